@@ -0,0 +1,39 @@
+"""Add execution_log_archives table for compacted execution logs
+
+Revision ID: add_exec_log_archives
+Revises: add_trace_job_id_id_idx
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_exec_log_archives'
+down_revision = 'add_trace_job_id_id_idx'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Create the table holding one compressed log archive per execution"""
+    op.create_table(
+        'execution_log_archives',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('execution_id', sa.String(), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=False),
+        sa.Column('line_count', sa.Integer(), nullable=False),
+        sa.Column('first_timestamp', sa.DateTime(), nullable=True),
+        sa.Column('last_timestamp', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('group_id', sa.String(length=100), nullable=True),
+        sa.Column('group_email', sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_execution_log_archives_execution_id'), 'execution_log_archives', ['execution_id'], unique=True)
+    op.create_index(op.f('ix_execution_log_archives_group_id'), 'execution_log_archives', ['group_id'], unique=False)
+
+def downgrade():
+    """Drop the execution_log_archives table"""
+    op.drop_index(op.f('ix_execution_log_archives_group_id'), table_name='execution_log_archives')
+    op.drop_index(op.f('ix_execution_log_archives_execution_id'), table_name='execution_log_archives')
+    op.drop_table('execution_log_archives')
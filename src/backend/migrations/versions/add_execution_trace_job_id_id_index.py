@@ -0,0 +1,28 @@
+"""Add composite (job_id, id) index to execution_trace
+
+Revision ID: add_trace_job_id_id_idx
+Revises: add_exec_group_created_idx
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_trace_job_id_id_idx'
+down_revision = 'add_exec_group_created_idx'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index execution_trace for incremental fetches by job and trace id"""
+    op.create_index(
+        'idx_execution_trace_job_id_id',
+        'execution_trace',
+        ['job_id', 'id'],
+        unique=False
+    )
+
+def downgrade():
+    """Drop the incremental fetch index"""
+    op.drop_index('idx_execution_trace_job_id_id', table_name='execution_trace')
@@ -0,0 +1,28 @@
+"""Add composite (group_id, created_at) index to executionhistory
+
+Revision ID: add_exec_group_created_idx
+Revises: add_global_enabled_mcp
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_exec_group_created_idx'
+down_revision = 'add_global_enabled_mcp'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index executionhistory for newest-first listing within a group"""
+    op.create_index(
+        'ix_executionhistory_group_id_created_at',
+        'executionhistory',
+        ['group_id', 'created_at'],
+        unique=False
+    )
+
+def downgrade():
+    """Drop the composite listing index"""
+    op.drop_index('ix_executionhistory_group_id_created_at', table_name='executionhistory')
@@ -0,0 +1,129 @@
+"""Partition execution_logs by month on PostgreSQL
+
+Converts execution_logs into a table range-partitioned on timestamp, with one
+partition per month and a default partition, so the retention service can
+drop old months instead of deleting rows. Other databases are left unchanged.
+
+Revision ID: partition_execution_logs
+Revises: add_exec_log_archives
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'partition_execution_logs'
+down_revision = 'add_exec_log_archives'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 2
+
+INDEXES = [
+    ('ix_execution_logs_id', 'id'),
+    ('ix_execution_logs_execution_id', 'execution_id'),
+    ('ix_execution_logs_group_id', 'group_id'),
+    ('ix_execution_logs_group_email', 'group_email'),
+    ('idx_execution_logs_exec_id_timestamp', 'execution_id, timestamp'),
+    ('idx_execution_logs_group_timestamp', 'group_id, timestamp'),
+    ('idx_execution_logs_group_exec_id', 'group_id, execution_id'),
+]
+
+
+def _next_month(month_start):
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def _drop_indexes():
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes():
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON execution_logs ({columns})")
+
+
+def upgrade():
+    """Recreate execution_logs as a monthly range-partitioned table and copy the rows"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE execution_logs RENAME TO execution_logs_unpartitioned")
+    op.execute("ALTER TABLE execution_logs_unpartitioned RENAME CONSTRAINT execution_logs_pkey TO execution_logs_unpartitioned_pkey")
+    _drop_indexes()
+    op.execute("ALTER SEQUENCE execution_logs_id_seq OWNED BY NONE")
+
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE execution_logs (
+            id INTEGER NOT NULL DEFAULT nextval('execution_logs_id_seq'),
+            execution_id VARCHAR NOT NULL,
+            content TEXT NOT NULL,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            group_id VARCHAR(100),
+            group_email VARCHAR(255),
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+
+    today = date.today()
+    oldest = bind.execute(sa.text("SELECT min(timestamp) FROM execution_logs_unpartitioned")).scalar()
+    month = date(oldest.year, oldest.month, 1) if oldest else date(today.year, today.month, 1)
+    last = date(today.year, today.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE execution_logs_p{month.year:04d}{month.month:02d} PARTITION OF execution_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+        month = _next_month(month)
+    op.execute("CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT")
+
+    op.execute("""
+        INSERT INTO execution_logs (id, execution_id, content, timestamp, group_id, group_email)
+        SELECT id, execution_id, content, COALESCE(timestamp, now() AT TIME ZONE 'utc'), group_id, group_email
+        FROM execution_logs_unpartitioned
+    """)
+    op.execute("DROP TABLE execution_logs_unpartitioned")
+    op.execute("ALTER SEQUENCE execution_logs_id_seq OWNED BY execution_logs.id")
+    _create_indexes()
+
+
+def downgrade():
+    """Recreate execution_logs as a plain table and copy the rows back"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE execution_logs RENAME TO execution_logs_partitioned")
+    op.execute("ALTER TABLE execution_logs_partitioned RENAME CONSTRAINT execution_logs_pkey TO execution_logs_partitioned_pkey")
+    _drop_indexes()
+    op.execute("ALTER SEQUENCE execution_logs_id_seq OWNED BY NONE")
+    op.execute("""
+        CREATE TABLE execution_logs (
+            id INTEGER NOT NULL DEFAULT nextval('execution_logs_id_seq'),
+            execution_id VARCHAR NOT NULL,
+            content TEXT NOT NULL,
+            timestamp TIMESTAMP WITHOUT TIME ZONE,
+            group_id VARCHAR(100),
+            group_email VARCHAR(255),
+            CONSTRAINT execution_logs_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("""
+        INSERT INTO execution_logs (id, execution_id, content, timestamp, group_id, group_email)
+        SELECT id, execution_id, content, timestamp, group_id, group_email
+        FROM execution_logs_partitioned
+    """)
+    # Dropping the parent drops all of its partitions
+    op.execute("DROP TABLE execution_logs_partitioned")
+    op.execute("ALTER SEQUENCE execution_logs_id_seq OWNED BY execution_logs.id")
+    _create_indexes()
@@ -10,10 +10,12 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.services.agent_generation_service import AgentGenerationService
 from src.core.dependencies import GroupContextDep
+from src.utils.streaming_json import format_sse_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -68,4 +70,34 @@ async def generate_agent(
     except Exception as e:
         # For all other errors
         logger.error(f"Error generating agent: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to generate agent configuration") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to generate agent configuration")
+
+
+@router.post("/generate/stream")
+async def stream_generate_agent(
+    prompt: AgentPrompt,
+    group_context: GroupContextDep
+):
+    """
+    Generate agent configuration as a Server-Sent Events stream.
+    
+    Streams the generated text ("token" events) and each top-level field as
+    soon as it is complete ("field" events), followed by a "complete" event
+    with the agent configuration or an "error" event.
+    """
+    service = AgentGenerationService.create()
+    
+    async def events():
+        async for event in service.stream_agent(
+            prompt_text=prompt.prompt,
+            model=prompt.model,
+            tools=prompt.tools,
+            group_context=group_context
+        ):
+            yield format_sse_event(event["event"], event["data"])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -8,10 +8,12 @@ with agents and tasks in the CrewAI ecosystem.
 import logging
 import traceback
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.schemas.crew import CrewGenerationRequest, CrewGenerationResponse, CrewCreationResponse
 from src.services.crew_generation_service import CrewGenerationService
 from src.core.dependencies import GroupContextDep
+from src.utils.streaming_json import format_sse_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -63,4 +65,30 @@ async def create_crew(
         error_msg = f"Error creating crew: {str(e)}"
         logger.error(error_msg)
         logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=error_msg) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.post("/create-crew/stream")
+async def stream_create_crew(
+    request: CrewGenerationRequest,
+    group_context: GroupContextDep
+):
+    """
+    Generate and create a crew as a Server-Sent Events stream.
+    
+    Streams the generated text ("token" events) and each agent and task as soon
+    as it has been created ("agent" / "task" events), followed by a "complete"
+    event with the whole crew or an "error" event.
+    """
+    crew_service = CrewGenerationService.create()
+    logger.info(f"Streaming crew creation from prompt: {request.prompt[:50]}...")
+    
+    async def events():
+        async for event in crew_service.stream_crew_complete(request, group_context):
+            yield format_sse_event(event["event"], event["data"])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -5,8 +5,10 @@ This module provides endpoints for real-time execution log streaming
 and retrieving historical execution logs.
 """
 
-from typing import List, Dict, Annotated
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query, Depends
+from datetime import datetime
+from typing import List, Dict, Annotated, Optional
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 
 from src.core.logger import LoggerManager
 from src.services.execution_logs_service import execution_logs_service
@@ -72,12 +74,62 @@ async def websocket_execution_logs(websocket: WebSocket, execution_id: str):
         # Ensure connection is properly cleaned up
         await execution_logs_service.disconnect(websocket, execution_id)
 
+@logs_router.get("/executions/{execution_id}/events")
+async def stream_execution_updates(
+    execution_id: str,
+    request: Request,
+    group_context: GroupContextDep,
+    after_trace_id: Optional[int] = Query(None, ge=0, description="Only send traces with an ID greater than this"),
+    after_log_id: Optional[int] = Query(None, ge=0, description="Only send logs with an ID greater than this"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-Sent Events stream of new traces and logs for an execution.
+    
+    Complements the WebSocket stream: events are pushed as soon as the trace
+    and log writers have stored new rows, and only rows after the client's
+    cursors are sent. A reconnecting EventSource resumes from its
+    Last-Event-ID, which takes precedence over the query cursors.
+    
+    Args:
+        execution_id: ID of the execution to stream
+        request: Incoming request, used to detect client disconnects
+        group_context: Group context from headers
+        after_trace_id: Only send traces with an ID greater than this
+        after_log_id: Only send logs with an ID greater than this
+        last_event_id: Last-Event-ID header ("<trace_id>:<log_id>")
+        
+    Returns:
+        StreamingResponse with "trace" and "log" events
+    """
+    if last_event_id:
+        try:
+            trace_part, log_part = last_event_id.split(":", 1)
+            after_trace_id, after_log_id = int(trace_part), int(log_part)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid Last-Event-ID: {last_event_id}")
+    
+    events = execution_logs_service.stream_execution_updates(
+        execution_id,
+        group_context,
+        after_trace_id=after_trace_id,
+        after_log_id=after_log_id,
+        is_disconnected=request.is_disconnected
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @logs_router.get("/executions/{execution_id}", response_model=List[ExecutionLogResponse])
 async def get_execution_logs(
     execution_id: str,
     group_context: GroupContextDep,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0, description="Only return logs with an ID greater than this"),
+    since: Optional[datetime] = Query(None, description="Only return logs with a timestamp later than this"),
 ):
     """
     Get historical execution logs for the current tenant.
@@ -90,12 +142,14 @@ async def get_execution_logs(
         group_context: Group context from headers
         limit: Maximum number of logs to return
         offset: Number of logs to skip
+        after_id: Only return logs with an ID greater than this
+        since: Only return logs with a timestamp later than this
         
     Returns:
         List of execution logs with their timestamps
     """
     try:
-        logs = await execution_logs_service.get_execution_logs_by_group(execution_id, group_context, limit, offset)
+        logs = await execution_logs_service.get_execution_logs_by_group(execution_id, group_context, limit, offset, after_id=after_id, since=since)
         return logs
     except Exception as e:
         logger.error(f"Error fetching execution logs: {e}")
@@ -107,6 +161,8 @@ async def get_run_logs(
     group_context: GroupContextDep,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0, description="Only return logs with an ID greater than this"),
+    since: Optional[datetime] = Query(None, description="Only return logs with a timestamp later than this"),
 ):
     """
     Get historical logs for a specific run within the current tenant.
@@ -119,12 +175,14 @@ async def get_run_logs(
         group_context: Group context from headers
         limit: Maximum number of logs to return
         offset: Number of logs to skip
+        after_id: Only return logs with an ID greater than this
+        since: Only return logs with a timestamp later than this
         
     Returns:
         Dictionary with a list of run logs with their timestamps
     """
     try:
-        logs = await execution_logs_service.get_execution_logs_by_group(run_id, group_context, limit, offset)
+        logs = await execution_logs_service.get_execution_logs_by_group(run_id, group_context, limit, offset, after_id=after_id, since=since)
         return ExecutionLogsResponse(logs=logs)
     except Exception as e:
         logger.error(f"Error fetching run logs: {e}")
@@ -138,10 +196,12 @@ async def get_execution_logs_main(
     group_context: GroupContextDep,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0, description="Only return logs with an ID greater than this"),
+    since: Optional[datetime] = Query(None, description="Only return logs with a timestamp later than this"),
 ):
     """Get execution logs via main router."""
     try:
-        logs = await execution_logs_service.get_execution_logs_by_group(execution_id, group_context, limit, offset)
+        logs = await execution_logs_service.get_execution_logs_by_group(execution_id, group_context, limit, offset, after_id=after_id, since=since)
         return logs
     except Exception as e:
         logger.error(f"Error fetching execution logs: {e}")
@@ -6,6 +6,7 @@ execution traces.
 """
 
 import logging
+from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Query, status
 
@@ -89,21 +90,30 @@ async def get_traces_by_run_id(
 async def get_traces_by_job_id(
     job_id: str, 
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0, description="Only return traces with an ID greater than this"),
+    since: Optional[datetime] = Query(None, description="Only return traces created later than this")
 ):
     """
     Get traces for an execution by job_id.
     
+    Clients polling a running execution should pass the highest trace ID they
+    have as ``after_id`` to receive only new traces.
+    
     Args:
         job_id: String ID of the execution (job_id)
         limit: Maximum number of traces to return (1-500)
         offset: Pagination offset
+        after_id: Only return traces with an ID greater than this
+        since: Only return traces created later than this
     
     Returns:
         ExecutionTraceResponseByJobId with traces for the execution
     """
     try:
-        result = await ExecutionTraceService.get_traces_by_job_id(None, job_id, limit, offset)
+        result = await ExecutionTraceService.get_traces_by_job_id(
+            None, job_id, limit, offset, after_id=after_id, since=since
+        )
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -7,8 +7,8 @@ of crews and flows, as well as utility operations like name generation.
 
 import logging
 import asyncio
-from typing import Annotated
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, UTC
@@ -24,6 +24,7 @@ from src.schemas.execution import (
     ExecutionStatus, 
     ExecutionResponse, 
     ExecutionCreateResponse,
+    ExecutionPageResponse,
     ExecutionNameGenerationRequest,
     ExecutionNameGenerationResponse
 )
@@ -109,6 +110,72 @@ async def create_execution(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _normalize_result(execution_data: dict) -> dict:
+    """Coerce an execution's result into the dict shape ExecutionResponse expects."""
+    result = execution_data.get("result")
+    if result and isinstance(result, str):
+        try:
+            # Try to parse as JSON
+            import json
+            execution_data["result"] = json.loads(result)
+        except json.JSONDecodeError:
+            # If not valid JSON, wrap in a dict to satisfy the schema
+            execution_data["result"] = {"value": result}
+    # If result is a list, convert it to a dictionary to match the schema
+    if execution_data.get("result") and isinstance(execution_data["result"], list):
+        execution_data["result"] = {"items": execution_data["result"]}
+    # If result is a boolean, convert it to a dictionary to match the schema
+    if execution_data.get("result") and isinstance(execution_data["result"], bool):
+        execution_data["result"] = {"success": execution_data["result"]}
+    # If result is not a dict at this point, set it to an empty dict
+    if execution_data.get("result") is not None and not isinstance(execution_data["result"], dict):
+        execution_data["result"] = {}
+    return execution_data
+
+
+# Registered before "/{execution_id}" so the path is not captured as an ID
+@router.get("/page", response_model=ExecutionPageResponse)
+async def list_executions_page(
+    group_context: GroupContextDep,
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of executions per page"),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    include_result: bool = Query(False, description="Include each execution's result"),
+    include_inputs: bool = Query(False, description="Include inputs, agents_yaml and tasks_yaml"),
+):
+    """
+    List executions newest first, one page at a time, with group filtering.
+    
+    Pages are addressed by an opaque cursor rather than an offset, and only
+    summary fields are returned unless result or inputs are requested, so the
+    cost of a request depends on the page size, not on the size of the history.
+    
+    Args:
+        group_context: Group context for filtering
+        limit: Maximum number of executions per page
+        cursor: Cursor returned with the previous page
+        include_result: Include each execution's result
+        include_inputs: Include inputs, agents_yaml and tasks_yaml
+    
+    Returns:
+        ExecutionPageResponse with the executions and the next cursor
+    """
+    try:
+        page = await ExecutionService.list_executions_page(
+            group_ids=group_context.group_ids,
+            limit=limit,
+            cursor=cursor,
+            include_result=include_result,
+            include_inputs=include_inputs
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return ExecutionPageResponse(
+        items=[ExecutionResponse(**_normalize_result(item)) for item in page["items"]],
+        next_cursor=page["next_cursor"]
+    )
+
+
 @router.get("/{execution_id}", response_model=ExecutionResponse)
 async def get_execution_status(
     execution_id: str, 
@@ -172,30 +239,7 @@ async def list_executions(group_context: GroupContextDep):
     executions_list = await ExecutionService.list_executions(group_ids=group_context.group_ids)
     
     # Process results before converting to response models
-    processed_executions = []
-    for execution_data in executions_list:
-        # Check if result exists and is a string - try to convert it to a dict
-        if execution_data.get("result") and isinstance(execution_data["result"], str):
-            try:
-                # Try to parse as JSON
-                import json
-                execution_data["result"] = json.loads(execution_data["result"])
-            except json.JSONDecodeError:
-                # If not valid JSON, wrap in a dict to satisfy the schema
-                execution_data["result"] = {"value": execution_data["result"]}
-        # If result is a list, convert it to a dictionary to match the schema
-        if execution_data.get("result") and isinstance(execution_data["result"], list):
-            execution_data["result"] = {"items": execution_data["result"]}
-        # If result is a boolean, convert it to a dictionary to match the schema
-        if execution_data.get("result") and isinstance(execution_data["result"], bool):
-            execution_data["result"] = {"success": execution_data["result"]}
-        # If result is not a dict at this point, set it to an empty dict
-        if execution_data.get("result") is not None and not isinstance(execution_data["result"], dict):
-            execution_data["result"] = {}
-        processed_executions.append(execution_data)
-    
-    # Convert to response models
-    return [ExecutionResponse(**execution_data) for execution_data in processed_executions]
+    return [ExecutionResponse(**_normalize_result(execution_data)) for execution_data in executions_list]
 
 
 @router.post("/generate-name", response_model=ExecutionNameGenerationResponse)
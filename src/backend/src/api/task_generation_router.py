@@ -8,10 +8,12 @@ with proper validation and error handling.
 import logging
 import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.schemas.task_generation import TaskGenerationRequest, TaskGenerationResponse
 from src.services.task_generation_service import TaskGenerationService
 from src.core.dependencies import GroupContextDep
+from src.utils.streaming_json import format_sse_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -61,4 +63,30 @@ async def generate_task(
         # Handle other errors with a 500 response
         error_msg = f"Error generating task: {str(e)}"
         logger.error(error_msg)
-        raise HTTPException(status_code=500, detail=error_msg) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.post("/generate-task/stream")
+async def stream_generate_task(
+    request: TaskGenerationRequest,
+    group_context: GroupContextDep
+):
+    """
+    Generate a task as a Server-Sent Events stream.
+    
+    Streams the generated text ("token" events) and each top-level field as
+    soon as it is complete ("field" events), followed by a "complete" event
+    with the generated task or an "error" event.
+    """
+    task_generation_service = TaskGenerationService.create()
+    logger.info(f"Streaming task generation from prompt: {request.text[:50]}...")
+    
+    async def events():
+        async for event in task_generation_service.stream_task(request, group_context):
+            yield format_sse_event(event["event"], event["data"])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -8,9 +8,11 @@ with proper validation and error handling.
 import logging
 import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.schemas.template_generation import TemplateGenerationRequest, TemplateGenerationResponse
 from src.services.template_generation_service import TemplateGenerationService
+from src.utils.streaming_json import format_sse_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -65,4 +67,29 @@ async def generate_templates(
         # Handle other errors with a 500 response
         error_msg = f"Error generating templates: {str(e)}"
         logger.error(error_msg)
-        raise HTTPException(status_code=500, detail=error_msg) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.post("/generate-templates/stream")
+async def stream_generate_templates(
+    request: TemplateGenerationRequest
+):
+    """
+    Generate agent templates as a Server-Sent Events stream.
+    
+    Streams the generated text ("token" events) and each template as soon as
+    it is complete ("field" events), followed by a "complete" event with all
+    three templates or an "error" event.
+    """
+    template_generation_service = TemplateGenerationService.create()
+    logger.info(f"Streaming template generation for agent role: {request.role}")
+    
+    async def events():
+        async for event in template_generation_service.stream_templates(request):
+            yield format_sse_event(event["event"], event["data"])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
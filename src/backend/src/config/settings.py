@@ -39,6 +39,166 @@ class Settings(BaseSettings):
     SQLITE_DB_PATH: str = os.getenv("SQLITE_DB_PATH", "./app.db")
     DB_FILE_PATH: str = os.getenv("DB_FILE_PATH", "sqlite.db")
 
+    # Connection pool settings. The main event loop uses the primary pool; every
+    # other event loop (worker threads) gets its own, smaller pool.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 3
+
+    # Execution logs writer: rows are coalesced into multi-row INSERTs of up to
+    # LOGS_WRITER_BATCH_SIZE rows or LOGS_WRITER_FLUSH_INTERVAL_MS, whichever
+    # comes first. Producers block (up to LOGS_QUEUE_PUT_TIMEOUT seconds) once
+    # the queue reaches LOGS_QUEUE_HIGH_WATER_MARK entries.
+    LOGS_WRITER_BATCH_SIZE: int = 100
+    LOGS_WRITER_FLUSH_INTERVAL_MS: int = 250
+    LOGS_QUEUE_HIGH_WATER_MARK: int = 10000
+    LOGS_QUEUE_PUT_TIMEOUT: float = 2.0
+
+    # Live log WebSockets: each execution keeps its last LOGS_WS_MAX_PENDING
+    # messages for its connections' writer tasks. A connection that falls further
+    # behind skips the oldest messages ("drop_oldest") or is closed ("disconnect");
+    # a single send taking longer than LOGS_WS_SEND_TIMEOUT_SECONDS closes it.
+    LOGS_WS_MAX_PENDING: int = 256
+    LOGS_WS_SLOW_CONSUMER_POLICY: str = "drop_oldest"
+    LOGS_WS_SEND_TIMEOUT_SECONDS: float = 10.0
+
+    # Execution trace writer: traces are bulk inserted in batches of up to
+    # TRACE_WRITER_BATCH_SIZE rows or TRACE_WRITER_FLUSH_INTERVAL_MS. Known
+    # job_id -> executionhistory.id mappings are kept in an LRU cache of
+    # TRACE_JOB_CACHE_SIZE entries.
+    TRACE_WRITER_BATCH_SIZE: int = 100
+    TRACE_WRITER_FLUSH_INTERVAL_MS: int = 250
+    TRACE_JOB_CACHE_SIZE: int = 1024
+
+    # Embeddings: vectors are cached by hash of provider, model and text in an
+    # LRU of EMBEDDING_CACHE_SIZE entries, optionally backed by a SQLite file at
+    # EMBEDDING_CACHE_DB_PATH. Uncached texts are sent in provider-sized batches,
+    # at most EMBEDDING_MAX_CONCURRENCY requests at a time.
+    EMBEDDING_CACHE_SIZE: int = 4096
+    EMBEDDING_CACHE_DB_PATH: Optional[str] = None
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+
+    # Scheduler: the loop sleeps until the earliest active schedule is due and is
+    # woken by schedule changes; the index is also reloaded from the database
+    # every SCHEDULER_RESYNC_INTERVAL_SECONDS to pick up changes made elsewhere.
+    SCHEDULER_RESYNC_INTERVAL_SECONDS: int = 3600
+
+    # API keys: decrypted values are cached in process for API_KEY_CACHE_TTL_SECONDS
+    # and invalidated when a key is created, updated or deleted. 0 disables caching.
+    API_KEY_CACHE_TTL_SECONDS: int = 300
+
+    # Model resolution: model configs and the LLM parameters derived from them are
+    # reused for MODEL_RESOLUTION_CACHE_TTL_SECONDS and dropped whenever a model
+    # configuration changes. 0 disables caching.
+    MODEL_RESOLUTION_CACHE_TTL_SECONDS: int = 300
+
+    # Documentation search on SQLite uses an in-process NumPy index persisted to
+    # sidecar .npy files at this path prefix (default: next to SQLITE_DB_PATH;
+    # empty string disables persistence).
+    DOCUMENTATION_VECTOR_INDEX_PATH: Optional[str] = None
+
+    # Number of long-lived background event loops used by run_sync to call async
+    # services (memory backends, MCP tools) from synchronous CrewAI code.
+    ASYNC_BRIDGE_LOOP_COUNT: int = 2
+
+    # MCP sessions are pooled per (server URL, credentials) and event loop. Idle
+    # sessions are pinged every MCP_SESSION_KEEPALIVE_SECONDS and closed after
+    # MCP_SESSION_IDLE_TIMEOUT_SECONDS unless a running execution leases them;
+    # beyond MCP_MAX_SESSIONS per loop, calls use one-off sessions. Tool lists
+    # are cached for MCP_TOOLS_CACHE_TTL_SECONDS or until the server reports a
+    # change (0 disables caching).
+    MCP_SESSION_KEEPALIVE_SECONDS: int = 60
+    MCP_SESSION_IDLE_TIMEOUT_SECONDS: int = 300
+    MCP_MAX_SESSIONS: int = 32
+    MCP_TOOLS_CACHE_TTL_SECONDS: int = 300
+
+    # Databricks REST calls share keep-alive HTTP sessions per workspace host,
+    # with at most HTTP_MAX_CONNECTIONS_PER_HOST connections to one host. Requests
+    # time out after HTTP_TIMEOUT_SECONDS (HTTP_CONNECT_TIMEOUT_SECONDS to connect)
+    # unless the caller sets a timeout; connection failures and throttling or
+    # server errors are retried HTTP_MAX_RETRIES times with jittered exponential
+    # backoff starting at HTTP_RETRY_BACKOFF_SECONDS.
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 16
+    HTTP_KEEPALIVE_SECONDS: int = 60
+    HTTP_TIMEOUT_SECONDS: int = 120
+    HTTP_CONNECT_TIMEOUT_SECONDS: int = 10
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_RETRY_BACKOFF_SECONDS: float = 0.5
+
+    # Databricks vector memory writes are buffered per memory index and upserted
+    # in batches of up to MEMORY_WRITE_BATCH_SIZE records, embedded with one
+    # embedder call per batch. Pending records are written at the latest
+    # MEMORY_WRITE_FLUSH_SECONDS after the first was buffered, before the index
+    # is searched, and at task and crew completion. A batch size of 1 writes
+    # each memory synchronously. Task and crew completion wait at most
+    # MEMORY_WRITE_FLUSH_TIMEOUT_SECONDS for the writes, which then carry on in
+    # the background.
+    MEMORY_WRITE_BATCH_SIZE: int = 50
+    MEMORY_WRITE_FLUSH_SECONDS: float = 5.0
+    MEMORY_WRITE_FLUSH_TIMEOUT_SECONDS: float = 30.0
+
+    # Within an execution, the results of up to MEMORY_SEARCH_CACHE_SIZE text
+    # searches per memory type are reused for MEMORY_SEARCH_CACHE_TTL_SECONDS
+    # until the execution writes to that memory (0 disables the cache), and the
+    # embeddings of the last MEMORY_QUERY_EMBEDDING_CACHE_SIZE queries are kept.
+    MEMORY_SEARCH_CACHE_TTL_SECONDS: int = 600
+    MEMORY_SEARCH_CACHE_SIZE: int = 128
+    MEMORY_QUERY_EMBEDDING_CACHE_SIZE: int = 64
+
+    # Execution update streams (SSE) push new traces and logs as the writers
+    # persist them, fetching at most EXECUTION_STREAM_BATCH_SIZE rows per kind
+    # per round and sending a keep-alive comment after
+    # EXECUTION_STREAM_KEEPALIVE_SECONDS without updates.
+    EXECUTION_STREAM_BATCH_SIZE: int = 500
+    EXECUTION_STREAM_KEEPALIVE_SECONDS: float = 15.0
+
+    # Dispatcher intent detection: messages whose top keyword score reaches
+    # DISPATCHER_FAST_PATH_MIN_SCORE and leads the runner-up by
+    # DISPATCHER_FAST_PATH_MIN_MARGIN are routed without the LLM. LLM decisions
+    # are cached per group, model and normalised message in an LRU of
+    # DISPATCHER_INTENT_CACHE_SIZE entries for DISPATCHER_INTENT_CACHE_TTL_SECONDS.
+    DISPATCHER_FAST_PATH_MIN_SCORE: int = 6
+    DISPATCHER_FAST_PATH_MIN_MARGIN: int = 3
+    DISPATCHER_INTENT_CACHE_SIZE: int = 1024
+    DISPATCHER_INTENT_CACHE_TTL_SECONDS: int = 3600
+
+    # Generation prompts: prompt templates, the tool catalogue and up to
+    # PROMPT_CACHE_MAX_RENDERED rendered system prompts are reused for
+    # PROMPT_CACHE_TTL_SECONDS and dropped when templates or tools change
+    # (0 disables caching). LLM_PROMPT_CACHE_HINTS marks the system prompt as a
+    # cacheable prefix for providers that support prompt caching.
+    PROMPT_CACHE_TTL_SECONDS: int = 600
+    PROMPT_CACHE_MAX_RENDERED: int = 256
+    LLM_PROMPT_CACHE_HINTS: bool = True
+
+    # Database backups: PostgreSQL tables are streamed in chunks of
+    # DB_BACKUP_CHUNK_SIZE rows (restores also insert in chunks of this size),
+    # exporting up to DB_BACKUP_PARALLEL_TABLES tables concurrently.
+    DB_BACKUP_CHUNK_SIZE: int = 5000
+    DB_BACKUP_PARALLEL_TABLES: int = 4
+
+    # Execution retention: every EXECUTION_RETENTION_INTERVAL_SECONDS a background
+    # task deletes executions older than EXECUTION_RETENTION_DAYS or beyond the
+    # newest EXECUTION_RETENTION_MAX_EXECUTIONS of their group (0 disables either
+    # rule), with their traces and logs. EXECUTION_RETENTION_GROUP_POLICIES
+    # overrides both per group, e.g. {"team-a": {"days": 30, "max_executions": 500}}.
+    # Logs of executions older than EXECUTION_LOGS_COMPACT_AFTER_DAYS are rolled
+    # up into one compressed archive per execution. Work is done in batches of
+    # EXECUTION_RETENTION_BATCH_SIZE rows, at most EXECUTION_RETENTION_MAX_BATCHES
+    # per run. On PostgreSQL with a partitioned execution_logs table, monthly
+    # partitions are created EXECUTION_LOGS_PARTITION_MONTHS_AHEAD months ahead.
+    EXECUTION_RETENTION_ENABLED: bool = True
+    EXECUTION_RETENTION_INTERVAL_SECONDS: int = 3600
+    EXECUTION_RETENTION_DAYS: int = 0
+    EXECUTION_RETENTION_MAX_EXECUTIONS: int = 0
+    EXECUTION_RETENTION_GROUP_POLICIES: Dict[str, Dict[str, int]] = {}
+    EXECUTION_LOGS_COMPACT_AFTER_DAYS: int = 7
+    EXECUTION_RETENTION_BATCH_SIZE: int = 1000
+    EXECUTION_RETENTION_MAX_BATCHES: int = 50
+    EXECUTION_LOGS_PARTITION_MONTHS_AHEAD: int = 2
+
     @field_validator("DATABASE_URI", mode="before")
     def assemble_db_connection(cls, v: Optional[str], info) -> Any:
         if isinstance(v, str):
@@ -0,0 +1,103 @@
+"""
+In-process cache of decrypted API key values.
+
+Provider keys are read on every agent, embedding and tool setup; resolving
+them means a database round trip plus an RSA decrypt. The cache keeps the
+decrypted value (or the fact that a key does not exist) for a short TTL and
+is invalidated by ApiKeysService whenever a key is created, updated or
+deleted.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+_MISSING = object()
+
+
+class ApiKeyCache:
+    """
+    Thread-safe TTL cache of decrypted API key values keyed by group and key name.
+
+    ``None`` values are cached too, so repeated lookups of unset keys do not hit
+    the database until the entry expires or the key is created.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl = ttl_seconds
+        self._entries: Dict[Tuple[Optional[str], str], Tuple[float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key_name: str, group_id: Optional[str] = None) -> Any:
+        """
+        Look up a key value.
+
+        Args:
+            key_name: API key name (e.g. ``OPENAI_API_KEY``)
+            group_id: Group the key belongs to, None for global keys
+
+        Returns:
+            The cached value (possibly None), or ``ApiKeyCache.MISSING`` if the
+            key is not cached or has expired
+        """
+        cache_key = (group_id, key_name)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self.hits += 1
+                    return value
+                del self._entries[cache_key]
+            self.misses += 1
+            return _MISSING
+
+    def put(self, key_name: str, value: Optional[str], group_id: Optional[str] = None) -> None:
+        """Store a key value (None meaning the key does not exist)."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(group_id, key_name)] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self, key_name: str) -> None:
+        """Drop a key from the cache for every group."""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[1] == key_name]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+ApiKeyCache.MISSING = _MISSING
+
+_api_key_cache: Optional[ApiKeyCache] = None
+_api_key_cache_lock = threading.Lock()
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Get the process-wide API key cache configured from settings."""
+    global _api_key_cache
+    if _api_key_cache is None:
+        with _api_key_cache_lock:
+            if _api_key_cache is None:
+                from src.config.settings import settings
+                _api_key_cache = ApiKeyCache(settings.API_KEY_CACHE_TTL_SECONDS)
+    return _api_key_cache
@@ -0,0 +1,211 @@
+"""
+Content-hash cache for embedding vectors.
+
+Embeddings are keyed by a SHA-256 hash of the provider, model and text, so the
+same text embedded with the same model is only sent to the provider once. The
+cache is a bounded in-memory LRU with an optional SQLite tier on disk that
+survives restarts. The module also holds the request batching helpers shared
+by the embedding callers.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of inputs sent in one embedding request, per provider
+EMBEDDING_BATCH_SIZES = {'databricks': 150, 'openai': 2048, 'google': 100, 'ollama': 32}
+DEFAULT_EMBEDDING_BATCH_SIZE = 100
+
+
+def make_embedding_key(provider: str, model: str, text: str) -> str:
+    """
+    Build the cache key for a text embedded with a given provider and model.
+
+    Provider prefixes on the model name (e.g. ``databricks/``) are ignored so the
+    key is the same whether or not a caller already added the litellm prefix.
+
+    Args:
+        provider: Embedding provider name
+        model: Embedding model name, with or without provider prefix
+        text: Text to embed
+
+    Returns:
+        Hex digest identifying the embedding
+    """
+    bare_model = model.split('/', 1)[1] if model.startswith(f"{provider}/") else model
+    digest = hashlib.sha256()
+    digest.update(f"{provider}\x00{bare_model}\x00".encode("utf-8"))
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_embedding_batch_size(provider: str) -> int:
+    """Get the maximum number of inputs per embedding request for a provider."""
+    return EMBEDDING_BATCH_SIZES.get(provider, DEFAULT_EMBEDDING_BATCH_SIZE)
+
+
+def iter_batches(items: Sequence, batch_size: int) -> Iterator[Sequence]:
+    """Split a sequence into consecutive batches of at most ``batch_size`` items."""
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache of embedding vectors with an optional SQLite tier.
+
+    All methods are thread-safe; the cache is shared by async callers and by
+    embedding functions that run in crew worker threads.
+    """
+
+    def __init__(self, max_size: int, db_path: Optional[str] = None):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_path = db_path
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        """Open (and create if needed) the on-disk tier."""
+        try:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"Embedding cache disk tier enabled at {db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open embedding cache at {db_path}, using memory only: {e}")
+            self._db = None
+
+    @property
+    def persistent(self) -> bool:
+        """Whether the on-disk tier is enabled."""
+        return self._db is not None
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        # Caller holds the lock
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up several embeddings.
+
+        Args:
+            keys: Cache keys from make_embedding_key
+
+        Returns:
+            Mapping of key to embedding for every key found in either tier
+        """
+        keys = list(keys)
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                embedding = self._entries.get(key)
+                if embedding is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = embedding
+
+            if missing and self._db is not None:
+                try:
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start:start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = self._db.execute(
+                            f"SELECT key, embedding FROM embedding_cache WHERE key IN ({placeholders})", chunk
+                        ).fetchall()
+                        for key, blob in rows:
+                            embedding = array('d', blob).tolist()
+                            found[key] = embedding
+                            self._remember(key, embedding)
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache disk lookup failed: {e}")
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """
+        Store several embeddings in both tiers.
+
+        Args:
+            embeddings: Mapping of cache key to embedding vector
+        """
+        if not embeddings:
+            return
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._remember(key, list(embedding))
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embedding_cache (key, embedding) VALUES (?, ?)",
+                        [(key, array('d', embedding).tobytes()) for key, embedding in embeddings.items()]
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache disk write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached embeddings from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM embedding_cache")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache disk clear failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent": self.persistent,
+        }
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache configured from settings."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                from src.config.settings import settings
+                _embedding_cache = EmbeddingCache(
+                    settings.EMBEDDING_CACHE_SIZE,
+                    settings.EMBEDDING_CACHE_DB_PATH or None
+                )
+    return _embedding_cache
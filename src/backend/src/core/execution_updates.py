@@ -0,0 +1,125 @@
+"""
+In-process notifications of new execution traces and logs.
+
+The trace and log writers publish the execution IDs they have just persisted;
+stream endpoints subscribe per execution and wake up only when something new
+was stored, then fetch the new rows with an ``after_id`` cursor instead of
+re-reading the whole history on a timer.
+"""
+import asyncio
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+
+class ExecutionUpdateSubscription:
+    """A subscriber's wakeup flag for one execution, bound to its event loop."""
+
+    def __init__(self, execution_id: str, loop: asyncio.AbstractEventLoop):
+        self.execution_id = execution_id
+        self._loop = loop
+        self._event = asyncio.Event()
+        self.kinds: Set[str] = set()
+
+    def _notify(self, kind: str) -> None:
+        # Runs on the subscriber's loop
+        self.kinds.add(kind)
+        self._event.set()
+
+    def notify(self, kind: str) -> None:
+        """Wake the subscriber; safe to call from any thread or loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._notify(kind)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._notify, kind)
+
+    async def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait for the next notification.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Kinds of updates ("traces", "logs") received since the last wait;
+            empty if the timeout elapsed first
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._event.clear()
+        kinds, self.kinds = self.kinds, set()
+        return kinds
+
+
+class ExecutionUpdateHub:
+    """Thread-safe registry of per-execution update subscriptions."""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[ExecutionUpdateSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, execution_id: str) -> ExecutionUpdateSubscription:
+        """Subscribe the running event loop to updates of one execution."""
+        subscription = ExecutionUpdateSubscription(execution_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.setdefault(execution_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ExecutionUpdateSubscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.execution_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.execution_id]
+
+    def publish(self, execution_ids: Iterable[str], kind: str) -> None:
+        """
+        Notify subscribers that rows were stored for some executions.
+
+        Args:
+            execution_ids: Executions that received new rows
+            kind: "traces" or "logs"
+        """
+        with self._lock:
+            if not self._subscriptions:
+                return
+            targets = [
+                subscription
+                for execution_id in set(execution_ids)
+                for subscription in self._subscriptions.get(execution_id, ())
+            ]
+        for subscription in targets:
+            subscription.notify(kind)
+
+    def subscriber_count(self, execution_id: Optional[str] = None) -> int:
+        """Number of subscriptions, for one execution or in total."""
+        with self._lock:
+            if execution_id is not None:
+                return len(self._subscriptions.get(execution_id, ()))
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def clear(self) -> None:
+        """Drop all subscriptions."""
+        with self._lock:
+            self._subscriptions.clear()
+
+
+_execution_update_hub: Optional[ExecutionUpdateHub] = None
+_execution_update_hub_lock = threading.Lock()
+
+
+def get_execution_update_hub() -> ExecutionUpdateHub:
+    """Get the process-wide execution update hub."""
+    global _execution_update_hub
+    if _execution_update_hub is None:
+        with _execution_update_hub_lock:
+            if _execution_update_hub is None:
+                _execution_update_hub = ExecutionUpdateHub()
+    return _execution_update_hub
@@ -0,0 +1,404 @@
+"""
+Shared keep-alive HTTP clients for Databricks REST calls.
+
+Repositories and tools used to open a new aiohttp session, or call the bare
+``requests`` functions, for every request, paying a TCP and TLS handshake to
+the workspace each time. The pool keeps one aiohttp session per event loop and
+host and one ``requests`` session per host, so connections are reused. Each
+host's connection pool is bounded, requests get default timeouts, and
+connection failures and throttling or server errors are retried with jittered
+exponential backoff. Hit/miss counters and per-host latencies are reported by
+``get_stats()``.
+
+aiohttp and requests speak HTTP/1.1 only, so connections are kept alive
+rather than multiplexed over HTTP/2.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# The server did not process the request: retried for every method
+THROTTLE_STATUSES = frozenset({429, 503})
+# Retried for idempotent methods only
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def url_host(url: str) -> str:
+    """Host (and port) of a URL, the key of the pooled sessions."""
+    return urlsplit(url).netloc.lower() or url
+
+
+class _PooledRequest:
+    """A request over a pooled session; ``async with`` (or await) it for the response."""
+
+    def __init__(self, pool: "HttpClientPool", method: str, url: str, kwargs: Dict[str, Any]):
+        self._pool = pool
+        self._method = method.upper()
+        self._url = url
+        self._kwargs = kwargs
+        self._response: Optional[aiohttp.ClientResponse] = None
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._response = await self._send()
+        return self._response
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._response is not None:
+            self._response.release()
+
+    async def _send(self) -> aiohttp.ClientResponse:
+        pool = self._pool
+        host = url_host(self._url)
+        attempt = 0
+        while True:
+            session = pool.get_session(self._url)
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = await session.request(self._method, self._url, **self._kwargs)
+            except aiohttp.ClientOSError as e:
+                # Connect failures never reached the server; a dropped keep-alive
+                # connection may have, so only idempotent requests are resent
+                pool.record(host, time.monotonic() - started, error=True)
+                retryable = isinstance(e, aiohttp.ClientConnectorError) or self._method in IDEMPOTENT_METHODS
+                if attempt >= pool.max_retries or not retryable:
+                    raise
+                logger.debug(f"{self._method} {self._url} failed ({e}), retrying")
+            except aiohttp.ServerDisconnectedError as e:
+                pool.record(host, time.monotonic() - started, error=True)
+                if attempt >= pool.max_retries or self._method not in IDEMPOTENT_METHODS:
+                    raise
+                logger.debug(f"{self._method} {self._url} failed ({e}), retrying")
+            else:
+                pool.record(host, time.monotonic() - started, error=response.status >= 500)
+                if attempt >= pool.max_retries or not pool.should_retry(self._method, response.status):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                response.release()
+                logger.debug(f"{self._method} {self._url} returned {response.status}, retrying")
+            pool.record_retry(host)
+            await asyncio.sleep(pool.backoff_delay(attempt, retry_after))
+            attempt += 1
+
+
+class AsyncHttpClient:
+    """
+    Async client over the pooled sessions with the request methods of an aiohttp session.
+
+    ``async with pool.client() as session`` keeps the shape of code written
+    for a per-call ``aiohttp.ClientSession``; leaving the block does not close
+    the shared sessions.
+    """
+
+    def __init__(self, pool: "HttpClientPool"):
+        self._pool = pool
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def request(self, method: str, url: str, **kwargs) -> _PooledRequest:
+        return _PooledRequest(self._pool, method, url, kwargs)
+
+    def get(self, url: str, **kwargs) -> _PooledRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _PooledRequest:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> _PooledRequest:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> _PooledRequest:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> _PooledRequest:
+        return self.request("DELETE", url, **kwargs)
+
+
+class SyncHttpClient:
+    """Blocking client over the pooled ``requests`` sessions, for the requests-based tools."""
+
+    def __init__(self, pool: "HttpClientPool"):
+        self._pool = pool
+
+    def _send(self, name: str, url: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> requests.Response:
+        session = self._pool.get_sync_session(url)
+        kwargs.setdefault("timeout", self._pool.sync_timeout)
+        host = url_host(url)
+        started = time.monotonic()
+        try:
+            response = getattr(session, name)(*args, **kwargs)
+        except requests.RequestException:
+            self._pool.record(host, time.monotonic() - started, error=True)
+            raise
+        status_code = getattr(response, "status_code", None)
+        self._pool.record(host, time.monotonic() - started, error=isinstance(status_code, int) and status_code >= 500)
+        return response
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self._send("request", url, (method, url), kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._send("get", url, (url,), kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._send("post", url, (url,), kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self._send("put", url, (url,), kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self._send("patch", url, (url,), kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self._send("delete", url, (url,), kwargs)
+
+    def close(self) -> None:
+        """Kept for callers that close their session; the shared sessions stay open."""
+        return None
+
+
+class HttpClientPool:
+    """Keep-alive HTTP sessions per host, shared by all Databricks REST callers."""
+
+    def __init__(
+        self,
+        max_connections_per_host: int,
+        keepalive_seconds: float,
+        timeout_seconds: float,
+        connect_timeout_seconds: float,
+        max_retries: int,
+        backoff_seconds: float,
+        max_backoff_seconds: float = 30.0
+    ):
+        self._max_connections_per_host = max(1, max_connections_per_host)
+        self._keepalive_seconds = keepalive_seconds
+        self._timeout_seconds = timeout_seconds
+        self._connect_timeout_seconds = connect_timeout_seconds
+        self.max_retries = max(0, max_retries)
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_sessions: Dict[str, requests.Session] = {}
+        self._latency: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def sync_timeout(self) -> Tuple[float, float]:
+        """Default (connect, read) timeout of blocking requests."""
+        return (self._connect_timeout_seconds, self._timeout_seconds)
+
+    def client(self) -> AsyncHttpClient:
+        """Get an async client over the pooled sessions."""
+        return AsyncHttpClient(self)
+
+    def sync_client(self) -> SyncHttpClient:
+        """Get a blocking client over the pooled ``requests`` sessions."""
+        return SyncHttpClient(self)
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Get the aiohttp session of the running event loop for the host of a URL.
+
+        Args:
+            url: URL to be requested
+
+        Returns:
+            The shared session, created on first use
+        """
+        loop = asyncio.get_running_loop()
+        host = url_host(url)
+        with self._lock:
+            sessions = self._sessions.get(loop)
+            if sessions is None:
+                sessions = self._sessions[loop] = {}
+            session = sessions.get(host)
+            if session is not None and not session.closed:
+                self.hits += 1
+                return session
+            self.misses += 1
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._max_connections_per_host,
+                keepalive_timeout=self._keepalive_seconds
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self._timeout_seconds,
+                    connect=self._connect_timeout_seconds
+                )
+            )
+            sessions[host] = session
+            return session
+
+    def get_sync_session(self, url: str) -> requests.Session:
+        """
+        Get the ``requests`` session for the host of a URL.
+
+        The session's connection pool blocks callers beyond the per-host
+        connection limit, and retries idempotent requests on connection
+        failures and retryable statuses.
+
+        Args:
+            url: URL to be requested
+
+        Returns:
+            The shared session, created on first use
+        """
+        host = url_host(url)
+        with self._lock:
+            session = self._sync_sessions.get(host)
+            if session is not None:
+                self.hits += 1
+                return session
+            self.misses += 1
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self._max_connections_per_host,
+                pool_block=True,
+                max_retries=self._sync_retry()
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._sync_sessions[host] = session
+            return session
+
+    def _sync_retry(self) -> Retry:
+        options = dict(
+            total=self.max_retries,
+            backoff_factor=self._backoff_seconds,
+            status_forcelist=sorted(RETRY_STATUSES),
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            return Retry(backoff_jitter=self._backoff_seconds, **options)
+        except TypeError:
+            # urllib3 < 2 has no backoff jitter
+            return Retry(**options)
+
+    @staticmethod
+    def should_retry(method: str, status: int) -> bool:
+        """Whether a response status is worth retrying for a request method."""
+        return status in THROTTLE_STATUSES or (method in IDEMPOTENT_METHODS and status in RETRY_STATUSES)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number ``attempt + 1``.
+
+        A numeric Retry-After header is honoured (up to the maximum backoff);
+        otherwise the delay doubles per attempt and is jittered between half
+        and the full value so clients do not retry in lockstep.
+        """
+        if retry_after:
+            try:
+                return min(max(0.0, float(retry_after)), self._max_backoff_seconds)
+            except ValueError:
+                pass
+        delay = min(self._max_backoff_seconds, self._backoff_seconds * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def record(self, host: str, seconds: float, error: bool = False) -> None:
+        """Record the latency of a request to a host."""
+        with self._lock:
+            stats = self._latency.get(host)
+            if stats is None:
+                stats = self._latency[host] = {
+                    "requests": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0
+                }
+            stats["requests"] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            if error:
+                stats["errors"] += 1
+
+    def record_retry(self, host: str) -> None:
+        """Record a retried request to a host."""
+        with self._lock:
+            stats = self._latency.get(host)
+            if stats is not None:
+                stats["retries"] += 1
+
+    async def close_all(self) -> None:
+        """Close the sessions of the running event loop and all ``requests`` sessions."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sessions = self._sessions.pop(loop, {})
+            sync_sessions = list(self._sync_sessions.values())
+            self._sync_sessions.clear()
+        for session in sessions.values():
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {e}")
+        for session in sync_sessions:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session counts, pool hit/miss counters and per-host latencies."""
+        with self._lock:
+            hosts = {
+                host: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "avg_latency_ms": round(1000 * stats["total_seconds"] / stats["requests"], 2),
+                    "max_latency_ms": round(1000 * stats["max_seconds"], 2),
+                }
+                for host, stats in self._latency.items() if stats["requests"]
+            }
+            return {
+                "async_sessions": sum(len(sessions) for sessions in self._sessions.values()),
+                "sync_sessions": len(self._sync_sessions),
+                "max_connections_per_host": self._max_connections_per_host,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hosts": hosts,
+            }
+
+
+_http_client_pool: Optional[HttpClientPool] = None
+_http_client_pool_lock = threading.Lock()
+
+
+def get_http_client_pool() -> HttpClientPool:
+    """Get the process-wide HTTP client pool configured from settings."""
+    global _http_client_pool
+    if _http_client_pool is None:
+        with _http_client_pool_lock:
+            if _http_client_pool is None:
+                from src.config.settings import settings
+                _http_client_pool = HttpClientPool(
+                    max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+                    keepalive_seconds=settings.HTTP_KEEPALIVE_SECONDS,
+                    timeout_seconds=settings.HTTP_TIMEOUT_SECONDS,
+                    connect_timeout_seconds=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+                    max_retries=settings.HTTP_MAX_RETRIES,
+                    backoff_seconds=settings.HTTP_RETRY_BACKOFF_SECONDS,
+                )
+    return _http_client_pool
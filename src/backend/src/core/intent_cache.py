@@ -0,0 +1,109 @@
+"""
+LRU cache of LLM intent decisions for the dispatcher.
+
+Chat messages repeat a lot ("run crew", "change model", the same request sent
+again after an error), so the dispatcher keeps the intent the LLM chose for a
+normalised message. Entries are scoped by group and model, so one group's
+decisions are never served to another, and expire after a TTL so prompt
+template changes eventually take effect.
+"""
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+IntentKey = Tuple[Optional[str], str, str]
+
+
+def normalize_message(message: str) -> str:
+    """Lower-case a message and collapse its whitespace."""
+    return _WHITESPACE_RE.sub(" ", message.strip().lower())
+
+
+class IntentCache:
+    """Thread-safe LRU cache with TTL of intent detection results."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[IntentKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(group_id: Optional[str], model: str, message: str) -> IntentKey:
+        """Build the cache key of a message sent by a group."""
+        return (group_id, model, normalize_message(message))
+
+    def get(self, key: IntentKey) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached intent result.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            A copy of the cached result, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(result)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: IntentKey, result: Dict[str, Any]) -> None:
+        """Cache an intent result, evicting the least recently used entry if full."""
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached intents, e.g. after the intent prompt template changed."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_intent_cache: Optional[IntentCache] = None
+_intent_cache_lock = threading.Lock()
+
+
+def get_intent_cache() -> IntentCache:
+    """Get the process-wide intent cache configured from settings."""
+    global _intent_cache
+    if _intent_cache is None:
+        with _intent_cache_lock:
+            if _intent_cache is None:
+                from src.config.settings import settings
+                _intent_cache = IntentCache(
+                    settings.DISPATCHER_INTENT_CACHE_SIZE,
+                    settings.DISPATCHER_INTENT_CACHE_TTL_SECONDS,
+                )
+    return _intent_cache
@@ -5,10 +5,11 @@ This module provides a centralized manager for configuring and interacting with
 different LLM providers through litellm.
 """
 
+import asyncio
 import logging
 import os
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 import time
 
 from crewai import LLM
@@ -17,6 +18,8 @@ from src.utils.databricks_url_utils import DatabricksURLUtils
 from src.services.model_config_service import ModelConfigService
 from src.services.api_keys_service import ApiKeysService
 from src.core.unit_of_work import UnitOfWork
+from src.core.model_resolution_cache import get_model_resolution_cache
+from src.core.embedding_cache import get_embedding_cache, get_embedding_batch_size, make_embedding_key, iter_batches
 import pathlib
 
 # CRITICAL: Import and apply model handlers BEFORE importing litellm
@@ -301,9 +304,7 @@ class LLMManager:
             Exception: For other configuration errors
         """
         # Get model configuration from database using ModelConfigService
-        async with UnitOfWork() as uow:
-            model_config_service = await ModelConfigService.from_unit_of_work(uow)
-            model_config_dict = await model_config_service.get_model_config(model)
+        model_config_dict = await LLMManager._get_model_config(model)
             
         # Check if model configuration was found
         if not model_config_dict:
@@ -457,24 +458,47 @@ class LLMManager:
         return model_params
 
     @staticmethod
-    async def configure_crewai_llm(model_name: str) -> LLM:
+    async def _get_model_config(model: str) -> Dict[str, Any]:
         """
-        Create and configure a CrewAI LLM instance with the correct provider prefix.
+        Get a model's configuration, reusing it from the model resolution cache.
         
         Args:
-            model_name: The model identifier to configure
+            model: Model identifier
             
         Returns:
-            LLM: Configured CrewAI LLM instance
+            Dict[str, Any]: Model configuration (without credentials when served from cache)
+        """
+        cache = get_model_resolution_cache()
+        model_config_dict = cache.get(("config", model))
+        if model_config_dict is not None:
+            return model_config_dict
+        
+        async with UnitOfWork() as uow:
+            model_config_service = await ModelConfigService.from_unit_of_work(uow)
+            model_config_dict = await model_config_service.get_model_config(model)
+        
+        if model_config_dict:
+            # Never keep secrets in the resolution cache
+            cache.put(("config", model), {k: v for k, v in model_config_dict.items() if k != "api_key"})
+        return model_config_dict
+
+    @staticmethod
+    async def _resolve_crewai_llm(model_name: str) -> Dict[str, Any]:
+        """
+        Resolve the CrewAI LLM parameters for a model, without credentials.
+        
+        Args:
+            model_name: The model identifier to resolve
+            
+        Returns:
+            Dict[str, Any]: ``params`` for the LLM constructor, the ``provider``,
+            the ``credential`` provider name to look the API key up with (or
+            None), and whether to use the GPT-OSS wrapper (``gpt_oss``)
             
         Raises:
             ValueError: If model configuration is not found
-            Exception: For other configuration errors
         """
-        # Get model configuration using ModelConfigService
-        async with UnitOfWork() as uow:
-            model_config_service = await ModelConfigService.from_unit_of_work(uow)
-            model_config_dict = await model_config_service.get_model_config(model_name)
+        model_config_dict = await LLMManager._get_model_config(model_name)
         
         # Check if model configuration was found
         if not model_config_dict:
@@ -486,21 +510,22 @@ class LLMManager:
         
         logger.info(f"Configuring CrewAI LLM with provider: {provider}, model: {model_name}")
         
-        # Get API key for the provider using ApiKeysService
-        api_key = None
+        # Provider whose API key is used, resolved on every build through ApiKeysService
+        credential = None
         api_base = None
+        gpt_oss = False
         
         # Set the correct provider prefix based on provider
         if provider == ModelProvider.DEEPSEEK:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            credential = provider
             api_base = os.getenv("DEEPSEEK_ENDPOINT", "https://api.deepseek.com")
             prefixed_model = f"deepseek/{model_name_value}"
         elif provider == ModelProvider.OPENAI:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            credential = provider
             # OpenAI doesn't need a prefix
             prefixed_model = model_name_value
         elif provider == ModelProvider.ANTHROPIC:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            credential = provider
             prefixed_model = f"anthropic/{model_name_value}"
         elif provider == ModelProvider.OLLAMA:
             api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
@@ -519,14 +544,14 @@ class LLMManager:
                     logger.info("Using Databricks Apps OAuth authentication for CrewAI LLM")
                     # Setup environment variables for LiteLLM compatibility
                     setup_environment_variables()
-                    api_key = None  # OAuth will be handled by environment variables
+                    credential = None  # OAuth will be handled by environment variables
                 else:
                     # Only use API key service when NOT in Databricks Apps context
-                    api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+                    credential = "DATABRICKS"
                     
             except ImportError:
                 logger.warning("Enhanced Databricks auth not available for CrewAI LLM, using legacy PAT")
-                api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+                credential = "DATABRICKS"
                 
             # Get workspace URL from environment first, then database
             workspace_url = os.getenv("DATABRICKS_HOST", "")
@@ -555,57 +580,19 @@ class LLMManager:
             
             prefixed_model = f"databricks/{model_name_value}"
             
-            # Ensure the model string explicitly includes the provider for CrewAI/LiteLLM compatibility
-            llm_params = {
-                "model": prefixed_model,
-                # Add built-in retry capability
-                "timeout": 120,  # Longer timeout to prevent premature failures
-            }
-            
-            # Add API key and base URL if available
-            if api_key:
-                llm_params["api_key"] = api_key
-            if api_base:
-                llm_params["api_base"] = api_base
-            
-            # Add max_output_tokens if defined in model config
-            if "max_output_tokens" in model_config_dict and model_config_dict["max_output_tokens"]:
-                # GPT-5 and newer OpenAI models use max_completion_tokens instead of max_tokens
-                # Since this is inside Databricks provider block, this won't apply to GPT-5
-                llm_params["max_tokens"] = model_config_dict["max_output_tokens"]
-                logger.info(f"Setting max_tokens to {model_config_dict['max_output_tokens']} for model {prefixed_model}")
-                
-            logger.info(f"Creating CrewAI LLM with model: {prefixed_model}, has_api_key: {bool(api_key)}, api_base: {api_base}")
-            
             # Use custom wrapper for GPT-OSS models
-            if DatabricksGPTOSSHandler.is_gpt_oss_model(model_name_value):
-                logger.info(f"Using DatabricksGPTOSSLLM wrapper for GPT-OSS model: {model_name_value}")
-                return DatabricksGPTOSSLLM(**llm_params)
-            else:
-                return LLM(**llm_params)
+            gpt_oss = DatabricksGPTOSSHandler.is_gpt_oss_model(model_name_value)
         elif provider == ModelProvider.GEMINI:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
-            # Set in environment variables for better compatibility with various libraries
-            if api_key:
-                os.environ["GEMINI_API_KEY"] = api_key
-                os.environ["GOOGLE_API_KEY"] = api_key
-                
-                # Set configuration for better tool/function handling with Instructor
-                os.environ["INSTRUCTOR_MODEL_NAME"] = "gemini"
-                
-                # Configure compatibility mode for Pydantic schema conversion
-                if "LITELLM_GEMINI_PYDANTIC_COMPAT" not in os.environ:
-                    os.environ["LITELLM_GEMINI_PYDANTIC_COMPAT"] = "true"
-                    
+            credential = provider
             prefixed_model = f"gemini/{model_name_value}"
         else:
             # Default fallback for other providers - use LiteLLM provider prefixing convention
             logger.warning(f"Using default model name format for provider: {provider}")
             prefixed_model = f"{provider.lower()}/{model_name_value}" if provider else model_name_value
         
-        # Configure LLM parameters (for all providers except Databricks which returns early)
         # Use longer timeout for GPT-5 models as they take more time to respond
-        timeout_value = 300 if (provider == ModelProvider.OPENAI and "gpt-5" in model_name_value.lower()) else 120
+        is_gpt5 = provider == ModelProvider.OPENAI and "gpt-5" in model_name_value.lower()
+        timeout_value = 300 if is_gpt5 else 120
         
         llm_params = {
             "model": prefixed_model,
@@ -614,7 +601,7 @@ class LLMManager:
         }
         
         # GPT-5 doesn't support certain parameters - enable drop_params
-        if provider == ModelProvider.OPENAI and "gpt-5" in model_name_value.lower():
+        if is_gpt5:
             # CrewAI's LLM will pass this to litellm
             llm_params["drop_params"] = True
             # Also specify additional params to drop that litellm might not know about
@@ -624,9 +611,6 @@ class LLMManager:
         if timeout_value == 300:
             logger.info(f"Using extended timeout of {timeout_value}s for GPT-5 model: {model_name_value}")
         
-        # Add API key and base URL if available
-        if api_key:
-            llm_params["api_key"] = api_key
         if api_base:
             llm_params["api_base"] = api_base
         
@@ -636,9 +620,68 @@ class LLMManager:
             llm_params["max_tokens"] = model_config_dict["max_output_tokens"]
             logger.info(f"Setting max_tokens to {model_config_dict['max_output_tokens']} for model {prefixed_model}")
         
+        return {
+            "params": llm_params,
+            "provider": provider,
+            "credential": credential,
+            "gpt_oss": gpt_oss,
+        }
+
+    @staticmethod
+    async def configure_crewai_llm(model_name: str) -> LLM:
+        """
+        Create and configure a CrewAI LLM instance with the correct provider prefix.
+        
+        The provider parameters are resolved once per model and reused from the
+        model resolution cache, so building an LLM for every agent of a crew
+        only costs an API key cache lookup.
+        
+        Args:
+            model_name: The model identifier to configure
+            
+        Returns:
+            LLM: Configured CrewAI LLM instance
+            
+        Raises:
+            ValueError: If model configuration is not found
+            Exception: For other configuration errors
+        """
+        cache = get_model_resolution_cache()
+        resolved = cache.get(("crewai", model_name))
+        if resolved is None:
+            resolved = await LLMManager._resolve_crewai_llm(model_name)
+            cache.put(("crewai", model_name), resolved)
+        
+        llm_params = resolved["params"]
+        provider = resolved["provider"]
+        
+        # Get API key for the provider using ApiKeysService
+        api_key = None
+        if resolved["credential"]:
+            api_key = await ApiKeysService.get_provider_api_key(resolved["credential"])
+        
+        if provider == ModelProvider.GEMINI and api_key:
+            # Set in environment variables for better compatibility with various libraries
+            os.environ["GEMINI_API_KEY"] = api_key
+            os.environ["GOOGLE_API_KEY"] = api_key
+            
+            # Set configuration for better tool/function handling with Instructor
+            os.environ["INSTRUCTOR_MODEL_NAME"] = "gemini"
+            
+            # Configure compatibility mode for Pydantic schema conversion
+            if "LITELLM_GEMINI_PYDANTIC_COMPAT" not in os.environ:
+                os.environ["LITELLM_GEMINI_PYDANTIC_COMPAT"] = "true"
+        
+        # Add API key if available
+        if api_key:
+            llm_params["api_key"] = api_key
+        
         # Create and return the CrewAI LLM
         # litellm 1.75.8+ handles GPT-5 natively, no need for custom wrapper
-        logger.info(f"Creating CrewAI LLM with model: {prefixed_model}")
+        logger.info(f"Creating CrewAI LLM with model: {llm_params['model']}, has_api_key: {bool(api_key)}, api_base: {llm_params.get('api_base')}")
+        if resolved["gpt_oss"]:
+            logger.info(f"Using DatabricksGPTOSSLLM wrapper for GPT-OSS model: {llm_params['model']}")
+            return DatabricksGPTOSSLLM(**llm_params)
         return LLM(**llm_params)
 
     @staticmethod
@@ -661,6 +704,9 @@ class LLMManager:
         """
         Get an embedding vector for the given text using configurable embedder.
         
+        This is a single-text convenience wrapper around get_embeddings, so it
+        shares the embedding cache and request batching.
+        
         Args:
             text: The text to create an embedding for
             model: The embedding model to use (can be overridden by embedder_config)
@@ -669,6 +715,31 @@ class LLMManager:
         Returns:
             List[float]: The embedding vector or None if creation fails
         """
+        embeddings = await LLMManager.get_embeddings([text], model=model, embedder_config=embedder_config)
+        return embeddings[0]
+
+    @staticmethod
+    async def get_embeddings(texts: List[str], model: str = "databricks-gte-large-en", embedder_config: Optional[Dict[str, Any]] = None) -> List[Optional[List[float]]]:
+        """
+        Get embedding vectors for several texts using configurable embedder.
+        
+        Identical texts are embedded once and previously embedded texts are
+        served from the content-hash embedding cache. The remaining texts are
+        sent in provider-sized batches, with at most EMBEDDING_MAX_CONCURRENCY
+        requests in flight, after resolving credentials once for the whole call.
+        
+        Args:
+            texts: The texts to create embeddings for
+            model: The embedding model to use (can be overridden by embedder_config)
+            embedder_config: Optional embedder configuration with provider and model settings
+            
+        Returns:
+            List with one embedding vector per input text, in input order; an entry
+            is None if its embedding could not be created
+        """
+        if not texts:
+            return []
+        
         provider = 'databricks'  # Default provider
         try:
             # Determine provider and model from embedder_config or defaults
@@ -681,236 +752,339 @@ class LLMManager:
                 embedding_model = model
             
             # Check circuit breaker for this provider
-            current_time = time.time()
-            if provider in LLMManager._embedding_failures:
-                failure_info = LLMManager._embedding_failures[provider]
-                failure_count = failure_info.get('count', 0)
-                last_failure_time = failure_info.get('last_failure', 0)
-                
-                # If circuit is open, check if it should be reset
-                if failure_count >= LLMManager._embedding_failure_threshold:
-                    if current_time - last_failure_time < LLMManager._circuit_reset_time:
-                        logger.warning(f"Circuit breaker OPEN for {provider} embeddings. Failing fast.")
-                        return None
-                    else:
-                        # Reset circuit after timeout
-                        logger.info(f"Resetting circuit breaker for {provider} embeddings")
-                        LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
+            if LLMManager._is_embedding_circuit_open(provider):
+                return [None] * len(texts)
             
-            logger.info(f"Creating embedding using provider: {provider}, model: {embedding_model}")
+            # Serve what we can from the cache and dedupe the rest
+            cache = get_embedding_cache()
+            keys = [make_embedding_key(provider, embedding_model, text) for text in texts]
+            if cache.persistent:
+                embeddings = await asyncio.to_thread(cache.get_many, keys)
+            else:
+                embeddings = cache.get_many(keys)
+            pending: Dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in embeddings and key not in pending:
+                    pending[key] = text
             
-            # Handle different embedding providers
-            if provider == 'databricks' or 'databricks' in embedding_model:
-                # Use enhanced Databricks authentication for embeddings - follow GenieTool pattern
-                try:
-                    from src.utils.databricks_auth import is_databricks_apps_environment, get_databricks_auth_headers
-                    
-                    # First try: OBO authentication if available
-                    logger.info("Attempting enhanced Databricks authentication for embeddings")
-                    headers_result, error = await get_databricks_auth_headers()
-                    if headers_result and not error:
-                        logger.info("Using enhanced Databricks authentication (OAuth/OBO) for embeddings")
-                        headers = headers_result
-                        api_key = None  # OAuth handled by headers
+            if pending:
+                logger.info(f"Creating {len(pending)} embeddings using provider: {provider}, model: {embedding_model} ({len(texts) - len(pending)} cached or duplicate)")
+                created = await LLMManager._create_embeddings(provider, embedding_model, list(pending.items()))
+                if created:
+                    if cache.persistent:
+                        await asyncio.to_thread(cache.put_many, created)
                     else:
-                        logger.info(f"Enhanced auth failed ({error}), falling back to API key service")
-                        # Second try: API key from service
-                        api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
-                        if api_key:
-                            logger.info("Using API key from service for embeddings")
-                            headers = None
+                        cache.put_many(created)
+                    embeddings.update(created)
+            else:
+                logger.debug(f"All {len(texts)} embeddings served from cache for {provider}/{embedding_model}")
+            
+            return [embeddings.get(key) for key in keys]
+                
+        except Exception as e:
+            logger.error(f"Error creating embedding: {str(e)}")
+            # Track failure for circuit breaker
+            LLMManager._record_embedding_failure(provider)
+            
+            # Log circuit breaker status
+            failure_count = LLMManager._embedding_failures[provider]['count']
+            if failure_count >= LLMManager._embedding_failure_threshold:
+                logger.error(f"Circuit breaker tripped for {provider} embeddings after {failure_count} failures")
+            
+            return [None] * len(texts)
+
+    @staticmethod
+    def _is_embedding_circuit_open(provider: str) -> bool:
+        """
+        Check the embedding circuit breaker for a provider, resetting it once the timeout passed.
+        
+        Args:
+            provider: Embedding provider name
+            
+        Returns:
+            True if calls to the provider should fail fast
+        """
+        current_time = time.time()
+        if provider in LLMManager._embedding_failures:
+            failure_info = LLMManager._embedding_failures[provider]
+            failure_count = failure_info.get('count', 0)
+            last_failure_time = failure_info.get('last_failure', 0)
+            
+            # If circuit is open, check if it should be reset
+            if failure_count >= LLMManager._embedding_failure_threshold:
+                if current_time - last_failure_time < LLMManager._circuit_reset_time:
+                    logger.warning(f"Circuit breaker OPEN for {provider} embeddings. Failing fast.")
+                    return True
+                else:
+                    # Reset circuit after timeout
+                    logger.info(f"Resetting circuit breaker for {provider} embeddings")
+                    LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
+        return False
+
+    @staticmethod
+    def _record_embedding_failure(provider: str) -> None:
+        """Count a failed embedding request towards the provider's circuit breaker."""
+        if provider not in LLMManager._embedding_failures:
+            LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
+        LLMManager._embedding_failures[provider]['count'] += 1
+        LLMManager._embedding_failures[provider]['last_failure'] = time.time()
+
+    @staticmethod
+    async def _get_databricks_embedding_auth() -> Optional[Tuple[Dict[str, str], str]]:
+        """
+        Resolve Databricks credentials and the invocation URL for embeddings.
+        
+        Tries OBO/OAuth headers, then the API key service, then client
+        credentials and finally the DATABRICKS_TOKEN environment variable.
+        
+        Returns:
+            Tuple of (request headers, workspace URL) or None if no credentials are available
+        """
+        try:
+            from src.utils.databricks_auth import is_databricks_apps_environment, get_databricks_auth_headers
+            
+            # First try: OBO authentication if available
+            logger.info("Attempting enhanced Databricks authentication for embeddings")
+            headers_result, error = await get_databricks_auth_headers()
+            if headers_result and not error:
+                logger.info("Using enhanced Databricks authentication (OAuth/OBO) for embeddings")
+                headers = headers_result
+                api_key = None  # OAuth handled by headers
+            else:
+                logger.info(f"Enhanced auth failed ({error}), falling back to API key service")
+                # Second try: API key from service
+                api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+                if api_key:
+                    logger.info("Using API key from service for embeddings")
+                    headers = None
+                else:
+                    # Third try: Client credentials from environment
+                    client_id = os.getenv("DATABRICKS_CLIENT_ID")
+                    client_secret = os.getenv("DATABRICKS_CLIENT_SECRET")
+                    if client_id and client_secret:
+                        logger.info("Using client credentials for embeddings")
+                        # Let the enhanced auth handle client credentials
+                        headers_result, error = await get_databricks_auth_headers()
+                        if headers_result and not error:
+                            headers = headers_result
+                            api_key = None
                         else:
-                            # Third try: Client credentials from environment
-                            client_id = os.getenv("DATABRICKS_CLIENT_ID")
-                            client_secret = os.getenv("DATABRICKS_CLIENT_SECRET")
-                            if client_id and client_secret:
-                                logger.info("Using client credentials for embeddings")
-                                # Let the enhanced auth handle client credentials
-                                headers_result, error = await get_databricks_auth_headers()
-                                if headers_result and not error:
-                                    headers = headers_result
-                                    api_key = None
-                                else:
-                                    # Fourth try: Environment variable DATABRICKS_TOKEN
-                                    api_key = os.getenv("DATABRICKS_TOKEN") or os.getenv("DATABRICKS_API_KEY")
-                                    if api_key:
-                                        logger.info("Using DATABRICKS_TOKEN from environment for embeddings")
-                                        headers = None
-                                    else:
-                                        logger.error("No Databricks authentication method available")
-                                        return None
+                            # Fourth try: Environment variable DATABRICKS_TOKEN
+                            api_key = os.getenv("DATABRICKS_TOKEN") or os.getenv("DATABRICKS_API_KEY")
+                            if api_key:
+                                logger.info("Using DATABRICKS_TOKEN from environment for embeddings")
+                                headers = None
                             else:
-                                # Fourth try: Environment variable DATABRICKS_TOKEN
-                                api_key = os.getenv("DATABRICKS_TOKEN") or os.getenv("DATABRICKS_API_KEY")
-                                if api_key:
-                                    logger.info("Using DATABRICKS_TOKEN from environment for embeddings")
-                                    headers = None
-                                else:
-                                    logger.error("No Databricks authentication method available")
-                                    return None
-                        
-                except ImportError:
-                    logger.warning("Enhanced Databricks auth not available for embeddings, using fallback methods")
-                    # Try API key service first
-                    api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
-                    if not api_key:
-                        # Fall back to environment variable
+                                logger.error("No Databricks authentication method available")
+                                return None
+                    else:
+                        # Fourth try: Environment variable DATABRICKS_TOKEN
                         api_key = os.getenv("DATABRICKS_TOKEN") or os.getenv("DATABRICKS_API_KEY")
                         if api_key:
-                            logger.info("Using DATABRICKS_TOKEN from environment for embeddings (no enhanced auth)")
-                    headers = None
-                
-                # Get workspace URL from environment first, then database
-                workspace_url = os.getenv("DATABRICKS_HOST", "")
-                if workspace_url:
-                    # Use centralized URL utility for consistent handling
-                    api_base = DatabricksURLUtils.construct_serving_endpoints_url(workspace_url)
-                    logger.info(f"Using Databricks workspace URL from environment for embeddings: {workspace_url}")
-                else:
-                    # Fallback to database configuration
-                    api_base = None
-                    from src.services.databricks_service import DatabricksService
-                    try:
-                        async with UnitOfWork() as uow:
-                            databricks_service = await DatabricksService.from_unit_of_work(uow)
-                            config = await databricks_service.get_databricks_config()
-                            if config and config.workspace_url:
-                                workspace_url = config.workspace_url
-                                # Use centralized URL utility for consistent handling
-                                api_base = DatabricksURLUtils.construct_serving_endpoints_url(workspace_url)
-                                logger.info(f"Using workspace URL from database for embeddings: {workspace_url}")
-                    except Exception as e:
-                        logger.error(f"Error getting Databricks workspace URL for embeddings: {e}")
-                
-                # Check if we have either OAuth headers or API key + base URL
-                if not ((headers and api_base) or (api_key and api_base)):
-                    logger.warning(f"Missing Databricks credentials - OAuth headers: {bool(headers)}, API key: {bool(api_key)}, API base: {bool(api_base)}")
-                    return None
-                
-                # Ensure model has databricks prefix for litellm
-                if not embedding_model.startswith('databricks/'):
-                    embedding_model = f"databricks/{embedding_model}"
+                            logger.info("Using DATABRICKS_TOKEN from environment for embeddings")
+                            headers = None
+                        else:
+                            logger.error("No Databricks authentication method available")
+                            return None
                 
-                # Use direct HTTP request to avoid config file issues
-                import aiohttp
+        except ImportError:
+            logger.warning("Enhanced Databricks auth not available for embeddings, using fallback methods")
+            # Try API key service first
+            api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+            if not api_key:
+                # Fall back to environment variable
+                api_key = os.getenv("DATABRICKS_TOKEN") or os.getenv("DATABRICKS_API_KEY")
+                if api_key:
+                    logger.info("Using DATABRICKS_TOKEN from environment for embeddings (no enhanced auth)")
+            headers = None
+        
+        # Get workspace URL from environment first, then database
+        workspace_url = os.getenv("DATABRICKS_HOST", "")
+        if workspace_url:
+            # Use centralized URL utility for consistent handling
+            api_base = DatabricksURLUtils.construct_serving_endpoints_url(workspace_url)
+            logger.info(f"Using Databricks workspace URL from environment for embeddings: {workspace_url}")
+        else:
+            # Fallback to database configuration
+            api_base = None
+            from src.services.databricks_service import DatabricksService
+            try:
+                async with UnitOfWork() as uow:
+                    databricks_service = await DatabricksService.from_unit_of_work(uow)
+                    config = await databricks_service.get_databricks_config()
+                    if config and config.workspace_url:
+                        workspace_url = config.workspace_url
+                        # Use centralized URL utility for consistent handling
+                        api_base = DatabricksURLUtils.construct_serving_endpoints_url(workspace_url)
+                        logger.info(f"Using workspace URL from database for embeddings: {workspace_url}")
+            except Exception as e:
+                logger.error(f"Error getting Databricks workspace URL for embeddings: {e}")
+        
+        # Check if we have either OAuth headers or API key + base URL
+        if not ((headers and api_base) or (api_key and api_base)):
+            logger.warning(f"Missing Databricks credentials - OAuth headers: {bool(headers)}, API key: {bool(api_key)}, API base: {bool(api_base)}")
+            return None
+        
+        # Use OAuth headers if available, otherwise fall back to API key
+        if headers:
+            request_headers = headers.copy()
+            if "Content-Type" not in request_headers:
+                request_headers["Content-Type"] = "application/json"
+        else:
+            request_headers = {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+        
+        # Extract workspace URL from api_base (which contains /serving-endpoints)
+        return request_headers, DatabricksURLUtils.extract_workspace_from_endpoint(api_base)
+
+    @staticmethod
+    async def _create_embeddings(provider: str, embedding_model: str, items: List[Tuple[str, str]]) -> Dict[str, List[float]]:
+        """
+        Embed uncached texts with the given provider.
+        
+        Args:
+            provider: Embedding provider name
+            embedding_model: Embedding model name
+            items: (cache key, text) pairs, without duplicates
+            
+        Returns:
+            Mapping of cache key to embedding for every text that was embedded
+        """
+        # Handle different embedding providers
+        if provider == 'databricks' or 'databricks' in embedding_model:
+            auth = await LLMManager._get_databricks_embedding_auth()
+            if not auth:
+                return {}
+            request_headers, workspace_url = auth
+            
+            # Ensure model has databricks prefix for litellm
+            if not embedding_model.startswith('databricks/'):
+                embedding_model = f"databricks/{embedding_model}"
+            
+            # Use direct HTTP request to avoid config file issues
+            import aiohttp
+            
+            try:
+                # Construct the direct API endpoint using centralized utility
+                endpoint_url = DatabricksURLUtils.construct_model_invocation_url(workspace_url, embedding_model)
                 
-                try:
-                    # Construct the direct API endpoint using centralized utility
-                    # Extract workspace URL from api_base (which contains /serving-endpoints)
-                    workspace_url = DatabricksURLUtils.extract_workspace_from_endpoint(api_base)
-                    endpoint_url = DatabricksURLUtils.construct_model_invocation_url(workspace_url, embedding_model)
-                    
-                    # Use OAuth headers if available, otherwise fall back to API key
-                    if headers:
-                        request_headers = headers.copy()
-                        if "Content-Type" not in request_headers:
-                            request_headers["Content-Type"] = "application/json"
-                    else:
-                        request_headers = {
-                            "Authorization": f"Bearer {api_key}",
-                            "Content-Type": "application/json"
-                        }
-                    
-                    payload = {
-                        "input": [text] if isinstance(text, str) else text
-                    }
-                    
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post(endpoint_url, headers=request_headers, json=payload) as response:
+                async with aiohttp.ClientSession() as session:
+                    async def embed_batch(batch: List[str]) -> Optional[List[List[float]]]:
+                        async with session.post(endpoint_url, headers=request_headers, json={"input": batch}) as response:
                             if response.status == 200:
                                 result = await response.json()
                                 # Databricks embedding API returns embeddings in 'data' field
                                 if 'data' in result and len(result['data']) > 0:
-                                    embedding = result['data'][0].get('embedding', result['data'][0])
-                                    logger.info(f"Successfully created embedding with {len(embedding)} dimensions using direct Databricks API")
-                                    return embedding
-                                else:
-                                    logger.warning("No embedding data found in Databricks response")
-                                    return None
-                            else:
-                                error_text = await response.text()
-                                logger.error(f"Databricks embedding API error {response.status}: {error_text}")
+                                    return [item.get('embedding', item) for item in result['data']]
+                                logger.warning("No embedding data found in Databricks response")
                                 return None
-                                
-                except Exception as e:
-                    logger.error(f"Error calling Databricks embedding API directly: {str(e)}")
-                    return None
-                
-            elif provider == 'ollama':
-                # Use Ollama for embeddings
-                api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
-                
-                # Ensure model has ollama prefix
-                if not embedding_model.startswith('ollama/'):
-                    embedding_model = f"ollama/{embedding_model}"
-                
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_base=api_base
-                )
-                
-            elif provider == 'google':
-                # Use Google AI for embeddings
-                api_key = await ApiKeysService.get_provider_api_key(ModelProvider.GEMINI)
-                
-                if not api_key:
-                    logger.warning("No Google API key found for creating embeddings")
-                    return None
-                
-                # Ensure model has gemini prefix for embeddings
-                if not embedding_model.startswith('gemini/'):
-                    embedding_model = f"gemini/{embedding_model}"
-                
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_key=api_key
-                )
-                
-            else:
-                # Default to OpenAI for embeddings
-                api_key = await ApiKeysService.get_provider_api_key(ModelProvider.OPENAI)
-                
-                if not api_key:
-                    logger.warning("No OpenAI API key found for creating embeddings")
-                    return None
+                            error_text = await response.text()
+                            logger.error(f"Databricks embedding API error {response.status}: {error_text}")
+                            return None
                     
-                # Create the embedding using litellm
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_key=api_key
-                )
-            
-            # Extract the embedding vector
-            if response and "data" in response and len(response["data"]) > 0:
-                embedding = response["data"][0]["embedding"]
-                logger.info(f"Successfully created embedding with {len(embedding)} dimensions using {provider}")
-                # Reset failure count on success
-                if provider in LLMManager._embedding_failures:
-                    LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
-                return embedding
-            else:
-                logger.warning("Failed to get embedding from response")
-                # Track failure
-                if provider not in LLMManager._embedding_failures:
-                    LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
-                LLMManager._embedding_failures[provider]['count'] += 1
-                LLMManager._embedding_failures[provider]['last_failure'] = time.time()
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error creating embedding: {str(e)}")
-            # Track failure for circuit breaker
-            if provider not in LLMManager._embedding_failures:
-                LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
-            LLMManager._embedding_failures[provider]['count'] += 1
-            LLMManager._embedding_failures[provider]['last_failure'] = time.time()
+                    return await LLMManager._run_embedding_batches(provider, items, embed_batch)
+                    
+            except Exception as e:
+                logger.error(f"Error calling Databricks embedding API directly: {str(e)}")
+                LLMManager._record_embedding_failure(provider)
+                return {}
             
-            # Log circuit breaker status
-            failure_count = LLMManager._embedding_failures[provider]['count']
-            if failure_count >= LLMManager._embedding_failure_threshold:
-                logger.error(f"Circuit breaker tripped for {provider} embeddings after {failure_count} failures")
+        elif provider == 'ollama':
+            # Use Ollama for embeddings
+            api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
+            
+            # Ensure model has ollama prefix
+            if not embedding_model.startswith('ollama/'):
+                embedding_model = f"ollama/{embedding_model}"
+            
+            request_kwargs = {"api_base": api_base}
+            
+        elif provider == 'google':
+            # Use Google AI for embeddings
+            api_key = await ApiKeysService.get_provider_api_key(ModelProvider.GEMINI)
+            
+            if not api_key:
+                logger.warning("No Google API key found for creating embeddings")
+                return {}
+            
+            # Ensure model has gemini prefix for embeddings
+            if not embedding_model.startswith('gemini/'):
+                embedding_model = f"gemini/{embedding_model}"
+            
+            request_kwargs = {"api_key": api_key}
             
+        else:
+            # Default to OpenAI for embeddings
+            api_key = await ApiKeysService.get_provider_api_key(ModelProvider.OPENAI)
+            
+            if not api_key:
+                logger.warning("No OpenAI API key found for creating embeddings")
+                return {}
+            
+            request_kwargs = {"api_key": api_key}
+        
+        async def embed_batch(batch: List[str]) -> Optional[List[List[float]]]:
+            # Create the embeddings using litellm
+            response = await litellm.aembedding(model=embedding_model, input=batch, **request_kwargs)
+            if response and "data" in response and len(response["data"]) > 0:
+                return [item["embedding"] for item in response["data"]]
+            logger.warning("Failed to get embedding from response")
             return None
+        
+        return await LLMManager._run_embedding_batches(provider, items, embed_batch)
+
+    @staticmethod
+    async def _run_embedding_batches(
+        provider: str,
+        items: List[Tuple[str, str]],
+        embed_batch: Callable[[List[str]], Awaitable[Optional[List[List[float]]]]]
+    ) -> Dict[str, List[float]]:
+        """
+        Send texts to the provider in batches, running batches concurrently under a limit.
+        
+        Args:
+            provider: Embedding provider name (selects the batch size)
+            items: (cache key, text) pairs
+            embed_batch: Coroutine function embedding a list of texts in one request
+            
+        Returns:
+            Mapping of cache key to embedding for every batch that succeeded
+        """
+        from src.config.settings import settings
+        
+        batch_size = get_embedding_batch_size(provider)
+        semaphore = asyncio.Semaphore(max(1, settings.EMBEDDING_MAX_CONCURRENCY))
+        
+        async def run(batch: List[Tuple[str, str]]):
+            async with semaphore:
+                return batch, await embed_batch([text for _, text in batch])
+        
+        outcomes = await asyncio.gather(
+            *(run(batch) for batch in iter_batches(items, batch_size)),
+            return_exceptions=True
+        )
+        
+        embeddings: Dict[str, List[float]] = {}
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error creating embedding batch with {provider}: {str(outcome)}")
+                LLMManager._record_embedding_failure(provider)
+                continue
+            batch, vectors = outcome
+            if not vectors or len(vectors) < len(batch):
+                # embed_batch already logged why the request failed
+                if vectors:
+                    logger.warning(f"Embedding response from {provider} has {len(vectors)} vectors for {len(batch)} inputs")
+                LLMManager._record_embedding_failure(provider)
+                continue
+            embeddings.update((key, vector) for (key, _), vector in zip(batch, vectors))
+        
+        if embeddings:
+            dimensions = len(next(iter(embeddings.values())))
+            logger.info(f"Successfully created {len(embeddings)} embeddings with {dimensions} dimensions using {provider}")
+            # Reset failure count on success
+            if provider in LLMManager._embedding_failures:
+                LLMManager._embedding_failures[provider] = {'count': 0, 'last_failure': 0}
+        return embeddings
@@ -0,0 +1,85 @@
+"""
+TTL cache of resolved model configurations.
+
+Building an LLM needs the model's configuration row and the provider-specific
+parameters derived from it (prefixed model name, api_base, timeouts, which
+provider key to use). Crew preparation builds one LLM per agent, so these are
+resolved once per model and reused until the entry expires or a model
+configuration changes. Cached entries never hold secrets: credentials are
+referenced by provider name and looked up through the API key cache.
+"""
+import copy
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ModelResolutionCache:
+    """Thread-safe TTL cache of resolved model parameters."""
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up a resolved entry.
+
+        Args:
+            key: Cache key, e.g. ``("crewai", model_name)``
+
+        Returns:
+            A copy of the cached dict, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """Store a resolved entry."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, copy.deepcopy(value))
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after a model configuration changed."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_model_resolution_cache: Optional[ModelResolutionCache] = None
+_model_resolution_cache_lock = threading.Lock()
+
+
+def get_model_resolution_cache() -> ModelResolutionCache:
+    """Get the process-wide model resolution cache configured from settings."""
+    global _model_resolution_cache
+    if _model_resolution_cache is None:
+        with _model_resolution_cache_lock:
+            if _model_resolution_cache is None:
+                from src.config.settings import settings
+                _model_resolution_cache = ModelResolutionCache(settings.MODEL_RESOLUTION_CACHE_TTL_SECONDS)
+    return _model_resolution_cache
@@ -0,0 +1,224 @@
+"""
+Cache of prompt templates, the tool catalogue and rendered system prompts.
+
+Every generation request needs its prompt template and, for crews, the tool
+catalogue rendered into the system prompt. Both change rarely, so they are
+kept in process: templates by name, the catalogue as a whole, and rendered
+system prompts by template name, template version (a digest of its content)
+and a fingerprint of the tool set. TemplateService and ToolService drop the
+affected entries whenever they change a template or a tool; entries also
+expire after a TTL to pick up changes made by other processes.
+
+The catalogue is also indexed by tool title and ID for tool factories, and
+versioned: every invalidation bumps the version, so a catalogue loaded while
+a tool was being changed is not cached.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+RenderedKey = Tuple[str, str, str]
+
+
+def content_digest(value: Any) -> str:
+    """Stable digest of a string or JSON-serializable value."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """Thread-safe TTL cache of templates, the tool catalogue and rendered prompts."""
+
+    def __init__(self, ttl_seconds: float, max_rendered: int):
+        self._ttl = ttl_seconds
+        self._max_rendered = max_rendered
+        self._templates: Dict[str, Tuple[float, str]] = {}
+        self._tools: Optional[Tuple[float, List[Any]]] = None
+        self._tool_index: Dict[str, Any] = {}
+        self._tools_version = 0
+        self._rendered: "OrderedDict[RenderedKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _expiry(self) -> float:
+        return time.monotonic() + self._ttl
+
+    def _lookup(self, entry: Optional[Tuple[float, Any]]) -> Any:
+        # Caller holds the lock
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def get_template(self, name: str) -> Optional[str]:
+        """Get the cached content of a template, or None if missing or expired."""
+        with self._lock:
+            return self._lookup(self._templates.get(name))
+
+    def put_template(self, name: str, content: str) -> None:
+        """Cache the content of a template."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._templates[name] = (self._expiry(), content)
+
+    def get_tools(self) -> Optional[List[Any]]:
+        """Get a copy of the cached tool catalogue, or None if missing or expired."""
+        with self._lock:
+            tools = self._lookup(self._tools)
+            return list(tools) if tools is not None else None
+
+    def get_tool_index(self) -> Optional[Dict[str, Any]]:
+        """Get a copy of the cached catalogue keyed by title and str(id), or None if missing or expired."""
+        with self._lock:
+            tools = self._lookup(self._tools)
+            return dict(self._tool_index) if tools is not None else None
+
+    @property
+    def tools_version(self) -> int:
+        """Version of the tool catalogue, bumped whenever it is invalidated."""
+        return self._tools_version
+
+    def put_tools(self, tools: List[Any], version: Optional[int] = None) -> None:
+        """
+        Cache the tool catalogue.
+
+        Args:
+            tools: Tools of the catalogue
+            version: ``tools_version`` read before the tools were loaded; the
+                catalogue is not cached if it was invalidated since
+        """
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self._tools_version:
+                return
+            index: Dict[str, Any] = {}
+            for tool in tools:
+                if hasattr(tool, 'title'):
+                    index[tool.title] = tool
+                if hasattr(tool, 'id'):
+                    index[str(tool.id)] = tool
+            self._tools = (self._expiry(), list(tools))
+            self._tool_index = index
+
+    @staticmethod
+    def rendered_key(template_name: str, template_content: str, tools: List[Dict[str, Any]]) -> RenderedKey:
+        """Build the key of a system prompt rendered from a template and a tool set."""
+        return (template_name, content_digest(template_content), content_digest(tools))
+
+    def get_rendered(self, key: RenderedKey) -> Optional[str]:
+        """Get a cached rendered system prompt, or None if missing or expired."""
+        with self._lock:
+            prompt = self._lookup(self._rendered.get(key))
+            if prompt is not None:
+                self._rendered.move_to_end(key)
+            return prompt
+
+    def put_rendered(self, key: RenderedKey, prompt: str) -> None:
+        """Cache a rendered system prompt, evicting the least recently used one if full."""
+        if self._ttl <= 0 or self._max_rendered <= 0:
+            return
+        with self._lock:
+            self._rendered[key] = (self._expiry(), prompt)
+            self._rendered.move_to_end(key)
+            while len(self._rendered) > self._max_rendered:
+                self._rendered.popitem(last=False)
+
+    def invalidate_templates(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached templates and the prompts rendered from them.
+
+        Args:
+            name: Template to drop, or None for all templates
+        """
+        with self._lock:
+            if name is None:
+                self._templates.clear()
+                self._rendered.clear()
+                return
+            self._templates.pop(name, None)
+            for key in [key for key in self._rendered if key[0] == name]:
+                del self._rendered[key]
+
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool catalogue, e.g. after a tool was created or changed."""
+        with self._lock:
+            self._tools = None
+            self._tool_index = {}
+            self._tools_version += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._templates.clear()
+            self._tools = None
+            self._tool_index = {}
+            self._tools_version += 1
+            self._rendered.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache sizes and hit/miss counters."""
+        return {
+            "templates": len(self._templates),
+            "tools_cached": self._tools is not None,
+            "tools_version": self._tools_version,
+            "rendered": len(self._rendered),
+            "max_rendered": self._max_rendered,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def add_prompt_cache_hints(messages: List[Dict[str, Any]], model: str) -> List[Dict[str, Any]]:
+    """
+    Mark the leading system message as a cacheable prompt prefix.
+
+    Only Anthropic models accept ``cache_control`` blocks; other messages are
+    returned unchanged, as are all messages when LLM_PROMPT_CACHE_HINTS is off.
+
+    Args:
+        messages: Chat messages, starting with the static system prompt
+        model: Model name as passed to litellm (provider-prefixed)
+
+    Returns:
+        Messages to send, the first one converted to a cacheable content block
+    """
+    from src.config.settings import settings
+    if not settings.LLM_PROMPT_CACHE_HINTS or not messages:
+        return messages
+    if not isinstance(model, str) or not model.startswith("anthropic/"):
+        return messages
+    first = messages[0]
+    if first.get("role") != "system" or not isinstance(first.get("content"), str):
+        return messages
+    cached = {
+        "role": "system",
+        "content": [{"type": "text", "text": first["content"], "cache_control": {"type": "ephemeral"}}],
+    }
+    return [cached] + list(messages[1:])
+
+
+_prompt_cache: Optional[PromptCache] = None
+_prompt_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> PromptCache:
+    """Get the process-wide prompt cache configured from settings."""
+    global _prompt_cache
+    if _prompt_cache is None:
+        with _prompt_cache_lock:
+            if _prompt_cache is None:
+                from src.config.settings import settings
+                _prompt_cache = PromptCache(
+                    settings.PROMPT_CACHE_TTL_SECONDS,
+                    settings.PROMPT_CACHE_MAX_RENDERED,
+                )
+    return _prompt_cache
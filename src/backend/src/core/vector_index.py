@@ -0,0 +1,271 @@
+"""
+In-process cosine-similarity index over embedding vectors.
+
+Vectors are kept L2-normalised in one contiguous float32 matrix, so a top-k
+query is a single matrix-vector product followed by ``argpartition``. The
+matrix can be persisted to ``.npy`` sidecar files and memory-mapped on the next
+start instead of re-parsing the embeddings stored as JSON in SQLite. A
+signature of the source table (row count, highest id, latest update) is saved
+with the sidecar so a stale sidecar is detected and rebuilt.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:
+    """
+    Top-k cosine similarity search over id-keyed vectors.
+
+    All methods are thread-safe. Rows are stored in a capacity-doubling buffer;
+    removal swaps the last row into the freed slot, so upsert and remove are
+    O(dim) and search is O(n * dim).
+    """
+
+    def __init__(self, sidecar_path: Optional[str] = None):
+        self._sidecar_path = sidecar_path
+        self._lock = threading.Lock()
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._size = 0
+        self._positions: Dict[int, int] = {}
+        self.loaded = False
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Vector dimension, or None while the index is empty."""
+        return self._matrix.shape[1] if self._size else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(array))
+        if not array.size or norm == 0.0 or not np.isfinite(norm):
+            return None
+        return array / norm
+
+    def _set_rows(self, ids: np.ndarray, matrix: np.ndarray) -> None:
+        # Caller holds the lock
+        self._ids = ids
+        self._matrix = matrix
+        self._size = len(ids)
+        self._positions = {int(row_id): position for position, row_id in enumerate(ids.tolist())}
+        self.loaded = True
+
+    def build(self, rows: Iterable[Tuple[int, Sequence[float]]]) -> None:
+        """
+        Replace the index contents.
+
+        Rows with a zero vector or a dimension different from the first valid
+        row are skipped.
+
+        Args:
+            rows: (id, embedding) pairs
+        """
+        ids: List[int] = []
+        vectors: List[np.ndarray] = []
+        dim = None
+        skipped = 0
+        for row_id, embedding in rows:
+            vector = self._normalize(embedding) if embedding is not None else None
+            if vector is None or (dim is not None and vector.shape[0] != dim):
+                skipped += 1
+                continue
+            dim = vector.shape[0]
+            ids.append(int(row_id))
+            vectors.append(vector)
+        if skipped:
+            logger.warning(f"Skipped {skipped} embeddings with missing, zero or mismatched vectors")
+
+        matrix = np.vstack(vectors).astype(np.float32, copy=False) if vectors else np.empty((0, 0), dtype=np.float32)
+        with self._lock:
+            self._set_rows(np.asarray(ids, dtype=np.int64), matrix)
+
+    def _ensure_writable(self, extra: int, dim: int) -> None:
+        # Caller holds the lock; copies memory-mapped or full buffers before writing
+        capacity = self._matrix.shape[0] if self._matrix.ndim == 2 and self._matrix.shape[1] == dim else 0
+        writable = isinstance(self._matrix, np.memmap) is False and self._matrix.flags.writeable
+        if capacity >= self._size + extra and writable:
+            return
+        new_capacity = max(16, self._size + extra, capacity * 2)
+        matrix = np.zeros((new_capacity, dim), dtype=np.float32)
+        ids = np.zeros(new_capacity, dtype=np.int64)
+        if self._size:
+            matrix[:self._size] = self._matrix[:self._size]
+            ids[:self._size] = self._ids[:self._size]
+        self._matrix = matrix
+        self._ids = ids
+
+    def upsert(self, row_id: int, embedding: Sequence[float]) -> bool:
+        """
+        Add a vector or replace the vector stored for an id.
+
+        Args:
+            row_id: Row id
+            embedding: Embedding vector
+
+        Returns:
+            True if the vector was stored, False if it was rejected
+        """
+        vector = self._normalize(embedding) if embedding is not None else None
+        with self._lock:
+            if vector is None or (self._size and vector.shape[0] != self._matrix.shape[1]):
+                logger.warning(f"Rejected embedding for id {row_id}: zero or mismatched vector")
+                self._remove_locked(int(row_id))
+                return False
+            position = self._positions.get(int(row_id))
+            if position is None:
+                self._ensure_writable(1, vector.shape[0])
+                position = self._size
+                self._size += 1
+                self._positions[int(row_id)] = position
+                self._ids[position] = int(row_id)
+            else:
+                self._ensure_writable(0, vector.shape[0])
+            self._matrix[position] = vector
+            return True
+
+    def _remove_locked(self, row_id: int) -> bool:
+        position = self._positions.pop(row_id, None)
+        if position is None:
+            return False
+        last = self._size - 1
+        if position != last:
+            self._ensure_writable(0, self._matrix.shape[1])
+            self._matrix[position] = self._matrix[last]
+            moved_id = int(self._ids[last])
+            self._ids[position] = moved_id
+            self._positions[moved_id] = position
+        self._size = last
+        return True
+
+    def remove(self, row_id: int) -> bool:
+        """Remove the vector stored for an id; returns whether it was present."""
+        with self._lock:
+            return self._remove_locked(int(row_id))
+
+    def search(self, query: Sequence[float], limit: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Find the vectors most similar to a query.
+
+        Args:
+            query: Query embedding
+            limit: Maximum number of results
+            min_score: Only return results with a cosine similarity above this
+
+        Returns:
+            (id, cosine similarity) pairs, most similar first
+        """
+        vector = self._normalize(query)
+        with self._lock:
+            size = self._size
+            if vector is None or not size or limit <= 0:
+                return []
+            if vector.shape[0] != self._matrix.shape[1]:
+                logger.warning(f"Query dimension {vector.shape[0]} does not match index dimension {self._matrix.shape[1]}")
+                return []
+            scores = self._matrix[:size] @ vector
+            ids = self._ids[:size]
+
+        k = min(limit, size)
+        if k < size:
+            top = np.argpartition(scores, size - k)[size - k:]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(int(ids[i]), float(scores[i])) for i in top if scores[i] > min_score]
+
+    def _sidecar_files(self) -> Tuple[str, str, str]:
+        base = self._sidecar_path
+        return f"{base}.vectors.npy", f"{base}.ids.npy", f"{base}.meta.json"
+
+    def save(self, signature: Dict[str, Any]) -> bool:
+        """
+        Write the index to its sidecar files.
+
+        Args:
+            signature: Description of the source table state the index reflects
+
+        Returns:
+            True if written
+        """
+        if not self._sidecar_path:
+            return False
+        vectors_path, ids_path, meta_path = self._sidecar_files()
+        with self._lock:
+            matrix = np.ascontiguousarray(self._matrix[:self._size])
+            ids = np.array(self._ids[:self._size])
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(vectors_path)), exist_ok=True)
+            # Remove the metadata first so a partially written sidecar is never trusted
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            np.save(vectors_path, matrix)
+            np.save(ids_path, ids)
+            with open(meta_path, "w") as f:
+                json.dump({"signature": signature, "count": int(len(ids))}, f)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not write vector index sidecar {self._sidecar_path}: {e}")
+            return False
+
+    def load(self, signature: Dict[str, Any]) -> bool:
+        """
+        Memory-map the sidecar files if they match the given signature.
+
+        Args:
+            signature: Current state of the source table
+
+        Returns:
+            True if the index was loaded from the sidecar
+        """
+        if not self._sidecar_path:
+            return False
+        vectors_path, ids_path, meta_path = self._sidecar_files()
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("signature") != signature:
+                return False
+            matrix = np.load(vectors_path, mmap_mode="r")
+            ids = np.load(ids_path)
+            if len(ids) != meta.get("count") or matrix.shape[0] != len(ids):
+                return False
+        except (OSError, ValueError):
+            return False
+        with self._lock:
+            self._set_rows(ids.astype(np.int64, copy=False), matrix if len(ids) else np.empty((0, 0), dtype=np.float32))
+        return True
+
+    def reset(self) -> None:
+        """Drop all vectors and mark the index as not loaded."""
+        with self._lock:
+            self._set_rows(np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32))
+            self.loaded = False
+
+
+_documentation_index: Optional[VectorIndex] = None
+_documentation_index_lock = threading.Lock()
+
+
+def get_documentation_vector_index() -> VectorIndex:
+    """Get the process-wide vector index over documentation embeddings."""
+    global _documentation_index
+    if _documentation_index is None:
+        with _documentation_index_lock:
+            if _documentation_index is None:
+                from src.config.settings import settings
+                sidecar_path = settings.DOCUMENTATION_VECTOR_INDEX_PATH
+                if sidecar_path is None and settings.SQLITE_DB_PATH and settings.SQLITE_DB_PATH != ":memory:":
+                    sidecar_path = f"{settings.SQLITE_DB_PATH}.docs_index"
+                _documentation_index = VectorIndex(sidecar_path or None)
+    return _documentation_index
@@ -0,0 +1,218 @@
+"""
+Non-blocking fan-out of JSON messages to WebSocket connections.
+
+A ``FanoutChannel`` keeps the most recent messages of one stream in a bounded
+ring buffer, each serialised once when published. Every connection is served
+by a ``FanoutSubscriber`` with its own cursor into that buffer and its own
+writer task, so publishing is a constant-time append that never awaits a send
+and a slow client only delays itself. A subscriber that falls behind sends its
+backlog coalesced into as few frames as possible; one that falls further
+behind than the buffer either skips the oldest messages or is disconnected,
+depending on the slow-consumer policy.
+"""
+import asyncio
+import itertools
+import json
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+# WebSocket close code sent to clients disconnected for being too slow
+CLOSE_CODE_TRY_AGAIN_LATER = 1013
+
+Entry = Tuple[int, Dict[str, Any], str]
+
+
+class FanoutChannel:
+    """Bounded, sequence-numbered buffer of messages shared by all subscribers of a stream."""
+
+    def __init__(self, max_pending: int = 256, coalesce_key: str = "content"):
+        self._buffer: Deque[Entry] = deque(maxlen=max(1, max_pending))
+        self._next_seq = 0
+        self._waiter: Optional[asyncio.Future] = None
+        self._coalesce_key = coalesce_key
+        self.subscribers: Dict[Any, "FanoutSubscriber"] = {}
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next published message will get."""
+        return self._next_seq
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """
+        Append a message and wake the subscribers.
+
+        Args:
+            message: JSON-serialisable message
+        """
+        self._buffer.append((self._next_seq, message, json.dumps(message)))
+        self._next_seq += 1
+        waiter, self._waiter = self._waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def wait_for(self, seq: int) -> None:
+        """Wait until a message with sequence number ``seq`` has been published."""
+        while self._next_seq <= seq:
+            if self._waiter is None:
+                self._waiter = asyncio.get_running_loop().create_future()
+            # Shielded so one cancelled subscriber does not cancel the shared future
+            await asyncio.shield(self._waiter)
+
+    def read_from(self, seq: int) -> Tuple[List[Entry], int]:
+        """
+        Get the buffered messages from a sequence number on.
+
+        Args:
+            seq: First sequence number wanted
+
+        Returns:
+            Tuple of (entries, number of wanted messages already evicted)
+        """
+        if not self._buffer:
+            return [], 0
+        oldest = self._buffer[0][0]
+        missed = max(0, oldest - seq)
+        start = max(0, seq - oldest)
+        return list(itertools.islice(self._buffer, start, None)), missed
+
+    def coalesce(self, entries: List[Entry]) -> List[str]:
+        """
+        Turn a backlog into frames, merging runs of compatible messages.
+
+        Consecutive messages that differ only in the coalesced field and the
+        timestamp are merged into one message whose field holds the joined
+        values and whose timestamp is the latest. A message that stands alone
+        reuses its pre-serialised text.
+
+        Args:
+            entries: Buffered entries, in sequence order
+
+        Returns:
+            Serialised frames to send
+        """
+        frames: List[str] = []
+        key = self._coalesce_key
+        run: List[Entry] = []
+
+        def group_of(message: Dict[str, Any]) -> Tuple:
+            return tuple(sorted((k, v) for k, v in message.items() if k not in (key, "timestamp")))
+
+        def flush_run() -> None:
+            if len(run) == 1:
+                frames.append(run[0][2])
+            elif run:
+                merged = dict(run[-1][1])
+                merged[key] = "\n".join(str(entry[1].get(key, "")) for entry in run)
+                frames.append(json.dumps(merged))
+            run.clear()
+
+        for entry in entries:
+            message = entry[1]
+            if run and (key not in message or group_of(message) != group_of(run[-1][1])):
+                flush_run()
+            run.append(entry)
+            if key not in message:
+                flush_run()
+        flush_run()
+        return frames
+
+
+class FanoutSubscriber:
+    """One connection's cursor into a channel plus the task that writes to it."""
+
+    def __init__(
+        self,
+        channel: FanoutChannel,
+        websocket: Any,
+        on_close: Callable[["FanoutSubscriber"], None],
+        policy: str = DROP_OLDEST,
+        send_timeout: Optional[float] = None,
+    ):
+        self.channel = channel
+        self.websocket = websocket
+        self._on_close = on_close
+        self._policy = policy
+        self._send_timeout = send_timeout
+        # Only messages published after subscribing are delivered
+        self._cursor = channel.next_seq
+        self._task: Optional[asyncio.Task] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.closed = False
+        self.dropped = 0
+        self.frames_sent = 0
+
+    def start(self) -> None:
+        """Start the writer task on the running loop."""
+        if self._task is None and not self.closed:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def wait_idle(self) -> None:
+        """Wait until everything published so far was sent or the subscriber closed."""
+        while not self.closed and self._cursor < self.channel.next_seq:
+            self._idle.clear()
+            await self._idle.wait()
+
+    async def _send(self, text: str) -> None:
+        if self._send_timeout:
+            await asyncio.wait_for(self.websocket.send_text(text), timeout=self._send_timeout)
+        else:
+            await self.websocket.send_text(text)
+
+    async def _run(self) -> None:
+        try:
+            while not self.closed:
+                if self._cursor >= self.channel.next_seq:
+                    self._idle.set()
+                    await self.channel.wait_for(self._cursor)
+                self._idle.clear()
+                entries, missed = self.channel.read_from(self._cursor)
+                if missed:
+                    self.dropped += missed
+                    if self._policy == DISCONNECT:
+                        logger.warning(f"Disconnecting slow WebSocket consumer that fell {missed} messages behind")
+                        try:
+                            await self.websocket.close(code=CLOSE_CODE_TRY_AGAIN_LATER)
+                        except Exception:
+                            pass
+                        break
+                    logger.debug(f"Slow WebSocket consumer skipped {missed} messages")
+                if not entries:
+                    self._cursor = self.channel.next_seq
+                    continue
+                for frame in self.channel.coalesce(entries):
+                    await self._send(frame)
+                    self.frames_sent += 1
+                # Advanced only once sent, so wait_idle() means delivered
+                self._cursor = entries[-1][0] + 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending WebSocket message, dropping connection: {e}")
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._idle.set()
+        self._on_close(self)
+
+    async def stop(self) -> None:
+        """Stop the writer task without notifying the owner."""
+        self.closed = True
+        self._idle.set()
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -22,7 +22,7 @@ from src.models.flow_execution import FlowExecution, FlowNodeExecution
 from src.models.schedule import Schedule
 from src.models.api_key import ApiKey
 from src.models.schema import Schema
-from src.models.execution_logs import ExecutionLog
+from src.models.execution_logs import ExecutionLog, ExecutionLogArchive
 from src.models.engine_config import EngineConfig
 from src.models.mcp_server import MCPServer
 from src.models.mcp_settings import MCPSettings
@@ -66,6 +66,7 @@ __all__ = [
     "ApiKey",
     "Schema",
     "ExecutionLog",
+    "ExecutionLogArchive",
     "EngineConfig",
     "MCPServer",
     "MCPSettings",
@@ -1,17 +1,20 @@
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional
+import asyncio
 import os
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 import sys
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.settings import settings
 from src.db.base import Base
@@ -66,31 +69,247 @@ sql_logger = SQLAlchemyLogger()
 # Import pool classes
 from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 
-# Determine if we should use NullPool for event loop isolation
-# This is necessary when running in environments with multiple event loops
-# such as with CrewAI memory backends or during testing
+# NullPool can still be forced as an escape hatch (e.g. for debugging connection
+# issues); by default every event loop gets its own pooled engine from the
+# registry below, which is what makes pooling safe across loops.
 use_nullpool = os.environ.get("USE_NULLPOOL", "false").lower() == "true"
 
-# Create async engine for the database
-if use_nullpool:
-    logger.info("Using NullPool to prevent connection reuse across event loops")
-    engine = create_async_engine(
-        str(settings.DATABASE_URI),
-        echo=False,  # Setting to False to disable SQL echoing to stdout
-        future=True,
-        poolclass=NullPool,  # Disable connection pooling to prevent event loop conflicts
-    )
-else:
-    # Use the default async pool (AsyncAdaptedQueuePool is automatically used)
-    engine = create_async_engine(
+
+def _create_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """
+    Create an async engine with the configured pool settings.
+
+    Args:
+        pool_size: Number of persistent connections kept in the pool
+        max_overflow: Number of extra connections allowed above pool_size
+
+    Returns:
+        AsyncEngine: New async engine
+    """
+    if use_nullpool:
+        return create_async_engine(
+            str(settings.DATABASE_URI),
+            echo=False,  # Setting to False to disable SQL echoing to stdout
+            future=True,
+            poolclass=NullPool,
+        )
+    return create_async_engine(
         str(settings.DATABASE_URI),
         echo=False,  # Setting to False to disable SQL echoing to stdout
         future=True,
+        poolclass=AsyncAdaptedQueuePool,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=settings.DB_POOL_RECYCLE,
     )
 
+
+if use_nullpool:
+    logger.info("Using NullPool to prevent connection reuse across event loops")
+
+# Primary engine, used by the first event loop that touches the database
+# (the FastAPI/uvicorn loop in production).
+engine = _create_engine(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
+
+class EngineRegistry:
+    """
+    Per-event-loop registry of pooled async engines.
+
+    asyncpg/aiosqlite connections are bound to the event loop that opened them,
+    so a single pool cannot be shared between the main loop and the short-lived
+    loops created in worker threads (memory backends, tool wrappers, callbacks).
+    The registry hands the primary pooled engine to the main loop and a small,
+    dedicated pool to every other loop. Worker engines are disposed when their
+    loop is closed.
+    """
+
+    def __init__(self, primary_engine: AsyncEngine):
+        self._primary_engine = primary_engine
+        self._primary_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_engines: Dict[asyncio.AbstractEventLoop, AsyncEngine] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def primary_engine(self) -> AsyncEngine:
+        """Engine used by the primary (main) event loop."""
+        return self._primary_engine
+
+    def set_primary_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Bind the primary engine to the given loop.
+
+        Called from the application lifespan so the main loop always gets the
+        large pool regardless of which loop touches the database first.
+
+        Args:
+            loop: The main application event loop
+        """
+        with self._lock:
+            if self._primary_loop is loop:
+                return
+            if self._primary_loop is not None:
+                # Connections of the previous loop cannot be reused on this one
+                self._primary_engine.sync_engine.dispose(close=False)
+            worker_engine = self._loop_engines.pop(loop, None)
+            self._primary_loop = loop
+        if worker_engine is not None:
+            worker_engine.sync_engine.dispose(close=False)
+        self._install_close_hook(loop)
+
+    def get_engine(self) -> AsyncEngine:
+        """
+        Get the engine bound to the currently running event loop.
+
+        Returns:
+            AsyncEngine: Pooled engine owned by the running loop, or the primary
+            engine when called outside of an event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._primary_engine
+
+        with self._lock:
+            if self._primary_loop is loop:
+                return self._primary_engine
+
+            if self._primary_loop is None or self._primary_loop.is_closed():
+                if self._primary_loop is not None:
+                    # Previous owner went away without running the close hook
+                    self._primary_engine.sync_engine.dispose(close=False)
+                self._primary_loop = loop
+                install_hook = True
+                loop_engine = self._primary_engine
+            else:
+                loop_engine = self._loop_engines.get(loop)
+                install_hook = loop_engine is None
+                if loop_engine is None:
+                    self._prune_closed_loops()
+                    loop_engine = _create_engine(
+                        settings.DB_WORKER_POOL_SIZE,
+                        settings.DB_WORKER_MAX_OVERFLOW,
+                    )
+                    self._loop_engines[loop] = loop_engine
+                    logger.debug(
+                        f"Created worker engine for event loop {id(loop)} "
+                        f"({len(self._loop_engines)} worker engines active)"
+                    )
+
+        if install_hook:
+            self._install_close_hook(loop)
+        return loop_engine
+
+    async def dispose_current_loop(self) -> None:
+        """Dispose the engine owned by the running loop (worker loops only)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_engine = self._loop_engines.pop(loop, None)
+        if loop_engine is not None:
+            await loop_engine.dispose()
+
+    async def dispose_all(self) -> None:
+        """Dispose the engine of the running loop and drop all other pools."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_engines = list(self._loop_engines.items())
+            self._loop_engines.clear()
+            owns_primary = self._primary_loop is loop
+        for engine_loop, loop_engine in loop_engines:
+            if engine_loop is loop:
+                await loop_engine.dispose()
+            else:
+                loop_engine.sync_engine.dispose(close=False)
+        if owns_primary:
+            await self._primary_engine.dispose()
+
+    def get_pool_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Collect pool statistics for every registered engine.
+
+        Returns:
+            List of dictionaries with size, checked-out, checked-in and overflow
+            counts per engine
+        """
+        with self._lock:
+            engines = [("primary", self._primary_loop, self._primary_engine)]
+            engines.extend(
+                ("worker", loop, loop_engine)
+                for loop, loop_engine in self._loop_engines.items()
+            )
+
+        metrics = []
+        for role, loop, loop_engine in engines:
+            pool = loop_engine.sync_engine.pool
+            metrics.append({
+                "role": role,
+                "loop_id": id(loop) if loop is not None else None,
+                "pool_class": type(pool).__name__,
+                "size": pool.size() if hasattr(pool, "size") else 0,
+                "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+                "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+                "overflow": pool.overflow() if hasattr(pool, "overflow") else 0,
+            })
+        return metrics
+
+    def _prune_closed_loops(self) -> None:
+        """Drop engines of loops that were closed without the close hook (lock held)."""
+        for loop in [lp for lp in self._loop_engines if lp.is_closed()]:
+            self._loop_engines.pop(loop).sync_engine.dispose(close=False)
+
+    def _install_close_hook(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Wrap ``loop.close`` so the loop's engine is disposed while the loop can
+        still run the async connection teardown.
+        """
+        if getattr(loop, "_kasal_engine_hook", False):
+            return
+        original_close = loop.close
+        registry = self
+
+        def close_with_dispose() -> None:
+            with registry._lock:
+                loop_engine = registry._loop_engines.pop(loop, None)
+                if registry._primary_loop is loop:
+                    registry._primary_loop = None
+                    loop_engine = registry._primary_engine
+            if loop_engine is not None and not loop.is_running() and not loop.is_closed():
+                try:
+                    loop.run_until_complete(loop_engine.dispose())
+                except Exception as e:
+                    logger.debug(f"Error disposing engine on loop close: {e}")
+                    loop_engine.sync_engine.dispose(close=False)
+            original_close()
+
+        loop.close = close_with_dispose
+        loop._kasal_engine_hook = True
+
+
+engine_registry = EngineRegistry(engine)
+
+
+def get_engine() -> AsyncEngine:
+    """Get the pooled async engine bound to the running event loop."""
+    return engine_registry.get_engine()
+
+
+def get_pool_metrics() -> List[Dict[str, Any]]:
+    """Get size/checked-out/overflow statistics for all engine pools."""
+    return engine_registry.get_pool_metrics()
+
+
+class LoopBoundSession(Session):
+    """
+    Session that resolves its bind from the engine registry.
+
+    The engine is looked up when a connection is first needed, which happens
+    on the event loop that actually runs the query.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        return engine_registry.get_engine().sync_engine
+
 # Create sync engine for backwards compatibility if needed
 # Since asyncpg is async-only and cannot be used for sync operations,
 # we'll use SQLite for sync operations when using PostgreSQL+asyncpg for async
@@ -111,9 +330,9 @@ else:
         future=True,
     )
 
-# Create async session factory
+# Create async session factory; each session picks the engine of the loop it runs on
 async_session_factory = async_sessionmaker(
-    engine,
+    sync_session_class=LoopBoundSession,
     expire_on_commit=False,
     autoflush=False,
 )
@@ -186,7 +405,7 @@ async def init_db() -> None:
             # Ensure pgvector extension is installed
             try:
                 logger.info("Checking pgvector extension...")
-                async with engine.connect() as conn:
+                async with get_engine().connect() as conn:
                     # Check if pgvector extension exists
                     result = await conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'vector'"))
                     extension_exists = result.fetchone() is not None
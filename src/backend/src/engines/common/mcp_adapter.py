@@ -2,13 +2,16 @@
 MCP Adapter using the official MCP client library.
 
 This adapter supports both SSE and Streamable MCP protocols using the official
-MCP client library with Databricks OAuth authentication.
+MCP client library with Databricks OAuth authentication. Sessions are shared
+through the MCP session pool rather than opened per call.
 """
 
 import asyncio
 import logging
 from typing import Dict, Optional, Any, List
 
+from src.engines.common.mcp_session_pool import PoolKey, get_mcp_session_pool, session_pool_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,8 @@ class MCPAdapter:
         
         self._tools = []
         self._initialized = False
+        # Pool key of the server and credentials, known once tools were discovered
+        self.pool_key: Optional[PoolKey] = None
         
     async def initialize(self):
         """Initialize the adapter and discover tools using the working MCP client approach."""
@@ -63,49 +68,33 @@ class MCPAdapter:
             self._initialized = True
             
     async def _discover_tools_with_mcp_client(self, headers: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Discover tools using the working MCP client approach."""
+        """Discover tools over a pooled MCP session, using the cached tool list when fresh."""
         try:
-            # Import MCP client dependencies
-            from mcp.client.streamable_http import streamablehttp_client as connect
-            from mcp import ClientSession
-            
             tools_list = []
             
             # Use only the Authorization header (this is what works)
             clean_headers = {"Authorization": headers["Authorization"]}
+            self.pool_key = session_pool_key(self.server_url, clean_headers)
+            
+            mcp_tools = await get_mcp_session_pool().list_tools(self.server_url, clean_headers)
+            logger.info(f"Retrieved tools from MCP server")
             
-            # Connect using MCP streamable HTTP client (the working approach)
-            async with connect(self.server_url, headers=clean_headers) as (read_stream, write_stream, _):
-                logger.info("Connected to MCP streamable endpoint for tool discovery")
+            if mcp_tools:
+                logger.info(f"Found {len(mcp_tools)} tools")
                 
-                # Create a session using the client streams
-                async with ClientSession(read_stream, write_stream) as session:
-                    logger.info("Created MCP client session")
-                    
-                    # Initialize the connection
-                    await session.initialize()
-                    logger.info("MCP session initialized")
-                    
-                    # List available tools
-                    tools_result = await session.list_tools()
-                    logger.info(f"Retrieved tools from MCP server")
-                    
-                    if hasattr(tools_result, 'tools') and tools_result.tools:
-                        logger.info(f"Found {len(tools_result.tools)} tools")
-                        
-                        # Convert MCP tools to our format
-                        for mcp_tool in tools_result.tools:
-                            tool_wrapper = {
-                                "name": mcp_tool.name,
-                                "description": mcp_tool.description,
-                                "mcp_tool": mcp_tool,
-                                "input_schema": mcp_tool.inputSchema,
-                                "adapter": self  # Store adapter reference for tool execution
-                            }
-                            tools_list.append(tool_wrapper)
-                            logger.debug(f"Added tool: {mcp_tool.name}")
-                    else:
-                        logger.warning("No tools found in MCP server response")
+                # Convert MCP tools to our format
+                for mcp_tool in mcp_tools:
+                    tool_wrapper = {
+                        "name": mcp_tool.name,
+                        "description": mcp_tool.description,
+                        "mcp_tool": mcp_tool,
+                        "input_schema": mcp_tool.inputSchema,
+                        "adapter": self  # Store adapter reference for tool execution
+                    }
+                    tools_list.append(tool_wrapper)
+                    logger.debug(f"Added tool: {mcp_tool.name}")
+            else:
+                logger.warning("No tools found in MCP server response")
                         
             return tools_list
             
@@ -114,34 +103,20 @@ class MCPAdapter:
             return []
     
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
-        """Execute a tool by creating a new MCP session (stateless approach)."""
+        """Execute a tool over a pooled MCP session."""
         try:
             # Get authentication headers
             headers = await self._get_authentication_headers()
             if not headers:
                 raise ValueError("No authentication headers available")
-                
-            # Import MCP client dependencies
-            from mcp.client.streamable_http import streamablehttp_client as connect
-            from mcp import ClientSession
             
             # Use only the Authorization header
             clean_headers = {"Authorization": headers["Authorization"]}
             
-            # Connect using MCP streamable HTTP client
-            async with connect(self.server_url, headers=clean_headers) as (read_stream, write_stream, _):
-                logger.debug(f"Connected to MCP for tool execution: {tool_name}")
-                
-                # Create a session using the client streams
-                async with ClientSession(read_stream, write_stream) as session:
-                    # Initialize the connection
-                    await session.initialize()
-                    
-                    # Execute the tool
-                    logger.info(f"Executing MCP tool: {tool_name}")
-                    result = await session.call_tool(tool_name, parameters)
-                    logger.info(f"Tool {tool_name} executed successfully")
-                    return result
+            logger.info(f"Executing MCP tool: {tool_name}")
+            result = await get_mcp_session_pool().call_tool(self.server_url, clean_headers, tool_name, parameters)
+            logger.info(f"Tool {tool_name} executed successfully")
+            return result
                     
         except Exception as e:
             logger.error(f"Error executing MCP tool {tool_name}: {e}")
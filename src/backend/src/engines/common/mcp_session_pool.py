@@ -0,0 +1,397 @@
+"""
+Pool of long-lived MCP client sessions.
+
+Opening an MCP session costs a TLS connection plus the MCP initialize
+handshake, which for many servers takes longer than the tool call itself. The
+pool keeps one session per (server URL, credentials) and event loop, reuses it
+for tool discovery and tool calls, pings it while idle and closes it once it
+has been idle for too long. Executions take leases on the sessions they use so
+that their sessions survive idle periods, and release only their own leases
+when they finish. An operation that fails because the server expired or
+dropped its session is retried once on a new session.
+
+Tool lists are cached per (server URL, credentials) for a TTL and dropped as
+soon as the server sends ``notifications/tools/list_changed``.
+
+Sessions are bound to the event loop they were opened on (tools run on the
+shared background loops, discovery on the application loop), so each loop has
+its own set of sessions; leases and the tool cache are process-wide.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (server URL, digest of the credentials)
+PoolKey = Tuple[str, str]
+
+
+def session_pool_key(server_url: str, headers: Dict[str, str]) -> PoolKey:
+    """Build the pool key of a server and the credentials used to reach it."""
+    authorization = headers.get("Authorization", "")
+    return (server_url, hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16])
+
+
+# Transport errors (anyio streams, httpx) of a session the server dropped, matched by name
+_SESSION_ERROR_TYPES = {
+    "ClosedResourceError",
+    "BrokenResourceError",
+    "EndOfStream",
+    "TransportError",
+    "ConnectionError",
+}
+
+
+def _is_session_error(error: BaseException) -> bool:
+    """Whether an error means the session itself is gone rather than the operation failed."""
+    nested = getattr(error, "exceptions", None)
+    if nested:
+        return any(_is_session_error(e) for e in nested)
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & _SESSION_ERROR_TYPES:
+        return True
+    # Servers answer requests on an expired session id with "Session terminated"
+    return "McpError" in names and "session terminated" in str(error).lower()
+
+
+class _PooledSession:
+    """
+    One MCP session kept open by a runner task.
+
+    The streamable-HTTP client and ClientSession context managers must be
+    entered and exited in the same task, so a dedicated task owns them and
+    waits until the session is closed; other tasks on the loop use the session
+    concurrently.
+    """
+
+    def __init__(self, pool: "MCPSessionPool", key: PoolKey, headers: Dict[str, str]):
+        self.pool = pool
+        self.key = key
+        self.headers = headers
+        self.session: Any = None
+        self.last_used = time.monotonic()
+        self.last_ping = self.last_used
+        self.in_flight = 0
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._runner is not None and not self._runner.done()
+
+    async def open(self, timeout: float) -> None:
+        """Connect and initialize the session, raising if that fails."""
+        self._runner = asyncio.create_task(self._run(), name=f"mcp-session-{self.key[0]}")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise TimeoutError(f"Timed out connecting to MCP server {self.key[0]}")
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        from mcp.client.streamable_http import streamablehttp_client as connect
+        from mcp import ClientSession
+
+        try:
+            async with connect(self.key[0], headers=self.headers) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream, message_handler=self._handle_message) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    logger.info(f"Opened pooled MCP session for {self.key[0]}")
+                    await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            if self.session is not None:
+                logger.warning(f"Pooled MCP session for {self.key[0]} ended: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def _handle_message(self, message: Any) -> None:
+        root = getattr(message, "root", None)
+        if type(root).__name__ == "ToolListChangedNotification":
+            logger.info(f"Tool list of MCP server {self.key[0]} changed")
+            self.pool.invalidate_tools(self.key)
+
+    async def close(self) -> None:
+        """Close the session and wait for its runner task to exit."""
+        self._closing.set()
+        if self._runner is None or self._runner.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._runner), timeout=5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._runner.cancel()
+        except Exception:
+            pass
+
+
+class _LoopSessions:
+    """Sessions of one event loop."""
+
+    def __init__(self):
+        self.sessions: "OrderedDict[PoolKey, _PooledSession]" = OrderedDict()
+        self.key_locks: Dict[PoolKey, asyncio.Lock] = {}
+        self.reaper: Optional[asyncio.Task] = None
+
+
+class MCPSessionPool:
+    """Reference-counted pool of MCP sessions with a TTL cache of tool lists."""
+
+    def __init__(
+        self,
+        keepalive_seconds: float,
+        idle_timeout_seconds: float,
+        max_sessions: int,
+        tools_ttl_seconds: float,
+        connect_timeout_seconds: float = 30.0
+    ):
+        self._keepalive = keepalive_seconds
+        self._idle_timeout = idle_timeout_seconds
+        self._max_sessions = max_sessions
+        self._tools_ttl = tools_ttl_seconds
+        self._connect_timeout = connect_timeout_seconds
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSessions]" = weakref.WeakKeyDictionary()
+        self._tools: Dict[PoolKey, Tuple[float, List[Any]]] = {}
+        self._leases: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Leases
+
+    def lease(self, owner: str, key: PoolKey) -> None:
+        """Record that an execution uses the sessions of a server, keeping them open while idle."""
+        with self._lock:
+            self._leases.setdefault(owner, Counter())[key] += 1
+
+    def release(self, owner: str) -> Set[PoolKey]:
+        """
+        Release all leases held by an execution.
+
+        Args:
+            owner: The execution that took the leases
+
+        Returns:
+            Keys of the servers the execution had leased
+        """
+        with self._lock:
+            leases = self._leases.pop(owner, Counter())
+        return set(leases)
+
+    def is_leased(self, key: PoolKey) -> bool:
+        """Whether any execution holds a lease on a server's sessions."""
+        with self._lock:
+            return any(leases.get(key) for leases in self._leases.values())
+
+    # Tool list cache
+
+    def get_cached_tools(self, key: PoolKey) -> Optional[List[Any]]:
+        """Get a copy of the cached tool list of a server, or None if missing or expired."""
+        with self._lock:
+            entry = self._tools.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+            return None
+
+    def invalidate_tools(self, key: Optional[PoolKey] = None) -> None:
+        """Drop the cached tool list of a server, or of all servers."""
+        with self._lock:
+            if key is None:
+                self._tools.clear()
+            else:
+                self._tools.pop(key, None)
+
+    async def list_tools(self, server_url: str, headers: Dict[str, str]) -> List[Any]:
+        """
+        List the tools of an MCP server, from the cache when possible.
+
+        Args:
+            server_url: URL of the MCP server
+            headers: Headers carrying the credentials
+
+        Returns:
+            The server's MCP tool objects
+        """
+        key = session_pool_key(server_url, headers)
+        tools = self.get_cached_tools(key)
+        if tools is not None:
+            return tools
+
+        async def list_on(session: Any) -> List[Any]:
+            result = await session.list_tools()
+            return list(getattr(result, "tools", None) or [])
+
+        tools = await self._with_session(key, headers, list_on)
+        if self._tools_ttl > 0:
+            with self._lock:
+                self._tools[key] = (time.monotonic() + self._tools_ttl, list(tools))
+        return tools
+
+    async def call_tool(self, server_url: str, headers: Dict[str, str], tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a tool on an MCP server over a pooled session.
+
+        Args:
+            server_url: URL of the MCP server
+            headers: Headers carrying the credentials
+            tool_name: Name of the tool
+            arguments: Tool arguments
+
+        Returns:
+            The MCP call result
+        """
+        key = session_pool_key(server_url, headers)
+        return await self._with_session(key, headers, lambda session: session.call_tool(tool_name, arguments))
+
+    # Sessions
+
+    def _loop_sessions(self) -> _LoopSessions:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = self._loops[loop] = _LoopSessions()
+        if state.reaper is None or state.reaper.done():
+            state.reaper = loop.create_task(self._reap(state), name="mcp-session-reaper")
+        return state
+
+    async def _with_session(self, key: PoolKey, headers: Dict[str, str], operation, retry: bool = True) -> Any:
+        state = self._loop_sessions()
+        pooled = await self._acquire(state, key, headers)
+        if pooled is None:
+            # Pool is full of busy sessions: fall back to a one-off session
+            logger.warning(f"MCP session pool is full, using a one-off session for {key[0]}")
+            pooled = _PooledSession(self, key, headers)
+            await pooled.open(self._connect_timeout)
+            try:
+                return await operation(pooled.session)
+            finally:
+                await pooled.close()
+
+        pooled.in_flight += 1
+        stale = False
+        try:
+            return await operation(pooled.session)
+        except Exception as e:
+            if not retry or (pooled.alive and not _is_session_error(e)):
+                raise
+            # The server expired or dropped the session: retry once on a new one
+            stale = True
+            logger.warning(f"Pooled MCP session for {key[0]} failed, retrying on a new session: {e}")
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+            if stale or not pooled.alive:
+                await self._discard(state, key, pooled)
+        return await self._with_session(key, headers, operation, retry=False)
+
+    async def _acquire(self, state: _LoopSessions, key: PoolKey, headers: Dict[str, str]) -> Optional[_PooledSession]:
+        lock = state.key_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = state.sessions.get(key)
+            if pooled is not None and pooled.alive:
+                state.sessions.move_to_end(key)
+                return pooled
+            if pooled is not None:
+                await self._discard(state, key, pooled)
+            if len(state.sessions) >= self._max_sessions and not await self._evict_one(state):
+                return None
+            pooled = _PooledSession(self, key, headers)
+            await pooled.open(self._connect_timeout)
+            state.sessions[key] = pooled
+            return pooled
+
+    @staticmethod
+    async def _discard(state: _LoopSessions, key: PoolKey, pooled: _PooledSession) -> None:
+        if state.sessions.get(key) is pooled:
+            del state.sessions[key]
+        await pooled.close()
+
+    async def _evict_one(self, state: _LoopSessions) -> bool:
+        """Close the least recently used idle session, preferring unleased ones."""
+        idle = [(key, pooled) for key, pooled in state.sessions.items() if pooled.in_flight == 0]
+        if not idle:
+            return False
+        unleased = [(key, pooled) for key, pooled in idle if not self.is_leased(key)]
+        key, pooled = (unleased or idle)[0]
+        await self._discard(state, key, pooled)
+        return True
+
+    async def _reap(self, state: _LoopSessions) -> None:
+        """Ping idle sessions and close sessions idle past the timeout."""
+        interval = max(1.0, min(self._keepalive, self._idle_timeout) / 2)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for key, pooled in list(state.sessions.items()):
+                idle = now - pooled.last_used
+                if pooled.in_flight:
+                    continue
+                if not pooled.alive or (idle > self._idle_timeout and not self.is_leased(key)):
+                    await self._discard(state, key, pooled)
+                elif now - max(pooled.last_used, pooled.last_ping) > self._keepalive:
+                    pooled.last_ping = now
+                    try:
+                        await asyncio.wait_for(pooled.session.send_ping(), timeout=self._connect_timeout)
+                    except Exception as e:
+                        logger.warning(f"Keepalive ping to MCP server {key[0]} failed: {e}")
+                        await self._discard(state, key, pooled)
+
+    async def close_all(self) -> None:
+        """Close all sessions of the current event loop."""
+        with self._lock:
+            state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        if state.reaper is not None:
+            state.reaper.cancel()
+            state.reaper = None
+        for key, pooled in list(state.sessions.items()):
+            await self._discard(state, key, pooled)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool sizes and tool cache counters."""
+        with self._lock:
+            return {
+                "sessions": sum(len(state.sessions) for state in self._loops.values()),
+                "leases": sum(sum(leases.values()) for leases in self._leases.values()),
+                "cached_tool_lists": len(self._tools),
+                "max_sessions": self._max_sessions,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_mcp_session_pool: Optional[MCPSessionPool] = None
+_mcp_session_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get the process-wide MCP session pool configured from settings."""
+    global _mcp_session_pool
+    if _mcp_session_pool is None:
+        with _mcp_session_pool_lock:
+            if _mcp_session_pool is None:
+                from src.config.settings import settings
+                _mcp_session_pool = MCPSessionPool(
+                    keepalive_seconds=settings.MCP_SESSION_KEEPALIVE_SECONDS,
+                    idle_timeout_seconds=settings.MCP_SESSION_IDLE_TIMEOUT_SECONDS,
+                    max_sessions=settings.MCP_MAX_SESSIONS,
+                    tools_ttl_seconds=settings.MCP_TOOLS_CACHE_TTL_SECONDS,
+                )
+    return _mcp_session_pool
@@ -9,13 +9,18 @@ import logging
 from typing import Any, Optional, Dict
 from datetime import datetime, timezone
 
+from src.config.settings import settings
+
 # Import queue services
 from src.services.execution_logs_queue import enqueue_log
-from src.services.trace_queue import get_trace_queue
+from src.services.trace_queue import TraceQueue, get_trace_queue
 
 # Import group context
 from src.utils.user_context import GroupContext, UserContext
 
+# Import memory write buffering
+from src.engines.crewai.memory.vector_write_buffer import flush_crew_memory
+
 logger = logging.getLogger(__name__)
 
 
@@ -352,6 +357,7 @@ def create_execution_callbacks(job_id: str, config: Dict[str, Any] = None, group
             
             try:
                 trace_queue.put_nowait(trace_data)
+                TraceQueue().notify()
                 logger.debug(f"{log_prefix} Step trace enqueued successfully")
             except Exception as trace_error:
                 logger.error(f"{log_prefix} Failed to enqueue step trace: {trace_error}")
@@ -369,6 +375,11 @@ def create_execution_callbacks(job_id: str, config: Dict[str, Any] = None, group
         try:
             logger.debug(f"{log_prefix} Task callback triggered - type: {type(task_output).__name__}")
             
+            # Write buffered memories so the next task reads what this one saved;
+            # a stalled write is logged and left to finish in the background
+            if crew_ref is not None:
+                flush_crew_memory(crew_ref, settings.MEMORY_WRITE_FLUSH_TIMEOUT_SECONDS)
+            
             # Extract information from task output
             timestamp = datetime.now(timezone.utc)
             
@@ -533,6 +544,7 @@ def create_execution_callbacks(job_id: str, config: Dict[str, Any] = None, group
             
             try:
                 trace_queue.put_nowait(trace_data)
+                TraceQueue().notify()
                 logger.debug(f"{log_prefix} Task trace enqueued successfully")
             except Exception as trace_error:
                 logger.error(f"{log_prefix} Failed to enqueue task trace: {trace_error}")
@@ -593,6 +605,7 @@ def create_crew_callbacks(job_id: str, config: Dict[str, Any] = None, group_cont
             
             try:
                 trace_queue.put_nowait(trace_data)
+                TraceQueue().notify()
             except Exception as trace_error:
                 logger.error(f"{log_prefix} Failed to enqueue crew start trace: {trace_error}")
             
@@ -639,6 +652,7 @@ def create_crew_callbacks(job_id: str, config: Dict[str, Any] = None, group_cont
             
             try:
                 trace_queue.put_nowait(trace_data)
+                TraceQueue().notify()
             except Exception as trace_error:
                 logger.error(f"{log_prefix} Failed to enqueue crew completion trace: {trace_error}")
             
@@ -2,35 +2,143 @@
 LLM Event Router for capturing CrewAI LLM events.
 
 This module provides a router that captures LLM events from the global CrewAI
-event bus and routes them to the appropriate execution based on agent context.
+event bus and routes them to the appropriate execution. The owning execution is
+resolved from the execution context bound around ``crew.kickoff``, then from
+the identity of the emitting agent, and only as a last resort from the agent
+role. Token usage and latency are aggregated per execution and agent and
+written as one ``llm_usage`` trace when the execution is unregistered.
 """
 
 import logging
 import threading
-from typing import Dict, Set, Any, Optional
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Set, Any, Optional, Tuple
 from datetime import datetime, timezone
-import weakref
 
-from crewai.utilities.events import crewai_event_bus, LLMCallCompletedEvent
-from src.services.trace_queue import get_trace_queue
+from crewai.utilities.events import crewai_event_bus, LLMCallCompletedEvent, LLMCallStartedEvent
+from src.services.trace_queue import TraceQueue, get_trace_queue, should_persist_trace
 from src.utils.user_context import GroupContext
 
 logger = logging.getLogger(__name__)
 
+# Execution owning LLM calls made in the current context (set around crew.kickoff)
+_current_execution_id: ContextVar[Optional[str]] = ContextVar("llm_event_execution_id", default=None)
+
+# Start times of in-flight LLM calls by LLM instance, per thread
+_call_started = threading.local()
+
+
+@contextmanager
+def bind_execution_context(execution_id: str):
+    """
+    Attribute LLM events emitted in this context to an execution.
+
+    Threads started with ``asyncio.to_thread`` inherit the binding.
+
+    Args:
+        execution_id: The execution that owns LLM calls made inside the block
+    """
+    token = _current_execution_id.set(execution_id)
+    try:
+        yield
+    finally:
+        _current_execution_id.reset(token)
+
+
+class LLMUsageAggregator:
+    """Thread-safe per-agent totals of LLM calls, tokens and latency for one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agents: Dict[str, Dict[str, float]] = {}
+        # Last seen cumulative (prompt, completion) token counts per agent object
+        self._token_baselines: Dict[int, Tuple[int, int]] = {}
+
+    @staticmethod
+    def _read_token_counts(agent: Any) -> Optional[Tuple[int, int]]:
+        """Read an agent's cumulative (prompt, completion) token counters, if it has them."""
+        token_process = getattr(agent, '_token_process', None)
+        counts = (
+            getattr(token_process, 'prompt_tokens', None),
+            getattr(token_process, 'completion_tokens', None),
+        )
+        if not all(isinstance(count, int) for count in counts):
+            return None
+        return counts
+
+    def set_baseline(self, agent: Any) -> None:
+        """Remember an agent's current token counters so earlier usage is not counted."""
+        counts = self._read_token_counts(agent)
+        if counts is not None:
+            with self._lock:
+                self._token_baselines[id(agent)] = counts
+
+    def token_delta(self, event: Any) -> Tuple[int, int]:
+        """
+        Get the prompt and completion tokens of one LLM call.
+
+        Uses usage reported on the event when present, otherwise the growth of
+        the emitting agent's cumulative token counters since the last call.
+        """
+        usage = getattr(event, 'usage', None)
+        if isinstance(usage, dict):
+            return int(usage.get('prompt_tokens') or 0), int(usage.get('completion_tokens') or 0)
+
+        agent = getattr(event, 'from_agent', None)
+        current = self._read_token_counts(agent)
+        if current is None:
+            return 0, 0
+        with self._lock:
+            previous = self._token_baselines.get(id(agent), (0, 0))
+            self._token_baselines[id(agent)] = current
+        return max(current[0] - previous[0], 0), max(current[1] - previous[1], 0)
+
+    def record(self, agent_role: str, prompt_tokens: int, completion_tokens: int,
+               latency_ms: Optional[float]) -> None:
+        """Add one LLM call to the agent's totals."""
+        with self._lock:
+            totals = self._agents.setdefault(agent_role, {
+                'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0,
+                'total_tokens': 0, 'latency_ms': 0.0,
+            })
+            totals['calls'] += 1
+            totals['prompt_tokens'] += prompt_tokens
+            totals['completion_tokens'] += completion_tokens
+            totals['total_tokens'] += prompt_tokens + completion_tokens
+            if latency_ms is not None:
+                totals['latency_ms'] += latency_ms
+
+    def summary(self) -> Dict[str, Any]:
+        """Get execution totals and the per-agent breakdown."""
+        with self._lock:
+            agents = {role: dict(totals) for role, totals in self._agents.items()}
+        overall = {'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0, 'latency_ms': 0.0}
+        for totals in agents.values():
+            for key in overall:
+                overall[key] += totals[key]
+        for totals in [overall, *agents.values()]:
+            totals['latency_ms'] = round(totals['latency_ms'], 1)
+        return {**overall, 'agents': agents}
+
 
 class LLMEventRouter:
     """
-    Routes LLM events to appropriate executions based on agent context.
-    
+    Routes LLM events to appropriate executions based on execution context.
+
     This is a singleton that registers once with the global CrewAI event bus
-    and routes events to the appropriate execution based on agent ownership.
+    and routes events to the execution bound to the emitting context, falling
+    back to agent identity and then agent role for calls made outside of it.
     """
-    
+
     _instance: Optional['LLMEventRouter'] = None
     _lock = threading.Lock()
     _initialized = False
     _active_executions: Dict[str, Dict[str, Any]] = {}
-    
+    # id(agent) -> execution_id, for calls made in threads without the context
+    _agent_executions: Dict[int, str] = {}
+
     def __new__(cls):
         """Ensure singleton pattern."""
         if cls._instance is None:
@@ -38,115 +146,212 @@ class LLMEventRouter:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
         return cls._instance
-    
+
     @classmethod
     def register_execution(cls, execution_id: str, crew: Any, group_context: Optional[GroupContext] = None):
         """
         Register an execution with its agents for LLM event routing.
-        
+
         Args:
             execution_id: Unique identifier for the execution
             crew: The CrewAI crew instance
             group_context: Optional group context for multi-tenant isolation
         """
         router = cls()
-        
+
         # Extract agent roles from crew
         agent_roles = set()
+        agent_ids = set()
+        usage = LLMUsageAggregator()
         if crew and hasattr(crew, 'agents'):
             for agent in crew.agents:
                 if hasattr(agent, 'role'):
                     agent_roles.add(agent.role)
-        
+                agent_ids.add(id(agent))
+                usage.set_baseline(agent)
+
         # Store execution data
         cls._active_executions[execution_id] = {
             'agents': agent_roles,
+            'agent_ids': agent_ids,
             'group_context': group_context,
-            'trace_queue': get_trace_queue()
+            'trace_queue': get_trace_queue(),
+            'usage': usage,
         }
-        
+        for agent_id in agent_ids:
+            cls._agent_executions[agent_id] = execution_id
+
         log_prefix = f"[LLMEventRouter][{execution_id}]"
         logger.info(f"{log_prefix} Registered execution with agents: {agent_roles}")
-        
+
         # Initialize global handler if needed
         if not cls._initialized:
             router._setup_global_handler()
             cls._initialized = True
-    
+
     @classmethod
     def unregister_execution(cls, execution_id: str):
         """
-        Remove an execution from routing.
-        
+        Remove an execution from routing and write its aggregated LLM usage.
+
         Args:
             execution_id: The execution to unregister
         """
+        exec_data = cls._active_executions.pop(execution_id, None)
+        if exec_data is None:
+            return
+        for agent_id in exec_data.get('agent_ids', ()):
+            if cls._agent_executions.get(agent_id) == execution_id:
+                del cls._agent_executions[agent_id]
+        cls._flush_usage(execution_id, exec_data)
+        logger.info(f"[LLMEventRouter][{execution_id}] Unregistered execution with agents: {exec_data['agents']}")
+
+    @classmethod
+    def _flush_usage(cls, execution_id: str, exec_data: Dict[str, Any]) -> None:
+        """Enqueue one trace with the execution's LLM usage totals."""
+        usage = exec_data.get('usage')
+        if usage is None or not should_persist_trace("llm_usage"):
+            return
+        summary = usage.summary()
+        if not summary['calls']:
+            return
+
+        trace_data = {
+            "job_id": execution_id,
+            "event_source": "crew",
+            "event_context": "llm_usage",
+            "event_type": "llm_usage",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "output_content": (
+                f"{summary['calls']} LLM calls, {summary['total_tokens']} tokens "
+                f"({summary['prompt_tokens']} prompt, {summary['completion_tokens']} completion)"
+            ),
+            "extra_data": {"type": "llm_usage", **summary},
+        }
+        if exec_data['group_context']:
+            trace_data["group_id"] = exec_data['group_context'].primary_group_id
+            trace_data["group_email"] = exec_data['group_context'].group_email
+        try:
+            exec_data['trace_queue'].put_nowait(trace_data)
+            TraceQueue().notify()
+        except Exception as e:
+            logger.error(f"[LLMEventRouter][{execution_id}] Error enqueuing LLM usage: {e}")
+
+    @classmethod
+    def resolve_execution(cls, event: Any) -> Optional[str]:
+        """
+        Find the execution an LLM event belongs to.
+
+        Args:
+            event: The CrewAI LLM event
+
+        Returns:
+            The execution ID, or None if no active execution matches
+        """
+        execution_id = _current_execution_id.get()
         if execution_id in cls._active_executions:
-            agent_roles = cls._active_executions[execution_id]['agents']
-            del cls._active_executions[execution_id]
-            logger.info(f"[LLMEventRouter][{execution_id}] Unregistered execution with agents: {agent_roles}")
-    
+            return execution_id
+
+        agent = getattr(event, 'from_agent', None)
+        if agent is not None:
+            execution_id = cls._agent_executions.get(id(agent))
+            if execution_id in cls._active_executions:
+                return execution_id
+
+        # Fallback: the first execution with an agent of this role
+        agent_role = getattr(event, 'agent_role', None)
+        if agent_role:
+            for exec_id, exec_data in list(cls._active_executions.items()):
+                if agent_role in exec_data['agents']:
+                    return exec_id
+        return None
+
     def _setup_global_handler(self):
-        """Set up the global LLM event handler once."""
+        """Set up the global LLM event handlers once."""
         logger.info("[LLMEventRouter] Setting up global LLM event handler")
-        
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def handle_llm_started(source: Any, event: LLMCallStartedEvent):
+            """Remember when the call started to measure latency."""
+            try:
+                starts = getattr(_call_started, 'starts', None)
+                if starts is None:
+                    starts = _call_started.starts = {}
+                starts[id(source)] = time.monotonic()
+            except Exception as e:
+                logger.debug(f"[LLMEventRouter] Error recording LLM call start: {e}")
+
         @crewai_event_bus.on(LLMCallCompletedEvent)
         def handle_llm_event(source: Any, event: LLMCallCompletedEvent):
             """Handle LLM events and route to appropriate execution."""
             try:
-                # Skip if no agent role
-                if not hasattr(event, 'agent_role') or not event.agent_role:
+                starts = getattr(_call_started, 'starts', None)
+                started_at = starts.pop(id(source), None) if starts else None
+                latency_ms = (time.monotonic() - started_at) * 1000 if started_at is not None else None
+
+                exec_id = self.resolve_execution(event)
+                if exec_id is None:
                     return
-                
-                agent_role = event.agent_role
-                
-                # Find which execution(s) this belongs to
-                # Note: If multiple executions have the same agent role, the event
-                # will be routed to the first matching one (limitation)
-                for exec_id, exec_data in self._active_executions.items():
-                    if agent_role in exec_data['agents']:
-                        # Extract response content
-                        output_content = "LLM call completed"
-                        if hasattr(event, 'response') and event.response:
-                            output_content = str(event.response)
-                        
-                        # Create trace data
-                        trace_data = {
-                            "job_id": exec_id,
-                            "event_source": agent_role,
-                            "event_context": "llm_call",
-                            "event_type": "llm_call",
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "output_content": output_content,
-                            "extra_data": {
-                                "type": "llm_event",
-                                "agent_role": agent_role,
-                                "model": str(event.model) if hasattr(event, 'model') else "unknown",
-                                "call_type": str(event.call_type.value) if hasattr(event, 'call_type') else "unknown"
-                            }
-                        }
-                        
-                        # Add group context if available
-                        if exec_data['group_context']:
-                            trace_data["group_id"] = exec_data['group_context'].primary_group_id
-                            trace_data["group_email"] = exec_data['group_context'].group_email
-                        
-                        # Enqueue trace
-                        exec_data['trace_queue'].put_nowait(trace_data)
-                        
-                        logger.debug(f"[LLMEventRouter] Routed LLM event from {agent_role} to execution {exec_id}")
-                        break  # Event processed, don't route to other executions
-                
+                exec_data = self._active_executions.get(exec_id)
+                if exec_data is None:
+                    return
+
+                agent_role = getattr(event, 'agent_role', None) or "llm"
+                usage = exec_data.get('usage')
+                prompt_tokens = completion_tokens = 0
+                if usage is not None:
+                    prompt_tokens, completion_tokens = usage.token_delta(event)
+                    usage.record(agent_role, prompt_tokens, completion_tokens, latency_ms)
+
+                # Skip before building the payload if LLM calls are not persisted
+                if not should_persist_trace("llm_call"):
+                    return
+
+                # Extract response content
+                output_content = "LLM call completed"
+                if hasattr(event, 'response') and event.response:
+                    output_content = str(event.response)
+
+                # Create trace data
+                trace_data = {
+                    "job_id": exec_id,
+                    "event_source": agent_role,
+                    "event_context": "llm_call",
+                    "event_type": "llm_call",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "output_content": output_content,
+                    "extra_data": {
+                        "type": "llm_event",
+                        "agent_role": agent_role,
+                        "model": str(event.model) if hasattr(event, 'model') else "unknown",
+                        "call_type": str(event.call_type.value) if hasattr(event, 'call_type') else "unknown",
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "latency_ms": round(latency_ms, 1) if latency_ms is not None else None,
+                    }
+                }
+
+                # Add group context if available
+                if exec_data['group_context']:
+                    trace_data["group_id"] = exec_data['group_context'].primary_group_id
+                    trace_data["group_email"] = exec_data['group_context'].group_email
+
+                # Enqueue trace
+                exec_data['trace_queue'].put_nowait(trace_data)
+                TraceQueue().notify()
+
+                logger.debug(f"[LLMEventRouter] Routed LLM event from {agent_role} to execution {exec_id}")
+
             except Exception as e:
                 logger.error(f"[LLMEventRouter] Error handling LLM event: {e}")
-        
+
         logger.info("[LLMEventRouter] Global LLM event handler registered")
-    
+
     @classmethod
     def get_active_execution_count(cls) -> int:
         """Get the number of active executions being tracked."""
         return len(cls._active_executions)
-    
+
     @classmethod
     def get_active_agents(cls) -> Set[str]:
         """Get all agent roles currently being tracked across all executions."""
@@ -155,12 +360,20 @@ class LLMEventRouter:
             all_agents.update(exec_data['agents'])
         return all_agents
 
+    @classmethod
+    def get_usage_summary(cls, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Get the LLM usage aggregated so far for an active execution."""
+        exec_data = cls._active_executions.get(execution_id)
+        if exec_data is None or exec_data.get('usage') is None:
+            return None
+        return exec_data['usage'].summary()
+
 
 # Convenience functions
 def register_execution_for_llm_events(execution_id: str, crew: Any, group_context: Optional[GroupContext] = None):
     """
     Register an execution to receive LLM events.
-    
+
     Args:
         execution_id: Unique identifier for the execution
         crew: The CrewAI crew instance
@@ -172,8 +385,8 @@ def register_execution_for_llm_events(execution_id: str, crew: Any, group_contex
 def unregister_execution_from_llm_events(execution_id: str):
     """
     Unregister an execution from receiving LLM events.
-    
+
     Args:
         execution_id: The execution to unregister
     """
-    LLMEventRouter.unregister_execution(execution_id)
\ No newline at end of file
+    LLMEventRouter.unregister_execution(execution_id)
@@ -24,7 +24,7 @@ from crewai.utilities.events import (
 from crewai.utilities.events.base_event_listener import BaseEventListener
 
 # Import our queue system
-from src.services.trace_queue import get_trace_queue
+from src.services.trace_queue import TraceQueue, get_trace_queue, should_persist_trace
 
 # Import the job_output_queue
 from src.services.execution_logs_queue import enqueue_log, get_job_output_queue
@@ -414,6 +414,10 @@ class AgentTraceEventListener(BaseEventListener):
             extra_data: Additional metadata
         """
         log_prefix = f"[AgentTraceEventListener][{self.job_id}]"
+        # Only event types stored by the trace writer are worth crossing the queue
+        if not should_persist_trace(event_type):
+            logger.debug(f"{log_prefix} EVENT[{event_type}] ⏭️ Skipping non-important event type")
+            return
         try:
             timestamp = datetime.now(timezone.utc)
             time_since_init = (timestamp - self._init_time).total_seconds()
@@ -444,6 +448,7 @@ class AgentTraceEventListener(BaseEventListener):
             
             # Enqueue the trace data
             self._queue.put_nowait(trace_data)
+            TraceQueue().notify()
             
             # Log successful enqueuing with more info
             logger.info(f"{log_prefix} EVENT[{event_type}] ✅ Successfully enqueued trace for Source: {event_source}, Context: {event_context[:30]}...")
@@ -8,11 +8,11 @@ including console output, event bus messages, and standard logging.
 import logging
 import traceback
 import warnings
-from typing import Optional, Any, Dict
+from typing import Callable, Optional, Any, Dict
 import sys
-import io
 import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 
 # Suppress known deprecation warnings from third-party libraries
@@ -263,90 +263,165 @@ class CrewLogger:
         """
         Context manager to capture stdout and stderr during execution.
         
+        Output written by the current context (including threads started with
+        ``asyncio.to_thread``, which inherit it) is routed to this job only and
+        forwarded line by line while the job runs. Output from other contexts
+        passes through to the original streams untouched.
+        
         Args:
             job_id: The execution/job ID
             
         Yields:
             None
         """
-        # Set up stdout/stderr capture
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
-        
+        install_output_demultiplexer()
+        capture = OutputCapture(lambda stream_name, line: self._emit_captured_line(job_id, stream_name, line))
+        token = _current_output_capture.set(capture)
         try:
-            # Redirect stdout/stderr
-            sys.stdout = stdout_capture
-            sys.stderr = stderr_capture
-            
             # Yield control back to caller
             yield
-            
         finally:
-            # Restore original stdout/stderr with protection
-            try:
-                if original_stdout and hasattr(original_stdout, 'write'):
-                    sys.stdout = original_stdout
-                if original_stderr and hasattr(original_stderr, 'write'):
-                    sys.stderr = original_stderr
-            except Exception:
-                # If restoration fails, ensure we have working streams
-                import sys as fallback_sys
-                sys.stdout = fallback_sys.__stdout__
-                sys.stderr = fallback_sys.__stderr__
-            
-            # Process captured output
-            try:
-                stdout_content = stdout_capture.getvalue()
-                stderr_content = stderr_capture.getvalue()
-            except ValueError:
-                # StringIO was closed - handle gracefully
-                stdout_content = ""
-                stderr_content = ""
-            
-            # Log any stdout/stderr content directly to ensure they reach the execution logs table
-            if stdout_content:
-                for line in stdout_content.splitlines():
-                    if line.strip():
-                        # Get group context for this job if available
-                        group_context = None
-                        if job_id in self._active_jobs:
-                            job_handler = self._active_jobs[job_id]["handler"]
-                            group_context = getattr(job_handler, 'group_context', None)
-                        
-                        # Log both to crew logger AND directly enqueue for database
-                        log_message = f"STDOUT: {line.strip()}"
-                        self._crew_logger.info(log_message)
-                        # Direct enqueue to ensure it reaches the execution logs table
-                        enqueue_log(
-                            execution_id=job_id, 
-                            content=f"[CREW] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - INFO - {log_message}", 
-                            group_context=group_context
-                        )
-            
-            if stderr_content:
-                for line in stderr_content.splitlines():
-                    if line.strip():
-                        # Get group context for this job if available
-                        group_context = None
-                        if job_id in self._active_jobs:
-                            job_handler = self._active_jobs[job_id]["handler"]
-                            group_context = getattr(job_handler, 'group_context', None)
-                        
-                        # Log both to crew logger AND directly enqueue for database
-                        log_message = f"STDERR: {line.strip()}"
-                        self._crew_logger.error(log_message)
-                        # Direct enqueue to ensure it reaches the execution logs table
-                        enqueue_log(
-                            execution_id=job_id, 
-                            content=f"[CREW] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ERROR - {log_message}", 
-                            group_context=group_context
-                        )
-            
-            # Clean up
-            stdout_capture.close()
-            stderr_capture.close()
+            _current_output_capture.reset(token)
+            # Forward any trailing partial lines
+            capture.close()
+    
+    def _emit_captured_line(self, job_id: str, stream_name: str, line: str) -> None:
+        """Log a captured stdout/stderr line and enqueue it for the execution logs table."""
+        if not line.strip():
+            return
+        
+        # Get group context for this job if available
+        group_context = None
+        if job_id in self._active_jobs:
+            job_handler = self._active_jobs[job_id]["handler"]
+            group_context = getattr(job_handler, 'group_context', None)
+        
+        # Log both to crew logger AND directly enqueue for database
+        if stream_name == "stderr":
+            log_message = f"STDERR: {line.strip()}"
+            self._crew_logger.error(log_message)
+            level = "ERROR"
+        else:
+            log_message = f"STDOUT: {line.strip()}"
+            self._crew_logger.info(log_message)
+            level = "INFO"
+        # Direct enqueue to ensure it reaches the execution logs table
+        enqueue_log(
+            execution_id=job_id, 
+            content=f"[CREW] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {level} - {log_message}", 
+            group_context=group_context
+        )
+
+
+# Capture owning the current context's stdout/stderr writes, if any
+_current_output_capture: ContextVar[Optional["OutputCapture"]] = ContextVar("crew_output_capture", default=None)
+
+# Set while a captured line is being forwarded, so log handlers that write to
+# stdout/stderr go to the real stream instead of back into the capture
+_forwarding = threading.local()
+
+# Longest partial line kept per stream before it is forwarded as is
+MAX_PENDING_LINE_CHARS = 8192
+
+
+class OutputCapture:
+    """
+    Line-buffered sink for one execution's stdout/stderr.
+    
+    Complete lines are forwarded as soon as they are written; only the current
+    partial line is buffered, bounded by ``MAX_PENDING_LINE_CHARS``.
+    """
+    
+    def __init__(self, forward: Callable[[str, str], None]):
+        """
+        Args:
+            forward: Called with (stream name, line) for every completed line
+        """
+        self._forward = forward
+        self._pending: Dict[str, str] = {"stdout": "", "stderr": ""}
+        self._lock = threading.Lock()
+        self.closed = False
+    
+    def write(self, stream_name: str, text: str) -> None:
+        """Buffer text written to a stream and forward completed lines."""
+        with self._lock:
+            data = self._pending[stream_name] + text
+            *lines, rest = data.split("\n")
+            while len(rest) > MAX_PENDING_LINE_CHARS:
+                lines.append(rest[:MAX_PENDING_LINE_CHARS])
+                rest = rest[MAX_PENDING_LINE_CHARS:]
+            self._pending[stream_name] = rest
+        for line in lines:
+            self._send(stream_name, line)
+    
+    def close(self) -> None:
+        """Forward any partial lines and stop capturing."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending = [(name, text) for name, text in self._pending.items() if text]
+            self._pending = {"stdout": "", "stderr": ""}
+        for stream_name, text in pending:
+            self._send(stream_name, text)
+    
+    def _send(self, stream_name: str, line: str) -> None:
+        _forwarding.active = True
+        try:
+            self._forward(stream_name, line)
+        except Exception:
+            pass
+        finally:
+            _forwarding.active = False
+
+
+class DemultiplexingStream:
+    """
+    Replacement for ``sys.stdout``/``sys.stderr`` that sends each write to the
+    capture of the writing context, or to the original stream if there is none.
+    """
+    
+    def __init__(self, original: Any, stream_name: str):
+        self._original = original
+        self._stream_name = stream_name
+    
+    @property
+    def original(self) -> Any:
+        """The wrapped stream."""
+        return self._original
+    
+    def write(self, text: str) -> int:
+        capture = _current_output_capture.get()
+        if capture is None or capture.closed or getattr(_forwarding, "active", False):
+            return self._original.write(text)
+        capture.write(self._stream_name, text)
+        return len(text)
+    
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+    
+    def flush(self) -> None:
+        try:
+            self._original.flush()
+        except Exception:
+            pass
+    
+    def __getattr__(self, name: str) -> Any:
+        # isatty, fileno, encoding, ... of the original stream
+        return getattr(self._original, name)
+
+
+_install_lock = threading.Lock()
+
+
+def install_output_demultiplexer() -> None:
+    """Wrap ``sys.stdout`` and ``sys.stderr`` once; safe to call repeatedly."""
+    with _install_lock:
+        if not isinstance(sys.stdout, DemultiplexingStream):
+            sys.stdout = DemultiplexingStream(sys.stdout, "stdout")
+        if not isinstance(sys.stderr, DemultiplexingStream):
+            sys.stderr = DemultiplexingStream(sys.stderr, "stderr")
 
 
 class CrewLoggerHandler(logging.Handler):
@@ -638,62 +638,101 @@ class CrewPreparation:
                                 
                                 def __call__(self, input: Documents) -> Embeddings:
                                     try:
-                                        # Always use direct HTTP request to avoid litellm/SDK authentication issues
-                                        import requests
+                                        from src.core.embedding_cache import get_embedding_cache, get_embedding_batch_size, make_embedding_key, iter_batches
                                         
-                                        # Construct the correct endpoint URL using centralized utility
-                                        # Extract workspace URL from api_base then build full invocation URL
-                                        workspace_url = DatabricksURLUtils.extract_workspace_from_endpoint(self.api_base)
-                                        endpoint_url = DatabricksURLUtils.construct_model_invocation_url(workspace_url, self.model)
-                                        if not endpoint_url:
-                                            raise Exception("Failed to construct valid endpoint URL")
-                                        logger.debug(f"Databricks embedding endpoint URL: {endpoint_url}")
-                                        payload = {"input": input if isinstance(input, list) else [input]}
+                                        texts = input if isinstance(input, list) else [input]
                                         
-                                        # Prepare headers - prioritize user token for OBO auth
-                                        if self.user_token:
-                                            # Use OBO token directly for Databricks Apps
-                                            headers = {
-                                                "Authorization": f"Bearer {self.user_token}",
-                                                "Content-Type": "application/json"
-                                            }
-                                            logger.debug("Using OBO token for embeddings")
-                                        elif self.auth_headers:
-                                            # Use pre-fetched OAuth headers
-                                            headers = self.auth_headers
-                                        elif self.api_key:
-                                            # Use API key authentication
-                                            headers = {
-                                                "Authorization": f"Bearer {self.api_key}",
-                                                "Content-Type": "application/json"
-                                            }
-                                        else:
-                                            logger.error("No authentication method available for Databricks embeddings")
-                                            raise Exception("No authentication method available")
+                                        # Serve repeated texts from the shared embedding cache and dedupe the rest
+                                        cache = get_embedding_cache()
+                                        keys = [make_embedding_key('databricks', self.model, text) for text in texts]
+                                        embeddings = cache.get_many(keys)
+                                        pending = {}
+                                        for key, text in zip(keys, texts):
+                                            if key not in embeddings and key not in pending:
+                                                pending[key] = text
                                         
-                                        try:
-                                            response = requests.post(
-                                                endpoint_url, 
-                                                headers=headers, 
-                                                json=payload,
-                                                timeout=30
-                                            )
-                                            if response.status_code == 200:
-                                                result = response.json()
-                                                if 'data' in result and len(result['data']) > 0:
-                                                    embeddings = [item.get('embedding', item) for item in result['data']]
-                                                    return cast(Embeddings, embeddings)
-                                                else:
-                                                    raise Exception(f"Unexpected response format: {result}")
+                                        if pending:
+                                            batches = list(iter_batches(list(pending.items()), get_embedding_batch_size('databricks')))
+                                            if len(batches) == 1:
+                                                results = [self._embed_batch([text for _, text in batches[0]])]
                                             else:
-                                                error_text = response.text
-                                                raise Exception(f"Embedding API error {response.status_code}: {error_text}")
-                                        except requests.exceptions.RequestException as e:
-                                            logger.error(f"Request failed for Databricks embeddings: {e}")
-                                            raise e
+                                                # Send provider-sized batches concurrently under the configured limit
+                                                from concurrent.futures import ThreadPoolExecutor
+                                                from src.config.settings import settings
+                                                max_workers = max(1, min(len(batches), settings.EMBEDDING_MAX_CONCURRENCY))
+                                                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                                                    results = list(executor.map(
+                                                        lambda batch: self._embed_batch([text for _, text in batch]),
+                                                        batches
+                                                    ))
+                                            
+                                            created = {}
+                                            for batch, vectors in zip(batches, results):
+                                                if len(vectors) < len(batch):
+                                                    raise Exception(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+                                                created.update((key, vector) for (key, _), vector in zip(batch, vectors))
+                                            cache.put_many(created)
+                                            embeddings.update(created)
+                                        
+                                        return cast(Embeddings, [embeddings[key] for key in keys])
                                     except Exception as e:
                                         logger.error(f"Error in Databricks embedding function: {e}")
                                         raise e
+                                
+                                def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+                                    """Embed one batch of texts with a single request."""
+                                    # Always use direct HTTP request to avoid litellm/SDK authentication issues
+                                    import requests
+                                    
+                                    # Construct the correct endpoint URL using centralized utility
+                                    # Extract workspace URL from api_base then build full invocation URL
+                                    workspace_url = DatabricksURLUtils.extract_workspace_from_endpoint(self.api_base)
+                                    endpoint_url = DatabricksURLUtils.construct_model_invocation_url(workspace_url, self.model)
+                                    if not endpoint_url:
+                                        raise Exception("Failed to construct valid endpoint URL")
+                                    logger.debug(f"Databricks embedding endpoint URL: {endpoint_url}")
+                                    payload = {"input": texts}
+                                    
+                                    # Prepare headers - prioritize user token for OBO auth
+                                    if self.user_token:
+                                        # Use OBO token directly for Databricks Apps
+                                        headers = {
+                                            "Authorization": f"Bearer {self.user_token}",
+                                            "Content-Type": "application/json"
+                                        }
+                                        logger.debug("Using OBO token for embeddings")
+                                    elif self.auth_headers:
+                                        # Use pre-fetched OAuth headers
+                                        headers = self.auth_headers
+                                    elif self.api_key:
+                                        # Use API key authentication
+                                        headers = {
+                                            "Authorization": f"Bearer {self.api_key}",
+                                            "Content-Type": "application/json"
+                                        }
+                                    else:
+                                        logger.error("No authentication method available for Databricks embeddings")
+                                        raise Exception("No authentication method available")
+                                    
+                                    try:
+                                        response = requests.post(
+                                            endpoint_url, 
+                                            headers=headers, 
+                                            json=payload,
+                                            timeout=30
+                                        )
+                                        if response.status_code == 200:
+                                            result = response.json()
+                                            if 'data' in result and len(result['data']) > 0:
+                                                return [item.get('embedding', item) for item in result['data']]
+                                            else:
+                                                raise Exception(f"Unexpected response format: {result}")
+                                        else:
+                                            error_text = response.text
+                                            raise Exception(f"Embedding API error {response.status_code}: {error_text}")
+                                    except requests.exceptions.RequestException as e:
+                                        logger.error(f"Request failed for Databricks embeddings: {e}")
+                                        raise e
                             
                             # Create the custom embedding function instance
                             if not databricks_endpoint:
@@ -21,6 +21,7 @@ from src.engines.crewai.crew_preparation import CrewPreparation
 from src.engines.crewai.flow_preparation import FlowPreparation
 from src.services.tool_service import ToolService
 from src.engines.crewai.tools.tool_factory import ToolFactory
+from src.engines.crewai.tools.mcp_handler import bind_mcp_owner, release_mcp_adapters
 
 # Import the logging callbacks
 from src.engines.crewai.callbacks.logging_callbacks import AgentTraceEventListener, TaskCompletionLogger, DetailedOutputLogger
@@ -150,8 +151,12 @@ class CrewAIEngineService(BaseEngineService):
                     # Use the CrewPreparation class for crew setup with tool_service and tool_factory
                     # Pass user_token for OBO authentication in Databricks Apps
                     crew_preparation = CrewPreparation(execution_config, tool_service, tool_factory, user_token)
-                    if not await crew_preparation.prepare():
+                    # MCP sessions used by the crew's tools are leased for this execution
+                    with bind_mcp_owner(execution_id):
+                        prepared = await crew_preparation.prepare()
+                    if not prepared:
                         logger.error(f"[CrewAIEngineService] Failed to prepare crew for {execution_id}")
+                        await release_mcp_adapters(execution_id)
                         await self._update_execution_status(
                             execution_id, 
                             ExecutionStatus.FAILED.value,
@@ -135,7 +135,7 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict, group_cont
     trace_listener = AgentTraceEventListener(job_id=execution_id, group_context=group_context)
     
     # Register this execution for LLM event routing
-    from src.engines.crewai.callbacks.llm_event_router import register_execution_for_llm_events
+    from src.engines.crewai.callbacks.llm_event_router import register_execution_for_llm_events, bind_execution_context
     register_execution_for_llm_events(execution_id, crew, group_context)
     logger.info(f"Registered execution {execution_id} for LLM event routing")
     
@@ -304,8 +304,9 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict, group_cont
                 # Don't fail the execution if API key setup fails - let the actual execution
                 # fail if the keys are actually required
             
-            # Using our context manager to capture stdout/stderr
-            with crew_logger.capture_stdout_stderr(execution_id):
+            # Using our context manager to capture stdout/stderr, and binding LLM
+            # events emitted during kickoff to this execution
+            with crew_logger.capture_stdout_stderr(execution_id), bind_execution_context(execution_id):
                 # Log retry attempt if this is a retry
                 if retry_count > 0:
                     attempt_msg = f"Retry attempt {retry_count}/{max_retry_limit} for execution {execution_id}"
@@ -423,6 +424,15 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict, group_cont
         final_message = f"CrewAI execution failed after {retry_count - 1} attempts: {str(last_error)}"
         logger.error(f"Execution {execution_id} failed after maximum retries. Error: {str(last_error)}")
         
+    try:
+        # Write the memories the crew still buffers; bounded so a stalled upsert
+        # cannot hold back the final status
+        from src.config.settings import settings
+        from src.engines.crewai.memory.vector_write_buffer import flush_crew_memory
+        await asyncio.to_thread(flush_crew_memory, crew, settings.MEMORY_WRITE_FLUSH_TIMEOUT_SECONDS)
+    except Exception as flush_error:
+        logger.error(f"Error writing buffered memories for execution {execution_id}: {str(flush_error)}")
+    
     try:
         # Clean up the event streaming
         event_streaming.cleanup()
@@ -437,10 +447,10 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict, group_cont
         
         # Clean up MCP tools
         try:
-            # Stop and cleanup any MCP adapters that were created
-            # This prevents process leaks for stdio adapters and cleans up network resources
-            from src.engines.crewai.tools.mcp_handler import stop_all_adapters
-            await stop_all_adapters()
+            # Release only this execution's MCP session leases; pooled sessions
+            # may still be in use by other executions
+            from src.engines.crewai.tools.mcp_handler import release_mcp_adapters
+            await release_mcp_adapters(execution_id)
             logger.info(f"Cleaned up MCP tools for execution {execution_id}")
         except Exception as mcp_cleanup_error:
             logger.error(f"Error cleaning up MCP tools for execution {execution_id}: {str(mcp_cleanup_error)}")
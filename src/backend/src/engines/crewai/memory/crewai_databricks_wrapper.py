@@ -5,22 +5,20 @@ This module provides a wrapper that makes Databricks Vector Storage compatible
 with CrewAI's memory system expectations.
 """
 import os
-
-# CRITICAL: Set USE_NULLPOOL immediately at import time to prevent asyncpg connection pool issues
-# This must be done before any database connections are created
-if not os.environ.get("USE_NULLPOOL"):
-    os.environ["USE_NULLPOOL"] = "true"
-
 import logging
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import json
 import uuid
 
+from src.config.settings import settings
 from src.core.logger import LoggerManager
 from src.engines.crewai.memory.databricks_vector_storage import DatabricksVectorStorage
+from src.engines.crewai.memory.memory_search_cache import MemorySearchCache
+from src.engines.crewai.memory.vector_write_buffer import VectorWriteBuffer
 from src.schemas.databricks_index_schemas import DatabricksIndexSchemas
 from src.engines.crewai.memory.entity_relationship_retriever import EntityRelationshipRetriever
+from src.utils.asyncio_utils import run_sync
 
 logger = LoggerManager.get_instance().crew
 entity_logger = LoggerManager.get_instance().databricks_entity
@@ -58,6 +56,26 @@ class CrewAIDatabricksWrapper:
         self.endpoint_name = databricks_storage.endpoint_name
         self.user_token = databricks_storage.user_token
         
+        # Writes are buffered and upserted in batches off the agent's thread
+        self.write_buffer: Optional[VectorWriteBuffer] = None
+        if settings.MEMORY_WRITE_BATCH_SIZE > 1:
+            self.write_buffer = VectorWriteBuffer(
+                databricks_storage,
+                self._generate_embeddings_sync,
+                max_batch_size=settings.MEMORY_WRITE_BATCH_SIZE,
+                flush_interval_seconds=settings.MEMORY_WRITE_FLUSH_SECONDS
+            )
+        
+        # Repeated searches of this execution reuse results until it writes to the memory
+        self.search_cache: Optional[MemorySearchCache] = None
+        if settings.MEMORY_SEARCH_CACHE_TTL_SECONDS > 0:
+            self.search_cache = MemorySearchCache(
+                self.memory_type,
+                max_results=settings.MEMORY_SEARCH_CACHE_SIZE,
+                max_embeddings=settings.MEMORY_QUERY_EMBEDDING_CACHE_SIZE,
+                ttl_seconds=settings.MEMORY_SEARCH_CACHE_TTL_SECONDS
+            )
+        
         # Initialize relationship retriever if enabled for entity memory
         self.relationship_retriever = None
         if self.enable_relationship_retrieval and self.memory_type == "entity":
@@ -117,7 +135,6 @@ class CrewAIDatabricksWrapper:
         Creates service instance dynamically to maintain async patterns.
         """
         try:
-            import asyncio
             from src.services.memory_backend_service import MemoryBackendService
             from src.core.unit_of_work import UnitOfWork
             
@@ -152,85 +169,37 @@ class CrewAIDatabricksWrapper:
                         user_token=self.user_token
                     )
             
-            # Handle async service call from sync context
-            try:
-                # Check if we're in an async context
-                loop = asyncio.get_running_loop()
-                # We're in an async context, create a new event loop in a thread
-                import concurrent.futures
-                import os
-                
-                # Ensure USE_NULLPOOL is set before creating new connections
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                
-                def run_in_new_loop():
-                    """Run the async function in a completely new event loop."""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(_async_search())
-                    finally:
-                        new_loop.close()
-                
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_in_new_loop)
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                # Ensure USE_NULLPOOL is set
-                import os
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                return asyncio.run(_async_search())
+            # Run on the shared background loop from sync context
+            return run_sync(_async_search())
         except Exception as e:
             logger.error(f"Error in service search call: {e}")
             return []
     
-    def _async_save(self, data: Dict[str, Any]) -> None:
+    def _async_save(self, data: Dict[str, Any], text: Optional[str] = None) -> None:
         """
         Helper method to handle async save operations from sync context.
         
+        With write buffering the data is queued and ``text`` is embedded when
+        its batch is written; otherwise the data is saved right away.
+        
         Args:
             data: Data dictionary to save
+            text: Text to embed for data without an embedding (buffered writes only)
         """
+        # Searches made before this write may miss it
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+        
+        if self.write_buffer is not None:
+            self.write_buffer.add(data, text)
+            return
+        
         try:
-            import asyncio
-            
             async def _do_save():
                 await self.storage.save(data)
             
-            # Handle async call from sync context
-            try:
-                # Check if we're in an async context
-                loop = asyncio.get_running_loop()
-                # We're in an async context, create a new event loop in a thread
-                import concurrent.futures
-                import os
-                
-                # Ensure USE_NULLPOOL is set before creating new connections
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                
-                def run_in_new_loop():
-                    """Run the async function in a completely new event loop."""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(_do_save())
-                    finally:
-                        new_loop.close()
-                
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_in_new_loop)
-                    future.result()
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                # Ensure USE_NULLPOOL is set
-                import os
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                asyncio.run(_do_save())
+            # Run on the shared background loop from sync context
+            run_sync(_do_save())
         except Exception as e:
             logger.error(f"Error in async save: {e}")
     
@@ -253,8 +222,6 @@ class CrewAIDatabricksWrapper:
             Enhanced search results
         """
         try:
-            import asyncio
-            
             async def _do_relationship_search():
                 # Create service instance within async context
                 async with self.unit_of_work_class() as uow:
@@ -276,37 +243,8 @@ class CrewAIDatabricksWrapper:
                         relationship_weight=relationship_weight
                     )
             
-            # Handle async call from sync context
-            try:
-                # Check if we're in an async context
-                loop = asyncio.get_running_loop()
-                # We're in an async context, create a new event loop in a thread
-                import concurrent.futures
-                import os
-                
-                # Ensure USE_NULLPOOL is set before creating new connections
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                
-                def run_in_new_loop():
-                    """Run the async function in a completely new event loop."""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(_do_relationship_search())
-                    finally:
-                        new_loop.close()
-                
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_in_new_loop)
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                # Ensure USE_NULLPOOL is set
-                import os
-                if not os.environ.get("USE_NULLPOOL"):
-                    os.environ["USE_NULLPOOL"] = "true"
-                return asyncio.run(_do_relationship_search())
+            # Run on the shared background loop from sync context
+            return run_sync(_do_relationship_search())
         except Exception as e:
             entity_logger.error(f"Error in async relationship search: {e}")
             # Return original results as fallback
@@ -567,14 +505,16 @@ class CrewAIDatabricksWrapper:
             if isinstance(value, str):
                 # Text content - need to generate embedding
                 if self.embedder:
-                    # Use the synchronous wrapper which handles event loop creation
-                    try:
-                        embedding = self._generate_embedding_sync(value)
-                    except Exception as e:
-                        logger.error(f"Error running embedding generation: {e}")
-                        embedding = None
+                    # Buffered writes are embedded together with the rest of their batch
+                    embedding = None
+                    if self.write_buffer is None:
+                        # Use the synchronous wrapper which handles event loop creation
+                        try:
+                            embedding = self._generate_embedding_sync(value)
+                        except Exception as e:
+                            logger.error(f"Error running embedding generation: {e}")
                     
-                    if embedding is not None:
+                    if embedding is not None or self.write_buffer is not None:
                         # Map metadata fields to schema fields for all memory types
                         memory_schema = DatabricksIndexSchemas.get_schema(self.memory_type)
                         # Get embedding model from the embedder configuration
@@ -795,7 +735,7 @@ class CrewAIDatabricksWrapper:
                             logger.info(f"[save] Using tools from metadata.tools: {tools_used}")
                         save_data['tools_used'] = tools_used
                         
-                        self._async_save(save_data)
+                        self._async_save(save_data, text=value if embedding is None else None)
                     else:
                         logger.warning("Failed to generate embedding for text content")
                 else:
@@ -850,6 +790,9 @@ class CrewAIDatabricksWrapper:
         """
         Search with CrewAI-compatible interface.
         
+        Results of text queries are cached for the execution until it writes
+        to this memory.
+        
         Args:
             query: Query text, dict, or embedding
             top_k: Number of results to return
@@ -858,12 +801,45 @@ class CrewAIDatabricksWrapper:
         Returns:
             List of search results
         """
+        if self.search_cache is None or not isinstance(query, str) or not self._is_memory_enabled_for_current_agent():
+            return self._search(query, top_k, **kwargs)
+        
+        cache_key = self.search_cache.result_key(query, kwargs.get('filters'), top_k, self._search_cache_scope())
+        cached_results = self.search_cache.get_results(cache_key)
+        if cached_results is not None:
+            logger.debug(f"[search] Reusing {len(cached_results)} cached {self.memory_type} results")
+            return cached_results
+        
+        version = self.search_cache.version
+        results = self._search(query, top_k, **kwargs)
+        # Empty results may come from a failed search; search again next time
+        if results:
+            self.search_cache.put_results(cache_key, results, version)
+        return results
+    
+    def _search_cache_scope(self) -> str:
+        """
+        Scope of cached results beyond the query.
+
+        Relationship retrieval expands entity results for the current agent, and
+        the wrapper is shared by the agents of a crew, so those results are
+        cached per agent role.
+        """
+        if self.memory_type == "entity" and self.enable_relationship_retrieval and self.relationship_retriever:
+            return str(getattr(self.agent_context, 'role', None) or 'default_agent')
+        return ""
+    
+    def _search(self, query: Union[str, Dict, List], top_k: int = 3, **kwargs) -> List[Dict]:
+        """Search the index without the result cache."""
         try:
             # Check if memory is disabled for the current agent
             if not self._is_memory_enabled_for_current_agent():
                 logger.info(f"[search] Memory is disabled for current agent, skipping {self.memory_type} similarity search")
                 return []
             
+            # Read your own writes: upsert buffered memories before searching
+            self.flush()
+            
             # Debug logging
             logger.debug(f"[search] Query type: {type(query)}")
             if hasattr(query, 'shape'):
@@ -890,7 +866,7 @@ class CrewAIDatabricksWrapper:
                     try:
                         if self.memory_type == "entity":
                             entity_logger.info(f"[search] Generating embedding for query: '{query[:100]}...'")
-                        embedding = self._generate_embedding_sync(query)
+                        embedding = self._embed_query(query)
                         if self.memory_type == "entity" and embedding:
                             entity_logger.info(f"[search] Generated embedding with length: {len(embedding)}")
                     except Exception as e:
@@ -999,6 +975,11 @@ class CrewAIDatabricksWrapper:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return []
             
+    def flush(self) -> None:
+        """Write buffered memories to the index and wait until they are upserted."""
+        if self.write_buffer is not None:
+            self.write_buffer.flush()
+    
     def reset(self) -> None:
         """Reset the storage."""
         self.storage.reset()
@@ -1067,6 +1048,50 @@ class CrewAIDatabricksWrapper:
             logger.error(f"Error in sync embedding generation: {e}")
             return None
     
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed a search query, reusing the embedding of a repeated query."""
+        if self.search_cache is None:
+            return self._generate_embedding_sync(query)
+        
+        embedding = self.search_cache.get_embedding(query)
+        if embedding is None:
+            embedding = self._generate_embedding_sync(query)
+            if embedding is not None:
+                self.search_cache.put_embedding(query, embedding)
+        return embedding
+    
+    def _generate_embeddings_sync(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed a batch of texts with one embedder call where the embedder supports it.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text, None for texts that could not be embedded
+        """
+        embedder = self.embedder
+        if isinstance(embedder, dict) and embedder.get('provider') == 'custom':
+            embedder = embedder.get('config', {}).get('embedder')
+        
+        if callable(embedder) or hasattr(embedder, 'embed_documents'):
+            try:
+                if callable(embedder):
+                    embeddings = embedder(list(texts))
+                else:
+                    embeddings = embedder.embed_documents(list(texts))
+                if embeddings is not None and len(embeddings) == len(texts):
+                    return [
+                        embedding.tolist() if hasattr(embedding, 'tolist') else embedding
+                        for embedding in embeddings
+                    ]
+                logger.warning(f"Embedder returned {len(embeddings) if embeddings is not None else 0} embeddings for {len(texts)} texts")
+            except Exception as e:
+                logger.error(f"Error in batch embedding generation: {e}")
+        
+        # Fall back to embedding the texts one at a time
+        return [self._generate_embedding_sync(text) for text in texts]
+    
     async def _generate_embedding(self, text: str) -> Optional[List[float]]:
         """
         Generate embedding for text using the configured embedder.
@@ -5,12 +5,6 @@ This module provides a custom storage backend that uses Databricks Vector Search
 for storing and retrieving short-term memory in CrewAI agents.
 """
 import os
-
-# CRITICAL: Set USE_NULLPOOL immediately at import time to prevent asyncpg connection pool issues
-# This must be done before any database connections are created
-if not os.environ.get("USE_NULLPOOL"):
-    os.environ["USE_NULLPOOL"] = "true"
-
 import uuid
 import json
 import logging
@@ -104,17 +98,246 @@ class DatabricksVectorStorage:
         
         # Initialize repository for clean architecture - this handles all operations
         self.repository = DatabricksVectorIndexRepository(workspace_url or os.getenv('DATABRICKS_HOST', ''))
-        
-        # IMPORTANT: Set USE_NULLPOOL environment variable to prevent asyncpg connection pool issues
-        # This is needed because Databricks memory operations run async code in different event loops
-        # which can conflict with SQLAlchemy's connection pooling
-        if not os.environ.get("USE_NULLPOOL"):
-            os.environ["USE_NULLPOOL"] = "true"
-            self.memory_logger.info("Set USE_NULLPOOL=true to prevent asyncpg connection pool issues")
+        # Index status is checked before upserts until the index is ready
+        self._index_ready = False
         
         # Note: We no longer need direct client access since we use the repository pattern
         # The repository handles all authentication, client creation, and operations
     
+    def build_record(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the index record for memory data.
+        
+        Args:
+            data: Dictionary containing memory data to save
+            
+        Returns:
+            Record with the fields of this memory type's schema
+        """
+        # Get schema for the specific memory type
+        schema = DatabricksIndexSchemas.get_schema(self.memory_type)
+        
+        # If no schema found, raise error
+        if not schema:
+            raise ValueError(f"Unsupported memory type: {self.memory_type}")
+        
+        # Extract embedding from data
+        embedding = data.get("embedding", None)
+        if embedding is None:
+            # Generate a random embedding if none provided (for testing)
+            embedding = [random.random() for _ in range(self.embedding_dimension)]
+        
+        # Initialize record with only fields that exist in schema
+        record = {}
+        
+        # Build record based on memory type, only including fields defined in schema
+        if self.memory_type == "short_term":
+            # Only add fields that exist in SHORT_TERM_SCHEMA
+            if "id" in schema:
+                record["id"] = str(uuid.uuid4())
+            if "content" in schema:
+                record["content"] = data.get("content", "")
+            if "embedding" in schema:
+                record["embedding"] = embedding
+            if "query_text" in schema:
+                record["query_text"] = data.get("context", {}).get("query_text", "")
+            if "session_id" in schema:
+                record["session_id"] = data.get("context", {}).get("session_id", str(uuid.uuid4()))
+            if "interaction_sequence" in schema:
+                record["interaction_sequence"] = data.get("context", {}).get("interaction_sequence", 0)
+            if "timestamp" in schema:
+                record["timestamp"] = datetime.utcnow().isoformat()
+            if "created_at" in schema:
+                # Use ISO format string for timestamp field
+                record["created_at"] = datetime.utcnow().isoformat()
+            if "ttl_hours" in schema:
+                record["ttl_hours"] = data.get("ttl_hours", 24)  # Default 24 hour TTL
+            if "crew_id" in schema:
+                record["crew_id"] = self.crew_id
+            if "agent_id" in schema:
+                record["agent_id"] = data.get("agent_id", self.agent_id)
+            if "group_id" in schema:
+                # Extract group_id from crew_id or use default
+                if self.crew_id and "user_" in self.crew_id:
+                    parts = self.crew_id.split("_crew_")
+                    record["group_id"] = parts[0] if parts else "default"
+                else:
+                    record["group_id"] = data.get("group_id", "default")
+            if "metadata" in schema:
+                record["metadata"] = json.dumps(data.get("metadata", {}))
+            if "llm_model" in schema:
+                record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
+            if "tools_used" in schema:
+                tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
+                record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
+            if "embedding_model" in schema:
+                record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
+            if "version" in schema:
+                record["version"] = 1
+                
+        elif self.memory_type == "long_term":
+            if "id" in schema:
+                record["id"] = str(uuid.uuid4())
+            if "content" in schema:
+                record["content"] = data.get("content", "")
+            if "embedding" in schema:
+                record["embedding"] = embedding
+            if "task_description" in schema:
+                record["task_description"] = data.get("task_description", "")
+            if "task_hash" in schema:
+                record["task_hash"] = hashlib.md5(data.get("task_description", "").encode()).hexdigest()
+            if "quality" in schema:
+                record["quality"] = data.get("quality", 0.8)
+            if "importance" in schema:
+                record["importance"] = data.get("importance", 0.5)
+            if "timestamp" in schema:
+                record["timestamp"] = datetime.utcnow().isoformat()
+            if "last_accessed" in schema:
+                record["last_accessed"] = datetime.utcnow().isoformat()
+            if "crew_id" in schema:
+                record["crew_id"] = self.crew_id
+            if "agent_id" in schema:
+                record["agent_id"] = data.get("agent_id", self.agent_id)
+            if "group_id" in schema:
+                # Extract group_id from crew_id or use default
+                if self.crew_id and "user_" in self.crew_id:
+                    parts = self.crew_id.split("_crew_")
+                    record["group_id"] = parts[0] if parts else "default"
+                else:
+                    record["group_id"] = data.get("group_id", "default")
+            if "metadata" in schema:
+                record["metadata"] = json.dumps(data.get("metadata", {}))
+            if "embedding_model" in schema:
+                record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
+            if "version" in schema:
+                record["version"] = 1
+            if "llm_model" in schema:
+                record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
+            if "tools_used" in schema:
+                tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
+                record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
+                
+        elif self.memory_type == "entity":
+            # Entity memory - use simplified schema
+            if "id" in schema:
+                record["id"] = str(uuid.uuid4())
+            if "entity_name" in schema:
+                record["entity_name"] = data.get("entity_name", "")
+            if "entity_type" in schema:
+                record["entity_type"] = data.get("entity_type", "unknown")
+            if "description" in schema:
+                record["description"] = data.get("description", "")
+            if "relationships" in schema:
+                record["relationships"] = json.dumps(data.get("relationships", []))
+            if "timestamp" in schema:
+                record["timestamp"] = datetime.utcnow().isoformat()
+            if "crew_id" in schema:
+                record["crew_id"] = self.crew_id
+            if "agent_id" in schema:
+                # Extract agent_id from agent object or metadata
+                agent_id = data.get("agent_id", self.agent_id)
+                if not agent_id and data.get("agent"):
+                    agent = data.get("agent")
+                    if hasattr(agent, "role"):
+                        agent_id = agent.role
+                    elif hasattr(agent, "id"):
+                        agent_id = agent.id
+                record["agent_id"] = agent_id or "unknown"
+            if "group_id" in schema:
+                # Extract group_id from crew_id (format: user_X_Y_crew_Z)
+                if self.crew_id and "user_" in self.crew_id:
+                    # Extract the user part before _crew_
+                    parts = self.crew_id.split("_crew_")
+                    if parts:
+                        record["group_id"] = parts[0]
+                else:
+                    record["group_id"] = data.get("group_id", "default")
+            if "embedding" in schema:
+                record["embedding"] = embedding
+            if "embedding_model" in schema:
+                # Use the configured embedding model
+                record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
+            if "llm_model" in schema:
+                record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
+            if "tools_used" in schema:
+                tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
+                record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
+                
+        elif self.memory_type == "document":
+            # Document memory type for documentation embeddings
+            if "id" in schema:
+                record["id"] = str(uuid.uuid4())
+            if "title" in schema:
+                record["title"] = data.get("context", {}).get("query_text", "")
+            if "content" in schema:
+                record["content"] = data.get("content", "")
+            if "source" in schema:
+                record["source"] = data.get("metadata", {}).get("source", "")
+            if "document_type" in schema:
+                record["document_type"] = data.get("metadata", {}).get("type", "documentation")
+            if "section" in schema:
+                record["section"] = data.get("metadata", {}).get("section", "")
+            if "chunk_index" in schema:
+                record["chunk_index"] = data.get("metadata", {}).get("chunk_index", 0)
+            if "chunk_size" in schema:
+                record["chunk_size"] = len(data.get("content", ""))
+            if "parent_document_id" in schema:
+                record["parent_document_id"] = data.get("metadata", {}).get("parent_document_id", "")
+            if "created_at" in schema:
+                record["created_at"] = datetime.utcnow().isoformat()
+            if "updated_at" in schema:
+                record["updated_at"] = datetime.utcnow().isoformat()
+            if "doc_metadata" in schema:
+                record["doc_metadata"] = json.dumps(data.get("metadata", {}))
+            if "group_id" in schema:
+                record["group_id"] = self.crew_id
+            if "embedding" in schema:
+                record["embedding"] = embedding
+            if "embedding_model" in schema:
+                record["embedding_model"] = data.get("metadata", {}).get("embedding_model", "databricks-gte-large-en")
+            if "version" in schema:
+                record["version"] = 1
+        else:
+            # This should not happen since we check for schema above
+            raise ValueError(f"Unsupported memory type: {self.memory_type}")
+        
+        # Ensure embedding is a list, not numpy array
+        if "embedding" in record:
+            import numpy as np
+            if isinstance(record["embedding"], np.ndarray):
+                record["embedding"] = record["embedding"].tolist()
+            elif not isinstance(record["embedding"], list):
+                # Try to convert to list if it's some other iterable
+                try:
+                    record["embedding"] = list(record["embedding"])
+                except:
+                    self.memory_logger.error(f"Could not convert embedding to list: {type(record['embedding'])}")
+        
+        # Validate record is not empty
+        if not record:
+            self.memory_logger.error(f"Record is empty after building for memory type {self.memory_type}")
+            self.memory_logger.error(f"Original data keys: {list(data.keys())}")
+            self.memory_logger.error(f"Schema fields: {list(schema.keys())}")
+            raise ValueError(f"Empty record built for memory type {self.memory_type}")
+        
+        # Log the record before upsert for debugging
+        self.memory_logger.info(f"Upserting {self.memory_type} record with {len(record)} fields: {list(record.keys())}")
+        self.memory_logger.debug(f"Record ID: {record.get('id', 'NO_ID')}")
+        if "embedding" in record:
+            self.memory_logger.debug(f"Embedding type: {type(record['embedding'])}, length: {len(record['embedding']) if hasattr(record['embedding'], '__len__') else 'N/A'}")
+        
+        # Additional validation - ensure essential fields are present
+        if "id" not in record:
+            self.memory_logger.warning("Record missing 'id' field, adding one")
+            record["id"] = str(uuid.uuid4())
+        
+        if "embedding" not in record:
+            self.memory_logger.error("Record missing 'embedding' field!")
+            self.memory_logger.error(f"Available fields: {list(record.keys())}")
+            raise ValueError("Record must have an embedding field")
+        
+        return record
+    
     async def save(self, data: Dict[str, Any]) -> None:
         """
         Save memory data to Databricks Vector Search.
@@ -123,229 +346,26 @@ class DatabricksVectorStorage:
             data: Dictionary containing memory data to save
         """
         try:
-            # Get schema for the specific memory type
-            schema = DatabricksIndexSchemas.get_schema(self.memory_type)
-            
-            # If no schema found, raise error
-            if not schema:
-                raise ValueError(f"Unsupported memory type: {self.memory_type}")
-            
-            # Extract embedding from data
-            embedding = data.get("embedding", None)
-            if embedding is None:
-                # Generate a random embedding if none provided (for testing)
-                embedding = [random.random() for _ in range(self.embedding_dimension)]
-            
-            # Initialize record with only fields that exist in schema
-            record = {}
-            
-            # Build record based on memory type, only including fields defined in schema
-            if self.memory_type == "short_term":
-                # Only add fields that exist in SHORT_TERM_SCHEMA
-                if "id" in schema:
-                    record["id"] = str(uuid.uuid4())
-                if "content" in schema:
-                    record["content"] = data.get("content", "")
-                if "embedding" in schema:
-                    record["embedding"] = embedding
-                if "query_text" in schema:
-                    record["query_text"] = data.get("context", {}).get("query_text", "")
-                if "session_id" in schema:
-                    record["session_id"] = data.get("context", {}).get("session_id", str(uuid.uuid4()))
-                if "interaction_sequence" in schema:
-                    record["interaction_sequence"] = data.get("context", {}).get("interaction_sequence", 0)
-                if "timestamp" in schema:
-                    record["timestamp"] = datetime.utcnow().isoformat()
-                if "created_at" in schema:
-                    # Use ISO format string for timestamp field
-                    record["created_at"] = datetime.utcnow().isoformat()
-                if "ttl_hours" in schema:
-                    record["ttl_hours"] = data.get("ttl_hours", 24)  # Default 24 hour TTL
-                if "crew_id" in schema:
-                    record["crew_id"] = self.crew_id
-                if "agent_id" in schema:
-                    record["agent_id"] = data.get("agent_id", self.agent_id)
-                if "group_id" in schema:
-                    # Extract group_id from crew_id or use default
-                    if self.crew_id and "user_" in self.crew_id:
-                        parts = self.crew_id.split("_crew_")
-                        record["group_id"] = parts[0] if parts else "default"
-                    else:
-                        record["group_id"] = data.get("group_id", "default")
-                if "metadata" in schema:
-                    record["metadata"] = json.dumps(data.get("metadata", {}))
-                if "llm_model" in schema:
-                    record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
-                if "tools_used" in schema:
-                    tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
-                    record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
-                if "embedding_model" in schema:
-                    record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
-                if "version" in schema:
-                    record["version"] = 1
-                    
-            elif self.memory_type == "long_term":
-                if "id" in schema:
-                    record["id"] = str(uuid.uuid4())
-                if "content" in schema:
-                    record["content"] = data.get("content", "")
-                if "embedding" in schema:
-                    record["embedding"] = embedding
-                if "task_description" in schema:
-                    record["task_description"] = data.get("task_description", "")
-                if "task_hash" in schema:
-                    record["task_hash"] = hashlib.md5(data.get("task_description", "").encode()).hexdigest()
-                if "quality" in schema:
-                    record["quality"] = data.get("quality", 0.8)
-                if "importance" in schema:
-                    record["importance"] = data.get("importance", 0.5)
-                if "timestamp" in schema:
-                    record["timestamp"] = datetime.utcnow().isoformat()
-                if "last_accessed" in schema:
-                    record["last_accessed"] = datetime.utcnow().isoformat()
-                if "crew_id" in schema:
-                    record["crew_id"] = self.crew_id
-                if "agent_id" in schema:
-                    record["agent_id"] = data.get("agent_id", self.agent_id)
-                if "group_id" in schema:
-                    # Extract group_id from crew_id or use default
-                    if self.crew_id and "user_" in self.crew_id:
-                        parts = self.crew_id.split("_crew_")
-                        record["group_id"] = parts[0] if parts else "default"
-                    else:
-                        record["group_id"] = data.get("group_id", "default")
-                if "metadata" in schema:
-                    record["metadata"] = json.dumps(data.get("metadata", {}))
-                if "embedding_model" in schema:
-                    record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
-                if "version" in schema:
-                    record["version"] = 1
-                if "llm_model" in schema:
-                    record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
-                if "tools_used" in schema:
-                    tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
-                    record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
-                    
-            elif self.memory_type == "entity":
-                # Entity memory - use simplified schema
-                if "id" in schema:
-                    record["id"] = str(uuid.uuid4())
-                if "entity_name" in schema:
-                    record["entity_name"] = data.get("entity_name", "")
-                if "entity_type" in schema:
-                    record["entity_type"] = data.get("entity_type", "unknown")
-                if "description" in schema:
-                    record["description"] = data.get("description", "")
-                if "relationships" in schema:
-                    record["relationships"] = json.dumps(data.get("relationships", []))
-                if "timestamp" in schema:
-                    record["timestamp"] = datetime.utcnow().isoformat()
-                if "crew_id" in schema:
-                    record["crew_id"] = self.crew_id
-                if "agent_id" in schema:
-                    # Extract agent_id from agent object or metadata
-                    agent_id = data.get("agent_id", self.agent_id)
-                    if not agent_id and data.get("agent"):
-                        agent = data.get("agent")
-                        if hasattr(agent, "role"):
-                            agent_id = agent.role
-                        elif hasattr(agent, "id"):
-                            agent_id = agent.id
-                    record["agent_id"] = agent_id or "unknown"
-                if "group_id" in schema:
-                    # Extract group_id from crew_id (format: user_X_Y_crew_Z)
-                    if self.crew_id and "user_" in self.crew_id:
-                        # Extract the user part before _crew_
-                        parts = self.crew_id.split("_crew_")
-                        if parts:
-                            record["group_id"] = parts[0]
-                    else:
-                        record["group_id"] = data.get("group_id", "default")
-                if "embedding" in schema:
-                    record["embedding"] = embedding
-                if "embedding_model" in schema:
-                    # Use the configured embedding model
-                    record["embedding_model"] = data.get("embedding_model", "databricks-gte-large-en")
-                if "llm_model" in schema:
-                    record["llm_model"] = data.get("llm_model", data.get("metadata", {}).get("llm_model", "unknown"))
-                if "tools_used" in schema:
-                    tools = data.get("tools_used", data.get("metadata", {}).get("tools_used", []))
-                    record["tools_used"] = json.dumps(tools) if isinstance(tools, list) else tools
-                    
-            elif self.memory_type == "document":
-                # Document memory type for documentation embeddings
-                if "id" in schema:
-                    record["id"] = str(uuid.uuid4())
-                if "title" in schema:
-                    record["title"] = data.get("context", {}).get("query_text", "")
-                if "content" in schema:
-                    record["content"] = data.get("content", "")
-                if "source" in schema:
-                    record["source"] = data.get("metadata", {}).get("source", "")
-                if "document_type" in schema:
-                    record["document_type"] = data.get("metadata", {}).get("type", "documentation")
-                if "section" in schema:
-                    record["section"] = data.get("metadata", {}).get("section", "")
-                if "chunk_index" in schema:
-                    record["chunk_index"] = data.get("metadata", {}).get("chunk_index", 0)
-                if "chunk_size" in schema:
-                    record["chunk_size"] = len(data.get("content", ""))
-                if "parent_document_id" in schema:
-                    record["parent_document_id"] = data.get("metadata", {}).get("parent_document_id", "")
-                if "created_at" in schema:
-                    record["created_at"] = datetime.utcnow().isoformat()
-                if "updated_at" in schema:
-                    record["updated_at"] = datetime.utcnow().isoformat()
-                if "doc_metadata" in schema:
-                    record["doc_metadata"] = json.dumps(data.get("metadata", {}))
-                if "group_id" in schema:
-                    record["group_id"] = self.crew_id
-                if "embedding" in schema:
-                    record["embedding"] = embedding
-                if "embedding_model" in schema:
-                    record["embedding_model"] = data.get("metadata", {}).get("embedding_model", "databricks-gte-large-en")
-                if "version" in schema:
-                    record["version"] = 1
-            else:
-                # This should not happen since we check for schema above
-                raise ValueError(f"Unsupported memory type: {self.memory_type}")
-            
-            # Ensure embedding is a list, not numpy array
-            if "embedding" in record:
-                import numpy as np
-                if isinstance(record["embedding"], np.ndarray):
-                    record["embedding"] = record["embedding"].tolist()
-                elif not isinstance(record["embedding"], list):
-                    # Try to convert to list if it's some other iterable
-                    try:
-                        record["embedding"] = list(record["embedding"])
-                    except:
-                        self.memory_logger.error(f"Could not convert embedding to list: {type(record['embedding'])}")
-            
-            # Validate record is not empty
-            if not record:
-                self.memory_logger.error(f"Record is empty after building for memory type {self.memory_type}")
-                self.memory_logger.error(f"Original data keys: {list(data.keys())}")
-                self.memory_logger.error(f"Schema fields: {list(schema.keys())}")
-                raise ValueError(f"Empty record built for memory type {self.memory_type}")
-            
-            # Log the record before upsert for debugging
-            self.memory_logger.info(f"Upserting {self.memory_type} record with {len(record)} fields: {list(record.keys())}")
-            self.memory_logger.debug(f"Record ID: {record.get('id', 'NO_ID')}")
-            if "embedding" in record:
-                self.memory_logger.debug(f"Embedding type: {type(record['embedding'])}, length: {len(record['embedding']) if hasattr(record['embedding'], '__len__') else 'N/A'}")
-            
-            # Additional validation - ensure essential fields are present
-            if "id" not in record:
-                self.memory_logger.warning("Record missing 'id' field, adding one")
-                record["id"] = str(uuid.uuid4())
+            record = self.build_record(data)
+            await self.upsert_records([record])
+            self.memory_logger.debug(f"Saved {self.memory_type} memory record to index {self.index_name}")
             
-            if "embedding" not in record:
-                self.memory_logger.error("Record missing 'embedding' field!")
-                self.memory_logger.error(f"Available fields: {list(record.keys())}")
-                raise ValueError("Record must have an embedding field")
+        except Exception as e:
+            self.memory_logger.error(f"Failed to save to Databricks Vector Search: {e}")
+            raise
+    
+    async def upsert_records(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Upsert records built by ``build_record`` in a single request.
+        
+        Args:
+            records: Records to upsert
             
-            # Check index status before upsert
+        Raises:
+            Exception: If the upsert fails
+        """
+        # Check index status before the first upsert
+        if not self._index_ready:
             try:
                 index_info = await self.repository.get_index(
                     self.index_name,
@@ -353,31 +373,28 @@ class DatabricksVectorStorage:
                     self.user_token
                 )
                 if index_info.success and index_info.index:
-                    if not index_info.index.ready:
+                    if index_info.index.ready:
+                        self._index_ready = True
+                    else:
                         self.memory_logger.warning(f"Index {self.index_name} is not ready yet (state: {index_info.index.state})")
                         # Still try to upsert as it might work
             except Exception as check_error:
                 self.memory_logger.warning(f"Could not check index status: {check_error}")
-            
-            # Upsert to Databricks Vector Search using repository
-            result = await self.repository.upsert(
-                self.index_name,
-                self.endpoint_name,
-                [record],
-                self.user_token
-            )
-            
-            if not result.get("success"):
-                error_msg = result.get("message", "Upsert failed")
-                self.memory_logger.error(f"Upsert failed: {error_msg}")
+        
+        # Upsert to Databricks Vector Search using repository
+        result = await self.repository.upsert(
+            self.index_name,
+            self.endpoint_name,
+            records,
+            self.user_token
+        )
+        
+        if not result.get("success"):
+            error_msg = result.get("message", "Upsert failed")
+            self.memory_logger.error(f"Upsert of {len(records)} records failed: {error_msg}")
+            for record in records:
                 self.memory_logger.error(f"Record that failed: {json.dumps({k: v for k, v in record.items() if k != 'embedding'}, indent=2)}")
-                raise Exception(error_msg)
-                
-            self.memory_logger.debug(f"Saved {self.memory_type} memory record to index {self.index_name}")
-            
-        except Exception as e:
-            self.memory_logger.error(f"Failed to save to Databricks Vector Search: {e}")
-            raise
+            raise Exception(error_msg)
     
     async def search(
         self, 
@@ -17,6 +17,19 @@ from src.core.logger import LoggerManager
 
 entity_logger = LoggerManager.get_instance().databricks_entity
 
+# Look for relationship keywords in descriptions, in order of precedence
+_RELATIONSHIP_TYPES = ('family', 'professional', 'organizational')
+_RELATIONSHIP_KEYWORDS = (
+    ('father', 'mother', 'son', 'daughter', 'birth name', 'real name', 'born', 'family'),
+    ('mentor', 'trainer', 'boss', 'employee', 'colleague', 'worked', 'career'),
+    ('organization', 'company', 'institution', 'member', 'belongs'),
+)
+
+# Cosine similarity above which two descriptions are related (adjustable)
+_SEMANTIC_SIMILARITY_THRESHOLD = 0.7
+# Rows of the similarity matrix computed at once, bounding memory to rows x entities
+_SEMANTIC_BLOCK_ROWS = 512
+
 
 @dataclass
 class EntityNode:
@@ -70,6 +83,8 @@ class EntityRelationshipRetriever:
         self.embedding_model = embedding_model
         self.entity_graph: Dict[str, EntityNode] = {}
         self.relationship_edges: List[RelationshipEdge] = []
+        # Outgoing edges by source entity, so traversal is O(degree)
+        self.adjacency: Dict[str, List[RelationshipEdge]] = {}
         self.description_embeddings: Dict[str, np.ndarray] = {}
         
     async def build_entity_graph(self, workspace_url: str, index_name: str, endpoint_name: str,
@@ -94,6 +109,7 @@ class EntityRelationshipRetriever:
             # Clear existing graph
             self.entity_graph.clear()
             self.relationship_edges.clear()
+            self.adjacency.clear()
             self.description_embeddings.clear()
             
             # Build entity nodes
@@ -261,6 +277,7 @@ class EntityRelationshipRetriever:
             # Clear existing graph
             self.entity_graph.clear()
             self.relationship_edges.clear()
+            self.adjacency.clear()
             self.description_embeddings.clear()
             
             # Add initial entities to the graph
@@ -431,8 +448,8 @@ class EntityRelationshipRetriever:
             for entity_name in current_hop:
                 # Find all outgoing edges from this entity
                 outgoing_edges = [
-                    edge for edge in self.relationship_edges 
-                    if edge.source == entity_name and edge.target not in visited
+                    edge for edge in self.adjacency.get(entity_name, ())
+                    if edge.target not in visited
                 ]
                 
                 entity_logger.info(f"[_traverse_relationships_from_seeds] Entity '{entity_name}' has {len(outgoing_edges)} outgoing relationships")
@@ -532,72 +549,152 @@ class EntityRelationshipRetriever:
                         relationship_type="explicit",
                         evidence=f"Explicitly listed in {entity_name}'s relationships"
                     )
-                    self.relationship_edges.append(edge)
+                    self._add_edge(edge)
+    
+    def _add_edge(self, edge: RelationshipEdge) -> None:
+        """Record an edge in the edge list and the adjacency index."""
+        self.relationship_edges.append(edge)
+        self.adjacency.setdefault(edge.source, []).append(edge)
     
     async def _build_semantic_relationship_edges(self) -> None:
-        """Build edges based on semantic similarity of descriptions."""
-        entity_names = list(self.entity_graph.keys())
+        """
+        Build edges based on semantic similarity of descriptions.
         
-        for i, name1 in enumerate(entity_names):
-            entity1 = self.entity_graph[name1]
-            embedding1 = self.description_embeddings.get(name1)
+        All description embeddings are stacked into one row-normalised float32
+        matrix and the pairwise cosine similarities come from matrix products
+        over blocks of rows, so memory stays linear in the number of entities.
+        """
+        entity_names = [
+            name for name in self.entity_graph
+            if self.description_embeddings.get(name) is not None
+        ]
+        if len(entity_names) < 2:
+            return
+        
+        try:
+            matrix = np.vstack([
+                np.asarray(self.description_embeddings[name], dtype=np.float32).reshape(-1)
+                for name in entity_names
+            ])
+        except ValueError as e:
+            entity_logger.error(f"Cannot stack description embeddings of different dimensions: {e}")
+            return
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero and so never pass the threshold
+        normalized = matrix / np.where(norms == 0, 1.0, norms)
+        
+        # Upper triangle only: one edge per unordered pair, source is the earlier entity
+        row_blocks, col_blocks, similarity_blocks = [], [], []
+        for start in range(0, len(entity_names), _SEMANTIC_BLOCK_ROWS):
+            block = normalized[start:start + _SEMANTIC_BLOCK_ROWS]
+            similarities = block @ normalized[start:].T
+            block_rows, block_cols = np.nonzero(
+                np.triu(similarities > _SEMANTIC_SIMILARITY_THRESHOLD, k=1)
+            )
+            row_blocks.append(block_rows + start)
+            col_blocks.append(block_cols + start)
+            similarity_blocks.append(similarities[block_rows, block_cols])
+        rows, cols = np.concatenate(row_blocks), np.concatenate(col_blocks)
+        pair_similarities = np.concatenate(similarity_blocks)
+        if not len(rows):
+            return
+        
+        keyword_flags = {
+            name: self._description_keyword_flags(self.entity_graph[name].description)
+            for name in {entity_names[i] for i in np.concatenate([rows, cols])}
+        }
+        for i, j, similarity in zip(rows.tolist(), cols.tolist(), pair_similarities.tolist()):
+            name1, name2 = entity_names[i], entity_names[j]
+            relationship_type = self._relationship_type_from_flags(
+                keyword_flags[name1], keyword_flags[name2]
+            )
             
-            if embedding1 is None:
-                continue
-                
-            for name2 in entity_names[i+1:]:
-                entity2 = self.entity_graph[name2]
-                embedding2 = self.description_embeddings.get(name2)
-                
-                if embedding2 is None:
-                    continue
-                
-                # Compute cosine similarity
-                similarity = self._cosine_similarity(embedding1, embedding2)
-                
-                # Create edge if similarity is above threshold
-                if similarity > 0.7:  # Adjustable threshold
-                    relationship_type = await self._infer_relationship_type_from_descriptions(
-                        entity1.description, entity2.description
-                    )
-                    
-                    edge = RelationshipEdge(
-                        source=name1,
-                        target=name2,
-                        strength=similarity,
-                        relationship_type=relationship_type,
-                        evidence=f"High semantic similarity ({similarity:.3f}) between descriptions"
-                    )
-                    self.relationship_edges.append(edge)
+            edge = RelationshipEdge(
+                source=name1,
+                target=name2,
+                strength=similarity,
+                relationship_type=relationship_type,
+                evidence=f"High semantic similarity ({similarity:.3f}) between descriptions"
+            )
+            self._add_edge(edge)
     
     async def _build_name_based_relationship_edges(self) -> None:
-        """Build edges based on name patterns and co-occurrence."""
-        entity_names = list(self.entity_graph.keys())
+        """
+        Build edges based on name patterns and co-occurrence.
         
-        for i, name1 in enumerate(entity_names):
-            entity1 = self.entity_graph[name1]
+        Instead of comparing all pairs, candidates are drawn from two indexes:
+        entities sharing a name word (a prerequisite for a non-zero Jaccard
+        similarity) and descriptions containing every character trigram of a
+        name (a prerequisite for the name occurring in that description).
+        """
+        entity_names = list(self.entity_graph.keys())
+        if len(entity_names) < 2:
+            return
+        
+        lowered_names = [name.lower() for name in entity_names]
+        lowered_descriptions = [
+            self.entity_graph[name].description.lower() for name in entity_names
+        ]
+        candidate_pairs: Set[Tuple[int, int]] = set()
+        
+        # Block on shared name words
+        word_index: Dict[str, List[int]] = {}
+        for i, name_lower in enumerate(lowered_names):
+            for word in set(name_lower.split()):
+                word_index.setdefault(word, []).append(i)
+        for members in word_index.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    candidate_pairs.add((members[a], members[b]))
+        
+        # Trigram index over descriptions for name co-occurrence
+        trigram_index: Dict[str, Set[int]] = {}
+        for i, description in enumerate(lowered_descriptions):
+            for trigram in self._trigrams(description):
+                trigram_index.setdefault(trigram, set()).add(i)
+        all_indices = range(len(entity_names))
+        for i, name_lower in enumerate(lowered_names):
+            name_trigrams = self._trigrams(name_lower)
+            if name_trigrams:
+                postings = sorted(
+                    (trigram_index.get(trigram, set()) for trigram in name_trigrams), key=len
+                )
+                described_in = set(postings[0]).intersection(*postings[1:])
+            else:
+                # Names shorter than a trigram are checked against every description
+                described_in = all_indices
+            for j in described_in:
+                if j != i and name_lower in lowered_descriptions[j]:
+                    candidate_pairs.add((min(i, j), max(i, j)))
+        
+        for i, j in sorted(candidate_pairs):
+            name1, name2 = entity_names[i], entity_names[j]
+            entity1, entity2 = self.entity_graph[name1], self.entity_graph[name2]
+            
+            # Check for name similarity patterns
+            name_similarity = self._compute_name_similarity(name1, name2)
+            description_cooccurrence = self._check_description_cooccurrence(
+                entity1.description, entity2.description, name1, name2
+            )
             
-            for name2 in entity_names[i+1:]:
-                entity2 = self.entity_graph[name2]
+            if name_similarity > 0.8 or description_cooccurrence:
+                relationship_type = "name_based" if name_similarity > 0.8 else "contextual"
+                strength = max(name_similarity, 0.6 if description_cooccurrence else 0.0)
                 
-                # Check for name similarity patterns
-                name_similarity = self._compute_name_similarity(name1, name2)
-                description_cooccurrence = self._check_description_cooccurrence(
-                    entity1.description, entity2.description, name1, name2
+                edge = RelationshipEdge(
+                    source=name1,
+                    target=name2,
+                    strength=strength,
+                    relationship_type=relationship_type,
+                    evidence=f"Name similarity or contextual co-occurrence detected"
                 )
-                
-                if name_similarity > 0.8 or description_cooccurrence:
-                    relationship_type = "name_based" if name_similarity > 0.8 else "contextual"
-                    strength = max(name_similarity, 0.6 if description_cooccurrence else 0.0)
-                    
-                    edge = RelationshipEdge(
-                        source=name1,
-                        target=name2,
-                        strength=strength,
-                        relationship_type=relationship_type,
-                        evidence=f"Name similarity or contextual co-occurrence detected"
-                    )
-                    self.relationship_edges.append(edge)
+                self._add_edge(edge)
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Character trigrams of a lower-cased string."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
     
     def _find_entity_by_name(self, name: str) -> Optional[EntityNode]:
         """Find entity by name, handling variations and partial matches."""
@@ -634,22 +731,25 @@ class EntityRelationshipRetriever:
     
     async def _infer_relationship_type_from_descriptions(self, desc1: str, desc2: str) -> str:
         """Infer relationship type using semantic analysis of descriptions."""
-        desc1_lower = desc1.lower()
-        desc2_lower = desc2.lower()
-        
-        # Look for relationship keywords in descriptions
-        family_keywords = ['father', 'mother', 'son', 'daughter', 'birth name', 'real name', 'born', 'family']
-        professional_keywords = ['mentor', 'trainer', 'boss', 'employee', 'colleague', 'worked', 'career']
-        organizational_keywords = ['organization', 'company', 'institution', 'member', 'belongs']
-        
-        if any(keyword in desc1_lower or keyword in desc2_lower for keyword in family_keywords):
-            return 'family'
-        elif any(keyword in desc1_lower or keyword in desc2_lower for keyword in professional_keywords):
-            return 'professional'
-        elif any(keyword in desc1_lower or keyword in desc2_lower for keyword in organizational_keywords):
-            return 'organizational'
-        else:
-            return 'semantic'
+        return self._relationship_type_from_flags(
+            self._description_keyword_flags(desc1), self._description_keyword_flags(desc2)
+        )
+    
+    def _description_keyword_flags(self, description: str) -> Tuple[bool, bool, bool]:
+        """Whether a description mentions family, professional and organizational keywords."""
+        description_lower = description.lower()
+        return tuple(
+            any(keyword in description_lower for keyword in keywords)
+            for keywords in _RELATIONSHIP_KEYWORDS
+        )
+    
+    @staticmethod
+    def _relationship_type_from_flags(flags1: Tuple[bool, ...], flags2: Tuple[bool, ...]) -> str:
+        """Pick the first relationship type whose keywords appear in either description."""
+        for relationship_type, flag1, flag2 in zip(_RELATIONSHIP_TYPES, flags1, flags2):
+            if flag1 or flag2:
+                return relationship_type
+        return 'semantic'
     
     def _compute_name_similarity(self, name1: str, name2: str) -> float:
         """Compute name similarity using multiple strategies."""
@@ -691,8 +791,8 @@ class EntityRelationshipRetriever:
             for entity_name in current_hop:
                 # Find all outgoing edges from this entity
                 outgoing_edges = [
-                    edge for edge in self.relationship_edges 
-                    if edge.source == entity_name and edge.target not in visited
+                    edge for edge in self.adjacency.get(entity_name, ())
+                    if edge.target not in visited
                 ]
                 
                 for edge in outgoing_edges:
@@ -0,0 +1,135 @@
+"""
+Per-execution cache of memory search results and query embeddings.
+
+CrewAI asks memory the same questions again and again within an execution
+(the task description is the query of every step of a task), and each search
+used to embed the query and call the remote index, plus relationship
+retrieval for entity memory. Each memory wrapper of an execution keeps a
+MemorySearchCache: search results keyed by memory type, normalised query,
+filters, k and scope (the searching agent, where results depend on it),
+dropped whenever the execution writes to that memory, and a small LRU of
+query embeddings, which writes do not invalidate.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+ResultKey = Tuple[str, str, str, int, str]
+
+
+class MemorySearchCache:
+    """Search results and query embeddings of one memory type within an execution."""
+
+    def __init__(self, memory_type: str, max_results: int, max_embeddings: int, ttl_seconds: float):
+        self.memory_type = memory_type
+        self._max_results = max_results
+        self._max_embeddings = max_embeddings
+        self._ttl_seconds = ttl_seconds
+        self._results: "OrderedDict[ResultKey, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Collapse whitespace so queries differing only in spacing share entries."""
+        return " ".join(query.split())
+
+    def result_key(self, query: str, filters: Optional[Dict[str, Any]], k: int, scope: str = "") -> ResultKey:
+        """
+        Build the key of a search's results.
+
+        Args:
+            query: Query text
+            filters: Search filters
+            k: Number of results
+            scope: What else the results depend on, such as the searching agent
+        """
+        filters_key = json.dumps(filters or {}, sort_keys=True, default=str)
+        return (self.memory_type, self.normalize_query(query), filters_key, k, scope)
+
+    @property
+    def version(self) -> int:
+        """Write counter; results searched before a write are not cached."""
+        with self._lock:
+            return self._version
+
+    def get_results(self, key: ResultKey) -> Optional[List[Dict[str, Any]]]:
+        """Get copies of cached search results, None if missing or expired."""
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self._ttl_seconds:
+                if entry is not None:
+                    del self._results[key]
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return [dict(result) for result in entry[1]]
+
+    def put_results(self, key: ResultKey, results: List[Dict[str, Any]], version: int) -> None:
+        """
+        Cache search results.
+
+        Args:
+            key: Key from result_key
+            results: Results of the search
+            version: ``version`` read before searching; stale results are discarded
+        """
+        if self._ttl_seconds <= 0 or self._max_results <= 0:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            self._results[key] = (time.monotonic(), [dict(result) for result in results])
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_results:
+                self._results.popitem(last=False)
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        """Get the cached embedding of a query."""
+        key = self.normalize_query(query)
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is None:
+                self.embedding_misses += 1
+                return None
+            self._embeddings.move_to_end(key)
+            self.embedding_hits += 1
+            return embedding
+
+    def put_embedding(self, query: str, embedding: List[float]) -> None:
+        """Cache the embedding of a query."""
+        if self._max_embeddings <= 0:
+            return
+        key = self.normalize_query(query)
+        with self._lock:
+            self._embeddings[key] = list(embedding)
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self._max_embeddings:
+                self._embeddings.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop cached results after a write to the memory."""
+        with self._lock:
+            self._version += 1
+            self._results.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache sizes and hit/miss counters."""
+        with self._lock:
+            return {
+                "memory_type": self.memory_type,
+                "results": len(self._results),
+                "embeddings": len(self._embeddings),
+                "hits": self.hits,
+                "misses": self.misses,
+                "embedding_hits": self.embedding_hits,
+                "embedding_misses": self.embedding_misses,
+            }
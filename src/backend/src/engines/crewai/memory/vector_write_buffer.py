@@ -0,0 +1,219 @@
+"""
+Write-behind buffering of Databricks vector memory writes.
+
+CrewAI saves memories one at a time from the agent's thread, and each save
+used to embed its text and upsert a single record before the agent could go
+on. A VectorWriteBuffer collects the records written to one memory index by
+all agents of a crew and upserts them in batches on a shared background loop,
+embedding the texts of a batch with one embedder call. Batches are written
+once ``max_batch_size`` records are pending, ``flush_interval_seconds`` after
+the first pending record, and on ``flush()``, which the memory wrapper calls
+before searching the index and the crew engine calls at task and crew
+completion, so later reads see earlier writes.
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.logger import LoggerManager
+from src.utils.asyncio_utils import run_in_background
+
+logger = LoggerManager.get_instance().databricks_vector_search
+
+# Memory data and, when it still has to be embedded, its text
+PendingWrite = Tuple[Dict[str, Any], Optional[str]]
+
+# Crew attributes holding CrewAI memory objects, whose storage may buffer writes
+CREW_MEMORY_ATTRIBUTES = (
+    "_short_term_memory", "_long_term_memory", "_entity_memory",
+    "short_term_memory", "long_term_memory", "entity_memory",
+)
+
+
+class VectorWriteBuffer:
+    """Buffer of memory writes to one Databricks vector index, upserted in batches."""
+
+    def __init__(
+        self,
+        storage: Any,
+        embed: Callable[[List[str]], List[Optional[List[float]]]],
+        max_batch_size: int,
+        flush_interval_seconds: float
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            storage: DatabricksVectorStorage building and upserting the records
+            embed: Function embedding a list of texts, None for texts it could not embed
+            max_batch_size: Records per upsert; a full batch is written right away
+            flush_interval_seconds: Delay after which pending records are written (0 to wait for a flush)
+        """
+        self.storage = storage
+        self._embed = embed
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: List[PendingWrite] = []
+        self._in_flight: Set[concurrent.futures.Future] = set()
+        self._timer_scheduled = False
+        self._lock = threading.Lock()
+        self.records_written = 0
+        self.records_failed = 0
+        self.upserts = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, data: Dict[str, Any], text: Optional[str] = None) -> None:
+        """
+        Buffer memory data for the index.
+
+        Args:
+            data: Memory data as accepted by ``DatabricksVectorStorage.build_record``
+            text: Text to embed when the batch is written, if data has no embedding yet
+        """
+        with self._lock:
+            self._pending.append((data, text))
+            full = len(self._pending) >= self.max_batch_size
+            start_timer = not full and not self._timer_scheduled and self.flush_interval_seconds > 0
+            if start_timer:
+                self._timer_scheduled = True
+        if full:
+            self._schedule_pending()
+        elif start_timer:
+            run_in_background(self._write_after(self.flush_interval_seconds))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all pending records and wait for the batches in flight.
+
+        Must be called from synchronous code outside the background loops,
+        which write the batches.
+
+        Args:
+            timeout: Seconds to wait for the writes, None to wait until they are done
+
+        Returns:
+            False if writes were still in flight when the timeout expired; they
+            go on in the background
+        """
+        self._schedule_pending()
+        with self._lock:
+            in_flight = list(self._in_flight)
+        if not in_flight:
+            return True
+        _, not_done = concurrent.futures.wait(in_flight, timeout)
+        return not not_done
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pending, written and failed record counts and the number of upserts."""
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "records_written": self.records_written,
+                "records_failed": self.records_failed,
+                "upserts": self.upserts,
+            }
+
+    def _schedule_pending(self) -> None:
+        # Taking the records and registering their write under one lock means
+        # a concurrent flush sees them either pending or in flight
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            future = run_in_background(self._write_pending(pending))
+            self._in_flight.add(future)
+        future.add_done_callback(self._discard)
+
+    def _discard(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._in_flight.discard(future)
+
+    async def _write_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        with self._lock:
+            self._timer_scheduled = False
+        self._schedule_pending()
+
+    async def _write_pending(self, pending: List[PendingWrite]) -> None:
+        for start in range(0, len(pending), self.max_batch_size):
+            await self._write_batch(pending[start:start + self.max_batch_size])
+
+    async def _write_batch(self, batch: List[PendingWrite]) -> None:
+        texts = [text for _, text in batch if text is not None]
+        embeddings: List[Optional[List[float]]] = []
+        if texts:
+            try:
+                # Embedders block on HTTP calls; keep the background loop free
+                embeddings = await asyncio.to_thread(self._embed, texts)
+            except Exception as e:
+                logger.error(f"Error embedding {len(texts)} buffered {self.storage.memory_type} memories: {e}")
+        embedding_iter = iter(embeddings)
+
+        records = []
+        for data, text in batch:
+            try:
+                if text is not None:
+                    embedding = next(embedding_iter, None)
+                    if embedding is None:
+                        raise ValueError("Failed to generate embedding for text content")
+                    data = {**data, "embedding": embedding}
+                records.append(self.storage.build_record(data))
+            except Exception as e:
+                logger.warning(f"Dropping buffered {self.storage.memory_type} memory: {e}")
+                with self._lock:
+                    self.records_failed += 1
+        if not records:
+            return
+
+        try:
+            await self.storage.upsert_records(records)
+        except Exception as e:
+            logger.error(f"Failed to write {len(records)} buffered {self.storage.memory_type} memories to {self.storage.index_name}: {e}")
+            with self._lock:
+                self.records_failed += len(records)
+            return
+        with self._lock:
+            self.records_written += len(records)
+            self.upserts += 1
+        logger.debug(f"Wrote {len(records)} buffered {self.storage.memory_type} memories to {self.storage.index_name}")
+
+
+def flush_crew_memory(crew: Any, timeout: Optional[float] = None) -> bool:
+    """
+    Write the memories a crew's memory storages still buffer.
+
+    Args:
+        crew: CrewAI crew whose memories may be buffered
+        timeout: Seconds to wait for all buffers together, None to wait until written
+
+    Returns:
+        False if a write failed to start or was still in flight at the timeout
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    flushed: Set[int] = set()
+    complete = True
+    for attribute in CREW_MEMORY_ATTRIBUTES:
+        storage = getattr(getattr(crew, attribute, None), "storage", None)
+        buffer = getattr(storage, "write_buffer", None)
+        if isinstance(buffer, VectorWriteBuffer) and id(buffer) not in flushed:
+            flushed.add(id(buffer))
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                if not buffer.flush(remaining):
+                    logger.warning(
+                        f"Buffered {buffer.storage.memory_type} memories were not written within {timeout}s; "
+                        f"continuing while they are written in the background"
+                    )
+                    complete = False
+            except Exception as e:
+                logger.error(f"Error writing buffered {buffer.storage.memory_type} memories: {e}")
+                complete = False
+    return complete
@@ -5,12 +5,17 @@ This module provides tool implementations for use with CrewAI.
 """
 
 from .tool_factory import ToolFactory
-from .mcp_handler import wrap_mcp_tool, stop_mcp_adapter, stop_all_adapters, register_mcp_adapter
+from .mcp_handler import (
+    wrap_mcp_tool, stop_mcp_adapter, stop_all_adapters, register_mcp_adapter,
+    bind_mcp_owner, release_mcp_adapters
+)
 
 __all__ = [
     'ToolFactory',
     'wrap_mcp_tool',
     'stop_mcp_adapter',
     'stop_all_adapters',
-    'register_mcp_adapter'
+    'register_mcp_adapter',
+    'bind_mcp_owner',
+    'release_mcp_adapters'
 ]
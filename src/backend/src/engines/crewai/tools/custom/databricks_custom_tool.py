@@ -6,6 +6,8 @@ import asyncio
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
+from src.core.http_client_pool import get_http_client_pool
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -387,7 +389,6 @@ class DatabricksCustomTool(BaseTool):
             if host.startswith('http://'):
                 host = host[7:]
             test_url = f"https://{host}/api/2.0/sql/warehouses"
-            import requests
             
             logger.info(f"Testing token permissions with URL: {test_url}")
             
@@ -425,7 +426,7 @@ class DatabricksCustomTool(BaseTool):
                     except Exception as jwt_error:
                         logger.warning(f"Could not decode JWT token: {jwt_error}")
             
-            response = requests.get(test_url, headers=headers, timeout=10)
+            response = get_http_client_pool().sync_client().get(test_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 logger.info("✅ Token has valid permissions for Databricks SQL API")
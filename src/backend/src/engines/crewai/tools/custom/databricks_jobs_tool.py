@@ -12,6 +12,9 @@ import aiohttp
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
+from src.core.http_client_pool import get_http_client_pool
+from src.utils.asyncio_utils import run_sync
+
 logger = logging.getLogger(__name__)
 
 # Global execution tracking dictionaries (outside of class to avoid Pydantic field interpretation)
@@ -488,7 +491,7 @@ class DatabricksJobsTool(BaseTool):
             token_preview = auth_header[7:11] + "..." + auth_header[-4:] if len(auth_header) > 15 else "***"
             logger.debug(f"🔐 Using auth token: {token_preview}")
         
-        async with aiohttp.ClientSession() as session:
+        async with get_http_client_pool().client() as session:
             try:
                 async with session.request(
                     method=method,
@@ -636,79 +639,74 @@ class DatabricksJobsTool(BaseTool):
                 job_params=job_params
             )
             
-            # Execute the requested action
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                if action == "list":
-                    result = loop.run_until_complete(self._list_jobs(limit, name_filter))
-                    self._action_usage_counts[action] += 1
-                elif action == "list_my_jobs":
-                    result = loop.run_until_complete(self._list_my_jobs(limit, name_filter))
-                    self._action_usage_counts[action] += 1
-                elif action == "get":
-                    result = loop.run_until_complete(self._get_job(job_id))
-                    self._action_usage_counts[action] += 1
-                elif action == "get_notebook":
-                    result = loop.run_until_complete(self._get_notebook_content(job_id))
-                    self._action_usage_counts[action] += 1
-                elif action == "run":
-                    result = loop.run_until_complete(self._run_job(job_id, job_params))
-                    
-                    # SINGLE EXECUTION TRACKING: Track successful run execution
-                    if result and "Successfully triggered job" in result:
-                        # Extract run_id from the result
-                        import re
-                        run_id_match = re.search(r'Run ID: (\d+)', result)
-                        if run_id_match:
-                            new_run_id = run_id_match.group(1)
-                            param_hash = DatabricksJobsTool._deterministic_hash(job_params) if job_params else 'no_params'
-                            execution_key = f"run_{job_id}_{param_hash}"
-                            _GLOBAL_RUN_EXECUTIONS[execution_key] = new_run_id
-                            self.current_usage_count += 1
-                            self._action_usage_counts[action] += 1
-                            logger.info(f"[SINGLE_EXECUTION] Tracked successful run: job_id={job_id}, run_id={new_run_id}, action_usage={self._action_usage_counts[action]}, total_tracked_runs={len(_GLOBAL_RUN_EXECUTIONS)}")
-                            
-                            # Add execution tracking info to result
-                            result += f"\n\n🔒 EXECUTION TRACKING: This tool will prevent duplicate runs of this job with these parameters."
-                            action_limit = self._action_limits.get(action)
-                            if action_limit is not None:
-                                result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/{action_limit}"
-                            else:
-                                result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/unlimited"
+            # Execute the requested action on a shared background loop, which keeps
+            # the pooled HTTP sessions to the workspace alive between calls
+            if action == "list":
+                result = run_sync(self._list_jobs(limit, name_filter))
+                self._action_usage_counts[action] += 1
+            elif action == "list_my_jobs":
+                result = run_sync(self._list_my_jobs(limit, name_filter))
+                self._action_usage_counts[action] += 1
+            elif action == "get":
+                result = run_sync(self._get_job(job_id))
+                self._action_usage_counts[action] += 1
+            elif action == "get_notebook":
+                result = run_sync(self._get_notebook_content(job_id))
+                self._action_usage_counts[action] += 1
+            elif action == "run":
+                result = run_sync(self._run_job(job_id, job_params))
+                
+                # SINGLE EXECUTION TRACKING: Track successful run execution
+                if result and "Successfully triggered job" in result:
+                    # Extract run_id from the result
+                    import re
+                    run_id_match = re.search(r'Run ID: (\d+)', result)
+                    if run_id_match:
+                        new_run_id = run_id_match.group(1)
+                        param_hash = DatabricksJobsTool._deterministic_hash(job_params) if job_params else 'no_params'
+                        execution_key = f"run_{job_id}_{param_hash}"
+                        _GLOBAL_RUN_EXECUTIONS[execution_key] = new_run_id
+                        self.current_usage_count += 1
+                        self._action_usage_counts[action] += 1
+                        logger.info(f"[SINGLE_EXECUTION] Tracked successful run: job_id={job_id}, run_id={new_run_id}, action_usage={self._action_usage_counts[action]}, total_tracked_runs={len(_GLOBAL_RUN_EXECUTIONS)}")
                         
-                elif action == "monitor":
-                    result = loop.run_until_complete(self._monitor_run(run_id))
-                    self._action_usage_counts[action] += 1
-                elif action == "create":
-                    result = loop.run_until_complete(self._create_job(job_config))
+                        # Add execution tracking info to result
+                        result += f"\n\n🔒 EXECUTION TRACKING: This tool will prevent duplicate runs of this job with these parameters."
+                        action_limit = self._action_limits.get(action)
+                        if action_limit is not None:
+                            result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/{action_limit}"
+                        else:
+                            result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/unlimited"
                     
-                    # SINGLE EXECUTION TRACKING: Track successful job creation
-                    if result and "Successfully created job" in result:
-                        # Extract job_id from the result
-                        import re
-                        job_id_match = re.search(r'Job ID: (\d+)', result)
-                        if job_id_match:
-                            new_job_id = job_id_match.group(1)
-                            config_hash = DatabricksJobsTool._deterministic_hash(job_config) if job_config else 'no_config'
-                            execution_key = f"create_{config_hash}"
-                            _GLOBAL_CREATE_EXECUTIONS[execution_key] = new_job_id
-                            self.current_usage_count += 1
-                            self._action_usage_counts[action] += 1
-                            logger.info(f"[SINGLE_EXECUTION] Tracked successful creation: job_name={job_config.get('name', 'Unknown')}, job_id={new_job_id}, action_usage={self._action_usage_counts[action]}, total_tracked_creates={len(_GLOBAL_CREATE_EXECUTIONS)}")
-                            
-                            # Add execution tracking info to result
-                            result += f"\n\n🔒 EXECUTION TRACKING: This tool will prevent duplicate creation of jobs with this configuration."
-                            action_limit = self._action_limits.get(action)
-                            if action_limit is not None:
-                                result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/{action_limit}"
-                            else:
-                                result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/unlimited"
-                else:
-                    result = f"Error: Unknown action '{action}'"
-            finally:
-                loop.close()
+            elif action == "monitor":
+                result = run_sync(self._monitor_run(run_id))
+                self._action_usage_counts[action] += 1
+            elif action == "create":
+                result = run_sync(self._create_job(job_config))
+                
+                # SINGLE EXECUTION TRACKING: Track successful job creation
+                if result and "Successfully created job" in result:
+                    # Extract job_id from the result
+                    import re
+                    job_id_match = re.search(r'Job ID: (\d+)', result)
+                    if job_id_match:
+                        new_job_id = job_id_match.group(1)
+                        config_hash = DatabricksJobsTool._deterministic_hash(job_config) if job_config else 'no_config'
+                        execution_key = f"create_{config_hash}"
+                        _GLOBAL_CREATE_EXECUTIONS[execution_key] = new_job_id
+                        self.current_usage_count += 1
+                        self._action_usage_counts[action] += 1
+                        logger.info(f"[SINGLE_EXECUTION] Tracked successful creation: job_name={job_config.get('name', 'Unknown')}, job_id={new_job_id}, action_usage={self._action_usage_counts[action]}, total_tracked_creates={len(_GLOBAL_CREATE_EXECUTIONS)}")
+                        
+                        # Add execution tracking info to result
+                        result += f"\n\n🔒 EXECUTION TRACKING: This tool will prevent duplicate creation of jobs with this configuration."
+                        action_limit = self._action_limits.get(action)
+                        if action_limit is not None:
+                            result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/{action_limit}"
+                        else:
+                            result += f"\n📊 Action Usage: {action} {self._action_usage_counts[action]}/unlimited"
+            else:
+                result = f"Error: Unknown action '{action}'"
             
             total_time = time.time() - start_time
             logger.info(f"Action '{action}' completed in {total_time:.3f}s")
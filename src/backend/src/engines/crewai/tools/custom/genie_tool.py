@@ -8,6 +8,8 @@ import os
 from pathlib import Path
 import asyncio
 
+from src.core.http_client_pool import get_http_client_pool
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -391,7 +393,6 @@ class GenieTool(BaseTool):
         try:
             # Try to list Genie spaces to test permissions
             test_url = f"https://{self._host}/api/2.0/genie/spaces"
-            import requests
             
             logger.info(f"Testing token permissions with URL: {test_url}")
             
@@ -432,7 +433,7 @@ class GenieTool(BaseTool):
                     except Exception as jwt_error:
                         logger.warning(f"Could not decode JWT token: {jwt_error}")
             
-            response = requests.get(test_url, headers=headers, timeout=10)
+            response = get_http_client_pool().sync_client().get(test_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 logger.info("✅ Token has valid permissions for Genie API")
@@ -507,7 +508,7 @@ class GenieTool(BaseTool):
                 logger.info(f"Continuing conversation at URL: {url}")
                 logger.info(f"Payload: {payload}")
                 
-                response = requests.post(url, json=payload, headers=headers)
+                response = get_http_client_pool().sync_client().post(url, json=payload, headers=headers)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -533,7 +534,7 @@ class GenieTool(BaseTool):
                 logger.info(f"Payload: {payload}")
                 logger.info(f"Headers: {headers}")
                 
-                response = requests.post(url, json=payload, headers=headers)
+                response = get_http_client_pool().sync_client().post(url, json=payload, headers=headers)
                 
                 try:
                     response.raise_for_status()
@@ -604,7 +605,7 @@ class GenieTool(BaseTool):
         if not headers:
             raise Exception("No authentication headers available")
         
-        response = requests.get(url, headers=headers)
+        response = get_http_client_pool().sync_client().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -639,7 +640,7 @@ class GenieTool(BaseTool):
         if not headers:
             raise Exception("No authentication headers available")
         
-        response = requests.get(url, headers=headers)
+        response = get_http_client_pool().sync_client().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -7,7 +7,10 @@ import subprocess
 import concurrent.futures
 import traceback
 import aiohttp
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Set
+from src.utils.asyncio_utils import run_sync
 from src.utils.databricks_auth import get_databricks_auth_headers, get_mcp_auth_headers
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,30 @@ _active_mcp_adapters = {}
 # Connection pool for MCP adapters to reuse connections
 _mcp_connection_pool = {}
 
+# Execution on whose behalf adapters are requested in the current context
+_current_mcp_owner: ContextVar[Optional[str]] = ContextVar("mcp_adapter_owner", default=None)
+
+# Adapter IDs registered by each execution
+_owner_adapter_ids: Dict[str, Set[str]] = {}
+
+
+@contextmanager
+def bind_mcp_owner(execution_id: str):
+    """
+    Attribute MCP adapters requested in this context to an execution.
+
+    The execution leases the MCP sessions of those adapters until
+    release_mcp_adapters is called for it.
+
+    Args:
+        execution_id: The execution that will use the adapters
+    """
+    token = _current_mcp_owner.set(execution_id)
+    try:
+        yield
+    finally:
+        _current_mcp_owner.reset(token)
+
 async def get_or_create_mcp_adapter(server_params, adapter_id=None):
     """
     Get an existing MCP adapter from the connection pool or create a new one.
@@ -42,8 +69,11 @@ async def get_or_create_mcp_adapter(server_params, adapter_id=None):
         command_str = ' '.join(server_params['command']) if isinstance(server_params['command'], list) else server_params['command']
         pool_key = f"stdio_{command_str}"
     else:
-        # For HTTP-based servers, use URL and auth type
-        pool_key = f"{server_url}_{auth_type}"
+        # For HTTP-based servers, use URL, auth type and credentials so that
+        # different users never share an adapter
+        from src.engines.common.mcp_session_pool import session_pool_key
+        identity = session_pool_key(server_url, server_params.get('headers') or {})[1]
+        pool_key = f"{server_url}_{auth_type}_{identity}"
     
     # Check if we have a valid adapter in the pool
     if pool_key in _mcp_connection_pool:
@@ -51,9 +81,9 @@ async def get_or_create_mcp_adapter(server_params, adapter_id=None):
         # Verify the adapter is still initialized and functional
         if hasattr(adapter, '_initialized') and adapter._initialized:
             logger.info(f"Reusing MCP adapter from pool for key: {pool_key}")
-            # Still register it with the specific adapter_id if provided
-            if adapter_id:
-                register_mcp_adapter(adapter_id, adapter)
+            # Refresh the tool list; served from the session pool's cache unless stale
+            await adapter.initialize()
+            _lease_adapter(adapter, adapter_id)
             return adapter
         else:
             # Remove stale adapter from pool
@@ -70,11 +100,35 @@ async def get_or_create_mcp_adapter(server_params, adapter_id=None):
     # Add to connection pool for reuse
     _mcp_connection_pool[pool_key] = adapter
     
-    # Also register it for tracking if adapter_id provided
+    _lease_adapter(adapter, adapter_id)
+    return adapter
+
+def _lease_adapter(adapter, adapter_id=None):
+    """Register an adapter and lease its MCP sessions for the current execution, if any."""
+    owner = _current_mcp_owner.get()
     if adapter_id:
         register_mcp_adapter(adapter_id, adapter)
+        if owner:
+            _owner_adapter_ids.setdefault(owner, set()).add(adapter_id)
+    if owner and getattr(adapter, 'pool_key', None):
+        from src.engines.common.mcp_session_pool import get_mcp_session_pool
+        get_mcp_session_pool().lease(owner, adapter.pool_key)
+
+async def release_mcp_adapters(execution_id):
+    """
+    Release the MCP sessions leased by one execution.
+
+    Pooled adapters and sessions stay available to other executions; idle
+    sessions without leases are closed by the session pool.
     
-    return adapter
+    Args:
+        execution_id: The execution whose leases to release
+    """
+    from src.engines.common.mcp_session_pool import get_mcp_session_pool
+    released = get_mcp_session_pool().release(execution_id)
+    for adapter_id in _owner_adapter_ids.pop(execution_id, set()):
+        _active_mcp_adapters.pop(adapter_id, None)
+    logger.info(f"Released {len(released)} MCP session leases of execution {execution_id}")
 
 def register_mcp_adapter(adapter_id, adapter):
     """
@@ -92,9 +146,10 @@ async def stop_all_adapters():
     """
     Stop all active MCP adapters that have been registered (async version)
     
-    This function is used during cleanup to ensure that all MCP resources
+    This function is used during shutdown to ensure that all MCP resources
     are properly released, especially important for stdio adapters that
-    could otherwise leave lingering processes.
+    could otherwise leave lingering processes. Executions release their own
+    leases with release_mcp_adapters instead.
     """
     global _active_mcp_adapters, _mcp_connection_pool
     logger.info(f"Stopping all MCP adapters, count: {len(_active_mcp_adapters)}")
@@ -131,6 +186,14 @@ async def stop_all_adapters():
                 
     # Reset the dictionary
     _active_mcp_adapters.clear()
+    _owner_adapter_ids.clear()
+    
+    # Close the pooled MCP sessions of this event loop
+    try:
+        from src.engines.common.mcp_session_pool import get_mcp_session_pool
+        await get_mcp_session_pool().close_all()
+    except Exception as e:
+        logger.error(f"Error closing pooled MCP sessions: {str(e)}")
     logger.info("All MCP adapters stopped")
 
 async def get_databricks_workspace_host():
@@ -288,23 +351,8 @@ def create_crewai_tool_from_mcp(mcp_tool_dict):
                 # Remove dummy field if it exists
                 kwargs.pop('dummy', None)
                 
-                # Check if there's already an event loop running
-                try:
-                    loop = asyncio.get_running_loop()
-                    # We're in an async context, create a task
-                    future = asyncio.create_task(self._mcp_tool_wrapper.execute(kwargs))
-                    # Use asyncio.run_coroutine_threadsafe to handle it properly
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        result = executor.submit(asyncio.run, self._mcp_tool_wrapper.execute(kwargs)).result()
-                except RuntimeError:
-                    # No event loop running, we can create one
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        result = loop.run_until_complete(self._mcp_tool_wrapper.execute(kwargs))
-                    finally:
-                        loop.close()
+                # Run on the shared background loop, whether or not this thread has a loop
+                result = run_sync(self._mcp_tool_wrapper.execute(kwargs))
                 
                 # Extract text content if it's an MCP result object
                 if hasattr(result, 'content') and result.content:
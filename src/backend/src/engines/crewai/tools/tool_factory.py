@@ -128,6 +128,19 @@ from src.services.tool_service import ToolService
 from src.services.api_keys_service import ApiKeysService
 from src.schemas.tool import ToolUpdate
 from src.utils.encryption_utils import EncryptionUtils
+from src.core.api_key_cache import ApiKeyCache, get_api_key_cache
+from src.core.prompt_cache import get_prompt_cache
+
+# API keys the built-in tools need, resolved once per factory
+TOOL_API_KEYS = ["SERPER_API_KEY", "PERPLEXITY_API_KEY", "OPENAI_API_KEY", "FIRECRAWL_API_KEY", "LINKUP_API_KEY", "DATABRICKS_API_KEY"]
+
+# Embedchain-based search tools, whose LLM and embedder default to OpenAI
+OPENAI_RAG_TOOLS = {
+    "RagTool", "WebsiteSearchTool", "GithubSearchTool", "CSVSearchTool", "YoutubeChannelSearchTool",
+    "YoutubeVideoSearchTool", "CodeDocsSearchTool", "DirectorySearchTool", "DOCXSearchTool",
+    "TXTSearchTool", "JSONSearchTool", "MDXSearchTool", "PDFSearchTool", "XMLSearchTool",
+    "PGSearchTool", "MySQLSearchTool",
+}
 
 class ToolFactory:
     def __init__(self, config, api_keys_service=None, user_token=None):
@@ -144,6 +157,8 @@ class ToolFactory:
         self.user_token = user_token
         # Store tools by both ID and title for easy lookup
         self._available_tools: Dict[str, object] = {}
+        # Decrypted API keys of this factory, injected into the tools it creates
+        self._credentials: Dict[str, Optional[str]] = {}
         self._tool_implementations = {}
         
         # Map tool names to their implementations
@@ -238,30 +253,9 @@ class ToolFactory:
             try:
                 await self._load_available_tools_async()
                 
-                # Setup API keys if we have the service
+                # Resolve the tool API keys if we have the service
                 if self.api_keys_service:
-                    # Pre-load common API keys into environment
-                    api_keys_to_load = ["SERPER_API_KEY", "PERPLEXITY_API_KEY", "OPENAI_API_KEY", "FIRECRAWL_API_KEY", "LINKUP_API_KEY", "DATABRICKS_API_KEY"]
-                    for key_name in api_keys_to_load:
-                        try:
-                            # Use utility function to avoid event loop issues
-                            from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
-                            
-                            async def _get_key_operation(session):
-                                # Re-use the api_keys_service but with a fresh session
-                                from src.services.api_keys_service import ApiKeysService
-                                api_keys_service = ApiKeysService(session)
-                                return await api_keys_service.find_by_name(key_name)
-                                
-                            api_key_obj = await execute_db_operation_with_fresh_engine(_get_key_operation)
-                            
-                            if api_key_obj and api_key_obj.encrypted_value:
-                                # Decrypt the value
-                                api_key = EncryptionUtils.decrypt_value(api_key_obj.encrypted_value)
-                                os.environ[key_name] = api_key
-                                logger.info(f"Pre-loaded {key_name} from ApiKeysService")
-                        except Exception as e:
-                            logger.error(f"Error pre-loading {key_name}: {str(e)}")
+                    await self._preload_credentials_async()
                 
                 self._initialized = True
             except Exception as e:
@@ -291,20 +285,12 @@ class ToolFactory:
                     asyncio.set_event_loop(loop)
                     loop.run_until_complete(self._load_available_tools_async())
                     
-                    # Also pre-load API keys if we have the service
+                    # Also resolve the tool API keys if we have the service
                     if self.api_keys_service:
-                        # Pre-load common API keys into environment
-                        api_keys_to_load = ["SERPER_API_KEY", "PERPLEXITY_API_KEY", "OPENAI_API_KEY", "FIRECRAWL_API_KEY", "LINKUP_API_KEY", "DATABRICKS_API_KEY"]
-                        for key_name in api_keys_to_load:
-                            try:
-                                api_key = loop.run_until_complete(
-                                    self._get_api_key_async(key_name)
-                                )
-                                if api_key:
-                                    os.environ[key_name] = api_key
-                                    logger.info(f"Pre-loaded {key_name} from ApiKeysService (sync)")
-                            except Exception as e:
-                                logger.error(f"Error pre-loading {key_name} (sync): {str(e)}")
+                        try:
+                            loop.run_until_complete(self._preload_credentials_async())
+                        except Exception as e:
+                            logger.error(f"Error pre-loading API keys (sync): {str(e)}")
                 finally:
                     loop.close()
         except Exception as e:
@@ -312,9 +298,96 @@ class ToolFactory:
             import traceback
             logger.error(traceback.format_exc())
     
+    async def _preload_credentials_async(self):
+        """
+        Resolve all tool API keys at once.
+        
+        Keys are served from the API key cache when possible; the others are
+        fetched with a single query, decrypted once and cached. The values are
+        kept on this factory and never written to os.environ.
+        """
+        cache = get_api_key_cache()
+        missing = []
+        for key_name in TOOL_API_KEYS:
+            cached = cache.get(key_name)
+            if cached is ApiKeyCache.MISSING:
+                missing.append(key_name)
+            else:
+                self._credentials[key_name] = cached
+        if not missing:
+            return
+        
+        try:
+            # Use utility function to avoid event loop issues
+            from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
+            
+            async def _get_keys_operation(session):
+                return await ApiKeysService(session).find_by_names(missing)
+            
+            api_keys = await execute_db_operation_with_fresh_engine(_get_keys_operation)
+        except Exception as e:
+            logger.error(f"Error pre-loading API keys {missing}: {str(e)}")
+            return
+        
+        found = {api_key.name: api_key for api_key in api_keys or []}
+        for key_name in missing:
+            api_key_obj = found.get(key_name)
+            value = None
+            if api_key_obj and api_key_obj.encrypted_value:
+                try:
+                    value = EncryptionUtils.decrypt_value(api_key_obj.encrypted_value)
+                except Exception as e:
+                    logger.error(f"Error decrypting {key_name}: {str(e)}")
+                    continue
+            cache.put(key_name, value or None)
+            self._credentials[key_name] = value or None
+            if value:
+                logger.info(f"Pre-loaded {key_name} from ApiKeysService")
+    
+    def _resolve_api_key(self, key_name: str) -> Optional[str]:
+        """
+        Resolve an API key for a tool instance.
+        
+        Pre-loaded credentials come first, then the process environment (keys
+        set by the deployment), then a lookup through the service layer. Keys
+        looked up are kept on this factory only.
+        """
+        if key_name in self._credentials:
+            return self._credentials[key_name] or os.environ.get(key_name)
+        env_value = os.environ.get(key_name)
+        if env_value:
+            return env_value
+        
+        logger.info(f"Looking up {key_name} through the service layer")
+        try:
+            # Check if we're already in an event loop
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+        
+        if in_event_loop:
+            # Use ThreadPoolExecutor to call async method from sync context
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                value = pool.submit(self._run_in_new_loop, self._get_api_key_async, key_name).result()
+        else:
+            value = self._get_api_key(key_name)
+        
+        self._credentials[key_name] = value or None
+        return value or None
+    
     async def _load_available_tools_async(self):
-        """Load all available tools from the service asynchronously"""
+        """Load all available tools, from the shared catalogue when it is cached"""
         try:
+            cache = get_prompt_cache()
+            tool_index = cache.get_tool_index()
+            if tool_index is not None:
+                self._available_tools = tool_index
+                logger.debug(f"Using cached tool catalogue version {cache.tools_version}")
+                return
+            version = cache.tools_version
+            
             # Get services using Unit of Work pattern
             from src.core.unit_of_work import UnitOfWork
             from src.services.tool_service import ToolService
@@ -332,6 +405,7 @@ class ToolFactory:
                 for tool in tools:
                     self._available_tools[tool.title] = tool
                     self._available_tools[str(tool.id)] = tool  # Convert ID to string since it might come as string from config
+                cache.put_tools(tools, version=version)
                 
                 logger.info(f"Loaded {len(tools)} tools from service using UnitOfWork")
                 logger.debug(f"Available tools: {[f'{t.id}:{t.title}' for t in tools]}")
@@ -365,6 +439,11 @@ class ToolFactory:
     
     async def _get_api_key_async(self, key_name: str) -> Optional[str]:
         """Get an API key asynchronously through the service"""
+        cache = get_api_key_cache()
+        cached = cache.get(key_name)
+        if cached is not ApiKeyCache.MISSING:
+            return cached
+        
         try:
             if self.api_keys_service:
                 # Use the provided API keys service properly through its methods
@@ -377,9 +456,12 @@ class ToolFactory:
                         # Log first and last 4 characters of the key for debugging
                         key_preview = f"{decrypted_value[:4]}...{decrypted_value[-4:]}" if len(decrypted_value) > 8 else "***"
                         logger.info(f"Using {key_name} from service directly: {key_preview}")
+                        if decrypted_value:
+                            cache.put(key_name, decrypted_value)
                         return decrypted_value
                     else:
                         logger.warning(f"{key_name} not found via service")
+                        cache.put(key_name, None)
                         return None
                 except Exception as e:
                     logger.error(f"Error with existing API keys service for {key_name}: {str(e)}")
@@ -406,6 +488,7 @@ class ToolFactory:
                 # Log first and last 4 characters of the key for debugging
                 key_preview = f"{decrypted_value[:4]}...{decrypted_value[-4:]}" if len(decrypted_value) > 8 else "***"
                 logger.info(f"Using {key_name} from isolated database operation: {key_preview}")
+                cache.put(key_name, decrypted_value)
                 return decrypted_value
             else:
                 logger.warning(f"{key_name} not found via isolated database operation")
@@ -422,6 +505,11 @@ class ToolFactory:
         Get an API key through the service layer synchronously
         Only use this method when not in an async context
         """
+        # Served from the API key cache without spinning up an event loop when possible
+        cached = get_api_key_cache().get(key_name)
+        if cached is not ApiKeyCache.MISSING:
+            return cached
+        
         try:
             # Check if we're already in an event loop
             try:
@@ -602,57 +690,10 @@ class ToolFactory:
                 # Use parameters directly from tool config
                 api_key = tool_config.get('api_key', '')
                 
-                # Try to get the key from environment first
-                perplexity_api_key = os.environ.get("PERPLEXITY_API_KEY")
+                # Resolve the key from the factory's credentials, the environment or the service
+                perplexity_api_key = None if api_key else self._resolve_api_key("PERPLEXITY_API_KEY")
                 
-                # If not found in environment, try to get it from the service
-                if not perplexity_api_key and not api_key:
-                    # Use the API keys service if provided, otherwise use the normal methods
-                    if self.api_keys_service is not None:
-                        logger.info("Using ApiKeysService to get PERPLEXITY_API_KEY")
-                        try:
-                            # Check if we're in an async context
-                            asyncio.get_running_loop()
-                            # Use ThreadPoolExecutor to call async method from sync context
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(
-                                    self._run_in_new_loop,
-                                    self._get_api_key_async,
-                                    "PERPLEXITY_API_KEY"
-                                ).result()
-                        except RuntimeError:
-                            # Not in async context
-                            loop = asyncio.new_event_loop()
-                            try:
-                                asyncio.set_event_loop(loop)
-                                db_api_key = loop.run_until_complete(
-                                    self._get_api_key_async("PERPLEXITY_API_KEY")
-                                )
-                            finally:
-                                loop.close()
-                    else:
-                        # Fallback to original method
-                        logger.info("No ApiKeysService provided, using fallback method for PERPLEXITY_API_KEY")
-                        try:
-                            # Check if we're already in an event loop
-                            current_loop = asyncio.get_running_loop()
-                            # We're in an async context, use ThreadPoolExecutor
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(self._run_in_new_loop, 
-                                                        self._get_api_key_async, 
-                                                        "PERPLEXITY_API_KEY").result()
-                        except RuntimeError:
-                            # We're not in an async context, use direct method
-                            db_api_key = self._get_api_key("PERPLEXITY_API_KEY")
-                        
-                        if db_api_key:
-                            # Set in environment for tools that read from there
-                            os.environ["PERPLEXITY_API_KEY"] = db_api_key
-                            perplexity_api_key = db_api_key
-                
-                # Use tool configuration or environment
+                # Use tool configuration or resolved key
                 final_api_key = api_key or perplexity_api_key
                 
                 # Add api key to config and create with all parameters from config
@@ -675,57 +716,10 @@ class ToolFactory:
                 # Get API key from tool config
                 api_key = tool_config.get('serper_api_key', '')
                 
-                # Try to get the key from environment first
-                serper_api_key = os.environ.get("SERPER_API_KEY")
-                
-                # If not found in environment, try to get it from the service
-                if not serper_api_key and not api_key:
-                    # Use the API keys service if provided, otherwise use the normal methods
-                    if self.api_keys_service is not None:
-                        logger.info("Using ApiKeysService to get SERPER_API_KEY")
-                        try:
-                            # Check if we're in an async context
-                            asyncio.get_running_loop()
-                            # Use ThreadPoolExecutor to call async method from sync context
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(
-                                    self._run_in_new_loop,
-                                    self._get_api_key_async, 
-                                    "SERPER_API_KEY"
-                                ).result()
-                        except RuntimeError:
-                            # Not in async context
-                            loop = asyncio.new_event_loop()
-                            try:
-                                asyncio.set_event_loop(loop)
-                                db_api_key = loop.run_until_complete(
-                                    self._get_api_key_async("SERPER_API_KEY")
-                                )
-                            finally:
-                                loop.close()
-                    else:
-                        # Fallback to original method
-                        logger.info("No ApiKeysService provided, using fallback method for SERPER_API_KEY")
-                        try:
-                            # Check if we're already in an event loop
-                            current_loop = asyncio.get_running_loop()
-                            # We're in an async context, use ThreadPoolExecutor
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(self._run_in_new_loop, 
-                                                        self._get_api_key_async, 
-                                                        "SERPER_API_KEY").result()
-                        except RuntimeError:
-                            # We're not in an async context, use direct method
-                            db_api_key = self._get_api_key("SERPER_API_KEY")
-                        
-                        if db_api_key:
-                            # Set in environment for tools that read from there
-                            os.environ["SERPER_API_KEY"] = db_api_key
-                            serper_api_key = db_api_key
+                # Resolve the key from the factory's credentials, the environment or the service
+                serper_api_key = None if api_key else self._resolve_api_key("SERPER_API_KEY")
                 
-                # Use tool configuration or environment
+                # Use tool configuration or resolved key
                 final_api_key = api_key or serper_api_key
                 
                 # Add api key to config and create with all parameters from config
@@ -743,57 +737,10 @@ class ToolFactory:
                 # Get API key from tool config
                 api_key = tool_config.get('api_key', '')
                 
-                # Try to get the key from environment first
-                firecrawl_api_key = os.environ.get("FIRECRAWL_API_KEY")
-                
-                # If not found in environment, try to get it from the service
-                if not firecrawl_api_key and not api_key:
-                    # Use the API keys service if provided, otherwise use the normal methods
-                    if self.api_keys_service is not None:
-                        logger.info("Using ApiKeysService to get FIRECRAWL_API_KEY")
-                        try:
-                            # Check if we're in an async context
-                            asyncio.get_running_loop()
-                            # Use ThreadPoolExecutor to call async method from sync context
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(
-                                    self._run_in_new_loop,
-                                    self._get_api_key_async, 
-                                    "FIRECRAWL_API_KEY"
-                                ).result()
-                        except RuntimeError:
-                            # Not in async context
-                            loop = asyncio.new_event_loop()
-                            try:
-                                asyncio.set_event_loop(loop)
-                                db_api_key = loop.run_until_complete(
-                                    self._get_api_key_async("FIRECRAWL_API_KEY")
-                                )
-                            finally:
-                                loop.close()
-                    else:
-                        # Fallback to original method
-                        logger.info("No ApiKeysService provided, using fallback method for FIRECRAWL_API_KEY")
-                        try:
-                            # Check if we're already in an event loop
-                            current_loop = asyncio.get_running_loop()
-                            # We're in an async context, use ThreadPoolExecutor
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(self._run_in_new_loop, 
-                                                        self._get_api_key_async, 
-                                                        "FIRECRAWL_API_KEY").result()
-                        except RuntimeError:
-                            # We're not in an async context, use direct method
-                            db_api_key = self._get_api_key("FIRECRAWL_API_KEY")
-                        
-                        if db_api_key:
-                            # Set in environment for tools that read from there
-                            os.environ["FIRECRAWL_API_KEY"] = db_api_key
-                            firecrawl_api_key = db_api_key
+                # Resolve the key from the factory's credentials, the environment or the service
+                firecrawl_api_key = None if api_key else self._resolve_api_key("FIRECRAWL_API_KEY")
                 
-                # Use tool configuration or environment
+                # Use tool configuration or resolved key
                 final_api_key = api_key or firecrawl_api_key
                 
                 # Add api key to config and create with all parameters from config
@@ -956,6 +903,13 @@ class ToolFactory:
                 
                 # Create the tool with the same pattern as GenieTool
                 logger.info(f"Creating DatabricksCustomTool with tool_config: {databricks_tool_config}")
+                
+                # Without a user token the tool authenticates with a PAT; pass the
+                # factory's key instead of relying on the process environment
+                if not user_token and 'DATABRICKS_API_KEY' not in databricks_tool_config and 'token' not in databricks_tool_config:
+                    databricks_api_key = self._resolve_api_key("DATABRICKS_API_KEY")
+                    if databricks_api_key:
+                        databricks_tool_config['DATABRICKS_API_KEY'] = databricks_api_key
                 return tool_class(
                     default_catalog=default_catalog,
                     default_schema=default_schema,
@@ -1043,6 +997,13 @@ class ToolFactory:
                 
                 # Create the tool with the same pattern as other Databricks tools
                 logger.info(f"Creating DatabricksJobsTool with tool_config: {databricks_jobs_config}")
+                
+                # Without a user token the tool authenticates with a PAT; pass the
+                # factory's key instead of relying on the process environment
+                if not user_token and 'DATABRICKS_API_KEY' not in databricks_jobs_config and 'token' not in databricks_jobs_config:
+                    databricks_api_key = self._resolve_api_key("DATABRICKS_API_KEY")
+                    if databricks_api_key:
+                        databricks_jobs_config['DATABRICKS_API_KEY'] = databricks_api_key
                 return tool_class(
                     databricks_host=databricks_host,
                     tool_config=databricks_jobs_config,
@@ -1093,57 +1054,10 @@ class ToolFactory:
                     # Get API key from tool config
                     api_key = tool_config.get('api_key', '')
                     
-                    # Try to get the key from environment first
-                    databricks_api_key = os.environ.get("DATABRICKS_API_KEY")
-                    
-                    # If not found in environment, try to get it from the service
-                    if not databricks_api_key and not api_key:
-                        # Use the API keys service if provided, otherwise use the normal methods
-                        if self.api_keys_service is not None:
-                            logger.info("Using ApiKeysService to get DATABRICKS_API_KEY")
-                            try:
-                                # Check if we're in an async context
-                                asyncio.get_running_loop()
-                                # Use ThreadPoolExecutor to call async method from sync context
-                                import concurrent.futures
-                                with concurrent.futures.ThreadPoolExecutor() as pool:
-                                    db_api_key = pool.submit(
-                                        self._run_in_new_loop,
-                                        self._get_api_key_async, 
-                                        "DATABRICKS_API_KEY"
-                                    ).result()
-                            except RuntimeError:
-                                # Not in async context
-                                loop = asyncio.new_event_loop()
-                                try:
-                                    asyncio.set_event_loop(loop)
-                                    db_api_key = loop.run_until_complete(
-                                        self._get_api_key_async("DATABRICKS_API_KEY")
-                                    )
-                                finally:
-                                    loop.close()
-                        else:
-                            # Fallback to original method
-                            logger.warning("DATABRICKS_API_KEY not found via service")
-                            try:
-                                # Check if we're already in an event loop
-                                current_loop = asyncio.get_running_loop()
-                                # We're in an async context, use ThreadPoolExecutor
-                                import concurrent.futures
-                                with concurrent.futures.ThreadPoolExecutor() as pool:
-                                    db_api_key = pool.submit(self._run_in_new_loop, 
-                                                            self._get_api_key_async, 
-                                                            "DATABRICKS_API_KEY").result()
-                            except RuntimeError:
-                                # We're not in an async context, use direct method
-                                db_api_key = self._get_api_key("DATABRICKS_API_KEY")
-                            
-                            if db_api_key:
-                                # Set in environment for tools that read from there
-                                os.environ["DATABRICKS_API_KEY"] = db_api_key
-                                databricks_api_key = db_api_key
+                    # Resolve the key from the factory's credentials, the environment or the service
+                    databricks_api_key = None if api_key else self._resolve_api_key("DATABRICKS_API_KEY")
                     
-                    # Use tool configuration or environment
+                    # Use tool configuration or resolved key
                     final_api_key = api_key or databricks_api_key
                     
                     # Add api key to config
@@ -1202,57 +1116,10 @@ class ToolFactory:
                 # Get API key from tool config
                 api_key = tool_config.get('api_key', '')
                 
-                # Try to get the key from environment first
-                linkup_api_key = os.environ.get("LINKUP_API_KEY")
+                # Resolve the key from the factory's credentials, the environment or the service
+                linkup_api_key = None if api_key else self._resolve_api_key("LINKUP_API_KEY")
                 
-                # If not found in environment, try to get it from the service
-                if not linkup_api_key and not api_key:
-                    # Use the API keys service if provided, otherwise use the normal methods
-                    if self.api_keys_service is not None:
-                        logger.info("Using ApiKeysService to get LINKUP_API_KEY")
-                        try:
-                            # Check if we're in an async context
-                            asyncio.get_running_loop()
-                            # Use ThreadPoolExecutor to call async method from sync context
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(
-                                    self._run_in_new_loop,
-                                    self._get_api_key_async, 
-                                    "LINKUP_API_KEY"
-                                ).result()
-                        except RuntimeError:
-                            # Not in async context
-                            loop = asyncio.new_event_loop()
-                            try:
-                                asyncio.set_event_loop(loop)
-                                db_api_key = loop.run_until_complete(
-                                    self._get_api_key_async("LINKUP_API_KEY")
-                                )
-                            finally:
-                                loop.close()
-                    else:
-                        # Fallback to original method
-                        logger.info("No ApiKeysService provided, using fallback method for LINKUP_API_KEY")
-                        try:
-                            # Check if we're already in an event loop
-                            current_loop = asyncio.get_running_loop()
-                            # We're in an async context, use ThreadPoolExecutor
-                            import concurrent.futures
-                            with concurrent.futures.ThreadPoolExecutor() as pool:
-                                db_api_key = pool.submit(self._run_in_new_loop, 
-                                                        self._get_api_key_async, 
-                                                        "LINKUP_API_KEY").result()
-                        except RuntimeError:
-                            # We're not in an async context, use direct method
-                            db_api_key = self._get_api_key("LINKUP_API_KEY")
-                        
-                        if db_api_key:
-                            # Set in environment for tools that read from there
-                            os.environ["LINKUP_API_KEY"] = db_api_key
-                            linkup_api_key = db_api_key
-                
-                # Use tool configuration or environment
+                # Use tool configuration or resolved key
                 final_api_key = api_key or linkup_api_key
                 
                 # Create a class that wraps the LinkupSearchTool to enforce parameters at runtime
@@ -1291,6 +1158,17 @@ class ToolFactory:
                 tool = PythonPPTXTool(**tool_config)
                 return tool
             
+            elif tool_name in OPENAI_RAG_TOOLS:
+                tool_args = {**tool_config, 'result_as_answer': result_as_answer}
+                
+                # Pass the OpenAI key in the embedchain config instead of the environment
+                openai_api_key = self._resolve_api_key("OPENAI_API_KEY")
+                if openai_api_key:
+                    tool_args['config'] = self._with_openai_api_key(tool_config.get('config'), openai_api_key)
+                
+                logger.info(f"Creating {tool_name} with config parameters: {tool_config}")
+                return tool_class(**tool_args)
+            
             # For all other tools, try to create with config parameters
             else:
                 # Check if the config has any data
@@ -1312,6 +1190,22 @@ class ToolFactory:
             logger.error(traceback.format_exc())
             return None
     
+    @staticmethod
+    def _with_openai_api_key(rag_config: Optional[Dict[str, Any]], api_key: str) -> Dict[str, Any]:
+        """
+        Set the API key of the OpenAI LLM and embedder of an embedchain config.
+        
+        Components configured for another provider, or with their own key, are left as they are.
+        """
+        rag_config = dict(rag_config or {})
+        for component_name in ("llm", "embedder"):
+            component = dict(rag_config.get(component_name) or {"provider": "openai"})
+            if component.get("provider", "openai") != "openai":
+                continue
+            component["config"] = {"api_key": api_key, **(component.get("config") or {})}
+            rag_config[component_name] = component
+        return rag_config
+    
     def register_tool_implementation(self, tool_name: str, tool_class):
         """Register a tool implementation class for a given tool name"""
         self._tool_implementations[tool_name] = tool_class
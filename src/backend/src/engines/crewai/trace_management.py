@@ -6,9 +6,13 @@ This module provides functionality for managing trace data from CrewAI execution
 import logging
 import asyncio
 import queue
-from typing import Optional, Dict, Any
+import time
+from queue import Empty
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from src.core.execution_updates import get_execution_update_hub
+
 logger = logging.getLogger(__name__)
 
 class TraceManager:
@@ -26,182 +30,220 @@ class TraceManager:
     _writer_started: bool = False
     _lock = asyncio.Lock()  # Lock for starting the writer
     
+    # Writer metrics, exposed through get_metrics()
+    _metrics: Dict[str, Any] = {
+        "batches_flushed": 0,
+        "traces_written": 0,
+        "traces_failed": 0,
+        "last_flush_latency_ms": 0.0,
+        "max_flush_latency_ms": 0.0,
+        "total_flush_latency_ms": 0.0,
+    }
+    
+    @staticmethod
+    def _to_trace_row(trace_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a queued trace into the format expected by ExecutionTraceService."""
+        event_type = trace_data.get("event_type", "unknown")
+        trace_dict = {
+            "job_id": trace_data.get("job_id"),
+            "event_source": trace_data.get("event_source", event_type),  # Use event_type as fallback
+            "event_context": trace_data.get("event_context", ""),
+            "event_type": event_type,
+            "output": trace_data.get("output_content", ""),
+            "trace_metadata": trace_data.get("extra_data", {})
+        }
+        
+        # Add group context if available in trace data
+        if "group_id" in trace_data:
+            trace_dict["group_id"] = trace_data["group_id"]
+        if "group_email" in trace_data:
+            trace_dict["group_email"] = trace_data["group_email"]
+        return trace_dict
+    
+    @classmethod
+    def _record_flush(cls, written: int, failed: int, latency_ms: float) -> None:
+        """Update writer metrics after a flush."""
+        metrics = cls._metrics
+        metrics["batches_flushed"] += 1
+        metrics["traces_written"] += written
+        metrics["traces_failed"] += failed
+        metrics["last_flush_latency_ms"] = latency_ms
+        metrics["max_flush_latency_ms"] = max(metrics["max_flush_latency_ms"], latency_ms)
+        metrics["total_flush_latency_ms"] += latency_ms
+    
     @classmethod
-    async def _trace_writer_loop(cls):
+    def get_metrics(cls) -> Dict[str, Any]:
         """
-        Background task that reads from the trace queue and writes to the database.
+        Get trace writer metrics.
+        
+        Returns:
+            Dictionary with the current queue depth, flush counters and
+            latencies, and job cache statistics
+        """
+        from src.services.trace_queue import get_trace_queue, get_trace_job_cache
+        
+        metrics = dict(cls._metrics)
+        total_latency = metrics.pop("total_flush_latency_ms")
+        batches = metrics["batches_flushed"]
+        metrics["avg_flush_latency_ms"] = total_latency / batches if batches else 0.0
+        metrics["queue_depth"] = get_trace_queue().qsize()
+        metrics["job_cache"] = get_trace_job_cache().get_stats()
+        metrics["writer_running"] = bool(cls._trace_writer_task and not cls._trace_writer_task.done())
+        return metrics
+    
+    @classmethod
+    async def _flush_traces(cls, batch: List[Dict[str, Any]]) -> int:
         """
-        from src.services.trace_queue import get_trace_queue
+        Persist a batch of queued traces with a single bulk insert.
+        
+        run_ids of known jobs come from the job cache; the rest are resolved
+        (or auto-created) by the repository in one query and cached. If the
+        bulk insert fails, traces are stored one by one so a single bad trace
+        does not drop the whole batch.
+        
+        Args:
+            batch: Trace dictionaries as put on the trace queue
+            
+        Returns:
+            Number of traces that could not be stored
+        """
+        from src.services.trace_queue import get_trace_job_cache, should_persist_trace
         from src.services.execution_trace_service import ExecutionTraceService
-        from src.services.execution_status_service import ExecutionStatusService
-        from src.services.execution_history_service import get_execution_history_service
-        from queue import Empty  # Import the Empty exception from queue module
+        
+        job_cache = get_trace_job_cache()
+        rows = []
+        for trace_data in batch:
+            job_id = trace_data.get("job_id", "unknown")
+            event_type = trace_data.get("event_type", "unknown")
+            
+            # Skip processing if this is an "unknown" job_id
+            if job_id == "unknown":
+                logger.warning(f"[TraceManager._flush_traces] [{job_id}:{event_type}] Skipping trace with unknown job_id")
+                continue
+            # Producers filter at enqueue time; this only catches direct queue writers
+            if not should_persist_trace(event_type):
+                logger.debug(f"[TraceManager._flush_traces] [{job_id}:{event_type}] Skipping non-important event type")
+                continue
+            
+            row = cls._to_trace_row(trace_data)
+            run_id = job_cache.get(job_id)
+            if run_id is not None:
+                row["run_id"] = run_id
+            rows.append(row)
+        
+        if not rows:
+            return 0
+        
+        started = time.perf_counter()
+        failures = 0
+        try:
+            resolved = await ExecutionTraceService.create_traces(rows)
+            for job_id, run_id in resolved.items():
+                job_cache.put(job_id, run_id)
+        except Exception as e:
+            logger.warning(f"[TraceManager._flush_traces] Bulk insert of {len(rows)} traces failed, falling back to single inserts: {e}")
+            for row in rows:
+                # A cached run_id may be stale (e.g. the execution was deleted)
+                job_cache.evict(row["job_id"])
+                row.pop("run_id", None)
+                try:
+                    await ExecutionTraceService.create_trace(row)
+                except Exception as row_error:
+                    logger.error(f"[TraceManager._flush_traces] [{row['job_id']}:{row['event_type']}] Failed to store trace: {row_error}")
+                    failures += 1
+        
+        latency_ms = (time.perf_counter() - started) * 1000
+        cls._record_flush(len(rows) - failures, failures, latency_ms)
+        get_execution_update_hub().publish((row["job_id"] for row in rows), "traces")
+        logger.debug(f"[TraceManager._flush_traces] Stored {len(rows) - failures}/{len(rows)} traces in {latency_ms:.1f}ms")
+        return failures
+    
+    @classmethod
+    async def _trace_writer_loop(cls, batch_size: Optional[int] = None, flush_interval_ms: Optional[int] = None):
+        """
+        Background task that reads from the trace queue and writes to the database.
+        
+        The queue is drained with non-blocking gets only; when it is empty the
+        task awaits a wakeup event that producers trigger through
+        ``loop.call_soon_threadsafe``, so the event loop is never blocked.
+        Traces are bulk inserted in batches of up to ``batch_size``, waiting at
+        most ``flush_interval_ms`` for a batch to fill.
+        
+        Args:
+            batch_size: Maximum traces per insert (defaults to TRACE_WRITER_BATCH_SIZE)
+            flush_interval_ms: Maximum time to coalesce traces (defaults to TRACE_WRITER_FLUSH_INTERVAL_MS)
+        """
+        from src.config.settings import settings
+        from src.services.trace_queue import TraceQueue, get_trace_queue
+        
+        batch_size = batch_size or settings.TRACE_WRITER_BATCH_SIZE
+        flush_interval = (flush_interval_ms or settings.TRACE_WRITER_FLUSH_INTERVAL_MS) / 1000.0
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        trace_queue_holder = TraceQueue()
+        
+        def notify():
+            # Called from producer threads; only schedule a wakeup when needed
+            if not wakeup.is_set():
+                loop.call_soon_threadsafe(wakeup.set)
+        
+        async def wait_for_traces(timeout: float) -> None:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
         
         try:
-            logger.info("[TraceManager._trace_writer_loop] Writer task started.")
+            logger.info(f"[TraceManager._trace_writer_loop] Writer task started (batch_size={batch_size}, flush_interval={flush_interval}s).")
             
             # Get trace queue
             queue = get_trace_queue()
+            trace_queue_holder.set_notifier(notify)
             logger.debug(f"[TraceManager._trace_writer_loop] Queue retrieved. Initial approximate size: {queue.qsize()}")
             
-            # Get service instance
-            execution_history_service = get_execution_history_service()
-            
             batch_count = 0
             total_trace_count = 0
-            empty_count = 0  # Count consecutive empty queue occurrences
-            
-            # Keep track of jobs we've confirmed exist
-            confirmed_jobs = set()
             
             while not cls._shutdown_event.is_set():
-                # Create a small batch of traces to process together
-                batch = []
-                batch_target_size = 10  # Process up to this many at once
-                
                 try:
-                    # Try to collect a batch of traces
-                    for _ in range(batch_target_size):
-                        try:
-                            # Log queue status periodically
-                            if _ == 0:
-                                logger.debug(f"[TraceManager._trace_writer_loop] Waiting for traces... Queue size: ~{queue.qsize()}")
-                            
-                            # Non-blocking get with timeout
-                            trace_data = queue.get(block=True, timeout=0.1)
-                            
-                            # Check if this is the shutdown signal (None)
-                            if trace_data is None:
-                                logger.debug("[TraceManager._trace_writer_loop] Received shutdown signal (None) in queue.")
-                                continue
-                                
-                            batch.append(trace_data)
-                            queue.task_done()
-                            empty_count = 0  # Reset empty count when we get an item
-                        except Empty:  # Use the imported Empty exception
-                            # Queue is empty, break out of the batch collection loop
-                            empty_count += 1
-                            if empty_count % 100 == 0:  # Log every 100 consecutive empty checks
-                                logger.debug(f"[TraceManager._trace_writer_loop] Queue empty for {empty_count} consecutive checks")
+                    wakeup.clear()
+                    batch = cls._drain_queue(queue, batch_size)
+                    
+                    if not batch:
+                        # Nothing queued: sleep until a producer wakes us up
+                        await wait_for_traces(1.0)
+                        continue
+                    
+                    # Coalesce more traces until the batch is full or the interval elapsed
+                    deadline = loop.time() + flush_interval
+                    while len(batch) < batch_size and not cls._shutdown_event.is_set():
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
                             break
+                        wakeup.clear()
+                        more = cls._drain_queue(queue, batch_size - len(batch))
+                        if more:
+                            batch.extend(more)
+                            continue
+                        await wait_for_traces(remaining)
                     
-                    # If we collected any traces, process them
-                    if batch:
-                        batch_count += 1
-                        total_trace_count += len(batch)
-                        
-                        # Log batch processing
-                        logger.debug(f"[TraceManager._trace_writer_loop] Processing batch #{batch_count} with {len(batch)} traces. Total processed: {total_trace_count}")
-                        
-                        # Process each trace in the batch
-                        failures = 0
-                        for idx, trace_data in enumerate(batch):
-                            try:
-                                job_id = trace_data.get("job_id", "unknown")
-                                event_type = trace_data.get("event_type", "unknown")
-                                trace_info = f"[{job_id}:{event_type}:{idx+1}/{len(batch)}]"
-                                
-                                # Skip processing if this is an "unknown" job_id
-                                if job_id == "unknown":
-                                    logger.warning(f"[TraceManager._trace_writer_loop] {trace_info} Skipping trace with unknown job_id")
-                                    continue
-                                
-                                # Check if we've already confirmed this job exists
-                                job_exists = job_id in confirmed_jobs
-                                
-                                # If not confirmed, check the database
-                                if not job_exists:
-                                    # Check if job exists in executionhistory using the service
-                                    execution = await execution_history_service.get_execution_by_job_id(job_id)
-                                    
-                                    if execution:
-                                        # Job exists, add to confirmed set
-                                        confirmed_jobs.add(job_id)
-                                        job_exists = True
-                                        logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} Found existing job in database")
-                                    else:
-                                        # Job doesn't exist, create it
-                                        logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Job not found, creating new execution record")
-                                        
-                                        # Create minimal execution record
-                                        job_data = {
-                                            "job_id": job_id,
-                                            "status": "running",
-                                            "trigger_type": "api",
-                                            "run_name": f"Auto-created for {event_type}",
-                                            "inputs": {"auto_created": True}
-                                        }
-                                        
-                                        # Try to create the job record
-                                        success = await ExecutionStatusService.create_execution(job_data)
-                                        
-                                        if success:
-                                            logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Successfully created job record")
-                                            confirmed_jobs.add(job_id)
-                                            job_exists = True
-                                        else:
-                                            logger.error(f"[TraceManager._trace_writer_loop] {trace_info} Failed to create job record")
-                                
-                                # Detailed logging of trace data
-                                logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} Processing trace: {str(trace_data)[:200]}...")
-                                
-                                # Only proceed if job exists
-                                if job_exists:
-                                    # FILTER: Store important events in execution_trace
-                                    # Include agent_execution, tool_usage, crew_started, crew_completed, task_started, task_completed
-                                    important_event_types = [
-                                        "agent_execution", "tool_usage", "crew_started", 
-                                        "crew_completed", "task_started", "task_completed", "llm_call"
-                                    ]
-                                    
-                                    if event_type in important_event_types:
-                                        # Prepare trace data in the format expected by ExecutionTraceService
-                                        trace_dict = {
-                                            "job_id": job_id,
-                                            "event_source": trace_data.get("event_source", event_type),  # Use event_type as fallback
-                                            "event_context": trace_data.get("event_context", ""),
-                                            "event_type": event_type,
-                                            "output": trace_data.get("output_content", ""),
-                                            "trace_metadata": trace_data.get("extra_data", {})
-                                        }
-                                        
-                                        # Add group context if available in trace data
-                                        if "group_id" in trace_data:
-                                            trace_dict["group_id"] = trace_data["group_id"]
-                                        if "group_email" in trace_data:
-                                            trace_dict["group_email"] = trace_data["group_email"]
-                                        
-                                        try:
-                                            # Use the ExecutionTraceService to create the trace
-                                            await ExecutionTraceService.create_trace(trace_dict)
-                                            logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Successfully stored {event_type} trace")
-                                        except Exception as e:
-                                            logger.error(f"[TraceManager._trace_writer_loop] {trace_info} Failed to store trace: {e}")
-                                            failures += 1
-                                    else:
-                                        # Log that we're skipping this trace type
-                                        logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} ⏭️ Skipping non-important event type: {event_type}")
-                                else:
-                                    logger.warning(f"[TraceManager._trace_writer_loop] {trace_info} Skipping trace due to missing job record")
-                                    failures += 1
-                                
-                            except Exception as e:
-                                logger.error(f"[TraceManager._trace_writer_loop] Error processing trace: {e}", exc_info=True)
-                                failures += 1
-                        
-                        if failures > 0:
-                            logger.warning(f"[TraceManager._trace_writer_loop] Batch #{batch_count} processed with {failures} failures.")
-                        else:
-                            logger.debug(f"[TraceManager._trace_writer_loop] Batch #{batch_count} processed successfully.")
+                    batch_count += 1
+                    total_trace_count += len(batch)
+                    logger.debug(f"[TraceManager._trace_writer_loop] Flushing batch #{batch_count} with {len(batch)} traces. Total processed: {total_trace_count}. Queue size: ~{queue.qsize()}")
                     
-                    # If no traces were collected, sleep briefly to avoid CPU spinning
-                    else:
-                        await asyncio.sleep(0.5)
+                    failures = await cls._flush_traces(batch)
+                    if failures > 0:
+                        logger.warning(f"[TraceManager._trace_writer_loop] Batch #{batch_count} processed with {failures} failures.")
                     
                 except Exception as e:
                     logger.error(f"[TraceManager._trace_writer_loop] Batch processing error: {e}", exc_info=True)
                     # Sleep to avoid rapid retry on persistent errors
                     await asyncio.sleep(1)
+            
+            # Persist whatever is still queued before exiting
+            remaining_traces = cls._drain_queue(queue, queue.qsize() + batch_size)
+            for start in range(0, len(remaining_traces), batch_size):
+                await cls._flush_traces(remaining_traces[start:start + batch_size])
                 
             logger.info("[TraceManager._trace_writer_loop] Shutdown event received, exiting trace writer loop.")
         
@@ -210,7 +252,32 @@ class TraceManager:
         except Exception as e:
             logger.critical(f"[TraceManager._trace_writer_loop] Unhandled exception in writer loop: {e}", exc_info=True)
         finally:
+            trace_queue_holder.set_notifier(None)
             logger.info("[TraceManager._trace_writer_loop] Writer task stopped.")
+    
+    @staticmethod
+    def _drain_queue(trace_queue, max_items: int) -> List[Dict[str, Any]]:
+        """
+        Take up to ``max_items`` traces from the queue without blocking.
+        
+        Args:
+            trace_queue: The trace queue
+            max_items: Maximum number of items to take
+            
+        Returns:
+            List of trace dictionaries (shutdown markers are skipped)
+        """
+        items = []
+        while len(items) < max_items:
+            try:
+                trace_data = trace_queue.get_nowait()
+            except Empty:
+                break
+            trace_queue.task_done()
+            # None is the shutdown marker put by stop_writer
+            if trace_data is not None:
+                items.append(trace_data)
+        return items
 
     @classmethod
     async def ensure_writer_started(cls):
@@ -246,14 +313,15 @@ class TraceManager:
             logger.info("[TraceManager] Setting shutdown event for all writer tasks...")
             cls._shutdown_event.set()
             
-            # Add None to trace queue to help unblock queue.get()
+            # Add None to trace queue and wake up the writer
+            from src.services.trace_queue import TraceQueue, get_trace_queue
             try:
                 from queue import Full
-                from src.services.trace_queue import get_trace_queue
                 queue = get_trace_queue()
                 queue.put_nowait(None)
             except Full:
                 logger.warning("[TraceManager] Trace queue full, writer might take longer to stop.")
+            TraceQueue().notify()
             
             # Stop trace writer task
             if cls._writer_started and cls._trace_writer_task and not cls._trace_writer_task.done():
@@ -6,20 +6,19 @@ from datetime import datetime
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 
-# CRITICAL: Set USE_NULLPOOL BEFORE any database imports to prevent asyncpg connection pool issues
-# This must be done before importing any modules that might create database connections
-os.environ["USE_NULLPOOL"] = "true"
-
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.config.settings import settings
 from src.api import api_router
+from src.core.http_client_pool import get_http_client_pool
 from src.core.logger import LoggerManager
-from src.db.session import get_db, async_session_factory
+from src.db.session import get_db, async_session_factory, engine_registry, get_pool_metrics
 from src.services.scheduler_service import SchedulerService
 from src.services.execution_cleanup_service import ExecutionCleanupService
+from src.services.execution_retention_service import ExecutionRetentionService
+from src.utils.asyncio_utils import shutdown_background_loops
 from src.utils.databricks_url_utils import DatabricksURLUtils
 
 # Set up basic logging initially, will be enhanced in lifespan
@@ -58,6 +57,10 @@ async def lifespan(app: FastAPI):
     system_logger = logger_manager.system
     system_logger.info(f"Starting application... Logs will be stored in: {log_dir}")
     
+    # Bind the primary connection pool to the main event loop; other loops
+    # (worker threads) get their own small pools from the engine registry
+    engine_registry.set_primary_loop(asyncio.get_running_loop())
+    
     # Validate and fix Databricks environment variables early in startup
     try:
         system_logger.info("Validating Databricks environment configuration...")
@@ -80,6 +83,7 @@ async def lifespan(app: FastAPI):
     
     # Now check if database exists and tables are initialized
     scheduler = None
+    retention_service = None
     db_initialized = False
     
     try:
@@ -150,7 +154,6 @@ async def lifespan(app: FastAPI):
             system_logger.info("Running database seeders...")
             try:
                 # Always run seeders in background to avoid blocking startup
-                import asyncio
                 system_logger.info("Starting seeders in background...")
                 
                 async def run_seeders_background():
@@ -196,6 +199,15 @@ async def lifespan(app: FastAPI):
     else:
         system_logger.warning("Skipping scheduler initialization. Database not ready.")
     
+    # Start execution retention and log compaction in the background
+    if db_initialized:
+        try:
+            retention_service = ExecutionRetentionService()
+            if retention_service.start():
+                system_logger.info("Execution retention task started.")
+        except Exception as e:
+            system_logger.error(f"Failed to start execution retention task: {e}")
+    
     system_logger.info("Application startup complete")
     
     try:
@@ -211,6 +223,13 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 system_logger.error(f"Error cleaning up jobs during shutdown: {e}")
         
+        # Stop the retention task before the scheduler and engines go away
+        if retention_service:
+            try:
+                await retention_service.shutdown()
+            except Exception as e:
+                system_logger.error(f"Error stopping execution retention task: {e}")
+        
         # Shutdown scheduler if it was started
         if scheduler:
             system_logger.info("Shutting down scheduler...")
@@ -220,6 +239,31 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 system_logger.error(f"Error during scheduler shutdown: {e}")
         
+        # Stop the sync->async bridge loops; each disposes its own engine on close
+        try:
+            await asyncio.to_thread(shutdown_background_loops)
+        except Exception as e:
+            system_logger.error(f"Error stopping background event loops: {e}")
+        
+        # Stop the MCP adapters and close their pooled sessions
+        try:
+            from src.engines.crewai.tools.mcp_handler import stop_all_adapters
+            await stop_all_adapters()
+        except Exception as e:
+            system_logger.error(f"Error stopping MCP adapters: {e}")
+        
+        # Close the keep-alive HTTP sessions to Databricks
+        try:
+            await get_http_client_pool().close_all()
+        except Exception as e:
+            system_logger.error(f"Error closing HTTP sessions: {e}")
+        
+        # Close pooled database connections
+        try:
+            await engine_registry.dispose_all()
+        except Exception as e:
+            system_logger.error(f"Error disposing database engines: {e}")
+        
         system_logger.info("Application shutdown complete.")
 
 # Initialize FastAPI app
@@ -257,6 +301,17 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+@app.get("/health/db-pool")
+async def db_pool_health():
+    """Database connection pool statistics per event loop."""
+    return {"pools": get_pool_metrics()}
+
+@app.get("/health/trace-writer")
+async def trace_writer_health():
+    """Trace writer queue depth, flush latency and job cache statistics."""
+    from src.engines.crewai.trace_management import TraceManager
+    return TraceManager.get_metrics()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -13,5 +13,5 @@ from src.models.flow import Flow
 from src.models.schedule import Schedule
 from src.models.api_key import ApiKey
 from src.models.schema import Schema
-from src.models.execution_logs import ExecutionLog
+from src.models.execution_logs import ExecutionLog, ExecutionLogArchive
 from src.models.engine_config import EngineConfig
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, JSON, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 
@@ -23,6 +23,10 @@ class ExecutionHistory(Base):
     """
     
     __tablename__ = "executionhistory"
+    __table_args__ = (
+        # Serves the newest-first, group-filtered execution listing
+        Index('ix_executionhistory_group_id_created_at', 'group_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(String, primary_key=False, unique=True, default=generate_job_id, index=True)
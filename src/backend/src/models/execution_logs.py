@@ -5,7 +5,7 @@ This module defines models for storing execution log data.
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, LargeBinary
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -40,4 +40,28 @@ class ExecutionLog(Base):
     def __init__(self, **kwargs):
         super(ExecutionLog, self).__init__(**kwargs)
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow() 
\ No newline at end of file
+            self.timestamp = datetime.utcnow()
+
+
+class ExecutionLogArchive(Base):
+    """
+    Compacted logs of one execution.
+    
+    Once an execution is old enough, its execution_logs rows are rolled up
+    into a single zlib-compressed JSON document here and deleted, keeping the
+    live table (and its indexes) proportional to recent activity.
+    """
+    
+    __tablename__ = "execution_log_archives"
+    
+    id = Column(Integer, primary_key=True)
+    execution_id = Column(String, unique=True, index=True, nullable=False)
+    content = Column(LargeBinary, nullable=False)  # zlib-compressed JSON list of log lines
+    line_count = Column(Integer, nullable=False, default=0)
+    first_timestamp = Column(DateTime, nullable=True)
+    last_timestamp = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Multi-group fields
+    group_id = Column(String(100), index=True, nullable=True)  # Group isolation
+    group_email = Column(String(255), nullable=True)  # User email for audit
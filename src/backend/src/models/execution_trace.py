@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -12,6 +12,10 @@ class ExecutionTrace(Base):
     """
     
     __tablename__ = "execution_trace"
+    __table_args__ = (
+        # Serves incremental "traces after id" fetches for one job
+        Index('idx_execution_trace_job_id_id', 'job_id', 'id'),
+    )
     
     id = Column(Integer, primary_key=True)
     run_id = Column(Integer, ForeignKey('executionhistory.id'))
@@ -54,6 +54,22 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         result = self.session.execute(query)
         return result.scalars().first()
     
+    async def find_by_names(self, names: List[str]) -> List[ApiKey]:
+        """
+        Find the API keys with the given names in a single query.
+        
+        Args:
+            names: Names to search for
+            
+        Returns:
+            List of the API keys found
+        """
+        if not names:
+            return []
+        query = select(self.model).where(self.model.name.in_(names))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+    
     async def find_all(self) -> List[ApiKey]:
         """
         Find all API keys.
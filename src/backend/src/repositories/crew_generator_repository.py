@@ -11,6 +11,7 @@ import json
 from typing import List, Tuple, Dict, Any, Optional
 import uuid
 
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.agent import Agent
@@ -159,49 +160,8 @@ class CrewGeneratorRepository:
         await self._create_task_dependencies(created_tasks, tasks_data)
         
         # Convert SQLAlchemy models to serializable dictionaries
-        serialized_agents = []
-        for agent in created_agents:
-            agent_dict = {
-                'id': agent.id,
-                'name': agent.name,
-                'role': agent.role,
-                'goal': agent.goal,
-                'backstory': agent.backstory,
-                'llm': agent.llm,
-                'tools': agent.tools,
-                'allow_delegation': agent.allow_delegation,
-                'verbose': agent.verbose,
-                'max_iter': agent.max_iter,
-                'max_rpm': agent.max_rpm,
-                'cache': agent.cache,
-                'allow_code_execution': agent.allow_code_execution,
-                'code_execution_mode': agent.code_execution_mode,
-                'max_retry_limit': agent.max_retry_limit,
-                'use_system_prompt': agent.use_system_prompt,
-                'respect_context_window': agent.respect_context_window,
-                'function_calling_llm': agent.function_calling_llm,
-                'created_at': agent.created_at.isoformat() if agent.created_at else None,
-                'updated_at': agent.updated_at.isoformat() if agent.updated_at else None
-            }
-            serialized_agents.append(agent_dict)
-            
-        serialized_tasks = []
-        for task in created_tasks:
-            task_dict = {
-                'id': task.id,
-                'name': task.name,
-                'description': task.description,
-                'agent_id': task.agent_id,
-                'expected_output': task.expected_output,
-                'tools': task.tools,
-                'async_execution': task.async_execution,
-                'context': task.context,
-                'output': task.output,
-                'human_input': task.human_input,
-                'created_at': task.created_at.isoformat() if task.created_at else None,
-                'updated_at': task.updated_at.isoformat() if task.updated_at else None
-            }
-            serialized_tasks.append(task_dict)
+        serialized_agents = [self.serialize_agent(agent) for agent in created_agents]
+        serialized_tasks = [self.serialize_task(task) for task in created_tasks]
         
         # Return both created agents and tasks in a dictionary format with serializable objects
         return {
@@ -209,6 +169,64 @@ class CrewGeneratorRepository:
             'tasks': serialized_tasks
         }
 
+    def serialize_agent(self, agent: Agent) -> Dict[str, Any]:
+        """
+        Convert a created agent into a serializable dictionary.
+        
+        Args:
+            agent: Agent model
+            
+        Returns:
+            Dictionary of the agent's fields
+        """
+        return {
+            'id': agent.id,
+            'name': agent.name,
+            'role': agent.role,
+            'goal': agent.goal,
+            'backstory': agent.backstory,
+            'llm': agent.llm,
+            'tools': agent.tools,
+            'allow_delegation': agent.allow_delegation,
+            'verbose': agent.verbose,
+            'max_iter': agent.max_iter,
+            'max_rpm': agent.max_rpm,
+            'cache': agent.cache,
+            'allow_code_execution': agent.allow_code_execution,
+            'code_execution_mode': agent.code_execution_mode,
+            'max_retry_limit': agent.max_retry_limit,
+            'use_system_prompt': agent.use_system_prompt,
+            'respect_context_window': agent.respect_context_window,
+            'function_calling_llm': agent.function_calling_llm,
+            'created_at': agent.created_at.isoformat() if agent.created_at else None,
+            'updated_at': agent.updated_at.isoformat() if agent.updated_at else None
+        }
+    
+    def serialize_task(self, task: Task) -> Dict[str, Any]:
+        """
+        Convert a created task into a serializable dictionary.
+        
+        Args:
+            task: Task model
+            
+        Returns:
+            Dictionary of the task's fields
+        """
+        return {
+            'id': task.id,
+            'name': task.name,
+            'description': task.description,
+            'agent_id': task.agent_id,
+            'expected_output': task.expected_output,
+            'tools': task.tools,
+            'async_execution': task.async_execution,
+            'context': task.context,
+            'output': task.output,
+            'human_input': task.human_input,
+            'created_at': task.created_at.isoformat() if task.created_at else None,
+            'updated_at': task.updated_at.isoformat() if task.updated_at else None
+        }
+
     async def _create_agents(self, agents_data):
         """
         Create agents in the database.
@@ -223,39 +241,51 @@ class CrewGeneratorRepository:
         created_agents = []
         
         for agent_data in agents_data:
-            # Log the agent data for debugging
-            logger.info(f"Creating agent: {self._safe_get_attr(agent_data, 'name')}")
-            
-            # Create the agent
-            agent = Agent(
-                id=str(uuid.uuid4()),
-                name=self._safe_get_attr(agent_data, 'name'),
-                role=self._safe_get_attr(agent_data, 'role'),
-                goal=self._safe_get_attr(agent_data, 'goal'),
-                backstory=self._safe_get_attr(agent_data, 'backstory'),
-                llm=self._safe_get_attr(agent_data, 'llm'),
-                tools=self._safe_get_attr(agent_data, 'tools', []),
-                allow_delegation=self._safe_get_attr(agent_data, 'allow_delegation', False),
-                verbose=self._safe_get_attr(agent_data, 'verbose', False),
-                max_iter=self._safe_get_attr(agent_data, 'max_iter', 25),
-                max_rpm=self._safe_get_attr(agent_data, 'max_rpm', 10),
-                cache=self._safe_get_attr(agent_data, 'cache', True),
-                # SECURITY: Always force allow_code_execution to False
-                allow_code_execution=False,  # Hardcoded to False, ignoring agent_data
-                code_execution_mode=self._safe_get_attr(agent_data, 'code_execution_mode', 'safe'),
-                max_retry_limit=self._safe_get_attr(agent_data, 'max_retry_limit', 2),
-                use_system_prompt=self._safe_get_attr(agent_data, 'use_system_prompt', True),
-                respect_context_window=self._safe_get_attr(agent_data, 'respect_context_window', True),
-                function_calling_llm=self._safe_get_attr(agent_data, 'function_calling_llm')
-            )
-            
-            # Store the agent in the database
-            await self.create(agent)
-            logger.info(f"Agent created: {agent.name} (ID: {agent.id})")
-            created_agents.append(agent)
+            created_agents.append(await self.create_agent(agent_data))
             
         return created_agents
 
+    async def create_agent(self, agent_data) -> Agent:
+        """
+        Create a single agent in the database.
+        
+        Args:
+            agent_data: Agent data dictionary
+        
+        Returns:
+            The created Agent model
+        """
+        # Log the agent data for debugging
+        logger.info(f"Creating agent: {self._safe_get_attr(agent_data, 'name')}")
+        
+        # Create the agent
+        agent = Agent(
+            id=str(uuid.uuid4()),
+            name=self._safe_get_attr(agent_data, 'name'),
+            role=self._safe_get_attr(agent_data, 'role'),
+            goal=self._safe_get_attr(agent_data, 'goal'),
+            backstory=self._safe_get_attr(agent_data, 'backstory'),
+            llm=self._safe_get_attr(agent_data, 'llm'),
+            tools=self._safe_get_attr(agent_data, 'tools', []),
+            allow_delegation=self._safe_get_attr(agent_data, 'allow_delegation', False),
+            verbose=self._safe_get_attr(agent_data, 'verbose', False),
+            max_iter=self._safe_get_attr(agent_data, 'max_iter', 25),
+            max_rpm=self._safe_get_attr(agent_data, 'max_rpm', 10),
+            cache=self._safe_get_attr(agent_data, 'cache', True),
+            # SECURITY: Always force allow_code_execution to False
+            allow_code_execution=False,  # Hardcoded to False, ignoring agent_data
+            code_execution_mode=self._safe_get_attr(agent_data, 'code_execution_mode', 'safe'),
+            max_retry_limit=self._safe_get_attr(agent_data, 'max_retry_limit', 2),
+            use_system_prompt=self._safe_get_attr(agent_data, 'use_system_prompt', True),
+            respect_context_window=self._safe_get_attr(agent_data, 'respect_context_window', True),
+            function_calling_llm=self._safe_get_attr(agent_data, 'function_calling_llm')
+        )
+        
+        # Store the agent in the database
+        await self.create(agent)
+        logger.info(f"Agent created: {agent.name} (ID: {agent.id})")
+        return agent
+
     async def _create_tasks(self, tasks_data, agent_name_to_id):
         """
         Create tasks in the database.
@@ -274,121 +304,172 @@ class CrewGeneratorRepository:
         
         # Variable to distribute tasks in round-robin fashion if no agent specified
         round_robin_idx = 0
-        agent_ids = list(agent_name_to_id.values())
         
         for i, task_data in enumerate(tasks_data):
-            task_name = self._safe_get_attr(task_data, 'name', f'Unknown Task {i}')
-            logger.info(f"Processing task {i+1}: '{task_name}'")
-            
-            # Check for agent name in either field
-            agent_name = self._safe_get_attr(task_data, 'agent')
-            
-            if not agent_name:
-                agent_name = self._safe_get_attr(task_data, 'assigned_agent')
-                
-            # Log the agent assignment from LLM
-            if agent_name:
-                logger.info(f"LLM assigned task '{task_name}' to agent '{agent_name}'")
-            else:
-                logger.warning(f"TASK {i+1}: '{task_name}' HAS NO AGENT ASSIGNMENT")
-                
-            # Look up the agent's database ID using the name
-            agent_id = None
-            best_match = False
+            task, round_robin_idx = await self.create_task(task_data, agent_name_to_id, round_robin_idx, index=i)
+            created_tasks.append(task)
             
-            # Try exact match first
-            if agent_name and agent_name in agent_name_to_id:
-                agent_id = agent_name_to_id[agent_name]
-                logger.info(f"Found exact agent ID match for '{agent_name}': {agent_id}")
-            # Try case-insensitive match if exact match fails
-            elif agent_name:
-                # Try to find a case-insensitive match
+        return created_tasks
+        
+    async def create_task(self, task_data, agent_name_to_id, round_robin_idx: int = 0, index: int = 0) -> Tuple[Task, int]:
+        """
+        Create a single task in the database, resolving its agent by name.
+        
+        Tasks without a resolvable agent are assigned round-robin; callers
+        creating several tasks pass the returned index to the next call.
+        
+        Args:
+            task_data: Task data dictionary
+            agent_name_to_id: Dictionary mapping agent names to IDs
+            round_robin_idx: Next agent index for round-robin assignment
+            index: Position of the task in the crew, used for default names
+        
+        Returns:
+            Tuple of (created Task model, next round-robin index)
+        """
+        agent_ids = list(agent_name_to_id.values())
+        task_name = self._safe_get_attr(task_data, 'name', f'Unknown Task {index}')
+        logger.info(f"Processing task {index+1}: '{task_name}'")
+        
+        # Check for agent name in either field
+        agent_name = self._safe_get_attr(task_data, 'agent')
+        
+        if not agent_name:
+            agent_name = self._safe_get_attr(task_data, 'assigned_agent')
+        
+        # Log the agent assignment from LLM
+        if agent_name:
+            logger.info(f"LLM assigned task '{task_name}' to agent '{agent_name}'")
+        else:
+            logger.warning(f"TASK {index+1}: '{task_name}' HAS NO AGENT ASSIGNMENT")
+        
+        # Look up the agent's database ID using the name
+        agent_id = None
+        best_match = False
+        
+        # Try exact match first
+        if agent_name and agent_name in agent_name_to_id:
+            agent_id = agent_name_to_id[agent_name]
+            logger.info(f"Found exact agent ID match for '{agent_name}': {agent_id}")
+        # Try case-insensitive match if exact match fails
+        elif agent_name:
+            # Try to find a case-insensitive match
+            for known_agent_name in agent_name_to_id:
+                if agent_name.lower() == known_agent_name.lower():
+                    agent_id = agent_name_to_id[known_agent_name]
+                    logger.info(f"Found case-insensitive match for '{agent_name}' -> '{known_agent_name}': {agent_id}")
+                    break
+        
+            # If still no match, try partial match using a scoring system
+            if not agent_id:
+                best_match = True
+                best_match_score = 0
+                best_match_name = None
+        
                 for known_agent_name in agent_name_to_id:
-                    if agent_name.lower() == known_agent_name.lower():
-                        agent_id = agent_name_to_id[known_agent_name]
-                        logger.info(f"Found case-insensitive match for '{agent_name}' -> '{known_agent_name}': {agent_id}")
-                        break
-                
-                # If still no match, try partial match using a scoring system
-                if not agent_id:
-                    best_match = True
-                    best_match_score = 0
-                    best_match_name = None
-                    
-                    for known_agent_name in agent_name_to_id:
-                        # Calculate similarity score 
-                        score = 0
-                        
-                        # Check if one is substring of the other (higher weight for this)
-                        if agent_name.lower() in known_agent_name.lower():
-                            score += 5
-                        if known_agent_name.lower() in agent_name.lower():
-                            score += 4
-                            
-                        # Check for common words
-                        agent_words = agent_name.lower().split()
-                        known_words = known_agent_name.lower().split()
-                        common_words = set(agent_words).intersection(set(known_words))
-                        score += len(common_words) * 3
-                        
-                        # Update best match if we found a better score
-                        if score > best_match_score:
-                            best_match_score = score
-                            best_match_name = known_agent_name
-                    
-                    # Only consider it a match if the score is above threshold
-                    if best_match_score > 2 and best_match_name:
-                        agent_id = agent_name_to_id[best_match_name]
-                        logger.info(f"Found best match for '{agent_name}' -> '{best_match_name}' with score {best_match_score}: {agent_id}")
-                    else:
-                        best_match = False
-                        logger.warning(f"No good match found for '{agent_name}'. Using round-robin assignment.")
-                
-                # If still no match, log the issue
-                if not agent_id:
-                    logger.warning(f"Could not find agent ID for '{agent_name}'. Agent name not in database.")
-                    logger.info(f"Available agents: {list(agent_name_to_id.keys())}")
-            
-            # If no agent assigned or found, use round-robin assignment
-            if not agent_id and agent_ids:
-                if round_robin_idx >= len(agent_ids):
-                    round_robin_idx = 0
-                agent_id = agent_ids[round_robin_idx]
-                round_robin_idx += 1
-                logger.info(f"Assigned task '{task_name}' to agent ID {agent_id} using round-robin")
-            elif not agent_id:
-                logger.warning(f"No agent assigned to task '{task_name}' and no agents available")
-            
-            # Create the task with the correct agent_id
-            task = Task(
-                id=str(uuid.uuid4()),
-                name=task_name,
-                description=self._safe_get_attr(task_data, 'description'),
-                expected_output=self._safe_get_attr(task_data, 'expected_output'),
-                tools=self._safe_get_attr(task_data, 'tools', []),
-                agent_id=agent_id,  # Set the agent_id based on the lookup or round-robin
-                async_execution=self._safe_get_attr(task_data, 'async_execution', False),
-                output=self._safe_get_attr(task_data, 'output'),
-                human_input=self._safe_get_attr(task_data, 'human_input', False),
-                markdown=self._safe_get_attr(task_data, 'markdown', False)
-            )
-            
-            # Store the task in the database
-            await self.create(task)
-            
-            # Log the task creation result
-            if agent_id:
-                if best_match:
-                    logger.info(f"Task created: '{task.name}' (ID: {task.id}) assigned to agent ID: {agent_id} using best match")
+                    # Calculate similarity score 
+                    score = 0
+        
+                    # Check if one is substring of the other (higher weight for this)
+                    if agent_name.lower() in known_agent_name.lower():
+                        score += 5
+                    if known_agent_name.lower() in agent_name.lower():
+                        score += 4
+        
+                    # Check for common words
+                    agent_words = agent_name.lower().split()
+                    known_words = known_agent_name.lower().split()
+                    common_words = set(agent_words).intersection(set(known_words))
+                    score += len(common_words) * 3
+        
+                    # Update best match if we found a better score
+                    if score > best_match_score:
+                        best_match_score = score
+                        best_match_name = known_agent_name
+        
+                # Only consider it a match if the score is above threshold
+                if best_match_score > 2 and best_match_name:
+                    agent_id = agent_name_to_id[best_match_name]
+                    logger.info(f"Found best match for '{agent_name}' -> '{best_match_name}' with score {best_match_score}: {agent_id}")
                 else:
-                    logger.info(f"Task created: '{task.name}' (ID: {task.id}) assigned to agent ID: {agent_id}")
+                    best_match = False
+                    logger.warning(f"No good match found for '{agent_name}'. Using round-robin assignment.")
+        
+            # If still no match, log the issue
+            if not agent_id:
+                logger.warning(f"Could not find agent ID for '{agent_name}'. Agent name not in database.")
+                logger.info(f"Available agents: {list(agent_name_to_id.keys())}")
+        
+        # If no agent assigned or found, use round-robin assignment
+        if not agent_id and agent_ids:
+            if round_robin_idx >= len(agent_ids):
+                round_robin_idx = 0
+            agent_id = agent_ids[round_robin_idx]
+            round_robin_idx += 1
+            logger.info(f"Assigned task '{task_name}' to agent ID {agent_id} using round-robin")
+        elif not agent_id:
+            logger.warning(f"No agent assigned to task '{task_name}' and no agents available")
+        
+        # Create the task with the correct agent_id
+        task = Task(
+            id=str(uuid.uuid4()),
+            name=task_name,
+            description=self._safe_get_attr(task_data, 'description'),
+            expected_output=self._safe_get_attr(task_data, 'expected_output'),
+            tools=self._safe_get_attr(task_data, 'tools', []),
+            agent_id=agent_id,  # Set the agent_id based on the lookup or round-robin
+            async_execution=self._safe_get_attr(task_data, 'async_execution', False),
+            output=self._safe_get_attr(task_data, 'output'),
+            human_input=self._safe_get_attr(task_data, 'human_input', False),
+            markdown=self._safe_get_attr(task_data, 'markdown', False)
+        )
+        
+        # Store the task in the database
+        await self.create(task)
+        
+        # Log the task creation result
+        if agent_id:
+            if best_match:
+                logger.info(f"Task created: '{task.name}' (ID: {task.id}) assigned to agent ID: {agent_id} using best match")
             else:
-                logger.warning(f"Task created: '{task.name}' (ID: {task.id}) with NO agent assignment")
-                
-            created_tasks.append(task)
-            
-        return created_tasks
+                logger.info(f"Task created: '{task.name}' (ID: {task.id}) assigned to agent ID: {agent_id}")
+        else:
+            logger.warning(f"Task created: '{task.name}' (ID: {task.id}) with NO agent assignment")
+        return task, round_robin_idx
+
+    async def link_task_dependencies(self, created_tasks, tasks_data) -> None:
+        """
+        Resolve the context references of created tasks into task IDs.
+        
+        Args:
+            created_tasks: Created Task models
+            tasks_data: Task data dictionaries with '_context_refs'
+        """
+        await self._create_task_dependencies(created_tasks, tasks_data)
+    
+    async def delete_crew_entities(self, agent_ids: List[str], task_ids: List[str]) -> None:
+        """
+        Delete agents and tasks created for a crew whose generation failed.
         
+        Args:
+            agent_ids: IDs of the agents to delete
+            task_ids: IDs of the tasks to delete
+        """
+        if not agent_ids and not task_ids:
+            return
+        async with async_session_factory() as session:
+            try:
+                if task_ids:
+                    await session.execute(delete(Task).where(Task.id.in_(task_ids)))
+                if agent_ids:
+                    await session.execute(delete(Agent).where(Agent.id.in_(agent_ids)))
+                await session.commit()
+                logger.info(f"Deleted {len(agent_ids)} agents and {len(task_ids)} tasks of a failed crew generation")
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error deleting crew entities: {e}")
+                raise
+
     async def _create_task_dependencies(self, created_tasks, tasks_data):
         """
         Create task dependencies in the database using the _context_refs field.
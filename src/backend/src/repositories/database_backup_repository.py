@@ -1,11 +1,13 @@
 """
 Database Backup Repository for handling backup operations with Databricks volumes.
 """
+import asyncio
 import os
 import json
+import shutil
 import sqlite3
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
@@ -15,6 +17,43 @@ from src.repositories.databricks_volume_repository import DatabricksVolumeReposi
 
 logger = LoggerManager.get_instance().system
 
+# Receives {"table", "table_rows", "total_rows", "tables_done", "table_count"}
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class _BackupProgress:
+    """Row and table counters of a running backup, reported to a callback."""
+    
+    def __init__(self, table_count: int, callback: Optional[ProgressCallback]):
+        self.table_count = table_count
+        self.tables_done = 0
+        self.total_rows = 0
+        self._table_rows: Dict[str, int] = {}
+        self._callback = callback
+    
+    def rows_written(self, table: str, count: int) -> None:
+        self._table_rows[table] = self._table_rows.get(table, 0) + count
+        self.total_rows += count
+        self._report(table)
+    
+    def table_done(self, table: str) -> None:
+        self.tables_done += 1
+        self._report(table)
+    
+    def _report(self, table: str) -> None:
+        if self._callback is None:
+            return
+        try:
+            self._callback({
+                "table": table,
+                "table_rows": self._table_rows.get(table, 0),
+                "total_rows": self.total_rows,
+                "tables_done": self.tables_done,
+                "table_count": self.table_count,
+            })
+        except Exception as e:
+            logger.warning(f"Backup progress callback failed: {e}")
+
 
 class DatabaseBackupRepository:
     """Repository for database backup operations with Databricks Unity Catalog volumes."""
@@ -118,11 +157,17 @@ class DatabaseBackupRepository:
         schema: str,
         volume_name: str,
         backup_filename: str,
-        export_format: str = "sql"
+        export_format: str = "sql",
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Create a backup of PostgreSQL database and upload to Databricks volume.
         
+        Table data is streamed in chunks of DB_BACKUP_CHUNK_SIZE rows and
+        written to a temporary file, so memory use does not grow with the
+        size of the database.
+        
         Args:
             session: Database session
             catalog: Unity Catalog name
@@ -130,118 +175,84 @@ class DatabaseBackupRepository:
             volume_name: Volume name
             backup_filename: Name for the backup file
             export_format: Export format ('sql' or 'sqlite')
+            session_factory: Optional factory of extra sessions, used to export
+                up to DB_BACKUP_PARALLEL_TABLES tables concurrently
+            progress_callback: Optional callable receiving progress dictionaries
             
         Returns:
             Backup creation result
         """
-        try:
-            if export_format == "sqlite":
-                # Create a SQLite database from PostgreSQL data
-                return await self._create_postgres_to_sqlite_backup(
-                    session, catalog, schema, volume_name, backup_filename
-                )
-            # Build SQL dump content
-            sql_content = []
-            
-            # Add header
-            sql_content.append("-- PostgreSQL database backup")
-            sql_content.append(f"-- Generated by Kasal on {datetime.now().isoformat()}")
-            sql_content.append("-- ")
-            sql_content.append("")
-            sql_content.append("SET statement_timeout = 0;")
-            sql_content.append("SET lock_timeout = 0;")
-            sql_content.append("SET client_encoding = 'UTF8';")
-            sql_content.append("SET standard_conforming_strings = on;")
-            sql_content.append("SET check_function_bodies = false;")
-            sql_content.append("SET client_min_messages = warning;")
-            sql_content.append("")
-            
-            # Get all tables
-            result = await session.execute(
-                text("SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename")
+        if export_format == "sqlite":
+            # Create a SQLite database from PostgreSQL data
+            return await self._create_postgres_to_sqlite_backup(
+                session, catalog, schema, volume_name, backup_filename,
+                session_factory=session_factory,
+                progress_callback=progress_callback
             )
-            tables = [row[0] for row in result.fetchall()]
-            
-            total_rows = 0
-            
-            for table in tables:
-                sql_content.append(f"-- Table: {table}")
-                sql_content.append("")
-                
-                # Get table columns info for proper INSERT statements
-                col_result = await session.execute(
-                    text(f"""
-                        SELECT column_name, data_type 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = '{table}'
-                        ORDER BY ordinal_position
-                    """)
-                )
-                columns = [(row[0], row[1]) for row in col_result.fetchall()]
-                column_names = [col[0] for col in columns]
-                
-                # Disable triggers and constraints for this table
-                sql_content.append(f"ALTER TABLE {table} DISABLE TRIGGER ALL;")
-                sql_content.append(f"DELETE FROM {table};")
-                sql_content.append("")
-                
-                # Get table data
-                result = await session.execute(
-                    text(f"SELECT * FROM {table}")
-                )
-                rows = result.fetchall()
-                
-                if rows:
-                    # Generate INSERT statements
-                    for row in rows:
-                        values = []
-                        for i, value in enumerate(row):
-                            if value is None:
-                                values.append("NULL")
-                            elif isinstance(value, (int, float)):
-                                values.append(str(value))
-                            elif isinstance(value, bool):
-                                values.append("TRUE" if value else "FALSE")
-                            elif isinstance(value, datetime):
-                                values.append(f"'{value.isoformat()}'")
-                            elif isinstance(value, dict):
-                                # Handle JSON/JSONB columns
-                                import json
-                                json_str = json.dumps(value).replace("'", "''")
-                                values.append(f"'{json_str}'::jsonb")
-                            else:
-                                # Escape single quotes in strings
-                                escaped_value = str(value).replace("'", "''")
-                                values.append(f"'{escaped_value}'")
-                        
-                        insert_stmt = f"INSERT INTO {table} ({', '.join(column_names)}) VALUES ({', '.join(values)});"
-                        sql_content.append(insert_stmt)
+        
+        import tempfile
+        part_paths: Dict[str, str] = {}
+        tmp_path = None
+        try:
+            tables = await self._list_tables(session)
+            progress = _BackupProgress(len(tables), progress_callback)
+            
+            async def export_table(table_session: AsyncSession, table: str) -> None:
+                columns = await self._get_table_columns(table_session, table)
+                column_names = ", ".join(col[0] for col in columns)
+                with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', suffix='.sql', delete=False) as part:
+                    part_paths[table] = part.name
+                    part.write(f"-- Table: {table}\n\n")
+                    # Disable triggers and constraints for this table
+                    part.write(f"ALTER TABLE {table} DISABLE TRIGGER ALL;\n")
+                    part.write(f"DELETE FROM {table};\n\n")
                     
-                    total_rows += len(rows)
-                    logger.info(f"Backed up {len(rows)} rows from table {table}")
-                
-                # Re-enable triggers
-                sql_content.append("")
-                sql_content.append(f"ALTER TABLE {table} ENABLE TRIGGER ALL;")
-                sql_content.append("")
-            
-            # Add footer
-            sql_content.append("")
-            sql_content.append("-- End of backup")
-            sql_content.append(f"-- Total tables: {len(tables)}")
-            sql_content.append(f"-- Total rows: {total_rows}")
+                    table_rows = 0
+                    async for rows in self._stream_table_rows(table_session, table):
+                        part.writelines(
+                            f"INSERT INTO {table} ({column_names}) VALUES ({', '.join(self._to_sql_literal(v) for v in row)});\n"
+                            for row in rows
+                        )
+                        table_rows += len(rows)
+                        progress.rows_written(table, len(rows))
+                    
+                    # Re-enable triggers
+                    part.write(f"\nALTER TABLE {table} ENABLE TRIGGER ALL;\n\n")
+                if table_rows:
+                    logger.info(f"Backed up {table_rows} rows from table {table}")
+                progress.table_done(table)
+            
+            await self._for_each_table(session, session_factory, tables, export_table)
+            
+            # Assemble the dump from the per-table parts, in table order
+            with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', suffix='.sql', delete=False) as dump:
+                tmp_path = dump.name
+                dump.write("-- PostgreSQL database backup\n")
+                dump.write(f"-- Generated by Kasal on {datetime.now().isoformat()}\n")
+                dump.write("-- \n\n")
+                dump.write("SET statement_timeout = 0;\n")
+                dump.write("SET lock_timeout = 0;\n")
+                dump.write("SET client_encoding = 'UTF8';\n")
+                dump.write("SET standard_conforming_strings = on;\n")
+                dump.write("SET check_function_bodies = false;\n")
+                dump.write("SET client_min_messages = warning;\n\n")
+                for table in tables:
+                    with open(part_paths[table], 'r', encoding='utf-8') as part:
+                        shutil.copyfileobj(part, dump)
+                # Add footer
+                dump.write("\n-- End of backup\n")
+                dump.write(f"-- Total tables: {len(tables)}\n")
+                dump.write(f"-- Total rows: {progress.total_rows}")
             
-            # Convert to bytes
-            sql_bytes = "\n".join(sql_content).encode('utf-8')
+            backup_size = os.path.getsize(tmp_path)
             
             # Upload to Databricks volume using API
-            upload_result = await self.volume_repo.upload_file_to_volume(
+            upload_result = await self.volume_repo.upload_local_file_to_volume(
                 catalog=catalog,
                 schema=schema,
                 volume_name=volume_name,
                 file_name=backup_filename,
-                file_content=sql_bytes
+                local_path=tmp_path
             )
             
             if not upload_result["success"]:
@@ -252,10 +263,10 @@ class DatabaseBackupRepository:
             return {
                 "success": True,
                 "backup_path": upload_result["path"],
-                "backup_size": len(sql_bytes),
+                "backup_size": backup_size,
                 "database_type": "postgres",
                 "table_count": len(tables),
-                "total_rows": total_rows,
+                "total_rows": progress.total_rows,
                 "catalog": catalog,
                 "schema": schema,
                 "volume": volume_name,
@@ -268,6 +279,10 @@ class DatabaseBackupRepository:
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            for path in list(part_paths.values()) + [tmp_path]:
+                if path and os.path.exists(path):
+                    os.unlink(path)
     
     async def _create_postgres_to_sqlite_backup(
         self,
@@ -275,130 +290,89 @@ class DatabaseBackupRepository:
         catalog: str,
         schema: str,
         volume_name: str,
-        backup_filename: str
+        backup_filename: str,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Create a SQLite database from PostgreSQL data.
         
+        Rows are streamed from PostgreSQL in chunks and bulk inserted with
+        executemany inside a single SQLite transaction. Journaling and syncing
+        are turned off while the file is built: it is a throwaway temporary
+        file until the upload succeeds.
+        
         Args:
             session: PostgreSQL database session
             catalog: Unity Catalog name
             schema: Schema name
             volume_name: Volume name
             backup_filename: Name for the backup file
+            session_factory: Optional factory of extra sessions for parallel export
+            progress_callback: Optional callable receiving progress dictionaries
             
         Returns:
             Backup creation result
         """
         import tempfile
+        tmp_path = None
+        conn = None
         try:
             # Create a temporary SQLite database
             with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
                 tmp_path = tmp_file.name
             
-            # Connect to SQLite database
-            conn = sqlite3.connect(tmp_path)
-            cursor = conn.cursor()
-            
-            # Get all tables from PostgreSQL
-            result = await session.execute(
-                text("SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename")
-            )
-            pg_tables = [row[0] for row in result.fetchall()]
+            # Writes run in worker threads, one at a time (guarded by write_lock)
+            conn = sqlite3.connect(tmp_path, check_same_thread=False)
+            conn.isolation_level = None
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("BEGIN")
+            write_lock = asyncio.Lock()
+            
+            # Get all tables from PostgreSQL and create them in SQLite
+            pg_tables = await self._list_tables(session)
+            table_columns: Dict[str, List[Tuple[str, str, str]]] = {}
+            for table_name in pg_tables:
+                columns = await self._get_table_columns(session, table_name, with_nullable=True)
+                table_columns[table_name] = columns
+                conn.execute(self._sqlite_create_table_sql(table_name, columns))
             
-            total_rows = 0
+            progress = _BackupProgress(len(pg_tables), progress_callback)
             
-            for table_name in pg_tables:
-                # Get table columns info
-                col_result = await session.execute(
-                    text(f"""
-                        SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = '{table_name}'
-                        ORDER BY ordinal_position
-                    """)
-                )
-                columns = [(row[0], row[1], row[2]) for row in col_result.fetchall()]
-                
-                # Create SQLite table
-                create_table_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ("
-                col_definitions = []
-                
-                for col_name, col_type, is_nullable in columns:
-                    # Map PostgreSQL types to SQLite types
-                    sqlite_type = "TEXT"  # Default to TEXT
-                    if 'int' in col_type.lower() or 'serial' in col_type.lower():
-                        sqlite_type = "INTEGER"
-                    elif 'numeric' in col_type.lower() or 'decimal' in col_type.lower() or 'float' in col_type.lower() or 'double' in col_type.lower():
-                        sqlite_type = "REAL"
-                    elif 'bool' in col_type.lower():
-                        sqlite_type = "INTEGER"  # SQLite uses 0/1 for boolean
-                    elif 'timestamp' in col_type.lower() or 'date' in col_type.lower() or 'time' in col_type.lower():
-                        sqlite_type = "TEXT"  # Store dates as ISO format text
-                    elif 'json' in col_type.lower():
-                        sqlite_type = "TEXT"  # Store JSON as text
-                    
-                    null_constraint = "" if is_nullable == 'YES' else " NOT NULL"
-                    
-                    # Handle primary key
-                    if col_name == 'id' and 'int' in col_type.lower():
-                        col_definitions.append(f"{col_name} {sqlite_type} PRIMARY KEY{null_constraint}")
-                    else:
-                        col_definitions.append(f"{col_name} {sqlite_type}{null_constraint}")
-                
-                create_table_sql += ", ".join(col_definitions) + ")"
-                cursor.execute(create_table_sql)
+            async def export_table(table_session: AsyncSession, table_name: str) -> None:
+                col_names = [col[0] for col in table_columns[table_name]]
+                placeholders = ", ".join(["?" for _ in col_names])
+                insert_sql = f"INSERT INTO {table_name} ({', '.join(col_names)}) VALUES ({placeholders})"
                 
-                # Get data from PostgreSQL
-                result = await session.execute(text(f"SELECT * FROM {table_name}"))
-                rows = result.fetchall()
+                table_rows = 0
+                async for rows in self._stream_table_rows(table_session, table_name):
+                    values = [[self._to_sqlite_value(value) for value in row] for row in rows]
+                    async with write_lock:
+                        await asyncio.to_thread(conn.executemany, insert_sql, values)
+                    table_rows += len(values)
+                    progress.rows_written(table_name, len(values))
                 
-                if rows:
-                    # Prepare column names for insertion
-                    col_names = [col[0] for col in columns]
-                    placeholders = ", ".join(["?" for _ in col_names])
-                    insert_sql = f"INSERT INTO {table_name} ({', '.join(col_names)}) VALUES ({placeholders})"
-                    
-                    # Convert and insert rows
-                    for row in rows:
-                        row_values = []
-                        for i, value in enumerate(row):
-                            if value is None:
-                                row_values.append(None)
-                            elif isinstance(value, bool):
-                                row_values.append(1 if value else 0)
-                            elif isinstance(value, (datetime, date)):
-                                row_values.append(value.isoformat())
-                            elif isinstance(value, (dict, list)):
-                                # Convert dict or list to JSON string
-                                row_values.append(json.dumps(value))
-                            else:
-                                row_values.append(str(value))  # Convert everything else to string
-                        
-                        cursor.execute(insert_sql, row_values)
-                    
-                    total_rows += len(rows)
-                    logger.info(f"Converted {len(rows)} rows from PostgreSQL table {table_name} to SQLite")
+                if table_rows:
+                    logger.info(f"Converted {table_rows} rows from PostgreSQL table {table_name} to SQLite")
+                progress.table_done(table_name)
+            
+            await self._for_each_table(session, session_factory, pg_tables, export_table)
             
             # Commit and close SQLite connection
-            conn.commit()
+            conn.execute("COMMIT")
             conn.close()
+            conn = None
             
-            # Read the SQLite database file
-            with open(tmp_path, 'rb') as f:
-                db_content = f.read()
-            
-            # Clean up temp file
-            os.unlink(tmp_path)
+            backup_size = os.path.getsize(tmp_path)
             
             # Upload to Databricks volume
-            upload_result = await self.volume_repo.upload_file_to_volume(
+            upload_result = await self.volume_repo.upload_local_file_to_volume(
                 catalog=catalog,
                 schema=schema,
                 volume_name=volume_name,
                 file_name=backup_filename,
-                file_content=db_content
+                local_path=tmp_path
             )
             
             if not upload_result["success"]:
@@ -409,11 +383,11 @@ class DatabaseBackupRepository:
             return {
                 "success": True,
                 "backup_path": upload_result["path"],
-                "backup_size": len(db_content),
+                "backup_size": backup_size,
                 "database_type": "sqlite",
                 "source_type": "postgres",
                 "table_count": len(pg_tables),
-                "total_rows": total_rows,
+                "total_rows": progress.total_rows,
                 "catalog": catalog,
                 "schema": schema,
                 "volume": volume_name,
@@ -422,13 +396,176 @@ class DatabaseBackupRepository:
             
         except Exception as e:
             logger.error(f"Error creating SQLite backup from PostgreSQL: {e}")
-            # Clean up temp file if it exists
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            if conn is not None:
+                conn.close()
+            # Clean up temp file
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    async def _list_tables(self, session: AsyncSession) -> List[str]:
+        """
+        List the tables of the public schema.
+        
+        Partitions are left out: their rows are read and restored through
+        their partitioned parent table, so listing them would export them twice.
+        """
+        result = await session.execute(text("""
+            SELECT c.relname
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public'
+              AND c.relkind IN ('r', 'p')
+              AND NOT c.relispartition
+            ORDER BY c.relname
+        """))
+        return [row[0] for row in result.fetchall()]
+    
+    async def _get_table_columns(self, session: AsyncSession, table_name: str, with_nullable: bool = False) -> List[Tuple]:
+        """
+        Get the columns of a table in ordinal order.
+        
+        Args:
+            session: Database session
+            table_name: Table to describe
+            with_nullable: Also return the is_nullable flag of each column
+            
+        Returns:
+            (column_name, data_type[, is_nullable]) tuples
+        """
+        nullable = ", is_nullable" if with_nullable else ""
+        result = await session.execute(
+            text(f"""
+                SELECT column_name, data_type{nullable}
+                FROM information_schema.columns 
+                WHERE table_schema = 'public' 
+                AND table_name = :table_name
+                ORDER BY ordinal_position
+            """),
+            {"table_name": table_name}
+        )
+        return [tuple(row) for row in result.fetchall()]
+    
+    async def _stream_table_rows(self, session: AsyncSession, table_name: str) -> AsyncIterator[List[Any]]:
+        """
+        Stream the rows of a table in chunks of DB_BACKUP_CHUNK_SIZE.
+        
+        Uses a server-side cursor, so only one chunk is held in memory.
+        
+        Args:
+            session: Database session
+            table_name: Table to read
+            
+        Yields:
+            Lists of at most DB_BACKUP_CHUNK_SIZE rows
+        """
+        chunk_size = max(1, settings.DB_BACKUP_CHUNK_SIZE)
+        result = await session.stream(
+            text(f"SELECT * FROM {table_name}").execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions(chunk_size):
+            yield rows
+    
+    async def _for_each_table(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[Callable[[], AsyncSession]],
+        tables: List[str],
+        export_table: Callable[[AsyncSession, str], Awaitable[None]]
+    ) -> None:
+        """
+        Run a table export for every table.
+        
+        Tables are independent, so with a session factory up to
+        DB_BACKUP_PARALLEL_TABLES of them are exported concurrently, each on its
+        own session; otherwise they are exported one by one on ``session``.
+        
+        Args:
+            session: Session used for sequential export
+            session_factory: Optional factory of sessions for parallel export
+            tables: Tables to export
+            export_table: Coroutine function taking (session, table name)
+        """
+        parallelism = max(1, settings.DB_BACKUP_PARALLEL_TABLES)
+        if session_factory is None or parallelism == 1 or len(tables) < 2:
+            for table in tables:
+                await export_table(session, table)
+            return
+        
+        semaphore = asyncio.Semaphore(parallelism)
+        
+        async def run(table: str) -> None:
+            async with semaphore:
+                async with session_factory() as table_session:
+                    await export_table(table_session, table)
+        
+        await asyncio.gather(*(run(table) for table in tables))
+    
+    @staticmethod
+    def _sqlite_create_table_sql(table_name: str, columns: List[Tuple[str, str, str]]) -> str:
+        """Build the SQLite CREATE TABLE statement for a PostgreSQL table."""
+        col_definitions = []
+        
+        for col_name, col_type, is_nullable in columns:
+            # Map PostgreSQL types to SQLite types
+            sqlite_type = "TEXT"  # Default to TEXT
+            if 'int' in col_type.lower() or 'serial' in col_type.lower():
+                sqlite_type = "INTEGER"
+            elif 'numeric' in col_type.lower() or 'decimal' in col_type.lower() or 'float' in col_type.lower() or 'double' in col_type.lower():
+                sqlite_type = "REAL"
+            elif 'bool' in col_type.lower():
+                sqlite_type = "INTEGER"  # SQLite uses 0/1 for boolean
+            elif 'timestamp' in col_type.lower() or 'date' in col_type.lower() or 'time' in col_type.lower():
+                sqlite_type = "TEXT"  # Store dates as ISO format text
+            elif 'json' in col_type.lower():
+                sqlite_type = "TEXT"  # Store JSON as text
+            
+            null_constraint = "" if is_nullable == 'YES' else " NOT NULL"
+            
+            # Handle primary key
+            if col_name == 'id' and 'int' in col_type.lower():
+                col_definitions.append(f"{col_name} {sqlite_type} PRIMARY KEY{null_constraint}")
+            else:
+                col_definitions.append(f"{col_name} {sqlite_type}{null_constraint}")
+        
+        return f"CREATE TABLE IF NOT EXISTS {table_name} (" + ", ".join(col_definitions) + ")"
+    
+    @staticmethod
+    def _to_sqlite_value(value: Any) -> Any:
+        """Convert a PostgreSQL value for insertion into SQLite."""
+        if value is None:
+            return None
+        elif isinstance(value, bool):
+            return 1 if value else 0
+        elif isinstance(value, (datetime, date)):
+            return value.isoformat()
+        elif isinstance(value, (dict, list)):
+            # Convert dict or list to JSON string
+            return json.dumps(value)
+        return str(value)  # Convert everything else to string
+    
+    @staticmethod
+    def _to_sql_literal(value: Any) -> str:
+        """Render a PostgreSQL value as a SQL literal."""
+        if value is None:
+            return "NULL"
+        elif isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, datetime):
+            return f"'{value.isoformat()}'"
+        elif isinstance(value, dict):
+            # Handle JSON/JSONB columns
+            json_str = json.dumps(value).replace("'", "''")
+            return f"'{json_str}'::jsonb"
+        # Escape single quotes in strings
+        escaped_value = str(value).replace("'", "''")
+        return f"'{escaped_value}'"
     
     async def restore_sqlite_backup(
         self,
@@ -541,6 +678,11 @@ class DatabaseBackupRepository:
         """
         Restore a PostgreSQL database from a Databricks volume backup.
         
+        The backup is downloaded to a temporary file and SQL dumps are read
+        from it line by line; consecutive row INSERTs into a table are sent
+        as multi-row INSERTs of up to DB_BACKUP_CHUNK_SIZE rows, so memory use
+        does not grow with the size of the backup.
+        
         Args:
             session: Database session
             catalog: Unity Catalog name
@@ -551,71 +693,43 @@ class DatabaseBackupRepository:
         Returns:
             Restore operation result
         """
+        import tempfile
+        tmp_path = None
         try:
+            with tempfile.NamedTemporaryFile(suffix=os.path.splitext(backup_filename)[1], delete=False) as tmp_file:
+                tmp_path = tmp_file.name
+            
             # Download backup from Databricks volume
-            download_result = await self.volume_repo.download_file_from_volume(
+            download_result = await self.volume_repo.download_file_from_volume_to_local(
                 catalog=catalog,
                 schema=schema,
                 volume_name=volume_name,
-                file_name=backup_filename
+                file_name=backup_filename,
+                local_path=tmp_path
             )
             
             if not download_result["success"]:
                 return download_result
             
-            backup_content = download_result["content"]
-            
             # Check if it's SQL or JSON format
             if backup_filename.endswith('.sql'):
-                # Execute SQL statements
-                sql_content = backup_content.decode('utf-8')
-                
-                # Split SQL statements and execute them
-                # We need to be careful with statements that contain semicolons in strings
-                statements = []
-                current_statement = []
-                in_string = False
-                escape_next = False
-                
-                for line in sql_content.split('\n'):
-                    # Skip comments and empty lines
-                    if line.strip().startswith('--') or not line.strip():
-                        continue
-                    
-                    current_statement.append(line)
-                    
-                    # Check if this line ends a statement (ends with ; and not in a string)
-                    for char in line:
-                        if escape_next:
-                            escape_next = False
-                            continue
-                        if char == '\\':
-                            escape_next = True
-                        elif char == "'":
-                            in_string = not in_string
-                    
-                    if line.rstrip().endswith(';') and not in_string:
-                        statements.append('\n'.join(current_statement))
-                        current_statement = []
-                
-                # Execute statements
+                # Execute statements as they are read off the dump
                 restored_tables = set()
                 total_rows = 0
+                chunk_size = max(1, settings.DB_BACKUP_CHUNK_SIZE)
                 
-                for stmt in statements:
-                    if stmt.strip():
+                with open(tmp_path, 'r', encoding='utf-8') as dump:
+                    statements = self._batch_insert_statements(self._iter_sql_statements(dump), chunk_size)
+                    for stmt, table, rows in statements:
                         try:
-                            # Track which tables we're working with
-                            if 'INSERT INTO' in stmt.upper():
-                                # Extract table name
-                                table_match = stmt.upper().split('INSERT INTO')[1].split('(')[0].strip()
-                                restored_tables.add(table_match.lower())
-                                total_rows += 1
-                            
                             await session.execute(text(stmt))
                         except Exception as stmt_error:
                             logger.warning(f"Error executing statement: {stmt_error}")
                             # Continue with other statements
+                            continue
+                        if table:
+                            restored_tables.add(table)
+                            total_rows += rows
                 
                 await session.commit()
                 
@@ -629,7 +743,8 @@ class DatabaseBackupRepository:
                 
             else:
                 # Handle JSON format (legacy)
-                backup_data = json.loads(backup_content)
+                with open(tmp_path, 'r', encoding='utf-8') as backup_file:
+                    backup_data = json.load(backup_file)
                 
                 if backup_data.get("database_type") != "postgres":
                     return {
@@ -643,12 +758,14 @@ class DatabaseBackupRepository:
                     # Clear table
                     await session.execute(text(f"TRUNCATE TABLE {table_name} CASCADE"))
                     
-                    # Insert rows
-                    for row_data in rows:
-                        columns = ', '.join(row_data.keys())
-                        placeholders = ', '.join([f":{k}" for k in row_data.keys()])
-                        insert_query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-                        await session.execute(text(insert_query), row_data)
+                    # Insert rows in chunks, one executemany per chunk
+                    chunk_size = max(1, settings.DB_BACKUP_CHUNK_SIZE)
+                    for start in range(0, len(rows), chunk_size):
+                        for keys, batch in self._group_rows_by_columns(rows[start:start + chunk_size]).items():
+                            columns = ', '.join(keys)
+                            placeholders = ', '.join([f":{k}" for k in keys])
+                            insert_query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+                            await session.execute(text(insert_query), batch)
                     
                     restored_tables.append(f"{table_name} ({len(rows)} rows)")
                     logger.info(f"Restored {len(rows)} rows to table {table_name}")
@@ -669,6 +786,94 @@ class DatabaseBackupRepository:
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    @staticmethod
+    def _iter_sql_statements(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Split a SQL dump into statements, lazily.
+        
+        Comments and empty lines are skipped; semicolons inside string
+        literals do not end a statement.
+        
+        Args:
+            lines: Lines of the SQL dump, such as an open file
+            
+        Yields:
+            Statements, in order
+        """
+        current_statement = []
+        in_string = False
+        escape_next = False
+        
+        for line in lines:
+            line = line.rstrip('\n')
+            # Skip comments and empty lines
+            if line.strip().startswith('--') or not line.strip():
+                continue
+            
+            current_statement.append(line)
+            
+            # Check if this line ends a statement (ends with ; and not in a string)
+            for char in line:
+                if escape_next:
+                    escape_next = False
+                    continue
+                if char == '\\':
+                    escape_next = True
+                elif char == "'":
+                    in_string = not in_string
+            
+            if line.rstrip().endswith(';') and not in_string:
+                statement = '\n'.join(current_statement)
+                current_statement = []
+                if statement.strip():
+                    yield statement
+    
+    @staticmethod
+    def _batch_insert_statements(statements: Iterable[str], batch_size: int) -> Iterator[Tuple[str, Optional[str], int]]:
+        """
+        Merge runs of single-row INSERTs into one table into multi-row INSERTs.
+        
+        Args:
+            statements: SQL statements, in order
+            batch_size: Maximum number of rows per INSERT
+            
+        Yields:
+            (statement, table, rows) tuples; table is None for statements
+            other than INSERTs
+        """
+        prefix: Optional[str] = None
+        table: Optional[str] = None
+        values: List[str] = []
+        
+        for stmt in statements:
+            head, sep, row = stmt.partition(' VALUES (')
+            if head.upper().startswith('INSERT INTO ') and sep and stmt.endswith(');'):
+                if head != prefix or len(values) >= batch_size:
+                    if values:
+                        yield f"{prefix} VALUES {', '.join(values)};", table, len(values)
+                    prefix, values = head, []
+                    table = head[len('INSERT INTO '):].split('(')[0].strip().lower()
+                values.append(f"({row[:-1]}")
+                continue
+            if values:
+                yield f"{prefix} VALUES {', '.join(values)};", table, len(values)
+                prefix, values = None, []
+            yield stmt, None, 0
+        
+        if values:
+            yield f"{prefix} VALUES {', '.join(values)};", table, len(values)
+    
+    @staticmethod
+    def _group_rows_by_columns(rows: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+        """Group row dictionaries by their column set, so each group can be inserted with one executemany."""
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row_data in rows:
+            groups.setdefault(tuple(row_data.keys()), []).append(row_data)
+        return groups
     
     async def list_backups(
         self,
@@ -927,10 +1132,7 @@ class DatabaseBackupRepository:
                 
             elif db_type == 'postgres' and session:
                 # Get all tables
-                result = await session.execute(
-                    text("SELECT tablename FROM pg_tables WHERE schemaname = 'public'")
-                )
-                tables = [row[0] for row in result.fetchall()]
+                tables = await self._list_tables(session)
                 
                 # Get row counts for each table
                 table_info = {}
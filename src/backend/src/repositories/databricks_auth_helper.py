@@ -93,9 +93,6 @@ class DatabricksAuthHelper:
             Synchronous function to fetch PAT from database.
             This runs in a completely isolated thread with its own event loop.
             """
-            # Ensure USE_NULLPOOL is set for the new event loop
-            os.environ["USE_NULLPOOL"] = "true"
-            
             # Create a brand new event loop for this thread
             new_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(new_loop)
@@ -5,8 +5,8 @@ This repository handles all interactions with Databricks Vector Search endpoints
 following the clean architecture pattern.
 """
 from typing import Optional, List, Dict, Any
-import aiohttp
 # No longer using VectorSearchClient - using REST API directly
+from src.core.http_client_pool import get_http_client_pool
 from src.core.logger import LoggerManager
 from src.schemas.databricks_vector_endpoint import (
     EndpointCreate,
@@ -98,7 +98,7 @@ class DatabricksVectorEndpointRepository:
             logger.info(f"Creating endpoint {endpoint_data.name} via REST API")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     response_text = await response.text()
                     
@@ -168,7 +168,7 @@ class DatabricksVectorEndpointRepository:
             
             logger.info(f"Getting endpoint {endpoint_name} via REST API")
             
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -243,7 +243,7 @@ class DatabricksVectorEndpointRepository:
             logger.info("Listing all endpoints via REST API")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -326,7 +326,7 @@ class DatabricksVectorEndpointRepository:
             logger.info(f"Deleting endpoint {endpoint_name} via REST API")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.delete(url, headers=headers) as response:
                     if response.status in [200, 204]:
                         logger.info(f"Successfully deleted endpoint: {endpoint_name}")
@@ -5,11 +5,11 @@ This repository handles all interactions with Databricks Vector Search indexes,
 following the clean architecture pattern.
 """
 from typing import Optional, List, Dict, Any
-import aiohttp
 import asyncio
 import json
 import os
 # No longer using VectorSearchClient - using REST API directly
+from src.core.http_client_pool import get_http_client_pool
 from src.core.logger import LoggerManager
 from src.schemas.databricks_vector_index import (
     IndexCreate,
@@ -120,7 +120,7 @@ class DatabricksVectorIndexRepository:
             logger.info(f"Creating index {index_data.name} via REST API at {url}")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     response_text = await response.text()
                     
@@ -191,7 +191,7 @@ class DatabricksVectorIndexRepository:
             logger.info(f"Getting index {index_name} via REST API at {url}")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -326,7 +326,7 @@ class DatabricksVectorIndexRepository:
             logger.info(f"Listing indexes for endpoint {endpoint_name} via REST API")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.get(url, headers=headers, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -431,7 +431,7 @@ class DatabricksVectorIndexRepository:
             logger.info(f"Deleting index {index_name} via REST API at {url}")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.delete(url, headers=headers) as response:
                     response_text = await response.text()
                     
@@ -505,7 +505,7 @@ class DatabricksVectorIndexRepository:
             # Step 1: Get current index configuration
             describe_url = f"{self.workspace_url}/api/2.0/vector-search/indexes/{encoded_index_name}"
             
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 # Get index info
                 async with session.get(describe_url, headers=headers) as response:
                     if response.status != 200:
@@ -673,7 +673,7 @@ class DatabricksVectorIndexRepository:
                 payload["filters"] = filters
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status == 200:
                         results = await response.json()
@@ -901,7 +901,7 @@ class DatabricksVectorIndexRepository:
             logger.debug(f"Payload has 'inputs_json' key with JSON string of {len(records)} records")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 # Log the complete structure for debugging
                 logger.info(f"Sending upsert request to: {url}")
                 logger.info(f"Payload keys: {list(payload.keys())}")
@@ -1027,7 +1027,7 @@ class DatabricksVectorIndexRepository:
             logger.info(f"Deleting {len(primary_keys)} records from {index_name}")
             
             # Make the REST API call
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client_pool().client() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status in [200, 204]:
                         logger.info(f"Successfully deleted {len(primary_keys)} records from {index_name}")
@@ -3,6 +3,7 @@ Repository for interacting with Databricks Unity Catalog Volumes using Workspace
 """
 import os
 import asyncio
+import shutil
 from datetime import datetime
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from concurrent.futures import ThreadPoolExecutor
@@ -337,6 +338,80 @@ class DatabricksVolumeRepository:
                 "error": str(e)
             }
     
+    async def upload_local_file_to_volume(
+        self,
+        catalog: str,
+        schema: str,
+        volume_name: str,
+        file_name: str,
+        local_path: str
+    ) -> Dict[str, Any]:
+        """
+        Upload a local file to a Unity Catalog volume without reading it into memory.
+        Creates the volume if it doesn't exist.
+        
+        Args:
+            catalog: Unity Catalog name
+            schema: Schema name
+            volume_name: Volume name
+            file_name: Name of the file in the volume
+            local_path: Path of the local file to upload
+            
+        Returns:
+            Upload result
+        """
+        try:
+            if not await self._ensure_client():
+                return {
+                    "success": False,
+                    "error": "Failed to create Databricks client"
+                }
+            
+            # Ensure volume exists
+            volume_result = await self.create_volume_if_not_exists(catalog, schema, volume_name)
+            if not volume_result["success"]:
+                return volume_result
+            
+            volume_path = f"/Volumes/{catalog}/{schema}/{volume_name}/{file_name}"
+            file_size = os.path.getsize(local_path)
+            
+            logger.info(f"Uploading file {file_name} from {local_path}: size={file_size} bytes")
+            
+            def _upload_file():
+                try:
+                    # The SDK streams file objects to the Files API
+                    with open(local_path, 'rb') as f:
+                        self._workspace_client.files.upload(
+                            file_path=volume_path,
+                            contents=f,
+                            overwrite=True
+                        )
+                    
+                    logger.info(f"Successfully uploaded file to {volume_path}")
+                    return {
+                        "success": True,
+                        "path": volume_path,
+                        "size": file_size
+                    }
+                    
+                except Exception as e:
+                    logger.error(f"Failed to upload file: {e}")
+                    return {
+                        "success": False,
+                        "error": f"Upload failed: {str(e)}"
+                    }
+            
+            # Run synchronously in executor
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, _upload_file)
+            
+        except Exception as e:
+            logger.error(f"Error uploading file to volume: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     async def download_file_from_volume(
         self,
         catalog: str,
@@ -405,6 +480,75 @@ class DatabricksVolumeRepository:
                 "error": str(e)
             }
     
+    async def download_file_from_volume_to_local(
+        self,
+        catalog: str,
+        schema: str,
+        volume_name: str,
+        file_name: str,
+        local_path: str
+    ) -> Dict[str, Any]:
+        """
+        Download a file from a Unity Catalog volume to a local file without reading it into memory.
+        
+        Args:
+            catalog: Unity Catalog name
+            schema: Schema name
+            volume_name: Volume name
+            file_name: Name of the file to download
+            local_path: Path of the local file to write
+            
+        Returns:
+            Download result with the file size
+        """
+        try:
+            if not await self._ensure_client():
+                return {
+                    "success": False,
+                    "error": "Failed to create Databricks client"
+                }
+            
+            volume_path = f"/Volumes/{catalog}/{schema}/{volume_name}/{file_name}"
+            
+            def _download_file():
+                try:
+                    # Copy the response stream to disk in chunks
+                    with self._workspace_client.files.download(volume_path) as f, open(local_path, 'wb') as out:
+                        shutil.copyfileobj(f, out, 1024 * 1024)
+                    file_size = os.path.getsize(local_path)
+                    
+                    logger.info(f"Successfully downloaded file from {volume_path} to {local_path}, size: {file_size} bytes")
+                    return {
+                        "success": True,
+                        "path": volume_path,
+                        "size": file_size
+                    }
+                    
+                except Exception as e:
+                    error_msg = str(e)
+                    if "not found" in error_msg.lower() or "404" in error_msg:
+                        return {
+                            "success": False,
+                            "error": f"File not found: {volume_path}"
+                        }
+                    
+                    logger.error(f"Failed to download file: {e}")
+                    return {
+                        "success": False,
+                        "error": f"Download failed: {error_msg}"
+                    }
+            
+            # Run synchronously in executor
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, _download_file)
+            
+        except Exception as e:
+            logger.error(f"Error downloading file from volume: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     async def list_volume_contents(
         self,
         catalog: str,
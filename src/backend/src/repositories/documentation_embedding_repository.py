@@ -1,11 +1,77 @@
+import logging
 from typing import Dict, List, Optional, Any, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, select
+from sqlalchemy import desc, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.documentation_embedding import DocumentationEmbedding
 from src.schemas.documentation_embedding import DocumentationEmbeddingCreate
 from src.core.base_repository import BaseRepository
+from src.core.vector_index import get_documentation_vector_index
+
+logger = logging.getLogger(__name__)
+
+# Session.info key of the vector index changes waiting for the session to commit
+VECTOR_INDEX_CHANGES_KEY = "documentation_vector_index_changes"
+
+
+class _PendingVectorIndexChanges:
+    """Documentation vector index changes of a session's open transaction."""
+
+    def __init__(self):
+        # Embedding per written row id, None for deleted rows
+        self.changes: Dict[int, Optional[List[float]]] = {}
+        # A savepoint was rolled back; the changes may include undone writes
+        self.stale = False
+        # The index was loaded from this transaction's uncommitted view of the table
+        self.index_loaded = False
+
+
+def _pending_vector_index_changes(db: Union[AsyncSession, Session], create: bool = False) -> Optional[_PendingVectorIndexChanges]:
+    """Get the vector index changes queued on a session (AsyncSession.info is its sync session's)."""
+    pending = db.info.get(VECTOR_INDEX_CHANGES_KEY)
+    if pending is None and create:
+        pending = db.info[VECTOR_INDEX_CHANGES_KEY] = _PendingVectorIndexChanges()
+    return pending
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_vector_index_changes(session: Session) -> None:
+    """Apply the committed row changes to the documentation vector index."""
+    pending = session.info.pop(VECTOR_INDEX_CHANGES_KEY, None)
+    if pending is None:
+        return
+    index = get_documentation_vector_index()
+    if pending.stale:
+        # Reloaded from the table on the next search
+        index.reset()
+        return
+    if not index.loaded:
+        return
+    for embedding_id, embedding in pending.changes.items():
+        if embedding:
+            index.upsert(embedding_id, embedding)
+        else:
+            index.remove(embedding_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _mark_vector_index_changes_stale(session: Session, previous_transaction) -> None:
+    """Remember that a savepoint may have undone queued changes."""
+    pending = session.info.get(VECTOR_INDEX_CHANGES_KEY)
+    if pending is not None and previous_transaction.nested:
+        pending.stale = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_vector_index_changes(session: Session, transaction) -> None:
+    """Drop the changes of a transaction that ended without committing."""
+    if transaction.parent is not None:
+        return
+    pending = session.info.pop(VECTOR_INDEX_CHANGES_KEY, None)
+    if pending is not None and pending.index_loaded:
+        # The index holds rows that were rolled back
+        get_documentation_vector_index().reset()
 
 
 class DocumentationEmbeddingRepository(BaseRepository[DocumentationEmbedding]):
@@ -30,8 +96,15 @@ class DocumentationEmbeddingRepository(BaseRepository[DocumentationEmbedding]):
         )
         self.db.add(db_embedding)
         await self.db.flush()  # Flush to get the ID but don't commit
+        self._queue_vector_index_change(db_embedding.id, db_embedding.embedding)
         return db_embedding
 
+    def _queue_vector_index_change(self, embedding_id: Optional[int], embedding: Optional[List[float]]) -> None:
+        """Queue a row change for the documentation vector index until the session commits."""
+        if embedding_id is None:
+            return
+        _pending_vector_index_changes(self.db, create=True).changes[embedding_id] = embedding
+
     async def get_by_id(self, embedding_id: int) -> Optional[DocumentationEmbedding]:
         """Get a specific documentation embedding by ID."""
         if isinstance(self.db, AsyncSession):
@@ -67,6 +140,8 @@ class DocumentationEmbeddingRepository(BaseRepository[DocumentationEmbedding]):
             for key, value in update_data.items():
                 setattr(db_embedding, key, value)
             await self.db.flush()
+            if "embedding" in update_data:
+                self._queue_vector_index_change(db_embedding.id, db_embedding.embedding)
         return db_embedding
 
     async def delete(self, embedding_id: int) -> bool:
@@ -75,6 +150,7 @@ class DocumentationEmbeddingRepository(BaseRepository[DocumentationEmbedding]):
         if db_embedding:
             await self.db.delete(db_embedding)
             # Don't commit here, let UnitOfWork handle it
+            self._queue_vector_index_change(embedding_id, None)
             return True
         return False
 
@@ -162,91 +238,98 @@ class DocumentationEmbeddingRepository(BaseRepository[DocumentationEmbedding]):
         """Detect the database type from the session."""
         try:
             if hasattr(self.db, 'bind') and self.db.bind:
-                dialect_name = self.db.bind.dialect.name.lower()
-                return dialect_name
-            elif hasattr(self.db, 'get_bind'):
-                bind = await self.db.get_bind()
-                if bind:
-                    dialect_name = bind.dialect.name.lower()
-                    return dialect_name
-            # Fallback: try to detect from settings
-            from src.config.settings import settings
-            return settings.DATABASE_TYPE.lower()
+                return self.db.bind.dialect.name.lower()
+            if hasattr(self.db, 'get_bind'):
+                # Sessions from the engine registry have no fixed bind; get_bind
+                # resolves the engine of the current event loop (not awaitable)
+                bind = self.db.get_bind()
+                if bind is not None:
+                    return bind.dialect.name.lower()
         except Exception as e:
-            # Default to postgres if detection fails
-            return "postgresql"
+            logger.debug(f"Could not detect database type from the session: {e}")
+        # Fallback: detect from settings
+        from src.config.settings import settings
+        return settings.DATABASE_TYPE.lower()
     
+    async def _table_signature(self) -> Dict[str, Any]:
+        """Summarise the table state so a persisted vector index can be validated."""
+        from sqlalchemy import func
+
+        result = await self.db.execute(
+            select(
+                func.count(DocumentationEmbedding.id),
+                func.max(DocumentationEmbedding.id),
+                func.max(func.coalesce(DocumentationEmbedding.updated_at, DocumentationEmbedding.created_at)),
+            )
+        )
+        count, max_id, last_change = result.one()
+        return {
+            "count": int(count or 0),
+            "max_id": int(max_id) if max_id is not None else None,
+            "last_change": str(last_change) if last_change is not None else None,
+        }
+
+    async def _ensure_vector_index(self):
+        """Load the documentation vector index from its sidecar or rebuild it from the table."""
+        index = get_documentation_vector_index()
+        if index.loaded:
+            return index
+
+        # Uncommitted writes of this session are part of the table it reads
+        pending = _pending_vector_index_changes(self.db)
+        if pending is not None:
+            pending.index_loaded = True
+
+        signature = await self._table_signature()
+        if index.load(signature):
+            logger.info(f"Loaded documentation vector index with {len(index)} vectors from sidecar")
+            return index
+
+        result = await self.db.execute(
+            select(DocumentationEmbedding.id, DocumentationEmbedding.embedding)
+            .where(DocumentationEmbedding.embedding.isnot(None))
+        )
+        index.build((row.id, row.embedding) for row in result.all())
+        if pending is None:
+            index.save(signature)
+        logger.info(f"Built documentation vector index with {len(index)} vectors")
+        return index
+
     async def _search_similar_sqlite(
         self,
         query_embedding: List[float],
         limit: int
     ) -> List[DocumentationEmbedding]:
-        """SQLite implementation of similarity search using JSON functions."""
-        import json
-        from sqlalchemy import text
-        
-        query_json = json.dumps(query_embedding)
-        
-        # Pure SQL cosine similarity calculation
-        similarity_query = text("""
-            WITH vector_calculations AS (
-                SELECT 
-                    id,
-                    source,
-                    title,
-                    content,
-                    doc_metadata,
-                    created_at,
-                    updated_at,
-                    embedding,
-                    -- Parse JSON and calculate dot product with query vector
-                    (
-                        SELECT SUM(
-                            CAST(d.value AS REAL) * CAST(q.value AS REAL)
-                        )
-                        FROM json_each(embedding) d, json_each(:query_vector) q
-                        WHERE d.key = q.key
-                    ) AS dot_product,
-                    -- Calculate norm of document vector
-                    (
-                        SELECT SQRT(SUM(
-                            CAST(value AS REAL) * CAST(value AS REAL)
-                        ))
-                        FROM json_each(embedding)
-                    ) AS doc_norm,
-                    -- Query vector norm (calculated once)
-                    (
-                        SELECT SQRT(SUM(
-                            CAST(value AS REAL) * CAST(value AS REAL)
-                        ))
-                        FROM json_each(:query_vector)
-                    ) AS query_norm
-                FROM documentation_embeddings
-                WHERE embedding IS NOT NULL
-            )
-            SELECT 
-                id, source, title, content, doc_metadata, created_at, updated_at,
-                -- Calculate cosine similarity
-                CASE 
-                    WHEN doc_norm > 0 AND query_norm > 0 
-                    THEN dot_product / (doc_norm * query_norm)
-                    ELSE 0 
-                END AS similarity
-            FROM vector_calculations
-            WHERE similarity > 0
-            ORDER BY similarity DESC
-            LIMIT :limit_val
-        """)
-        
-        result = await self.db.execute(similarity_query, {
-            "query_vector": query_json,
-            "limit_val": limit
-        })
-        rows = result.all()
-        
-        # Convert rows to DocumentationEmbedding objects
+        """
+        SQLite implementation of similarity search.
+
+        Scores are computed by an in-process NumPy index instead of parsing every
+        stored JSON embedding in SQL; only the top-k rows are then loaded.
+        """
+        index = await self._ensure_vector_index()
+        hits = index.search(query_embedding, limit)
+        if not hits:
+            return []
+
+        result = await self.db.execute(
+            select(
+                DocumentationEmbedding.id,
+                DocumentationEmbedding.source,
+                DocumentationEmbedding.title,
+                DocumentationEmbedding.content,
+                DocumentationEmbedding.doc_metadata,
+                DocumentationEmbedding.created_at,
+                DocumentationEmbedding.updated_at,
+            ).where(DocumentationEmbedding.id.in_([doc_id for doc_id, _ in hits]))
+        )
+        rows_by_id = {row.id: row for row in result.all()}
+
+        # Convert rows to DocumentationEmbedding objects, most similar first
         similar_docs = []
-        for row in rows:
+        for doc_id, _ in hits:
+            row = rows_by_id.get(doc_id)
+            if row is None:
+                continue
             doc = DocumentationEmbedding(
                 id=row.id,
                 source=row.source,
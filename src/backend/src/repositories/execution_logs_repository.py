@@ -4,14 +4,16 @@ Repository for execution logs data access.
 This module provides database operations for execution logs.
 """
 
-from typing import List, Optional
+import json
+import zlib
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, delete, text
+from sqlalchemy import desc, func, delete, insert, text
 import logging
 from datetime import datetime, timezone
 
-from src.models.execution_logs import ExecutionLog
+from src.models.execution_logs import ExecutionLog, ExecutionLogArchive
 from src.db.session import async_session_factory
 from src.core.logger import LoggerManager
 from src.utils.user_context import GroupContext
@@ -20,6 +22,44 @@ from src.utils.user_context import GroupContext
 logger = LoggerManager.get_instance().system
 
 
+def pack_log_lines(lines: List[Dict[str, Any]]) -> bytes:
+    """
+    Compress log lines for an ExecutionLogArchive.
+    
+    Args:
+        lines: Dictionaries with id, content and timestamp (datetime or None)
+        
+    Returns:
+        zlib-compressed JSON document
+    """
+    document = [
+        [line["id"], line["content"], line["timestamp"].isoformat() if line.get("timestamp") else None]
+        for line in lines
+    ]
+    return zlib.compress(json.dumps(document, separators=(",", ":")).encode("utf-8"))
+
+
+def unpack_log_lines(content: bytes) -> List[Dict[str, Any]]:
+    """
+    Decompress the log lines of an ExecutionLogArchive.
+    
+    Args:
+        content: Archive content produced by pack_log_lines
+        
+    Returns:
+        Dictionaries with id, content and timestamp, in archived order
+    """
+    document = json.loads(zlib.decompress(content).decode("utf-8"))
+    return [
+        {
+            "id": log_id,
+            "content": text_content,
+            "timestamp": datetime.fromisoformat(timestamp) if timestamp else None,
+        }
+        for log_id, text_content, timestamp in document
+    ]
+
+
 class ExecutionLogsRepository:
     """Repository for execution logs data access operations."""
     
@@ -148,13 +188,56 @@ class ExecutionLogsRepository:
             logger.error(f"[ExecutionLogsRepository.create_with_managed_session] Session error: {session_error}", exc_info=True)
             raise
     
+    def _apply_cursor(self, query, after_id: Optional[int] = None, since: Optional[datetime] = None):
+        """
+        Restrict a log query to rows after an incremental-fetch cursor.
+        
+        Combined with the execution_id filter, the ``since`` condition is a
+        range scan on the (execution_id, timestamp) index.
+        
+        Args:
+            query: Select statement over ExecutionLog
+            after_id: Only keep logs with an ID greater than this
+            since: Only keep logs with a timestamp later than this
+            
+        Returns:
+            The restricted select statement
+        """
+        if since is not None:
+            query = query.where(ExecutionLog.timestamp > self._normalize_timestamp(since))
+        if after_id is not None:
+            query = query.where(ExecutionLog.id > after_id)
+        return query
+    
+    def _apply_order(self, query, newest_first: bool = False, by_id: bool = False):
+        """
+        Order a log query chronologically.
+        
+        ID-cursor fetches are ordered by ID so the last row of a page is a
+        valid ``after_id`` for the next one.
+        
+        Args:
+            query: Select statement over ExecutionLog
+            newest_first: If True, newest logs come first
+            by_id: Order by ID instead of timestamp
+            
+        Returns:
+            The ordered select statement
+        """
+        columns = [ExecutionLog.id] if by_id else [ExecutionLog.timestamp, ExecutionLog.id]
+        if newest_first:
+            columns = [desc(column) for column in columns]
+        return query.order_by(*columns)
+    
     async def get_by_execution_id(
         self, 
         session: AsyncSession, 
         execution_id: str, 
         limit: int = 1000, 
         offset: int = 0,
-        newest_first: bool = False
+        newest_first: bool = False,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionLog]:
         """
         Retrieve logs for a specific execution.
@@ -165,6 +248,8 @@ class ExecutionLogsRepository:
             limit: Maximum number of logs to return
             offset: Number of logs to skip
             newest_first: If True, return newest logs first
+            after_id: Only return logs with an ID greater than this
+            since: Only return logs with a timestamp later than this
             
         Returns:
             List of ExecutionLog objects
@@ -172,11 +257,9 @@ class ExecutionLogsRepository:
         query = select(ExecutionLog).where(
             ExecutionLog.execution_id == execution_id
         )
+        query = self._apply_cursor(query, after_id, since)
         
-        if newest_first:
-            query = query.order_by(desc(ExecutionLog.timestamp))
-        else:
-            query = query.order_by(ExecutionLog.timestamp)
+        query = self._apply_order(query, newest_first, after_id is not None)
             
         query = query.offset(offset).limit(limit)
         
@@ -251,7 +334,9 @@ class ExecutionLogsRepository:
         execution_id: str, 
         limit: int = 1000, 
         offset: int = 0,
-        newest_first: bool = False
+        newest_first: bool = False,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionLog]:
         """
         Retrieve logs for a specific execution with internal session management.
@@ -261,18 +346,28 @@ class ExecutionLogsRepository:
             limit: Maximum number of logs to return
             offset: Number of logs to skip
             newest_first: If True, return newest logs first
+            after_id: Only return logs with an ID greater than this
+            since: Only return logs with a timestamp later than this
             
         Returns:
             List of ExecutionLog objects
         """
         async with async_session_factory() as session:
-            return await self.get_by_execution_id(
+            logs = await self.get_by_execution_id(
                 session=session,
                 execution_id=execution_id,
                 limit=limit,
                 offset=offset,
-                newest_first=newest_first
+                newest_first=newest_first,
+                after_id=after_id,
+                since=since
             )
+            if not logs:
+                # Compacted executions have no live rows left
+                logs = await self.get_archived(
+                    session, execution_id, limit, offset, newest_first, after_id, since
+                )
+            return logs
     
     async def get_by_execution_id_and_group_with_managed_session(
         self, 
@@ -281,7 +376,9 @@ class ExecutionLogsRepository:
         limit: int = 1000, 
         offset: int = 0,
         newest_first: bool = False,
-        include_null_group: bool = False
+        include_null_group: bool = False,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionLog]:
         """
         Retrieve logs for a specific execution and group with internal session management.
@@ -293,6 +390,8 @@ class ExecutionLogsRepository:
             offset: Number of logs to skip
             newest_first: If True, return newest logs first
             include_null_group: If True, also include logs with NULL group_id (for backward compatibility)
+            after_id: Only return logs with an ID greater than this
+            since: Only return logs with a timestamp later than this
             
         Returns:
             List of ExecutionLog objects filtered by group
@@ -310,16 +409,21 @@ class ExecutionLogsRepository:
                     ExecutionLog.execution_id == execution_id,
                     ExecutionLog.group_id == group_id
                 )
+            query = self._apply_cursor(query, after_id, since)
             
-            if newest_first:
-                query = query.order_by(desc(ExecutionLog.timestamp))
-            else:
-                query = query.order_by(ExecutionLog.timestamp)
+            query = self._apply_order(query, newest_first, after_id is not None)
                 
             query = query.offset(offset).limit(limit)
             
             result = await session.execute(query)
-            return result.scalars().all()
+            logs = result.scalars().all()
+            if not logs:
+                # Compacted executions have no live rows left
+                logs = await self.get_archived(
+                    session, execution_id, limit, offset, newest_first, after_id, since,
+                    group_id=group_id, include_null_group=include_null_group
+                )
+            return logs
     
     async def count_by_execution_id_with_managed_session(self, execution_id: str) -> int:
         """
@@ -332,7 +436,10 @@ class ExecutionLogsRepository:
             Number of logs
         """
         async with async_session_factory() as session:
-            return await self.count_by_execution_id(session, execution_id)
+            count = await self.count_by_execution_id(session, execution_id)
+            if not count:
+                count = await self.count_archived(session, execution_id)
+            return count
     
     async def delete_by_execution_id_with_managed_session(self, execution_id: str) -> int:
         """
@@ -345,7 +452,9 @@ class ExecutionLogsRepository:
             Number of deleted records
         """
         async with async_session_factory() as session:
-            return await self.delete_by_execution_id(session, execution_id)
+            deleted = await self.delete_by_execution_id(session, execution_id)
+            await self.delete_archive(session, execution_id)
+            return deleted
             
     async def delete_all_with_managed_session(self) -> int:
         """
@@ -355,7 +464,9 @@ class ExecutionLogsRepository:
             Number of deleted records
         """
         async with async_session_factory() as session:
-            return await self.delete_all(session)
+            deleted = await self.delete_all(session)
+            await self.delete_all_archives(session)
+            return deleted
     
     async def create_with_group_managed_session(self, execution_id: str, content: str, timestamp=None, group_context: GroupContext = None) -> ExecutionLog:
         """
@@ -399,6 +510,169 @@ class ExecutionLogsRepository:
             logger.error(f"[ExecutionLogsRepository.create_with_group_managed_session] Error creating log: {e}", exc_info=True)
             raise
 
+    async def create_many(self, session: AsyncSession, logs: List[Dict[str, Any]]) -> int:
+        """
+        Insert several execution log entries with a single multi-row INSERT.
+        
+        Args:
+            session: Database session
+            logs: List of dictionaries with execution_id, content and optional
+                timestamp, group_id and group_email keys
+            
+        Returns:
+            Number of inserted rows
+        """
+        if not logs:
+            return 0
+        
+        rows = [
+            {
+                "execution_id": log["execution_id"],
+                "content": log["content"],
+                "timestamp": self._normalize_timestamp(log.get("timestamp")) or datetime.utcnow(),
+                "group_id": log.get("group_id"),
+                "group_email": log.get("group_email"),
+            }
+            for log in logs
+        ]
+        
+        try:
+            await session.execute(insert(ExecutionLog).values(rows))
+            await session.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"[ExecutionLogsRepository.create_many] Error inserting {len(rows)} logs: {e}")
+            try:
+                await session.rollback()
+            except Exception as rollback_error:
+                logger.error(f"[ExecutionLogsRepository.create_many] Rollback failed: {rollback_error}")
+            raise
+    
+    async def create_many_with_managed_session(self, logs: List[Dict[str, Any]]) -> int:
+        """
+        Insert several execution log entries in one transaction with internal session management.
+        
+        Args:
+            logs: List of log dictionaries (see create_many)
+            
+        Returns:
+            Number of inserted rows
+        """
+        async with async_session_factory() as session:
+            return await self.create_many(session, logs)
+
+    
+    async def get_archived(
+        self,
+        session: AsyncSession,
+        execution_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        newest_first: bool = False,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        group_id: Optional[str] = None,
+        include_null_group: bool = False
+    ) -> List[ExecutionLog]:
+        """
+        Retrieve the compacted logs of an execution.
+        
+        Filters, ordering and paging match get_by_execution_id. The returned
+        ExecutionLog objects are transient (not attached to the session).
+        
+        Args:
+            session: Database session
+            execution_id: ID of the execution to fetch logs for
+            limit: Maximum number of logs to return
+            offset: Number of logs to skip
+            newest_first: If True, return newest logs first
+            after_id: Only return logs with an ID greater than this
+            since: Only return logs with a timestamp later than this
+            group_id: Only return the archive if it belongs to this group
+            include_null_group: With group_id, also accept archives without a group
+            
+        Returns:
+            List of ExecutionLog objects
+        """
+        result = await session.execute(
+            select(ExecutionLogArchive).where(ExecutionLogArchive.execution_id == execution_id)
+        )
+        archive = result.scalars().first()
+        if archive is None:
+            return []
+        if group_id is not None and archive.group_id != group_id:
+            if not (include_null_group and archive.group_id is None):
+                return []
+        
+        lines = unpack_log_lines(archive.content)
+        since = self._normalize_timestamp(since)
+        if since is not None:
+            lines = [line for line in lines if line["timestamp"] is not None and line["timestamp"] > since]
+        if after_id is not None:
+            lines = [line for line in lines if line["id"] > after_id]
+            lines.sort(key=lambda line: line["id"], reverse=newest_first)
+        else:
+            lines.sort(key=lambda line: (line["timestamp"] or datetime.min, line["id"]), reverse=newest_first)
+        
+        return [
+            ExecutionLog(
+                id=line["id"],
+                execution_id=execution_id,
+                content=line["content"],
+                timestamp=line["timestamp"],
+                group_id=archive.group_id,
+                group_email=archive.group_email
+            )
+            for line in lines[offset:offset + limit]
+        ]
+    
+    async def count_archived(self, session: AsyncSession, execution_id: str) -> int:
+        """
+        Count the compacted logs of an execution.
+        
+        Args:
+            session: Database session
+            execution_id: ID of the execution to count logs for
+            
+        Returns:
+            Number of archived logs (0 if the execution has no archive)
+        """
+        result = await session.execute(
+            select(ExecutionLogArchive.line_count).where(ExecutionLogArchive.execution_id == execution_id)
+        )
+        return result.scalar() or 0
+    
+    async def delete_archive(self, session: AsyncSession, execution_id: str) -> int:
+        """
+        Delete the compacted logs of an execution.
+        
+        Args:
+            session: Database session
+            execution_id: ID of the execution to delete the archive of
+            
+        Returns:
+            Number of deleted archives
+        """
+        result = await session.execute(
+            delete(ExecutionLogArchive).where(ExecutionLogArchive.execution_id == execution_id)
+        )
+        await session.commit()
+        return result.rowcount
+    
+    async def delete_all_archives(self, session: AsyncSession) -> int:
+        """
+        Delete all compacted logs.
+        
+        Args:
+            session: Database session
+            
+        Returns:
+            Number of deleted archives
+        """
+        result = await session.execute(delete(ExecutionLogArchive))
+        await session.commit()
+        return result.rowcount
+
 
 # Create a singleton instance
 execution_logs_repository = ExecutionLogsRepository() 
\ No newline at end of file
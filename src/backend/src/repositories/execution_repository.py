@@ -7,7 +7,7 @@ This module provides database operations for execution models.
 from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, delete, update
+from sqlalchemy import and_, desc, func, delete, or_, update
 from datetime import datetime, UTC
 import logging
 
@@ -76,6 +76,80 @@ class ExecutionRepository(BaseRepository[ExecutionHistory]):
         
         return executions, total_count
     
+    async def get_execution_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        group_ids: List[str] = None,
+        include_result: bool = False,
+        include_inputs: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of executions, newest first, using keyset pagination.
+        
+        Rows are ordered by (created_at, id) descending and the page starts
+        strictly after the given cursor, so the cost depends on the page size
+        rather than on how deep the page is. Only summary columns are loaded;
+        the potentially large ``result`` and ``inputs`` JSON columns are
+        selected only when requested.
+        
+        Args:
+            limit: Maximum number of items to return
+            cursor: (created_at, id) of the last row of the previous page
+            group_ids: List of group IDs for filtering
+            include_result: Whether to load the result column
+            include_inputs: Whether to load the inputs column
+            
+        Returns:
+            List of execution dictionaries keyed by column name
+        """
+        columns = [
+            ExecutionHistory.id,
+            ExecutionHistory.job_id,
+            ExecutionHistory.status,
+            ExecutionHistory.created_at,
+            ExecutionHistory.completed_at,
+            ExecutionHistory.run_name,
+            ExecutionHistory.error,
+            ExecutionHistory.group_email,
+        ]
+        if include_result:
+            columns.append(ExecutionHistory.result)
+        if include_inputs:
+            columns.append(ExecutionHistory.inputs)
+        
+        stmt = select(*columns)
+        if group_ids:
+            stmt = stmt.where(ExecutionHistory.group_id.in_(group_ids))
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            stmt = stmt.where(
+                or_(
+                    ExecutionHistory.created_at < cursor_created_at,
+                    and_(ExecutionHistory.created_at == cursor_created_at, ExecutionHistory.id < cursor_id)
+                )
+            )
+        stmt = stmt.order_by(ExecutionHistory.created_at.desc(), ExecutionHistory.id.desc()).limit(limit)
+        
+        result = await self.session.execute(stmt)
+        return [dict(row._mapping) for row in result.all()]
+    
+    async def get_existing_job_ids(self, job_ids: List[str]) -> List[str]:
+        """
+        Find which of the given job IDs already have an execution row.
+        
+        Args:
+            job_ids: Job IDs to look up
+            
+        Returns:
+            The subset of job IDs present in the database
+        """
+        if not job_ids:
+            return []
+        stmt = select(ExecutionHistory.job_id).where(ExecutionHistory.job_id.in_(job_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+    
     async def get_execution_by_job_id(self, job_id: str, group_ids: List[str] = None) -> Optional[ExecutionHistory]:
         """
         Get a specific execution by job_id with group filtering.
@@ -0,0 +1,395 @@
+"""
+Repository for execution retention operations.
+
+This module provides the bulk operations behind the retention service:
+finding expired executions and deleting them with their traces and logs in
+bounded batches, compacting per-line logs into per-execution archives, and
+maintaining monthly partitions of execution_logs on PostgreSQL.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, desc, func, insert, or_, select, text, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logger import LoggerManager
+from src.models.billing import LLMUsageBilling
+from src.models.execution_history import ErrorTrace, ExecutionHistory, TaskStatus
+from src.models.execution_logs import ExecutionLog, ExecutionLogArchive
+from src.models.execution_status import ExecutionStatus
+from src.models.execution_trace import ExecutionTrace
+from src.repositories.execution_logs_repository import pack_log_lines, unpack_log_lines
+
+# Get logger from the centralized logging system
+logger = LoggerManager.get_instance().system
+
+# Executions in these states are never deleted or compacted
+ACTIVE_STATUSES = [
+    ExecutionStatus.PENDING.value,
+    ExecutionStatus.PREPARING.value,
+    ExecutionStatus.RUNNING.value,
+]
+
+_PARTITION_NAME_RE = re.compile(r"^execution_logs_p(\d{4})(\d{2})$")
+
+
+def log_partition_name(month_start: date) -> str:
+    """Name of the execution_logs partition holding the given month."""
+    return f"execution_logs_p{month_start.year:04d}{month_start.month:02d}"
+
+
+def next_month(month_start: date) -> date:
+    """First day of the month after month_start."""
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+class ExecutionRetentionRepository:
+    """Repository for retention, compaction and partition maintenance of execution data."""
+
+    @staticmethod
+    def _is_active():
+        return func.upper(ExecutionHistory.status).in_(ACTIVE_STATUSES)
+
+    async def find_expired_job_ids(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cutoff: Optional[datetime] = None,
+        keep_latest: Optional[int] = None,
+        group_id: Optional[str] = None,
+        exclude_group_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Find executions that fall outside a retention policy, oldest first.
+
+        An execution is expired if it was created before ``cutoff`` or is not
+        among the ``keep_latest`` newest executions of its group. Active
+        executions and executions referenced by billing records are kept.
+
+        Args:
+            session: Database session
+            limit: Maximum number of job IDs to return
+            cutoff: Expire executions created before this time
+            keep_latest: Keep this many newest executions per group
+            group_id: Only consider this group's executions
+            exclude_group_ids: Otherwise consider all groups except these
+
+        Returns:
+            Job IDs of expired executions
+        """
+        if cutoff is None and not keep_latest:
+            return []
+
+        if group_id is not None:
+            scope = ExecutionHistory.group_id == group_id
+        elif exclude_group_ids:
+            scope = or_(ExecutionHistory.group_id.is_(None), ExecutionHistory.group_id.notin_(exclude_group_ids))
+        else:
+            scope = true()
+
+        ranked = (
+            select(
+                ExecutionHistory.job_id.label("job_id"),
+                ExecutionHistory.created_at.label("created_at"),
+                func.row_number().over(
+                    partition_by=ExecutionHistory.group_id,
+                    order_by=(desc(ExecutionHistory.created_at), desc(ExecutionHistory.id))
+                ).label("position")
+            )
+            .where(scope)
+            .subquery()
+        )
+
+        expired_conditions = []
+        if cutoff is not None:
+            expired_conditions.append(ranked.c.created_at < cutoff)
+        if keep_latest:
+            expired_conditions.append(ranked.c.position > keep_latest)
+
+        active = select(ExecutionHistory.job_id).where(self._is_active())
+        billed = select(LLMUsageBilling.id).where(LLMUsageBilling.execution_id == ranked.c.job_id).exists()
+        query = (
+            select(ranked.c.job_id)
+            .where(or_(*expired_conditions), ranked.c.job_id.notin_(active), ~billed)
+            .order_by(ranked.c.created_at, ranked.c.job_id)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [row[0] for row in result.fetchall()]
+
+    async def _delete_in_batches(self, session: AsyncSession, model: Any, condition: Any, batch_size: int) -> int:
+        """Delete matching rows batch_size at a time, committing after each batch."""
+        deleted = 0
+        while True:
+            ids = select(model.id).where(condition).limit(batch_size)
+            result = await session.execute(delete(model).where(model.id.in_(ids)))
+            await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+    async def delete_executions(self, session: AsyncSession, job_ids: List[str], batch_size: int) -> Dict[str, int]:
+        """
+        Delete executions with their traces, logs, log archives, task statuses and error traces.
+
+        Traces and logs are deleted ``batch_size`` rows per statement and
+        transaction, so no single statement holds locks for long.
+
+        Args:
+            session: Database session
+            job_ids: Job IDs of the executions to delete
+            batch_size: Maximum rows per DELETE
+
+        Returns:
+            Dictionary with deletion counts
+        """
+        if not job_ids:
+            return {"executions": 0, "traces": 0, "logs": 0}
+
+        run_ids_result = await session.execute(
+            select(ExecutionHistory.id).where(ExecutionHistory.job_id.in_(job_ids))
+        )
+        run_ids = [row[0] for row in run_ids_result.fetchall()]
+
+        try:
+            trace_count = await self._delete_in_batches(
+                session, ExecutionTrace,
+                or_(ExecutionTrace.job_id.in_(job_ids), ExecutionTrace.run_id.in_(run_ids)),
+                batch_size
+            )
+            log_count = await self._delete_in_batches(
+                session, ExecutionLog, ExecutionLog.execution_id.in_(job_ids), batch_size
+            )
+            await session.execute(delete(ExecutionLogArchive).where(ExecutionLogArchive.execution_id.in_(job_ids)))
+            await session.execute(delete(TaskStatus).where(TaskStatus.job_id.in_(job_ids)))
+            await session.execute(delete(ErrorTrace).where(ErrorTrace.run_id.in_(run_ids)))
+            history_result = await session.execute(delete(ExecutionHistory).where(ExecutionHistory.job_id.in_(job_ids)))
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+        return {"executions": history_result.rowcount, "traces": trace_count, "logs": log_count}
+
+    async def find_compactable_execution_ids(self, session: AsyncSession, cutoff: datetime, limit: int) -> List[str]:
+        """
+        Find executions whose live logs all predate ``cutoff`` and are not archived yet.
+
+        Args:
+            session: Database session
+            cutoff: Only executions whose newest log line is older than this
+            limit: Maximum number of execution IDs to return
+
+        Returns:
+            Execution IDs to compact
+        """
+        active = select(ExecutionHistory.job_id).where(self._is_active())
+        archived = select(ExecutionLogArchive.id).where(
+            ExecutionLogArchive.execution_id == ExecutionLog.execution_id
+        ).exists()
+        query = (
+            select(ExecutionLog.execution_id)
+            .where(ExecutionLog.execution_id.notin_(active), ~archived)
+            .group_by(ExecutionLog.execution_id)
+            .having(func.max(ExecutionLog.timestamp) < cutoff)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [row[0] for row in result.fetchall()]
+
+    async def compact_execution(self, session: AsyncSession, execution_id: str, delete_lines: bool = True) -> int:
+        """
+        Roll the live log lines of an execution up into its archive.
+
+        Lines already in an archive are merged with the new ones. With
+        ``delete_lines`` the compacted lines are removed from execution_logs in
+        the same transaction; on a partitioned table they are left for the
+        partition drop instead.
+
+        Args:
+            session: Database session
+            execution_id: ID of the execution to compact
+            delete_lines: Delete the compacted lines from execution_logs
+
+        Returns:
+            Number of lines compacted
+        """
+        try:
+            result = await session.execute(
+                select(
+                    ExecutionLog.id, ExecutionLog.content, ExecutionLog.timestamp,
+                    ExecutionLog.group_id, ExecutionLog.group_email
+                )
+                .where(ExecutionLog.execution_id == execution_id)
+                .order_by(ExecutionLog.id)
+            )
+            rows = result.fetchall()
+            if not rows:
+                return 0
+
+            lines = [{"id": row[0], "content": row[1], "timestamp": row[2]} for row in rows]
+            group_id = next((row[3] for row in rows if row[3] is not None), None)
+            group_email = next((row[4] for row in rows if row[4] is not None), None)
+
+            archive_result = await session.execute(
+                select(ExecutionLogArchive).where(ExecutionLogArchive.execution_id == execution_id)
+            )
+            archive = archive_result.scalars().first()
+            if archive is not None:
+                known_ids = {line["id"] for line in lines}
+                lines = [line for line in unpack_log_lines(archive.content) if line["id"] not in known_ids] + lines
+                lines.sort(key=lambda line: line["id"])
+
+            timestamps = [line["timestamp"] for line in lines if line["timestamp"] is not None]
+            values = {
+                "content": pack_log_lines(lines),
+                "line_count": len(lines),
+                "first_timestamp": min(timestamps) if timestamps else None,
+                "last_timestamp": max(timestamps) if timestamps else None,
+                "group_id": group_id,
+                "group_email": group_email,
+            }
+            if archive is None:
+                await session.execute(
+                    insert(ExecutionLogArchive).values(
+                        execution_id=execution_id, created_at=datetime.utcnow(), **values
+                    )
+                )
+            else:
+                await session.execute(
+                    update(ExecutionLogArchive)
+                    .where(ExecutionLogArchive.id == archive.id)
+                    .values(**values)
+                )
+
+            if delete_lines:
+                await session.execute(
+                    delete(ExecutionLog).where(
+                        ExecutionLog.execution_id == execution_id,
+                        ExecutionLog.id <= rows[-1][0]
+                    )
+                )
+            await session.commit()
+            return len(rows)
+        except Exception:
+            await session.rollback()
+            raise
+
+    async def is_logs_table_partitioned(self, session: AsyncSession) -> bool:
+        """
+        Check whether execution_logs is a partitioned table.
+
+        Args:
+            session: Database session (PostgreSQL)
+
+        Returns:
+            True if execution_logs is partitioned
+        """
+        result = await session.execute(text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = 'execution_logs'"
+        ))
+        return result.first() is not None
+
+    async def list_log_partitions(self, session: AsyncSession) -> List[Tuple[str, date]]:
+        """
+        List the monthly partitions of execution_logs.
+
+        Args:
+            session: Database session (PostgreSQL)
+
+        Returns:
+            (partition name, first day of its month), oldest first; the default
+            partition and partitions named otherwise are not included
+        """
+        result = await session.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'execution_logs'"
+        ))
+        partitions = []
+        for (name,) in result.fetchall():
+            match = _PARTITION_NAME_RE.match(name)
+            if match:
+                partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    async def create_log_partition(self, session: AsyncSession, month_start: date) -> str:
+        """
+        Create the execution_logs partition for a month if it does not exist.
+
+        Args:
+            session: Database session (PostgreSQL)
+            month_start: First day of the month
+
+        Returns:
+            Name of the partition
+        """
+        name = log_partition_name(month_start)
+        await session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF execution_logs "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month(month_start).isoformat()}')"
+        ))
+        await session.commit()
+        return name
+
+    async def partition_has_unarchived_logs(self, session: AsyncSession, name: str) -> bool:
+        """
+        Check whether a partition holds log lines of executions without an archive.
+
+        Args:
+            session: Database session (PostgreSQL)
+            name: Partition name from list_log_partitions
+
+        Returns:
+            True if dropping the partition would lose logs
+        """
+        result = await session.execute(text(
+            f"SELECT 1 FROM {name} l WHERE NOT EXISTS ("
+            f"SELECT 1 FROM execution_log_archives a WHERE a.execution_id = l.execution_id"
+            f") LIMIT 1"
+        ))
+        return result.first() is not None
+
+    async def drop_log_partition(self, session: AsyncSession, name: str) -> None:
+        """
+        Drop a partition of execution_logs.
+
+        Args:
+            session: Database session (PostgreSQL)
+            name: Partition name from list_log_partitions
+        """
+        await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        await session.commit()
+
+    async def delete_archived_lines(self, session: AsyncSession, before: datetime, batch_size: int) -> int:
+        """
+        Delete live log lines, older than ``before``, of executions that have an archive.
+
+        On a partitioned table this removes the lines of archived executions
+        that spill into a partition that is not dropped yet.
+
+        Args:
+            session: Database session
+            before: Only delete lines older than this
+            batch_size: Maximum rows per DELETE
+
+        Returns:
+            Number of deleted lines
+        """
+        archived = select(ExecutionLogArchive.id).where(
+            ExecutionLogArchive.execution_id == ExecutionLog.execution_id
+        ).exists()
+        return await self._delete_in_batches(
+            session, ExecutionLog, and_(ExecutionLog.timestamp < before, archived), batch_size
+        )
+
+
+# Create a singleton instance
+execution_retention_repository = ExecutionRetentionRepository()
@@ -5,8 +5,9 @@ This module provides functions for CRUD operations on execution traces.
 """
 
 import logging
+from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import select, delete, update, func
+from sqlalchemy import select, delete, update, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -46,6 +47,79 @@ class ExecutionTraceRepository:
             logger.error(f"Database error creating execution trace: {str(e)}")
             raise
     
+    async def _create_many(self, session: AsyncSession, traces: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert several execution traces with a single multi-row INSERT using provided session.
+        
+        Traces without a run_id get it from executionhistory with one lookup for
+        all their job_ids; jobs that do not exist yet are auto-created, as in create.
+        
+        Args:
+            session: Database session
+            traces: List of dictionaries with trace data
+            
+        Returns:
+            Mapping of job_id to run_id for every job that had to be resolved
+        """
+        if not traces:
+            return {}
+        
+        try:
+            unresolved = {
+                trace["job_id"] for trace in traces
+                if trace.get("job_id") and trace.get("run_id") is None
+            }
+            run_ids: Dict[str, int] = {}
+            if unresolved:
+                stmt = select(ExecutionHistory.job_id, ExecutionHistory.id).where(
+                    ExecutionHistory.job_id.in_(unresolved)
+                )
+                result = await session.execute(stmt)
+                run_ids = {job_id: run_id for job_id, run_id in result.all()}
+                
+                missing = unresolved - run_ids.keys()
+                if missing:
+                    job_records = [
+                        ExecutionHistory(
+                            job_id=job_id,
+                            status="running",
+                            trigger_type="api",
+                            run_name="Auto-created for trace",
+                            inputs={"auto_created": True}
+                        )
+                        for job_id in missing
+                    ]
+                    session.add_all(job_records)
+                    # Flush to get the IDs; committed together with the traces
+                    await session.flush()
+                    for job_record in job_records:
+                        run_ids[job_record.job_id] = job_record.id
+                    logger.info(f"Created job records for {len(missing)} unknown jobs before adding execution traces")
+            
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "run_id": trace.get("run_id") if trace.get("run_id") is not None else run_ids.get(trace.get("job_id")),
+                    "job_id": trace.get("job_id"),
+                    "event_source": trace["event_source"],
+                    "event_context": trace["event_context"],
+                    "event_type": trace["event_type"],
+                    "output": trace.get("output"),
+                    "trace_metadata": trace.get("trace_metadata"),
+                    "created_at": trace.get("created_at") or now,
+                    "group_id": trace.get("group_id"),
+                    "group_email": trace.get("group_email"),
+                }
+                for trace in traces
+            ]
+            await session.execute(insert(ExecutionTrace).values(rows))
+            await session.commit()
+            return run_ids
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.error(f"Database error creating {len(traces)} execution traces: {str(e)}")
+            raise
+    
     async def _get_by_id(self, session: AsyncSession, trace_id: int) -> Optional[ExecutionTrace]:
         """
         Get an execution trace by ID with provided session.
@@ -65,12 +139,36 @@ class ExecutionTraceRepository:
             logger.error(f"Database error retrieving execution trace {trace_id}: {str(e)}")
             raise
     
+    @staticmethod
+    def _apply_cursor(stmt, after_id: Optional[int] = None, since: Optional[datetime] = None):
+        """
+        Restrict a trace query to rows after an incremental-fetch cursor.
+        
+        With ``after_id`` the rows are ordered by ID so the last row of a page
+        is the cursor for the next one.
+        
+        Args:
+            stmt: Select statement over ExecutionTrace
+            after_id: Only keep traces with an ID greater than this
+            since: Only keep traces created later than this
+            
+        Returns:
+            The restricted select statement
+        """
+        if since is not None:
+            stmt = stmt.where(ExecutionTrace.created_at > since)
+        if after_id is not None:
+            stmt = stmt.where(ExecutionTrace.id > after_id).order_by(ExecutionTrace.id)
+        return stmt
+    
     async def _get_by_run_id(
         self, 
         session: AsyncSession, 
         run_id: int,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by run_id with provided session.
@@ -80,12 +178,15 @@ class ExecutionTraceRepository:
             run_id: Run ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            after_id: Only return traces with an ID greater than this, in ID order
+            since: Only return traces created later than this
             
         Returns:
             List of ExecutionTrace records
         """
         try:
             stmt = select(ExecutionTrace).where(ExecutionTrace.run_id == run_id)
+            stmt = self._apply_cursor(stmt, after_id, since)
             
             if offset is not None:
                 stmt = stmt.offset(offset)
@@ -103,7 +204,9 @@ class ExecutionTraceRepository:
         session: AsyncSession, 
         job_id: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by job_id with provided session.
@@ -113,12 +216,15 @@ class ExecutionTraceRepository:
             job_id: Job ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            after_id: Only return traces with an ID greater than this, in ID order
+            since: Only return traces created later than this
             
         Returns:
             List of ExecutionTrace records
         """
         try:
             stmt = select(ExecutionTrace).where(ExecutionTrace.job_id == job_id)
+            stmt = self._apply_cursor(stmt, after_id, since)
             
             if offset is not None:
                 stmt = stmt.offset(offset)
@@ -351,6 +457,19 @@ class ExecutionTraceRepository:
             # Now create the trace with the existing or newly created job
             return await self._create(session, trace_data)
     
+    async def create_many(self, traces: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Create several execution trace records in one transaction.
+        
+        Args:
+            traces: List of dictionaries with trace data
+            
+        Returns:
+            Mapping of job_id to run_id for every job that had to be resolved
+        """
+        async with async_session_factory() as session:
+            return await self._create_many(session, traces)
+    
     async def get_by_id(self, trace_id: int) -> Optional[ExecutionTrace]:
         """
         Get an execution trace by ID.
@@ -368,7 +487,9 @@ class ExecutionTraceRepository:
         self, 
         run_id: int,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by run_id.
@@ -377,18 +498,22 @@ class ExecutionTraceRepository:
             run_id: Run ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            after_id: Only return traces with an ID greater than this, in ID order
+            since: Only return traces created later than this
             
         Returns:
             List of ExecutionTrace records
         """
         async with async_session_factory() as session:
-            return await self._get_by_run_id(session, run_id, limit, offset)
+            return await self._get_by_run_id(session, run_id, limit, offset, after_id, since)
     
     async def get_by_job_id(
         self, 
         job_id: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by job_id.
@@ -397,12 +522,14 @@ class ExecutionTraceRepository:
             job_id: Job ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            after_id: Only return traces with an ID greater than this, in ID order
+            since: Only return traces created later than this
             
         Returns:
             List of ExecutionTrace records
         """
         async with async_session_factory() as session:
-            return await self._get_by_job_id(session, job_id, limit, offset)
+            return await self._get_by_job_id(session, job_id, limit, offset, after_id, since)
     
     async def get_all_traces(
         self,
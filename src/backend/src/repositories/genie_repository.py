@@ -11,10 +11,8 @@ import os
 import time
 from typing import Optional, Dict, Any, List, Tuple
 import httpx
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
+from src.core.http_client_pool import get_http_client_pool
 from src.schemas.genie import (
     GenieSpace,
     GenieSpacesResponse,
@@ -64,16 +62,8 @@ class GenieRepository:
         self._setup_session()
     
     def _setup_session(self):
-        """Setup requests session with retry logic."""
-        self._session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
+        """Use the shared keep-alive session of the workspace, with retry logic."""
+        self._session = get_http_client_pool().sync_client()
     
     @property
     def base_url(self) -> str:
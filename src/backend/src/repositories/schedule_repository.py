@@ -99,6 +99,17 @@ class ScheduleRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
+    async def find_active(self) -> List[Schedule]:
+        """
+        Find all active schedules.
+
+        Returns:
+            List of active Schedule objects
+        """
+        query = select(Schedule).where(Schedule.is_active == True)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def find_due_schedules(self, current_time) -> List[Schedule]:
         """
         Find all schedules that are due to run.
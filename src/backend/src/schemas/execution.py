@@ -113,6 +113,12 @@ class ExecutionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ExecutionPageResponse(BaseModel):
+    """One page of executions with the cursor for the next page"""
+    items: List[ExecutionResponse] = Field(default_factory=list, description="Executions on this page, newest first")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page")
+
+
 class ExecutionCreateResponse(BaseModel):
     """Simple response for execution creation."""
     execution_id: str = Field(..., description="Unique identifier for the created execution")
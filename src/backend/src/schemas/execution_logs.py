@@ -20,6 +20,7 @@ class LogMessage(BaseModel):
 
 class ExecutionLogResponse(BaseModel):
     """Schema for execution log responses."""
+    id: Optional[int] = Field(None, description="ID of the log entry, usable as an after_id cursor")
     content: str = Field(..., description="Content of the log message")
     timestamp: str = Field(..., description="ISO-formatted timestamp when the log was created")
 
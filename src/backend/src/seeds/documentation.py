@@ -445,27 +445,31 @@ async def seed_documentation_embeddings(user_token: Optional[str] = None) -> Non
                 chunks = await create_documentation_chunks(url)
                 logger.info(f"Created {len(chunks)} chunks for {url}")
                 
-                # Create embedding for each chunk and store in database
-                for chunk in chunks:
+                # Embed all chunks of the page with one batched call
+                chunk_embeddings = [None] * len(chunks)
+                if chunks and not use_mock_embeddings and embedding_available:
                     try:
-                        # Create embedding - use real if available, otherwise mock
-                        if use_mock_embeddings or not embedding_available:
-                            embedding = await mock_create_embedding(chunk["content"])
-                        else:
-                            try:
-                                embedder_config = {
-                                    'provider': 'databricks',
-                                    'config': {'model': EMBEDDING_MODEL}
-                                }
-                                embedding = await LLMManager.get_embedding(
-                                    text=chunk["content"],
-                                    model=EMBEDDING_MODEL,
-                                    embedder_config=embedder_config
-                                )
-                            except Exception as e:
+                        embedder_config = {
+                            'provider': 'databricks',
+                            'config': {'model': EMBEDDING_MODEL}
+                        }
+                        chunk_embeddings = await LLMManager.get_embeddings(
+                            [chunk["content"] for chunk in chunks],
+                            model=EMBEDDING_MODEL,
+                            embedder_config=embedder_config
+                        )
+                    except Exception as e:
+                        logger.debug(f"Batch embedding failed for {url}, using mock embeddings: {str(e)}")
+                
+                # Store each chunk in database
+                for chunk, embedding in zip(chunks, chunk_embeddings):
+                    try:
+                        # Use the real embedding if available, otherwise mock
+                        if embedding is None:
+                            if not use_mock_embeddings and embedding_available:
                                 # If embedding fails after initial test passed, use mock for this chunk
-                                logger.debug(f"Embedding failed for chunk, using mock: {str(e)}")
-                                embedding = await mock_create_embedding(chunk["content"])
+                                logger.debug("Embedding failed for chunk, using mock")
+                            embedding = await mock_create_embedding(chunk["content"])
                         
                         # Create schema for database record
                         doc_embedding_create = DocumentationEmbeddingCreate(
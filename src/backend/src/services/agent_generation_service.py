@@ -10,16 +10,18 @@ import logging
 import json
 import os
 import traceback
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
 
 import litellm
 
 from src.models.log import LLMLog
 from src.utils.prompt_utils import robust_json_parser
+from src.utils.streaming_json import ANY, IncrementalJSONParser, iter_completion_text
 from src.services.template_service import TemplateService
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.prompt_cache import add_prompt_cache_hints
 from src.utils.user_context import GroupContext
 
 # Configure logging
@@ -133,6 +135,60 @@ class AgentGenerationService:
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise
     
+    async def stream_agent(self, prompt_text: str, model: str = None, tools: List[str] = None,
+                           group_context: Optional[GroupContext] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate an agent configuration while streaming the generation.
+        
+        Args:
+            prompt_text: Natural language description of the agent
+            model: Model to use for generation, defaults to environment variable or "databricks-llama-4-maverick"
+            tools: List of tools available to the agent (ignored, see generate_agent)
+            group_context: Optional group context for multi-group isolation
+            
+        Yields:
+            Events as {"event": ..., "data": ...}: "token" for each text delta,
+            "field" for each top-level field as soon as it is complete, then
+            "complete" with the processed configuration, or "error"
+        """
+        model = model or os.getenv("AGENT_MODEL", "databricks-llama-4-maverick")
+        logger.info(f"Streaming agent generation with model: {model}")
+        
+        try:
+            system_message = await self._prepare_prompt_template([])
+            messages = [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt_text}
+            ]
+            model_params = await LLMManager.configure_litellm(model)
+            response = await litellm.acompletion(
+                **model_params,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
+                temperature=0.7,
+                max_tokens=4000,
+                stream=True
+            )
+            
+            parser = IncrementalJSONParser([(ANY,)])
+            async for delta in iter_completion_text(response):
+                yield {"event": "token", "data": {"text": delta}}
+                for path, value in parser.feed(delta):
+                    yield {"event": "field", "data": {"name": path[0], "value": value}}
+            
+            agent_config = self._process_agent_config(robust_json_parser(parser.text), model)
+            await self._log_llm_interaction(
+                endpoint='generate-agent',
+                prompt=f"System: {system_message}\nUser: {prompt_text}",
+                response=json.dumps(agent_config),
+                model=model,
+                group_context=group_context
+            )
+            yield {"event": "complete", "data": agent_config}
+        except Exception as e:
+            logger.error(f"Error streaming agent generation: {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            yield {"event": "error", "data": {"message": f"Failed to generate agent configuration: {str(e)}"}}
+    
     async def _prepare_prompt_template(self, tools: List[str]) -> str:
         """
         Prepare the prompt template with tools context.
@@ -188,7 +244,7 @@ class AgentGenerationService:
             # Use the rate limit handler utility to handle potential rate limit errors
             response = await litellm.acompletion(
                 **model_params,
-                messages=messages,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
                 temperature=0.7,
                 max_tokens=4000
             )
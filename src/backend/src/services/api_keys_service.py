@@ -11,6 +11,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.core.api_key_cache import ApiKeyCache, get_api_key_cache
 from src.core.base_service import BaseService
 from src.models.api_key import ApiKey
 from src.repositories.api_key_repository import ApiKeyRepository
@@ -76,6 +77,18 @@ class ApiKeysService(BaseService):
         
         return self.repository.find_by_name_sync(name)
     
+    async def find_by_names(self, names: List[str]) -> List[ApiKey]:
+        """
+        Find several API keys by name in a single query.
+        
+        Args:
+            names: Names to search for
+            
+        Returns:
+            List of the API keys found
+        """
+        return await self.repository.find_by_names(names)
+    
     async def create_api_key(self, api_key_data: ApiKeyCreate) -> ApiKey:
         """
         Create a new API key with encrypted value.
@@ -98,6 +111,7 @@ class ApiKeysService(BaseService):
         
         # Save to database
         created_key = await self.repository.create(api_key_dict)
+        get_api_key_cache().invalidate(api_key_data.name)
         
         # For the response, we need to set the decrypted value
         # This won't be saved to the database, it's just for the API response
@@ -131,6 +145,7 @@ class ApiKeysService(BaseService):
         
         # Update in database
         updated_key = await self.repository.update(api_key.id, update_dict)
+        get_api_key_cache().invalidate(name)
         
         # For the response, we need to set the decrypted value
         # This won't be saved to the database, it's just for the API response
@@ -154,7 +169,9 @@ class ApiKeysService(BaseService):
             return False
         
         # Delete from database
-        return await self.repository.delete(api_key.id)
+        deleted = await self.repository.delete(api_key.id)
+        get_api_key_cache().invalidate(name)
+        return deleted
     
     async def get_all_api_keys(self) -> List[ApiKey]:
         """
@@ -214,6 +231,11 @@ class ApiKeysService(BaseService):
             key_name = db
             db = None
         
+        cache = get_api_key_cache()
+        cached = cache.get(key_name)
+        if cached is not ApiKeyCache.MISSING:
+            return cached
+        
         # Create a service instance using UnitOfWork pattern
         from src.core.unit_of_work import UnitOfWork
         async with UnitOfWork() as uow:
@@ -222,11 +244,15 @@ class ApiKeysService(BaseService):
             # Find the API key
             api_key = await service.find_by_name(key_name)
             if not api_key:
+                cache.put(key_name, None)
                 return None
             
             # Decrypt and return the value
             try:
-                return EncryptionUtils.decrypt_value(api_key.encrypted_value)
+                value = EncryptionUtils.decrypt_value(api_key.encrypted_value)
+                if value:
+                    cache.put(key_name, value)
+                return value
             except Exception as e:
                 logger.error(f"Error decrypting API key '{key_name}': {str(e)}")
                 return None
@@ -438,6 +464,7 @@ class ApiKeysService(BaseService):
         """
         Get API key for a specific provider using the repository pattern.
         This method handles encryption/decryption and doesn't require a db session.
+        Values are served from the in-process API key cache when available.
         
         Args:
             provider: Provider name (e.g., 'openai', 'anthropic', 'deepseek')
@@ -445,22 +472,30 @@ class ApiKeysService(BaseService):
         Returns:
             Decrypted API key if found, None otherwise
         """
+        # Provider keys are stored with an _API_KEY suffix
+        key_name = f"{provider.upper()}_API_KEY"
+        cache = get_api_key_cache()
+        cached = cache.get(key_name)
+        if cached is not ApiKeyCache.MISSING:
+            return cached
+        
         try:
             # Create a service instance using UnitOfWork pattern
             from src.core.unit_of_work import UnitOfWork
             async with UnitOfWork() as uow:
                 service = await cls.from_unit_of_work(uow)
                 
-                # Find the API key by name (provider name with _API_KEY suffix)
-                key_name = f"{provider.upper()}_API_KEY"
                 api_key = await service.find_by_name(key_name)
                 if not api_key:
                     logger.warning(f"No API key found for provider: {provider}")
+                    cache.put(key_name, None)
                     return None
                 
                 # Decrypt the API key value
                 try:
                     decrypted_value = EncryptionUtils.decrypt_value(api_key.encrypted_value)
+                    if decrypted_value:
+                        cache.put(key_name, decrypted_value)
                     return decrypted_value
                 except Exception as e:
                     logger.error(f"Error decrypting API key for provider {provider}: {str(e)}")
@@ -11,18 +11,20 @@ import logging
 import os
 import traceback
 import uuid
-from typing import Dict, Any, List, Tuple, Optional
+from typing import AsyncIterator, Dict, Any, List, Tuple, Optional
 
 
 import litellm
 
 from src.utils.prompt_utils import robust_json_parser
+from src.utils.streaming_json import ANY, IncrementalJSONParser, iter_completion_text
 from src.services.template_service import TemplateService
 from src.services.tool_service import ToolService
 from src.services.documentation_embedding_service import DocumentationEmbeddingService
 from src.schemas.crew import CrewGenerationRequest, CrewGenerationResponse
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.prompt_cache import add_prompt_cache_hints, get_prompt_cache
 from src.models.agent import Agent
 from src.models.task import Task
 from src.repositories.crew_generator_repository import CrewGeneratorRepository
@@ -110,6 +112,13 @@ class CrewGenerationService:
         if not system_message:
             raise ValueError("Required prompt template 'generate_crew' not found in database")
         
+        # Reuse the prompt rendered for the same template version and tool set
+        cache = get_prompt_cache()
+        cache_key = cache.rendered_key("generate_crew", system_message, tools)
+        rendered = cache.get_rendered(cache_key)
+        if rendered is not None:
+            return rendered
+        
         # Build tools context for the prompt with detailed descriptions
         tools_context = ""
         if tools:
@@ -137,7 +146,9 @@ class CrewGenerationService:
                 tools_context += "\n\nFor NL2SQLTool, use the following format for input: {'sql_query': <your_query>}"
         
         # Add tools context to the system message
-        return system_message + tools_context
+        rendered = system_message + tools_context
+        cache.put_rendered(cache_key, rendered)
+        return rendered
     
     def _process_crew_setup(self, setup: Dict[str, Any], allowed_tools: List[Dict[str, Any]], tool_name_to_id_map: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -189,128 +200,146 @@ class CrewGenerationService:
             logger.error("Missing or empty 'tasks' array in LLM response")
             raise ValueError("Missing or empty 'tasks' array in response")
             
-        # Validate agent fields
+        # Validate all agents before processing any of them
         for i, agent in enumerate(setup["agents"]):
-            agent_name = agent.get('name', f'Agent_{i}')
-            logger.info(f"VALIDATING: Agent '{agent_name}'")
-            
-            required_agent_fields = ["name", "role", "goal", "backstory"]
-            for field in required_agent_fields:
-                if field not in agent:
-                    logger.error(f"Agent '{agent_name}' is missing required field: {field}")
-                    raise ValueError(f"Missing required field '{field}' in agent {i}")
+            self._validate_agent(agent, i)
         
-        # Filter agent tools to only include allowed tools and convert tool names to IDs
         for agent in setup['agents']:
-            agent_name = agent.get('name', 'Unknown')
-            
-            if 'tools' in agent and isinstance(agent['tools'], list):
-                original_tools = agent['tools'].copy()
-                
-                # First filter tools to include only allowed ones
-                filtered_tools = [tool for tool in agent['tools'] if tool in allowed_tool_names]
-                
-                if len(filtered_tools) != len(original_tools):
-                    removed_tools = [tool for tool in original_tools if tool not in allowed_tool_names]
-                    logger.info(f"TOOLS: Removed tools from agent '{agent_name}': {removed_tools}")
-                    logger.info(f"TOOLS: Remaining tools for agent '{agent_name}': {filtered_tools}")
-                
-                # Convert tool names to IDs
-                tool_ids = []
-                for tool_name in filtered_tools:
-                    if tool_name in tool_name_to_id_map:
-                        tool_ids.append(tool_name_to_id_map[tool_name])
-                    else:
-                        logger.warning(f"Could not find ID for tool: {tool_name}")
-                        # Keep the name as is if ID not found
-                        tool_ids.append(tool_name)
-                
-                agent['tools'] = tool_ids
-                logger.info(f"TOOLS: Converted tool names to IDs for agent '{agent_name}': {agent['tools']}")
-                
-            # Remove any existing ID to let the database generate it
-            if 'id' in agent:
-                logger.info(f"PROCESSING: Removing existing ID from agent '{agent_name}': {agent['id']}")
-                del agent['id']
-            
-            # Ensure tools is a list
-            if not isinstance(agent.get('tools'), list):
-                logger.info(f"PROCESSING: Initializing empty tools list for agent '{agent_name}'")
-                agent['tools'] = []
+            self._process_agent(agent, allowed_tool_names, tool_name_to_id_map)
         
-        # Filter task tools to only include allowed tools and convert to IDs
         for task in setup['tasks']:
-            task_name = task.get('name', 'Unknown')
-            
-            # Debug log task fields
-            logger.info(f"TASK FIELDS: Task '{task_name}' has fields: {list(task.keys())}")
-            
-            # Process Tools (existing logic)
-            if 'tools' in task and isinstance(task['tools'], list):
-                original_tools = task['tools'].copy()
-                filtered_tools = [tool for tool in task['tools'] if tool in allowed_tool_names]
-                
-                # Convert tool names to IDs
-                tool_ids = []
-                for tool_name in filtered_tools:
-                    if tool_name in tool_name_to_id_map:
-                        tool_ids.append(tool_name_to_id_map[tool_name])
-                    else:
-                        logger.warning(f"Could not find ID for tool: {tool_name}")
-                        # Keep the name as is if ID not found
-                        tool_ids.append(tool_name)
-                
-                task['tools'] = tool_ids
-                
-                if len(filtered_tools) != len(original_tools):
-                    removed_tools = [tool for tool in original_tools if tool not in allowed_tool_names]
-                    logger.info(f"TOOLS: Removed tools from task '{task_name}': {removed_tools}")
-                logger.info(f"TOOLS: Converted tool names to IDs for task '{task_name}': {task['tools']}")
-            
-            if not isinstance(task.get('tools'), list):
-                 task['tools'] = [] # Ensure tools is a list
-                 
-            # Remove any existing ID to let the database generate it
-            if 'id' in task:
-                logger.info(f"PROCESSING: Removing existing ID from task '{task_name}': {task['id']}")
-                del task['id']
-                
-            # --- Start: Process Context/Dependencies ---
-            raw_context = task.get('context')
-            if isinstance(raw_context, list) and len(raw_context) > 0:
-                # Assume context from LLM contains dependency names/refs
-                # Store these raw refs temporarily for the repository to resolve later
-                task['_context_refs'] = raw_context
-                logger.info(f"PROCESSING: Stored {len(raw_context)} context refs for task '{task_name}': {raw_context}")
-            else:
-                # Ensure _context_refs doesn't exist if context is empty/invalid
-                if '_context_refs' in task:
-                    del task['_context_refs']
-                    
-            # Explicitly set the main context field to an empty list for initial creation
-            # The repository will populate this later using _context_refs
-            task['context'] = []
-            logger.info(f"PROCESSING: Initialized empty context list for task '{task_name}' (refs stored separately)")
-            # --- End: Process Context/Dependencies ---
-                
-            # Log agent assignment for this task AGAIN to ensure it's preserved
-            agent_name = task.get('agent')
-            if not agent_name:
-                agent_name = task.get('assigned_agent')
-                
-            if agent_name:
-                logger.info(f"FINAL LLM STRUCTURE: Task '{task_name}' will be assigned to agent '{agent_name}'")
-                # Double-check both fields are set
-                task['agent'] = agent_name
-                task['assigned_agent'] = agent_name
-            else:
-                logger.warning(f"FINAL LLM STRUCTURE: Task '{task_name}' has no agent assignment")
+            self._process_task(task, allowed_tool_names, tool_name_to_id_map)
         
         logger.info("PROCESSING: Finished processing crew setup")
         return setup
+    
+    def _validate_agent(self, agent: Dict[str, Any], index: int) -> None:
+        """
+        Check that a generated agent has all required fields.
         
+        Args:
+            agent: Raw agent from the LLM
+            index: Position of the agent in the crew
+            
+        Raises:
+            ValueError: If a required field is missing
+        """
+        agent_name = agent.get('name', f'Agent_{index}')
+        logger.info(f"VALIDATING: Agent '{agent_name}'")
+        
+        required_agent_fields = ["name", "role", "goal", "backstory"]
+        for field in required_agent_fields:
+            if field not in agent:
+                logger.error(f"Agent '{agent_name}' is missing required field: {field}")
+                raise ValueError(f"Missing required field '{field}' in agent {index}")
     
+    def _convert_tool_names(self, tool_names: List[str], tool_name_to_id_map: Dict[str, str]) -> List[str]:
+        """Convert tool names to IDs, keeping names whose ID is unknown."""
+        tool_ids = []
+        for tool_name in tool_names:
+            if tool_name in tool_name_to_id_map:
+                tool_ids.append(tool_name_to_id_map[tool_name])
+            else:
+                logger.warning(f"Could not find ID for tool: {tool_name}")
+                # Keep the name as is if ID not found
+                tool_ids.append(tool_name)
+        return tool_ids
+    
+    def _process_agent(self, agent: Dict[str, Any], allowed_tool_names: List[str], tool_name_to_id_map: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Filter an agent's tools to allowed ones, convert them to IDs and drop LLM-provided IDs.
+        
+        Args:
+            agent: Validated agent from the LLM, updated in place
+            allowed_tool_names: Names of the tools the crew may use
+            tool_name_to_id_map: Mapping from tool names to their IDs
+            
+        Returns:
+            The processed agent
+        """
+        agent_name = agent.get('name', 'Unknown')
+        
+        if 'tools' in agent and isinstance(agent['tools'], list):
+            original_tools = agent['tools'].copy()
+            
+            # First filter tools to include only allowed ones
+            filtered_tools = [tool for tool in agent['tools'] if tool in allowed_tool_names]
+            
+            if len(filtered_tools) != len(original_tools):
+                removed_tools = [tool for tool in original_tools if tool not in allowed_tool_names]
+                logger.info(f"TOOLS: Removed tools from agent '{agent_name}': {removed_tools}")
+                logger.info(f"TOOLS: Remaining tools for agent '{agent_name}': {filtered_tools}")
+            
+            agent['tools'] = self._convert_tool_names(filtered_tools, tool_name_to_id_map)
+            logger.info(f"TOOLS: Converted tool names to IDs for agent '{agent_name}': {agent['tools']}")
+            
+        # Remove any existing ID to let the database generate it
+        if 'id' in agent:
+            logger.info(f"PROCESSING: Removing existing ID from agent '{agent_name}': {agent['id']}")
+            del agent['id']
+        
+        # Ensure tools is a list
+        if not isinstance(agent.get('tools'), list):
+            logger.info(f"PROCESSING: Initializing empty tools list for agent '{agent_name}'")
+            agent['tools'] = []
+        return agent
+    
+    def _process_task(self, task: Dict[str, Any], allowed_tool_names: List[str], tool_name_to_id_map: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Normalise a generated task: tools, agent assignment and context references.
+        
+        Args:
+            task: Task from the LLM, updated in place
+            allowed_tool_names: Names of the tools the crew may use
+            tool_name_to_id_map: Mapping from tool names to their IDs
+            
+        Returns:
+            The processed task
+        """
+        task_name = task.get('name', 'Unknown')
+        
+        # Debug log task fields
+        logger.info(f"TASK FIELDS: Task '{task_name}' has fields: {list(task.keys())}")
+        
+        if 'tools' in task and isinstance(task['tools'], list):
+            original_tools = task['tools'].copy()
+            filtered_tools = [tool for tool in task['tools'] if tool in allowed_tool_names]
+            task['tools'] = self._convert_tool_names(filtered_tools, tool_name_to_id_map)
             
+            if len(filtered_tools) != len(original_tools):
+                removed_tools = [tool for tool in original_tools if tool not in allowed_tool_names]
+                logger.info(f"TOOLS: Removed tools from task '{task_name}': {removed_tools}")
+            logger.info(f"TOOLS: Converted tool names to IDs for task '{task_name}': {task['tools']}")
+        
+        if not isinstance(task.get('tools'), list):
+            task['tools'] = [] # Ensure tools is a list
+            
+        # Remove any existing ID to let the database generate it
+        if 'id' in task:
+            logger.info(f"PROCESSING: Removing existing ID from task '{task_name}': {task['id']}")
+            del task['id']
+        
+        # Assume context from LLM contains dependency names/refs. Store these raw
+        # refs for the repository to resolve once all tasks exist; the main
+        # context field starts empty.
+        raw_context = task.get('context')
+        if isinstance(raw_context, list) and len(raw_context) > 0:
+            task['_context_refs'] = raw_context
+            logger.info(f"PROCESSING: Stored {len(raw_context)} context refs for task '{task_name}': {raw_context}")
+        elif '_context_refs' in task:
+            del task['_context_refs']
+        task['context'] = []
+        
+        # Preserve the agent assignment in both fields
+        agent_name = task.get('agent') or task.get('assigned_agent')
+        if agent_name:
+            logger.info(f"FINAL LLM STRUCTURE: Task '{task_name}' will be assigned to agent '{agent_name}'")
+            task['agent'] = agent_name
+            task['assigned_agent'] = agent_name
+        else:
+            logger.warning(f"FINAL LLM STRUCTURE: Task '{task_name}' has no agent assignment")
+        return task
+    
     def _safe_get_attr(self, obj, attr, default=None):
         """
         Safely get an attribute from an object, whether it's a dictionary or an object.
@@ -395,6 +424,40 @@ class CrewGenerationService:
             logger.error(traceback.format_exc())
             return ""
 
+    async def _build_crew_messages(self, request: CrewGenerationRequest, tools_with_details: List[Dict[str, Any]]) -> Tuple[str, str, List[Dict[str, str]]]:
+        """
+        Build the LLM messages for a crew generation request.
+        
+        Args:
+            request: The crew generation request
+            tools_with_details: Tools available to the crew, with descriptions
+            
+        Returns:
+            Tuple of (system message, documentation context, messages)
+        """
+        # Get and prepare the prompt template with tool descriptions
+        system_message = await self._prepare_prompt_template(tools_with_details)
+        logger.info("CREATE CREW: Prepared prompt template with detailed tool information")
+        
+        # Get relevant documentation based on the user's prompt
+        documentation_context = await self._get_relevant_documentation(request.prompt)
+        
+        messages = [
+            {"role": "system", "content": system_message}
+        ]
+        
+        # Add documentation context if available
+        if documentation_context:
+            messages.append({
+                "role": "system", 
+                "content": "Here is some relevant documentation about CrewAI that may help you generate a better crew:\n\n" + documentation_context
+            })
+            logger.info("Added relevant documentation to enhance context")
+        
+        # Add the user's prompt
+        messages.append({"role": "user", "content": request.prompt})
+        return system_message, documentation_context, messages
+
     async def create_crew_complete(self, request: CrewGenerationRequest, group_context: Optional[GroupContext] = None) -> Dict[str, Any]:
         """
         Create a crew with agents and tasks.
@@ -422,28 +485,8 @@ class CrewGenerationService:
                 # Generate the crew using the LLM
                 model = request.model or os.getenv("CREW_MODEL", "databricks-llama-4-maverick")
                 
-                # Get and prepare the prompt template with tool descriptions
-                system_message = await self._prepare_prompt_template(tools_with_details)
-                logger.info("CREATE CREW: Prepared prompt template with detailed tool information")
-                
-                # Get relevant documentation based on the user's prompt
-                documentation_context = await self._get_relevant_documentation(request.prompt)
-                
-                # Prepare messages for the LLM
-                messages = [
-                    {"role": "system", "content": system_message}
-                ]
-                
-                # Add documentation context if available
-                if documentation_context:
-                    messages.append({
-                        "role": "system", 
-                        "content": "Here is some relevant documentation about CrewAI that may help you generate a better crew:\n\n" + documentation_context
-                    })
-                    logger.info("Added relevant documentation to enhance context")
-                
-                # Add the user's prompt
-                messages.append({"role": "user", "content": request.prompt})
+                # Prepare the prompt with tool descriptions and relevant documentation
+                system_message, documentation_context, messages = await self._build_crew_messages(request, tools_with_details)
                 
                 # Configure litellm using the LLMManager
                 model_params = await LLMManager.configure_litellm(model)
@@ -454,7 +497,7 @@ class CrewGenerationService:
                     logger.info("CREATE CREW: Calling LLM API...")
                     response = await litellm.acompletion(
                         **model_params,
-                        messages=messages,
+                        messages=add_prompt_cache_hints(messages, model_params.get("model")),
                         temperature=0.7,
                         max_tokens=4000
                     )
@@ -557,6 +600,158 @@ class CrewGenerationService:
             logger.error(f"CREATE CREW: Exception traceback: {traceback.format_exc()}")
             raise
 
+    async def stream_crew_complete(self, request: CrewGenerationRequest, group_context: Optional[GroupContext] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Create a crew while streaming the generation.
+        
+        The completion is streamed and parsed incrementally: every agent is
+        validated and stored as soon as its JSON object is complete, and tasks
+        follow once all agents exist (tasks generated before the end of the
+        agents list wait for it). Task dependencies are linked at the end. If
+        generation fails, or the stream is closed or cancelled before the crew
+        is complete, the entities created so far are deleted.
+        
+        Args:
+            request: The crew generation request with prompt, model, and tool information
+            group_context: Optional group context for multi-group isolation
+            
+        Yields:
+            Events as {"event": ..., "data": ...}: "token" for each text delta,
+            "agent" and "task" for each stored entity, then "complete" with
+            all agents and tasks, or "error"
+        """
+        created_agents: List[Agent] = []
+        created_tasks: List[Task] = []
+        tasks_data: List[Dict[str, Any]] = []
+        pending_tasks: List[Dict[str, Any]] = []
+        agent_name_to_id: Dict[str, str] = {}
+        round_robin_idx = 0
+        model = request.model or os.getenv("CREW_MODEL", "databricks-llama-4-maverick")
+        system_message = documentation_context = ""
+        content = ""
+        completed = cleaned_up = False
+        
+        async def delete_partial_crew() -> None:
+            nonlocal cleaned_up
+            cleaned_up = True
+            if not created_agents and not created_tasks:
+                return
+            try:
+                await self.crew_generator_repository.delete_crew_entities(
+                    [agent.id for agent in created_agents],
+                    [task.id for task in created_tasks]
+                )
+            except Exception as cleanup_error:
+                logger.error(f"CREATE CREW: Failed to delete partially created crew: {cleanup_error}")
+        
+        try:
+            async with UnitOfWork() as uow:
+                tool_service = await ToolService.from_unit_of_work(uow)
+                tools_with_details = await self._get_tool_details(request.tools or [], tool_service)
+            tool_name_to_id_map = self._create_tool_name_to_id_map(tools_with_details)
+            allowed_tool_names = [t.get('name') for t in tools_with_details if t.get('name')]
+            
+            system_message, documentation_context, messages = await self._build_crew_messages(request, tools_with_details)
+            model_params = await LLMManager.configure_litellm(model)
+            
+            async def store_agent(agent: Dict[str, Any]) -> Dict[str, Any]:
+                self._validate_agent(agent, len(created_agents))
+                self._process_agent(agent, allowed_tool_names, tool_name_to_id_map)
+                db_agent = await self.crew_generator_repository.create_agent(agent)
+                created_agents.append(db_agent)
+                agent_name_to_id[db_agent.name] = db_agent.id
+                return self.crew_generator_repository.serialize_agent(db_agent)
+            
+            async def store_task(task: Dict[str, Any]) -> Dict[str, Any]:
+                nonlocal round_robin_idx
+                self._process_task(task, allowed_tool_names, tool_name_to_id_map)
+                db_task, round_robin_idx = await self.crew_generator_repository.create_task(
+                    task, agent_name_to_id, round_robin_idx, index=len(created_tasks)
+                )
+                created_tasks.append(db_task)
+                tasks_data.append(task)
+                return self.crew_generator_repository.serialize_task(db_task)
+            
+            logger.info("CREATE CREW: Streaming LLM API call...")
+            response = await litellm.acompletion(
+                **model_params,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
+                temperature=0.7,
+                max_tokens=4000,
+                stream=True
+            )
+            
+            parser = IncrementalJSONParser([("agents", ANY), ("tasks", ANY)])
+            async for delta in iter_completion_text(response):
+                yield {"event": "token", "data": {"text": delta}}
+                for path, value in parser.feed(delta):
+                    if not isinstance(value, dict):
+                        continue
+                    if path[0] == "agents":
+                        yield {"event": "agent", "data": await store_agent(value)}
+                    else:
+                        pending_tasks.append(value)
+                if pending_tasks and ("agents",) in parser.closed_paths:
+                    for task in pending_tasks:
+                        yield {"event": "task", "data": await store_task(task)}
+                    pending_tasks.clear()
+            content = parser.text
+            
+            await self._log_llm_interaction(
+                endpoint='generate-crew',
+                prompt=f"System: {system_message}\nDocumentation: {documentation_context}\nUser: {request.prompt}",
+                response=content,
+                model=model,
+                group_context=group_context
+            )
+            
+            if parser.failed or not parser.done:
+                # Not parseable incrementally: store whatever the full parse has beyond what was streamed
+                crew_setup = robust_json_parser(content)
+                agents = crew_setup.get("agents") if isinstance(crew_setup, dict) else None
+                tasks = crew_setup.get("tasks") if isinstance(crew_setup, dict) else None
+                for agent in (agents or [])[len(created_agents):]:
+                    yield {"event": "agent", "data": await store_agent(agent)}
+                pending_tasks = (tasks or [])[len(created_tasks):]
+            
+            if not created_agents:
+                raise ValueError("Missing or empty 'agents' array in response")
+            for task in pending_tasks:
+                yield {"event": "task", "data": await store_task(task)}
+            if not created_tasks:
+                raise ValueError("Missing or empty 'tasks' array in response")
+            
+            await self.crew_generator_repository.link_task_dependencies(created_tasks, tasks_data)
+            logger.info(f"CREATE CREW: Streamed crew with {len(created_agents)} agents and {len(created_tasks)} tasks")
+            completed = True
+            yield {
+                "event": "complete",
+                "data": {
+                    "agents": [self.crew_generator_repository.serialize_agent(agent) for agent in created_agents],
+                    "tasks": [self.crew_generator_repository.serialize_task(task) for task in created_tasks]
+                }
+            }
+        except Exception as e:
+            error_msg = f"Error generating crew: {str(e)}"
+            logger.error(f"CREATE CREW: {error_msg}")
+            logger.error(f"CREATE CREW: Exception traceback: {traceback.format_exc()}")
+            await delete_partial_crew()
+            await self._log_llm_interaction(
+                endpoint='generate-crew',
+                prompt=f"System: {system_message}\nUser: {request.prompt}",
+                response=content,
+                model=model,
+                status='error',
+                error_message=error_msg,
+                group_context=group_context
+            )
+            yield {"event": "error", "data": {"message": error_msg}}
+        finally:
+            if not completed and not cleaned_up:
+                # The consumer closed the stream (client disconnect) or the task was cancelled
+                logger.warning("CREATE CREW: Stream closed before the crew was complete, deleting partial crew")
+                await delete_partial_crew()
+
     def _create_tool_name_to_id_map(self, tools: List[Dict[str, Any]]) -> Dict[str, str]:
         """
         Create a mapping from tool names to tool IDs.
@@ -601,10 +796,15 @@ class CrewGenerationService:
         detailed_tools = []
         
         try:
-            # Get all available tools using the provided service
-            tools_response = await tool_service.get_all_tools()
-            all_tools = tools_response.tools
-            logger.info(f"Retrieved {len(all_tools)} tools from tool service")
+            # Get all available tools, from the catalogue cache if possible
+            cache = get_prompt_cache()
+            all_tools = cache.get_tools()
+            if all_tools is None:
+                version = cache.tools_version
+                tools_response = await tool_service.get_all_tools()
+                all_tools = tools_response.tools
+                cache.put_tools(all_tools, version=version)
+                logger.info(f"Retrieved {len(all_tools)} tools from tool service")
             
             # Create lookup maps for faster tool retrieval
             tools_by_name = {tool.title: tool for tool in all_tools if hasattr(tool, 'title')}
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logger import LoggerManager
 from src.config.settings import settings
-from src.repositories.database_backup_repository import DatabaseBackupRepository
+from src.repositories.database_backup_repository import DatabaseBackupRepository, ProgressCallback
 from src.services.databricks_role_service import DatabricksRoleService
 from src.db.session import async_session_factory
 
@@ -56,7 +56,8 @@ class DatabaseManagementService:
         schema: str,
         volume_name: str = "kasal_backups",
         export_format: str = "native",
-        session: Optional[AsyncSession] = None
+        session: Optional[AsyncSession] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Export database to a Databricks volume.
@@ -66,6 +67,8 @@ class DatabaseManagementService:
             schema: Databricks schema name
             volume_name: Volume name (default: kasal_backups)
             session: Optional database session (for PostgreSQL)
+            progress_callback: Optional callable receiving per-chunk progress
+                dictionaries while PostgreSQL tables are exported
             
         Returns:
             Export result with volume path and Databricks URL
@@ -131,7 +134,9 @@ class DatabaseManagementService:
                         schema=schema,
                         volume_name=volume_name,
                         backup_filename=backup_filename,
-                        export_format=postgres_export_format
+                        export_format=postgres_export_format,
+                        session_factory=async_session_factory,
+                        progress_callback=progress_callback
                     )
                     
                     # For PostgreSQL, we don't have an original file size
@@ -19,6 +19,7 @@ from src.services.task_generation_service import TaskGenerationService
 from src.services.crew_generation_service import CrewGenerationService
 from src.services.template_service import TemplateService
 from src.services.log_service import LLMLogService
+from src.core.intent_cache import get_intent_cache, normalize_message
 from src.core.llm_manager import LLMManager
 from src.utils.prompt_utils import robust_json_parser
 from src.utils.user_context import GroupContext
@@ -29,6 +30,46 @@ logger = logging.getLogger(__name__)
 # Default model for intent detection
 DEFAULT_DISPATCHER_MODEL = os.getenv("DEFAULT_DISPATCHER_MODEL", "databricks-llama-4-maverick")
 
+# Patterns used by semantic analysis, compiled once
+WORD_RE = re.compile(r'\b\w+\b')
+COMMAND_PATTERNS = [
+    re.compile(r'^(find|get|create|make|build|search|analyze)'),  # Starts with action
+    re.compile(r'^(i need|i want|help me|can you)'),              # Request patterns
+    re.compile(r'^(an order|a task|a job)'),                      # Task-like prefixes
+]
+CONFIGURE_PATTERNS = [
+    re.compile(r'(configure|config|setup|set up)'),               # Configuration words
+    re.compile(r'(change|update|modify|adjust).*?(llm|model|tools|maxr|max|rpm)'), # Change configuration
+    re.compile(r'(select|choose|pick).*?(llm|model|tools)'),       # Selection patterns
+    re.compile(r'(llm|model|tools|maxr).*?(setting|config)'),      # Configuration contexts
+]
+CREATE_PLAN_RE = re.compile(r'create\s+a\s+plan|build\s+a\s+plan|design\s+a\s+plan|plan\s+that|plan\s+to')
+COMPLEX_TASK_RE = re.compile(r'multiple|several|all|various|different')
+
+# Unambiguous phrasings routed without the LLM, matched against the normalised message
+FAST_PATH_RULES = [
+    ('execute_crew', re.compile(
+        r'^(?:please\s+)?(?:ec|(?:execute|run|start|launch)(?:\s+(?:the|my|this))?\s+(?:crew|workflow|plan))[.!]?$'
+    )),
+    ('configure_crew', re.compile(
+        r'^(?:please\s+)?(?:configure|config|setup|set up|change|update|modify|adjust|select|choose|pick)'
+        r'(?:\s+(?:the|my))?\s+(?:crew|llm|model|tools?|max\s*rpm|maxr|settings)[.!]?$'
+    )),
+    ('generate_agent', re.compile(
+        r'^(?:please\s+)?(?:create|build|make|generate|design)\s+(?:me\s+)?(?:an?|one)\s+(?:[\w-]+\s+){0,3}?(?:agent|assistant)\b'
+    )),
+    ('generate_crew', re.compile(
+        r'^(?:please\s+)?(?:create|build|make|generate|assemble|design)\s+(?:me\s+)?(?:an?\s+)?(?:[\w-]+\s+){0,3}?(?:team|crew)\b'
+    )),
+]
+FAST_PATH_RULE_CONFIDENCE = 0.95
+AGENT_NOUN_RE = re.compile(r'\bagents?\b')
+CONFIG_TYPE_KEYWORDS = {
+    'llm': {'llm', 'model'},
+    'maxr': {'maxr', 'max', 'rpm'},
+    'tools': {'tools', 'tool'},
+}
+
 
 class DispatcherService:
     """Service for dispatching natural language requests to generation services."""
@@ -91,6 +132,9 @@ class DispatcherService:
         'choose', 'pick', 'adjust', 'tune', 'customize', 'personalize'
     }
     
+    # Number of intent decisions made by each tier (fast path, cache, LLM, fallback)
+    _metrics: Dict[str, int] = {}
+    
     def __init__(self, log_service: LLMLogService):
         """
         Initialize the service.
@@ -154,7 +198,8 @@ class DispatcherService:
             Dictionary containing semantic analysis results
         """
         # Normalize message for analysis
-        words = re.findall(r'\b\w+\b', message.lower())
+        lowered = message.lower()
+        words = WORD_RE.findall(lowered)
         word_set = set(words)
         
         # Count different types of keywords
@@ -171,28 +216,14 @@ class DispatcherService:
         has_question = message.strip().endswith('?') or any(word in words[:2] for word in ['what', 'how', 'why', 'when', 'where', 'who'])
         has_greeting = any(word in words[:3] for word in self.CONVERSATION_WORDS)
         
-        # Detect command-like structures
-        command_patterns = [
-            r'^(find|get|create|make|build|search|analyze)',  # Starts with action
-            r'^(i need|i want|help me|can you)',              # Request patterns
-            r'^(an order|a task|a job)',                      # Task-like prefixes
-        ]
-        
-        # Detect configuration patterns
-        configure_patterns = [
-            r'(configure|config|setup|set up)',               # Configuration words
-            r'(change|update|modify|adjust).*?(llm|model|tools|maxr|max|rpm)', # Change configuration
-            r'(select|choose|pick).*?(llm|model|tools)',       # Selection patterns
-            r'(llm|model|tools|maxr).*?(setting|config)',      # Configuration contexts
-        ]
-        
-        has_command_structure = any(re.search(pattern, message.lower()) for pattern in command_patterns)
-        has_configure_structure = any(re.search(pattern, message.lower()) for pattern in configure_patterns)
+        # Detect command-like and configuration structures
+        has_command_structure = any(pattern.search(lowered) for pattern in COMMAND_PATTERNS)
+        has_configure_structure = any(pattern.search(lowered) for pattern in CONFIGURE_PATTERNS)
         
         # Calculate intent suggestions based on semantic analysis
         # Give extra weight to plan when "create a plan" or "plan that" is detected
-        has_create_plan = bool(re.search(r'create\s+a\s+plan|build\s+a\s+plan|design\s+a\s+plan|plan\s+that|plan\s+to', message.lower()))
-        has_complex_task = len(task_actions) > 1 or bool(re.search(r'multiple|several|all|various|different', message.lower()))
+        has_create_plan = bool(CREATE_PLAN_RE.search(lowered))
+        has_complex_task = len(task_actions) > 1 or bool(COMPLEX_TASK_RE.search(lowered))
         
         intent_scores = {
             'generate_task': len(task_actions) * 2 + (1 if has_imperative else 0) + (1 if has_command_structure else 0) - (3 if has_create_plan else 0),
@@ -249,20 +280,143 @@ class DispatcherService:
             "suggested_intent": max(intent_scores, key=intent_scores.get) if max(intent_scores.values()) > 0 else "unknown"
         }
     
-    async def _detect_intent(self, message: str, model: str) -> Dict[str, Any]:
+    def _fast_path_intent(self, message: str, semantic_analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Detect the intent from the user's message using LLM enhanced with semantic analysis.
+        Classify a message without the LLM when the answer is unambiguous.
+        
+        Explicit commands ("execute crew", "create an agent that...") are
+        matched by precompiled rules; other messages qualify when their top
+        semantic score is high enough and clearly ahead of the runner-up.
+        
+        Args:
+            message: User's natural language message
+            semantic_analysis: Result of _analyze_message_semantics for the message
+            
+        Returns:
+            Intent result, or None if the LLM should decide
+        """
+        from src.config.settings import settings
+        
+        normalized = normalize_message(message)
+        intent_scores = semantic_analysis["intent_scores"]
+        intent = None
+        confidence = FAST_PATH_RULE_CONFIDENCE
+        source = "fast_path_rule"
+        
+        plan_score = intent_scores.get("generate_plan", 0)
+        if plan_score >= 8 and semantic_analysis.get("has_create_plan", False):
+            # Same strong plan signal that overrides the LLM decision
+            intent = "generate_plan"
+        else:
+            for rule_intent, pattern in FAST_PATH_RULES:
+                if pattern.search(normalized):
+                    intent = rule_intent
+                    break
+            # Several agents, teams or plans need the LLM to tell crew from plan
+            if intent == "generate_agent" and (
+                semantic_analysis["crew_keywords"] or semantic_analysis["plan_keywords"]
+                or len(AGENT_NOUN_RE.findall(normalized)) > 1
+            ):
+                intent = None
+            elif intent == "generate_crew" and semantic_analysis["plan_keywords"]:
+                intent = None
+        
+        if intent is None:
+            ranked = sorted(intent_scores.values(), reverse=True)
+            top_score = ranked[0]
+            runner_up = ranked[1] if len(ranked) > 1 else 0
+            if (top_score < settings.DISPATCHER_FAST_PATH_MIN_SCORE
+                    or top_score - runner_up < settings.DISPATCHER_FAST_PATH_MIN_MARGIN):
+                return None
+            intent = semantic_analysis["suggested_intent"]
+            confidence = min(1.0, top_score / 5.0)
+            source = "fast_path_score"
+        
+        extracted_info: Dict[str, Any] = {"semantic_analysis": semantic_analysis}
+        if intent == "configure_crew":
+            words = set(WORD_RE.findall(normalized))
+            config_types = [name for name, keywords in CONFIG_TYPE_KEYWORDS.items() if words & keywords]
+            extracted_info["config_type"] = config_types[0] if len(config_types) == 1 else "general"
+        
+        return {
+            "intent": intent,
+            "confidence": confidence,
+            "extracted_info": extracted_info,
+            "suggested_prompt": message,
+            "source": source
+        }
+    
+    async def _detect_intent(self, message: str, model: str, group_context: Optional[GroupContext] = None) -> Dict[str, Any]:
+        """
+        Detect the intent from the user's message.
+        
+        Tries, in order: the fast path for unambiguous messages, the group's
+        cache of earlier LLM decisions for the same normalised message, and
+        finally the LLM. Which tier answered is counted in the class metrics
+        and reported as the result's "source".
         
         Args:
             message: User's natural language message
             model: LLM model to use
+            group_context: Optional group context scoping the intent cache
             
         Returns:
             Dictionary containing intent, confidence, and extracted information
         """
-        # Perform semantic analysis first
         semantic_analysis = self._analyze_message_semantics(message)
         
+        result = self._fast_path_intent(message, semantic_analysis)
+        if result is not None:
+            self._record_tier(result["source"])
+            logger.info(f"Fast-path intent '{result['intent']}' ({result['source']}) for message without LLM call")
+            return result
+        
+        cache = get_intent_cache()
+        group_id = group_context.primary_group_id if group_context else None
+        cache_key = cache.make_key(group_id, model, message)
+        result = cache.get(cache_key)
+        if result is not None:
+            result["source"] = "cache"
+            self._record_tier("cache")
+            return result
+        
+        result = await self._detect_intent_with_llm(message, model, semantic_analysis)
+        if result.get("source") == "llm":
+            cache.put(cache_key, result)
+        self._record_tier(result.get("source", "semantic_fallback"))
+        return result
+    
+    @classmethod
+    def _record_tier(cls, tier: str) -> None:
+        """Count an intent decision made by a tier."""
+        cls._metrics[tier] = cls._metrics.get(tier, 0) + 1
+    
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """
+        Get intent detection metrics.
+        
+        Returns:
+            Dictionary with the number of decisions per tier and the intent
+            cache statistics
+        """
+        return {
+            "tiers": dict(cls._metrics),
+            "intent_cache": get_intent_cache().get_stats()
+        }
+    
+    async def _detect_intent_with_llm(self, message: str, model: str, semantic_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Detect the intent from the user's message using LLM enhanced with semantic analysis.
+        
+        Args:
+            message: User's natural language message
+            model: LLM model to use
+            semantic_analysis: Result of _analyze_message_semantics for the message
+            
+        Returns:
+            Dictionary containing intent, confidence, and extracted information
+        """
         # Get prompt template from database
         system_prompt = await TemplateService.get_template_content("detect_intent")
         
@@ -425,6 +579,7 @@ Please analyze this message and provide your intent classification, considering
                     "intent": semantic_analysis["suggested_intent"] if semantic_confidence > 0.3 else "unknown",
                     "confidence": max(0.3, semantic_confidence),
                     "extracted_info": {},
+                    "suggested_prompt": message,
                     "source": "semantic_fallback_empty_response"
                 }
             
@@ -443,6 +598,7 @@ Please analyze this message and provide your intent classification, considering
                 
             # Enhance extracted_info with semantic analysis
             result["extracted_info"]["semantic_analysis"] = semantic_analysis
+            result["source"] = "llm"
             
             # If LLM result seems wrong and semantic analysis is confident, use semantic analysis
             semantic_confidence = max(semantic_analysis["intent_scores"].values()) / 5.0  # Normalize to 0-1
@@ -469,7 +625,8 @@ Please analyze this message and provide your intent classification, considering
                 "intent": semantic_analysis["suggested_intent"] if semantic_confidence > 0.3 else "unknown",
                 "confidence": max(0.3, semantic_confidence),
                 "extracted_info": {"semantic_analysis": semantic_analysis},
-                "suggested_prompt": message
+                "suggested_prompt": message,
+                "source": "semantic_fallback"
             }
     
     async def dispatch(self, request: DispatcherRequest, group_context: GroupContext = None) -> Dict[str, Any]:
@@ -486,7 +643,7 @@ Please analyze this message and provide your intent classification, considering
         model = request.model or DEFAULT_DISPATCHER_MODEL
         
         # Detect intent
-        intent_result = await self._detect_intent(request.message, model)
+        intent_result = await self._detect_intent(request.message, model, group_context)
         
         # Log the intent detection
         await self._log_llm_interaction(
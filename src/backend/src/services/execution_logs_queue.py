@@ -1,31 +1,67 @@
+import asyncio
 import queue
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
+from src.config.settings import settings
 from src.utils.user_context import GroupContext
 
 class JobOutputQueue:
     """Singleton holder for the job output queue."""
     _instance = None
     _queue = None
+    _notifier: Optional[Callable[[], None]] = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(JobOutputQueue, cls).__new__(cls)
-            cls._instance._queue = queue.Queue()
+            # Bounded at the high-water mark so producer threads get backpressure
+            # instead of growing the queue without limit
+            cls._instance._queue = queue.Queue(maxsize=settings.LOGS_QUEUE_HIGH_WATER_MARK)
+            cls._instance._notifier = None
         return cls._instance
 
     def get_queue(self) -> queue.Queue:
         """Get the singleton queue instance."""
         return self._queue
 
+    def set_notifier(self, notifier: Optional[Callable[[], None]]) -> None:
+        """
+        Register a callback invoked after every enqueue.
+        
+        The logs writer uses this to wake up its event loop (via
+        ``loop.call_soon_threadsafe``) instead of polling the queue.
+        
+        Args:
+            notifier: Thread-safe callable, or None to unregister
+        """
+        self._notifier = notifier
+
+    def notify(self) -> None:
+        """Wake up the registered consumer, if any."""
+        notifier = self._notifier
+        if notifier is not None:
+            notifier()
+
 # Function to get the singleton queue instance easily
 def get_job_output_queue() -> queue.Queue:
     return JobOutputQueue().get_queue()
 
+def _in_event_loop() -> bool:
+    """Check whether the caller runs inside an event loop (and must not block)."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
 def enqueue_log(execution_id: str, content: str, timestamp: Optional[datetime] = None, group_context: GroupContext = None) -> bool:
     """
     Enqueue a log message to be processed by the logs writer.
     
+    When the queue is at its high-water mark, callers running in a worker thread
+    block for up to ``LOGS_QUEUE_PUT_TIMEOUT`` seconds until the writer drains it.
+    Callers inside an event loop never block; the message is dropped instead.
+    
     Args:
         execution_id: ID of the execution (job_id)
         content: Content of the log message
@@ -52,11 +88,18 @@ def enqueue_log(execution_id: str, content: str, timestamp: Optional[datetime] =
             log_data["group_email"] = group_context.group_email
         
         # Add to queue
-        job_queue.put_nowait(log_data)
+        try:
+            job_queue.put_nowait(log_data)
+        except queue.Full:
+            if _in_event_loop():
+                raise
+            # Backpressure: let the producer thread wait for the writer
+            job_queue.put(log_data, block=True, timeout=settings.LOGS_QUEUE_PUT_TIMEOUT)
+        JobOutputQueue().notify()
         return True
     except queue.Full:
         # Queue is full
         return False
     except Exception:
         # Any other error
-        return False 
\ No newline at end of file
+        return False
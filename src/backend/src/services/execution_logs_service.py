@@ -7,18 +7,20 @@ storing logs in the database, and managing WebSocket connections.
 
 import asyncio
 import json
-from typing import Dict, Set, List, Any, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, Set, List, Any, Optional
 from datetime import datetime
 from queue import Empty
 
 from fastapi import WebSocket
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.execution_updates import get_execution_update_hub
+from src.core.websocket_fanout import FanoutChannel, FanoutSubscriber
 from src.core.logger import LoggerManager
 from src.models.execution_logs import ExecutionLog
 from src.schemas.execution_logs import LogMessage, ExecutionLogResponse
 from src.repositories.execution_logs_repository import execution_logs_repository
-from src.services.execution_logs_queue import enqueue_log, get_job_output_queue
+from src.services.execution_logs_queue import JobOutputQueue, enqueue_log, get_job_output_queue
 from src.utils.user_context import GroupContext
 
 # Get logger from the centralized logging system
@@ -35,12 +37,88 @@ class ExecutionLogsService:
     - WebSocket connection management
     - Broadcasting logs to connected clients
     - Storing and retrieving execution logs from the database
+    
+    Broadcasts are fanned out through one FanoutChannel per execution: the
+    message is serialised once and appended to the channel, and each
+    connection's writer task sends it on its own, so a slow client never
+    delays the producer or the other clients.
     """
     
     def __init__(self):
         """Initialize the execution logs service."""
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self._lock = asyncio.Lock()
+        self._channels: Dict[str, FanoutChannel] = {}
+    
+    def _subscribe(self, websocket: WebSocket, execution_id: str) -> FanoutSubscriber:
+        """
+        Get or create the fan-out writer of a connection.
+        
+        The writer is not started; callers start it once any direct sends
+        (such as historical logs) are done, and live messages published in the
+        meantime are buffered in the channel.
+        
+        Args:
+            websocket: Registered WebSocket connection
+            execution_id: ID of the execution the connection watches
+            
+        Returns:
+            The connection's subscriber
+        """
+        from src.config.settings import settings
+        
+        channel = self._channels.get(execution_id)
+        if channel is None:
+            channel = self._channels[execution_id] = FanoutChannel(settings.LOGS_WS_MAX_PENDING)
+        subscriber = channel.subscribers.get(websocket)
+        if subscriber is None:
+            subscriber = FanoutSubscriber(
+                channel,
+                websocket,
+                on_close=lambda closed: self._drop_connection(execution_id, closed),
+                policy=settings.LOGS_WS_SLOW_CONSUMER_POLICY,
+                send_timeout=settings.LOGS_WS_SEND_TIMEOUT_SECONDS
+            )
+            channel.subscribers[websocket] = subscriber
+        return subscriber
+    
+    def _drop_connection(self, execution_id: str, subscriber: FanoutSubscriber) -> None:
+        """Forget a connection whose writer failed or was too slow."""
+        connections = self.active_connections.get(execution_id)
+        if connections is not None:
+            connections.discard(subscriber.websocket)
+        channel = self._channels.get(execution_id)
+        if channel is not None:
+            channel.subscribers.pop(subscriber.websocket, None)
+            if not channel.subscribers:
+                del self._channels[execution_id]
+        logger.info(f"Dropped WebSocket connection for execution {execution_id} ({subscriber.dropped} messages skipped)")
+    
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all broadcast messages were sent to all connections.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if every connection caught up within the timeout
+        """
+        subscribers = [
+            subscriber
+            for channel in list(self._channels.values())
+            for subscriber in list(channel.subscribers.values())
+        ]
+        if not subscribers:
+            return True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(subscriber.wait_idle() for subscriber in subscribers)),
+                timeout=timeout
+            )
+            return True
+        except asyncio.TimeoutError:
+            return False
     
     async def connect(self, websocket: WebSocket, execution_id: str):
         """
@@ -55,6 +133,7 @@ class ExecutionLogsService:
             if execution_id not in self.active_connections:
                 self.active_connections[execution_id] = set()
             self.active_connections[execution_id].add(websocket)
+            subscriber = self._subscribe(websocket, execution_id)
         
         # Send historical logs when client connects
         try:
@@ -69,6 +148,8 @@ class ExecutionLogsService:
                 }))
         except Exception as e:
             logger.error(f"Error sending historical logs: {e}")
+        # Live messages broadcast meanwhile were buffered and follow the history
+        subscriber.start()
         
         logger.debug(f"Client connected to execution {execution_id}. Total connections: {len(self.active_connections[execution_id])}")
     
@@ -86,6 +167,7 @@ class ExecutionLogsService:
             if execution_id not in self.active_connections:
                 self.active_connections[execution_id] = set()
             self.active_connections[execution_id].add(websocket)
+            subscriber = self._subscribe(websocket, execution_id)
         
         # Send group-filtered historical logs when client connects
         try:
@@ -107,6 +189,8 @@ class ExecutionLogsService:
                 }))
         except Exception as e:
             logger.error(f"Error sending historical logs: {e}")
+        # Live messages broadcast meanwhile were buffered and follow the history
+        subscriber.start()
         
         logger.debug(f"Client connected to execution {execution_id} with group {group_context.primary_group_id}. Total connections: {len(self.active_connections[execution_id])}")
 
@@ -118,11 +202,19 @@ class ExecutionLogsService:
             websocket: WebSocket connection to unregister
             execution_id: ID of the execution to disconnect from
         """
+        subscriber = None
         async with self._lock:
             if execution_id in self.active_connections:
                 self.active_connections[execution_id].discard(websocket)
                 if not self.active_connections[execution_id]:
                     del self.active_connections[execution_id]
+            channel = self._channels.get(execution_id)
+            if channel is not None:
+                subscriber = channel.subscribers.pop(websocket, None)
+                if not channel.subscribers:
+                    del self._channels[execution_id]
+        if subscriber is not None:
+            await subscriber.stop()
         logger.debug(f"Client disconnected from execution {execution_id}")
 
     async def create_execution_log(self, execution_id: str, content: str, timestamp: datetime = None, group_context: GroupContext = None) -> bool:
@@ -173,7 +265,8 @@ class ExecutionLogsService:
             logger.error(f"[broadcast_to_execution] Failed to enqueue log for execution {execution_id}")
 
         # Now handle WebSocket connections if any exist
-        if execution_id not in self.active_connections:
+        connections = self.active_connections.get(execution_id)
+        if not connections:
             logger.debug(f"[broadcast_to_execution] No active connections for execution {execution_id}")
             return
 
@@ -184,22 +277,17 @@ class ExecutionLogsService:
             "type": "live"
         }
 
-        logger.debug(f"[broadcast_to_execution] Broadcasting to {len(self.active_connections[execution_id])} connections")
-        disconnected = set()
-        for connection in self.active_connections[execution_id]:
-            try:
-                await connection.send_text(json.dumps(message_data))
-                logger.debug("[broadcast_to_execution] Successfully sent message to connection")
-            except Exception as e:
-                logger.error(f"[broadcast_to_execution] Error sending message to client: {e}")
-                logger.error("[broadcast_to_execution] Stack trace:", exc_info=True)
-                disconnected.add(connection)
-
-        # Clean up disconnected clients
-        if disconnected:
-            logger.info(f"[broadcast_to_execution] Cleaned up {len(disconnected)} disconnected clients")
-            async with self._lock:
-                self.active_connections[execution_id] -= disconnected
+        channel = self._channels.get(execution_id)
+        if channel is None or len(channel.subscribers) != len(connections):
+            # Connections registered without connect() get their writer here
+            for connection in list(connections):
+                subscriber = self._subscribe(connection, execution_id)
+                subscriber.start()
+            channel = self._channels[execution_id]
+        
+        # Serialised once and handed to the connections' writer tasks; never awaits a send
+        channel.publish(message_data)
+        logger.debug(f"[broadcast_to_execution] Queued message for {len(connections)} connections")
 
     async def get_execution_logs(self, execution_id: str, limit: int = 1000, offset: int = 0) -> List[ExecutionLogResponse]:
         """
@@ -227,15 +315,28 @@ class ExecutionLogsService:
             for log in logs
         ]
     
-    async def get_execution_logs_by_group(self, execution_id: str, group_context: GroupContext, limit: int = 1000, offset: int = 0) -> List[ExecutionLogResponse]:
+    async def get_execution_logs_by_group(
+        self,
+        execution_id: str,
+        group_context: GroupContext,
+        limit: int = 1000,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
+    ) -> List[ExecutionLogResponse]:
         """
         Fetch historical execution logs from the database filtered by group.
         
+        Pass the highest log ID already seen as ``after_id`` (or the latest
+        timestamp as ``since``) to fetch only logs written since then.
+        
         Args:
             execution_id: ID of the execution to fetch logs for
             group_context: Group context for filtering
             limit: Maximum number of logs to fetch
             offset: Number of logs to skip
+            after_id: Only return logs with an ID greater than this
+            since: Only return logs with a timestamp later than this
             
         Returns:
             List of execution log responses for the group
@@ -247,7 +348,9 @@ class ExecutionLogsService:
             logs = await execution_logs_repository.get_by_execution_id_with_managed_session(
                 execution_id=execution_id,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                after_id=after_id,
+                since=since
             )
         else:
             # Use group-aware filtering when group context is available
@@ -257,17 +360,92 @@ class ExecutionLogsService:
                 group_id=group_context.primary_group_id,
                 limit=limit,
                 offset=offset,
-                include_null_group=True
+                include_null_group=True,
+                after_id=after_id,
+                since=since
             )
         
         return [
             ExecutionLogResponse(
+                id=log.id,
                 content=log.content,
                 timestamp=log.timestamp.isoformat()
             )
             for log in logs
         ]
     
+    async def stream_execution_updates(
+        self,
+        execution_id: str,
+        group_context: GroupContext,
+        after_trace_id: Optional[int] = None,
+        after_log_id: Optional[int] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream new traces and logs of an execution as Server-Sent Events.
+        
+        Rows after the given cursors are sent first. The stream then sleeps
+        until the trace or log writer reports new rows for this execution and
+        fetches only those, so the work per update is proportional to the
+        number of new rows. Each event ID holds both cursors as
+        ``"<trace_id>:<log_id>"`` so a client can resume via Last-Event-ID.
+        
+        Args:
+            execution_id: ID of the execution to stream
+            group_context: Group context for filtering logs
+            after_trace_id: Only send traces with an ID greater than this
+            after_log_id: Only send logs with an ID greater than this
+            is_disconnected: Coroutine function reporting whether the client left
+            
+        Yields:
+            SSE-formatted "trace" and "log" events and keep-alive comments
+        """
+        from src.config.settings import settings
+        from src.services.execution_trace_service import ExecutionTraceService
+        
+        batch_size = settings.EXECUTION_STREAM_BATCH_SIZE
+        trace_cursor = after_trace_id or 0
+        log_cursor = after_log_id or 0
+        hub = get_execution_update_hub()
+        # Subscribe before the first fetch so rows stored in between still wake us
+        subscription = hub.subscribe(execution_id)
+        pending = {"traces", "logs"}
+        try:
+            while True:
+                backlog = set()
+                if "traces" in pending:
+                    result = await ExecutionTraceService.get_traces_by_job_id(
+                        None, execution_id, batch_size, 0, after_id=trace_cursor
+                    )
+                    traces = result.traces if result else []
+                    for trace in traces:
+                        trace_cursor = max(trace_cursor, trace.id)
+                        yield _format_sse_event("trace", trace.model_dump_json(), f"{trace_cursor}:{log_cursor}")
+                    if len(traces) >= batch_size:
+                        backlog.add("traces")
+                if "logs" in pending:
+                    logs = await self.get_execution_logs_by_group(
+                        execution_id, group_context, batch_size, 0, after_id=log_cursor
+                    )
+                    for log in logs:
+                        log_cursor = max(log_cursor, log.id or 0)
+                        yield _format_sse_event("log", log.model_dump_json(), f"{trace_cursor}:{log_cursor}")
+                    if len(logs) >= batch_size:
+                        backlog.add("logs")
+                
+                if is_disconnected is not None and await is_disconnected():
+                    break
+                if backlog:
+                    # A full batch means more rows are already waiting
+                    pending = backlog
+                    continue
+                pending = await subscription.wait(settings.EXECUTION_STREAM_KEEPALIVE_SECONDS)
+                if not pending:
+                    yield ": keep-alive\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+    
     async def count_logs(self, execution_id: str) -> int:
         """
         Count logs for a specific execution.
@@ -292,114 +470,178 @@ class ExecutionLogsService:
         """
         return await execution_logs_repository.delete_by_execution_id_with_managed_session(execution_id)
 
+def _format_sse_event(event: str, data: str, event_id: str) -> str:
+    """Format one Server-Sent Event."""
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
 # Create a singleton instance of the service
 execution_logs_service = ExecutionLogsService()
 
 # --- Logs Writer Functions ---
 
-async def logs_writer_loop(shutdown_event: asyncio.Event):
+def _drain_queue(job_queue, max_items: int) -> List[Dict[str, Any]]:
+    """
+    Take up to ``max_items`` logs from the queue without blocking.
+    
+    Args:
+        job_queue: The job output queue
+        max_items: Maximum number of items to take
+        
+    Returns:
+        List of log dictionaries (shutdown markers are skipped)
+    """
+    items = []
+    while len(items) < max_items:
+        try:
+            log_data = job_queue.get_nowait()
+        except Empty:
+            break
+        job_queue.task_done()
+        # None is the shutdown marker put by stop_logs_writer
+        if log_data is not None:
+            items.append(log_data)
+    return items
+
+async def _flush_logs_batch(batch: List[Dict[str, Any]]) -> int:
+    """
+    Persist a batch of queued logs with a single multi-row INSERT.
+    
+    Falls back to row-by-row inserts if the bulk insert fails so a single
+    malformed row does not drop the whole batch.
+    
+    Args:
+        batch: Log dictionaries as produced by enqueue_log
+        
+    Returns:
+        Number of logs that could not be stored
+    """
+    rows = [
+        {
+            "execution_id": log_data.get("job_id", "unknown"),
+            "content": log_data.get("content", ""),
+            "timestamp": log_data.get("timestamp") or datetime.now(),
+            "group_id": log_data.get("group_id"),
+            "group_email": log_data.get("group_email"),
+        }
+        for log_data in batch
+    ]
+    
+    hub = get_execution_update_hub()
+    try:
+        await execution_logs_repository.create_many_with_managed_session(rows)
+        hub.publish((row["execution_id"] for row in rows), "logs")
+        return 0
+    except Exception as e:
+        logger.warning(f"[logs_writer_loop] Bulk insert of {len(rows)} logs failed, falling back to single inserts: {e}")
+    
+    failures = 0
+    for row in rows:
+        group_context = None
+        if row["group_id"] or row["group_email"]:
+            group_context = GroupContext(
+                group_ids=[row["group_id"]] if row["group_id"] else None,
+                group_email=row["group_email"]
+            )
+        success = await execution_logs_service.create_execution_log(
+            execution_id=row["execution_id"],
+            content=row["content"],
+            timestamp=row["timestamp"],
+            group_context=group_context
+        )
+        if not success:
+            failures += 1
+    hub.publish((row["execution_id"] for row in rows), "logs")
+    return failures
+
+async def logs_writer_loop(shutdown_event: asyncio.Event, batch_size: Optional[int] = None, flush_interval_ms: Optional[int] = None):
     """
     Background task that reads from the job output queue and writes logs to the database.
     
+    The queue is drained with non-blocking gets only; when it is empty the task
+    awaits a wakeup event that enqueue_log triggers through
+    ``loop.call_soon_threadsafe``, so the event loop is never blocked. Logs are
+    coalesced into multi-row INSERTs of up to ``batch_size`` rows, waiting at
+    most ``flush_interval_ms`` for a batch to fill.
+    
     Args:
         shutdown_event: Event to signal shutdown
+        batch_size: Maximum rows per INSERT (defaults to LOGS_WRITER_BATCH_SIZE)
+        flush_interval_ms: Maximum time to coalesce rows (defaults to LOGS_WRITER_FLUSH_INTERVAL_MS)
     """
+    from src.config.settings import settings
+    
+    batch_size = batch_size or settings.LOGS_WRITER_BATCH_SIZE
+    flush_interval = (flush_interval_ms or settings.LOGS_WRITER_FLUSH_INTERVAL_MS) / 1000.0
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+    output_queue = JobOutputQueue()
+    
+    def notify():
+        # Called from producer threads; only schedule a wakeup when needed
+        if not wakeup.is_set():
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                # The writer loop is closed; the wakeup is only a hint
+                pass
+    
+    async def wait_for_logs(timeout: float) -> None:
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     try:
-        logger.info("[logs_writer_loop] Logs writer task started.")
+        logger.info(f"[logs_writer_loop] Logs writer task started (batch_size={batch_size}, flush_interval={flush_interval}s).")
         
         # Get job output queue
         queue = get_job_output_queue()
+        output_queue.set_notifier(notify)
         logger.debug(f"[logs_writer_loop] Queue retrieved. Initial approximate size: {queue.qsize()}")
         
         batch_count = 0
         total_log_count = 0
-        empty_count = 0  # Count consecutive empty queue occurrences
         
         while not shutdown_event.is_set():
-            # Create a small batch of logs to process together
-            batch = []
-            batch_target_size = 10  # Process up to this many at once
-            
             try:
-                # Try to collect a batch of logs
-                for _ in range(batch_target_size):
-                    try:
-                        # Log queue status periodically
-                        if _ == 0:
-                            logger.debug(f"[logs_writer_loop] Waiting for logs... Queue size: ~{queue.qsize()}")
-                        
-                        # Non-blocking get with timeout
-                        log_data = queue.get(block=True, timeout=0.1)
-                        
-                        # Check if this is the shutdown signal (None)
-                        if log_data is None:
-                            logger.debug("[logs_writer_loop] Received shutdown signal (None) in queue.")
-                            continue
-                            
-                        batch.append(log_data)
-                        queue.task_done()
-                        empty_count = 0  # Reset empty count when we get an item
-                    except Empty:
-                        # Queue is empty, break out of the batch collection loop
-                        empty_count += 1
-                        if empty_count % 100 == 0:  # Log every 100 consecutive empty checks
-                            logger.debug(f"[logs_writer_loop] Queue empty for {empty_count} consecutive checks")
+                wakeup.clear()
+                batch = _drain_queue(queue, batch_size)
+                
+                if not batch:
+                    # Nothing queued: sleep until a producer wakes us up
+                    await wait_for_logs(1.0)
+                    continue
+                
+                # Coalesce more rows until the batch is full or the interval elapsed
+                deadline = loop.time() + flush_interval
+                while len(batch) < batch_size and not shutdown_event.is_set():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
                         break
+                    wakeup.clear()
+                    more = _drain_queue(queue, batch_size - len(batch))
+                    if more:
+                        batch.extend(more)
+                        continue
+                    await wait_for_logs(remaining)
                 
-                # If we collected any logs, process them
-                if batch:
-                    batch_count += 1
-                    total_log_count += len(batch)
-                    
-                    # Log batch processing
-                    logger.debug(f"[logs_writer_loop] Processing batch #{batch_count} with {len(batch)} logs. Total processed: {total_log_count}")
-                    
-                    # Process each log in the batch
-                    failures = 0
-                    for idx, log_data in enumerate(batch):
-                        try:
-                            job_id = log_data.get("job_id", "unknown")
-                            content = log_data.get("content", "")
-                            timestamp = log_data.get("timestamp", datetime.now())
-                            log_info = f"[{job_id}:{idx+1}/{len(batch)}]"
-                            
-                            # Extract group information if available
-                            group_context = None
-                            if log_data.get("group_id") or log_data.get("group_email"):
-                                group_context = GroupContext(
-                                    group_ids=[log_data.get("group_id")] if log_data.get("group_id") else None,
-                                    group_email=log_data.get("group_email")
-                                )
-                            
-                            # Create log with execution_logs_service
-                            success = await execution_logs_service.create_execution_log(
-                                execution_id=job_id,
-                                content=content,
-                                timestamp=timestamp,
-                                group_context=group_context
-                            )
-                            
-                            if not success:
-                                logger.warning(f"[logs_writer_loop] {log_info} ❌ Failed to store log")
-                                failures += 1
-                                
-                        except Exception as e:
-                            logger.error(f"[logs_writer_loop] Error processing log: {e}", exc_info=True)
-                            failures += 1
-                    
-                    if failures > 0:
-                        logger.warning(f"[logs_writer_loop] Batch #{batch_count} processed with {failures} failures.")
-                    else:
-                        logger.debug(f"[logs_writer_loop] Batch #{batch_count} processed successfully.")
+                batch_count += 1
+                total_log_count += len(batch)
+                logger.debug(f"[logs_writer_loop] Flushing batch #{batch_count} with {len(batch)} logs. Total processed: {total_log_count}. Queue size: ~{queue.qsize()}")
                 
-                # If no logs were collected, sleep briefly to avoid CPU spinning
-                else:
-                    await asyncio.sleep(0.5)
+                failures = await _flush_logs_batch(batch)
+                if failures > 0:
+                    logger.warning(f"[logs_writer_loop] Batch #{batch_count} processed with {failures} failures.")
                 
             except Exception as e:
                 logger.error(f"[logs_writer_loop] Batch processing error: {e}", exc_info=True)
                 # Sleep to avoid rapid retry on persistent errors
                 await asyncio.sleep(1)
+        
+        # Persist whatever is still queued before exiting
+        remaining_logs = _drain_queue(queue, queue.qsize() + batch_size)
+        for start in range(0, len(remaining_logs), batch_size):
+            await _flush_logs_batch(remaining_logs[start:start + batch_size])
             
         logger.info("[logs_writer_loop] Shutdown event received, exiting logs writer loop.")
     
@@ -408,6 +650,7 @@ async def logs_writer_loop(shutdown_event: asyncio.Event):
     except Exception as e:
         logger.critical(f"[logs_writer_loop] Unhandled exception in logs writer loop: {e}", exc_info=True)
     finally:
+        output_queue.set_notifier(None)
         logger.info("[logs_writer_loop] Logs writer task stopped.")
 
 async def start_logs_writer(shutdown_event: asyncio.Event) -> asyncio.Task:
@@ -449,13 +692,14 @@ async def stop_logs_writer(timeout: float = 5.0) -> bool:
         
     logger.info("[stop_logs_writer] Stopping logs writer task...")
     try:
-        # Add None to logs queue to help unblock queue.get()
+        # Add None to logs queue and wake up the writer
         try:
             from queue import Full
             logs_queue = get_job_output_queue()
             logs_queue.put_nowait(None)
         except Full:
             logger.warning("[stop_logs_writer] Logs queue full, writer might take longer to stop.")
+        JobOutputQueue().notify()
             
         # Wait for task to complete
         await asyncio.wait_for(_logs_writer_task, timeout=timeout)
@@ -0,0 +1,288 @@
+"""
+Execution Retention Service.
+
+This service keeps execution history, traces and logs bounded. A background
+task periodically:
+
+- deletes executions outside their group's retention policy (older than N
+  days or beyond the newest N executions), with their traces and logs, in
+  bounded batches;
+- compacts the per-line logs of old executions into one compressed archive
+  per execution;
+- on PostgreSQL with a partitioned execution_logs table, creates upcoming
+  monthly partitions and drops old partitions whose logs are all archived.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config.settings import settings
+from src.db.session import async_session_factory
+from src.repositories.execution_retention_repository import (
+    ExecutionRetentionRepository,
+    next_month,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Retention rules for one group (group_id None: the default policy)."""
+
+    group_id: Optional[str]
+    days: int = 0
+    max_executions: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.days > 0 or self.max_executions > 0
+
+
+class ExecutionRetentionService:
+    """Background retention, log compaction and partition maintenance."""
+
+    def __init__(
+        self,
+        repository: Optional[ExecutionRetentionRepository] = None,
+        session_factory: Callable = async_session_factory
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            repository: Retention repository
+            session_factory: Factory of database sessions
+        """
+        self.repository = repository or ExecutionRetentionRepository()
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+    @staticmethod
+    def get_policies() -> List[RetentionPolicy]:
+        """
+        Build the retention policies from settings.
+
+        Returns:
+            The default policy followed by one policy per configured group
+        """
+        policies = [RetentionPolicy(
+            group_id=None,
+            days=settings.EXECUTION_RETENTION_DAYS,
+            max_executions=settings.EXECUTION_RETENTION_MAX_EXECUTIONS
+        )]
+        for group_id, policy in settings.EXECUTION_RETENTION_GROUP_POLICIES.items():
+            policies.append(RetentionPolicy(
+                group_id=group_id,
+                days=int(policy.get("days", 0)),
+                max_executions=int(policy.get("max_executions", 0))
+            ))
+        return policies
+
+    async def apply_retention(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Delete executions outside their retention policy.
+
+        Each round deletes at most EXECUTION_RETENTION_BATCH_SIZE executions,
+        and at most EXECUTION_RETENTION_MAX_BATCHES rounds run per policy, so
+        a large backlog is worked off over several runs.
+
+        Args:
+            now: Current time (timezone-naive UTC), for testing
+
+        Returns:
+            Deletion counts
+        """
+        now = now or datetime.utcnow()
+        batch_size = max(1, settings.EXECUTION_RETENTION_BATCH_SIZE)
+        totals = {"executions": 0, "traces": 0, "logs": 0}
+        policies = self.get_policies()
+        group_ids = [policy.group_id for policy in policies if policy.group_id is not None]
+
+        for policy in policies:
+            if not policy.enabled:
+                continue
+            cutoff = now - timedelta(days=policy.days) if policy.days > 0 else None
+            for _ in range(max(1, settings.EXECUTION_RETENTION_MAX_BATCHES)):
+                async with self.session_factory() as session:
+                    job_ids = await self.repository.find_expired_job_ids(
+                        session,
+                        limit=batch_size,
+                        cutoff=cutoff,
+                        keep_latest=policy.max_executions or None,
+                        group_id=policy.group_id,
+                        exclude_group_ids=group_ids if policy.group_id is None else None
+                    )
+                    if not job_ids:
+                        break
+                    counts = await self.repository.delete_executions(session, job_ids, batch_size)
+                for key in totals:
+                    totals[key] += counts.get(key, 0)
+                if len(job_ids) < batch_size:
+                    break
+
+        if totals["executions"]:
+            logger.info(
+                f"Retention deleted {totals['executions']} executions, "
+                f"{totals['traces']} traces and {totals['logs']} logs"
+            )
+        return totals
+
+    async def compact_logs(self, partitioned: bool = False, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Roll up the logs of executions older than EXECUTION_LOGS_COMPACT_AFTER_DAYS.
+
+        Args:
+            partitioned: execution_logs is partitioned; compacted lines are
+                then left for the partition drop instead of deleted
+            now: Current time (timezone-naive UTC), for testing
+
+        Returns:
+            Number of executions and lines compacted
+        """
+        totals = {"executions": 0, "lines": 0}
+        if settings.EXECUTION_LOGS_COMPACT_AFTER_DAYS <= 0:
+            return totals
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=settings.EXECUTION_LOGS_COMPACT_AFTER_DAYS)
+        batch_size = max(1, settings.EXECUTION_RETENTION_BATCH_SIZE)
+
+        for _ in range(max(1, settings.EXECUTION_RETENTION_MAX_BATCHES)):
+            compacted = 0
+            async with self.session_factory() as session:
+                execution_ids = await self.repository.find_compactable_execution_ids(session, cutoff, batch_size)
+                for execution_id in execution_ids:
+                    try:
+                        lines = await self.repository.compact_execution(
+                            session, execution_id, delete_lines=not partitioned
+                        )
+                    except Exception as e:
+                        logger.error(f"Error compacting logs of execution {execution_id}: {e}")
+                        continue
+                    compacted += 1
+                    totals["lines"] += lines
+            totals["executions"] += compacted
+            # Failed executions would be found again; leave them for the next run
+            if len(execution_ids) < batch_size or compacted < len(execution_ids):
+                break
+
+        if totals["executions"]:
+            logger.info(f"Compacted {totals['lines']} log lines of {totals['executions']} executions")
+        return totals
+
+    async def maintain_partitions(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Create upcoming monthly partitions of execution_logs and drop old ones.
+
+        A partition is dropped once its whole month is older than the
+        compaction cutoff and every line in it belongs to an archived
+        execution; remaining lines of archived executions are then deleted.
+
+        Args:
+            now: Current time (timezone-naive UTC), for testing
+
+        Returns:
+            Names of the created and dropped partitions
+        """
+        now = now or datetime.utcnow()
+        created: List[str] = []
+        dropped: List[str] = []
+        async with self.session_factory() as session:
+            month = date(now.year, now.month, 1)
+            existing = {name for name, _ in await self.repository.list_log_partitions(session)}
+            for _ in range(max(0, settings.EXECUTION_LOGS_PARTITION_MONTHS_AHEAD) + 1):
+                name = await self.repository.create_log_partition(session, month)
+                if name not in existing:
+                    created.append(name)
+                month = next_month(month)
+
+            if settings.EXECUTION_LOGS_COMPACT_AFTER_DAYS > 0:
+                cutoff = now - timedelta(days=settings.EXECUTION_LOGS_COMPACT_AFTER_DAYS)
+                for name, month_start in await self.repository.list_log_partitions(session):
+                    if datetime.combine(next_month(month_start), datetime.min.time()) > cutoff:
+                        break
+                    if await self.repository.partition_has_unarchived_logs(session, name):
+                        continue
+                    await self.repository.drop_log_partition(session, name)
+                    dropped.append(name)
+                if dropped:
+                    await self.repository.delete_archived_lines(
+                        session, cutoff, max(1, settings.EXECUTION_RETENTION_BATCH_SIZE)
+                    )
+
+        if created or dropped:
+            logger.info(f"execution_logs partitions created: {created}, dropped: {dropped}")
+        return {"created": created, "dropped": dropped}
+
+    async def _is_partitioned(self) -> bool:
+        if not str(settings.DATABASE_URI).startswith('postgresql'):
+            return False
+        async with self.session_factory() as session:
+            return await self.repository.is_logs_table_partitioned(session)
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Run one retention pass: retention, then compaction, then partition maintenance.
+
+        Returns:
+            Results of each step
+        """
+        results: Dict[str, Any] = {"retention": await self.apply_retention()}
+        partitioned = await self._is_partitioned()
+        results["compaction"] = await self.compact_logs(partitioned=partitioned)
+        if partitioned:
+            results["partitions"] = await self.maintain_partitions()
+        return results
+
+    async def _run_loop(self, interval_seconds: float) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Error during execution retention run: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> Optional[asyncio.Task]:
+        """
+        Start the background retention task.
+
+        Returns:
+            The task, or None if retention is disabled
+        """
+        if not settings.EXECUTION_RETENTION_ENABLED:
+            logger.info("Execution retention is disabled")
+            return None
+        if self._task is None or self._task.done():
+            self._stop_event.clear()
+            self._task = asyncio.create_task(
+                self._run_loop(settings.EXECUTION_RETENTION_INTERVAL_SECONDS),
+                name="execution_retention"
+            )
+        return self._task
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Stop the background retention task, waiting for a running pass to finish.
+
+        Args:
+            timeout: Seconds to wait before cancelling the task
+        """
+        if self._task is None or self._task.done():
+            return
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
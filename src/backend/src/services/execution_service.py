@@ -5,6 +5,7 @@ This module provides business logic for execution operations including
 running execution jobs, tracking status, and generating descriptive names.
 """
 
+import base64
 import logging
 import sys
 import traceback
@@ -13,7 +14,7 @@ import os
 import uuid
 import concurrent.futures
 import asyncio
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime, UTC
 import litellm
 from fastapi import HTTPException, status
@@ -388,7 +389,6 @@ class ExecutionService:
                 logger.info(f"Successfully retrieved {len(db_executions_list)} executions from database")
                 
                 # Convert to list of dicts, including inputs with agents_yaml and tasks_yaml
-                import json
                 db_executions = []
                 for e in db_executions_list:
                     exec_dict = {
@@ -403,20 +403,17 @@ class ExecutionService:
                     }
                     
                     # Also extract agents_yaml and tasks_yaml from inputs for direct access
-                    if e.inputs and isinstance(e.inputs, dict):
-                        if 'agents_yaml' in e.inputs:
-                            exec_dict['agents_yaml'] = json.dumps(e.inputs['agents_yaml']) if isinstance(e.inputs['agents_yaml'], dict) else e.inputs.get('agents_yaml', '')
-                        if 'tasks_yaml' in e.inputs:
-                            exec_dict['tasks_yaml'] = json.dumps(e.inputs['tasks_yaml']) if isinstance(e.inputs['tasks_yaml'], dict) else e.inputs.get('tasks_yaml', '')
+                    exec_dict.update(ExecutionService._extract_yaml_fields(e.inputs))
                     
                     db_executions.append(exec_dict)
             
             # Get in-memory executions that might not be in the database yet
-            memory_executions = {}
-            for execution_id, execution_data in ExecutionService.executions.items():
-                # Check if this execution is already in the list from the database
-                if not any(e.get("execution_id") == execution_id for e in db_executions):
-                    memory_executions[execution_id] = execution_data
+            db_execution_ids = {e["execution_id"] for e in db_executions}
+            memory_executions = {
+                execution_id: execution_data
+                for execution_id, execution_data in ExecutionService.executions.items()
+                if execution_id not in db_execution_ids
+            }
             
             # Combine results
             results = db_executions.copy()
@@ -448,6 +445,159 @@ class ExecutionService:
             logger.info(f"Falling back to {len(memory_only_results)} in-memory executions")
             return memory_only_results
     
+    @staticmethod
+    def _extract_yaml_fields(inputs: Any) -> Dict[str, Any]:
+        """
+        Expose agents_yaml and tasks_yaml from execution inputs as top-level fields.
+        
+        Args:
+            inputs: The inputs stored with an execution
+            
+        Returns:
+            Dictionary with agents_yaml and/or tasks_yaml serialised as strings
+        """
+        fields = {}
+        if inputs and isinstance(inputs, dict):
+            for key in ('agents_yaml', 'tasks_yaml'):
+                if key in inputs:
+                    fields[key] = json.dumps(inputs[key]) if isinstance(inputs[key], dict) else inputs.get(key, '')
+        return fields
+    
+    @staticmethod
+    def encode_execution_cursor(created_at: datetime, execution_pk: int) -> str:
+        """
+        Encode the position of an execution row as an opaque page cursor.
+        
+        Args:
+            created_at: Creation time of the last row on the page
+            execution_pk: Database ID of the last row on the page
+            
+        Returns:
+            URL-safe cursor string
+        """
+        raw = f"{created_at.isoformat()}|{execution_pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def decode_execution_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        Decode a page cursor produced by encode_execution_cursor.
+        
+        Args:
+            cursor: Cursor string from a previous page
+            
+        Returns:
+            Tuple of (created_at, database ID)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at, execution_pk = raw.rsplit("|", 1)
+            return datetime.fromisoformat(created_at), int(execution_pk)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+    
+    @staticmethod
+    async def list_executions_page(
+        group_ids: List[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_result: bool = False,
+        include_inputs: bool = False
+    ) -> Dict[str, Any]:
+        """
+        List one page of executions, newest first, with group filtering.
+        
+        Database rows are fetched with keyset pagination on (created_at, id)
+        and only summary fields are returned unless result or inputs are
+        requested. On the first page, in-memory executions that are not yet in
+        the database are listed ahead of the stored ones.
+        
+        Args:
+            group_ids: List of group IDs for filtering
+            limit: Maximum number of database executions on the page
+            cursor: Cursor returned with the previous page, or None for the first page
+            include_result: Whether to include each execution's result
+            include_inputs: Whether to include inputs, agents_yaml and tasks_yaml
+            
+        Returns:
+            Dictionary with the page ``items`` and the ``next_cursor`` (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        from src.db.session import async_session_factory
+        from src.repositories.execution_repository import ExecutionRepository
+        
+        position = ExecutionService.decode_execution_cursor(cursor) if cursor else None
+        
+        async with async_session_factory() as db:
+            repo = ExecutionRepository(db)
+            # Fetch one extra row to know whether another page follows
+            rows = await repo.get_execution_page(
+                limit=limit + 1,
+                cursor=position,
+                group_ids=group_ids,
+                include_result=include_result,
+                include_inputs=include_inputs
+            )
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            
+            memory_candidates = {}
+            if position is None:
+                page_ids = {row["job_id"] for row in rows}
+                memory_candidates = {
+                    execution_id: data
+                    for execution_id, data in ExecutionService.executions.items()
+                    if execution_id not in page_ids
+                    and (not group_ids or data.get("group_id") is None or data.get("group_id") in group_ids)
+                }
+                if memory_candidates:
+                    # Executions persisted on later pages must not be listed twice
+                    for execution_id in await repo.get_existing_job_ids(list(memory_candidates)):
+                        memory_candidates.pop(execution_id, None)
+        
+        items = []
+        for execution_id, data in sorted(
+            memory_candidates.items(),
+            key=lambda entry: entry[1].get("created_at") or datetime.min,
+            reverse=True
+        ):
+            item = {**data, "execution_id": execution_id}
+            if not include_result:
+                item.pop("result", None)
+            if not include_inputs:
+                item.pop("inputs", None)
+            items.append(item)
+        
+        for row in rows:
+            item = {
+                "id": row["id"],
+                "execution_id": row["job_id"],
+                "status": row["status"],
+                "created_at": row["created_at"],
+                "completed_at": row["completed_at"],
+                "run_name": row["run_name"],
+                "error": row["error"],
+                "group_email": row["group_email"],
+            }
+            if include_result:
+                item["result"] = row["result"]
+            if include_inputs:
+                item["inputs"] = row["inputs"]
+                item.update(ExecutionService._extract_yaml_fields(row["inputs"]))
+            items.append(item)
+        
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = ExecutionService.encode_execution_cursor(last["created_at"], last["id"])
+        
+        return {"items": items, "next_cursor": next_cursor}
+    
     @staticmethod
     def _execute_crew(
         execution_id: str,
@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional
 
 from src.models.execution_status import ExecutionStatus
 from src.repositories.execution_repository import ExecutionRepository
+from src.services.trace_queue import get_trace_job_cache
 from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,8 @@ class ExecutionStatusService:
             logger.error(f"[ExecutionStatusService] Invalid job_id: {job_id}")
             return False
             
+        is_terminal = status in [ExecutionStatus.COMPLETED.value, ExecutionStatus.FAILED.value, ExecutionStatus.CANCELLED.value]
+        
         try:
             # Define the database operation
             async def _update_operation(session):
@@ -88,7 +91,7 @@ class ExecutionStatusService:
                         update_data["result"] = str(result)
                 
                 # Set completed_at if status is a terminal status
-                if status in [ExecutionStatus.COMPLETED.value, ExecutionStatus.FAILED.value, ExecutionStatus.CANCELLED.value]:
+                if is_terminal:
                     from datetime import datetime
                     # Always set completed_at to current time for terminal statuses
                     update_data["completed_at"] = datetime.now()  # Use timezone-naive datetime
@@ -118,7 +121,12 @@ class ExecutionStatusService:
                     return False
 
             # Execute the operation with a fresh engine/session
-            return await execute_db_operation_with_fresh_engine(_update_operation)
+            success = await execute_db_operation_with_fresh_engine(_update_operation)
+            
+            # A finished execution no longer needs its trace writer cache entry
+            if success and is_terminal:
+                get_trace_job_cache().evict(job_id)
+            return success
                 
         except Exception as e:
             logger.error(f"[ExecutionStatusService] Error during update/flush/commit for job_id {job_id}: {str(e)}", exc_info=True)
@@ -5,6 +5,7 @@ This module provides functions for retrieving and managing execution traces
 from the database.
 """
 
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
 from sqlalchemy.exc import SQLAlchemyError
@@ -86,16 +87,23 @@ class ExecutionTraceService:
         db, 
         job_id: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> ExecutionTraceResponseByJobId:
         """
         Get traces for an execution by job_id with pagination.
         
+        Pass the highest trace ID already seen as ``after_id`` (or the latest
+        creation time as ``since``) to fetch only traces recorded since then.
+        
         Args:
             db: No longer used, kept for backward compatibility
             job_id: String ID of the execution (job_id in database)
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            after_id: Only return traces with an ID greater than this
+            since: Only return traces created later than this
             
         Returns:
             ExecutionTraceResponseByJobId with traces for the execution
@@ -111,7 +119,9 @@ class ExecutionTraceService:
             traces = await execution_trace_repository.get_by_job_id(
                 job_id,
                 limit,
-                offset
+                offset,
+                after_id=after_id,
+                since=since
             )
             
             # If no traces found using the direct job_id field, try via the run_id (for backward compatibility)
@@ -120,7 +130,9 @@ class ExecutionTraceService:
                 traces = await execution_trace_repository.get_by_run_id(
                     run_id,
                     limit,
-                    offset
+                    offset,
+                    after_id=after_id,
+                    since=since
                 )
                 
                 # Update job_id for these traces if it's missing
@@ -230,7 +242,28 @@ class ExecutionTraceService:
         except Exception as e:
             logger.error(f"Error creating trace: {str(e)}")
             raise
-    
+
+    @staticmethod
+    async def create_traces(traces: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Create several traces with a single bulk insert.
+
+        Args:
+            traces: List of dictionaries with trace data
+
+        Returns:
+            Mapping of job_id to run_id for the jobs resolved during the insert
+        """
+        try:
+            return await execution_trace_repository.create_many(traces)
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error creating {len(traces)} traces: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error creating {len(traces)} traces: {str(e)}")
+            raise
+
     @staticmethod
     async def delete_trace(trace_id: int) -> Optional[DeleteTraceResponse]:
         """
@@ -11,6 +11,7 @@ from fastapi import HTTPException
 
 from src.utils.model_config import get_model_config
 from src.core.logger import LoggerManager
+from src.core.model_resolution_cache import get_model_resolution_cache
 from src.services.api_keys_service import ApiKeysService
 from src.repositories.model_config_repository import ModelConfigRepository
 from src.models.model_config import ModelConfig
@@ -99,7 +100,9 @@ class ModelConfigService:
             model_dict = dict(model_data)
         
         # Create new model
-        return await self.repository.create(model_dict)
+        created = await self.repository.create(model_dict)
+        get_model_resolution_cache().clear()
+        return created
     
     async def update_model_config(self, key: str, model_data):
         """
@@ -126,7 +129,9 @@ class ModelConfigService:
             model_dict = dict(model_data)
             
         # Update model
-        return await self.repository.update(existing_model.id, model_dict)
+        updated = await self.repository.update(existing_model.id, model_dict)
+        get_model_resolution_cache().clear()
+        return updated
     
     async def toggle_model_enabled(self, key: str, enabled: bool) -> Optional[ModelConfig]:
         """
@@ -142,6 +147,7 @@ class ModelConfigService:
         try:
             # Use the direct DML method to avoid locking
             updated = await self.repository.toggle_enabled(key, enabled)
+            get_model_resolution_cache().clear()
             
             if not updated:
                 return None
@@ -167,7 +173,9 @@ class ModelConfigService:
         logger.info(f"Service: Attempting to delete model with key: {key}")
         
         # Use the dedicated repository method for deletion by key
-        return await self.repository.delete_by_key(key)
+        deleted = await self.repository.delete_by_key(key)
+        get_model_resolution_cache().clear()
+        return deleted
     
     async def enable_all_models(self) -> List[ModelConfig]:
         """
@@ -179,6 +187,7 @@ class ModelConfigService:
         try:
             # Enable all models with a single operation
             success = await self.repository.enable_all_models()
+            get_model_resolution_cache().clear()
             if not success:
                 logger.warning("Failed to enable all models")
                 
@@ -198,6 +207,7 @@ class ModelConfigService:
         try:
             # Disable all models with a single operation
             success = await self.repository.disable_all_models()
+            get_model_resolution_cache().clear()
             if not success:
                 logger.warning("Failed to disable all models")
                 
@@ -0,0 +1,171 @@
+"""
+In-memory timing index for active schedules.
+
+The scheduler loop keeps every active schedule in a min-heap keyed by its
+``next_run_at`` so it can sleep exactly until the earliest one is due instead
+of polling the database. Schedule changes made through ``SchedulerService``
+mark the index dirty and wake the loop, which then reloads it from the
+repository.
+"""
+import asyncio
+import heapq
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.cron_utils import ensure_utc
+
+
+class ScheduleDispatcher:
+    """
+    Min-heap of (next_run_at, schedule_id) entries with a change notifier.
+
+    Rescheduling a schedule pushes a new entry and leaves the old one in the
+    heap; entries that no longer match ``_next_runs`` are discarded lazily when
+    they reach the top, so push, remove and pop are all O(log n).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int]] = []
+        self._next_runs: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._dirty = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def load(self, schedules: Iterable[Any]) -> None:
+        """
+        Replace the index with the given schedules.
+
+        Args:
+            schedules: Schedule objects; inactive ones and ones without a
+                next run time are ignored
+        """
+        next_runs = {
+            schedule.id: ensure_utc(schedule.next_run_at)
+            for schedule in schedules
+            if schedule.is_active and schedule.next_run_at is not None
+        }
+        heap = [(next_run, schedule_id) for schedule_id, next_run in next_runs.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._next_runs = next_runs
+            self._heap = heap
+
+    def push(self, schedule_id: int, next_run_at: datetime) -> None:
+        """Add a schedule or move it to a new run time."""
+        next_run_at = ensure_utc(next_run_at)
+        with self._lock:
+            self._next_runs[schedule_id] = next_run_at
+            heapq.heappush(self._heap, (next_run_at, schedule_id))
+
+    def remove(self, schedule_id: int) -> None:
+        """Drop a schedule from the index."""
+        with self._lock:
+            self._next_runs.pop(schedule_id, None)
+
+    def _discard_stale(self) -> None:
+        # Caller holds the lock
+        while self._heap:
+            next_run, schedule_id = self._heap[0]
+            if self._next_runs.get(schedule_id) == next_run:
+                return
+            heapq.heappop(self._heap)
+
+    def peek(self) -> Optional[Tuple[datetime, int]]:
+        """Get the earliest (next_run_at, schedule_id) entry without removing it."""
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[int]:
+        """
+        Remove and return the IDs of all schedules due at ``now``.
+
+        Args:
+            now: Current time; naive values are treated as UTC
+
+        Returns:
+            Due schedule IDs, earliest first
+        """
+        now = ensure_utc(now)
+        due = []
+        with self._lock:
+            self._discard_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, schedule_id = heapq.heappop(self._heap)
+                del self._next_runs[schedule_id]
+                due.append(schedule_id)
+                self._discard_stale()
+        return due
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Get the delay until the earliest schedule is due, or None if the index is empty."""
+        entry = self.peek()
+        if entry is None:
+            return None
+        now = ensure_utc(now) if now is not None else datetime.now(timezone.utc)
+        return max(0.0, (entry[0] - now).total_seconds())
+
+    def __len__(self) -> int:
+        return len(self._next_runs)
+
+    def bind_loop(self) -> None:
+        """Bind the wakeup event to the running event loop (the scheduler loop)."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+    def notify_changed(self) -> None:
+        """Mark the index stale and wake the scheduler loop; safe from any thread."""
+        self._dirty = True
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def take_dirty(self) -> bool:
+        """Return whether a reload was requested and clear the flag."""
+        dirty, self._dirty = self._dirty, False
+        return dirty
+
+    async def wait(self, timeout: Optional[float]) -> bool:
+        """
+        Sleep until a change notification arrives or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to sleep, or None to wait for a change
+
+        Returns:
+            True if woken by a change notification
+        """
+        wakeup = self._wakeup
+        if wakeup is None:
+            raise RuntimeError("ScheduleDispatcher.bind_loop() must be called before wait()")
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            wakeup.clear()
+
+
+_schedule_dispatcher: Optional[ScheduleDispatcher] = None
+_schedule_dispatcher_lock = threading.Lock()
+
+
+def get_schedule_dispatcher() -> ScheduleDispatcher:
+    """Get the process-wide schedule dispatcher."""
+    global _schedule_dispatcher
+    if _schedule_dispatcher is None:
+        with _schedule_dispatcher_lock:
+            if _schedule_dispatcher is None:
+                _schedule_dispatcher = ScheduleDispatcher()
+    return _schedule_dispatcher
@@ -14,9 +14,10 @@ from src.repositories.execution_history_repository import ExecutionHistoryReposi
 from src.schemas.schedule import ScheduleCreate, ScheduleCreateFromExecution, ScheduleUpdate, ScheduleResponse, ScheduleListResponse, ToggleResponse
 from src.schemas.execution import CrewConfig
 from src.schemas.scheduler import SchedulerJobCreate, SchedulerJobUpdate, SchedulerJobResponse
-from src.utils.cron_utils import ensure_utc, calculate_next_run_from_last
+from src.utils.cron_utils import calculate_next_run_from_last
 from src.services.crewai_execution_service import CrewAIExecutionService, JobStatus
 from src.db.session import async_session_factory
+from src.services.schedule_dispatcher import ScheduleDispatcher, get_schedule_dispatcher
 from src.models.execution_history import ExecutionHistory as Run
 from src.config.settings import settings
 from src.engines.crewai.callbacks import JobOutputCallback
@@ -76,6 +77,7 @@ class SchedulerService:
                 schedule_dict["created_by_email"] = group_context.group_email
             
             schedule = await self.repository.create(schedule_dict)
+            get_schedule_dispatcher().notify_changed()
             
             return ScheduleResponse.model_validate(schedule)
         except ValueError as e:
@@ -160,6 +162,7 @@ class SchedulerService:
                 schedule_dict["created_by_email"] = group_context.group_email
             
             schedule = await self.repository.create(schedule_dict)
+            get_schedule_dispatcher().notify_changed()
             
             return ScheduleResponse.model_validate(schedule)
         except HTTPException:
@@ -244,6 +247,7 @@ class SchedulerService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Schedule with ID {schedule_id} not found"
                 )
+            get_schedule_dispatcher().notify_changed()
             
             return ScheduleResponse.model_validate(schedule)
         except HTTPException:
@@ -282,6 +286,7 @@ class SchedulerService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Schedule with ID {schedule_id} not found"
                 )
+            get_schedule_dispatcher().notify_changed()
             
             return {"message": "Schedule deleted successfully"}
         except HTTPException:
@@ -314,6 +319,7 @@ class SchedulerService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Schedule with ID {schedule_id} not found"
                 )
+            get_schedule_dispatcher().notify_changed()
             
             return ToggleResponse.model_validate(schedule)
         except HTTPException:
@@ -453,6 +459,7 @@ class SchedulerService:
                 # Update schedule after execution
                 repo = ScheduleRepository(session)
                 await repo.update_after_execution(schedule_id, execution_time)
+                get_schedule_dispatcher().notify_changed()
                 
                 logger_manager.scheduler.info(
                     f"Successfully ran schedule {schedule_id}."
@@ -465,119 +472,134 @@ class SchedulerService:
                 async with async_session_factory() as error_session:
                     repo = ScheduleRepository(error_session)
                     await repo.update_after_execution(schedule_id, execution_time)
+                get_schedule_dispatcher().notify_changed()
             except Exception as update_error:
                 logger_manager.scheduler.error(f"Error updating schedule {schedule_id} after job failure: {update_error}")
     
+    async def _reload_schedules(self, dispatcher: ScheduleDispatcher) -> None:
+        """
+        Rebuild the dispatcher index from the active schedules in the database.
+        
+        Args:
+            dispatcher: Dispatcher to reload
+        """
+        async with async_session_factory() as session:
+            repo = ScheduleRepository(session)
+            schedules = await repo.find_active()
+        dispatcher.load(schedules)
+        next_entry = dispatcher.peek()
+        logger_manager.scheduler.info(
+            f"Loaded {len(dispatcher)} active schedules; next run at "
+            f"{next_entry[0] if next_entry else None} (schedule {next_entry[1] if next_entry else None})"
+        )
+    
+    async def _run_due_schedules(self, dispatcher: ScheduleDispatcher, due_ids: List[int], now_utc: datetime) -> None:
+        """
+        Start jobs for the schedules the dispatcher reported as due.
+        
+        Due schedules are re-read from the database so the stored state stays
+        authoritative; each started schedule is pushed back into the index with
+        its new next run time.
+        
+        Args:
+            dispatcher: Dispatcher that reported the schedules
+            due_ids: IDs popped from the dispatcher
+            now_utc: Current time (timezone-aware UTC)
+        """
+        async with async_session_factory() as session:
+            repo = ScheduleRepository(session)
+            # Convert timezone-aware now_utc to timezone-naive for database comparison
+            due_schedules = await repo.find_due_schedules(now_utc.replace(tzinfo=None))
+            logger_manager.scheduler.info(f"Found {len(due_schedules)} schedules due to run")
+            
+            for schedule in due_schedules:
+                logger_manager.scheduler.info(f"Starting task for schedule {schedule.id} - {schedule.name}")
+                logger_manager.scheduler.debug(f"Schedule configuration: agents_yaml={schedule.agents_yaml}, tasks_yaml={schedule.tasks_yaml}, inputs={schedule.inputs}, planning={schedule.planning}, model={schedule.model}")
+                
+                config = CrewConfig(
+                    agents_yaml=schedule.agents_yaml,
+                    tasks_yaml=schedule.tasks_yaml,
+                    inputs=schedule.inputs,
+                    planning=schedule.planning,
+                    model=schedule.model,
+                    reasoning=False,  # Default value for scheduled jobs
+                    execution_type="crew",  # Scheduled jobs are crew executions
+                    schema_detection_enabled=True  # Default value
+                )
+                
+                # Create task for the job
+                task = asyncio.create_task(
+                    self.run_schedule_job(schedule.id, config, now_utc),
+                    name=f"schedule_{schedule.id}_{now_utc.isoformat()}"
+                )
+                self._running_tasks.add(task)
+                
+                # Update next run time immediately
+                # Convert timezone-aware now_utc to timezone-naive for consistency
+                schedule.next_run_at = calculate_next_run_from_last(
+                    schedule.cron_expression,
+                    now_utc.replace(tzinfo=None)
+                )
+                dispatcher.push(schedule.id, schedule.next_run_at)
+            
+            await session.commit()
+        
+        # A popped schedule that is no longer due was changed behind our back
+        started_ids = {schedule.id for schedule in due_schedules}
+        if any(schedule_id not in started_ids for schedule_id in due_ids):
+            dispatcher.notify_changed()
+    
     async def check_and_run_schedules(self) -> None:
         """
-        Check for due schedules and run them.
+        Run due schedules as they become due.
         This is the main scheduler loop that runs continuously.
+        
+        Active schedules are kept in the dispatcher's min-heap; the loop sleeps
+        until the earliest next run time and is woken early whenever a schedule
+        is created, updated, toggled or deleted.
         """
         logger_manager.scheduler.info("Schedule checker started and running")
+        dispatcher = get_schedule_dispatcher()
+        dispatcher.bind_loop()
+        dispatcher.notify_changed()
+        last_reload = 0.0
         
         while True:
             try:
-                # Clean up completed tasks
-                self._running_tasks = {task for task in self._running_tasks if not task.done()}
-                
-                # Get current time
-                now_utc = datetime.now(timezone.utc)
-                now_local = datetime.now().astimezone()
-                logger_manager.scheduler.info(f"Checking for due schedules at {now_local} (local) / {now_utc} (UTC)")
-                logger_manager.scheduler.info(f"Currently running tasks: {len(self._running_tasks)}")
+                # Clean up completed tasks and report their errors
+                for task in [task for task in self._running_tasks if task.done()]:
+                    self._running_tasks.discard(task)
+                    if not task.cancelled() and task.exception() is not None:
+                        logger_manager.scheduler.error(f"Task {task.get_name()} failed with error: {task.exception()}")
                 
-                # Find due schedules
-                async with async_session_factory() as session:
-                    repo = ScheduleRepository(session)
-                    # Convert timezone-aware now_utc to timezone-naive for database comparison
-                    due_schedules = await repo.find_due_schedules(now_utc.replace(tzinfo=None))
-                    all_schedules = await repo.find_all()
-                    
-                    # Log status of all schedules
-                    logger_manager.scheduler.info("Current schedules status:")
-                    for schedule in all_schedules:
-                        # Handle timezone-naive datetimes from database
-                        if schedule.next_run_at and schedule.next_run_at.tzinfo is None:
-                            next_run = schedule.next_run_at.replace(tzinfo=timezone.utc)
-                        else:
-                            next_run = ensure_utc(schedule.next_run_at)
-                            
-                        if schedule.last_run_at and schedule.last_run_at.tzinfo is None:
-                            last_run = schedule.last_run_at.replace(tzinfo=timezone.utc)
-                        else:
-                            last_run = ensure_utc(schedule.last_run_at)
-                            
-                        is_due = schedule.is_active and next_run is not None and next_run <= now_utc
-                        
-                        next_run_local = next_run.astimezone() if next_run else None
-                        last_run_local = last_run.astimezone() if last_run else None
-                        
-                        logger_manager.scheduler.info(
-                            f"Schedule {schedule.id} - {schedule.name}:"
-                            f" active={schedule.is_active},"
-                            f" next_run={next_run_local} (local) / {next_run} (UTC),"
-                            f" last_run={last_run_local} (local) / {last_run} (UTC),"
-                            f" cron={schedule.cron_expression},"
-                            f" planning={schedule.planning},"
-                            f" model={schedule.model},"
-                            f" is_due={is_due}"
-                            f" (now={now_local} local / {now_utc} UTC)"
-                        )
-                    
-                    # Start tasks for due schedules
-                    logger_manager.scheduler.info(f"Found {len(due_schedules)} schedules due to run")
-                    
-                    for schedule in due_schedules:
-                        logger_manager.scheduler.info(f"Starting task for schedule {schedule.id} - {schedule.name}")
-                        logger_manager.scheduler.info(f"Schedule configuration: agents_yaml={schedule.agents_yaml}, tasks_yaml={schedule.tasks_yaml}, inputs={schedule.inputs}, planning={schedule.planning}, model={schedule.model}")
-                        
-                        config = CrewConfig(
-                            agents_yaml=schedule.agents_yaml,
-                            tasks_yaml=schedule.tasks_yaml,
-                            inputs=schedule.inputs,
-                            planning=schedule.planning,
-                            model=schedule.model,
-                            reasoning=False,  # Default value for scheduled jobs
-                            execution_type="crew",  # Scheduled jobs are crew executions
-                            schema_detection_enabled=True  # Default value
-                        )
-                        
-                        # Create task for the job
-                        task = asyncio.create_task(
-                            self.run_schedule_job(schedule.id, config, now_utc),
-                            name=f"schedule_{schedule.id}_{now_utc.isoformat()}"
-                        )
-                        self._running_tasks.add(task)
-                        
-                        # Update next run time immediately
-                        # Convert timezone-aware now_utc to timezone-naive for consistency
-                        schedule.next_run_at = calculate_next_run_from_last(
-                            schedule.cron_expression,
-                            now_utc.replace(tzinfo=None)
-                        )
-                        await session.commit()
+                loop_time = asyncio.get_running_loop().time()
+                resync_due = loop_time - last_reload >= settings.SCHEDULER_RESYNC_INTERVAL_SECONDS
+                if dispatcher.take_dirty() or resync_due:
+                    await self._reload_schedules(dispatcher)
+                    last_reload = loop_time
                 
-                # Check for task errors
-                for task in list(self._running_tasks):
-                    if task.done():
-                        try:
-                            await task
-                        except Exception as e:
-                            logger_manager.scheduler.error(f"Task {task.get_name()} failed with error: {e}")
+                now_utc = datetime.now(timezone.utc)
+                due_ids = dispatcher.pop_due(now_utc)
+                if due_ids:
+                    await self._run_due_schedules(dispatcher, due_ids, now_utc)
                 
-                # Sleep before next check
-                logger_manager.scheduler.info("Sleeping for 60 seconds before next check")
-                await asyncio.sleep(60)
+                # Sleep until the next schedule is due, a schedule changes, or the periodic resync
+                timeout = settings.SCHEDULER_RESYNC_INTERVAL_SECONDS
+                delay = dispatcher.seconds_until_next()
+                if delay is not None:
+                    timeout = min(timeout, delay)
+                await dispatcher.wait(timeout)
             except Exception as e:
                 logger_manager.scheduler.error(f"Error in schedule checker: {e}")
-                await asyncio.sleep(60)
+                dispatcher.notify_changed()
+                await asyncio.sleep(5)
     
     async def start_scheduler(self, interval_seconds: int = 60) -> None:
         """
         Start the scheduler with a background task.
         
         Args:
-            interval_seconds: Interval in seconds between schedule checks
+            interval_seconds: Delay in seconds before restarting the scheduler loop after it exits
         """
         logger.info("Starting scheduler background task...")
         
@@ -678,6 +700,7 @@ class SchedulerService:
         
         # Create schedule
         schedule = await self.repository.create(schedule_data.model_dump())
+        get_schedule_dispatcher().notify_changed()
         
         # Convert back to job response
         return SchedulerJobResponse(
@@ -742,6 +765,7 @@ class SchedulerService:
         
         # Update schedule
         updated_schedule = await self.repository.update(job_id, update_data)
+        get_schedule_dispatcher().notify_changed()
         
         # Convert to job response
         return SchedulerJobResponse(
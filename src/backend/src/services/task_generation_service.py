@@ -7,7 +7,7 @@ using LLM models and prompt templates.
 
 import logging
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import re
 import json
 import litellm
@@ -16,8 +16,10 @@ from src.schemas.model_provider import ModelProvider
 from src.schemas.task_generation import TaskGenerationRequest, TaskGenerationResponse
 from src.services.template_service import TemplateService
 from src.utils.prompt_utils import robust_json_parser
+from src.utils.streaming_json import ANY, IncrementalJSONParser, iter_completion_text
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.prompt_cache import add_prompt_cache_hints
 from src.schemas.task import TaskCreate
 from src.utils.user_context import GroupContext
 
@@ -100,31 +102,7 @@ class TaskGenerationService:
         model = request.model or os.getenv("TASK_MODEL", DEFAULT_TASK_MODEL)
         logger.info(f"Using model for task generation: {model}")
         
-        # Get prompt template from database
-        base_message = await TemplateService.get_template_content("generate_task")
-        
-        # Check if we have a prompt template
-        if not base_message:
-            logger.error("No prompt template found in database for generate_task")
-            raise ValueError("Required prompt template 'generate_task' not found in database")
-        
-        logger.info("Using prompt template for generate_task from database")
-        
-        # Add agent context if provided
-        if request.agent:
-            agent = request.agent
-            base_message += f"\n\nCreate a task specifically for an agent with the following profile:\n"
-            base_message += f"Name: {agent.name}\n"
-            base_message += f"Role: {agent.role}\n"
-            base_message += f"Goal: {agent.goal}\n"
-            base_message += f"Backstory: {agent.backstory}\n"
-            base_message += "\nEnsure the task aligns with this agent's expertise and goals."
-
-        # Prepare messages for LLM
-        messages = [
-            {"role": "system", "content": base_message},
-            {"role": "user", "content": request.text}
-        ]
+        base_message, messages = await self._build_task_messages(request)
         
         try:
             # Configure litellm using the LLMManager
@@ -133,7 +111,7 @@ class TaskGenerationService:
             # Generate completion with litellm directly
             response = await litellm.acompletion(
                 **model_params,
-                messages=messages,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
                 temperature=0.7,
                 max_tokens=4000
             )
@@ -146,20 +124,7 @@ class TaskGenerationService:
                 
             logger.info(f"Generated task setup: {content[:100]}...")
             
-            # Special handling for responses with embedded function calls or unusual JSON
-            if "```json" in content or "```" in content:
-                logger.info("Found code block in response, extracting JSON...")
-                # Extract JSON from code block if present
-                code_block_pattern = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
-                matches = code_block_pattern.search(content)
-                if matches:
-                    content = matches.group(1).strip()
-                    logger.info("Extracted JSON from code block")
-                
-            # Try to clean up some common JSON formatting issues before parsing
-            content = content.strip()
-            # Remove trailing commas which can cause parsing failures
-            content = re.sub(r',\s*([\]}])', r'\1', content)
+            content = self._clean_content(content)
             
             # Log successful interaction
             await self._log_llm_interaction(
@@ -202,6 +167,149 @@ class TaskGenerationService:
             )
             raise ValueError(f"Could not parse response as JSON: {str(e)}")
         
+        return self._process_task_setup(setup, model)
+    
+    async def stream_task(self, request: TaskGenerationRequest, group_context: Optional[GroupContext] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a task while streaming the generation.
+        
+        Args:
+            request: Task generation request with prompt text, model, and agent context
+            group_context: Optional group context for multi-group isolation
+            
+        Yields:
+            Events as {"event": ..., "data": ...}: "token" for each text delta,
+            "field" for each top-level field as soon as it is complete, then
+            "complete" with the generated task, or "error"
+        """
+        model = request.model or os.getenv("TASK_MODEL", DEFAULT_TASK_MODEL)
+        logger.info(f"Streaming task generation with model: {model}")
+        base_message = ""
+        content = ""
+        
+        try:
+            base_message, messages = await self._build_task_messages(request)
+            model_params = await LLMManager.configure_litellm(model)
+            response = await litellm.acompletion(
+                **model_params,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
+                temperature=0.7,
+                max_tokens=4000,
+                stream=True
+            )
+            
+            parser = IncrementalJSONParser([(ANY,)])
+            async for delta in iter_completion_text(response):
+                yield {"event": "token", "data": {"text": delta}}
+                for path, value in parser.feed(delta):
+                    yield {"event": "field", "data": {"name": path[0], "value": value}}
+            
+            if not parser.text:
+                raise ValueError("Empty content received from LLM")
+            content = self._clean_content(parser.text)
+            task = self._process_task_setup(robust_json_parser(content), model)
+            await self._log_llm_interaction(
+                endpoint='generate-task',
+                prompt=f"System: {base_message}\nUser: {request.text}",
+                response=content,
+                model=model,
+                group_context=group_context
+            )
+            yield {"event": "complete", "data": task.model_dump()}
+        except Exception as e:
+            error_msg = f"Error generating task: {str(e)}"
+            logger.error(error_msg)
+            await self._log_llm_interaction(
+                endpoint='generate-task',
+                prompt=f"System: {base_message}\nUser: {request.text}",
+                response=content or str(e),
+                model=model,
+                status='error',
+                error_message=error_msg,
+                group_context=group_context
+            )
+            yield {"event": "error", "data": {"message": error_msg}}
+    
+    async def _build_task_messages(self, request: TaskGenerationRequest) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Build the LLM messages for a task generation request.
+        
+        Args:
+            request: Task generation request with prompt text and agent context
+            
+        Returns:
+            Tuple of (system message, messages)
+            
+        Raises:
+            ValueError: If required prompt template is not found
+        """
+        # Get prompt template from database
+        base_message = await TemplateService.get_template_content("generate_task")
+        
+        # Check if we have a prompt template
+        if not base_message:
+            logger.error("No prompt template found in database for generate_task")
+            raise ValueError("Required prompt template 'generate_task' not found in database")
+        
+        logger.info("Using prompt template for generate_task from database")
+        
+        # Add agent context if provided
+        if request.agent:
+            agent = request.agent
+            base_message += f"\n\nCreate a task specifically for an agent with the following profile:\n"
+            base_message += f"Name: {agent.name}\n"
+            base_message += f"Role: {agent.role}\n"
+            base_message += f"Goal: {agent.goal}\n"
+            base_message += f"Backstory: {agent.backstory}\n"
+            base_message += "\nEnsure the task aligns with this agent's expertise and goals."
+
+        # Prepare messages for LLM
+        messages = [
+            {"role": "system", "content": base_message},
+            {"role": "user", "content": request.text}
+        ]
+        return base_message, messages
+    
+    def _clean_content(self, content: str) -> str:
+        """
+        Extract the JSON from a generated response and fix common formatting issues.
+        
+        Args:
+            content: Raw response content
+            
+        Returns:
+            Cleaned content ready for parsing
+        """
+        # Special handling for responses with embedded function calls or unusual JSON
+        if "```json" in content or "```" in content:
+            logger.info("Found code block in response, extracting JSON...")
+            # Extract JSON from code block if present
+            code_block_pattern = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+            matches = code_block_pattern.search(content)
+            if matches:
+                content = matches.group(1).strip()
+                logger.info("Extracted JSON from code block")
+            
+        # Try to clean up some common JSON formatting issues before parsing
+        content = content.strip()
+        # Remove trailing commas which can cause parsing failures
+        content = re.sub(r',\s*([\]}])', r'\1', content)
+        return content
+    
+    def _process_task_setup(self, setup: Dict[str, Any], model: str) -> TaskGenerationResponse:
+        """
+        Validate a generated task and fill in advanced_config defaults.
+        
+        Args:
+            setup: Parsed task configuration from the LLM
+            model: Model used for generation
+            
+        Returns:
+            TaskGenerationResponse with generated task details
+            
+        Raises:
+            ValueError: If required fields are missing
+        """
         # Validate required fields
         required_fields = ['name', 'description', 'expected_output']
         for field in required_fields:
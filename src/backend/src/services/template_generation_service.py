@@ -9,7 +9,7 @@ import logging
 import json
 import traceback
 
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import litellm
 
@@ -17,7 +17,9 @@ from src.services.template_service import TemplateService
 from src.schemas.template_generation import TemplateGenerationRequest, TemplateGenerationResponse
 from src.services.log_service import LLMLogService
 from src.utils.prompt_utils import robust_json_parser
+from src.utils.streaming_json import ANY, IncrementalJSONParser, iter_completion_text
 from src.core.llm_manager import LLMManager
+from src.core.prompt_cache import add_prompt_cache_hints
 from src.services.model_config_service import ModelConfigService
 from src.core.unit_of_work import UnitOfWork
 
@@ -93,40 +95,7 @@ class TemplateGenerationService:
             Exception: For other errors
         """
         try:
-            # Get model configuration from database using ModelConfigService
-            async with UnitOfWork() as uow:
-                model_config_service = await ModelConfigService.from_unit_of_work(uow)
-                model_config = await model_config_service.get_model_config(request.model)
-            
-            # Check if model configuration was found
-            if not model_config:
-                raise ValueError(f"Model {request.model} not found in the database")
-                
-            logger.info(f"Using model for template generation: {model_config['name']}")
-            
-            # Get prompt template from database
-            system_message = await TemplateService.get_template_content("generate_templates")
-            
-            # Check if we have a prompt template
-            if not system_message:
-                logger.error("No prompt template found in database for generate_templates")
-                raise ValueError("Required prompt template 'generate_templates' not found in database")
-            
-            logger.info("Using prompt template for generate_templates from database")
-            
-            # Create the user prompt with agent details
-            user_prompt = f"""Create templates for an AI agent with:
-            Role: {request.role}
-            Goal: {request.goal}
-            Backstory: {request.backstory}
-            
-            Generate all three templates following CrewAI and LangChain best practices."""
-            
-            # Prepare messages for LLM
-            messages = [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_prompt}
-            ]
+            model_config, system_message, user_prompt, messages = await self._prepare_generation(request)
             
             # Configure litellm using the LLMManager
             model_params = await LLMManager.configure_litellm(model_config["name"])
@@ -135,7 +104,7 @@ class TemplateGenerationService:
                 # Generate completion with litellm directly
                 response = await litellm.acompletion(
                     **model_params,
-                    messages=messages,
+                    messages=add_prompt_cache_hints(messages, model_params.get("model")),
                     temperature=0.7,
                     max_tokens=4000
                 )
@@ -170,25 +139,144 @@ class TemplateGenerationService:
             # Parse the response as JSON using robust parser
             templates = robust_json_parser(content)
             
-            # Normalize the field names to lowercase if needed
-            normalized_templates = {
-                "system_template": templates.get("system_template") or templates.get("System Template") or templates.get("System_Template"),
-                "prompt_template": templates.get("prompt_template") or templates.get("Prompt Template") or templates.get("Prompt_Template"),
-                "response_template": templates.get("response_template") or templates.get("Response Template") or templates.get("Response_Template")
-            }
-            
-            # Validate that all required fields are present and non-empty
-            for field, value in normalized_templates.items():
-                if not value:
-                    raise ValueError(f"Missing or empty required field: {field}")
-            
-            # Create response object from normalized templates
-            response = TemplateGenerationResponse(**normalized_templates)
-            return response
+            return self._normalize_templates(templates)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response as JSON: {str(e)}")
             raise ValueError("Failed to parse AI response as JSON")
         except Exception as e:
             logger.error(f"Error generating templates: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+    
+    async def stream_templates(self, request: TemplateGenerationRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate templates for an agent while streaming the generation.
+        
+        Args:
+            request: Template generation request with role, goal, backstory, and model
+            
+        Yields:
+            Events as {"event": ..., "data": ...}: "token" for each text delta,
+            "field" for each template as soon as it is complete, then
+            "complete" with all three templates, or "error"
+        """
+        model_name = request.model
+        system_message = user_prompt = content = ""
+        
+        try:
+            model_config, system_message, user_prompt, messages = await self._prepare_generation(request)
+            model_name = model_config["name"]
+            model_params = await LLMManager.configure_litellm(model_name)
+            response = await litellm.acompletion(
+                **model_params,
+                messages=add_prompt_cache_hints(messages, model_params.get("model")),
+                temperature=0.7,
+                max_tokens=4000,
+                stream=True
+            )
+            
+            parser = IncrementalJSONParser([(ANY,)])
+            async for delta in iter_completion_text(response):
+                yield {"event": "token", "data": {"text": delta}}
+                for path, value in parser.feed(delta):
+                    yield {"event": "field", "data": {"name": path[0], "value": value}}
+            content = parser.text
+            
+            await self._log_llm_interaction(
+                endpoint='generate-templates',
+                prompt=f"System: {system_message}\nUser: {user_prompt}",
+                response=content,
+                model=model_name
+            )
+            templates = self._normalize_templates(robust_json_parser(content))
+            yield {"event": "complete", "data": templates.model_dump()}
+        except Exception as e:
+            error_msg = f"Error generating templates: {str(e)}"
+            logger.error(error_msg)
+            if not content:
+                await self._log_llm_interaction(
+                    endpoint='generate-templates',
+                    prompt=f"System: {system_message}\nUser: {user_prompt}",
+                    response=str(e),
+                    model=model_name,
+                    status='error',
+                    error_message=error_msg
+                )
+            yield {"event": "error", "data": {"message": error_msg}}
+    
+    async def _prepare_generation(self, request: TemplateGenerationRequest) -> Tuple[Dict[str, Any], str, str, List[Dict[str, str]]]:
+        """
+        Resolve the model and build the LLM messages for a template generation request.
+        
+        Args:
+            request: Template generation request with role, goal, backstory, and model
+            
+        Returns:
+            Tuple of (model configuration, system message, user prompt, messages)
+            
+        Raises:
+            ValueError: If the model or the prompt template is not found
+        """
+        # Get model configuration from database using ModelConfigService
+        async with UnitOfWork() as uow:
+            model_config_service = await ModelConfigService.from_unit_of_work(uow)
+            model_config = await model_config_service.get_model_config(request.model)
+        
+        # Check if model configuration was found
+        if not model_config:
+            raise ValueError(f"Model {request.model} not found in the database")
+        
+        logger.info(f"Using model for template generation: {model_config['name']}")
+        
+        # Get prompt template from database
+        system_message = await TemplateService.get_template_content("generate_templates")
+        
+        # Check if we have a prompt template
+        if not system_message:
+            logger.error("No prompt template found in database for generate_templates")
+            raise ValueError("Required prompt template 'generate_templates' not found in database")
+        
+        logger.info("Using prompt template for generate_templates from database")
+        
+        # Create the user prompt with agent details
+        user_prompt = f"""Create templates for an AI agent with:
+            Role: {request.role}
+            Goal: {request.goal}
+            Backstory: {request.backstory}
+            
+            Generate all three templates following CrewAI and LangChain best practices."""
+        
+        # Prepare messages for LLM
+        messages = [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_prompt}
+        ]
+        return model_config, system_message, user_prompt, messages
+    
+    def _normalize_templates(self, templates: Dict[str, Any]) -> TemplateGenerationResponse:
+        """
+        Normalize and validate generated templates.
+        
+        Args:
+            templates: Parsed LLM response
+            
+        Returns:
+            TemplateGenerationResponse with system, prompt, and response templates
+            
+        Raises:
+            ValueError: If a template is missing or empty
+        """
+        # Normalize the field names to lowercase if needed
+        normalized_templates = {
+            "system_template": templates.get("system_template") or templates.get("System Template") or templates.get("System_Template"),
+            "prompt_template": templates.get("prompt_template") or templates.get("Prompt Template") or templates.get("Prompt_Template"),
+            "response_template": templates.get("response_template") or templates.get("Response Template") or templates.get("Response_Template")
+        }
+        
+        # Validate that all required fields are present and non-empty
+        for field, value in normalized_templates.items():
+            if not value:
+                raise ValueError(f"Missing or empty required field: {field}")
+        
+        # Create response object from normalized templates
+        return TemplateGenerationResponse(**normalized_templates)
@@ -7,6 +7,8 @@ from src.models.template import PromptTemplate
 from src.schemas.template import PromptTemplateCreate, PromptTemplateUpdate
 from src.seeds.prompt_templates import DEFAULT_TEMPLATES
 from src.core.unit_of_work import UnitOfWork
+from src.core.intent_cache import get_intent_cache
+from src.core.prompt_cache import get_prompt_cache
 
 
 # Configure logging
@@ -134,7 +136,8 @@ class TemplateService:
             service = cls(uow.template_repository)
             template = await service.create_template(template_data)
             await uow.commit()
-            return template
+        cls._invalidate_caches(template_data.name)
+        return template
     
     async def create_template(self, template_data: PromptTemplateCreate) -> PromptTemplate:
         """
@@ -166,7 +169,9 @@ class TemplateService:
             template = await service.update_template(id, template_data)
             if template:
                 await uow.commit()
-            return template
+        if template:
+            cls._invalidate_caches()
+        return template
     
     async def update_template(self, id: int, template_data: PromptTemplateUpdate) -> Optional[PromptTemplate]:
         """
@@ -198,7 +203,9 @@ class TemplateService:
             deleted = await service.delete_template(id)
             if deleted:
                 await uow.commit()
-            return deleted
+        if deleted:
+            cls._invalidate_caches()
+        return deleted
     
     async def delete_template(self, id: int) -> bool:
         """
@@ -224,7 +231,8 @@ class TemplateService:
             service = cls(uow.template_repository)
             count = await service.delete_all_templates()
             await uow.commit()
-            return count
+        cls._invalidate_caches()
+        return count
     
     async def delete_all_templates(self) -> int:
         """
@@ -247,7 +255,8 @@ class TemplateService:
             service = cls(uow.template_repository)
             count = await service.reset_templates()
             await uow.commit()
-            return count
+        cls._invalidate_caches()
+        return count
     
     async def reset_templates(self) -> int:
         """
@@ -267,6 +276,22 @@ class TemplateService:
             
         return count
     
+    @staticmethod
+    def _invalidate_caches(name: Optional[str] = None) -> None:
+        """
+        Drop cached template content and everything derived from it.
+        
+        Called after the change is committed: dropping entries before the
+        commit lets concurrent reads cache the old content again.
+        
+        Args:
+            name: Changed template, or None if unknown (drops all templates)
+        """
+        get_prompt_cache().invalidate_templates(name)
+        # Intent decisions depend on the detect_intent template
+        if name is None or name == "detect_intent":
+            get_intent_cache().clear()
+    
     @classmethod
     async def get_template_content(cls, name: str, default_template: str = None) -> str:
         """
@@ -279,11 +304,17 @@ class TemplateService:
         Returns:
             Template content
         """
+        cache = get_prompt_cache()
+        cached = cache.get_template(name)
+        if cached is not None:
+            return cached
+        
         try:
             async with UnitOfWork() as uow:
                 service = cls(uow.template_repository)
                 template = await service.find_by_name(name)
                 if template:
+                    cache.put_template(name, template.template)
                     return template.template
                 elif default_template:
                     return default_template
@@ -3,6 +3,7 @@ import logging
 
 from fastapi import HTTPException, status
 
+from src.core.prompt_cache import get_prompt_cache
 from src.repositories.tool_repository import ToolRepository
 from src.schemas.tool import ToolCreate, ToolUpdate, ToolResponse, ToolListResponse, ToggleResponse
 
@@ -106,6 +107,7 @@ class ToolService:
         try:
             # Create tool
             tool = await self.repository.create(tool_data.model_dump())
+            get_prompt_cache().invalidate_tools()
             return ToolResponse.model_validate(tool)
         except Exception as e:
             logger.error(f"Failed to create tool: {str(e)}")
@@ -141,6 +143,7 @@ class ToolService:
             # Update tool
             update_data = tool_data.model_dump(exclude_unset=True)
             updated_tool = await self.repository.update(tool_id, update_data)
+            get_prompt_cache().invalidate_tools()
             return ToolResponse.model_validate(updated_tool)
         except Exception as e:
             logger.error(f"Failed to update tool: {str(e)}")
@@ -174,6 +177,7 @@ class ToolService:
         try:
             # Delete tool
             await self.repository.delete(tool_id)
+            get_prompt_cache().invalidate_tools()
             return True
         except Exception as e:
             logger.error(f"Failed to delete tool: {str(e)}")
@@ -198,6 +202,7 @@ class ToolService:
         try:
             # Toggle tool enabled status using repository
             tool = await self.repository.toggle_enabled(tool_id)
+            get_prompt_cache().invalidate_tools()
             if not tool:
                 logger.warning(f"Tool with ID {tool_id} not found for toggle")
                 raise HTTPException(
@@ -261,6 +266,7 @@ class ToolService:
         """
         try:
             updated_tool = await self.repository.update_configuration_by_title(title, config)
+            get_prompt_cache().invalidate_tools()
             if not updated_tool:
                 logger.warning(f"Tool with title '{title}' not found for configuration update")
                 raise HTTPException(
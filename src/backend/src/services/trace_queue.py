@@ -1,20 +1,127 @@
 import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from src.config.settings import settings
+
+# Event types persisted to execution_trace. Anything else is dropped at enqueue
+# time so it never crosses the queue.
+IMPORTANT_EVENT_TYPES = frozenset({
+    "agent_execution", "tool_usage", "crew_started",
+    "crew_completed", "task_started", "task_completed", "llm_call", "llm_usage"
+})
+
+
+def should_persist_trace(event_type: Optional[str]) -> bool:
+    """Check whether traces of this event type are stored by the trace writer."""
+    return event_type in IMPORTANT_EVENT_TYPES
+
 
 class TraceQueue:
     """Singleton holder for the agent trace queue."""
     _instance = None
     _queue = None
+    _notifier: Optional[Callable[[], None]] = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(TraceQueue, cls).__new__(cls)
             cls._instance._queue = queue.Queue()
+            cls._instance._notifier = None
         return cls._instance
 
     def get_queue(self) -> queue.Queue:
         """Get the singleton queue instance."""
         return self._queue
 
+    def set_notifier(self, notifier: Optional[Callable[[], None]]) -> None:
+        """
+        Register a callback invoked after every enqueue.
+
+        The trace writer uses this to wake up its event loop (via
+        ``loop.call_soon_threadsafe``) instead of polling the queue.
+
+        Args:
+            notifier: Thread-safe callable, or None to unregister
+        """
+        self._notifier = notifier
+
+    def notify(self) -> None:
+        """Wake up the registered consumer, if any."""
+        notifier = self._notifier
+        if notifier is not None:
+            notifier()
+
 # Function to get the singleton queue instance easily
 def get_trace_queue() -> queue.Queue:
-    return TraceQueue().get_queue() 
\ No newline at end of file
+    return TraceQueue().get_queue()
+
+
+class TraceJobCache:
+    """
+    Bounded LRU cache of job_id -> executionhistory.id for the trace writer.
+
+    Saves the writer an executionhistory lookup per trace. Entries are evicted
+    when the cache is full and when an execution reaches a terminal status.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, job_id: str) -> Optional[int]:
+        """Return the cached run_id for a job, or None on a miss."""
+        with self._lock:
+            run_id = self._entries.get(job_id)
+            if run_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(job_id)
+            self.hits += 1
+            return run_id
+
+    def put(self, job_id: str, run_id: int) -> None:
+        """Cache the run_id for a job, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[job_id] = run_id
+            self._entries.move_to_end(job_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, job_id: str) -> None:
+        """Drop a job from the cache, e.g. once its execution has finished."""
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached jobs."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_trace_job_cache: Optional[TraceJobCache] = None
+
+
+def get_trace_job_cache() -> TraceJobCache:
+    """Get the process-wide job existence cache used by the trace writer."""
+    global _trace_job_cache
+    if _trace_job_cache is None:
+        _trace_job_cache = TraceJobCache(settings.TRACE_JOB_CACHE_SIZE)
+    return _trace_job_cache
+
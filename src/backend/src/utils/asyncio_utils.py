@@ -2,8 +2,12 @@
 Utilities for event loop management and handling asyncio operations across threads.
 """
 import asyncio
+import concurrent.futures
+import contextvars
+import itertools
 import logging
-from typing import Any, Callable, List, TypeVar, Coroutine
+import threading
+from typing import Any, Callable, List, Optional, TypeVar, Coroutine
 
 from src.core.logger import LoggerManager
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
@@ -157,4 +161,190 @@ def run_in_thread_with_loop(func: Callable, *args, **kwargs) -> Any:
                 loop.close()
                 logger.info("Successfully closed the event loop created for this thread")
             except Exception as e:
-                logger.error(f"Error cleaning up event loop: {str(e)}") 
\ No newline at end of file
+                logger.error(f"Error cleaning up event loop: {str(e)}")
+
+
+class BackgroundLoop:
+    """
+    A long-lived event loop running in a daemon thread.
+
+    Sync code (CrewAI memory backends, tool ``_run`` methods) submits coroutines
+    to it instead of creating a thread and an event loop per call. Resources
+    bound to the loop, such as its database engine from the engine registry,
+    are reused across calls and disposed when the loop is shut down.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(loop, started), name=self.name, daemon=True
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception as e:
+                logger.error(f"Error cleaning up background loop {self.name}: {str(e)}")
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+    def owns_current_thread(self) -> bool:
+        """Whether the caller is running on this loop's thread."""
+        return self._thread is not None and self._thread is threading.current_thread()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the loop and return a thread-safe future.
+
+        The coroutine runs in a copy of the caller's context, so context
+        variables set by the caller (such as the request's user context) are
+        visible to it. Cancelling the future cancels the coroutine.
+        """
+        loop = self.loop
+        context = contextvars.copy_context()
+        future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+        def start() -> None:
+            if future.cancelled():
+                coroutine.close()
+                return
+            task = context.run(loop.create_task, coroutine)
+            task.add_done_callback(lambda done: _copy_task_state(done, future))
+
+            def cancel_task(cancelled: concurrent.futures.Future) -> None:
+                if cancelled.cancelled() and not loop.is_closed():
+                    loop.call_soon_threadsafe(task.cancel)
+
+            future.add_done_callback(cancel_task)
+
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Cancel pending work, stop the loop and wait for its thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+def _copy_task_state(task: asyncio.Task, future: concurrent.futures.Future) -> None:
+    """Set the outcome of a finished background task on its thread-safe future."""
+    if future.cancelled():
+        return
+    try:
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+    except concurrent.futures.InvalidStateError:
+        # The caller cancelled the future while the task was finishing
+        pass
+
+
+_background_loops: List[BackgroundLoop] = []
+_background_loops_lock = threading.Lock()
+_background_loop_counter = itertools.count()
+
+
+def _get_background_loop() -> BackgroundLoop:
+    """Pick one of the process-wide background loops (round-robin)."""
+    if not _background_loops:
+        with _background_loops_lock:
+            if not _background_loops:
+                from src.config.settings import settings
+                count = max(1, settings.ASYNC_BRIDGE_LOOP_COUNT)
+                _background_loops.extend(
+                    BackgroundLoop(f"async-bridge-{i}") for i in range(count)
+                )
+    return _background_loops[next(_background_loop_counter) % len(_background_loops)]
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine from synchronous code on a shared background event loop.
+
+    Works whether or not the calling thread already runs an event loop. If the
+    caller gives up (timeout or interrupt), the coroutine is cancelled on the
+    background loop.
+
+    Args:
+        coroutine: Coroutine to run
+        timeout: Seconds to wait for the result, None to wait indefinitely
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        TimeoutError: If the result is not available within ``timeout``
+        RuntimeError: If called from a background loop thread, which would deadlock
+    """
+    if any(background.owns_current_thread() for background in _background_loops):
+        coroutine.close()
+        raise RuntimeError("run_sync cannot be called from a background loop thread; await the coroutine instead")
+
+    future = _get_background_loop().submit(coroutine)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Coroutine did not complete within {timeout} seconds")
+    except BaseException:
+        # Propagate interrupts/cancellation of the waiting thread to the coroutine
+        future.cancel()
+        raise
+
+
+def run_in_background(coroutine: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """
+    Schedule a coroutine on a shared background event loop without waiting for it.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        A thread-safe future of the coroutine's result
+    """
+    return _get_background_loop().submit(coroutine)
+
+
+def shutdown_background_loops(timeout: float = 10.0) -> None:
+    """Stop all background loops started by ``run_sync``."""
+    with _background_loops_lock:
+        loops = list(_background_loops)
+        _background_loops.clear()
+    for background in loops:
+        background.shutdown(timeout)
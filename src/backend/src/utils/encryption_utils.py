@@ -7,7 +7,8 @@ This module provides utilities for encrypting and decrypting sensitive data.
 import os
 import logging
 import base64
-from typing import Tuple
+import threading
+from typing import Any, Dict, Tuple
 from pathlib import Path
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes, serialization
@@ -21,6 +22,19 @@ logger = logging.getLogger(__name__)
 class EncryptionUtils:
     """Utility class for encryption and decryption operations."""
     
+    # Key pairs read from disk (by key directory) and parsed key objects (by PEM
+    # bytes), so RSA keys are loaded once per process instead of on every call
+    _key_pairs: Dict[str, Tuple[bytes, bytes]] = {}
+    _key_objects: Dict[bytes, Any] = {}
+    _key_cache_lock = threading.Lock()
+    
+    @classmethod
+    def clear_key_cache(cls) -> None:
+        """Forget loaded key pairs, e.g. after the key files were replaced"""
+        with cls._key_cache_lock:
+            cls._key_pairs.clear()
+            cls._key_objects.clear()
+    
     @staticmethod
     def get_key_directory() -> Path:
         """Get the directory where SSH keys are stored"""
@@ -58,6 +72,10 @@ class EncryptionUtils:
     def get_or_create_ssh_keys() -> Tuple[bytes, bytes]:
         """Get existing SSH keys or create new ones if they don't exist"""
         key_dir = EncryptionUtils.get_key_directory()
+        cached = EncryptionUtils._key_pairs.get(str(key_dir))
+        if cached is not None:
+            return cached
+        
         private_key_path = key_dir / "private_key.pem"
         public_key_path = key_dir / "public_key.pem"
         
@@ -73,8 +91,37 @@ class EncryptionUtils:
             public_key_path.write_bytes(public_key)
             logger.info("Generated new SSH key pair for encryption")
         
+        with EncryptionUtils._key_cache_lock:
+            EncryptionUtils._key_pairs[str(key_dir)] = (private_key, public_key)
         return private_key, public_key
 
+    @staticmethod
+    def load_private_key(private_key_bytes: bytes) -> Any:
+        """Parse a PEM private key, reusing the key object if it was parsed before"""
+        key = EncryptionUtils._key_objects.get(private_key_bytes)
+        if key is None:
+            key = serialization.load_pem_private_key(
+                private_key_bytes,
+                password=None,
+                backend=default_backend()
+            )
+            with EncryptionUtils._key_cache_lock:
+                EncryptionUtils._key_objects[private_key_bytes] = key
+        return key
+
+    @staticmethod
+    def load_public_key(public_key_bytes: bytes) -> Any:
+        """Parse a PEM public key, reusing the key object if it was parsed before"""
+        key = EncryptionUtils._key_objects.get(public_key_bytes)
+        if key is None:
+            key = serialization.load_pem_public_key(
+                public_key_bytes,
+                backend=default_backend()
+            )
+            with EncryptionUtils._key_cache_lock:
+                EncryptionUtils._key_objects[public_key_bytes] = key
+        return key
+
     @staticmethod
     def get_encryption_key() -> bytes:
         """Get or generate a Fernet encryption key (for backward compatibility)"""
@@ -93,10 +140,7 @@ class EncryptionUtils:
         """Encrypt a value using RSA public key encryption"""
         try:
             _, public_key_bytes = EncryptionUtils.get_or_create_ssh_keys()
-            public_key = serialization.load_pem_public_key(
-                public_key_bytes,
-                backend=default_backend()
-            )
+            public_key = EncryptionUtils.load_public_key(public_key_bytes)
             
             # RSA can only encrypt limited data size, so we'll use a hybrid approach
             # Generate a symmetric key
@@ -128,11 +172,7 @@ class EncryptionUtils:
         """Decrypt a value using RSA private key encryption"""
         try:
             private_key_bytes, _ = EncryptionUtils.get_or_create_ssh_keys()
-            private_key = serialization.load_pem_private_key(
-                private_key_bytes,
-                password=None,
-                backend=default_backend()
-            )
+            private_key = EncryptionUtils.load_private_key(private_key_bytes)
             
             # Decode the combined value
             combined = base64.b64decode(encrypted_value.encode())
@@ -0,0 +1,245 @@
+"""
+Utilities for streaming LLM generations.
+
+The generation services ask the model for one JSON document. When the
+completion is streamed, ``IncrementalJSONParser`` scans the text as it
+arrives and hands back every value at a requested path (e.g. each element of
+``"agents"``) as soon as that value is complete, without waiting for the rest
+of the document. Text before the document (prose, code fences) is skipped.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+from src.utils.prompt_utils import robust_json_parser
+
+logger = logging.getLogger(__name__)
+
+PathElement = Union[str, int]
+JSONPath = Tuple[PathElement, ...]
+
+# Wildcard matching any key or index in a path pattern
+ANY = "*"
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Container:
+    """An object or array that has been opened but not yet closed."""
+
+    __slots__ = ("kind", "path", "start", "key", "index", "expect")
+
+    def __init__(self, kind: str, path: JSONPath, start: int):
+        self.kind = kind
+        self.path = path
+        self.start = start
+        self.key: Optional[str] = None
+        self.index = 0
+        # Objects alternate "key" -> "colon" -> "value" -> "comma"; arrays "value" -> "comma"
+        self.expect = "key" if kind == "object" else "value"
+
+    def child_path(self) -> JSONPath:
+        return self.path + ((self.key if self.kind == "object" else self.index),)
+
+
+class IncrementalJSONParser:
+    """
+    Incremental parser emitting completed values at selected paths.
+
+    Paths are tuples of object keys and array indexes from the document root;
+    patterns may use ``ANY`` for any key or index. For a crew document,
+    ``("agents", ANY)`` matches each agent object and ``(ANY,)`` each
+    top-level field.
+    """
+
+    def __init__(self, patterns: Iterable[JSONPath]):
+        self._patterns = [tuple(pattern) for pattern in patterns]
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Container] = []
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+        self._token_start = -1
+        self._string_is_key = False
+        self._scalar_start = -1
+        self.done = False
+        self.failed = False
+        self.closed_paths: List[JSONPath] = []
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
+
+    def _matches(self, path: JSONPath) -> bool:
+        for pattern in self._patterns:
+            if len(pattern) == len(path) and all(p == ANY or p == e for p, e in zip(pattern, path)):
+                return True
+        return False
+
+    def _decode(self, raw: str) -> Any:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            if raw.lstrip().startswith(("{", "[")):
+                return robust_json_parser(raw)
+            raise
+
+    def _complete_value(self, path: JSONPath, raw: str, events: List[Tuple[JSONPath, Any]]) -> None:
+        """Record a finished value, emitting it if its path was requested."""
+        if self._matches(path):
+            try:
+                events.append((path, self._decode(raw)))
+            except ValueError as e:
+                logger.warning(f"Could not decode streamed JSON value at {path}: {e}")
+        if self._stack:
+            self._stack[-1].expect = "comma"
+        else:
+            self.done = True
+
+    def feed(self, chunk: str) -> List[Tuple[JSONPath, Any]]:
+        """
+        Add text and collect the values it completed.
+
+        Args:
+            chunk: Next piece of the generated text
+
+        Returns:
+            List of (path, value) for requested values completed by this chunk
+        """
+        events: List[Tuple[JSONPath, Any]] = []
+        if not chunk:
+            return events
+        self._text += chunk
+        if self.done or self.failed:
+            return events
+        text = self._text
+
+        while self._pos < len(text) and not self.done and not self.failed:
+            ch = text[self._pos]
+
+            if not self._started:
+                if ch in "{[":
+                    self._started = True
+                    continue
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    raw = text[self._token_start:self._pos + 1]
+                    container = self._stack[-1] if self._stack else None
+                    if self._string_is_key:
+                        try:
+                            container.key = json.loads(raw)
+                        except json.JSONDecodeError:
+                            container.key = raw[1:-1]
+                        container.expect = "colon"
+                    else:
+                        path = container.child_path() if container else ()
+                        self._complete_value(path, raw, events)
+                self._pos += 1
+                continue
+
+            if self._scalar_start >= 0:
+                if ch in ",}]" or ch in _WHITESPACE:
+                    container = self._stack[-1] if self._stack else None
+                    path = container.child_path() if container else ()
+                    self._complete_value(path, text[self._scalar_start:self._pos], events)
+                    self._scalar_start = -1
+                    # The delimiter is handled by the structural branch below
+                    continue
+                self._pos += 1
+                continue
+
+            container = self._stack[-1] if self._stack else None
+
+            if ch in _WHITESPACE:
+                pass
+            elif container is not None and container.expect == "comma":
+                if ch == ",":
+                    if container.kind == "array":
+                        container.index += 1
+                        container.expect = "value"
+                    else:
+                        container.expect = "key"
+                elif ch in "}]":
+                    self._close(ch, text, events)
+                else:
+                    self.failed = True
+            elif container is not None and container.expect == "key":
+                if ch == '"':
+                    self._in_string = True
+                    self._string_is_key = True
+                    self._token_start = self._pos
+                elif ch == "}":
+                    # Empty object or trailing comma
+                    self._close(ch, text, events)
+                else:
+                    self.failed = True
+            elif container is not None and container.expect == "colon":
+                if ch == ":":
+                    container.expect = "value"
+                else:
+                    self.failed = True
+            else:
+                # A value starts here (or an empty array / trailing comma ends)
+                if ch in "{[":
+                    path = container.child_path() if container else ()
+                    self._stack.append(_Container("object" if ch == "{" else "array", path, self._pos))
+                elif ch == "]" and container is not None and container.kind == "array":
+                    self._close(ch, text, events)
+                elif ch == '"':
+                    self._in_string = True
+                    self._string_is_key = False
+                    self._token_start = self._pos
+                elif ch in "}],:":
+                    self.failed = True
+                else:
+                    self._scalar_start = self._pos
+            self._pos += 1
+
+        if self.failed:
+            logger.warning("Streamed JSON is not well-formed; falling back to parsing the full response")
+        return events
+
+    def _close(self, ch: str, text: str, events: List[Tuple[JSONPath, Any]]) -> None:
+        container = self._stack.pop()
+        if (ch == "}") != (container.kind == "object"):
+            self.failed = True
+            return
+        self.closed_paths.append(container.path)
+        self._complete_value(container.path, text[container.start:self._pos + 1], events)
+
+
+async def iter_completion_text(response: Any) -> AsyncIterator[str]:
+    """
+    Yield the text deltas of a streamed litellm completion.
+
+    Args:
+        response: Result of ``litellm.acompletion(..., stream=True)``
+
+    Yields:
+        Non-empty content deltas, in order
+    """
+    async for chunk in response:
+        try:
+            choices = chunk["choices"] if isinstance(chunk, dict) else chunk.choices
+            delta = choices[0]["delta"] if isinstance(choices[0], dict) else choices[0].delta
+            content = delta.get("content") if isinstance(delta, dict) else getattr(delta, "content", None)
+        except (AttributeError, IndexError, KeyError, TypeError):
+            continue
+        if content:
+            yield content
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -125,6 +125,18 @@ def cleanup_after_test():
     yield
     # Clean up any global state if needed
     # For example, clear in-memory caches, reset singletons, etc.
+    from src.core.api_key_cache import get_api_key_cache
+    from src.core.intent_cache import get_intent_cache
+    from src.core.model_resolution_cache import get_model_resolution_cache
+    from src.core.prompt_cache import get_prompt_cache
+    from src.core.vector_index import get_documentation_vector_index
+    from src.utils.encryption_utils import EncryptionUtils
+    get_api_key_cache().clear()
+    get_intent_cache().clear()
+    get_model_resolution_cache().clear()
+    get_prompt_cache().clear()
+    get_documentation_vector_index().reset()
+    EncryptionUtils.clear_key_cache()
 
 # Skip integration tests marker
 def pytest_configure(config):
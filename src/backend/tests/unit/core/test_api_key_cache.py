@@ -0,0 +1,84 @@
+"""
+Unit tests for the in-process API key cache.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.api_key_cache import ApiKeyCache, get_api_key_cache
+
+
+class TestApiKeyCache:
+    """Test cases for ApiKeyCache."""
+
+    def test_get_missing_returns_sentinel(self):
+        """Test an uncached key returns MISSING and counts a miss."""
+        cache = ApiKeyCache(ttl_seconds=60)
+
+        assert cache.get("OPENAI_API_KEY") is ApiKeyCache.MISSING
+        assert cache.get_stats()["misses"] == 1
+
+    def test_put_and_get(self):
+        """Test cached values are returned, including cached None."""
+        cache = ApiKeyCache(ttl_seconds=60)
+        cache.put("OPENAI_API_KEY", "sk-test")
+        cache.put("ANTHROPIC_API_KEY", None)
+
+        assert cache.get("OPENAI_API_KEY") == "sk-test"
+        assert cache.get("ANTHROPIC_API_KEY") is None
+        assert cache.get_stats()["hits"] == 2
+
+    def test_entries_are_scoped_by_group(self):
+        """Test the same key name is cached separately per group."""
+        cache = ApiKeyCache(ttl_seconds=60)
+        cache.put("OPENAI_API_KEY", "global")
+        cache.put("OPENAI_API_KEY", "group-a", group_id="a")
+
+        assert cache.get("OPENAI_API_KEY") == "global"
+        assert cache.get("OPENAI_API_KEY", group_id="a") == "group-a"
+        assert cache.get("OPENAI_API_KEY", group_id="b") is ApiKeyCache.MISSING
+
+    def test_entries_expire(self):
+        """Test entries are dropped once the TTL has elapsed."""
+        cache = ApiKeyCache(ttl_seconds=10)
+        with patch('src.core.api_key_cache.time.monotonic', return_value=100.0):
+            cache.put("OPENAI_API_KEY", "sk-test")
+        with patch('src.core.api_key_cache.time.monotonic', return_value=109.0):
+            assert cache.get("OPENAI_API_KEY") == "sk-test"
+        with patch('src.core.api_key_cache.time.monotonic', return_value=111.0):
+            assert cache.get("OPENAI_API_KEY") is ApiKeyCache.MISSING
+        assert len(cache) == 0
+
+    def test_invalidate_drops_key_for_all_groups(self):
+        """Test invalidate removes every group's entry for a key name only."""
+        cache = ApiKeyCache(ttl_seconds=60)
+        cache.put("OPENAI_API_KEY", "global")
+        cache.put("OPENAI_API_KEY", "group-a", group_id="a")
+        cache.put("ANTHROPIC_API_KEY", "other")
+
+        cache.invalidate("OPENAI_API_KEY")
+
+        assert cache.get("OPENAI_API_KEY") is ApiKeyCache.MISSING
+        assert cache.get("OPENAI_API_KEY", group_id="a") is ApiKeyCache.MISSING
+        assert cache.get("ANTHROPIC_API_KEY") == "other"
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a TTL of 0 never stores values."""
+        cache = ApiKeyCache(ttl_seconds=0)
+        cache.put("OPENAI_API_KEY", "sk-test")
+
+        assert cache.get("OPENAI_API_KEY") is ApiKeyCache.MISSING
+
+    def test_clear(self):
+        """Test clear drops entries and counters."""
+        cache = ApiKeyCache(ttl_seconds=60)
+        cache.put("OPENAI_API_KEY", "sk-test")
+        cache.get("OPENAI_API_KEY")
+
+        cache.clear()
+
+        assert cache.get_stats() == {"size": 0, "ttl_seconds": 60, "hits": 0, "misses": 0}
+
+    def test_get_api_key_cache_singleton(self):
+        """Test the module-level accessor returns one shared instance."""
+        assert get_api_key_cache() is get_api_key_cache()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the embedding cache.
+
+Tests content-hash keys, LRU eviction, the SQLite disk tier and batching helpers.
+"""
+import pytest
+
+from src.core.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_batch_size,
+    iter_batches,
+    make_embedding_key,
+)
+
+
+class TestMakeEmbeddingKey:
+    """Test cases for make_embedding_key."""
+
+    def test_key_depends_on_provider_model_and_text(self):
+        """Test that every component changes the key."""
+        key = make_embedding_key("databricks", "gte", "hello")
+
+        assert key == make_embedding_key("databricks", "gte", "hello")
+        assert key != make_embedding_key("openai", "gte", "hello")
+        assert key != make_embedding_key("databricks", "bge", "hello")
+        assert key != make_embedding_key("databricks", "gte", "hello!")
+
+    def test_provider_prefix_is_ignored(self):
+        """Test that litellm-style prefixes map to the same key."""
+        assert make_embedding_key("databricks", "databricks/gte", "x") == make_embedding_key("databricks", "gte", "x")
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_get_many_and_put_many(self):
+        """Test lookups, stores and hit/miss counters."""
+        cache = EmbeddingCache(max_size=10)
+        cache.put_many({"k1": [0.1, 0.2]})
+
+        found = cache.get_many(["k1", "k2"])
+
+        assert found == {"k1": [0.1, 0.2]}
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["persistent"] is False
+
+    def test_lru_eviction(self):
+        """Test that the least recently used embedding is evicted first."""
+        cache = EmbeddingCache(max_size=2)
+        cache.put_many({"k1": [1.0], "k2": [2.0]})
+        cache.get_many(["k1"])
+        cache.put_many({"k3": [3.0]})
+
+        assert len(cache) == 2
+        assert cache.get_many(["k1", "k2", "k3"]) == {"k1": [1.0], "k3": [3.0]}
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Test that embeddings written to SQLite are found by a fresh cache."""
+        db_path = str(tmp_path / "embeddings.db")
+        cache = EmbeddingCache(max_size=1, db_path=db_path)
+        cache.put_many({"k1": [0.1, 0.2, 0.3], "k2": [0.4]})
+
+        reopened = EmbeddingCache(max_size=10, db_path=db_path)
+
+        assert reopened.persistent
+        assert reopened.get_many(["k1", "k2"]) == {"k1": [0.1, 0.2, 0.3], "k2": [0.4]}
+        # Disk hits are promoted into memory
+        assert len(reopened) == 2
+
+    def test_clear(self, tmp_path):
+        """Test that clear empties both tiers."""
+        cache = EmbeddingCache(max_size=10, db_path=str(tmp_path / "embeddings.db"))
+        cache.put_many({"k1": [1.0]})
+
+        cache.clear()
+
+        assert cache.get_many(["k1"]) == {}
+
+
+class TestBatchingHelpers:
+    """Test cases for the batching helpers."""
+
+    def test_iter_batches(self):
+        """Test splitting into consecutive batches."""
+        assert list(iter_batches([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+        assert list(iter_batches([], 2)) == []
+
+    def test_get_embedding_batch_size(self):
+        """Test per-provider batch sizes with a default for unknown providers."""
+        assert get_embedding_batch_size("databricks") == 150
+        assert get_embedding_batch_size("unknown") == 100
@@ -0,0 +1,55 @@
+"""
+Unit tests for the execution update hub.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.core.execution_updates import ExecutionUpdateHub, get_execution_update_hub
+
+
+class TestExecutionUpdateHub:
+    """Test per-execution update subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_publish_wakes_only_matching_subscribers(self):
+        """Test that subscribers are woken for their own execution only."""
+        hub = ExecutionUpdateHub()
+        first = hub.subscribe("exec-1")
+        second = hub.subscribe("exec-2")
+
+        hub.publish(["exec-1", "exec-1"], "traces")
+        hub.publish(["exec-1"], "logs")
+
+        assert await first.wait(1.0) == {"traces", "logs"}
+        assert await second.wait(0.01) == set()
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        """Test that publishing from a writer thread wakes an async subscriber."""
+        hub = ExecutionUpdateHub()
+        subscription = hub.subscribe("exec-1")
+
+        thread = threading.Thread(target=hub.publish, args=(["exec-1"], "logs"))
+        thread.start()
+        thread.join()
+
+        assert await subscription.wait(1.0) == {"logs"}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_subscription(self):
+        """Test that unsubscribed clients are no longer counted or notified."""
+        hub = ExecutionUpdateHub()
+        subscription = hub.subscribe("exec-1")
+        assert hub.subscriber_count("exec-1") == 1
+
+        hub.unsubscribe(subscription)
+        hub.publish(["exec-1"], "traces")
+
+        assert hub.subscriber_count() == 0
+        assert await subscription.wait(0.01) == set()
+
+    def test_get_execution_update_hub_is_singleton(self):
+        """Test that the accessor returns one shared hub."""
+        assert get_execution_update_hub() is get_execution_update_hub()
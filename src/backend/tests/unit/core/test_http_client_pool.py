@@ -0,0 +1,109 @@
+"""
+Unit tests for the shared HTTP client pool.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.http_client_pool import HttpClientPool, url_host
+
+
+def make_pool(**overrides) -> HttpClientPool:
+    options = dict(
+        max_connections_per_host=4,
+        keepalive_seconds=60,
+        timeout_seconds=120,
+        connect_timeout_seconds=10,
+        max_retries=2,
+        backoff_seconds=0.5,
+    )
+    options.update(overrides)
+    return HttpClientPool(**options)
+
+
+class TestHttpClientPool:
+    """Test cases for HttpClientPool."""
+
+    def test_url_host(self):
+        """Test sessions are keyed by the host and port of a URL."""
+        assert url_host("https://Example.cloud.databricks.com/api/2.0/jobs") == "example.cloud.databricks.com"
+        assert url_host("http://localhost:8080/x") == "localhost:8080"
+
+    def test_should_retry(self):
+        """Test throttling is retried for any method and server errors only for idempotent ones."""
+        assert HttpClientPool.should_retry("POST", 429)
+        assert HttpClientPool.should_retry("POST", 503)
+        assert not HttpClientPool.should_retry("POST", 500)
+        assert HttpClientPool.should_retry("GET", 502)
+        assert not HttpClientPool.should_retry("GET", 404)
+
+    def test_backoff_delay(self):
+        """Test the backoff doubles with jitter, is capped and honours Retry-After."""
+        pool = make_pool(max_backoff_seconds=3.0)
+
+        assert 0.25 <= pool.backoff_delay(0) <= 0.5
+        assert 1.0 <= pool.backoff_delay(2) <= 2.0
+        assert 1.5 <= pool.backoff_delay(10) <= 3.0
+        assert pool.backoff_delay(0, retry_after="2") == 2.0
+        assert pool.backoff_delay(0, retry_after="120") == 3.0
+        assert 0.25 <= pool.backoff_delay(0, retry_after="Wed, 21 Oct 2015 07:28:00 GMT") <= 0.5
+
+    def test_sync_sessions_are_shared_per_host(self):
+        """Test one requests session is kept per host."""
+        pool = make_pool()
+        session = pool.get_sync_session("https://a.example.com/one")
+
+        assert pool.get_sync_session("https://a.example.com/two") is session
+        assert pool.get_sync_session("https://b.example.com/one") is not session
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["sync_sessions"] == 2
+
+    @patch("requests.Session.get")
+    def test_sync_client_default_timeout_and_metrics(self, mock_get):
+        """Test blocking requests get the default timeout and are recorded per host."""
+        pool = make_pool()
+        mock_get.return_value = MagicMock(status_code=500)
+
+        pool.sync_client().get("https://a.example.com/x", headers={"A": "b"})
+        pool.sync_client().get("https://a.example.com/y", timeout=5)
+
+        assert mock_get.call_args_list[0].kwargs["timeout"] == (10, 120)
+        assert mock_get.call_args_list[1].kwargs["timeout"] == 5
+        host_stats = pool.get_stats()["hosts"]["a.example.com"]
+        assert host_stats["requests"] == 2
+        assert host_stats["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_request_retries_throttling(self):
+        """Test a throttled request is retried after the Retry-After delay."""
+        pool = make_pool()
+        throttled = MagicMock(status=429, headers={"Retry-After": "0"})
+        ok = MagicMock(status=200, headers={})
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=[throttled, ok])
+
+        with patch.object(pool, "get_session", return_value=session):
+            async with pool.client() as client:
+                async with client.post("https://a.example.com/x", json={}) as response:
+                    assert response is ok
+
+        assert session.request.await_count == 2
+        throttled.release.assert_called_once()
+        ok.release.assert_called_once()
+        assert pool.get_stats()["hosts"]["a.example.com"]["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_request_gives_up_after_max_retries(self):
+        """Test the last response is returned once the retries are used up."""
+        pool = make_pool(max_retries=1)
+        unavailable = MagicMock(status=503, headers={"Retry-After": "0"})
+        session = MagicMock()
+        session.request = AsyncMock(return_value=unavailable)
+
+        with patch.object(pool, "get_session", return_value=session):
+            response = await pool.client().get("https://a.example.com/x")
+
+        assert response.status == 503
+        assert session.request.await_count == 2
@@ -0,0 +1,56 @@
+"""
+Unit tests for the dispatcher intent cache.
+"""
+from unittest.mock import patch
+
+from src.core.intent_cache import IntentCache, normalize_message
+
+
+class TestIntentCache:
+    """Test cases for IntentCache."""
+
+    def test_normalize_message_collapses_case_and_whitespace(self):
+        """Test messages differing only in case and spacing normalise alike."""
+        assert normalize_message("  Run   the\tCrew ") == "run the crew"
+
+    def test_keys_are_scoped_by_group_and_model(self):
+        """Test one group's or model's decisions are not served to another."""
+        cache = IntentCache(max_size=10, ttl_seconds=60)
+        cache.put(cache.make_key("group-a", "model", "Run crew"), {"intent": "execute_crew"})
+
+        assert cache.get(cache.make_key("group-a", "model", "run  crew"))["intent"] == "execute_crew"
+        assert cache.get(cache.make_key("group-b", "model", "run crew")) is None
+        assert cache.get(cache.make_key("group-a", "other", "run crew")) is None
+
+    def test_returns_copies(self):
+        """Test callers cannot mutate the cached entry."""
+        cache = IntentCache(max_size=10, ttl_seconds=60)
+        key = cache.make_key(None, "model", "hi")
+        cache.put(key, {"extracted_info": {}})
+
+        cache.get(key)["extracted_info"]["changed"] = True
+
+        assert cache.get(key) == {"extracted_info": {}}
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = IntentCache(max_size=2, ttl_seconds=60)
+        keys = [cache.make_key(None, "model", text) for text in ("a", "b", "c")]
+        cache.put(keys[0], {"intent": "a"})
+        cache.put(keys[1], {"intent": "b"})
+        cache.get(keys[0])
+        cache.put(keys[2], {"intent": "c"})
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """Test entries are dropped after the TTL."""
+        cache = IntentCache(max_size=10, ttl_seconds=60)
+        key = cache.make_key(None, "model", "hi")
+        with patch("src.core.intent_cache.time.monotonic", return_value=100.0):
+            cache.put(key, {"intent": "conversation"})
+        with patch("src.core.intent_cache.time.monotonic", return_value=161.0):
+            assert cache.get(key) is None
+        assert cache.get_stats()["misses"] == 1
@@ -16,12 +16,14 @@ from unittest.mock import patch, MagicMock, AsyncMock, Mock, PropertyMock
 from datetime import datetime, timedelta
 
 from src.core.llm_manager import LiteLLMFileLogger, LLMManager
+from src.core.embedding_cache import get_embedding_cache
+from src.core.model_resolution_cache import get_model_resolution_cache
 from src.schemas.model_provider import ModelProvider
 
 
 @pytest.fixture(autouse=True)
 def reset_modules_and_circuit_breaker():
-    """Reset modules and circuit breaker state."""
+    """Reset modules, circuit breaker and embedding cache state."""
     # Clear databricks_auth module
     if 'src.utils.databricks_auth' in sys.modules:
         del sys.modules['src.utils.databricks_auth']
@@ -30,6 +32,9 @@ def reset_modules_and_circuit_breaker():
     original_failures = LLMManager._embedding_failures.copy()
     LLMManager._embedding_failures.clear()
     
+    # Every test embeds "test text"; don't let one test's result leak into the next
+    get_embedding_cache().clear()
+    
     yield
     
     LLMManager._embedding_failures = original_failures.copy()
@@ -1165,7 +1170,7 @@ class TestComplete100PercentCoverage:
             # Check that ollama prefix was added
             mock_embedding.assert_called_with(
                 model="ollama/nomic-embed-text",
-                input="test text",
+                input=["test text"],
                 api_base="http://localhost:11434"
             )
 
@@ -1188,7 +1193,7 @@ class TestComplete100PercentCoverage:
                 # Check that gemini prefix was added
                 mock_embedding.assert_called_with(
                     model="gemini/text-embedding-004",
-                    input="test text",
+                    input=["test text"],
                     api_key="google-api-key"
                 )
 
@@ -2126,4 +2131,138 @@ class TestComplete100PercentCoverage:
                             with patch('src.core.llm_manager.logger.warning') as mock_warning:
                                 result = await LLMManager.get_embedding("test text", embedder_config=embedder_config)
                                 assert result is None
-                                mock_warning.assert_called_with("No embedding data found in Databricks response")
\ No newline at end of file
+                                mock_warning.assert_called_with("No embedding data found in Databricks response")
+
+class TestConfigureCrewaiLlmCache:
+    """Tests for reuse of resolved model parameters across LLM builds."""
+
+    @pytest.mark.asyncio
+    async def test_model_resolved_once_for_many_agents(self):
+        """Test building the same model repeatedly looks the config up only once."""
+        mock_config = {"provider": ModelProvider.ANTHROPIC, "name": "claude-x", "max_output_tokens": 1024, "api_key": "secret"}
+
+        with patch('src.core.llm_manager.UnitOfWork'), \
+             patch('src.core.llm_manager.ModelConfigService.from_unit_of_work') as mock_service, \
+             patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', new_callable=AsyncMock, return_value="key-1") as mock_api_keys, \
+             patch('src.core.llm_manager.LLM') as mock_llm_class:
+            mock_service.return_value.get_model_config = AsyncMock(return_value=mock_config)
+
+            for _ in range(10):
+                await LLMManager.configure_crewai_llm("claude-x")
+
+        mock_service.return_value.get_model_config.assert_awaited_once_with("claude-x")
+        assert mock_api_keys.await_count == 10
+        assert mock_llm_class.call_count == 10
+        assert mock_llm_class.call_args.kwargs == {
+            "model": "anthropic/claude-x",
+            "timeout": 120,
+            "max_tokens": 1024,
+            "api_key": "key-1",
+        }
+        # Credentials are referenced, never stored in the cache
+        cached = get_model_resolution_cache().get(("crewai", "claude-x"))
+        assert "api_key" not in cached["params"]
+        assert cached["credential"] == ModelProvider.ANTHROPIC
+        assert "api_key" not in get_model_resolution_cache().get(("config", "claude-x"))
+
+    @pytest.mark.asyncio
+    async def test_cached_params_not_mutated_by_builds(self):
+        """Test the key added for one build does not leak into the next."""
+        mock_config = {"provider": ModelProvider.OPENAI, "name": "gpt-4"}
+
+        with patch('src.core.llm_manager.UnitOfWork'), \
+             patch('src.core.llm_manager.ModelConfigService.from_unit_of_work') as mock_service, \
+             patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', new_callable=AsyncMock, side_effect=["key-1", None]), \
+             patch('src.core.llm_manager.LLM') as mock_llm_class:
+            mock_service.return_value.get_model_config = AsyncMock(return_value=mock_config)
+
+            await LLMManager.configure_crewai_llm("gpt-4")
+            await LLMManager.configure_crewai_llm("gpt-4")
+
+        assert mock_llm_class.call_args_list[0].kwargs["api_key"] == "key-1"
+        assert "api_key" not in mock_llm_class.call_args_list[1].kwargs
+
+    @pytest.mark.asyncio
+    async def test_cache_cleared_resolves_again(self):
+        """Test clearing the cache (as model config changes do) forces a new lookup."""
+        mock_config = {"provider": ModelProvider.OPENAI, "name": "gpt-4"}
+
+        with patch('src.core.llm_manager.UnitOfWork'), \
+             patch('src.core.llm_manager.ModelConfigService.from_unit_of_work') as mock_service, \
+             patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', new_callable=AsyncMock, return_value="key"), \
+             patch('src.core.llm_manager.LLM'):
+            mock_service.return_value.get_model_config = AsyncMock(return_value=mock_config)
+
+            await LLMManager.configure_crewai_llm("gpt-4")
+            get_model_resolution_cache().clear()
+            await LLMManager.configure_crewai_llm("gpt-4")
+
+        assert mock_service.return_value.get_model_config.await_count == 2
+
+
+class TestGetEmbeddingsBatching:
+    """Tests for the batched, cached embedding API."""
+
+    OPENAI_CONFIG = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+
+    @staticmethod
+    def _echo_embeddings(model, input, **kwargs):
+        """Fake litellm.aembedding returning one vector per input, derived from the text length."""
+        return {"data": [{"embedding": [float(len(text)), 1.0]} for text in input]}
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_dedupes_and_preserves_order(self):
+        """Identical texts are embedded once and results follow input order."""
+        with patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', AsyncMock(return_value="key")):
+            with patch('litellm.aembedding', AsyncMock(side_effect=self._echo_embeddings)) as mock_embedding:
+                result = await LLMManager.get_embeddings(["a", "bbb", "a"], embedder_config=self.OPENAI_CONFIG)
+
+        assert result == [[1.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+        mock_embedding.assert_awaited_once()
+        assert mock_embedding.call_args.kwargs["input"] == ["a", "bbb"]
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_serves_repeats_from_cache(self):
+        """A second call for the same texts does not hit the provider."""
+        with patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', AsyncMock(return_value="key")):
+            with patch('litellm.aembedding', AsyncMock(side_effect=self._echo_embeddings)) as mock_embedding:
+                first = await LLMManager.get_embeddings(["hello", "world!"], embedder_config=self.OPENAI_CONFIG)
+                second = await LLMManager.get_embedding("world!", embedder_config=self.OPENAI_CONFIG)
+
+        assert second == first[1]
+        mock_embedding.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_splits_provider_sized_batches(self):
+        """Inputs are sent in batches no larger than the provider batch size."""
+        with patch.dict('src.core.embedding_cache.EMBEDDING_BATCH_SIZES', {"openai": 2}):
+            with patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', AsyncMock(return_value="key")):
+                with patch('litellm.aembedding', AsyncMock(side_effect=self._echo_embeddings)) as mock_embedding:
+                    result = await LLMManager.get_embeddings(["a", "bb", "ccc", "dddd", "eeeee"], embedder_config=self.OPENAI_CONFIG)
+
+        assert [vector[0] for vector in result] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert mock_embedding.await_count == 3
+        assert sorted(len(call.kwargs["input"]) for call in mock_embedding.call_args_list) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_failed_batch_returns_none(self):
+        """Only the texts of a failed batch come back as None, and failures are not cached."""
+        async def flaky(model, input, **kwargs):
+            if "bad" in input:
+                raise Exception("provider error")
+            return self._echo_embeddings(model, input)
+
+        with patch.dict('src.core.embedding_cache.EMBEDDING_BATCH_SIZES', {"openai": 1}):
+            with patch('src.core.llm_manager.ApiKeysService.get_provider_api_key', AsyncMock(return_value="key")):
+                with patch('litellm.aembedding', AsyncMock(side_effect=flaky)):
+                    result = await LLMManager.get_embeddings(["ok", "bad"], embedder_config=self.OPENAI_CONFIG)
+
+        assert result == [[2.0, 1.0], None]
+        assert len(get_embedding_cache()) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_empty_input(self):
+        """An empty input list returns immediately."""
+        with patch('litellm.aembedding') as mock_embedding:
+            assert await LLMManager.get_embeddings([]) == []
+        mock_embedding.assert_not_called()
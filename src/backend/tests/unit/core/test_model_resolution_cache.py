@@ -0,0 +1,60 @@
+"""
+Unit tests for the model resolution cache.
+"""
+from unittest.mock import patch
+
+from src.core.model_resolution_cache import ModelResolutionCache, get_model_resolution_cache
+
+
+class TestModelResolutionCache:
+    """Test cases for ModelResolutionCache."""
+
+    def test_get_missing(self):
+        """Test an unknown key returns None and counts a miss."""
+        cache = ModelResolutionCache(ttl_seconds=60)
+
+        assert cache.get(("crewai", "gpt-4")) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_put_and_get_returns_copies(self):
+        """Test callers cannot mutate the cached entry."""
+        cache = ModelResolutionCache(ttl_seconds=60)
+        resolved = {"params": {"model": "gpt-4"}, "credential": "openai"}
+        cache.put(("crewai", "gpt-4"), resolved)
+        resolved["params"]["api_key"] = "leaked"
+
+        first = cache.get(("crewai", "gpt-4"))
+        first["params"]["api_key"] = "leaked"
+
+        assert cache.get(("crewai", "gpt-4")) == {"params": {"model": "gpt-4"}, "credential": "openai"}
+        assert cache.get_stats()["hits"] == 2
+
+    def test_entries_expire(self):
+        """Test entries are dropped once the TTL has elapsed."""
+        cache = ModelResolutionCache(ttl_seconds=10)
+        with patch('src.core.model_resolution_cache.time.monotonic', return_value=100.0):
+            cache.put("gpt-4", {"name": "gpt-4"})
+        with patch('src.core.model_resolution_cache.time.monotonic', return_value=111.0):
+            assert cache.get("gpt-4") is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a TTL of 0 never stores entries."""
+        cache = ModelResolutionCache(ttl_seconds=0)
+        cache.put("gpt-4", {"name": "gpt-4"})
+
+        assert cache.get("gpt-4") is None
+
+    def test_clear(self):
+        """Test clear drops every entry."""
+        cache = ModelResolutionCache(ttl_seconds=60)
+        cache.put("a", {})
+        cache.put("b", {})
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_get_model_resolution_cache_singleton(self):
+        """Test the module-level accessor returns one shared instance."""
+        assert get_model_resolution_cache() is get_model_resolution_cache()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the generation prompt cache.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.core.prompt_cache import PromptCache, add_prompt_cache_hints
+
+
+TOOLS = [{"name": "SerperDevTool", "description": "Search the web"}]
+
+
+class TestPromptCache:
+    """Test cases for PromptCache."""
+
+    def test_rendered_key_changes_with_template_and_tools(self):
+        """Test rendered prompts are keyed by template version and tool set."""
+        key = PromptCache.rendered_key("generate_crew", "template v1", TOOLS)
+
+        assert key == PromptCache.rendered_key("generate_crew", "template v1", [dict(TOOLS[0])])
+        assert key != PromptCache.rendered_key("generate_crew", "template v2", TOOLS)
+        assert key != PromptCache.rendered_key("generate_crew", "template v1", [])
+
+    def test_invalidate_template_drops_its_rendered_prompts(self):
+        """Test invalidating a template drops only the prompts rendered from it."""
+        cache = PromptCache(ttl_seconds=60, max_rendered=10)
+        crew_key = cache.rendered_key("generate_crew", "crew", TOOLS)
+        agent_key = cache.rendered_key("generate_agent", "agent", [])
+        cache.put_template("generate_crew", "crew")
+        cache.put_rendered(crew_key, "crew + tools")
+        cache.put_rendered(agent_key, "agent")
+
+        cache.invalidate_templates("generate_crew")
+
+        assert cache.get_template("generate_crew") is None
+        assert cache.get_rendered(crew_key) is None
+        assert cache.get_rendered(agent_key) == "agent"
+
+    def test_tool_catalogue_is_invalidated(self):
+        """Test the tool catalogue is served until invalidated."""
+        cache = PromptCache(ttl_seconds=60, max_rendered=10)
+        cache.put_tools(TOOLS)
+
+        assert cache.get_tools() == TOOLS
+        cache.invalidate_tools()
+        assert cache.get_tools() is None
+
+    def test_tool_index_by_title_and_id(self):
+        """Test the catalogue is indexed by tool title and string ID."""
+        cache = PromptCache(ttl_seconds=60, max_rendered=10)
+        tool = SimpleNamespace(id=7, title="SerperDevTool")
+        cache.put_tools([tool])
+
+        assert cache.get_tool_index() == {"SerperDevTool": tool, "7": tool}
+        cache.invalidate_tools()
+        assert cache.get_tool_index() is None
+
+    def test_stale_catalogue_is_not_cached(self):
+        """Test a catalogue loaded before an invalidation is discarded."""
+        cache = PromptCache(ttl_seconds=60, max_rendered=10)
+        version = cache.tools_version
+        cache.invalidate_tools()
+
+        cache.put_tools(TOOLS, version=version)
+        assert cache.get_tools() is None
+
+        cache.put_tools(TOOLS, version=cache.tools_version)
+        assert cache.get_tools() == TOOLS
+
+    def test_entries_expire(self):
+        """Test entries are not served after the TTL."""
+        cache = PromptCache(ttl_seconds=60, max_rendered=10)
+        with patch("src.core.prompt_cache.time.monotonic", return_value=1000.0):
+            cache.put_template("generate_task", "task")
+        with patch("src.core.prompt_cache.time.monotonic", return_value=1061.0):
+            assert cache.get_template("generate_task") is None
+
+    def test_disabled_with_zero_ttl(self):
+        """Test nothing is cached when the TTL is 0."""
+        cache = PromptCache(ttl_seconds=0, max_rendered=10)
+        cache.put_template("generate_task", "task")
+        cache.put_tools(TOOLS)
+
+        assert cache.get_template("generate_task") is None
+        assert cache.get_tools() is None
+
+
+class TestPromptCacheHints:
+    """Test cases for add_prompt_cache_hints."""
+
+    MESSAGES = [
+        {"role": "system", "content": "Static instructions"},
+        {"role": "user", "content": "Build a crew"},
+    ]
+
+    def test_marks_system_prefix_for_anthropic(self):
+        """Test the system prompt becomes a cacheable block for Anthropic models."""
+        messages = add_prompt_cache_hints(self.MESSAGES, "anthropic/claude-3-5-sonnet")
+
+        assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[0]["content"][0]["text"] == "Static instructions"
+        assert messages[1] == self.MESSAGES[1]
+
+    def test_other_providers_unchanged(self):
+        """Test messages for other providers are sent as they are."""
+        assert add_prompt_cache_hints(self.MESSAGES, "databricks/databricks-llama-4-maverick") is self.MESSAGES
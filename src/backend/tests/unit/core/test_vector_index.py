@@ -0,0 +1,124 @@
+"""
+Unit tests for the in-process vector index.
+"""
+import numpy as np
+import pytest
+
+from src.core.vector_index import VectorIndex, get_documentation_vector_index
+
+
+class TestVectorIndex:
+    """Test cases for VectorIndex."""
+
+    def test_search_returns_top_k_by_cosine_similarity(self):
+        """Test that search ranks by cosine similarity and honours the limit."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0]), (2, [1.0, 1.0]), (3, [0.0, 1.0]), (4, [-1.0, 0.0])])
+
+        results = index.search([2.0, 0.2], limit=2)
+
+        assert [doc_id for doc_id, _ in results] == [1, 2]
+        assert results[0][1] == pytest.approx(0.995, abs=1e-3)
+
+    def test_search_excludes_non_positive_scores(self):
+        """Test that orthogonal and opposite vectors are not returned."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0]), (2, [0.0, 1.0]), (3, [-1.0, 0.0])])
+
+        assert index.search([1.0, 0.0], limit=10) == [(1, pytest.approx(1.0))]
+
+    def test_build_skips_invalid_vectors(self):
+        """Test that missing, zero and mismatched vectors are skipped."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0]), (2, None), (3, [0.0, 0.0]), (4, [1.0, 0.0, 0.0])])
+
+        assert len(index) == 1
+        assert index.dim == 2
+
+    def test_search_with_mismatched_dimension_returns_empty(self):
+        """Test that a query of a different dimension returns no results."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0])])
+
+        assert index.search([1.0, 0.0, 0.0], limit=5) == []
+
+    def test_upsert_adds_and_replaces(self):
+        """Test that upsert adds new ids and replaces existing vectors."""
+        index = VectorIndex()
+        index.build([])
+        for doc_id in range(40):
+            assert index.upsert(doc_id, [1.0, float(doc_id)])
+        assert index.upsert(0, [0.0, 1.0])
+
+        assert len(index) == 40
+        assert index.search([0.0, 1.0], limit=1)[0] == (0, pytest.approx(1.0))
+
+    def test_upsert_rejects_mismatched_dimension(self):
+        """Test that upserting a vector of another dimension removes the id instead."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0]), (2, [0.0, 1.0])])
+
+        assert index.upsert(1, [1.0, 0.0, 0.0]) is False
+        assert len(index) == 1
+
+    def test_remove_swaps_last_row(self):
+        """Test that removal keeps the remaining ids searchable."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0]), (2, [0.0, 1.0]), (3, [1.0, 1.0])])
+
+        assert index.remove(1) is True
+        assert index.remove(1) is False
+        assert len(index) == 2
+        assert index.search([0.0, 1.0], limit=1)[0][0] == 2
+        assert index.search([1.0, 1.0], limit=1)[0][0] == 3
+
+    def test_save_and_load_sidecar(self, tmp_path):
+        """Test that a saved index is memory-mapped back when the signature matches."""
+        sidecar = str(tmp_path / "index")
+        index = VectorIndex(sidecar)
+        index.build([(1, [1.0, 0.0]), (2, [0.0, 1.0])])
+        assert index.save({"count": 2})
+
+        restored = VectorIndex(sidecar)
+        assert restored.load({"count": 2})
+        assert isinstance(restored._matrix, np.memmap)
+        assert restored.search([0.0, 1.0], limit=1)[0][0] == 2
+
+        # Writes copy the read-only mapping first
+        assert restored.upsert(3, [1.0, 1.0])
+        assert restored.remove(1)
+        assert [doc_id for doc_id, _ in restored.search([1.0, 1.0], limit=3)] == [3, 2]
+
+    def test_load_rejects_stale_or_missing_sidecar(self, tmp_path):
+        """Test that a sidecar with another signature or no files is not loaded."""
+        sidecar = str(tmp_path / "index")
+        index = VectorIndex(sidecar)
+        assert index.load({"count": 1}) is False
+
+        index.build([(1, [1.0, 0.0])])
+        index.save({"count": 1})
+
+        assert VectorIndex(sidecar).load({"count": 2}) is False
+
+    def test_no_sidecar_path_disables_persistence(self):
+        """Test that save and load are no-ops without a sidecar path."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0])])
+
+        assert index.save({}) is False
+        assert index.load({}) is False
+
+    def test_reset_marks_not_loaded(self):
+        """Test that reset empties the index."""
+        index = VectorIndex()
+        index.build([(1, [1.0, 0.0])])
+
+        index.reset()
+
+        assert not index.loaded
+        assert len(index) == 0
+        assert index.search([1.0, 0.0], limit=1) == []
+
+    def test_get_documentation_vector_index_is_singleton(self):
+        """Test that the accessor returns the same instance."""
+        assert get_documentation_vector_index() is get_documentation_vector_index()
@@ -0,0 +1,156 @@
+"""
+Unit tests for the WebSocket fan-out channel and subscribers.
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.websocket_fanout import (
+    CLOSE_CODE_TRY_AGAIN_LATER,
+    DISCONNECT,
+    DROP_OLDEST,
+    FanoutChannel,
+    FanoutSubscriber,
+)
+
+
+def _message(content, execution_id="exec-1", message_type="live"):
+    return {"execution_id": execution_id, "content": content, "timestamp": f"t-{content}", "type": message_type}
+
+
+def _websocket():
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    return websocket
+
+
+class TestFanoutChannel:
+    """Test the shared message buffer."""
+
+    def test_read_from_reports_evicted_messages(self):
+        """Test that reading behind the ring buffer reports how much was missed."""
+        channel = FanoutChannel(max_pending=2)
+        for i in range(5):
+            channel.publish(_message(str(i)))
+
+        entries, missed = channel.read_from(1)
+
+        assert [entry[0] for entry in entries] == [3, 4]
+        assert missed == 2
+
+    def test_coalesce_merges_compatible_runs(self):
+        """Test that consecutive live lines merge and other messages stay separate."""
+        channel = FanoutChannel()
+        channel.publish(_message("a"))
+        channel.publish(_message("b"))
+        channel.publish(_message("c", message_type="historical"))
+        channel.publish({"execution_id": "exec-1", "status": "done"})
+        entries, _ = channel.read_from(0)
+
+        frames = [json.loads(frame) for frame in channel.coalesce(entries)]
+
+        assert frames[0] == {"execution_id": "exec-1", "content": "a\nb", "timestamp": "t-b", "type": "live"}
+        assert frames[1]["content"] == "c"
+        assert frames[2] == {"execution_id": "exec-1", "status": "done"}
+
+    def test_single_message_reuses_serialised_text(self):
+        """Test that a message is serialised once and shared by every reader."""
+        channel = FanoutChannel()
+        channel.publish(_message("a"))
+        entries, _ = channel.read_from(0)
+
+        assert channel.coalesce(entries)[0] is entries[0][2]
+
+
+class TestFanoutSubscriber:
+    """Test per-connection writer tasks."""
+
+    @pytest.mark.asyncio
+    async def test_slow_connection_does_not_block_others(self):
+        """Test that a stalled client neither blocks publishing nor other clients."""
+        channel = FanoutChannel()
+        release = asyncio.Event()
+
+        async def stall(text):
+            await release.wait()
+
+        slow = _websocket()
+        slow.send_text = AsyncMock(side_effect=stall)
+        fast = _websocket()
+        subscribers = [FanoutSubscriber(channel, ws, on_close=MagicMock()) for ws in (slow, fast)]
+        for subscriber in subscribers:
+            subscriber.start()
+
+        for i in range(3):
+            channel.publish(_message(str(i)))
+        await asyncio.wait_for(subscribers[1].wait_idle(), 1.0)
+
+        sent = "\n".join(json.loads(call.args[0])["content"] for call in fast.send_text.call_args_list)
+        assert sent.split("\n") == ["0", "1", "2"]
+        release.set()
+        await asyncio.wait_for(subscribers[0].wait_idle(), 1.0)
+        for subscriber in subscribers:
+            await subscriber.stop()
+
+    @pytest.mark.asyncio
+    async def test_backlog_is_coalesced_and_oldest_dropped(self):
+        """Test that a subscriber behind the buffer skips the oldest and merges the rest."""
+        channel = FanoutChannel(max_pending=2)
+        websocket = _websocket()
+        subscriber = FanoutSubscriber(channel, websocket, on_close=MagicMock(), policy=DROP_OLDEST)
+        for i in range(5):
+            channel.publish(_message(str(i)))
+
+        subscriber.start()
+        await asyncio.wait_for(subscriber.wait_idle(), 1.0)
+
+        websocket.send_text.assert_awaited_once()
+        assert json.loads(websocket.send_text.call_args.args[0])["content"] == "3\n4"
+        assert subscriber.dropped == 3
+        await subscriber.stop()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_slow_consumer(self):
+        """Test that the disconnect policy closes a subscriber that fell behind."""
+        channel = FanoutChannel(max_pending=1)
+        websocket = _websocket()
+        on_close = MagicMock()
+        subscriber = FanoutSubscriber(channel, websocket, on_close=on_close, policy=DISCONNECT)
+        channel.publish(_message("0"))
+        channel.publish(_message("1"))
+
+        subscriber.start()
+        await asyncio.wait_for(subscriber.wait_idle(), 1.0)
+
+        websocket.close.assert_awaited_once_with(code=CLOSE_CODE_TRY_AGAIN_LATER)
+        websocket.send_text.assert_not_awaited()
+        on_close.assert_called_once_with(subscriber)
+
+    @pytest.mark.asyncio
+    async def test_send_failure_and_timeout_close_subscriber(self):
+        """Test that failing or stalled sends close the subscriber."""
+        channel = FanoutChannel()
+        failing = _websocket()
+        failing.send_text = AsyncMock(side_effect=RuntimeError("gone"))
+
+        async def stall(text):
+            await asyncio.sleep(10)
+
+        stalled = _websocket()
+        stalled.send_text = AsyncMock(side_effect=stall)
+        on_close = MagicMock()
+        subscribers = [
+            FanoutSubscriber(channel, failing, on_close=on_close),
+            FanoutSubscriber(channel, stalled, on_close=on_close, send_timeout=0.01),
+        ]
+        for subscriber in subscribers:
+            subscriber.start()
+
+        channel.publish(_message("0"))
+        await asyncio.wait_for(asyncio.gather(*(s.wait_idle() for s in subscribers)), 1.0)
+
+        assert all(subscriber.closed for subscriber in subscribers)
+        assert on_close.call_count == 2
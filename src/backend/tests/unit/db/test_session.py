@@ -999,3 +999,79 @@ class TestActual100PercentCoverage:
     
     
 
+
+
+class TestEngineRegistry:
+    """Test the per-event-loop engine registry."""
+
+    def _make_registry(self):
+        from src.db.session import EngineRegistry
+        primary = MagicMock()
+        primary.dispose = AsyncMock()
+        return EngineRegistry(primary), primary
+
+    def test_get_engine_outside_loop_returns_primary(self):
+        """Sync callers get the primary engine."""
+        registry, primary = self._make_registry()
+        assert registry.get_engine() is primary
+
+    def test_first_loop_claims_primary_and_other_loops_get_workers(self):
+        """The first loop owns the primary pool, other loops get their own."""
+        import asyncio
+        registry, primary = self._make_registry()
+        worker_engine = MagicMock()
+        worker_engine.dispose = AsyncMock()
+
+        async def lookup():
+            return registry.get_engine()
+
+        main_loop = asyncio.new_event_loop()
+        worker_loop = asyncio.new_event_loop()
+        try:
+            assert main_loop.run_until_complete(lookup()) is primary
+            assert main_loop.run_until_complete(lookup()) is primary
+            with patch('src.db.session._create_engine', return_value=worker_engine) as mock_create:
+                assert worker_loop.run_until_complete(lookup()) is worker_engine
+                assert worker_loop.run_until_complete(lookup()) is worker_engine
+                mock_create.assert_called_once()
+        finally:
+            worker_loop.close()
+            main_loop.close()
+
+        # Closing the loops disposes their engines and releases the primary
+        worker_engine.dispose.assert_awaited_once()
+        primary.dispose.assert_awaited_once()
+        assert registry.get_pool_metrics()[0]["loop_id"] is None
+
+    def test_set_primary_loop(self):
+        """An explicitly bound loop owns the primary engine."""
+        import asyncio
+        registry, primary = self._make_registry()
+
+        async def lookup():
+            return registry.get_engine()
+
+        loop = asyncio.new_event_loop()
+        try:
+            registry.set_primary_loop(loop)
+            assert loop.run_until_complete(lookup()) is primary
+        finally:
+            loop.close()
+
+    def test_pool_metrics(self):
+        """Metrics report size, checked-out and overflow per pool."""
+        registry, primary = self._make_registry()
+        pool = primary.sync_engine.pool
+        pool.size.return_value = 10
+        pool.checkedout.return_value = 3
+        pool.checkedin.return_value = 7
+        pool.overflow.return_value = -7
+
+        metrics = registry.get_pool_metrics()
+
+        assert len(metrics) == 1
+        assert metrics[0]["role"] == "primary"
+        assert metrics[0]["size"] == 10
+        assert metrics[0]["checked_out"] == 3
+        assert metrics[0]["checked_in"] == 7
+        assert metrics[0]["overflow"] == -7
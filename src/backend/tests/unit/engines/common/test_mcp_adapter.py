@@ -1,10 +1,21 @@
 """Unit tests for MCPAdapter."""
 
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
 
 from src.engines.common.mcp_adapter import MCPAdapter, MCPTool
+from src.engines.common.mcp_session_pool import MCPSessionPool
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def session_pool():
+    """Give every test its own MCP session pool and close its sessions afterwards."""
+    pool = MCPSessionPool(keepalive_seconds=60, idle_timeout_seconds=300, max_sessions=4, tools_ttl_seconds=300)
+    with patch('src.engines.common.mcp_adapter.get_mcp_session_pool', return_value=pool):
+        yield pool
+        await pool.close_all()
 
 
 class TestMCPAdapter:
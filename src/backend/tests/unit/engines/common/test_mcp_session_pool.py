@@ -0,0 +1,143 @@
+"""Unit tests for MCPSessionPool."""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.engines.common.mcp_session_pool import MCPSessionPool, session_pool_key
+
+URL = 'https://test.mcp.server/api/mcp/'
+HEADERS = {'Authorization': 'Bearer token'}
+
+
+class ToolListChangedNotification:
+    """Stand-in for the MCP notification type, matched by name."""
+
+
+class ClosedResourceError(Exception):
+    """Stand-in for the anyio error of a closed stream, matched by name."""
+
+
+@pytest_asyncio.fixture
+async def pool():
+    """Create a pool and close its sessions afterwards."""
+    pool = MCPSessionPool(keepalive_seconds=60, idle_timeout_seconds=300, max_sessions=2, tools_ttl_seconds=300)
+    yield pool
+    await pool.close_all()
+
+
+@pytest.fixture
+def mcp_client():
+    """Patch the MCP client; yields (connect mock, ClientSession mock, session)."""
+    tool = Mock()
+    tool.name = 'test_tool'
+    session = AsyncMock()
+    session.list_tools = AsyncMock(return_value=Mock(tools=[tool]))
+    session.call_tool = AsyncMock(return_value='result')
+    with patch('mcp.client.streamable_http.streamablehttp_client') as mock_connect, \
+         patch('mcp.ClientSession') as mock_client_session:
+        mock_connect.return_value.__aenter__.return_value = (Mock(), Mock(), None)
+        mock_client_session.return_value.__aenter__.return_value = session
+        yield mock_connect, mock_client_session, session
+
+
+class TestMCPSessionPool:
+    """Test suite for MCPSessionPool."""
+
+    def test_session_pool_key_depends_on_credentials(self):
+        """Test that different credentials get different keys."""
+        assert session_pool_key(URL, HEADERS) == session_pool_key(URL, dict(HEADERS))
+        assert session_pool_key(URL, HEADERS) != session_pool_key(URL, {'Authorization': 'Bearer other'})
+
+    @pytest.mark.asyncio
+    async def test_calls_reuse_one_session(self, pool, mcp_client):
+        """Test that consecutive tool calls share one connection and handshake."""
+        mock_connect, _, session = mcp_client
+
+        assert await pool.call_tool(URL, HEADERS, 'test_tool', {'a': 1}) == 'result'
+        assert await pool.call_tool(URL, HEADERS, 'test_tool', {'a': 2}) == 'result'
+
+        mock_connect.assert_called_once_with(URL, headers=HEADERS)
+        session.initialize.assert_awaited_once()
+        assert session.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tools_is_cached_until_list_changed(self, pool, mcp_client):
+        """Test that tool lists are cached and dropped on tools/list_changed."""
+        _, mock_client_session, session = mcp_client
+
+        first = await pool.list_tools(URL, HEADERS)
+        second = await pool.list_tools(URL, HEADERS)
+        assert [tool.name for tool in second] == [tool.name for tool in first] == ['test_tool']
+        session.list_tools.assert_awaited_once()
+
+        message_handler = mock_client_session.call_args.kwargs['message_handler']
+        await message_handler(Mock(root=ToolListChangedNotification()))
+        await pool.list_tools(URL, HEADERS)
+
+        assert session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_pool_evicts_least_recently_used_unleased_session(self, pool, mcp_client):
+        """Test that the max-sessions limit closes an idle session without leases."""
+        mock_connect, _, _ = mcp_client
+        headers = [{'Authorization': f'Bearer {i}'} for i in range(3)]
+        pool.lease('exec-1', session_pool_key(URL, headers[0]))
+
+        for header in headers:
+            await pool.call_tool(URL, header, 'test_tool', {})
+        await pool.call_tool(URL, headers[0], 'test_tool', {})
+
+        # The leased session survived; the unleased one was evicted
+        assert mock_connect.call_count == 3
+        assert pool.get_stats()['sessions'] == 2
+
+    @pytest.mark.asyncio
+    async def test_release_only_drops_own_leases(self, pool):
+        """Test that releasing one execution keeps the leases of others."""
+        key = session_pool_key(URL, HEADERS)
+        pool.lease('exec-1', key)
+        pool.lease('exec-2', key)
+
+        assert pool.release('exec-1') == {key}
+        assert pool.is_leased(key)
+        pool.release('exec-2')
+        assert not pool.is_leased(key)
+
+    @pytest.mark.asyncio
+    async def test_dead_session_is_replaced(self, pool, mcp_client):
+        """Test that a session whose connection ended is reopened on next use."""
+        mock_connect, _, _ = mcp_client
+        await pool.call_tool(URL, HEADERS, 'test_tool', {})
+        state = pool._loops[asyncio.get_running_loop()]
+        await next(iter(state.sessions.values())).close()
+
+        await pool.call_tool(URL, HEADERS, 'test_tool', {})
+
+        assert mock_connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dropped_session_is_retried_once_on_new_session(self, pool, mcp_client):
+        """Test that a call on a session the server dropped is retried on a new session."""
+        mock_connect, _, session = mcp_client
+        await pool.call_tool(URL, HEADERS, 'test_tool', {})
+        session.call_tool.side_effect = [ClosedResourceError(), 'result']
+
+        assert await pool.call_tool(URL, HEADERS, 'test_tool', {}) == 'result'
+
+        assert mock_connect.call_count == 2
+        assert session.call_tool.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_operation_errors_are_not_retried(self, pool, mcp_client):
+        """Test that an error of the operation itself keeps the session and is raised."""
+        mock_connect, _, session = mcp_client
+        session.call_tool.side_effect = ValueError('bad arguments')
+
+        with pytest.raises(ValueError):
+            await pool.call_tool(URL, HEADERS, 'test_tool', {})
+
+        assert mock_connect.call_count == 1
+        assert session.call_tool.await_count == 1
+        assert len(pool._loops[asyncio.get_running_loop()].sessions) == 1
@@ -12,6 +12,8 @@ import threading
 
 from src.engines.crewai.callbacks.llm_event_router import (
     LLMEventRouter,
+    LLMUsageAggregator,
+    bind_execution_context,
     register_execution_for_llm_events,
     unregister_execution_from_llm_events
 )
@@ -26,6 +28,7 @@ class TestLLMEventRouter:
         LLMEventRouter._instance = None
         LLMEventRouter._initialized = False
         LLMEventRouter._active_executions = {}
+        LLMEventRouter._agent_executions = {}
     
     def test_singleton_pattern(self):
         """Test that LLMEventRouter follows singleton pattern."""
@@ -175,8 +178,8 @@ class TestLLMEventRouter:
         router = LLMEventRouter()
         router._setup_global_handler()
         
-        # Verify event handler was registered
-        mock_event_bus.on.assert_called_once()
+        # Verify the call started and call completed handlers were registered
+        assert mock_event_bus.on.call_count == 2
     
     @patch('src.engines.crewai.callbacks.llm_event_router.datetime')
     @patch('src.engines.crewai.callbacks.llm_event_router.crewai_event_bus')
@@ -341,4 +344,140 @@ class TestConvenienceFunctions:
         """Test the convenience function for unregistering executions."""
         unregister_execution_from_llm_events("exec131")
         
-        mock_unregister.assert_called_once_with("exec131")
\ No newline at end of file
+        mock_unregister.assert_called_once_with("exec131")
+
+
+class TestExecutionScopedRouting:
+    """Test suite for context-based routing and usage aggregation."""
+    
+    def setup_method(self):
+        """Reset singleton state and capture the registered handlers."""
+        LLMEventRouter._instance = None
+        LLMEventRouter._initialized = False
+        LLMEventRouter._active_executions = {}
+        LLMEventRouter._agent_executions = {}
+        self.handlers = {}
+        
+        def capture_handler(event_class):
+            def decorator(func):
+                self.handlers[event_class.__name__] = func
+                return func
+            return decorator
+        
+        self.event_bus_patcher = patch('src.engines.crewai.callbacks.llm_event_router.crewai_event_bus')
+        mock_event_bus = self.event_bus_patcher.start()
+        mock_event_bus.on = capture_handler
+        self.queue_patcher = patch('src.engines.crewai.callbacks.llm_event_router.get_trace_queue')
+        self.mock_get_queue = self.queue_patcher.start()
+    
+    def teardown_method(self):
+        """Stop patches."""
+        self.event_bus_patcher.stop()
+        self.queue_patcher.stop()
+        LLMEventRouter._active_executions = {}
+        LLMEventRouter._agent_executions = {}
+    
+    def _make_agent(self, role):
+        agent = Mock()
+        agent.role = role
+        agent._token_process = Mock(prompt_tokens=0, completion_tokens=0)
+        return agent
+    
+    def _register(self, execution_id, agents):
+        queue = Mock()
+        self.mock_get_queue.return_value = queue
+        crew = Mock()
+        crew.agents = agents
+        LLMEventRouter.register_execution(execution_id, crew, None)
+        return queue
+    
+    def _emit(self, agent, llm):
+        started = Mock()
+        self.handlers['LLMCallStartedEvent'](llm, started)
+        event = Mock(spec=['agent_role', 'from_agent', 'response', 'model', 'call_type'])
+        event.agent_role = agent.role
+        event.from_agent = agent
+        event.response = "ok"
+        event.model = "model"
+        event.call_type = Mock(value="llm_call")
+        self.handlers['LLMCallCompletedEvent'](llm, event)
+    
+    def test_same_role_routed_by_execution_context(self):
+        """Test that executions sharing a role each receive their own events."""
+        agent_a, agent_b = self._make_agent("researcher"), self._make_agent("researcher")
+        queue_a = self._register("exec_a", [agent_a])
+        queue_b = self._register("exec_b", [agent_b])
+        # An agent object that neither execution registered, to exercise the context
+        stray_agent = self._make_agent("researcher")
+        
+        with bind_execution_context("exec_b"):
+            self._emit(stray_agent, Mock())
+        
+        queue_a.put_nowait.assert_not_called()
+        assert queue_b.put_nowait.call_args[0][0]['job_id'] == "exec_b"
+    
+    def test_agent_identity_used_outside_context(self):
+        """Test that events from threads without the context route by agent object."""
+        agent_a, agent_b = self._make_agent("researcher"), self._make_agent("researcher")
+        queue_a = self._register("exec_a", [agent_a])
+        queue_b = self._register("exec_b", [agent_b])
+        
+        self._emit(agent_b, Mock())
+        
+        queue_a.put_nowait.assert_not_called()
+        assert queue_b.put_nowait.call_args[0][0]['job_id'] == "exec_b"
+    
+    def test_usage_aggregated_and_flushed_once(self):
+        """Test that token usage is summed per agent and written on unregister."""
+        researcher, writer = self._make_agent("researcher"), self._make_agent("writer")
+        researcher._token_process.prompt_tokens = 50  # Usage from before registration
+        queue = self._register("exec_a", [researcher, writer])
+        
+        with bind_execution_context("exec_a"):
+            researcher._token_process.prompt_tokens = 150
+            researcher._token_process.completion_tokens = 20
+            self._emit(researcher, Mock())
+            researcher._token_process.prompt_tokens = 200
+            researcher._token_process.completion_tokens = 30
+            self._emit(researcher, Mock())
+            writer._token_process.prompt_tokens = 10
+            writer._token_process.completion_tokens = 5
+            self._emit(writer, Mock())
+        
+        call_trace = queue.put_nowait.call_args_list[0][0][0]
+        assert call_trace['extra_data']['prompt_tokens'] == 100
+        assert call_trace['extra_data']['latency_ms'] is not None
+        
+        summary = LLMEventRouter.get_usage_summary("exec_a")
+        assert summary['calls'] == 3
+        assert summary['agents']['researcher'] == pytest.approx({
+            'calls': 2, 'prompt_tokens': 150, 'completion_tokens': 30,
+            'total_tokens': 180, 'latency_ms': summary['agents']['researcher']['latency_ms'],
+        })
+        assert summary['total_tokens'] == 195
+        
+        queue.put_nowait.reset_mock()
+        LLMEventRouter.unregister_execution("exec_a")
+        
+        queue.put_nowait.assert_called_once()
+        usage_trace = queue.put_nowait.call_args[0][0]
+        assert usage_trace['event_type'] == "llm_usage"
+        assert usage_trace['extra_data']['agents']['writer']['total_tokens'] == 15
+        assert LLMEventRouter._agent_executions == {}
+    
+    def test_unregister_without_calls_writes_nothing(self):
+        """Test that executions without LLM calls do not write a usage trace."""
+        queue = self._register("exec_a", [self._make_agent("researcher")])
+        
+        LLMEventRouter.unregister_execution("exec_a")
+        
+        queue.put_nowait.assert_not_called()
+    
+    def test_event_usage_preferred_over_agent_counters(self):
+        """Test that usage reported on the event is used when present."""
+        aggregator = LLMUsageAggregator()
+        event = Mock()
+        event.usage = {'prompt_tokens': 7, 'completion_tokens': 3}
+        
+        assert aggregator.token_delta(event) == (7, 3)
+
@@ -127,7 +127,7 @@ class TestAgentTraceEventListener(unittest.TestCase):
         listener._enqueue_trace(
             event_source="TestAgent",
             event_context="Test Task",
-            event_type="test_event",
+            event_type="agent_execution",
             output_content="Test output",
             extra_data={"key": "value"}
         )
@@ -139,12 +139,29 @@ class TestAgentTraceEventListener(unittest.TestCase):
         self.assertEqual(trace_data["job_id"], self.job_id)
         self.assertEqual(trace_data["event_source"], "TestAgent")
         self.assertEqual(trace_data["event_context"], "Test Task")
-        self.assertEqual(trace_data["event_type"], "test_event")
+        self.assertEqual(trace_data["event_type"], "agent_execution")
         self.assertEqual(trace_data["output_content"], "Test output")
         self.assertEqual(trace_data["extra_data"], {"key": "value"})
         self.assertEqual(trace_data["group_id"], "group_123")
         self.assertEqual(trace_data["group_email"], "test@example.com")
 
+    @patch('src.engines.crewai.callbacks.logging_callbacks.get_trace_queue')
+    def test_enqueue_trace_skips_non_important_event_types(self, mock_get_queue):
+        """Test that events the trace writer would drop never reach the queue"""
+        mock_queue = MagicMock()
+        mock_get_queue.return_value = mock_queue
+
+        listener = AgentTraceEventListener(self.job_id)
+
+        listener._enqueue_trace(
+            event_source="TestAgent",
+            event_context="Test Task",
+            event_type="debug_info",
+            output_content="Test output"
+        )
+
+        mock_queue.put_nowait.assert_not_called()
+
     @patch('src.engines.crewai.callbacks.logging_callbacks.get_trace_queue')
     def test_enqueue_trace_queue_full(self, mock_get_queue):
         """Test trace enqueueing when queue is full"""
@@ -158,7 +175,7 @@ class TestAgentTraceEventListener(unittest.TestCase):
         listener._enqueue_trace(
             event_source="TestAgent",
             event_context="Test Task",
-            event_type="test_event",
+            event_type="agent_execution",
             output_content="Test output"
         )
 
@@ -605,7 +622,7 @@ class TestAgentTraceEventListener(unittest.TestCase):
         listener._enqueue_trace(
             event_source="TestAgent",
             event_context="Test Task",
-            event_type="test_event",
+            event_type="agent_execution",
             output_content="Test output"
         )
         
@@ -630,7 +647,7 @@ class TestAgentTraceEventListener(unittest.TestCase):
         listener._enqueue_trace(
             event_source="TestAgent",
             event_context="Test Task",
-            event_type="test_event",
+            event_type="agent_execution",
             output_content="Test output"
         )
 
@@ -1461,7 +1478,7 @@ class TestAdditionalCoverage(unittest.TestCase):
         listener._enqueue_trace(
             event_source="TestAgent",
             event_context="Test Task",
-            event_type="debug_test",
+            event_type="agent_execution",
             output_content="Debug output"
         )
         
@@ -1549,7 +1566,7 @@ class TestAdditionalCoverage(unittest.TestCase):
         listener._enqueue_trace(
             event_source="test_source",
             event_context="test_context",
-            event_type="test_type",
+            event_type="tool_usage",
             output_content="test_output",
             extra_data={"key": "value"}
         )
@@ -1561,7 +1578,7 @@ class TestAdditionalCoverage(unittest.TestCase):
         self.assertEqual(trace_data["job_id"], self.job_id)
         self.assertEqual(trace_data["event_source"], "test_source")
         self.assertEqual(trace_data["event_context"], "test_context")
-        self.assertEqual(trace_data["event_type"], "test_type")
+        self.assertEqual(trace_data["event_type"], "tool_usage")
         self.assertEqual(trace_data["output_content"], "test_output")
         self.assertEqual(trace_data["extra_data"], {"key": "value"})
         self.assertEqual(trace_data["group_id"], "group_123")
@@ -0,0 +1,165 @@
+"""
+Unit tests for EntityRelationshipRetriever graph construction and traversal.
+"""
+import itertools
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.engines.crewai.memory.entity_relationship_retriever import (
+    EntityNode,
+    EntityRelationshipRetriever,
+    RelationshipEdge,
+)
+
+
+def _node(name, description="", relationships=None):
+    return EntityNode(
+        name=name,
+        entity_type="person",
+        description=description,
+        agent_id="agent",
+        metadata={"id": name},
+        explicit_relationships=relationships or [],
+    )
+
+
+@pytest.fixture
+def retriever():
+    """Create a retriever with a mocked memory backend."""
+    return EntityRelationshipRetriever(MagicMock())
+
+
+class TestSemanticRelationshipEdges:
+    """Test cases for matrix-based semantic edge construction."""
+
+    @pytest.mark.asyncio
+    async def test_matches_pairwise_cosine_similarity(self, retriever):
+        """Test that the matrix product yields the same edges as pairwise comparison."""
+        rng = np.random.default_rng(7)
+        base = rng.normal(size=16)
+        for i in range(30):
+            name = f"entity {i}"
+            retriever.entity_graph[name] = _node(name, "worked at a company" if i % 3 == 0 else "plain")
+            noise = rng.normal(size=16) * (0.2 if i % 2 == 0 else 3.0)
+            retriever.description_embeddings[name] = base + noise
+        retriever.description_embeddings["entity 5"] = np.zeros(16)
+
+        await retriever._build_semantic_relationship_edges()
+
+        expected = []
+        names = list(retriever.entity_graph)
+        for name1, name2 in itertools.combinations(names, 2):
+            similarity = retriever._cosine_similarity(
+                retriever.description_embeddings[name1], retriever.description_embeddings[name2]
+            )
+            if similarity > 0.7:
+                relationship_type = await retriever._infer_relationship_type_from_descriptions(
+                    retriever.entity_graph[name1].description, retriever.entity_graph[name2].description
+                )
+                expected.append((name1, name2, relationship_type, similarity))
+
+        actual = [(e.source, e.target, e.relationship_type, e.strength) for e in retriever.relationship_edges]
+        assert expected
+        assert [a[:3] for a in actual] == [e[:3] for e in expected]
+        assert [a[3] for a in actual] == pytest.approx([e[3] for e in expected])
+
+    @pytest.mark.asyncio
+    async def test_row_blocks_yield_the_same_edges(self, retriever):
+        """Test that computing the similarities in row blocks finds every pair once."""
+        rng = np.random.default_rng(11)
+        base = rng.normal(size=8)
+        for i in range(23):
+            name = f"entity {i}"
+            retriever.entity_graph[name] = _node(name)
+            retriever.description_embeddings[name] = base + rng.normal(size=8) * (0.3 if i % 2 else 2.0)
+
+        await retriever._build_semantic_relationship_edges()
+        whole = [(e.source, e.target, e.strength) for e in retriever.relationship_edges]
+        retriever.relationship_edges, retriever.adjacency = [], {}
+        with patch('src.engines.crewai.memory.entity_relationship_retriever._SEMANTIC_BLOCK_ROWS', 4):
+            await retriever._build_semantic_relationship_edges()
+        blocked = [(e.source, e.target, e.strength) for e in retriever.relationship_edges]
+
+        assert whole
+        assert [edge[:2] for edge in blocked] == [edge[:2] for edge in whole]
+        assert [edge[2] for edge in blocked] == pytest.approx([edge[2] for edge in whole])
+
+    @pytest.mark.asyncio
+    async def test_skips_entities_without_embeddings(self, retriever):
+        """Test that entities without an embedding get no semantic edges."""
+        retriever.entity_graph = {"a": _node("a"), "b": _node("b"), "c": _node("c")}
+        retriever.description_embeddings = {"a": np.array([1.0, 0.0]), "b": np.array([1.0, 0.1])}
+
+        await retriever._build_semantic_relationship_edges()
+
+        assert [(e.source, e.target) for e in retriever.relationship_edges] == [("a", "b")]
+        assert retriever.relationship_edges[0].relationship_type == "semantic"
+
+
+class TestNameBasedRelationshipEdges:
+    """Test cases for indexed name-based edge construction."""
+
+    @pytest.mark.asyncio
+    async def test_matches_all_pairs_comparison(self, retriever):
+        """Test that blocked candidates yield the same edges as comparing every pair."""
+        entities = [
+            ("Marshall Mathers", "Rapper known as Eminem"),
+            ("Eminem", "Stage name of Marshall Mathers"),
+            ("Dr Dre", "Producer who mentored eminem"),
+            ("Aftermath Entertainment", "Label founded by dr dre"),
+            ("Marshall Mathers LP", "Album"),
+            ("Li", "Short name"),
+            ("Bruce", "Lives with li and Eminem"),
+            ("", "Unnamed"),
+        ]
+        for name, description in entities:
+            retriever.entity_graph[name] = _node(name, description)
+
+        await retriever._build_name_based_relationship_edges()
+
+        expected = []
+        for name1, name2 in itertools.combinations(retriever.entity_graph, 2):
+            e1, e2 = retriever.entity_graph[name1], retriever.entity_graph[name2]
+            similarity = retriever._compute_name_similarity(name1, name2)
+            cooccurs = retriever._check_description_cooccurrence(e1.description, e2.description, name1, name2)
+            if similarity > 0.8 or cooccurs:
+                expected.append((name1, name2))
+
+        actual = [(e.source, e.target) for e in retriever.relationship_edges]
+        assert expected
+        assert sorted(actual) == sorted(expected)
+        assert len(actual) == len(set(actual))
+
+
+class TestRelationshipTraversal:
+    """Test cases for adjacency-based traversal."""
+
+    @pytest.mark.asyncio
+    async def test_traverse_follows_outgoing_edges_by_hop(self, retriever):
+        """Test that traversal follows outgoing edges through the adjacency index."""
+        retriever.entity_graph = {name: _node(name) for name in ["a", "b", "c", "d"]}
+        retriever._add_edge(RelationshipEdge("a", "b", 1.0, "explicit", "listed"))
+        retriever._add_edge(RelationshipEdge("b", "c", 0.8, "semantic", "similar"))
+        retriever._add_edge(RelationshipEdge("d", "a", 1.0, "explicit", "listed"))
+
+        one_hop = await retriever._traverse_relationships(["a"], "query", max_hops=1)
+        two_hops = await retriever._traverse_relationships(["a"], "query", max_hops=2)
+
+        assert [c.entity.name for c in one_hop] == ["b"]
+        assert [(c.entity.name, c.relationship_context["hop_distance"]) for c in two_hops] == [("b", 1), ("c", 2)]
+        assert retriever.adjacency["a"][0].target == "b"
+
+    @pytest.mark.asyncio
+    async def test_explicit_edges_populate_adjacency(self, retriever):
+        """Test that explicit relationships are indexed by source entity."""
+        retriever.entity_graph = {
+            "Alice": _node("Alice", relationships=["Bob"]),
+            "Bob": _node("Bob"),
+        }
+
+        await retriever._build_explicit_relationship_edges()
+
+        assert [e.target for e in retriever.adjacency["Alice"]] == ["Bob"]
+        assert "Bob" not in retriever.adjacency
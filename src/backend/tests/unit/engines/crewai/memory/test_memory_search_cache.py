@@ -0,0 +1,87 @@
+"""
+Unit tests for the per-execution memory search cache.
+"""
+from unittest.mock import patch
+
+from src.engines.crewai.memory.memory_search_cache import MemorySearchCache
+
+
+RESULTS = [{"content": "Paris is the capital of France", "score": 0.9}]
+
+
+def make_cache(**overrides) -> MemorySearchCache:
+    options = dict(memory_type="short_term", max_results=2, max_embeddings=2, ttl_seconds=60)
+    options.update(overrides)
+    return MemorySearchCache(**options)
+
+
+class TestMemorySearchCache:
+    """Test cases for MemorySearchCache."""
+
+    def test_key_normalises_query_and_filters(self):
+        """Test queries differing in spacing and filters in order share a key."""
+        cache = make_cache()
+        key = cache.result_key("What is  the capital?\n", {"a": 1, "b": 2}, 3)
+
+        assert key == cache.result_key("What is the capital?", {"b": 2, "a": 1}, 3)
+        assert key != cache.result_key("What is the capital?", {"a": 1, "b": 2}, 5)
+        assert key != make_cache(memory_type="entity").result_key("What is the capital?", {"a": 1, "b": 2}, 3)
+
+    def test_key_separates_scopes(self):
+        """Test results that depend on the searching agent are not shared between agents."""
+        cache = make_cache(memory_type="entity")
+        cache.put_results(cache.result_key("capital", None, 3, "Researcher"), RESULTS, cache.version)
+
+        assert cache.get_results(cache.result_key("capital", None, 3, "Writer")) is None
+        assert cache.get_results(cache.result_key("capital", None, 3, "Researcher")) == RESULTS
+
+    def test_results_are_served_until_a_write(self):
+        """Test cached results are dropped when the execution writes to the memory."""
+        cache = make_cache()
+        key = cache.result_key("capital", None, 3)
+        cache.put_results(key, RESULTS, cache.version)
+
+        assert cache.get_results(key) == RESULTS
+        cache.invalidate()
+        assert cache.get_results(key) is None
+        assert cache.get_stats()["hits"] == 1
+
+    def test_results_searched_before_a_write_are_not_cached(self):
+        """Test a search racing a write does not cache stale results."""
+        cache = make_cache()
+        key = cache.result_key("capital", None, 3)
+        version = cache.version
+        cache.invalidate()
+
+        cache.put_results(key, RESULTS, version)
+        assert cache.get_results(key) is None
+
+    def test_cached_results_are_copies(self):
+        """Test callers mutating results do not change the cache."""
+        cache = make_cache()
+        key = cache.result_key("capital", None, 3)
+        cache.put_results(key, RESULTS, cache.version)
+
+        cache.get_results(key)[0]["context"] = "changed"
+        assert "context" not in cache.get_results(key)[0]
+
+    def test_results_expire(self):
+        """Test results are not served after the TTL."""
+        cache = make_cache()
+        key = cache.result_key("capital", None, 3)
+        with patch("src.engines.crewai.memory.memory_search_cache.time.monotonic", return_value=1000.0):
+            cache.put_results(key, RESULTS, cache.version)
+        with patch("src.engines.crewai.memory.memory_search_cache.time.monotonic", return_value=1061.0):
+            assert cache.get_results(key) is None
+
+    def test_query_embeddings_survive_writes(self):
+        """Test query embeddings are an LRU kept across writes."""
+        cache = make_cache()
+        cache.put_embedding("first", [0.1])
+        cache.put_embedding("second", [0.2])
+        cache.invalidate()
+
+        assert cache.get_embedding(" first ") == [0.1]
+        cache.put_embedding("third", [0.3])
+        assert cache.get_embedding("second") is None
+        assert cache.get_embedding("third") == [0.3]
@@ -0,0 +1,145 @@
+"""
+Unit tests for write-behind buffering of Databricks vector memory writes.
+"""
+import asyncio
+import concurrent.futures
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.engines.crewai.memory.vector_write_buffer import VectorWriteBuffer, flush_crew_memory
+
+
+@pytest.fixture
+def storage():
+    """Create a storage that builds records from the data as it is."""
+    storage = MagicMock()
+    storage.memory_type = "short_term"
+    storage.index_name = "catalog.schema.short_term"
+    storage.build_record.side_effect = lambda data: dict(data)
+    storage.upsert_records = AsyncMock()
+    return storage
+
+
+def embed(texts):
+    return [[float(len(text))] for text in texts]
+
+
+class TestVectorWriteBuffer:
+    """Test cases for VectorWriteBuffer."""
+
+    def test_writes_full_batches_and_flushes_the_rest(self, storage):
+        """Test records are upserted in batches with one embedder call per batch."""
+        embedder = MagicMock(side_effect=embed)
+        buffer = VectorWriteBuffer(storage, embedder, max_batch_size=3, flush_interval_seconds=0)
+
+        for i in range(5):
+            buffer.add({"content": f"memory {i}"}, text="x" * (i + 1))
+        buffer.flush()
+
+        batches = [call.args[0] for call in storage.upsert_records.await_args_list]
+        assert [len(batch) for batch in batches] == [3, 2]
+        assert batches[0][0] == {"content": "memory 0", "embedding": [1.0]}
+        assert embedder.call_count == 2
+        assert buffer.get_stats() == {
+            "pending": 0, "in_flight": 0, "records_written": 5, "records_failed": 0, "upserts": 2
+        }
+
+    def test_nothing_is_written_before_a_threshold(self, storage):
+        """Test records wait in the buffer until it is full or flushed."""
+        buffer = VectorWriteBuffer(storage, embed, max_batch_size=10, flush_interval_seconds=0)
+
+        buffer.add({"content": "memory", "embedding": [0.5]})
+
+        assert buffer.pending == 1
+        storage.upsert_records.assert_not_awaited()
+        buffer.flush()
+        storage.upsert_records.assert_awaited_once_with([{"content": "memory", "embedding": [0.5]}])
+
+    def test_records_without_embedding_are_dropped(self, storage):
+        """Test a record whose text could not be embedded does not fail its batch."""
+        buffer = VectorWriteBuffer(
+            storage, lambda texts: [None, [1.0]], max_batch_size=10, flush_interval_seconds=0
+        )
+
+        buffer.add({"content": "a"}, text="a")
+        buffer.add({"content": "b"}, text="b")
+        buffer.flush()
+
+        storage.upsert_records.assert_awaited_once_with([{"content": "b", "embedding": [1.0]}])
+        assert buffer.get_stats()["records_failed"] == 1
+
+    def test_failed_upsert_is_counted(self, storage):
+        """Test a failing upsert is logged and counted, not raised to the agent."""
+        storage.upsert_records.side_effect = Exception("Upsert failed")
+        buffer = VectorWriteBuffer(storage, embed, max_batch_size=10, flush_interval_seconds=0)
+
+        buffer.add({"content": "a"}, text="a")
+        buffer.flush()
+
+        assert buffer.get_stats()["records_failed"] == 1
+        assert buffer.get_stats()["records_written"] == 0
+
+
+    def test_records_being_written_are_in_flight(self, storage):
+        """Test a flush never sees records neither pending nor in flight while their write starts."""
+        started = []
+
+        def run_in_background(coroutine):
+            future = concurrent.futures.Future()
+            started.append((coroutine, future))
+            return future
+
+        buffer = VectorWriteBuffer(storage, embed, max_batch_size=2, flush_interval_seconds=0)
+        with patch('src.engines.crewai.memory.vector_write_buffer.run_in_background', run_in_background):
+            buffer.add({"content": "a", "embedding": [0.1]})
+            buffer.add({"content": "b", "embedding": [0.2]})
+
+            # The write has not run yet, but the records are already handed to it
+            assert buffer.get_stats()["pending"] == 0
+            assert buffer.get_stats()["in_flight"] == 1
+            buffer.flush(timeout=0)
+            assert len(started) == 1
+
+        coroutine, future = started[0]
+        future.set_result(asyncio.run(coroutine))
+        storage.upsert_records.assert_awaited_once_with(
+            [{"content": "a", "embedding": [0.1]}, {"content": "b", "embedding": [0.2]}]
+        )
+        assert buffer.get_stats()["in_flight"] == 0
+
+
+class TestFlushCrewMemory:
+    """Test cases for flush_crew_memory."""
+
+    def test_flushes_each_buffer_once(self, storage):
+        """Test buffers reachable from the crew's memories are flushed once."""
+        buffer = VectorWriteBuffer(storage, embed, max_batch_size=10, flush_interval_seconds=0)
+        buffer.add({"content": "a", "embedding": [0.1]})
+        memory = SimpleNamespace(storage=SimpleNamespace(write_buffer=buffer))
+        crew = SimpleNamespace(_short_term_memory=memory, short_term_memory=memory, entity_memory=None)
+
+        flush_crew_memory(crew)
+
+        storage.upsert_records.assert_awaited_once()
+        assert buffer.pending == 0
+
+    def test_stalled_write_times_out(self, storage):
+        """Test a flush gives up after its timeout and reports the write as unfinished."""
+        release = threading.Event()
+
+        async def stall(records):
+            await asyncio.to_thread(release.wait)
+
+        storage.upsert_records.side_effect = stall
+        buffer = VectorWriteBuffer(storage, embed, max_batch_size=10, flush_interval_seconds=0)
+        buffer.add({"content": "a", "embedding": [0.1]})
+        memory = SimpleNamespace(storage=SimpleNamespace(write_buffer=buffer))
+        crew = SimpleNamespace(short_term_memory=memory)
+
+        assert flush_crew_memory(crew, timeout=0.05) is False
+        assert buffer.get_stats()["in_flight"] == 1
+        release.set()
+        assert buffer.flush() is True
@@ -196,4 +196,119 @@ class TestCrewLoggerHandler:
         
         with patch("src.engines.crewai.crew_logger.enqueue_log"):
             # Should not raise exception even with format error
-            handler.emit(record)
\ No newline at end of file
+            handler.emit(record)
+
+@pytest.fixture
+def restore_streams():
+    """Restore sys.stdout/sys.stderr after the demultiplexer was installed."""
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    yield
+    sys.stdout, sys.stderr = original_stdout, original_stderr
+
+
+class TestCaptureStdoutStderr:
+    """Test cases for per-execution stdout/stderr capture."""
+    
+    def test_lines_are_forwarded_while_running(self, crew_logger_instance, restore_streams):
+        """Test that complete lines are enqueued before the capture exits."""
+        with patch("src.engines.crewai.crew_logger.enqueue_log") as mock_enqueue:
+            with crew_logger_instance.capture_stdout_stderr("job_1"):
+                print("first line")
+                sys.stdout.write("partial")
+                assert mock_enqueue.call_count == 1
+                assert "STDOUT: first line" in mock_enqueue.call_args.kwargs["content"]
+                sys.stderr.write(" oops \n")
+                assert mock_enqueue.call_count == 2
+            
+            # The trailing partial line is forwarded on exit
+            assert mock_enqueue.call_count == 3
+        
+        contents = [c.kwargs["content"] for c in mock_enqueue.call_args_list]
+        assert "- ERROR - STDERR: oops" in contents[1]
+        assert "STDOUT: partial" in contents[2]
+        assert all(c.kwargs["execution_id"] == "job_1" for c in mock_enqueue.call_args_list)
+        crew_logger_instance._crew_logger.error.assert_called_with("STDERR: oops")
+    
+    def test_output_outside_capture_passes_through(self, crew_logger_instance, restore_streams):
+        """Test that writes from contexts without a capture reach the original stream."""
+        from src.engines.crewai.crew_logger import DemultiplexingStream
+        
+        target = io.StringIO()
+        sys.stdout = target
+        with patch("src.engines.crewai.crew_logger.enqueue_log") as mock_enqueue:
+            with crew_logger_instance.capture_stdout_stderr("job_1"):
+                assert isinstance(sys.stdout, DemultiplexingStream)
+                outside = threading.Thread(target=lambda: print("not captured"))
+                outside.start()
+                outside.join()
+            print("after")
+        
+        assert target.getvalue() == "not captured\nafter\n"
+        mock_enqueue.assert_not_called()
+    
+    def test_concurrent_captures_are_isolated(self, crew_logger_instance, restore_streams):
+        """Test that concurrent executions only receive their own output."""
+        import contextvars
+        
+        barrier = threading.Barrier(2)
+        
+        def run(job_id):
+            with crew_logger_instance.capture_stdout_stderr(job_id):
+                barrier.wait()
+                for i in range(20):
+                    print(f"{job_id} line {i}")
+        
+        with patch("src.engines.crewai.crew_logger.enqueue_log") as mock_enqueue:
+            threads = [
+                threading.Thread(target=contextvars.copy_context().run, args=(run, job_id))
+                for job_id in ("job_a", "job_b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        by_job = {}
+        for c in mock_enqueue.call_args_list:
+            by_job.setdefault(c.kwargs["execution_id"], []).append(c.kwargs["content"])
+        assert set(by_job) == {"job_a", "job_b"}
+        for job_id, contents in by_job.items():
+            assert len(contents) == 20
+            assert all(f"STDOUT: {job_id} line" in content for content in contents)
+    
+    def test_long_partial_lines_are_bounded(self, restore_streams):
+        """Test that a line without newline is forwarded in bounded chunks."""
+        from src.engines.crewai.crew_logger import OutputCapture, MAX_PENDING_LINE_CHARS
+        
+        forwarded = []
+        capture = OutputCapture(lambda stream_name, line: forwarded.append((stream_name, line)))
+        capture.write("stdout", "x" * (MAX_PENDING_LINE_CHARS * 2 + 5))
+        
+        assert [len(line) for _, line in forwarded] == [MAX_PENDING_LINE_CHARS, MAX_PENDING_LINE_CHARS]
+        capture.close()
+        assert forwarded[-1] == ("stdout", "xxxxx")
+    
+    def test_logging_to_stderr_during_forwarding_does_not_recurse(self, restore_streams):
+        """Test that writes made while forwarding a line go to the original stream."""
+        from src.engines.crewai.crew_logger import (
+            OutputCapture, _current_output_capture, install_output_demultiplexer,
+        )
+        
+        target = io.StringIO()
+        sys.stderr = target
+        install_output_demultiplexer()
+        forwarded = []
+        
+        def forward(stream_name, line):
+            forwarded.append(line)
+            sys.stderr.write(f"handler saw {line}\n")
+        
+        capture = OutputCapture(forward)
+        token = _current_output_capture.set(capture)
+        try:
+            sys.stderr.write("hello\n")
+        finally:
+            _current_output_capture.reset(token)
+        
+        assert forwarded == ["hello"]
+        assert target.getvalue() == "handler saw hello\n"
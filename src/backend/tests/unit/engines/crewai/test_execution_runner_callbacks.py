@@ -67,7 +67,7 @@ class TestExecutionRunnerCallbackIntegration:
              patch("src.services.api_keys_service.ApiKeysService.setup_openai_api_key"), \
              patch("src.services.api_keys_service.ApiKeysService.setup_anthropic_api_key"), \
              patch("src.services.api_keys_service.ApiKeysService.setup_gemini_api_key"), \
-             patch("src.engines.crewai.tools.mcp_handler.stop_all_adapters"), \
+             patch("src.engines.crewai.tools.mcp_handler.release_mcp_adapters"), \
              patch("src.engines.crewai.execution_runner.update_execution_status_with_retry"):
             
             # Setup callback mocks
@@ -118,7 +118,7 @@ class TestExecutionRunnerCallbackIntegration:
              patch("src.services.api_keys_service.ApiKeysService.setup_openai_api_key"), \
              patch("src.services.api_keys_service.ApiKeysService.setup_anthropic_api_key"), \
              patch("src.services.api_keys_service.ApiKeysService.setup_gemini_api_key"), \
-             patch("src.engines.crewai.tools.mcp_handler.stop_all_adapters"), \
+             patch("src.engines.crewai.tools.mcp_handler.release_mcp_adapters"), \
              patch("src.engines.crewai.execution_runner.update_execution_status_with_retry"):
             
             # Setup mocks - callbacks creation succeeds but setting on crew fails
@@ -3,8 +3,11 @@ Simplified unit tests for trace management with execution-scoped callbacks.
 
 Tests core trace management functionality with minimal async complexity.
 """
+import asyncio
+import queue
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 
 class TestTraceManagerEventFiltering:
@@ -12,11 +15,8 @@ class TestTraceManagerEventFiltering:
     
     def test_important_event_types_list(self):
         """Test that important event types are correctly defined."""
-        # This tests the event filtering logic that's in the trace writer
-        important_event_types = [
-            "agent_execution", "tool_usage", "crew_started", 
-            "crew_completed", "task_started", "task_completed", "llm_call"
-        ]
+        # This tests the event filter applied when traces are enqueued
+        from src.services.trace_queue import IMPORTANT_EVENT_TYPES as important_event_types
         
         # Test that our callback events are in the important list
         assert "agent_execution" in important_event_types
@@ -322,4 +322,117 @@ class TestConfigSanitization:
             mock_enqueue.assert_called_once()
             call_args = mock_enqueue.call_args
             kwargs = call_args[1] if len(call_args) > 1 else call_args.kwargs
-            assert kwargs["execution_id"] == job_id
\ No newline at end of file
+            assert kwargs["execution_id"] == job_id
+
+
+class TestTraceManagerWriter:
+    """Test cases for the batched trace writer."""
+    
+    @staticmethod
+    def _trace(job_id="job-1", event_type="agent_execution"):
+        return {
+            "job_id": job_id,
+            "event_source": "Test Agent",
+            "event_context": "Test Task",
+            "event_type": event_type,
+            "output_content": "output",
+            "extra_data": {"key": "value"},
+            "group_id": "group-1",
+        }
+    
+    @pytest.mark.asyncio
+    async def test_flush_traces_uses_job_cache(self):
+        """Test that cached run_ids are reused and resolved ones are cached."""
+        from src.engines.crewai.trace_management import TraceManager
+        from src.services.trace_queue import TraceJobCache
+        
+        cache = TraceJobCache(max_size=10)
+        cache.put("job-1", 1)
+        create_traces = AsyncMock(return_value={"job-2": 2})
+        
+        with patch("src.services.trace_queue.get_trace_job_cache", return_value=cache), \
+             patch("src.services.execution_trace_service.ExecutionTraceService.create_traces", create_traces):
+            failures = await TraceManager._flush_traces([
+                self._trace("job-1"),
+                self._trace("job-2", "task_completed"),
+                self._trace("unknown"),
+                self._trace("job-1", "debug_info"),
+            ])
+        
+        assert failures == 0
+        create_traces.assert_awaited_once()
+        rows = create_traces.call_args.args[0]
+        assert len(rows) == 2
+        assert rows[0]["run_id"] == 1
+        assert rows[0]["output"] == "output"
+        assert rows[0]["trace_metadata"] == {"key": "value"}
+        assert rows[0]["group_id"] == "group-1"
+        assert "run_id" not in rows[1]
+        assert cache.get("job-2") == 2
+    
+    @pytest.mark.asyncio
+    async def test_flush_traces_falls_back_to_single_inserts(self):
+        """Test per-trace fallback and cache eviction when the bulk insert fails."""
+        from src.engines.crewai.trace_management import TraceManager
+        from src.services.trace_queue import TraceJobCache
+        
+        cache = TraceJobCache(max_size=10)
+        cache.put("job-1", 1)
+        create_trace = AsyncMock(side_effect=[MagicMock(), Exception("bad row")])
+        
+        with patch("src.services.trace_queue.get_trace_job_cache", return_value=cache), \
+             patch("src.services.execution_trace_service.ExecutionTraceService.create_traces",
+                   AsyncMock(side_effect=Exception("bulk failed"))), \
+             patch("src.services.execution_trace_service.ExecutionTraceService.create_trace", create_trace):
+            failures = await TraceManager._flush_traces([self._trace("job-1"), self._trace("job-1")])
+        
+        assert failures == 1
+        assert create_trace.await_count == 2
+        assert "run_id" not in create_trace.call_args_list[0].args[0]
+        assert cache.get("job-1") is None
+    
+    @pytest.mark.asyncio
+    async def test_writer_loop_batches_and_drains_on_shutdown(self):
+        """Test that queued traces are written in bulk without blocking the loop."""
+        from src.engines.crewai.trace_management import TraceManager
+        from src.services.trace_queue import TraceQueue, TraceJobCache
+        
+        trace_queue = queue.Queue()
+        create_traces = AsyncMock(return_value={})
+        
+        with patch("src.services.trace_queue.get_trace_queue", return_value=trace_queue), \
+             patch("src.services.trace_queue.get_trace_job_cache", return_value=TraceJobCache(max_size=10)), \
+             patch("src.services.execution_trace_service.ExecutionTraceService.create_traces", create_traces):
+            TraceManager._shutdown_event.clear()
+            task = asyncio.create_task(TraceManager._trace_writer_loop(batch_size=10, flush_interval_ms=20))
+            await asyncio.sleep(0.05)
+            
+            for _ in range(3):
+                trace_queue.put_nowait(self._trace())
+            TraceQueue().notify()
+            await asyncio.sleep(0.2)
+            
+            assert create_traces.await_count == 1
+            assert len(create_traces.call_args.args[0]) == 3
+            
+            # Traces still queued at shutdown are flushed before the task exits
+            trace_queue.put_nowait(self._trace())
+            TraceManager._shutdown_event.set()
+            trace_queue.put_nowait(None)
+            TraceQueue().notify()
+            await asyncio.wait_for(task, timeout=2.0)
+            TraceManager._shutdown_event.clear()
+        
+        assert create_traces.await_count == 2
+        assert trace_queue.empty()
+        assert TraceQueue()._notifier is None
+    
+    def test_get_metrics(self):
+        """Test that queue depth, latency and cache statistics are exposed."""
+        from src.engines.crewai.trace_management import TraceManager
+        
+        metrics = TraceManager.get_metrics()
+        
+        for key in ("queue_depth", "batches_flushed", "traces_written", "traces_failed",
+                    "last_flush_latency_ms", "avg_flush_latency_ms", "max_flush_latency_ms", "job_cache"):
+            assert key in metrics
@@ -380,7 +380,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_success(self, mock_get):
         """Test token permission validation success"""
         async def run_test():
@@ -403,7 +403,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_forbidden(self, mock_get):
         """Test token permission validation with 403 forbidden"""
         async def run_test():
@@ -422,7 +422,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_with_https_prefix_host(self, mock_get):
         """Test token permission validation when host already has https:// prefix"""
         async def run_test():
@@ -446,7 +446,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_with_jwt_decoding(self, mock_get):
         """Test token permission validation with JWT token decoding"""
         async def run_test():
@@ -613,7 +613,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_unexpected_status(self, mock_get):
         """Test token permission validation with unexpected status code"""
         async def run_test():
@@ -632,7 +632,7 @@ class TestDatabricksCustomTool(unittest.TestCase):
         
         asyncio.run(run_test())
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_token_permissions_exception(self, mock_get):
         """Test token permission validation with exception"""
         async def run_test():
@@ -491,8 +491,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
             result = tool._run(action="create", job_config={"name": "test"})
             self.assertIn("Mocked result", result)
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_get_auth_headers_with_pat(self, mock_session):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_get_auth_headers_with_pat(self, mock_get_pool):
         """Test _get_auth_headers with PAT token"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -506,7 +506,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
 
 
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
     @patch('src.services.api_keys_service.ApiKeysService.get_provider_api_key', new_callable=AsyncMock)
     @patch('src.core.unit_of_work.UnitOfWork')
     def test_get_auth_headers_no_token_error(self, mock_uow, mock_get_api_key, mock_session):
@@ -526,8 +526,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
         
         self.assertIn("No authentication token available", str(cm.exception))
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_make_api_call_success(self, mock_session_class):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_make_api_call_success(self, mock_get_pool):
         """Test successful API call"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -545,7 +545,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_session_class.return_value = mock_session
+        mock_get_pool.return_value.client.return_value = mock_session
         
         # Run the async method
         result = asyncio.run(tool._make_api_call("GET", "/api/2.1/jobs/list"))
@@ -553,8 +553,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
         self.assertEqual(result, {"result": "success"})
         mock_session.request.assert_called_once()
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_make_api_call_with_data(self, mock_session_class):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_make_api_call_with_data(self, mock_get_pool):
         """Test API call with data parameter"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -572,7 +572,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_session_class.return_value = mock_session
+        mock_get_pool.return_value.client.return_value = mock_session
         
         test_data = {"job_id": 123}
         
@@ -584,8 +584,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
         call_args = mock_session.request.call_args
         self.assertEqual(call_args[1]['json'], test_data)
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_make_api_call_error(self, mock_session_class):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_make_api_call_error(self, mock_get_pool):
         """Test API call with error response"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -603,7 +603,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_session_class.return_value = mock_session
+        mock_get_pool.return_value.client.return_value = mock_session
         
         # Run the async method
         with self.assertRaises(Exception) as cm:
@@ -613,8 +613,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
         self.assertIn("INVALID_REQUEST", str(cm.exception))
         self.assertIn("Bad request", str(cm.exception))
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_make_api_call_error_invalid_json(self, mock_session_class):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_make_api_call_error_invalid_json(self, mock_get_pool):
         """Test API call with error response that has invalid JSON"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -632,7 +632,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_session_class.return_value = mock_session
+        mock_get_pool.return_value.client.return_value = mock_session
         
         # Run the async method
         with self.assertRaises(Exception) as cm:
@@ -641,8 +641,8 @@ class TestDatabricksJobsTool(unittest.TestCase):
         self.assertIn("API call failed with status 500", str(cm.exception))
         self.assertIn("Internal Server Error", str(cm.exception))
 
-    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.aiohttp.ClientSession')
-    def test_make_api_call_timeout(self, mock_session_class):
+    @patch('src.engines.crewai.tools.custom.databricks_jobs_tool.get_http_client_pool')
+    def test_make_api_call_timeout(self, mock_get_pool):
         """Test API call timeout"""
         tool = DatabricksJobsTool(tool_config=self.tool_config)
         
@@ -652,7 +652,7 @@ class TestDatabricksJobsTool(unittest.TestCase):
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_session_class.return_value = mock_session
+        mock_get_pool.return_value.client.return_value = mock_session
         
         # Run the async method
         with self.assertRaises(Exception) as cm:
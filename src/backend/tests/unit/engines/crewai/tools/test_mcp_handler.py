@@ -14,8 +14,13 @@ from src.engines.crewai.tools.mcp_handler import (
     stop_mcp_adapter,
     wrap_mcp_tool,
     run_in_separate_process,
-    _active_mcp_adapters
+    get_or_create_mcp_adapter,
+    bind_mcp_owner,
+    release_mcp_adapters,
+    _active_mcp_adapters,
+    _mcp_connection_pool
 )
+from src.engines.common.mcp_session_pool import MCPSessionPool
 from src.engines.common.mcp_adapter import MCPTool
 
 
@@ -75,6 +80,39 @@ class TestMCPAdapterManagement:
         # Actually the implementation resets the dictionary
         assert len(_active_mcp_adapters) == 0
     
+    @pytest.mark.asyncio
+    async def test_execution_leases_are_released_per_execution(self):
+        """Test that releasing one execution keeps the leases and adapters of another."""
+        _active_mcp_adapters.clear()
+        _mcp_connection_pool.clear()
+        pool = MCPSessionPool(keepalive_seconds=60, idle_timeout_seconds=300, max_sessions=4, tools_ttl_seconds=300)
+        server_params = {'url': 'https://mcp.example/', 'headers': {'Authorization': 'Bearer token'}}
+        
+        adapter = Mock()
+        adapter._initialized = True
+        adapter.pool_key = ('https://mcp.example/', 'digest')
+        adapter.initialize = AsyncMock()
+        
+        with patch('src.engines.common.mcp_session_pool.get_mcp_session_pool', return_value=pool), \
+             patch('src.engines.common.mcp_adapter.MCPAdapter', return_value=adapter):
+            with bind_mcp_owner('exec-1'):
+                first = await get_or_create_mcp_adapter(server_params, 'agent_a_server_1')
+            with bind_mcp_owner('exec-2'):
+                second = await get_or_create_mcp_adapter(server_params, 'agent_b_server_1')
+            
+            assert first is second
+            await release_mcp_adapters('exec-1')
+            
+            assert pool.is_leased(adapter.pool_key)
+            assert 'agent_a_server_1' not in _active_mcp_adapters
+            assert 'agent_b_server_1' in _active_mcp_adapters
+            
+            await release_mcp_adapters('exec-2')
+            assert not pool.is_leased(adapter.pool_key)
+        
+        _mcp_connection_pool.clear()
+        _active_mcp_adapters.clear()
+    
     @pytest.mark.asyncio
     async def test_stop_mcp_adapter_async(self):
         """Test stopping an async MCP adapter."""
@@ -4,7 +4,19 @@ import os
 from unittest.mock import MagicMock, patch, AsyncMock
 from concurrent.futures import ThreadPoolExecutor, Future
 
-from src.engines.crewai.tools.tool_factory import ToolFactory
+from src.core.api_key_cache import get_api_key_cache
+from src.core.prompt_cache import get_prompt_cache
+from src.engines.crewai.tools.tool_factory import ToolFactory, TOOL_API_KEYS
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    """Start every test with empty tool catalogue and API key caches."""
+    get_prompt_cache().clear()
+    get_api_key_cache().clear()
+    yield
+    get_prompt_cache().clear()
+    get_api_key_cache().clear()
 
 
 class TestToolFactory:
@@ -91,14 +103,57 @@ class TestToolFactory:
             
             # Mock the API key object
             mock_api_key = MagicMock()
+            mock_api_key.name = "SERPER_API_KEY"
             mock_api_key.encrypted_value = "encrypted_key"
-            mock_exec.return_value = mock_api_key
+            mock_exec.return_value = [mock_api_key]
             
-            await factory.initialize()
+            with patch.dict('os.environ', {}, clear=True):
+                await factory.initialize()
+                
+                # Keys are held by the factory, not written to the environment
+                assert "SERPER_API_KEY" not in os.environ
             
             assert factory._initialized is True
-            # Should attempt to load several API keys
-            assert mock_exec.call_count >= 1
+            # All keys are loaded with a single query
+            mock_exec.assert_called_once()
+            assert factory._credentials["SERPER_API_KEY"] == "test_key"
+            assert factory._credentials["OPENAI_API_KEY"] is None
+    
+    @pytest.mark.asyncio
+    async def test_initialize_credentials_from_cache(self, mock_config):
+        """Test a warm API key cache avoids the database entirely."""
+        cache = get_api_key_cache()
+        for key_name in TOOL_API_KEYS:
+            cache.put(key_name, f"cached_{key_name}")
+        factory = ToolFactory(mock_config, MagicMock())
+        
+        with patch.object(factory, '_load_available_tools_async', new_callable=AsyncMock), \
+             patch('src.utils.asyncio_utils.execute_db_operation_with_fresh_engine', new_callable=AsyncMock) as mock_exec:
+            await factory.initialize()
+        
+        mock_exec.assert_not_called()
+        assert factory._credentials["SERPER_API_KEY"] == "cached_SERPER_API_KEY"
+    
+    def test_factories_keep_separate_credentials(self, mock_config):
+        """Test factories inject their own keys instead of sharing os.environ."""
+        mock_tool = MagicMock()
+        mock_tool.title = "SerperDevTool"
+        mock_tool.config = {}
+        mock_serper_class = MagicMock()
+        
+        factory_a = ToolFactory(mock_config)
+        factory_b = ToolFactory(mock_config)
+        factory_a._credentials["SERPER_API_KEY"] = "key_a"
+        factory_b._credentials["SERPER_API_KEY"] = "key_b"
+        
+        with patch.dict('os.environ', {}, clear=True):
+            for factory in (factory_a, factory_b):
+                factory._tool_implementations["SerperDevTool"] = mock_serper_class
+                with patch.object(factory, 'get_tool_info', return_value=mock_tool):
+                    factory.create_tool("SerperDevTool")
+            assert "SERPER_API_KEY" not in os.environ
+        
+        assert [c[1]["api_key"] for c in mock_serper_class.call_args_list] == ["key_a", "key_b"]
     
     @pytest.mark.asyncio
     async def test_initialize_exception_handling(self, tool_factory):
@@ -363,6 +418,37 @@ class TestToolFactory:
                 assert tool_factory._available_tools["Tool2"] == mock_tool2
                 assert tool_factory._available_tools["2"] == mock_tool2
     
+    @pytest.mark.asyncio
+    async def test_load_available_tools_async_uses_catalogue_cache(self, mock_config):
+        """Test the tool catalogue is loaded once and shared between factories."""
+        mock_tool = MagicMock()
+        mock_tool.id = 1
+        mock_tool.title = "Tool1"
+        mock_response = MagicMock()
+        mock_response.tools = [mock_tool]
+        
+        with patch('src.core.unit_of_work.UnitOfWork') as mock_uow_class, \
+             patch('src.services.tool_service.ToolService.from_unit_of_work', new_callable=AsyncMock) as mock_from_uow:
+            mock_uow_class.return_value.__aenter__.return_value = MagicMock()
+            mock_service = MagicMock()
+            mock_service.get_all_tools = AsyncMock(return_value=mock_response)
+            mock_from_uow.return_value = mock_service
+            
+            first = ToolFactory(mock_config)
+            await first._load_available_tools_async()
+            second = ToolFactory(mock_config)
+            await second._load_available_tools_async()
+            
+            assert mock_service.get_all_tools.await_count == 1
+            assert second._available_tools["Tool1"] == mock_tool
+            assert second._available_tools["1"] == mock_tool
+            
+            # A tool change invalidates the shared catalogue
+            get_prompt_cache().invalidate_tools()
+            third = ToolFactory(mock_config)
+            await third._load_available_tools_async()
+            assert mock_service.get_all_tools.await_count == 2
+    
     @pytest.mark.asyncio
     async def test_load_available_tools_async_exception(self, tool_factory):
         """Test exception handling in async tool loading."""
@@ -525,8 +611,9 @@ class TestToolFactory:
                 result = factory.create_tool("FirecrawlCrawlWebsiteTool")
                 
                 assert result == mock_instance
-                # When no api_key in config and none in env, it's created with just result_as_answer
+                # The key from the service is injected into the tool
                 mock_firecrawl_class.assert_called_once_with(
+                    api_key="service_firecrawl_key",
                     result_as_answer=False
                 )
     
@@ -621,6 +708,7 @@ class TestToolFactory:
         
         # Mock environment variable and DatabricksService to prevent real URLs
         with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.object(tool_factory, '_resolve_api_key', return_value=None), \
              patch.dict('os.environ', {'DATABRICKS_HOST': ''}, clear=False), \
              patch('src.services.databricks_service.DatabricksService.from_unit_of_work', new_callable=AsyncMock) as mock_service_factory, \
              patch('src.core.unit_of_work.UnitOfWork'):
@@ -668,7 +756,8 @@ class TestToolFactory:
         mock_jobs_class.return_value = mock_instance
         tool_factory._tool_implementations["DatabricksJobsTool"] = mock_jobs_class
         
-        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool):
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.object(tool_factory, '_resolve_api_key', return_value=None):
             
             result = tool_factory.create_tool("DatabricksJobsTool")
             
@@ -682,6 +771,27 @@ class TestToolFactory:
                 result_as_answer=False
             )
     
+    @pytest.mark.parametrize("tool_name", ["DatabricksCustomTool", "DatabricksJobsTool"])
+    def test_create_tool_databricks_pat_from_credentials(self, tool_factory, tool_name):
+        """Test Databricks tools get the PAT stored in the API keys table without it being in the environment."""
+        mock_tool = MagicMock()
+        mock_tool.title = tool_name
+        mock_tool.config = {"DATABRICKS_HOST": "https://test.databricks.com"}
+        
+        mock_class = MagicMock()
+        tool_factory._tool_implementations[tool_name] = mock_class
+        tool_factory._credentials["DATABRICKS_API_KEY"] = "dapi-test"
+        
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch('src.utils.user_context.UserContext.get_user_token', return_value=None), \
+             patch.dict(os.environ, {}, clear=True):
+            
+            result = tool_factory.create_tool(tool_name)
+            
+            assert result == mock_class.return_value
+            assert mock_class.call_args.kwargs['tool_config']['DATABRICKS_API_KEY'] == "dapi-test"
+            assert "DATABRICKS_API_KEY" not in os.environ
+    
     def test_create_tool_genie_with_user_token(self, mock_config):
         """Test creating GenieTool with user token for OAuth."""
         factory = ToolFactory(mock_config, user_token="factory_token")
@@ -731,7 +841,8 @@ class TestToolFactory:
         mock_website_class.return_value = mock_instance
         tool_factory._tool_implementations["WebsiteSearchTool"] = mock_website_class
         
-        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool):
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.object(tool_factory, '_resolve_api_key', return_value=None):
             
             result = tool_factory.create_tool("WebsiteSearchTool", result_as_answer=True)
             
@@ -741,6 +852,35 @@ class TestToolFactory:
                 result_as_answer=True
             )
     
+    def test_create_tool_rag_tool_gets_openai_key(self, tool_factory):
+        """Test embedchain-based tools get the OpenAI key in their config, not from the environment."""
+        mock_tool = MagicMock()
+        mock_tool.title = "PDFSearchTool"
+        mock_tool.config = {
+            "pdf": "report.pdf",
+            "config": {"embedder": {"provider": "huggingface", "config": {"model": "BAAI/bge-small-en-v1.5"}}}
+        }
+        
+        mock_pdf_class = MagicMock()
+        tool_factory._tool_implementations["PDFSearchTool"] = mock_pdf_class
+        tool_factory._credentials["OPENAI_API_KEY"] = "sk-test"
+        
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.dict(os.environ, {}, clear=True):
+            
+            result = tool_factory.create_tool("PDFSearchTool")
+            
+            assert result == mock_pdf_class.return_value
+            mock_pdf_class.assert_called_once_with(
+                pdf="report.pdf",
+                config={
+                    "llm": {"provider": "openai", "config": {"api_key": "sk-test"}},
+                    "embedder": {"provider": "huggingface", "config": {"model": "BAAI/bge-small-en-v1.5"}}
+                },
+                result_as_answer=False
+            )
+            assert "OPENAI_API_KEY" not in os.environ
+    
     def test_create_tool_exception_handling(self, tool_factory):
         """Test exception handling in create_tool."""
         mock_tool = MagicMock()
@@ -1121,7 +1261,8 @@ class TestToolFactory:
         mock_website_class.return_value = mock_instance
         tool_factory._tool_implementations["WebsiteSearchTool"] = mock_website_class
         
-        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool):
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.object(tool_factory, '_resolve_api_key', return_value=None):
             
             result = tool_factory.create_tool("WebsiteSearchTool")
             
@@ -1139,7 +1280,8 @@ class TestToolFactory:
         mock_website_class.return_value = mock_instance
         tool_factory._tool_implementations["WebsiteSearchTool"] = mock_website_class
         
-        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool):
+        with patch.object(tool_factory, 'get_tool_info', return_value=mock_tool), \
+             patch.object(tool_factory, '_resolve_api_key', return_value=None):
             
             result = tool_factory.create_tool("WebsiteSearchTool")
             
@@ -230,7 +230,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is True
@@ -245,7 +245,7 @@ class TestGenieTool:
         mock_response.status_code = 403
         mock_response.text = "Forbidden"
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is False
@@ -269,7 +269,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is True
@@ -289,7 +289,7 @@ class TestGenieTool:
             "message_id": "msg-456"
         }
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -313,7 +313,7 @@ class TestGenieTool:
             "message_id": "new-msg-789"
         }
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Follow-up question")
@@ -338,7 +338,7 @@ class TestGenieTool:
             ]
         }
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 result = tool._get_message_status("conv-123", "msg-456")
         
@@ -366,7 +366,7 @@ class TestGenieTool:
             }
         }
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 result = tool._get_query_result("conv-123", "msg-456")
         
@@ -755,7 +755,7 @@ class TestGenieTool:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is False
@@ -771,7 +771,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is True
@@ -782,7 +782,7 @@ class TestGenieTool:
         tool = GenieTool(tool_config={"DATABRICKS_HOST": "test.databricks.com", "spaceId": "test-space-id"})
         headers = {"Authorization": "Bearer test-token"}
         
-        with patch('requests.get', side_effect=Exception("Connection error")):
+        with patch('requests.Session.get', side_effect=Exception("Connection error")):
             result = await tool._test_token_permissions(headers)
         
         assert result is False
@@ -799,7 +799,7 @@ class TestGenieTool:
         mock_response.status_code = 200
         mock_response.json.return_value = {}  # Missing IDs
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -822,7 +822,7 @@ class TestGenieTool:
             "message": {"id": "nested-msg-456"}
         }
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -842,7 +842,7 @@ class TestGenieTool:
         mock_response.status_code = 200  
         mock_response.json.return_value = {"id": "msg-only-789"}
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -862,7 +862,7 @@ class TestGenieTool:
         mock_response.text = "Bad Request Details"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("400 Bad Request")
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     with pytest.raises(requests.exceptions.HTTPError):
@@ -1170,7 +1170,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         assert result is True  # Still returns True, but logs missing scopes
 
@@ -1193,7 +1193,7 @@ class TestGenieTool:
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"id": "nested-msg"}}
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("test")
@@ -1209,7 +1209,7 @@ class TestGenieTool:
         mock_response.json.return_value = {"status": "COMPLETED"}
         
         # Mock async auth to fail, forcing sync fallback
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 result = tool._get_message_status("conv-123", "msg-456")
         
@@ -1224,7 +1224,7 @@ class TestGenieTool:
         mock_response.json.return_value = {"data": "test"}
         
         # Mock async auth to fail, forcing sync fallback  
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 result = tool._get_query_result("conv-123", "msg-456")
         
@@ -1429,7 +1429,7 @@ class TestGenieTool:
             "message_id": "msg-456"
         }
         
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -1444,7 +1444,7 @@ class TestGenieTool:
         tool = GenieTool(tool_config={"DATABRICKS_HOST": "test.databricks.com", "spaceId": "test-space-id"})
         headers = {"Authorization": "Bearer test-token"}
         
-        with patch('requests.get', side_effect=requests.exceptions.Timeout("Request timeout")):
+        with patch('requests.Session.get', side_effect=requests.exceptions.Timeout("Request timeout")):
             result = await tool._test_token_permissions(headers)
         
         assert result is False
@@ -1607,7 +1607,7 @@ class TestGenieTool:
         }
         
         # Mock async auth to fail, triggering sync fallback
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -1630,7 +1630,7 @@ class TestGenieTool:
         }
         
         # Mock async auth to fail, should fall back to user token
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -1649,7 +1649,7 @@ class TestGenieTool:
         mock_response.json.return_value = {"status": "COMPLETED"}
         
         # Mock async to fail, should use PAT token
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 result = tool._get_message_status("conv-123", "msg-456")
         
@@ -1674,7 +1674,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is True
@@ -1697,7 +1697,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = await tool._test_token_permissions(headers)
         
         assert result is True
@@ -1712,7 +1712,7 @@ class TestGenieTool:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             # Should not crash on decode error
             result = await tool._test_token_permissions(headers)
         
@@ -1897,7 +1897,7 @@ class TestGenieTool:
         # Mock permission test to fail but continue anyway
         with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
             with patch.object(tool, '_test_token_permissions', return_value=False):
-                with patch('requests.post') as mock_post:
+                with patch('requests.Session.post') as mock_post:
                     mock_response = Mock()
                     mock_response.status_code = 200
                     mock_response.json.return_value = {"conversation_id": "conv", "message_id": "msg"}
@@ -1919,7 +1919,7 @@ class TestGenieTool:
         # Mock permission test to raise exception but continue anyway
         with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
             with patch.object(tool, '_test_token_permissions', side_effect=Exception("Permission test failed")):
-                with patch('requests.post') as mock_post:
+                with patch('requests.Session.post') as mock_post:
                     mock_response = Mock()
                     mock_response.status_code = 200
                     mock_response.json.return_value = {"conversation_id": "conv", "message_id": "msg"}
@@ -2255,7 +2255,7 @@ class TestGenieTool:
         mock_response.status_code = 200
         mock_response.json.return_value = {"id": "msg-789"}  # Only id field
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch.object(tool, '_get_auth_headers', return_value={"Authorization": "Bearer test"}):
                 with patch.object(tool, '_test_token_permissions', return_value=True):
                     result = tool._start_or_continue_conversation("Test question")
@@ -2289,7 +2289,7 @@ class TestGenieTool:
         mock_response.json.return_value = {"data": "test"}
         
         # Mock async auth to fail, should use PAT token
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with patch('asyncio.new_event_loop', side_effect=Exception("Async failed")):
                 result = tool._get_query_result("conv-123", "msg-456")
         
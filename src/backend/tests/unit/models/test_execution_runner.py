@@ -70,7 +70,7 @@ class TestRunCrew:
              patch('src.core.llm_manager.LLMManager') as mock_llm_manager, \
              patch('src.services.api_keys_service.ApiKeysService') as mock_api_keys, \
              patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread, \
-             patch('src.engines.crewai.tools.mcp_handler.stop_all_adapters', new_callable=AsyncMock) as mock_stop_adapters, \
+             patch('src.engines.crewai.tools.mcp_handler.release_mcp_adapters', new_callable=AsyncMock) as mock_release_adapters, \
              patch('src.engines.crewai.execution_runner.update_execution_status_with_retry', new_callable=AsyncMock) as mock_update_status:
             
             # Setup mocks
@@ -86,7 +86,7 @@ class TestRunCrew:
             mock_api_keys.setup_gemini_api_key = AsyncMock()
             mock_to_thread.return_value = "crew execution result"
             mock_update_status.return_value = True
-            mock_stop_adapters.return_value = None
+            mock_release_adapters.return_value = None
             
             # Setup crew agents with LLM attributes
             for agent in sample_crew.agents:
@@ -127,7 +127,7 @@ class TestRunCrew:
              patch('src.engines.crewai.callbacks.streaming_callbacks.EventStreamingCallback') as mock_event_streaming, \
              patch('src.services.api_keys_service.ApiKeysService') as mock_api_keys, \
              patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread, \
-             patch('src.engines.crewai.tools.mcp_handler.stop_all_adapters', new_callable=AsyncMock) as mock_stop_adapters, \
+             patch('src.engines.crewai.tools.mcp_handler.release_mcp_adapters', new_callable=AsyncMock) as mock_release_adapters, \
              patch('src.engines.crewai.execution_runner.update_execution_status_with_retry', new_callable=AsyncMock) as mock_update_status, \
              patch('src.utils.databricks_auth.is_databricks_apps_environment', return_value=False):
             
@@ -144,7 +144,7 @@ class TestRunCrew:
             mock_api_keys.setup_gemini_api_key = AsyncMock()
             mock_to_thread.return_value = "success"
             mock_update_status.return_value = True
-            mock_stop_adapters.return_value = None
+            mock_release_adapters.return_value = None
             
             # Setup crew agents
             for agent in sample_crew.agents:
@@ -156,7 +156,7 @@ class TestRunCrew:
             # Verify cleanup operations
             mock_event_streaming_instance.cleanup.assert_called_once()
             mock_crew_logger.cleanup_for_job.assert_called_once_with(execution_id)
-            mock_stop_adapters.assert_called_once()
+            mock_release_adapters.assert_called_once_with(execution_id)
             
             # Verify job was removed from running_jobs
             assert execution_id not in sample_running_jobs
@@ -170,7 +170,7 @@ class TestRunCrew:
              patch('src.engines.crewai.callbacks.streaming_callbacks.EventStreamingCallback') as mock_event_streaming, \
              patch('src.services.api_keys_service.ApiKeysService') as mock_api_keys, \
              patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread, \
-             patch('src.engines.crewai.tools.mcp_handler.stop_all_adapters', new_callable=AsyncMock) as mock_stop_adapters, \
+             patch('src.engines.crewai.tools.mcp_handler.release_mcp_adapters', new_callable=AsyncMock) as mock_release_adapters, \
              patch('src.engines.crewai.execution_runner.update_execution_status_with_retry', new_callable=AsyncMock) as mock_update_status, \
              patch('src.utils.databricks_auth.is_databricks_apps_environment', return_value=False):
             
@@ -186,7 +186,7 @@ class TestRunCrew:
             mock_api_keys.setup_gemini_api_key = AsyncMock()
             mock_to_thread.return_value = "success"
             mock_update_status.return_value = True
-            mock_stop_adapters.return_value = None
+            mock_release_adapters.return_value = None
             
             # Setup crew agents
             for agent in sample_crew.agents:
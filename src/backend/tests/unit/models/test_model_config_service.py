@@ -599,4 +599,31 @@ class TestModelConfigService:
             await model_config_service.get_model_config("gpt-4")
         
         assert exc_info.value.status_code == 500
-        assert "Failed to get model configuration" in str(exc_info.value.detail)
\ No newline at end of file
+        assert "Failed to get model configuration" in str(exc_info.value.detail)
+
+class TestModelConfigServiceResolutionCache:
+    """Test that model config changes invalidate the model resolution cache."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operation", ["update", "toggle", "delete", "enable_all", "disable_all"])
+    async def test_changes_clear_resolution_cache(self, operation):
+        """Test every write operation drops cached model resolutions."""
+        from src.core.model_resolution_cache import get_model_resolution_cache
+        cache = get_model_resolution_cache()
+        cache.put(("crewai", "gpt-4"), {"params": {"model": "gpt-4"}})
+        repository = AsyncMock()
+        repository.find_all.return_value = []
+        service = ModelConfigService(repository)
+        
+        if operation == "update":
+            await service.update_model_config("gpt-4", {"temperature": 0.1})
+        elif operation == "toggle":
+            await service.toggle_model_enabled("gpt-4", False)
+        elif operation == "delete":
+            await service.delete_model_config("gpt-4")
+        elif operation == "enable_all":
+            await service.enable_all_models()
+        else:
+            await service.disable_all_models()
+        
+        assert cache.get(("crewai", "gpt-4")) is None
@@ -142,6 +142,28 @@ class TestApiKeyRepositoryFindByName:
         mock_async_session.execute.assert_called_once()
 
 
+class TestApiKeyRepositoryFindByNames:
+    """Test cases for find_by_names method."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_names_single_query(self, api_key_repository_async, mock_async_session, sample_api_keys):
+        """Test all requested keys are fetched with one query."""
+        mock_async_session.execute.return_value = MockResult(sample_api_keys[:2])
+
+        result = await api_key_repository_async.find_by_names(["OPENAI_API_KEY", "ANTHROPIC_API_KEY"])
+
+        assert result == sample_api_keys[:2]
+        mock_async_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_names_empty(self, api_key_repository_async, mock_async_session):
+        """Test no query is run for an empty list of names."""
+        result = await api_key_repository_async.find_by_names([])
+
+        assert result == []
+        mock_async_session.execute.assert_not_called()
+
+
 class TestApiKeyRepositoryFindByNameSync:
     """Test cases for find_by_name_sync method."""
     
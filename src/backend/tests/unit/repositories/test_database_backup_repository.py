@@ -6,6 +6,7 @@ Tests the repository for handling database backup operations with Databricks vol
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, mock_open
+import io
 import os
 import sqlite3
 import tempfile
@@ -197,28 +198,27 @@ class TestDatabaseBackupRepository:
         mock_posts_cols = Mock()
         mock_posts_cols.fetchall.return_value = [("id", "integer"), ("title", "text")]
         
-        # Mock data queries
-        mock_users_data = Mock()
-        mock_users_data.fetchall.return_value = [(1, "Alice"), (2, "Bob")]
-        
-        mock_posts_data = Mock()
-        mock_posts_data.fetchall.return_value = [(1, "Post 1"), (2, "Post 2")]
-        
-        # Configure session execute returns
+        # Configure session execute and stream returns
         mock_session.execute.side_effect = [
             mock_tables_result,  # Tables query
             mock_users_cols,     # Users columns
-            mock_users_data,     # Users data
-            mock_posts_cols,     # Posts columns
-            mock_posts_data      # Posts data
+            mock_posts_cols      # Posts columns
+        ]
+        mock_session.stream.side_effect = [
+            _stream_result([(1, "Alice"), (2, "Bob")]),
+            _stream_result([(1, "Post 1"), (2, "Post 2")])
         ]
         
-        # Setup volume repository
+        # Setup volume repository, capturing the uploaded file
+        uploaded = {}
+        
+        async def upload(catalog, schema, volume_name, file_name, local_path):
+            with open(local_path, encoding='utf-8') as f:
+                uploaded["content"] = f.read()
+            return {"success": True, "path": "/volumes/catalog/schema/volume/backup.sql"}
+        
         mock_volume_repo = AsyncMock()
-        mock_volume_repo.upload_file_to_volume.return_value = {
-            "success": True,
-            "path": "/volumes/catalog/schema/volume/backup.sql"
-        }
+        mock_volume_repo.upload_local_file_to_volume.side_effect = upload
         mock_volume_repo_class.return_value = mock_volume_repo
         
         repo = DatabaseBackupRepository()
@@ -240,15 +240,86 @@ class TestDatabaseBackupRepository:
         assert result["table_count"] == 2
         assert result["total_rows"] == 4
         
-        # Verify SQL content was generated
-        upload_call = mock_volume_repo.upload_file_to_volume.call_args
-        sql_content = upload_call[1]["file_content"].decode('utf-8')
+        # Verify SQL content was generated, tables in order
+        sql_content = uploaded["content"]
         
         assert "PostgreSQL database backup" in sql_content
-        assert "INSERT INTO users" in sql_content
+        assert "INSERT INTO users (id, name) VALUES (1, 'Alice');" in sql_content
         assert "INSERT INTO posts" in sql_content
-        assert "'Alice'" in sql_content
         assert "'Bob'" in sql_content
+        assert sql_content.index("-- Table: users") < sql_content.index("-- Table: posts")
+        assert "-- Total rows: 4" in sql_content
+
+    @pytest.mark.asyncio
+    @patch('src.repositories.database_backup_repository.DatabricksVolumeRepository')
+    async def test_list_tables_leaves_out_partitions(self, mock_volume_repo_class):
+        """Test partitions are not listed, their rows are exported through the parent table."""
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_tables_result = Mock()
+        mock_tables_result.fetchall.return_value = [("execution_logs",), ("users",)]
+        mock_session.execute.return_value = mock_tables_result
+
+        repo = DatabaseBackupRepository()
+        tables = await repo._list_tables(mock_session)
+
+        assert tables == ["execution_logs", "users"]
+        query = str(mock_session.execute.call_args.args[0])
+        assert "pg_tables" not in query
+        assert "relkind IN ('r', 'p')" in query
+        assert "NOT c.relispartition" in query
+
+    @pytest.mark.asyncio
+    @patch('src.repositories.database_backup_repository.settings')
+    @patch('src.repositories.database_backup_repository.DatabricksVolumeRepository')
+    async def test_create_postgres_backup_parallel_tables_with_progress(self, mock_volume_repo_class, mock_settings):
+        """Test tables are exported on their own sessions and progress is reported per chunk."""
+        mock_settings.DB_BACKUP_CHUNK_SIZE = 2
+        mock_settings.DB_BACKUP_PARALLEL_TABLES = 2
+        
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_tables_result = Mock()
+        mock_tables_result.fetchall.return_value = [("posts",), ("users",)]
+        mock_session.execute.return_value = mock_tables_result
+        
+        table_sessions = {}
+        
+        def session_factory():
+            table_session = AsyncMock(spec=AsyncSession)
+            cols = Mock()
+            cols.fetchall.return_value = [("id", "integer")]
+            table_session.execute.return_value = cols
+            table_session.stream.side_effect = lambda statement: _stream_result(
+                [(1,), (2,)], [(3,)]
+            )
+            table_session.__aenter__.return_value = table_session
+            table_sessions[len(table_sessions)] = table_session
+            return table_session
+        
+        mock_volume_repo = AsyncMock()
+        mock_volume_repo.upload_local_file_to_volume.return_value = {"success": True, "path": "/p"}
+        mock_volume_repo_class.return_value = mock_volume_repo
+        
+        progress = []
+        repo = DatabaseBackupRepository()
+        result = await repo.create_postgres_backup(
+            session=mock_session,
+            catalog="test_catalog",
+            schema="test_schema",
+            volume_name="test_volume",
+            backup_filename="backup.sql",
+            session_factory=session_factory,
+            progress_callback=progress.append
+        )
+        
+        assert result["success"] is True
+        assert result["total_rows"] == 6
+        assert len(table_sessions) == 2
+        mock_session.stream.assert_not_called()
+        # Two chunks per table plus one completion event per table
+        assert len(progress) == 6
+        assert progress[-1]["tables_done"] == 2
+        assert progress[-1]["total_rows"] == 6
+        assert progress[-1]["table_count"] == 2
     
     @pytest.mark.asyncio
     @patch('src.repositories.database_backup_repository.DatabricksVolumeRepository')
@@ -281,7 +352,9 @@ class TestDatabaseBackupRepository:
                 "test_catalog",
                 "test_schema",
                 "test_volume",
-                "backup.db"
+                "backup.db",
+                session_factory=None,
+                progress_callback=None
             )
             
             assert result["success"] is True
@@ -311,12 +384,13 @@ class TestDatabaseBackupRepository:
         mock_logger.error.assert_called()
     
     @pytest.mark.asyncio
-    @patch('os.unlink')
-    @patch('tempfile.NamedTemporaryFile')
-    @patch('sqlite3.connect')
+    @patch('src.repositories.database_backup_repository.settings')
     @patch('src.repositories.database_backup_repository.DatabricksVolumeRepository')
-    async def test_create_postgres_to_sqlite_backup(self, mock_volume_repo_class, mock_sqlite3_connect, mock_tempfile, mock_unlink):
+    async def test_create_postgres_to_sqlite_backup(self, mock_volume_repo_class, mock_settings):
         """Test creating SQLite backup from PostgreSQL data."""
+        mock_settings.DB_BACKUP_CHUNK_SIZE = 2
+        mock_settings.DB_BACKUP_PARALLEL_TABLES = 4
+        
         # Setup mock session
         mock_session = AsyncMock(spec=AsyncSession)
         
@@ -332,75 +406,146 @@ class TestDatabaseBackupRepository:
             ("active", "boolean", "NO")
         ]
         
-        # Mock data query
-        mock_data_result = Mock()
-        mock_data_result.fetchall.return_value = [(1, "Alice", True)]
-        
         mock_session.execute.side_effect = [
             mock_tables_result,
-            mock_cols_result,
-            mock_data_result
+            mock_cols_result
         ]
+        # Rows arrive in chunks of DB_BACKUP_CHUNK_SIZE
+        mock_session.stream.return_value = _stream_result(
+            [(1, "Alice", True), (2, "Bob", False)],
+            [(3, None, True)]
+        )
         
-        # Setup SQLite mock
-        mock_cursor = Mock()
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_sqlite3_connect.return_value = mock_conn
+        # Setup volume repository, reading back the uploaded database
+        uploaded = {}
         
-        # Setup tempfile mock - properly mock the context manager
-        mock_temp_file = Mock()
-        mock_temp_file.name = "/tmp/test.db"
-        mock_tempfile.return_value.__enter__.return_value = mock_temp_file
-        mock_tempfile.return_value.__exit__.return_value = None
+        async def upload(catalog, schema, volume_name, file_name, local_path):
+            conn = sqlite3.connect(local_path)
+            uploaded["schema"] = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'users'").fetchone()[0]
+            uploaded["rows"] = conn.execute("SELECT id, name, active FROM users ORDER BY id").fetchall()
+            conn.close()
+            uploaded["path"] = local_path
+            return {"success": True, "path": "/volumes/catalog/schema/volume/backup.db"}
         
-        # Setup volume repository
         mock_volume_repo = AsyncMock()
-        mock_volume_repo.upload_file_to_volume.return_value = {
-            "success": True,
-            "path": "/volumes/catalog/schema/volume/backup.db"
-        }
+        mock_volume_repo.upload_local_file_to_volume.side_effect = upload
         mock_volume_repo_class.return_value = mock_volume_repo
         
-        # Mock open for reading temp file with proper context manager
-        mock_file = mock_open(read_data=b'sqlite content')
-        with patch('builtins.open', mock_file):
-            repo = DatabaseBackupRepository()
-            
-            result = await repo._create_postgres_to_sqlite_backup(
-                session=mock_session,
-                catalog="test_catalog",
-                schema="test_schema",
-                volume_name="test_volume",
-                backup_filename="backup.db"
-            )
+        repo = DatabaseBackupRepository()
+        
+        result = await repo._create_postgres_to_sqlite_backup(
+            session=mock_session,
+            catalog="test_catalog",
+            schema="test_schema",
+            volume_name="test_volume",
+            backup_filename="backup.db"
+        )
         
         # Assert
         assert result["success"] is True
         assert result["database_type"] == "sqlite"
         assert result["source_type"] == "postgres"
         assert result["table_count"] == 1
-        assert result["total_rows"] == 1
+        assert result["total_rows"] == 3
         
-        # Verify SQLite operations
-        mock_cursor.execute.assert_any_call(
-            "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY NOT NULL, name TEXT, active INTEGER NOT NULL)"
+        # Verify SQLite contents: ids are stored as strings in INTEGER columns, booleans as 0/1
+        assert uploaded["schema"] == (
+            "CREATE TABLE users (id INTEGER PRIMARY KEY NOT NULL, name TEXT, active INTEGER NOT NULL)"
         )
-        mock_cursor.execute.assert_any_call(
-            "INSERT INTO users (id, name, active) VALUES (?, ?, ?)",
-            ['1', 'Alice', 1]  # Note: id is converted to string, boolean True is converted to 1
+        assert uploaded["rows"] == [(1, "Alice", 1), (2, "Bob", 0), (3, None, 1)]
+        
+        # Verify the temporary file was removed after the upload
+        assert not os.path.exists(uploaded["path"])
+    
+    def test_iter_sql_statements(self):
+        """Test SQL dump splitting keeps semicolons inside strings."""
+        sql_content = (
+            "-- header\n"
+            "SET lock_timeout = 0;\n"
+            "\n"
+            "INSERT INTO notes (id, body) VALUES (1, 'a; b');\n"
+            "INSERT INTO notes (id, body) VALUES (2, 'multi\n"
+            "line;');\n"
         )
-        mock_conn.commit.assert_called()
-        mock_conn.close.assert_called()
         
-        # Verify file operations
-        mock_unlink.assert_called_once_with("/tmp/test.db")
+        statements = list(DatabaseBackupRepository._iter_sql_statements(io.StringIO(sql_content)))
         
-        # Verify upload was called with the sqlite content
-        mock_volume_repo.upload_file_to_volume.assert_called_once_with(
-            catalog="test_catalog",
-            schema="test_schema",
-            volume_name="test_volume",
-            file_name="backup.db",
-            file_content=b'sqlite content'
-        )
\ No newline at end of file
+        assert statements == [
+            "SET lock_timeout = 0;",
+            "INSERT INTO notes (id, body) VALUES (1, 'a; b');",
+            "INSERT INTO notes (id, body) VALUES (2, 'multi\nline;');"
+        ]
+    
+    def test_batch_insert_statements(self):
+        """Test runs of row INSERTs into one table are merged up to the batch size."""
+        statements = [
+            "ALTER TABLE notes DISABLE TRIGGER ALL;",
+            "INSERT INTO notes (id, body) VALUES (1, 'a');",
+            "INSERT INTO notes (id, body) VALUES (2, 'b');",
+            "INSERT INTO notes (id, body) VALUES (3, 'c');",
+            "INSERT INTO tags (id) VALUES (1);",
+            "ALTER TABLE notes ENABLE TRIGGER ALL;"
+        ]
+        
+        batches = list(DatabaseBackupRepository._batch_insert_statements(statements, batch_size=2))
+        
+        assert batches == [
+            ("ALTER TABLE notes DISABLE TRIGGER ALL;", None, 0),
+            ("INSERT INTO notes (id, body) VALUES (1, 'a'), (2, 'b');", "notes", 2),
+            ("INSERT INTO notes (id, body) VALUES (3, 'c');", "notes", 1),
+            ("INSERT INTO tags (id) VALUES (1);", "tags", 1),
+            ("ALTER TABLE notes ENABLE TRIGGER ALL;", None, 0)
+        ]
+    
+    @pytest.mark.asyncio
+    @patch('src.repositories.database_backup_repository.settings')
+    @patch('src.repositories.database_backup_repository.DatabricksVolumeRepository')
+    async def test_restore_postgres_backup_streams_dump(self, mock_volume_repo_class, mock_settings):
+        """Test SQL restore reads the downloaded file and inserts rows in batches."""
+        mock_settings.DB_BACKUP_CHUNK_SIZE = 2
+        mock_session = AsyncMock(spec=AsyncSession)
+        downloaded = {}
+        
+        async def download(catalog, schema, volume_name, file_name, local_path):
+            downloaded["path"] = local_path
+            with open(local_path, 'w', encoding='utf-8') as f:
+                f.write(
+                    "-- PostgreSQL database backup\n"
+                    "DELETE FROM users;\n"
+                    "INSERT INTO users (id, name) VALUES (1, 'Alice');\n"
+                    "INSERT INTO users (id, name) VALUES (2, 'Bob');\n"
+                    "INSERT INTO users (id, name) VALUES (3, 'Carol');\n"
+                )
+            return {"success": True, "path": "/Volumes/c/s/v/backup.sql", "size": 0}
+        
+        mock_volume_repo = AsyncMock()
+        mock_volume_repo.download_file_from_volume_to_local.side_effect = download
+        mock_volume_repo_class.return_value = mock_volume_repo
+        
+        repo = DatabaseBackupRepository()
+        result = await repo.restore_postgres_backup(mock_session, "c", "s", "v", "backup.sql")
+        
+        assert result["success"] is True
+        assert result["restored_tables"] == ["users"]
+        assert result["total_rows"] == 3
+        executed = [str(c.args[0]) for c in mock_session.execute.await_args_list]
+        assert executed == [
+            "DELETE FROM users;",
+            "INSERT INTO users (id, name) VALUES (1, 'Alice'), (2, 'Bob');",
+            "INSERT INTO users (id, name) VALUES (3, 'Carol');"
+        ]
+        mock_session.commit.assert_awaited_once()
+        mock_volume_repo.download_file_from_volume.assert_not_called()
+        assert not os.path.exists(downloaded["path"])
+
+
+def _stream_result(*chunks):
+    """Build a mock streamed result yielding the given row chunks from partitions()."""
+    result = Mock()
+    
+    async def partitions(size=None):
+        for chunk in chunks:
+            yield list(chunk)
+    
+    result.partitions = partitions
+    return result
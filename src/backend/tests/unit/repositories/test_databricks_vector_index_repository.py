@@ -60,8 +60,8 @@ class TestDatabricksVectorIndexRepository:
         with patch.object(repository, '_get_auth_token', new_callable=AsyncMock) as mock_get_auth:
             mock_get_auth.return_value = mock_auth_token
             
-            # Mock aiohttp session - patch the entire async with context
-            with patch('src.repositories.databricks_vector_index_repository.aiohttp') as mock_aiohttp:
+            # Mock the pooled HTTP session - patch the entire async with context
+            with patch('src.repositories.databricks_vector_index_repository.get_http_client_pool') as mock_get_pool:
                 # Create the response mock
                 mock_response = AsyncMock()
                 mock_response.status = 200
@@ -76,11 +76,11 @@ class TestDatabricksVectorIndexRepository:
                 mock_post_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.post = MagicMock(return_value=mock_post_cm)
                 
-                # Mock ClientSession to return a context manager
+                # Mock the pooled client to return a context manager
                 mock_session_cm = MagicMock()
                 mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-                mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_cm)
+                mock_get_pool.return_value.client = MagicMock(return_value=mock_session_cm)
                 
                 # Act
                 result = await repository.similarity_search(
@@ -131,8 +131,8 @@ class TestDatabricksVectorIndexRepository:
         with patch.object(repository, '_get_auth_token', new_callable=AsyncMock) as mock_get_auth:
             mock_get_auth.return_value = mock_auth_token
             
-            # Mock aiohttp session
-            with patch('src.repositories.databricks_vector_index_repository.aiohttp') as mock_aiohttp:
+            # Mock the pooled HTTP session
+            with patch('src.repositories.databricks_vector_index_repository.get_http_client_pool') as mock_get_pool:
                 # Create the response mock
                 mock_response = AsyncMock()
                 mock_response.status = 200
@@ -147,11 +147,11 @@ class TestDatabricksVectorIndexRepository:
                 mock_post_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.post = MagicMock(return_value=mock_post_cm)
                 
-                # Mock ClientSession to return a context manager
+                # Mock the pooled client to return a context manager
                 mock_session_cm = MagicMock()
                 mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-                mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_cm)
+                mock_get_pool.return_value.client = MagicMock(return_value=mock_session_cm)
                 
                 # Act
                 result = await repository.similarity_search(
@@ -187,8 +187,8 @@ class TestDatabricksVectorIndexRepository:
         with patch.object(repository, '_get_auth_token', new_callable=AsyncMock) as mock_get_auth:
             mock_get_auth.return_value = mock_auth_token
             
-            # Mock aiohttp session with error
-            with patch('src.repositories.databricks_vector_index_repository.aiohttp') as mock_aiohttp:
+            # Mock the pooled HTTP session with error
+            with patch('src.repositories.databricks_vector_index_repository.get_http_client_pool') as mock_get_pool:
                 # Create the response mock with error
                 mock_response = AsyncMock()
                 mock_response.status = 500
@@ -203,11 +203,11 @@ class TestDatabricksVectorIndexRepository:
                 mock_post_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.post = MagicMock(return_value=mock_post_cm)
                 
-                # Mock ClientSession to return a context manager
+                # Mock the pooled client to return a context manager
                 mock_session_cm = MagicMock()
                 mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-                mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_cm)
+                mock_get_pool.return_value.client = MagicMock(return_value=mock_session_cm)
                 
                 # Act
                 result = await repository.similarity_search(
@@ -279,8 +279,8 @@ class TestDatabricksVectorIndexRepository:
         with patch.object(repository, '_get_auth_token', new_callable=AsyncMock) as mock_get_auth:
             mock_get_auth.return_value = mock_auth_token
             
-            # Mock aiohttp session
-            with patch('src.repositories.databricks_vector_index_repository.aiohttp') as mock_aiohttp:
+            # Mock the pooled HTTP session
+            with patch('src.repositories.databricks_vector_index_repository.get_http_client_pool') as mock_get_pool:
                 # Create the response mock
                 mock_response = AsyncMock()
                 mock_response.status = 200
@@ -295,11 +295,11 @@ class TestDatabricksVectorIndexRepository:
                 mock_post_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.post = MagicMock(return_value=mock_post_cm)
                 
-                # Mock ClientSession to return a context manager
+                # Mock the pooled client to return a context manager
                 mock_session_cm = MagicMock()
                 mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-                mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_cm)
+                mock_get_pool.return_value.client = MagicMock(return_value=mock_session_cm)
                 
                 # Act
                 result = await repository.upsert(
@@ -335,8 +335,8 @@ class TestDatabricksVectorIndexRepository:
         with patch.object(repository, '_get_auth_token', new_callable=AsyncMock) as mock_get_auth:
             mock_get_auth.return_value = mock_auth_token
             
-            # Mock aiohttp session
-            with patch('src.repositories.databricks_vector_index_repository.aiohttp') as mock_aiohttp:
+            # Mock the pooled HTTP session
+            with patch('src.repositories.databricks_vector_index_repository.get_http_client_pool') as mock_get_pool:
                 # Create the response mock
                 mock_response = AsyncMock()
                 mock_response.status = 204
@@ -350,11 +350,11 @@ class TestDatabricksVectorIndexRepository:
                 mock_post_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.post = MagicMock(return_value=mock_post_cm)
                 
-                # Mock ClientSession to return a context manager
+                # Mock the pooled client to return a context manager
                 mock_session_cm = MagicMock()
                 mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-                mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_cm)
+                mock_get_pool.return_value.client = MagicMock(return_value=mock_session_cm)
                 
                 # Act
                 result = await repository.delete_records(
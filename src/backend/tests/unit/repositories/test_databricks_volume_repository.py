@@ -6,6 +6,7 @@ Tests the repository for interacting with Databricks Unity Catalog Volumes using
 
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
+import io
 import os
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -389,6 +390,34 @@ class TestDatabricksVolumeRepository:
         assert result["success"] is False
         assert "Upload failed" in result["error"]
     
+    @pytest.mark.asyncio
+    async def test_upload_local_file_to_volume_success(self, tmp_path):
+        """Test uploading a local file streams the open file to the Files API."""
+        repo = DatabricksVolumeRepository()
+        local_file = tmp_path / "backup.sql"
+        local_file.write_bytes(b"file content")
+        
+        uploaded = {}
+        
+        def upload(file_path, contents, overwrite):
+            uploaded["path"] = file_path
+            uploaded["content"] = contents.read()
+        
+        mock_client = Mock()
+        mock_client.files.upload.side_effect = upload
+        repo._workspace_client = mock_client
+        
+        with patch.object(repo, '_ensure_client', return_value=True):
+            with patch.object(repo, 'create_volume_if_not_exists', return_value={"success": True}):
+                result = await repo.upload_local_file_to_volume(
+                    "catalog", "schema", "volume", "backup.sql", str(local_file)
+                )
+        
+        assert result["success"] is True
+        assert result["path"] == "/Volumes/catalog/schema/volume/backup.sql"
+        assert result["size"] == len(b"file content")
+        assert uploaded == {"path": "/Volumes/catalog/schema/volume/backup.sql", "content": b"file content"}
+    
     @pytest.mark.asyncio
     async def test_download_file_from_volume_success(self):
         """Test successful file download from volume."""
@@ -417,6 +446,27 @@ class TestDatabricksVolumeRepository:
             "/Volumes/catalog/schema/volume/file.txt"
         )
     
+    @pytest.mark.asyncio
+    async def test_download_file_from_volume_to_local_success(self, tmp_path):
+        """Test downloading a volume file streams it into a local file."""
+        repo = DatabricksVolumeRepository()
+        local_file = tmp_path / "backup.sql"
+        
+        mock_client = Mock()
+        mock_client.files.download.return_value = io.BytesIO(b"file content")
+        repo._workspace_client = mock_client
+        
+        with patch.object(repo, '_ensure_client', return_value=True):
+            result = await repo.download_file_from_volume_to_local(
+                "catalog", "schema", "volume", "backup.sql", str(local_file)
+            )
+        
+        assert result["success"] is True
+        assert result["path"] == "/Volumes/catalog/schema/volume/backup.sql"
+        assert result["size"] == len(b"file content")
+        assert "content" not in result
+        assert local_file.read_bytes() == b"file content"
+    
     @pytest.mark.asyncio
     async def test_download_file_not_found(self):
         """Test download when file doesn't exist."""
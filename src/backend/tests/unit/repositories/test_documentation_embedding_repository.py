@@ -5,6 +5,7 @@ Tests the functionality of documentation embedding repository including
 CRUD operations, search functionality, and similarity operations.
 """
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import List, Dict, Any
 from datetime import datetime
@@ -745,4 +746,159 @@ class TestDocumentationEmbeddingRepositoryIntegration:
                 results = await repository_with_async_session.search_similar(query_embedding, limit=2)
                 
                 assert len(results) == 2
-                assert results == similar_embeddings
\ No newline at end of file
+                assert results == similar_embeddings
+
+class TestSearchSimilarSqliteVectorIndex:
+    """Test SQLite similarity search backed by the NumPy vector index."""
+
+    @pytest_asyncio.fixture
+    async def sqlite_session(self):
+        """Create an in-memory SQLite session with the documentation table."""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(DocumentationEmbedding.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            yield session
+        await engine.dispose()
+
+    @pytest.fixture
+    def index(self):
+        """Use a non-persistent index for the repository."""
+        from src.core.vector_index import VectorIndex
+
+        vector_index = VectorIndex()
+        with patch(
+            'src.repositories.documentation_embedding_repository.get_documentation_vector_index',
+            return_value=vector_index,
+        ):
+            yield vector_index
+
+    async def _seed(self, repository):
+        for title, embedding in [("x", [1.0, 0.0, 0.0]), ("xy", [1.0, 1.0, 0.0]), ("z", [0.0, 0.0, 1.0])]:
+            await repository.create(MockDocumentationEmbeddingCreate(title=title, embedding=embedding))
+        await repository.db.commit()
+
+    @pytest.mark.asyncio
+    async def test_search_builds_index_and_orders_by_similarity(self, sqlite_session, index):
+        """Test that the first search builds the index and returns rows most similar first."""
+        repository = DocumentationEmbeddingRepository(sqlite_session)
+        await self._seed(repository)
+
+        results = await repository._search_similar_sqlite([1.0, 0.1, 0.0], limit=5)
+
+        assert index.loaded
+        assert len(index) == 3
+        # The orthogonal document has zero similarity and is excluded
+        assert [doc.title for doc in results] == ["x", "xy"]
+        assert results[0].embedding == []
+
+    @pytest.mark.asyncio
+    async def test_search_reflects_update_and_delete(self, sqlite_session, index):
+        """Test that updates and deletes after loading are applied to the index once committed."""
+        repository = DocumentationEmbeddingRepository(sqlite_session)
+        await self._seed(repository)
+        await repository._search_similar_sqlite([1.0, 0.0, 0.0], limit=5)
+
+        z_doc = (await repository.search_by_title("z"))[0]
+        await repository.update(z_doc.id, {"embedding": [1.0, 0.0, 0.0]})
+        x_doc = [doc for doc in await repository.search_by_title("x") if doc.title == "x"][0]
+        await repository.delete(x_doc.id)
+        await sqlite_session.flush()
+
+        assert len(index) == 3
+        await sqlite_session.commit()
+        results = await repository._search_similar_sqlite([1.0, 0.0, 0.0], limit=1)
+
+        assert len(index) == 2
+        assert [doc.title for doc in results] == ["z"]
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_changes_are_not_applied(self, sqlite_session, index):
+        """Test that writes of a rolled back transaction never reach the index."""
+        repository = DocumentationEmbeddingRepository(sqlite_session)
+        await self._seed(repository)
+        await repository._search_similar_sqlite([1.0, 0.0, 0.0], limit=5)
+
+        z_doc = (await repository.search_by_title("z"))[0]
+        await repository.update(z_doc.id, {"embedding": [1.0, 0.0, 0.0]})
+        await repository.create(MockDocumentationEmbeddingCreate(title="new", embedding=[1.0, 0.0, 0.0]))
+        await sqlite_session.rollback()
+        await sqlite_session.commit()
+
+        results = await repository._search_similar_sqlite([1.0, 0.0, 0.0], limit=1)
+
+        assert len(index) == 3
+        assert [doc.title for doc in results] == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_index_loaded_from_uncommitted_rows_is_reset_on_rollback(self, sqlite_session, index):
+        """Test that an index built while the session had uncommitted writes is dropped on rollback."""
+        repository = DocumentationEmbeddingRepository(sqlite_session)
+        await self._seed(repository)
+        await repository.create(MockDocumentationEmbeddingCreate(title="new", embedding=[0.0, 1.0, 0.0]))
+        await repository._search_similar_sqlite([0.0, 1.0, 0.0], limit=1)
+        assert len(index) == 4
+
+        await sqlite_session.rollback()
+
+        assert not index.loaded
+        results = await repository._search_similar_sqlite([0.0, 1.0, 0.0], limit=1)
+        assert len(index) == 3
+        assert [doc.title for doc in results] == ["xy"]
+
+    @pytest.mark.asyncio
+    async def test_search_uses_matching_sidecar(self, sqlite_session, tmp_path):
+        """Test that a sidecar saved for the same table state is loaded instead of rebuilt."""
+        from src.core.vector_index import VectorIndex
+
+        sidecar = str(tmp_path / "docs_index")
+        first = VectorIndex(sidecar)
+        repository = DocumentationEmbeddingRepository(sqlite_session)
+        with patch(
+            'src.repositories.documentation_embedding_repository.get_documentation_vector_index',
+            return_value=first,
+        ):
+            await self._seed(repository)
+            await repository._search_similar_sqlite([1.0, 0.0, 0.0], limit=1)
+
+        second = VectorIndex(sidecar)
+        with patch(
+            'src.repositories.documentation_embedding_repository.get_documentation_vector_index',
+            return_value=second,
+        ), patch.object(second, 'build') as mock_build:
+            results = await repository._search_similar_sqlite([0.0, 0.0, 1.0], limit=1)
+
+        mock_build.assert_not_called()
+        assert [doc.title for doc in results] == ["z"]
+
+    @pytest.mark.asyncio
+    async def test_search_similar_detects_sqlite_without_session_bind(self, index):
+        """Test sessions that resolve their engine per query are detected as SQLite."""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from sqlalchemy.orm import Session
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(DocumentationEmbedding.__table__.create)
+
+        class RegistryBoundSession(Session):
+            """Session without a fixed bind, like the application's LoopBoundSession."""
+
+            def get_bind(self, mapper=None, clause=None, **kwargs):
+                return engine.sync_engine
+
+        session_factory = async_sessionmaker(sync_session_class=RegistryBoundSession, expire_on_commit=False)
+        try:
+            async with session_factory() as session:
+                repository = DocumentationEmbeddingRepository(session)
+                await self._seed(repository)
+
+                assert session.bind is None
+                assert await repository._get_database_type() == "sqlite"
+                results = await repository.search_similar([0.0, 0.0, 1.0], limit=1)
+                assert [doc.title for doc in results] == ["z"]
+        finally:
+            await engine.dispose()
@@ -5,6 +5,7 @@ Tests the functionality of execution logs repository including
 timestamp normalization, session management, group context handling, and error recovery.
 """
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 from typing import List
@@ -587,7 +588,9 @@ class TestExecutionLogsRepositoryManagedSessionMethods:
                     execution_id=execution_id,
                     limit=50,
                     offset=10,
-                    newest_first=True
+                    newest_first=True,
+                    after_id=None,
+                    since=None
                 )
     
     @pytest.mark.asyncio
@@ -767,6 +770,48 @@ class TestExecutionLogsRepositoryGroupMethods:
                     mock_logger.error.assert_called()
 
 
+class TestExecutionLogsRepositoryCreateMany:
+    """Test cases for multi-row inserts."""
+    
+    @pytest.mark.asyncio
+    async def test_create_many_single_statement(self, execution_logs_repository, mock_async_session):
+        """Test that all rows are inserted with one statement and one commit."""
+        aware = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        logs = [
+            {"execution_id": "exec-1", "content": "line 1", "timestamp": aware, "group_id": "group-1"},
+            {"execution_id": "exec-1", "content": "line 2"},
+        ]
+        
+        count = await execution_logs_repository.create_many(mock_async_session, logs)
+        
+        assert count == 2
+        mock_async_session.execute.assert_called_once()
+        mock_async_session.commit.assert_called_once()
+        stmt = mock_async_session.execute.call_args.args[0]
+        params = stmt.compile().params
+        assert params["content_m0"] == "line 1"
+        assert params["content_m1"] == "line 2"
+        assert params["group_id_m0"] == "group-1"
+        assert params["timestamp_m0"].tzinfo is None
+        assert params["timestamp_m1"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, execution_logs_repository, mock_async_session):
+        """Test that an empty batch does not touch the database."""
+        assert await execution_logs_repository.create_many(mock_async_session, []) == 0
+        mock_async_session.execute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_many_rolls_back_on_error(self, execution_logs_repository, mock_async_session):
+        """Test rollback and re-raise when the insert fails."""
+        mock_async_session.execute.side_effect = Exception("DB error")
+        
+        with pytest.raises(Exception, match="DB error"):
+            await execution_logs_repository.create_many(mock_async_session, [{"execution_id": "e", "content": "c"}])
+        
+        mock_async_session.rollback.assert_called_once()
+
+
 class TestExecutionLogsRepositoryIntegration:
     """Integration test cases testing method interactions."""
     
@@ -947,4 +992,45 @@ class TestExecutionLogsRepositoryEdgeCases:
         assert result == 3
         # SQL should be properly escaped
         sql_call = mock_async_session.execute.call_args[0][0]
-        assert execution_id in str(sql_call)
\ No newline at end of file
+        assert execution_id in str(sql_call)
+
+class TestIncrementalLogFetch:
+    """Test after_id/since cursors against a real SQLite table."""
+
+    @pytest_asyncio.fixture
+    async def sqlite_session(self):
+        """Create an in-memory SQLite session with the execution logs table."""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(ExecutionLog.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await ExecutionLogsRepository().create_many(session, [
+                {"execution_id": "exec-1", "content": f"log {i}", "timestamp": datetime(2025, 1, 1, 0, 0, i)}
+                for i in range(5)
+            ] + [{"execution_id": "exec-2", "content": "other", "timestamp": datetime(2025, 1, 1)}])
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_after_id_returns_only_newer_logs_in_id_order(self, sqlite_session):
+        """Test that after_id skips logs already seen."""
+        repository = ExecutionLogsRepository()
+        all_logs = await repository.get_by_execution_id(sqlite_session, "exec-1")
+
+        newer = await repository.get_by_execution_id(sqlite_session, "exec-1", after_id=all_logs[2].id)
+
+        assert [log.content for log in newer] == ["log 3", "log 4"]
+
+    @pytest.mark.asyncio
+    async def test_since_filters_by_timestamp(self, sqlite_session):
+        """Test that since returns logs strictly after the given time."""
+        repository = ExecutionLogsRepository()
+
+        newer = await repository.get_by_execution_id(
+            sqlite_session, "exec-1", since=datetime(2025, 1, 1, 0, 0, 3)
+        )
+
+        assert [log.content for log in newer] == ["log 4"]
@@ -5,6 +5,7 @@ Tests the functionality of the execution repository including
 database operations for execution management.
 """
 import pytest
+import pytest_asyncio
 import uuid
 from datetime import datetime, UTC
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -386,4 +387,74 @@ class TestExecutionRepository:
         # Verify pagination parameters in the query
         # The second call should be the list query with limit and offset
         list_call = mock_session.execute.call_args_list[1][0][0]
-        assert list_call is not None
\ No newline at end of file
+        assert list_call is not None
+
+class TestGetExecutionPage:
+    """Test keyset pagination over a real SQLite table."""
+
+    @pytest_asyncio.fixture
+    async def sqlite_session(self):
+        """Create an in-memory SQLite session with the execution history table."""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(ExecutionHistory.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            yield session
+        await engine.dispose()
+
+    async def _seed(self, session):
+        same_time = datetime(2025, 1, 1, 12, 0, 0)
+        rows = [
+            ExecutionHistory(job_id=f"job-{i}", status="completed", group_id="group-a" if i % 2 else "group-b",
+                             created_at=same_time if i >= 3 else datetime(2025, 1, 1, i), result={"output": "x" * 10},
+                             inputs={"agents_yaml": {"a": {}}})
+            for i in range(6)
+        ]
+        session.add_all(rows)
+        await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_in_order(self, sqlite_session):
+        """Test that following cursors visits every row once, newest first, ties broken by id."""
+        repository = ExecutionRepository(sqlite_session)
+        await self._seed(sqlite_session)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.get_execution_page(limit=2, cursor=cursor)
+            if not page:
+                break
+            seen.extend(row["job_id"] for row in page)
+            cursor = (page[-1]["created_at"], page[-1]["id"])
+
+        assert seen == ["job-5", "job-4", "job-3", "job-2", "job-1", "job-0"]
+
+    @pytest.mark.asyncio
+    async def test_projection_omits_large_columns_unless_requested(self, sqlite_session):
+        """Test that result and inputs are only selected when asked for."""
+        repository = ExecutionRepository(sqlite_session)
+        await self._seed(sqlite_session)
+
+        summary = await repository.get_execution_page(limit=1)
+        full = await repository.get_execution_page(limit=1, include_result=True, include_inputs=True)
+
+        assert "result" not in summary[0] and "inputs" not in summary[0]
+        assert full[0]["result"] == {"output": "x" * 10}
+        assert full[0]["inputs"] == {"agents_yaml": {"a": {}}}
+
+    @pytest.mark.asyncio
+    async def test_group_filter_and_existing_job_ids(self, sqlite_session):
+        """Test group filtering and the lookup of already persisted job IDs."""
+        repository = ExecutionRepository(sqlite_session)
+        await self._seed(sqlite_session)
+
+        page = await repository.get_execution_page(limit=10, group_ids=["group-a"])
+        existing = await repository.get_existing_job_ids(["job-1", "missing"])
+
+        assert [row["job_id"] for row in page] == ["job-5", "job-3", "job-1"]
+        assert existing == ["job-1"]
+        assert await repository.get_existing_job_ids([]) == []
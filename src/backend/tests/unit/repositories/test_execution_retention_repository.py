@@ -0,0 +1,195 @@
+"""
+Unit tests for ExecutionRetentionRepository.
+
+Tests expiry selection, batched deletion and log compaction against an
+in-memory SQLite database.
+"""
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from src.models.billing import LLMUsageBilling
+from src.models.execution_history import ErrorTrace, ExecutionHistory, TaskStatus
+from src.models.execution_logs import ExecutionLog, ExecutionLogArchive
+from src.models.execution_trace import ExecutionTrace
+from src.repositories.execution_logs_repository import unpack_log_lines
+from src.repositories.execution_retention_repository import (
+    ExecutionRetentionRepository,
+    log_partition_name,
+    next_month,
+)
+
+NOW = datetime(2025, 6, 1)
+
+
+@pytest_asyncio.fixture
+async def sqlite_session():
+    """Create an in-memory SQLite session with the execution tables."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tables = [
+        ExecutionHistory.__table__, ExecutionTrace.__table__, TaskStatus.__table__,
+        ErrorTrace.__table__, LLMUsageBilling.__table__, ExecutionLog.__table__,
+        ExecutionLogArchive.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: ExecutionHistory.metadata.create_all(sync_conn, tables=tables))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+async def add_execution(session, job_id, age_days, status="COMPLETED", group_id=None, logs=0):
+    """Add an execution with one trace and ``logs`` log lines."""
+    created_at = NOW - timedelta(days=age_days)
+    session.add(ExecutionHistory(job_id=job_id, status=status, created_at=created_at, group_id=group_id))
+    session.add(ExecutionTrace(
+        job_id=job_id, event_source="agent", event_context="task", event_type="step", created_at=created_at
+    ))
+    for i in range(logs):
+        session.add(ExecutionLog(
+            execution_id=job_id, content=f"{job_id} line {i}",
+            timestamp=created_at + timedelta(seconds=i), group_id=group_id
+        ))
+    await session.commit()
+
+
+async def count(session, model):
+    return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestFindExpiredJobIds:
+    """Test selection of executions outside the retention policy."""
+
+    @pytest.mark.asyncio
+    async def test_cutoff_selects_old_executions_oldest_first(self, sqlite_session):
+        """Test that executions older than the cutoff are returned, oldest first."""
+        await add_execution(sqlite_session, "new", 1)
+        await add_execution(sqlite_session, "old", 40)
+        await add_execution(sqlite_session, "older", 50)
+
+        job_ids = await ExecutionRetentionRepository().find_expired_job_ids(
+            sqlite_session, limit=10, cutoff=NOW - timedelta(days=30)
+        )
+
+        assert job_ids == ["older", "old"]
+
+    @pytest.mark.asyncio
+    async def test_keep_latest_is_per_group(self, sqlite_session):
+        """Test that keep_latest keeps the newest executions of each group."""
+        for i in range(3):
+            await add_execution(sqlite_session, f"a-{i}", i, group_id="a")
+            await add_execution(sqlite_session, f"b-{i}", i, group_id="b")
+
+        job_ids = await ExecutionRetentionRepository().find_expired_job_ids(
+            sqlite_session, limit=10, keep_latest=2
+        )
+
+        assert sorted(job_ids) == ["a-2", "b-2"]
+
+    @pytest.mark.asyncio
+    async def test_skips_active_and_billed_executions(self, sqlite_session):
+        """Test that running executions and executions with billing records are kept."""
+        await add_execution(sqlite_session, "running", 60, status="running")
+        await add_execution(sqlite_session, "billed", 60)
+        await add_execution(sqlite_session, "done", 60)
+        sqlite_session.add(LLMUsageBilling(
+            execution_id="billed", execution_type="crew", model_name="m", model_provider="p"
+        ))
+        await sqlite_session.commit()
+
+        job_ids = await ExecutionRetentionRepository().find_expired_job_ids(
+            sqlite_session, limit=10, cutoff=NOW - timedelta(days=30)
+        )
+
+        assert job_ids == ["done"]
+
+    @pytest.mark.asyncio
+    async def test_group_scoping(self, sqlite_session):
+        """Test group_id and exclude_group_ids restrict the candidates."""
+        await add_execution(sqlite_session, "a", 60, group_id="a")
+        await add_execution(sqlite_session, "b", 60, group_id="b")
+        await add_execution(sqlite_session, "none", 60)
+        repository = ExecutionRetentionRepository()
+        cutoff = NOW - timedelta(days=30)
+
+        scoped = await repository.find_expired_job_ids(sqlite_session, limit=10, cutoff=cutoff, group_id="a")
+        default = await repository.find_expired_job_ids(
+            sqlite_session, limit=10, cutoff=cutoff, exclude_group_ids=["a"]
+        )
+
+        assert scoped == ["a"]
+        assert sorted(default) == ["b", "none"]
+
+
+class TestDeleteExecutions:
+    """Test batched deletion of executions and their data."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_execution_with_traces_logs_and_archive(self, sqlite_session):
+        """Test that all rows of the deleted executions go, in small batches."""
+        await add_execution(sqlite_session, "gone", 60, logs=5)
+        await add_execution(sqlite_session, "kept", 1, logs=2)
+        sqlite_session.add(ExecutionLogArchive(execution_id="gone", content=b"", line_count=0))
+        await sqlite_session.commit()
+
+        counts = await ExecutionRetentionRepository().delete_executions(sqlite_session, ["gone"], batch_size=2)
+
+        assert counts == {"executions": 1, "traces": 1, "logs": 5}
+        assert await count(sqlite_session, ExecutionHistory) == 1
+        assert await count(sqlite_session, ExecutionLog) == 2
+        assert await count(sqlite_session, ExecutionLogArchive) == 0
+
+
+class TestCompaction:
+    """Test rolling up log lines into archives."""
+
+    @pytest.mark.asyncio
+    async def test_compact_execution_archives_and_deletes_lines(self, sqlite_session):
+        """Test that compaction stores all lines in one archive and removes them."""
+        await add_execution(sqlite_session, "old", 30, logs=3)
+        await add_execution(sqlite_session, "new", 0, logs=1)
+        repository = ExecutionRetentionRepository()
+
+        candidates = await repository.find_compactable_execution_ids(sqlite_session, NOW - timedelta(days=7), 10)
+        compacted = await repository.compact_execution(sqlite_session, "old")
+
+        assert candidates == ["old"]
+        assert compacted == 3
+        archive = (await sqlite_session.execute(select(ExecutionLogArchive))).scalar_one()
+        assert archive.line_count == 3
+        assert [line["content"] for line in unpack_log_lines(archive.content)] == [
+            "old line 0", "old line 1", "old line 2"
+        ]
+        assert await count(sqlite_session, ExecutionLog) == 1
+        assert await repository.find_compactable_execution_ids(sqlite_session, NOW - timedelta(days=7), 10) == []
+
+    @pytest.mark.asyncio
+    async def test_compact_execution_merges_late_lines(self, sqlite_session):
+        """Test that lines written after compaction are merged into the archive."""
+        await add_execution(sqlite_session, "old", 30, logs=2)
+        repository = ExecutionRetentionRepository()
+        await repository.compact_execution(sqlite_session, "old")
+        sqlite_session.add(ExecutionLog(execution_id="old", content="late", timestamp=NOW - timedelta(days=20)))
+        await sqlite_session.commit()
+
+        await repository.compact_execution(sqlite_session, "old")
+
+        archive = (await sqlite_session.execute(select(ExecutionLogArchive))).scalar_one()
+        assert archive.line_count == 3
+        assert unpack_log_lines(archive.content)[-1]["content"] == "late"
+
+
+class TestPartitionNames:
+    """Test monthly partition naming."""
+
+    def test_partition_name_and_next_month(self):
+        """Test names are zero-padded and months roll over the year."""
+        from datetime import date
+
+        assert log_partition_name(date(2025, 3, 1)) == "execution_logs_p202503"
+        assert next_month(date(2025, 12, 1)) == date(2026, 1, 1)
@@ -5,6 +5,7 @@ Tests the functionality of execution trace repository including
 CRUD operations, job lookup, pagination, auto-creation of missing jobs, and error handling.
 """
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Tuple, Optional
@@ -157,6 +158,90 @@ class TestExecutionTraceRepositoryPrivateCreate:
                 mock_logger.error.assert_called()
 
 
+class TestExecutionTraceRepositoryPrivateCreateMany:
+    """Test cases for _create_many method."""
+
+    @staticmethod
+    def _trace(job_id, **overrides):
+        trace = {
+            "job_id": job_id,
+            "event_source": "agent",
+            "event_context": "task",
+            "event_type": "agent_execution",
+            "output": "out",
+            "trace_metadata": {},
+        }
+        trace.update(overrides)
+        return trace
+
+    @pytest.mark.asyncio
+    async def test_create_many_resolves_run_ids_with_one_lookup(self, execution_trace_repository, mock_async_session):
+        """Test that unresolved jobs are looked up once and all traces go into one INSERT."""
+        lookup_result = MagicMock()
+        lookup_result.all.return_value = [("job-1", 11)]
+        mock_async_session.execute.side_effect = [lookup_result, MagicMock()]
+
+        traces = [self._trace("job-1"), self._trace("job-1"), self._trace("job-2", run_id=22)]
+        resolved = await execution_trace_repository._create_many(mock_async_session, traces)
+
+        assert resolved == {"job-1": 11}
+        assert mock_async_session.execute.call_count == 2
+        mock_async_session.commit.assert_called_once()
+        params = mock_async_session.execute.call_args_list[1].args[0].compile().params
+        assert params["run_id_m0"] == 11
+        assert params["run_id_m1"] == 11
+        assert params["run_id_m2"] == 22
+        assert params["created_at_m0"] is not None
+
+    @pytest.mark.asyncio
+    async def test_create_many_auto_creates_missing_jobs(self, execution_trace_repository, mock_async_session):
+        """Test that jobs missing from executionhistory are created in the same transaction."""
+        lookup_result = MagicMock()
+        lookup_result.all.return_value = []
+        mock_async_session.execute.side_effect = [lookup_result, MagicMock()]
+        added = []
+        mock_async_session.add_all = MagicMock(side_effect=added.extend)
+
+        async def assign_ids():
+            for record in added:
+                record.id = 5
+        mock_async_session.flush.side_effect = assign_ids
+
+        resolved = await execution_trace_repository._create_many(mock_async_session, [self._trace("job-new")])
+
+        assert resolved == {"job-new": 5}
+        assert len(added) == 1
+        assert added[0].job_id == "job-new"
+        assert added[0].inputs == {"auto_created": True}
+        mock_async_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_many_skips_lookup_when_run_ids_known(self, execution_trace_repository, mock_async_session):
+        """Test that cached run_ids avoid the executionhistory lookup entirely."""
+        resolved = await execution_trace_repository._create_many(
+            mock_async_session, [self._trace("job-1", run_id=1)]
+        )
+
+        assert resolved == {}
+        mock_async_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, execution_trace_repository, mock_async_session):
+        """Test that an empty batch does not touch the database."""
+        assert await execution_trace_repository._create_many(mock_async_session, []) == {}
+        mock_async_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_rolls_back_on_error(self, execution_trace_repository, mock_async_session):
+        """Test rollback and re-raise when the insert fails."""
+        mock_async_session.execute.side_effect = SQLAlchemyError("Database error")
+
+        with pytest.raises(SQLAlchemyError, match="Database error"):
+            await execution_trace_repository._create_many(mock_async_session, [self._trace("job-1")])
+
+        mock_async_session.rollback.assert_called_once()
+
+
 class TestExecutionTraceRepositoryPrivateGetById:
     """Test cases for _get_by_id method."""
     
@@ -691,7 +776,7 @@ class TestExecutionTraceRepositoryPublicMethods:
                 result = await execution_trace_repository.get_by_run_id(run_id, limit=10, offset=5)
                 
                 assert result == matching_traces
-                mock_get.assert_called_once_with(mock_session, run_id, 10, 5)
+                mock_get.assert_called_once_with(mock_session, run_id, 10, 5, None, None)
     
     @pytest.mark.asyncio
     async def test_get_by_job_id_public(self, execution_trace_repository, sample_execution_traces):
@@ -707,7 +792,7 @@ class TestExecutionTraceRepositoryPublicMethods:
                 result = await execution_trace_repository.get_by_job_id(job_id, limit=20, offset=10)
                 
                 assert result == matching_traces
-                mock_get.assert_called_once_with(mock_session, job_id, 20, 10)
+                mock_get.assert_called_once_with(mock_session, job_id, 20, 10, None, None)
     
     @pytest.mark.asyncio
     async def test_get_all_traces_public(self, execution_trace_repository, sample_execution_traces):
@@ -947,7 +1032,7 @@ class TestExecutionTraceRepositoryEdgeCases:
                 result = await execution_trace_repository.get_by_run_id(run_id, limit=0)
                 
                 assert result == []
-                mock_get.assert_called_once_with(mock_session, run_id, 0, 0)
+                mock_get.assert_called_once_with(mock_session, run_id, 0, 0, None, None)
     
     @pytest.mark.asyncio
     async def test_delete_by_job_id_with_special_characters(self, execution_trace_repository):
@@ -992,4 +1077,46 @@ class TestExecutionTraceRepositoryEdgeCases:
                             # Should NOT override existing run_id
                             create_call_args = mock_create.call_args[0][1]
                             assert create_call_args["run_id"] == 999  # Original value preserved
-                            mock_logger.info.assert_called()  # For job creation logging
\ No newline at end of file
+                            mock_logger.info.assert_called()  # For job creation logging
+
+class TestIncrementalTraceFetch:
+    """Test after_id/since cursors against a real SQLite table."""
+
+    @pytest_asyncio.fixture
+    async def sqlite_session(self):
+        """Create an in-memory SQLite session with execution history and trace tables."""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(ExecutionHistory.__table__.create)
+            await conn.run_sync(ExecutionTrace.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await ExecutionTraceRepository()._create_many(session, [
+                {"job_id": "job-1", "event_source": "agent", "event_context": "task", "event_type": f"event_{i}",
+                 "created_at": datetime(2025, 1, 1, 0, 0, i)}
+                for i in range(4)
+            ])
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_after_id_pages_through_new_traces(self, sqlite_session):
+        """Test that after_id returns newer traces in ID order, page by page."""
+        repository = ExecutionTraceRepository()
+        first = await repository._get_by_job_id(sqlite_session, "job-1", 2, 0, after_id=0)
+        second = await repository._get_by_job_id(sqlite_session, "job-1", 2, 0, after_id=first[-1].id)
+        third = await repository._get_by_job_id(sqlite_session, "job-1", 2, 0, after_id=second[-1].id)
+
+        assert [trace.event_type for trace in first + second] == ["event_0", "event_1", "event_2", "event_3"]
+        assert third == []
+
+    @pytest.mark.asyncio
+    async def test_since_filters_by_creation_time(self, sqlite_session):
+        """Test that since returns traces created strictly later."""
+        repository = ExecutionTraceRepository()
+
+        traces = await repository._get_by_job_id(sqlite_session, "job-1", since=datetime(2025, 1, 1, 0, 0, 1))
+
+        assert sorted(trace.event_type for trace in traces) == ["event_2", "event_3"]
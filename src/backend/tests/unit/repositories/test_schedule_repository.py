@@ -281,6 +281,23 @@ class TestScheduleRepositoryFindByGroup:
         mock_async_session.execute.assert_called_once()
 
 
+class TestScheduleRepositoryFindActive:
+    """Test cases for find_active method."""
+    
+    @pytest.mark.asyncio
+    async def test_find_active_success(self, schedule_repository, mock_async_session, sample_schedules):
+        """Test retrieval of active schedules."""
+        active_schedules = [schedule for schedule in sample_schedules if schedule.is_active]
+        mock_async_session.execute.return_value = MockResult(active_schedules)
+        
+        result = await schedule_repository.find_active()
+        
+        assert result == active_schedules
+        mock_async_session.execute.assert_called_once()
+        query_text = str(mock_async_session.execute.call_args[0][0])
+        assert "is_active" in query_text
+
+
 class TestScheduleRepositoryFindDueSchedules:
     """Test cases for find_due_schedules method."""
     
@@ -238,4 +238,30 @@ async def test_create_crew_general_error(client, mock_crew_generation_service):
         
         # Assert response code and detail
         assert response.status_code == 500
-        assert "Error creating crew" in response.json()["detail"] 
\ No newline at end of file
+        assert "Error creating crew" in response.json()["detail"] 
+
+@pytest.mark.asyncio
+async def test_stream_create_crew(client, mock_crew_generation_service):
+    """Test that the streaming endpoint forwards service events as Server-Sent Events."""
+    async def stream_events(request, group_context):
+        yield {"event": "token", "data": {"text": "{\"agents\": ["}}
+        yield {"event": "agent", "data": {"id": "abc123", "name": "Researcher"}}
+        yield {"event": "complete", "data": {"agents": [{"id": "abc123"}], "tasks": []}}
+    
+    mock_crew_generation_service.stream_crew_complete = MagicMock(side_effect=stream_events)
+    
+    with patch.object(
+        CrewGenerationService,
+        "create",
+        return_value=mock_crew_generation_service
+    ):
+        response = client.post(
+            "/crew/create-crew/stream",
+            json={"prompt": "Create a research crew"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block for block in response.text.split("\n\n") if block]
+        assert events[1] == 'event: agent\ndata: {"id": "abc123", "name": "Researcher"}'
+        assert events[-1].startswith("event: complete")
@@ -294,7 +294,7 @@ class TestGetExecutionLogs:
         data = response.json()
         assert len(data) == 2
         mock_service.get_execution_logs_by_group.assert_called_once_with(
-            execution_id, mock_group_context, 1000, 0
+            execution_id, mock_group_context, 1000, 0, after_id=None, since=None
         )
     
     @patch('src.api.execution_logs_router.execution_logs_service')
@@ -325,7 +325,7 @@ class TestGetExecutionLogs:
         
         assert response.status_code == 200
         mock_service.get_execution_logs_by_group.assert_called_once_with(
-            execution_id, mock_group_context, limit, offset
+            execution_id, mock_group_context, limit, offset, after_id=None, since=None
         )
     
     def test_get_execution_logs_invalid_params(self, client_logs):
@@ -345,6 +345,53 @@ class TestGetExecutionLogs:
         assert response.status_code == 422
 
 
+class TestStreamExecutionUpdates:
+    """Test cases for the Server-Sent Events update stream."""
+    
+    @patch('src.api.execution_logs_router.execution_logs_service')
+    def test_stream_passes_cursors_and_streams_events(self, mock_service, client_logs, mock_group_context):
+        """Test that query cursors reach the service and events are streamed."""
+        async def events():
+            yield "id: 1:0\nevent: trace\ndata: {}\n\n"
+        
+        mock_service.stream_execution_updates = MagicMock(return_value=events())
+        
+        response = client_logs.get("/logs/executions/exec-123/events?after_trace_id=3&after_log_id=7")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: trace" in response.text
+        call = mock_service.stream_execution_updates.call_args
+        assert call.args == ("exec-123", mock_group_context)
+        assert call.kwargs["after_trace_id"] == 3
+        assert call.kwargs["after_log_id"] == 7
+    
+    @patch('src.api.execution_logs_router.execution_logs_service')
+    def test_last_event_id_overrides_query_cursors(self, mock_service, client_logs):
+        """Test that a reconnecting client resumes from Last-Event-ID."""
+        async def events():
+            return
+            yield
+        
+        mock_service.stream_execution_updates = MagicMock(return_value=events())
+        
+        response = client_logs.get(
+            "/logs/executions/exec-123/events?after_trace_id=3",
+            headers={"Last-Event-ID": "10:20"}
+        )
+        
+        assert response.status_code == 200
+        call = mock_service.stream_execution_updates.call_args
+        assert (call.kwargs["after_trace_id"], call.kwargs["after_log_id"]) == (10, 20)
+    
+    @patch('src.api.execution_logs_router.execution_logs_service')
+    def test_invalid_last_event_id(self, mock_service, client_logs):
+        """Test that a malformed Last-Event-ID is rejected."""
+        response = client_logs.get("/logs/executions/exec-123/events", headers={"Last-Event-ID": "garbage"})
+        
+        assert response.status_code == 400
+
+
 class TestGetRunLogs:
     """Test cases for get run logs endpoint."""
     
@@ -367,7 +414,7 @@ class TestGetRunLogs:
         assert "logs" in data
         assert len(data["logs"]) == 2
         mock_service.get_execution_logs_by_group.assert_called_once_with(
-            run_id, mock_group_context, 1000, 0
+            run_id, mock_group_context, 1000, 0, after_id=None, since=None
         )
     
     @patch('src.api.execution_logs_router.execution_logs_service')
@@ -398,7 +445,7 @@ class TestGetRunLogs:
         
         assert response.status_code == 200
         mock_service.get_execution_logs_by_group.assert_called_once_with(
-            run_id, mock_group_context, limit, offset
+            run_id, mock_group_context, limit, offset, after_id=None, since=None
         )
 
 
@@ -419,7 +466,7 @@ class TestGetExecutionLogsMain:
         data = response.json()
         assert len(data) == 1
         mock_service.get_execution_logs_by_group.assert_called_once_with(
-            execution_id, mock_group_context, 1000, 0
+            execution_id, mock_group_context, 1000, 0, after_id=None, since=None
         )
     
     @patch('src.api.execution_logs_router.execution_logs_service')
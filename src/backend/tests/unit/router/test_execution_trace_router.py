@@ -485,4 +485,4 @@ class TestExecutionTraceRouter:
             response = client.get("/traces/job/job-123?limit=25&offset=5")
             
             assert response.status_code == 200
-            mock_get_traces.assert_called_once_with(None, "job-123", 25, 5)
\ No newline at end of file
+            mock_get_traces.assert_called_once_with(None, "job-123", 25, 5, after_id=None, since=None)
\ No newline at end of file
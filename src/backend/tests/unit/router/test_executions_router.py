@@ -932,4 +932,41 @@ class TestHealthCheck:
         health_routes = [route for route in routes if 'health' in route]
         
         # Verify health route is defined
-        assert any('health' in route for route in routes), "Health endpoint should be defined in routes"
\ No newline at end of file
+        assert any('health' in route for route in routes), "Health endpoint should be defined in routes"
+
+class TestListExecutionsPageEndpoint:
+    """Test cases for the cursor-paginated executions endpoint."""
+
+    @patch('src.api.executions_router.ExecutionService.list_executions_page')
+    def test_page_returns_items_and_cursor(self, mock_list_page, client, mock_group_context):
+        """Test that the page endpoint passes query parameters and normalises results."""
+        mock_list_page.return_value = {
+            "items": [{"execution_id": "exec-1", "status": "completed", "created_at": datetime.utcnow(),
+                       "result": '{"output": "json"}'}],
+            "next_cursor": "abc",
+        }
+
+        response = client.get("/executions/page?limit=10&cursor=xyz&include_result=true")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] == "abc"
+        assert data["items"][0]["result"] == {"output": "json"}
+        mock_list_page.assert_awaited_once_with(
+            group_ids=["group-123"], limit=10, cursor="xyz", include_result=True, include_inputs=False
+        )
+
+    @patch('src.api.executions_router.ExecutionService.list_executions_page')
+    def test_page_rejects_invalid_cursor(self, mock_list_page, client, mock_group_context):
+        """Test that a malformed cursor is reported as a bad request."""
+        mock_list_page.side_effect = ValueError("Invalid cursor: xyz")
+
+        response = client.get("/executions/page?cursor=xyz")
+
+        assert response.status_code == 400
+
+    def test_page_validates_limit(self, client, mock_group_context):
+        """Test that out-of-range page sizes are rejected."""
+        response = client.get("/executions/page?limit=0")
+
+        assert response.status_code == 422
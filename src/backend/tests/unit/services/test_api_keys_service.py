@@ -747,4 +747,91 @@ class TestApiKeysServiceClassMethods:
         result = await ApiKeysService.from_unit_of_work(mock_uow)
         
         assert isinstance(result, ApiKeysService)
-        assert result.repository == mock_uow.api_key_repository
\ No newline at end of file
+        assert result.repository == mock_uow.api_key_repository
+
+class TestApiKeysServiceCache:
+    """Test cases for the decrypted API key cache."""
+    
+    @pytest.mark.asyncio
+    async def test_get_provider_api_key_served_from_cache(self):
+        """Test repeated provider key lookups hit the database and decrypt only once."""
+        mock_api_key = MockApiKey(name="OPENAI_API_KEY", encrypted_value="encrypted")
+        
+        with patch('src.core.unit_of_work.UnitOfWork') as mock_uow:
+            mock_uow.return_value.__aenter__.return_value = AsyncMock()
+            
+            with patch.object(ApiKeysService, 'from_unit_of_work') as mock_from_uow:
+                mock_service = AsyncMock()
+                mock_service.find_by_name.return_value = mock_api_key
+                mock_from_uow.return_value = mock_service
+                
+                with patch('src.services.api_keys_service.EncryptionUtils.decrypt_value', return_value="decrypted") as mock_decrypt:
+                    first = await ApiKeysService.get_provider_api_key("openai")
+                    second = await ApiKeysService.get_provider_api_key("OpenAI")
+                    value = await ApiKeysService.get_api_key_value("OPENAI_API_KEY")
+        
+        assert first == second == value == "decrypted"
+        mock_service.find_by_name.assert_called_once_with("OPENAI_API_KEY")
+        mock_decrypt.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_missing_key_is_cached(self):
+        """Test lookups of an unset key do not hit the database again."""
+        with patch('src.core.unit_of_work.UnitOfWork') as mock_uow:
+            mock_uow.return_value.__aenter__.return_value = AsyncMock()
+            
+            with patch.object(ApiKeysService, 'from_unit_of_work') as mock_from_uow:
+                mock_service = AsyncMock()
+                mock_service.find_by_name.return_value = None
+                mock_from_uow.return_value = mock_service
+                
+                assert await ApiKeysService.get_provider_api_key("anthropic") is None
+                assert await ApiKeysService.get_provider_api_key("anthropic") is None
+        
+        mock_service.find_by_name.assert_called_once_with("ANTHROPIC_API_KEY")
+    
+    @pytest.mark.asyncio
+    async def test_failed_decryption_is_not_cached(self):
+        """Test an empty decryption result is looked up again next time."""
+        mock_api_key = MockApiKey(name="OPENAI_API_KEY", encrypted_value="encrypted")
+        
+        with patch('src.core.unit_of_work.UnitOfWork') as mock_uow:
+            mock_uow.return_value.__aenter__.return_value = AsyncMock()
+            
+            with patch.object(ApiKeysService, 'from_unit_of_work') as mock_from_uow:
+                mock_service = AsyncMock()
+                mock_service.find_by_name.return_value = mock_api_key
+                mock_from_uow.return_value = mock_service
+                
+                with patch('src.services.api_keys_service.EncryptionUtils.decrypt_value', return_value=""):
+                    await ApiKeysService.get_provider_api_key("openai")
+                    await ApiKeysService.get_provider_api_key("openai")
+        
+        assert mock_service.find_by_name.call_count == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operation", ["create", "update", "delete"])
+    async def test_writes_invalidate_cache(self, operation, api_keys_service_with_repository, mock_repository):
+        """Test create, update and delete drop the cached value for the key."""
+        from src.core.api_key_cache import ApiKeyCache, get_api_key_cache
+        cache = get_api_key_cache()
+        cache.put("OPENAI_API_KEY", "stale")
+        existing_key = MockApiKey(id="key-1", name="OPENAI_API_KEY")
+        mock_repository.find_by_name.return_value = existing_key
+        mock_repository.create.return_value = existing_key
+        mock_repository.update.return_value = existing_key
+        mock_repository.delete.return_value = True
+        
+        with patch('src.services.api_keys_service.EncryptionUtils.encrypt_value', return_value="encrypted"):
+            if operation == "create":
+                await api_keys_service_with_repository.create_api_key(
+                    ApiKeyCreate(name="OPENAI_API_KEY", value="fresh", description="")
+                )
+            elif operation == "update":
+                await api_keys_service_with_repository.update_api_key(
+                    "OPENAI_API_KEY", ApiKeyUpdate(value="fresh")
+                )
+            else:
+                await api_keys_service_with_repository.delete_api_key("OPENAI_API_KEY")
+        
+        assert cache.get("OPENAI_API_KEY") is ApiKeyCache.MISSING
@@ -723,6 +723,31 @@ class TestGetToolDetails:
             assert result[1]["name"] == "Tool2"
             mock_logger.error.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_get_tool_details_skips_cache_after_concurrent_update(self, crew_generation_service, sample_tools):
+        """Test a catalogue loaded while the tools change is not cached."""
+        from src.core.prompt_cache import PromptCache
+
+        cache = PromptCache(ttl_seconds=300, max_rendered=16)
+
+        async def load_during_update():
+            cache.invalidate_tools()
+            response = MagicMock()
+            response.tools = sample_tools
+            return response
+
+        mock_tool_service = AsyncMock()
+        mock_tool_service.get_all_tools = AsyncMock(side_effect=load_during_update)
+
+        with patch('src.services.crew_generation_service.get_prompt_cache', return_value=cache):
+            result = await crew_generation_service._get_tool_details(
+                ["NL2SQL Tool"],
+                mock_tool_service
+            )
+
+        assert result[0]["name"] == "NL2SQLTool"
+        assert cache.get_tools() is None
+
 
 class TestEdgeCases:
     """Test edge cases and error scenarios."""
@@ -788,4 +813,119 @@ class TestEdgeCases:
         assert result["tasks"][0]["agent"] == "agent1"
         assert result["tasks"][0]["assigned_agent"] == "agent1"
         assert result["tasks"][1]["agent"] == "agent1"
-        assert result["tasks"][1]["assigned_agent"] == "agent1"
\ No newline at end of file
+        assert result["tasks"][1]["assigned_agent"] == "agent1"
+
+def _stream_chunks(text, size=7):
+    """Build a streamed litellm completion yielding text in small deltas."""
+    async def stream():
+        for start in range(0, len(text), size):
+            yield {"choices": [{"delta": {"content": text[start:start + size]}}]}
+    return stream()
+
+
+class TestStreamCrewComplete:
+    """Test cases for stream_crew_complete method."""
+    
+    def _setup_repository(self, crew_generation_service):
+        repository = crew_generation_service.crew_generator_repository
+        repository.create_agent = AsyncMock(side_effect=lambda data: MockAgent(id=f"agent-{data['name']}", name=data["name"]))
+        repository.create_task = AsyncMock(
+            side_effect=lambda data, name_to_id, idx=0, index=0: (MockTask(id=f"task-{data['name']}", name=data["name"]), idx)
+        )
+        repository.link_task_dependencies = AsyncMock()
+        repository.delete_crew_entities = AsyncMock()
+        repository.serialize_agent = MagicMock(side_effect=lambda agent: agent.model_dump())
+        repository.serialize_task = MagicMock(side_effect=lambda task: task.model_dump())
+        return repository
+    
+    async def _collect(self, crew_generation_service, request, content, close_after=None):
+        with patch('src.services.crew_generation_service.UnitOfWork'), \
+             patch('src.services.crew_generation_service.ToolService') as mock_tool_service_class, \
+             patch('src.services.crew_generation_service.litellm') as mock_litellm, \
+             patch('src.services.crew_generation_service.LLMManager') as mock_llm_manager, \
+             patch.object(crew_generation_service, '_prepare_prompt_template', AsyncMock(return_value="System message")), \
+             patch.object(crew_generation_service, '_get_relevant_documentation', AsyncMock(return_value="")):
+            mock_tool_service_class.from_unit_of_work = AsyncMock(return_value=AsyncMock())
+            crew_generation_service._get_tool_details = AsyncMock(return_value=[
+                {"id": "1", "name": "NL2SQLTool"}, {"id": "2", "name": "DataVisualizationTool"}
+            ])
+            mock_llm_manager.configure_litellm = AsyncMock(return_value={"model": "test-model"})
+            mock_litellm.acompletion = AsyncMock(return_value=_stream_chunks(content))
+            
+            events = []
+            stream = crew_generation_service.stream_crew_complete(request)
+            async for event in stream:
+                events.append(event)
+                if event["event"] == close_after:
+                    # The consumer goes away, as on a client disconnect
+                    await stream.aclose()
+                    break
+            assert mock_litellm.acompletion.call_args.kwargs["stream"] is True
+            return events
+    
+    @pytest.mark.asyncio
+    async def test_stream_crew_complete_emits_entities_incrementally(self, crew_generation_service,
+                                                                  sample_crew_request, sample_llm_response):
+        """Test that agents and tasks are created and emitted while the response streams."""
+        import json
+        repository = self._setup_repository(crew_generation_service)
+        content = "Here is your crew:\n```json\n" + json.dumps(sample_llm_response) + "\n```"
+        
+        events = await self._collect(crew_generation_service, sample_crew_request, content)
+        kinds = [event["event"] for event in events]
+        
+        # The first agent is emitted before the response has finished streaming
+        first_agent = kinds.index("agent")
+        assert "token" in kinds[first_agent + 1:]
+        assert [e["data"]["name"] for e in events if e["event"] == "agent"] == ["data_analyst", "visualizer"]
+        assert [e["data"]["name"] for e in events if e["event"] == "task"] == ["analyze_data", "create_visualizations"]
+        assert kinds.index("task") > kinds.index("agent")
+        assert kinds[-1] == "complete"
+        assert len(events[-1]["data"]["agents"]) == 2
+        assert len(events[-1]["data"]["tasks"]) == 2
+        
+        # Tool names are converted to IDs before persisting
+        assert repository.create_agent.call_args_list[0].args[0]["tools"] == ["1"]
+        repository.link_task_dependencies.assert_called_once()
+        repository.delete_crew_entities.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_stream_crew_complete_cleans_up_on_error(self, crew_generation_service,
+                                                          sample_crew_request, sample_llm_response):
+        """Test that a failure mid-stream deletes the entities created so far."""
+        import json
+        repository = self._setup_repository(crew_generation_service)
+        repository.create_task.side_effect = Exception("Database error")
+        
+        events = await self._collect(crew_generation_service, sample_crew_request, json.dumps(sample_llm_response))
+        
+        assert events[-1]["event"] == "error"
+        assert "Database error" in events[-1]["data"]["message"]
+        repository.delete_crew_entities.assert_called_once_with(["agent-data_analyst", "agent-visualizer"], [])
+    
+    @pytest.mark.asyncio
+    async def test_stream_crew_complete_cleans_up_when_closed(self, crew_generation_service,
+                                                             sample_crew_request, sample_llm_response):
+        """Test that closing the stream before completion deletes the entities created so far."""
+        import json
+        repository = self._setup_repository(crew_generation_service)
+        
+        events = await self._collect(crew_generation_service, sample_crew_request,
+                                     json.dumps(sample_llm_response), close_after="agent")
+        
+        assert events[-1]["event"] == "agent"
+        repository.delete_crew_entities.assert_called_once_with(["agent-data_analyst"], [])
+        repository.link_task_dependencies.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_stream_crew_complete_missing_tasks(self, crew_generation_service, sample_crew_request,
+                                                     sample_llm_response):
+        """Test that a crew without tasks is reported as an error."""
+        import json
+        self._setup_repository(crew_generation_service)
+        content = json.dumps({"agents": sample_llm_response["agents"], "tasks": []})
+        
+        events = await self._collect(crew_generation_service, sample_crew_request, content)
+        
+        assert events[-1]["event"] == "error"
+        assert "Missing or empty 'tasks' array" in events[-1]["data"]["message"]
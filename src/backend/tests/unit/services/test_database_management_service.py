@@ -141,11 +141,13 @@ class TestDatabaseManagementService:
             mock_now.isoformat.return_value = "2024-01-01T12:00:00"
             mock_datetime.now.return_value = mock_now
             
+            progress_callback = Mock()
             result = await service.export_to_volume(
                 catalog="test_catalog",
                 schema="test_schema",
                 export_format="sql",
-                session=mock_session
+                session=mock_session,
+                progress_callback=progress_callback
             )
         
         # Assert
@@ -159,6 +161,8 @@ class TestDatabaseManagementService:
         call_args = mock_repo.create_postgres_backup.call_args
         assert call_args[1]["export_format"] == "sql"
         assert call_args[1]["session"] == mock_session
+        assert call_args[1]["session_factory"] is mock_session_factory
+        assert call_args[1]["progress_callback"] is progress_callback
     
     @pytest.mark.asyncio
     @patch('src.services.database_management_service.async_session_factory')
@@ -811,7 +811,8 @@ class TestDispatcherService:
             # Should use default model
             dispatcher_service._detect_intent.assert_called_once_with(
                 "find the best hotel", 
-                "databricks-llama-4-maverick"  # Default model
+                "databricks-llama-4-maverick",  # Default model
+                None
             )
 
     @pytest.mark.asyncio
@@ -1053,4 +1054,93 @@ class TestDispatcherService:
         assert len(dispatcher_service.AGENT_KEYWORDS) > 0
         assert len(dispatcher_service.CREW_KEYWORDS) > 0
         assert len(dispatcher_service.EXECUTE_KEYWORDS) > 0
-        assert len(dispatcher_service.CONFIGURE_KEYWORDS) > 0
\ No newline at end of file
+        assert len(dispatcher_service.CONFIGURE_KEYWORDS) > 0
+
+class TestTieredIntentDetection:
+    """Test the fast path and intent cache in front of the LLM."""
+
+    @staticmethod
+    def _llm_patches(intent="generate_task"):
+        return (
+            patch('src.services.dispatcher_service.TemplateService.get_template_content', new_callable=AsyncMock, return_value="template"),
+            patch('src.services.dispatcher_service.LLMManager.configure_litellm', new_callable=AsyncMock, return_value={"model": "test-model"}),
+            patch('src.services.dispatcher_service.litellm.acompletion', new_callable=AsyncMock, return_value={
+                "choices": [{"message": {"content": json.dumps({"intent": intent, "confidence": 0.9})}}]
+            }),
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("message,intent,config_type", [
+        ("execute crew", "execute_crew", None),
+        ("ec", "execute_crew", None),
+        ("change model", "configure_crew", "llm"),
+        ("select tools", "configure_crew", "tools"),
+        ("Create an agent that can analyze data", "generate_agent", None),
+        ("Build a team of agents to handle customer support", "generate_crew", None),
+        ("Create a plan that will get all the news from switzerland", "generate_plan", None),
+    ])
+    async def test_unambiguous_messages_skip_llm(self, dispatcher_service, message, intent, config_type):
+        """Test that unambiguous messages are classified without an LLM call."""
+        template_patch, configure_patch, completion_patch = self._llm_patches()
+        with template_patch, configure_patch, completion_patch as mock_completion:
+            result = await dispatcher_service._detect_intent(message, "test-model")
+
+        mock_completion.assert_not_called()
+        assert result["intent"] == intent
+        assert result["source"].startswith("fast_path")
+        assert result["extracted_info"].get("config_type") == config_type
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_message_goes_to_llm(self, dispatcher_service):
+        """Test that messages with several plausible intents still ask the LLM."""
+        template_patch, configure_patch, completion_patch = self._llm_patches(intent="generate_crew")
+        with template_patch, configure_patch, completion_patch as mock_completion:
+            result = await dispatcher_service._detect_intent(
+                "create a research agent and a writer agent with tasks for each", "test-model"
+            )
+
+        mock_completion.assert_called_once()
+        assert result["intent"] == "generate_crew"
+        assert result["source"] == "llm"
+
+    @pytest.mark.asyncio
+    async def test_llm_decision_cached_per_group(self, dispatcher_service, group_context):
+        """Test that repeated messages reuse the group's LLM decision."""
+        other_group = GroupContext(group_ids=["other_group"], user_id="other", group_email="o@example.com", email_domain="example.com")
+        template_patch, configure_patch, completion_patch = self._llm_patches()
+        with template_patch, configure_patch, completion_patch as mock_completion:
+            first = await dispatcher_service._detect_intent("find the best hotel", "test-model", group_context)
+            second = await dispatcher_service._detect_intent("  Find the  best hotel ", "test-model", group_context)
+            assert mock_completion.call_count == 1
+            await dispatcher_service._detect_intent("find the best hotel", "test-model", other_group)
+            assert mock_completion.call_count == 2
+
+        assert first["source"] == "llm"
+        assert second["source"] == "cache"
+        assert second["intent"] == first["intent"]
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_not_cached(self, dispatcher_service):
+        """Test that semantic fallbacks after LLM errors are not cached."""
+        with patch('src.services.dispatcher_service.TemplateService.get_template_content', new_callable=AsyncMock, return_value="template"), \
+             patch('src.services.dispatcher_service.LLMManager.configure_litellm', new_callable=AsyncMock, return_value={"model": "test-model"}), \
+             patch('src.services.dispatcher_service.litellm.acompletion', new_callable=AsyncMock, side_effect=Exception("LLM error")) as mock_completion:
+            await dispatcher_service._detect_intent("find the best hotel", "test-model")
+            result = await dispatcher_service._detect_intent("find the best hotel", "test-model")
+
+        assert mock_completion.call_count == 2
+        assert result["source"] == "semantic_fallback"
+
+    @pytest.mark.asyncio
+    async def test_metrics_count_tiers(self, dispatcher_service):
+        """Test that each tier's decisions are counted."""
+        before = DispatcherService.get_metrics()["tiers"]
+        template_patch, configure_patch, completion_patch = self._llm_patches()
+        with template_patch, configure_patch, completion_patch:
+            await dispatcher_service._detect_intent("execute crew", "test-model")
+            await dispatcher_service._detect_intent("find the best hotel", "test-model")
+            await dispatcher_service._detect_intent("find the best hotel", "test-model")
+
+        after = DispatcherService.get_metrics()["tiers"]
+        for tier in ("fast_path_rule", "llm", "cache"):
+            assert after.get(tier, 0) - before.get(tier, 0) == 1
@@ -173,12 +173,48 @@ class TestEnqueueLog:
         """Test log enqueueing when queue is full."""
         mock_queue = MagicMock()
         mock_queue.put_nowait.side_effect = queue.Full("Queue is full")
+        mock_queue.put.side_effect = queue.Full("Queue is full")
         mock_get_queue.return_value = mock_queue
         
         result = enqueue_log("test-exec", "test content")
         
         assert result is False
         mock_queue.put_nowait.assert_called_once()
+        # Producer threads wait for the writer before giving up
+        mock_queue.put.assert_called_once()
+    
+    @patch('src.services.execution_logs_queue.get_job_output_queue')
+    def test_enqueue_log_backpressure_waits_for_space(self, mock_get_queue):
+        """Test that a full queue blocks producer threads instead of dropping."""
+        mock_queue = MagicMock()
+        mock_queue.put_nowait.side_effect = queue.Full("Queue is full")
+        mock_get_queue.return_value = mock_queue
+        
+        result = enqueue_log("test-exec", "test content")
+        
+        assert result is True
+        assert mock_queue.put.call_args.kwargs["block"] is True
+    
+    @pytest.mark.asyncio
+    @patch('src.services.execution_logs_queue.get_job_output_queue')
+    async def test_enqueue_log_full_queue_never_blocks_event_loop(self, mock_get_queue):
+        """Test that callers inside an event loop drop instead of blocking."""
+        mock_queue = MagicMock()
+        mock_queue.put_nowait.side_effect = queue.Full("Queue is full")
+        mock_get_queue.return_value = mock_queue
+        
+        result = enqueue_log("test-exec", "test content")
+        
+        assert result is False
+        mock_queue.put.assert_not_called()
+    
+    def test_enqueue_log_notifies_consumer(self):
+        """Test that the registered notifier is called after enqueueing."""
+        notifier = MagicMock()
+        JobOutputQueue().set_notifier(notifier)
+        
+        assert enqueue_log("test-exec", "test content") is True
+        notifier.assert_called_once()
     
     @patch('src.services.execution_logs_queue.get_job_output_queue')
     def test_enqueue_log_general_exception(self, mock_get_queue):
@@ -378,6 +378,8 @@ class TestExecutionLogsService:
             mock_enqueue.return_value = True
             
             await service.broadcast_to_execution(execution_id, message)
+            # Sends happen on the connections' writer tasks
+            await service.flush()
             
             # Verify log was enqueued
             mock_enqueue.assert_called_once()
@@ -426,6 +428,8 @@ class TestExecutionLogsService:
             mock_enqueue.return_value = False
             
             await service.broadcast_to_execution(execution_id, message)
+            # Sends happen on the connections' writer tasks
+            await service.flush()
             
             # Should continue with WebSocket broadcasting despite enqueue failure
             mock_websocket.send_text.assert_called_once()
@@ -447,6 +451,8 @@ class TestExecutionLogsService:
             mock_enqueue.return_value = True
             
             await service.broadcast_to_execution(execution_id, message)
+            # Sends happen on the connections' writer tasks
+            await service.flush()
             
             # Failing connection should be removed
             assert failing_websocket not in service.active_connections[execution_id]
@@ -471,6 +477,8 @@ class TestExecutionLogsService:
             mock_enqueue.return_value = True
             
             await service.broadcast_to_execution(execution_id, message)
+            # Sends happen on the connections' writer tasks
+            await service.flush()
             
             # Good connection should remain, bad should be removed
             assert good_websocket in service.active_connections[execution_id]
@@ -529,7 +537,9 @@ class TestExecutionLogsService:
                 group_id=group_context.primary_group_id,
                 limit=1000,
                 offset=0,
-                include_null_group=True
+                include_null_group=True,
+                after_id=None,
+                since=None
             )
     
     @pytest.mark.asyncio
@@ -553,7 +563,9 @@ class TestExecutionLogsService:
             mock_repo.get_by_execution_id_with_managed_session.assert_called_once_with(
                 execution_id=execution_id,
                 limit=1000,
-                offset=0
+                offset=0,
+                after_id=None,
+                since=None
             )
     
     @pytest.mark.asyncio
@@ -599,6 +611,29 @@ class TestSingletonService:
 class TestLogsWriterLoop:
     """Test cases for logs_writer_loop function."""
     
+    @staticmethod
+    def _make_log(content="Test log", **extra):
+        log_data = {
+            "job_id": "exec-123",
+            "content": content,
+            "timestamp": datetime.now()
+        }
+        log_data.update(extra)
+        return log_data
+    
+    @staticmethod
+    async def _run_writer(job_queue, duration=0.2, **kwargs):
+        """Run the writer against the given queue, then shut it down."""
+        shutdown_event = asyncio.Event()
+        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=job_queue):
+            task = asyncio.create_task(logs_writer_loop(shutdown_event, **kwargs))
+            await asyncio.sleep(duration)
+            shutdown_event.set()
+            job_queue.put_nowait(None)
+            from src.services.execution_logs_queue import JobOutputQueue
+            JobOutputQueue().notify()
+            await asyncio.wait_for(task, timeout=2)
+    
     @pytest.mark.asyncio
     async def test_logs_writer_loop_shutdown_event(self):
         """Test logs writer loop with immediate shutdown."""
@@ -607,7 +642,7 @@ class TestLogsWriterLoop:
         # Mock the queue
         mock_queue = MagicMock()
         mock_queue.qsize.return_value = 0
-        mock_queue.get.side_effect = Empty()
+        mock_queue.get_nowait.side_effect = Empty()
         
         with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
             # Set shutdown event immediately
@@ -615,140 +650,156 @@ class TestLogsWriterLoop:
             
             await logs_writer_loop(shutdown_event)
             
-            # Should exit gracefully without processing
+            # Should exit gracefully without blocking on the queue
             mock_queue.qsize.assert_called()
+            mock_queue.get.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_logs_writer_loop_empty_queue(self):
-        """Test logs writer loop with empty queue."""
-        shutdown_event = asyncio.Event()
+    async def test_logs_writer_loop_empty_queue_does_not_block_loop(self):
+        """An idle writer must not block the event loop."""
+        job_queue = queue.Queue()
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await self._run_writer(job_queue, duration=0.3)
+        finally:
+            ticker_task.cancel()
         
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 0
-        mock_queue.get.side_effect = Empty()
+        # With a blocking get(timeout=0.1) the ticker would only run a few times
+        assert ticks >= 15
+    
+    @pytest.mark.asyncio
+    async def test_logs_writer_loop_bulk_inserts_batch(self):
+        """Queued logs are written with a single multi-row insert."""
+        job_queue = queue.Queue()
+        for i in range(5):
+            job_queue.put_nowait(self._make_log(f"line {i}"))
         
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
-            # Create task and cancel it after short delay
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.1)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        with patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=5)
+            await self._run_writer(job_queue, flush_interval_ms=20)
+        
+        mock_repo.create_many_with_managed_session.assert_awaited_once()
+        rows = mock_repo.create_many_with_managed_session.call_args.args[0]
+        assert [row["content"] for row in rows] == [f"line {i}" for i in range(5)]
+        assert all(row["execution_id"] == "exec-123" for row in rows)
     
     @pytest.mark.asyncio
-    async def test_logs_writer_loop_process_logs(self):
-        """Test logs writer loop processing logs."""
-        shutdown_event = asyncio.Event()
+    async def test_logs_writer_loop_respects_batch_size(self):
+        """Batches are split at the configured batch size."""
+        job_queue = queue.Queue()
+        for i in range(7):
+            job_queue.put_nowait(self._make_log(f"line {i}"))
         
-        # Mock log data
-        log_data = {
-            "job_id": "exec-123",
-            "content": "Test log",
-            "timestamp": datetime.now()
-        }
+        with patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=3)
+            await self._run_writer(job_queue, batch_size=3, flush_interval_ms=20)
         
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = [log_data, Empty()]
-        mock_queue.task_done = MagicMock()
+        sizes = [len(c.args[0]) for c in mock_repo.create_many_with_managed_session.call_args_list]
+        assert sizes == [3, 3, 1]
+    
+    @pytest.mark.asyncio
+    async def test_logs_writer_loop_wakes_up_on_enqueue(self):
+        """Logs enqueued from another thread wake up the idle writer."""
+        import threading
+        from src.services.execution_logs_queue import JobOutputQueue, enqueue_log
+        
+        JobOutputQueue._instance = None
+        JobOutputQueue._queue = None
+        job_queue = JobOutputQueue().get_queue()
+        shutdown_event = asyncio.Event()
         
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            mock_service.create_execution_log.return_value = True
+        with patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=1)
+            task = asyncio.create_task(logs_writer_loop(shutdown_event, flush_interval_ms=10))
+            await asyncio.sleep(0.05)
             
-            # Create task and cancel it after processing
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.2)
-            task.cancel()
+            producer = threading.Thread(target=enqueue_log, args=("exec-1", "from thread"))
+            producer.start()
+            producer.join()
+            await asyncio.sleep(0.1)
             
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+            # Written well before the 1s idle timeout
+            mock_repo.create_many_with_managed_session.assert_awaited_once()
             
-            # Verify log was processed
-            mock_service.create_execution_log.assert_called()
-            mock_queue.task_done.assert_called()
+            shutdown_event.set()
+            JobOutputQueue().notify()
+            await asyncio.wait_for(task, timeout=2)
+        
+        JobOutputQueue._instance = None
+        JobOutputQueue._queue = None
+        assert job_queue.empty()
+    
+    def test_logs_writer_notifier_ignores_closed_loop(self):
+        """A wakeup racing with a closed writer loop is ignored."""
+        from src.services.execution_logs_queue import JobOutputQueue
+        
+        notifiers = []
+        job_queue = queue.Queue()
+        shutdown_event = asyncio.Event()
+        shutdown_event.set()
+        
+        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=job_queue), \
+             patch.object(JobOutputQueue, 'set_notifier', side_effect=notifiers.append):
+            asyncio.run(logs_writer_loop(shutdown_event))
+        
+        # The notifier was registered, then the loop closed before a producer called it
+        notifiers[0]()
     
     @pytest.mark.asyncio
     async def test_logs_writer_loop_process_logs_with_group(self):
-        """Test logs writer loop processing logs with group context."""
-        shutdown_event = asyncio.Event()
+        """Group information is written with each row."""
+        job_queue = queue.Queue()
+        job_queue.put_nowait(self._make_log(group_id="group-456", group_email="test@example.com"))
         
-        # Mock log data with group information
-        log_data = {
-            "job_id": "exec-123",
-            "content": "Test log",
-            "timestamp": datetime.now(),
-            "group_id": "group-456",
-            "group_email": "test@example.com"
-        }
+        with patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=1)
+            await self._run_writer(job_queue, flush_interval_ms=10)
         
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = [log_data, Empty()]
-        mock_queue.task_done = MagicMock()
+        row = mock_repo.create_many_with_managed_session.call_args.args[0][0]
+        assert row["group_id"] == "group-456"
+        assert row["group_email"] == "test@example.com"
+    
+    @pytest.mark.asyncio
+    async def test_logs_writer_loop_bulk_failure_falls_back_to_single_inserts(self):
+        """A failing bulk insert falls back to per-row inserts with group context."""
+        job_queue = queue.Queue()
+        job_queue.put_nowait(self._make_log(group_id="group-456", group_email="test@example.com"))
+        job_queue.put_nowait(self._make_log("second"))
         
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
+        with patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo, \
              patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            mock_service.create_execution_log.return_value = True
-            
-            # Create task and cancel it after processing
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.2)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Verify log was processed with group context
-            call_args = mock_service.create_execution_log.call_args
-            group_context = call_args.kwargs['group_context']
-            assert group_context is not None
-            assert group_context.primary_group_id == "group-456"
-            assert group_context.group_email == "test@example.com"
-    
+            mock_repo.create_many_with_managed_session = AsyncMock(side_effect=Exception("DB error"))
+            mock_service.create_execution_log = AsyncMock(side_effect=[True, False])
+            await self._run_writer(job_queue, flush_interval_ms=10)
+        
+        assert mock_service.create_execution_log.await_count == 2
+        group_context = mock_service.create_execution_log.call_args_list[0].kwargs['group_context']
+        assert group_context.primary_group_id == "group-456"
+        assert group_context.group_email == "test@example.com"
+        assert mock_service.create_execution_log.call_args_list[1].kwargs['group_context'] is None
     
     @pytest.mark.asyncio
-    async def test_logs_writer_loop_log_creation_failure(self):
-        """Test logs writer loop when log creation fails."""
+    async def test_logs_writer_loop_flushes_remaining_logs_on_shutdown(self):
+        """Logs still queued at shutdown are persisted."""
+        job_queue = queue.Queue()
         shutdown_event = asyncio.Event()
+        shutdown_event.set()
+        job_queue.put_nowait(self._make_log())
         
-        log_data = {
-            "job_id": "exec-123",
-            "content": "Test log",
-            "timestamp": datetime.now()
-        }
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = [log_data, Empty()]
-        mock_queue.task_done = MagicMock()
+        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=job_queue), \
+             patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=1)
+            await logs_writer_loop(shutdown_event)
         
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            mock_service.create_execution_log.return_value = False  # Simulate failure
-            
-            # Create task and cancel it after processing
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.2)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should still process the log despite failure
-            mock_service.create_execution_log.assert_called()
+        mock_repo.create_many_with_managed_session.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_logs_writer_loop_exception_handling(self):
@@ -757,7 +808,7 @@ class TestLogsWriterLoop:
         
         mock_queue = MagicMock()
         mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = Exception("Queue error")
+        mock_queue.get_nowait.side_effect = Exception("Queue error")
         
         with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
             # Create task and cancel it after error
@@ -925,30 +976,6 @@ class TestStopLogsWriter:
         finally:
             service_module._logs_writer_task = original_task
     
-    @pytest.mark.asyncio
-    async def test_additional_coverage_scenarios(self):
-        """Test additional scenarios to improve coverage."""
-        # Test logs_writer_loop with failures and empty batches
-        shutdown_event = asyncio.Event()
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 0
-        mock_queue.get.side_effect = Empty()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
-            # Create task and let it run briefly to hit empty batch logic
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.1)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Verify it attempted to get from queue
-            assert mock_queue.get.call_count > 0
-    
     @pytest.mark.asyncio
     async def test_connect_with_group_websocket_send_error(self, execution_logs_service_instance, mock_websocket, group_context):
         """Test connecting with group when websocket send fails."""
@@ -971,200 +998,9 @@ class TestStopLogsWriter:
             assert mock_websocket in service.active_connections[execution_id]
 
 
-class TestLogsWriterLoopAdditionalCoverage:
-    """Additional tests to achieve 100% coverage for logs_writer_loop function."""
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_empty_count_logging(self):
-        """Test logs writer loop logs empty count every 100 checks by mocking behavior."""
-        shutdown_event = asyncio.Event()
-        
-        # We'll simulate hitting the 100-check logging condition
-        # by directly testing the logic path that gets triggered
-        # This tests line 346: logger.debug(f"[logs_writer_loop] Queue empty for {empty_count} consecutive checks")
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue') as mock_get_queue, \
-             patch('src.services.execution_logs_service.logger') as mock_logger:
-            
-            call_count = 0
-            def mock_queue_get(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                if call_count % 100 == 0:
-                    # This will trigger the empty count logging on the 100th call
-                    pass
-                raise Empty()
-            
-            mock_queue = MagicMock()
-            mock_queue.qsize.return_value = 0
-            mock_queue.get.side_effect = mock_queue_get
-            mock_get_queue.return_value = mock_queue
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            
-            # Let it run briefly to trigger some logging
-            await asyncio.sleep(0.5)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Verify the task attempted to process items
-            assert mock_queue.get.call_count >= 1
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_log_creation_failures(self):
-        """Test logs writer loop handles log creation failures correctly."""
-        shutdown_event = asyncio.Event()
-        
-        # Mock multiple log entries with some failures
-        log_data1 = {"job_id": "exec-1", "content": "Log 1", "timestamp": datetime.now()}
-        log_data2 = {"job_id": "exec-2", "content": "Log 2", "timestamp": datetime.now()}
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 2
-        mock_queue.get.side_effect = [log_data1, log_data2, Empty()]
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            # Make first call succeed, second fail
-            mock_service.create_execution_log.side_effect = [True, False]
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.5)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have called create_execution_log twice
-            assert mock_service.create_execution_log.call_count == 2
-            mock_queue.task_done.assert_called()
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_batch_processing_success(self):
-        """Test logs writer loop successful batch processing with no failures."""
-        shutdown_event = asyncio.Event()
-        
-        log_data = {"job_id": "exec-success", "content": "Success log", "timestamp": datetime.now()}
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = [log_data, Empty()]
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            # All logs succeed
-            mock_service.create_execution_log.return_value = True
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.5)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have processed successfully
-            mock_service.create_execution_log.assert_called()
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_exception_in_log_processing(self):
-        """Test logs writer loop handles exceptions during log processing."""
-        shutdown_event = asyncio.Event()
-        
-        log_data = {"job_id": "exec-error", "content": "Error log", "timestamp": datetime.now()}
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        mock_queue.get.side_effect = [log_data, Empty()]
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            # Make create_execution_log raise an exception
-            mock_service.create_execution_log.side_effect = Exception("Database error")
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.5)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have attempted to process despite exception
-            mock_service.create_execution_log.assert_called()
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_unhandled_exception(self):
-        """Test logs writer loop handles unhandled exceptions."""
-        shutdown_event = asyncio.Event()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue') as mock_get_queue:
-            # Make get_job_output_queue raise an exception
-            mock_get_queue.side_effect = Exception("Critical error")
-            
-            # The loop should handle the exception and log it
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.1)
-            
-            # Wait for the task to complete naturally due to the exception
-            try:
-                await task
-            except Exception:
-                pass  # Expected due to our mock
-            
-            # Task should have completed due to exception handling
-
-
 class TestComplexScenarios:
     """Test complex scenarios to improve coverage."""
     
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_all_failure_scenarios(self):
-        """Test various failure scenarios in logs_writer_loop."""
-        shutdown_event = asyncio.Event()
-        
-        # Test scenario with log that has both success and failure
-        log_data1 = {"job_id": "exec-1", "content": "Log 1", "timestamp": datetime.now()}
-        log_data2 = {"job_id": "exec-2", "content": "Log 2", "timestamp": datetime.now()}
-        log_data3 = {"job_id": "exec-3", "content": "Log 3", "timestamp": datetime.now()}
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 3
-        mock_queue.get.side_effect = [log_data1, log_data2, log_data3, Empty()]
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            # Mix of success and failures: success, failure, exception
-            mock_service.create_execution_log.side_effect = [True, False, Exception("DB Error")]
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.7)  # Give more time for processing
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have attempted all three
-            assert mock_service.create_execution_log.call_count == 3
-    
     @pytest.mark.asyncio
     async def test_critical_exception_in_logs_writer_loop(self):
         """Test that unhandled exceptions are caught and logged."""
@@ -1184,109 +1020,6 @@ class TestComplexScenarios:
             except Exception:
                 pass  # Expected
     
-    @pytest.mark.asyncio
-    async def test_shutdown_signal_with_task_done(self):
-        """Test shutdown signal processing with task_done call."""
-        shutdown_event = asyncio.Event()
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 1
-        
-        # Create a more sophisticated mock that will actually process None
-        def queue_get_side_effect(*args, **kwargs):
-            # First call returns None (shutdown signal)
-            # Second call raises Empty to exit loop
-            if not hasattr(queue_get_side_effect, 'call_count'):
-                queue_get_side_effect.call_count = 0
-            queue_get_side_effect.call_count += 1
-            
-            if queue_get_side_effect.call_count == 1:
-                return None  # This should trigger the continue branch (lines 336-337)
-            else:
-                raise Empty()
-        
-        mock_queue.get.side_effect = queue_get_side_effect
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(1.0)  # Give enough time for processing
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Verify that the loop processed the None signal
-            assert mock_queue.get.call_count >= 1
-    
-    @pytest.mark.asyncio 
-    async def test_empty_count_modulo_logging(self):
-        """Test that empty count logging happens every 100 iterations."""
-        shutdown_event = asyncio.Event()
-        
-        # Create a mock that will be called enough times to trigger the % 100 == 0 condition
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 0
-        
-        call_count = 0
-        def mock_get(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # Always raise Empty to simulate empty queue
-            raise Empty()
-        
-        mock_queue.get.side_effect = mock_get
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue):
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            
-            # Let it run long enough to accumulate empty checks
-            await asyncio.sleep(1.5)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have made multiple attempts to get from queue
-            assert mock_queue.get.call_count > 0
-    
-    @pytest.mark.asyncio
-    async def test_batch_processing_success_and_failure_logging(self):
-        """Test both success and failure batch logging paths."""
-        shutdown_event = asyncio.Event()
-        
-        # Create logs that will cause both success and failure
-        log_data1 = {"job_id": "exec-success", "content": "Success", "timestamp": datetime.now()}
-        log_data2 = {"job_id": "exec-fail", "content": "Fail", "timestamp": datetime.now()}
-        
-        mock_queue = MagicMock()
-        mock_queue.qsize.return_value = 2
-        mock_queue.get.side_effect = [log_data1, log_data2, Empty()]
-        mock_queue.task_done = MagicMock()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue', return_value=mock_queue), \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service:
-            
-            # First succeeds, second fails - this should trigger failure logging (lines 382-384, 393)
-            mock_service.create_execution_log.side_effect = [True, False]
-            
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.8)
-            task.cancel()
-            
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            
-            # Should have processed both logs
-            assert mock_service.create_execution_log.call_count == 2
-
-
 class TestStopLogsWriterSpecificCoverage:
     """Target specific missing lines in stop_logs_writer."""
     
@@ -1341,127 +1074,6 @@ class TestStopLogsWriterSpecificCoverage:
 class TestFinalCoverage:
     """Final test class to achieve 100% coverage with simple, targeted tests."""
     
-    @pytest.mark.asyncio
-    async def test_logs_writer_loop_empty_count_line_346(self):
-        """Test line 346: empty count logging."""
-        shutdown_event = asyncio.Event()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue') as mock_get_queue, \
-             patch('src.services.execution_logs_service.logger') as mock_logger:
-            
-            mock_queue = MagicMock()
-            mock_queue.qsize.return_value = 0
-            
-            # Create a counter to control when shutdown happens
-            call_count = 0
-            def mock_get(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                # Set shutdown after exactly 100 calls to hit the modulo condition
-                if call_count == 100:
-                    shutdown_event.set()
-                raise Empty()
-            
-            mock_queue.get.side_effect = mock_get
-            mock_get_queue.return_value = mock_queue
-            
-            # Run the loop until it hits 100 empty checks
-            await logs_writer_loop(shutdown_event)
-            
-            # Should have called the debug log for 100th empty check
-            assert call_count == 100
-            debug_calls = [call for call in mock_logger.debug.call_args_list
-                          if "Queue empty for 100 consecutive checks" in str(call)]
-            assert len(debug_calls) >= 1
-    
-    @pytest.mark.asyncio 
-    async def test_logs_writer_failure_warning_lines_382_384(self):
-        """Test failure warning logging lines 382-384."""
-        shutdown_event = asyncio.Event()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue') as mock_get_queue, \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service, \
-             patch('src.services.execution_logs_service.logger') as mock_logger:
-            
-            mock_queue = MagicMock()
-            mock_queue.qsize.return_value = 1
-            
-            # Create logs that will cause create_execution_log to return False
-            log_data = {
-                "job_id": "test-fail-exec", 
-                "content": "fail content",
-                "timestamp": datetime.now()
-            }
-            
-            # Return one log, then empty to stop
-            mock_queue.get.side_effect = [log_data, Empty()]
-            mock_queue.task_done = MagicMock()
-            mock_get_queue.return_value = mock_queue
-            
-            # Make create_execution_log return False to trigger failure path (lines 382-384)
-            mock_service.create_execution_log.return_value = False
-            
-            # Start and stop quickly to process the failing batch
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.05)  # Let it process the batch
-            shutdown_event.set()
-            await task
-            
-            # Verify specific warning was called for individual log failure (line 383)
-            warning_calls = [call for call in mock_logger.warning.call_args_list
-                           if "❌ Failed to store log" in str(call)]
-            # If individual warning not found, check for batch failure warning
-            if len(warning_calls) == 0:
-                batch_warning_calls = [call for call in mock_logger.warning.call_args_list
-                                     if "processed with" in str(call) and "failures" in str(call)]
-                assert len(batch_warning_calls) >= 1, f"Expected individual failure warning but got: {mock_logger.warning.call_args_list}"
-            else:
-                assert len(warning_calls) >= 1, f"Expected individual failure warning but got: {mock_logger.warning.call_args_list}"
-    
-    @pytest.mark.asyncio
-    async def test_logs_writer_success_debug_line_393(self):
-        """Test success debug logging line 393."""
-        shutdown_event = asyncio.Event()
-        
-        with patch('src.services.execution_logs_service.get_job_output_queue') as mock_get_queue, \
-             patch('src.services.execution_logs_service.execution_logs_service') as mock_service, \
-             patch('src.services.execution_logs_service.logger') as mock_logger:
-            
-            mock_queue = MagicMock()
-            mock_queue.qsize.return_value = 1
-            
-            # Create a log that will succeed  
-            log_data = {
-                "job_id": "test-success-exec", 
-                "content": "success content",
-                "timestamp": datetime.now()
-            }
-            
-            # Return one successful log, then empty to stop
-            mock_queue.get.side_effect = [log_data, Empty()]
-            mock_queue.task_done = MagicMock()
-            mock_get_queue.return_value = mock_queue
-            
-            # Make create_execution_log return True to trigger success path (line 393)
-            mock_service.create_execution_log.return_value = True
-            
-            # Process the successful batch
-            task = asyncio.create_task(logs_writer_loop(shutdown_event))
-            await asyncio.sleep(0.05)  # Let it process the batch
-            shutdown_event.set()
-            await task
-            
-            # Verify success debug was called (line 393)
-            debug_calls = [call for call in mock_logger.debug.call_args_list
-                          if "processed successfully" in str(call)]
-            # If success debug not found, check for batch processing debug messages
-            if len(debug_calls) == 0:
-                batch_debug_calls = [call for call in mock_logger.debug.call_args_list
-                                   if "Processing batch" in str(call) and "logs" in str(call)]
-                assert len(batch_debug_calls) >= 1, f"Expected success debug but got: {mock_logger.debug.call_args_list}"
-            else:
-                assert len(debug_calls) >= 1, f"Expected success debug but got: {mock_logger.debug.call_args_list}"
-    
     @pytest.mark.asyncio
     async def test_stop_logs_writer_starting_log_line_450(self):
         """Test the starting log message line 450."""
@@ -1608,3 +1220,122 @@ class TestFinalCoverage:
         finally:
             service_module._logs_writer_task = original_task
     
+
+
+class TestStreamExecutionUpdates:
+    """Test the Server-Sent Events stream of new traces and logs."""
+
+    @staticmethod
+    def _trace(trace_id):
+        from src.schemas.execution_trace import ExecutionTraceItem
+        return ExecutionTraceItem(id=trace_id, job_id="exec-123", event_type="task_completed")
+
+    @pytest.mark.asyncio
+    async def test_sends_backlog_then_only_new_rows_on_wakeup(self, execution_logs_service_instance, group_context):
+        """Test that rows after the cursors are sent and later wakeups fetch only newer rows."""
+        from src.core.execution_updates import ExecutionUpdateHub
+        from src.schemas.execution_trace import ExecutionTraceResponseByJobId
+
+        service = execution_logs_service_instance
+        hub = ExecutionUpdateHub()
+        trace_batches = [[self._trace(5)], [self._trace(6)]]
+        log_batches = [[MockExecutionLog(id=9, content="hello")], []]
+
+        async def get_traces(db, job_id, limit, offset, after_id=None):
+            return ExecutionTraceResponseByJobId(job_id=job_id, traces=trace_batches.pop(0))
+
+        async def get_logs(*args, **kwargs):
+            return log_batches.pop(0)
+
+        with patch('src.services.execution_logs_service.get_execution_update_hub', return_value=hub), \
+             patch('src.services.execution_trace_service.ExecutionTraceService.get_traces_by_job_id',
+                   side_effect=get_traces) as mock_traces, \
+             patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.get_by_execution_id_and_group_with_managed_session = AsyncMock(side_effect=get_logs)
+            stream = service.stream_execution_updates("exec-123", group_context, after_trace_id=4)
+
+            first = await stream.__anext__()
+            second = await stream.__anext__()
+            hub.publish(["exec-123"], "traces")
+            third = await stream.__anext__()
+            await stream.aclose()
+
+        assert first.startswith("id: 5:0\nevent: trace\n")
+        assert second.startswith("id: 5:9\nevent: log\n")
+        assert json.loads(second.split("data: ", 1)[1])["content"] == "hello"
+        assert third.startswith("id: 6:9\nevent: trace\n")
+        assert [c.kwargs["after_id"] for c in mock_traces.call_args_list] == [4, 5]
+        # The wakeup was for traces only, so logs were not queried again
+        assert mock_repo.get_by_execution_id_and_group_with_managed_session.await_count == 1
+        assert hub.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_sends_keepalive_when_idle(self, execution_logs_service_instance, group_context):
+        """Test that an idle stream emits keep-alive comments."""
+        from src.core.execution_updates import ExecutionUpdateHub
+
+        service = execution_logs_service_instance
+        with patch('src.services.execution_logs_service.get_execution_update_hub', return_value=ExecutionUpdateHub()), \
+             patch('src.services.execution_trace_service.ExecutionTraceService.get_traces_by_job_id',
+                   AsyncMock(return_value=None)), \
+             patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo, \
+             patch('src.config.settings.settings.EXECUTION_STREAM_KEEPALIVE_SECONDS', 0.01):
+            mock_repo.get_by_execution_id_and_group_with_managed_session = AsyncMock(return_value=[])
+            stream = service.stream_execution_updates("exec-123", group_context)
+
+            event = await stream.__anext__()
+            await stream.aclose()
+
+        assert event == ": keep-alive\n\n"
+
+    @pytest.mark.asyncio
+    async def test_flush_publishes_stored_executions(self):
+        """Test that the logs writer notifies the hub after storing a batch."""
+        from src.services.execution_logs_service import _flush_logs_batch
+
+        hub = MagicMock()
+        with patch('src.services.execution_logs_service.get_execution_update_hub', return_value=hub), \
+             patch('src.services.execution_logs_service.execution_logs_repository') as mock_repo:
+            mock_repo.create_many_with_managed_session = AsyncMock(return_value=2)
+            failures = await _flush_logs_batch([
+                {"job_id": "exec-1", "content": "a"},
+                {"job_id": "exec-2", "content": "b"},
+            ])
+
+        assert failures == 0
+        execution_ids, kind = hub.publish.call_args.args
+        assert sorted(execution_ids) == ["exec-1", "exec-2"]
+        assert kind == "logs"
+
+
+class TestBroadcastFanout:
+    """Test that broadcasts are fanned out without waiting on clients."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_returns_before_slow_client_receives(self, execution_logs_service_instance):
+        """Test that a stalled connection does not delay the producer or other connections."""
+        service = execution_logs_service_instance
+        release = asyncio.Event()
+
+        async def stall(text):
+            await release.wait()
+
+        slow = MagicMock()
+        slow.send_text = AsyncMock(side_effect=stall)
+        fast = MagicMock()
+        fast.send_text = AsyncMock()
+        service.active_connections["exec-1"] = {slow, fast}
+
+        with patch('src.services.execution_logs_service.enqueue_log', return_value=True):
+            await asyncio.wait_for(service.broadcast_to_execution("exec-1", "line 1"), 0.5)
+            await asyncio.wait_for(service.broadcast_to_execution("exec-1", "line 2"), 0.5)
+            assert not await service.flush(timeout=0.1)
+
+        contents = [json.loads(call.args[0])["content"] for call in fast.send_text.call_args_list]
+        assert "\n".join(contents).split("\n") == ["line 1", "line 2"]
+        release.set()
+        assert await service.flush(timeout=1.0)
+
+        await service.disconnect(slow, "exec-1")
+        await service.disconnect(fast, "exec-1")
+        assert service._channels == {}
@@ -0,0 +1,172 @@
+"""
+Unit tests for ExecutionRetentionService.
+
+Tests policy resolution, batching and partition maintenance with a mocked repository.
+"""
+import pytest
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.execution_retention_service import ExecutionRetentionService, RetentionPolicy
+
+NOW = datetime(2025, 6, 15)
+
+
+@pytest.fixture
+def mock_settings():
+    """Retention settings with small batches."""
+    with patch("src.services.execution_retention_service.settings") as settings:
+        settings.EXECUTION_RETENTION_ENABLED = True
+        settings.EXECUTION_RETENTION_INTERVAL_SECONDS = 3600
+        settings.EXECUTION_RETENTION_DAYS = 30
+        settings.EXECUTION_RETENTION_MAX_EXECUTIONS = 0
+        settings.EXECUTION_RETENTION_GROUP_POLICIES = {"team-a": {"max_executions": 100}}
+        settings.EXECUTION_LOGS_COMPACT_AFTER_DAYS = 7
+        settings.EXECUTION_RETENTION_BATCH_SIZE = 2
+        settings.EXECUTION_RETENTION_MAX_BATCHES = 10
+        settings.EXECUTION_LOGS_PARTITION_MONTHS_AHEAD = 1
+        settings.DATABASE_URI = "postgresql+asyncpg://localhost/kasal"
+        yield settings
+
+
+@pytest.fixture
+def repository():
+    """Mocked retention repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(repository):
+    """Service using the mocked repository and a dummy session factory."""
+    @asynccontextmanager
+    async def session_factory():
+        yield MagicMock()
+
+    return ExecutionRetentionService(repository=repository, session_factory=session_factory)
+
+
+class TestPolicies:
+    """Test retention policy resolution."""
+
+    def test_default_and_group_policies(self, mock_settings):
+        """Test that the default policy comes first, followed by group overrides."""
+        policies = ExecutionRetentionService.get_policies()
+
+        assert policies == [
+            RetentionPolicy(group_id=None, days=30, max_executions=0),
+            RetentionPolicy(group_id="team-a", days=0, max_executions=100),
+        ]
+
+
+class TestApplyRetention:
+    """Test batched retention."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches_until_exhausted(self, mock_settings, service, repository):
+        """Test that batches repeat while full and group overrides are excluded from the default."""
+        repository.find_expired_job_ids.side_effect = [["a", "b"], ["c"], []]
+        repository.delete_executions.return_value = {"executions": 1, "traces": 2, "logs": 3}
+
+        totals = await service.apply_retention(now=NOW)
+
+        assert totals == {"executions": 2, "traces": 4, "logs": 6}
+        default_call = repository.find_expired_job_ids.call_args_list[0].kwargs
+        assert default_call["cutoff"] == NOW - timedelta(days=30)
+        assert default_call["exclude_group_ids"] == ["team-a"]
+        group_call = repository.find_expired_job_ids.call_args_list[2].kwargs
+        assert group_call["group_id"] == "team-a"
+        assert group_call["keep_latest"] == 100
+        assert group_call["cutoff"] is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_policies_do_nothing(self, mock_settings, service, repository):
+        """Test that a policy without limits selects nothing."""
+        mock_settings.EXECUTION_RETENTION_DAYS = 0
+        mock_settings.EXECUTION_RETENTION_GROUP_POLICIES = {}
+
+        await service.apply_retention(now=NOW)
+
+        repository.find_expired_job_ids.assert_not_called()
+
+
+class TestCompactLogs:
+    """Test log compaction."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_lines_on_partitioned_table(self, mock_settings, service, repository):
+        """Test that lines are left for the partition drop when partitioned."""
+        repository.find_compactable_execution_ids.return_value = ["exec-1"]
+        repository.compact_execution.return_value = 5
+
+        totals = await service.compact_logs(partitioned=True, now=NOW)
+
+        assert totals == {"executions": 1, "lines": 5}
+        repository.compact_execution.assert_awaited_once()
+        assert repository.compact_execution.call_args.kwargs["delete_lines"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_does_not_stop_compaction(self, mock_settings, service, repository):
+        """Test that an error compacting one execution is logged and skipped."""
+        repository.find_compactable_execution_ids.return_value = ["bad", "good"]
+        repository.compact_execution.side_effect = [Exception("boom"), 2]
+
+        totals = await service.compact_logs(now=NOW)
+
+        assert totals == {"executions": 1, "lines": 2}
+
+
+class TestMaintainPartitions:
+    """Test partition creation and dropping."""
+
+    @pytest.mark.asyncio
+    async def test_creates_ahead_and_drops_archived_months(self, mock_settings, service, repository):
+        """Test that upcoming months are created and fully archived old months dropped."""
+        existing = [
+            ("execution_logs_p202504", date(2025, 4, 1)),
+            ("execution_logs_p202505", date(2025, 5, 1)),
+            ("execution_logs_p202506", date(2025, 6, 1)),
+        ]
+        repository.list_log_partitions.return_value = existing
+        repository.create_log_partition.side_effect = ["execution_logs_p202506", "execution_logs_p202507"]
+        repository.partition_has_unarchived_logs.return_value = False
+
+        result = await service.maintain_partitions(now=NOW)
+
+        assert result == {"created": ["execution_logs_p202507"], "dropped": ["execution_logs_p202504", "execution_logs_p202505"]}
+        repository.delete_archived_lines.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_keeps_partitions_with_unarchived_logs(self, mock_settings, service, repository):
+        """Test that a partition holding unarchived logs is not dropped."""
+        repository.list_log_partitions.return_value = [("execution_logs_p202504", date(2025, 4, 1))]
+        repository.create_log_partition.return_value = "execution_logs_p202506"
+        repository.partition_has_unarchived_logs.return_value = True
+
+        result = await service.maintain_partitions(now=NOW)
+
+        assert result["dropped"] == []
+        repository.drop_log_partition.assert_not_called()
+
+
+class TestRunOnce:
+    """Test a full retention pass."""
+
+    @pytest.mark.asyncio
+    async def test_skips_partitions_on_sqlite(self, mock_settings, service, repository):
+        """Test that partition maintenance only runs on partitioned PostgreSQL."""
+        mock_settings.DATABASE_URI = "sqlite+aiosqlite:///./app.db"
+        repository.find_expired_job_ids.return_value = []
+        repository.find_compactable_execution_ids.return_value = []
+
+        results = await service.run_once()
+
+        assert "partitions" not in results
+        repository.is_logs_table_partitioned.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_is_noop_when_disabled(self, mock_settings, service):
+        """Test that no task is started when retention is disabled."""
+        mock_settings.EXECUTION_RETENTION_ENABLED = False
+
+        assert service.start() is None
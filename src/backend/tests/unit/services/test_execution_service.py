@@ -457,3 +457,99 @@ class TestExecutionService:
         # Clean up
         ExecutionService.executions.clear()
 
+
+
+class TestListExecutionsPage:
+    """Test cursor-paginated execution listing."""
+
+    @pytest.fixture
+    def page_repo(self):
+        """Patch the session factory and repository used by list_executions_page."""
+        repo = MagicMock()
+        repo.get_execution_page = AsyncMock()
+        repo.get_existing_job_ids = AsyncMock(return_value=[])
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_cm.__aexit__ = AsyncMock(return_value=None)
+        with patch('src.db.session.async_session_factory', return_value=session_cm), \
+             patch('src.repositories.execution_repository.ExecutionRepository', return_value=repo), \
+             patch.dict(ExecutionService.executions, {}, clear=True):
+            yield repo
+
+    @staticmethod
+    def _row(pk, created_at, **extra):
+        row = {"id": pk, "job_id": f"job-{pk}", "status": "completed", "created_at": created_at,
+               "completed_at": None, "run_name": None, "error": None, "group_email": None}
+        row.update(extra)
+        return row
+
+    def test_cursor_round_trip_and_invalid_cursor(self):
+        """Test that cursors decode to what was encoded and garbage is rejected."""
+        created_at = datetime(2025, 5, 1, 10, 30, 15, 123456)
+        cursor = ExecutionService.encode_execution_cursor(created_at, 42)
+
+        assert ExecutionService.decode_execution_cursor(cursor) == (created_at, 42)
+        with pytest.raises(ValueError):
+            ExecutionService.decode_execution_cursor("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_points_at_last_row(self, page_repo):
+        """Test that an extra fetched row yields a cursor for the last returned row."""
+        rows = [self._row(pk, datetime(2025, 1, pk)) for pk in (3, 2, 1)]
+        page_repo.get_execution_page.return_value = rows
+
+        page = await ExecutionService.list_executions_page(group_ids=["g"], limit=2)
+
+        assert [item["execution_id"] for item in page["items"]] == ["job-3", "job-2"]
+        assert "result" not in page["items"][0] and "inputs" not in page["items"][0]
+        assert ExecutionService.decode_execution_cursor(page["next_cursor"]) == (datetime(2025, 1, 2), 2)
+        assert page_repo.get_execution_page.call_args.kwargs["limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor_and_includes_requested_fields(self, page_repo):
+        """Test the final page and the optional result/inputs fields."""
+        page_repo.get_execution_page.return_value = [
+            self._row(1, datetime(2025, 1, 1), result={"ok": True}, inputs={"tasks_yaml": {"t": {}}})
+        ]
+        cursor = ExecutionService.encode_execution_cursor(datetime(2025, 1, 2), 2)
+
+        page = await ExecutionService.list_executions_page(
+            limit=5, cursor=cursor, include_result=True, include_inputs=True
+        )
+
+        assert page["next_cursor"] is None
+        item = page["items"][0]
+        assert item["result"] == {"ok": True}
+        assert item["tasks_yaml"] == json.dumps({"t": {}})
+        assert page_repo.get_execution_page.call_args.kwargs["cursor"] == (datetime(2025, 1, 2), 2)
+
+    @pytest.mark.asyncio
+    async def test_first_page_merges_unpersisted_memory_executions(self, page_repo):
+        """Test that only in-memory executions missing from the database are prepended."""
+        page_repo.get_execution_page.return_value = [self._row(1, datetime(2025, 1, 1))]
+        page_repo.get_existing_job_ids.return_value = ["persisted"]
+        ExecutionService.executions.update({
+            "job-1": {"status": "running", "group_id": "g"},
+            "persisted": {"status": "running", "group_id": "g"},
+            "fresh": {"status": "running", "group_id": "g", "created_at": datetime(2025, 1, 3), "result": "r"},
+            "other-group": {"status": "running", "group_id": "h"},
+        })
+
+        page = await ExecutionService.list_executions_page(group_ids=["g"], limit=10)
+
+        assert [item["execution_id"] for item in page["items"]] == ["fresh", "job-1"]
+        assert page["items"][1]["status"] == "completed"
+        assert "result" not in page["items"][0]
+        page_repo.get_existing_job_ids.assert_awaited_once_with(["persisted", "fresh"])
+
+    @pytest.mark.asyncio
+    async def test_later_pages_skip_memory_executions(self, page_repo):
+        """Test that in-memory executions are only listed on the first page."""
+        page_repo.get_execution_page.return_value = []
+        ExecutionService.executions["fresh"] = {"status": "running"}
+        cursor = ExecutionService.encode_execution_cursor(datetime(2025, 1, 2), 2)
+
+        page = await ExecutionService.list_executions_page(cursor=cursor)
+
+        assert page == {"items": [], "next_cursor": None}
+        page_repo.get_existing_job_ids.assert_not_awaited()
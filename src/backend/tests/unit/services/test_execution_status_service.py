@@ -254,9 +254,31 @@ class TestExecutionStatusService:
                 status=ExecutionStatus.CANCELLED.value,
                 message="Task cancelled"
             )
-            
+
             assert result is True
-    
+
+    @pytest.mark.asyncio
+    async def test_update_status_terminal_status_evicts_trace_job_cache(self):
+        """Test that finished executions are dropped from the trace writer job cache."""
+        mock_cache = MagicMock()
+        with patch('src.services.execution_status_service.execute_db_operation_with_fresh_engine') as mock_execute, \
+             patch('src.services.execution_status_service.get_trace_job_cache', return_value=mock_cache):
+            mock_execute.return_value = True
+
+            await ExecutionStatusService.update_status(
+                job_id="test-job-123",
+                status=ExecutionStatus.RUNNING.value,
+                message="Running"
+            )
+            mock_cache.evict.assert_not_called()
+
+            await ExecutionStatusService.update_status(
+                job_id="test-job-123",
+                status=ExecutionStatus.COMPLETED.value,
+                message="Done"
+            )
+            mock_cache.evict.assert_called_once_with("test-job-123")
+
     @pytest.mark.asyncio
     async def test_get_status_success(self, mock_execution):
         """Test successful status retrieval."""
@@ -183,7 +183,7 @@ class TestExecutionTraceService:
         assert all(isinstance(trace, ExecutionTraceItem) for trace in result.traces)
         
         mock_execution_trace_repository.get_execution_run_id_by_job_id.assert_called_once_with(job_id)
-        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, 100, 0)
+        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, 100, 0, after_id=None, since=None)
     
     @pytest.mark.asyncio
     async def test_get_traces_by_job_id_execution_not_found(self, mock_execution_trace_repository):
@@ -226,8 +226,8 @@ class TestExecutionTraceService:
         assert traces_with_missing_job_id[0].job_id == job_id
         assert traces_with_missing_job_id[1].job_id == job_id
         
-        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, 100, 0)
-        mock_execution_trace_repository.get_by_run_id.assert_called_once_with(run_id, 100, 0)
+        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, 100, 0, after_id=None, since=None)
+        mock_execution_trace_repository.get_by_run_id.assert_called_once_with(run_id, 100, 0, after_id=None, since=None)
     
     @pytest.mark.asyncio
     async def test_get_traces_by_job_id_sqlalchemy_error(self, mock_execution_trace_repository):
@@ -561,7 +561,7 @@ class TestExecutionTraceService:
         )
         
         assert result is not None
-        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, limit, offset)
+        mock_execution_trace_repository.get_by_job_id.assert_called_once_with(job_id, limit, offset, after_id=None, since=None)
     
     @pytest.mark.asyncio
     async def test_get_all_traces_custom_pagination(self, mock_execution_trace_repository, mock_traces):
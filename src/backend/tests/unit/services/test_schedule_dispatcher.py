@@ -0,0 +1,144 @@
+"""
+Unit tests for ScheduleDispatcher.
+
+Tests the min-heap index of schedule run times and the change notification
+used to wake the scheduler loop.
+"""
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.schedule_dispatcher import ScheduleDispatcher, get_schedule_dispatcher
+
+
+NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_schedule(schedule_id, minutes, is_active=True):
+    """Create a schedule stub due ``minutes`` after NOW (stored naive, as in the database)."""
+    return SimpleNamespace(
+        id=schedule_id,
+        is_active=is_active,
+        next_run_at=(NOW + timedelta(minutes=minutes)).replace(tzinfo=None),
+    )
+
+
+class TestScheduleDispatcherIndex:
+    """Test cases for the heap operations."""
+
+    def test_load_orders_by_next_run_and_skips_inactive(self):
+        """Test load keeps only active schedules with a run time, earliest first."""
+        dispatcher = ScheduleDispatcher()
+        no_run = SimpleNamespace(id=4, is_active=True, next_run_at=None)
+        dispatcher.load([make_schedule(1, 30), make_schedule(2, 5), make_schedule(3, 1, is_active=False), no_run])
+
+        assert len(dispatcher) == 2
+        assert dispatcher.peek() == (NOW + timedelta(minutes=5), 2)
+
+    def test_pop_due_returns_due_schedules_in_order(self):
+        """Test pop_due removes every schedule due at the given time."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.load([make_schedule(1, -1), make_schedule(2, -5), make_schedule(3, 10)])
+
+        assert dispatcher.pop_due(NOW) == [2, 1]
+        assert dispatcher.pop_due(NOW) == []
+        assert dispatcher.peek() == (NOW + timedelta(minutes=10), 3)
+
+    def test_push_reschedules_existing_entry(self):
+        """Test pushing a known schedule replaces its previous run time."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.load([make_schedule(1, 1), make_schedule(2, 10)])
+
+        dispatcher.push(1, (NOW + timedelta(minutes=20)).replace(tzinfo=None))
+
+        assert len(dispatcher) == 2
+        assert dispatcher.pop_due(NOW + timedelta(minutes=15)) == [2]
+        assert dispatcher.peek() == (NOW + timedelta(minutes=20), 1)
+
+    def test_remove_drops_schedule(self):
+        """Test removed schedules are never reported as due."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.load([make_schedule(1, -1), make_schedule(2, -1)])
+
+        dispatcher.remove(1)
+
+        assert dispatcher.pop_due(NOW) == [2]
+        assert dispatcher.peek() is None
+
+    def test_seconds_until_next(self):
+        """Test the delay until the earliest schedule, clamped at zero."""
+        dispatcher = ScheduleDispatcher()
+        assert dispatcher.seconds_until_next(NOW) is None
+
+        dispatcher.load([make_schedule(1, 2)])
+        assert dispatcher.seconds_until_next(NOW) == 120.0
+        assert dispatcher.seconds_until_next(NOW + timedelta(minutes=5)) == 0.0
+
+
+class TestScheduleDispatcherNotification:
+    """Test cases for change notification."""
+
+    def test_take_dirty(self):
+        """Test the dirty flag starts set and is cleared when taken."""
+        dispatcher = ScheduleDispatcher()
+
+        assert dispatcher.take_dirty() is True
+        assert dispatcher.take_dirty() is False
+        dispatcher.notify_changed()
+        assert dispatcher.take_dirty() is True
+
+    def test_notify_before_bind_only_marks_dirty(self):
+        """Test notify_changed is safe before the scheduler loop starts."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.take_dirty()
+
+        dispatcher.notify_changed()
+
+        assert dispatcher.take_dirty() is True
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Test wait returns False when nothing changes."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.bind_loop()
+
+        assert await dispatcher.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_waiter(self):
+        """Test notify_changed wakes a waiting loop immediately."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.bind_loop()
+
+        waiter = asyncio.create_task(dispatcher.wait(10))
+        await asyncio.sleep(0)
+        dispatcher.notify_changed()
+
+        assert await asyncio.wait_for(waiter, 1) is True
+
+    @pytest.mark.asyncio
+    async def test_notify_from_other_thread_wakes_waiter(self):
+        """Test notify_changed can be called from another thread."""
+        dispatcher = ScheduleDispatcher()
+        dispatcher.bind_loop()
+
+        waiter = asyncio.create_task(dispatcher.wait(10))
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=dispatcher.notify_changed)
+        thread.start()
+        thread.join()
+
+        assert await asyncio.wait_for(waiter, 1) is True
+
+    @pytest.mark.asyncio
+    async def test_wait_requires_bind(self):
+        """Test wait fails clearly when the loop was never bound."""
+        with pytest.raises(RuntimeError):
+            await ScheduleDispatcher().wait(0)
+
+    def test_get_schedule_dispatcher_singleton(self):
+        """Test the module-level accessor returns one shared instance."""
+        assert get_schedule_dispatcher() is get_schedule_dispatcher()
@@ -7,11 +7,12 @@ schedule CRUD operations, job management, and scheduler execution.
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch, Mock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status
 
 from src.services.scheduler_service import SchedulerService
+from src.services.schedule_dispatcher import ScheduleDispatcher
 from src.schemas.schedule import ScheduleCreate, ScheduleCreateFromExecution, ScheduleUpdate, ScheduleResponse, ScheduleListResponse, ToggleResponse, CrewConfig
 from src.schemas.scheduler import SchedulerJobCreate, SchedulerJobUpdate, SchedulerJobResponse
 from src.utils.user_context import GroupContext
@@ -543,31 +544,78 @@ class TestSchedulerService:
     
     @pytest.mark.asyncio
     async def test_check_and_run_schedules_no_due_schedules(self, scheduler_service):
-        """Test check_and_run_schedules with no due schedules."""
+        """Test check_and_run_schedules loads active schedules and waits for the next one."""
+        dispatcher = ScheduleDispatcher()
+        future_schedule = MockSchedule(id=1, next_run_at=datetime.utcnow() + timedelta(hours=1))
+        
+        with patch('src.services.scheduler_service.async_session_factory') as mock_session_factory, \
+             patch('src.services.scheduler_service.get_schedule_dispatcher', return_value=dispatcher), \
+             patch.object(dispatcher, 'wait', side_effect=Exception("Break loop")) as mock_wait:
+            
+            mock_session = AsyncMock()
+            mock_session_factory.return_value.__aenter__.return_value = mock_session
+            mock_repo = AsyncMock()
+            mock_repo.find_active.return_value = [future_schedule]
+            
+            with patch('src.services.scheduler_service.ScheduleRepository', return_value=mock_repo), \
+                 patch('asyncio.sleep', side_effect=asyncio.CancelledError):
+                with pytest.raises(asyncio.CancelledError):
+                    await scheduler_service.check_and_run_schedules()
+            
+            mock_repo.find_active.assert_called_once()
+            mock_repo.find_due_schedules.assert_not_called()
+            mock_repo.find_all.assert_not_called()
+            # Sleeps until the schedule is due rather than a fixed interval
+            timeout = mock_wait.call_args[0][0]
+            assert 3500 < timeout <= 3600
+    
+    @pytest.mark.asyncio
+    async def test_check_and_run_schedules_starts_due_schedule(self, scheduler_service):
+        """Test a due schedule is started and re-queued with its next run time."""
+        dispatcher = ScheduleDispatcher()
+        due_schedule = MockSchedule(id=7, next_run_at=datetime.utcnow() - timedelta(seconds=1))
+        next_run = datetime.utcnow() + timedelta(days=1)
+        
         with patch('src.services.scheduler_service.async_session_factory') as mock_session_factory, \
-             patch('asyncio.sleep') as mock_sleep:
+             patch('src.services.scheduler_service.get_schedule_dispatcher', return_value=dispatcher), \
+             patch('src.services.scheduler_service.calculate_next_run_from_last', return_value=next_run), \
+             patch.object(scheduler_service, 'run_schedule_job', new_callable=AsyncMock) as mock_run_job, \
+             patch.object(dispatcher, 'wait', side_effect=asyncio.CancelledError):
             
             mock_session = AsyncMock()
             mock_session_factory.return_value.__aenter__.return_value = mock_session
             mock_repo = AsyncMock()
+            mock_repo.find_active.return_value = [due_schedule]
+            mock_repo.find_due_schedules.return_value = [due_schedule]
             
             with patch('src.services.scheduler_service.ScheduleRepository', return_value=mock_repo):
-                mock_repo.find_due_schedules.return_value = []
-                mock_repo.find_all.return_value = []
-                
-                # Mock sleep to break the infinite loop after first iteration
-                call_count = 0
-                async def mock_sleep_func(seconds):
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count >= 2:  # Break after second call
-                        raise Exception("Break loop")
-                    await asyncio.sleep(0)
-                
-                mock_sleep.side_effect = mock_sleep_func
-                
-                with pytest.raises(Exception, match="Break loop"):
+                with pytest.raises(asyncio.CancelledError):
                     await scheduler_service.check_and_run_schedules()
+                await asyncio.gather(*scheduler_service._running_tasks)
+            
+            mock_run_job.assert_called_once()
+            assert mock_run_job.call_args[0][0] == 7
+            assert due_schedule.next_run_at == next_run
+            mock_session.commit.assert_called_once()
+            assert dispatcher.peek()[1] == 7
+            assert dispatcher.peek()[0].replace(tzinfo=None) == next_run
+    
+    @pytest.mark.asyncio
+    async def test_schedule_changes_notify_dispatcher(self, scheduler_service, mock_schedule):
+        """Test create/update/toggle/delete wake the scheduler loop."""
+        dispatcher = MagicMock()
+        scheduler_service.repository.update.return_value = mock_schedule
+        scheduler_service.repository.delete.return_value = True
+        scheduler_service.repository.toggle_active.return_value = mock_schedule
+        
+        with patch('src.services.scheduler_service.get_schedule_dispatcher', return_value=dispatcher):
+            await scheduler_service.update_schedule(1, ScheduleUpdate(
+                name="updated", cron_expression="0 1 * * *", agents_yaml={}, tasks_yaml={}
+            ))
+            await scheduler_service.toggle_schedule(1)
+            await scheduler_service.delete_schedule(1)
+        
+        assert dispatcher.notify_changed.call_count == 3
     
     @pytest.mark.asyncio
     async def test_create_schedule_exception_handling(self, scheduler_service):
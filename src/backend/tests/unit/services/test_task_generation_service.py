@@ -692,4 +692,46 @@ class TestTaskGenerationService:
         result = task_generation_service.convert_to_task_create(response)
         
         assert isinstance(result, TaskCreate)
-        assert result.tools == ["tool1", "tool2", "tool3"]
\ No newline at end of file
+        assert result.tools == ["tool1", "tool2", "tool3"]
+
+class TestStreamTask:
+    """Test cases for TaskGenerationService.stream_task."""
+    
+    @staticmethod
+    def _stream(text, size=5):
+        async def stream():
+            for start in range(0, len(text), size):
+                yield {"choices": [{"delta": {"content": text[start:start + size]}}]}
+        return stream()
+    
+    @pytest.mark.asyncio
+    async def test_stream_task_success(self, task_generation_service, sample_request, group_context):
+        """Test that fields are emitted while streaming and the processed task is returned last."""
+        content = MOCK_LLM_RESPONSE["choices"][0]["message"]["content"]
+        
+        with patch('src.services.task_generation_service.TemplateService') as mock_template_service, \
+             patch('src.services.task_generation_service.LLMManager') as mock_llm_manager, \
+             patch('src.services.task_generation_service.litellm') as mock_litellm:
+            mock_template_service.get_template_content = AsyncMock(return_value=MOCK_TEMPLATE_CONTENT)
+            mock_llm_manager.configure_litellm = AsyncMock(return_value={"model": "test-model"})
+            mock_litellm.acompletion = AsyncMock(return_value=self._stream(content))
+            
+            events = [event async for event in task_generation_service.stream_task(sample_request, group_context)]
+        
+        fields = [event["data"]["name"] for event in events if event["event"] == "field"]
+        assert fields[:3] == ["name", "description", "expected_output"]
+        assert events[-1]["event"] == "complete"
+        assert events[-1]["data"]["name"] == "Test Task"
+        assert mock_litellm.acompletion.call_args.kwargs["stream"] is True
+        task_generation_service.log_service.create_log.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_stream_task_missing_template(self, task_generation_service, sample_request):
+        """Test that a missing prompt template is reported as an error event."""
+        with patch('src.services.task_generation_service.TemplateService') as mock_template_service:
+            mock_template_service.get_template_content = AsyncMock(return_value=None)
+            
+            events = [event async for event in task_generation_service.stream_task(sample_request)]
+        
+        assert [event["event"] for event in events] == ["error"]
+        assert "generate_task" in events[0]["data"]["message"]
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from typing import List
 
+from src.core.prompt_cache import get_prompt_cache
 from src.services.template_service import TemplateService
 from src.models.template import PromptTemplate
 from src.repositories.template_repository import TemplateRepository
@@ -569,4 +570,34 @@ class TestTemplateServiceGetContent:
                         result = await TemplateService.get_template_content("error_template")
                         
                         assert result == ""
-                        mock_logger.error.assert_called_once()
\ No newline at end of file
+                        mock_logger.error.assert_called_once()
+
+class TestTemplateServiceContentCache:
+    """Test cases for the template content cache."""
+    
+    @pytest.mark.asyncio
+    async def test_get_template_content_is_cached_until_update(self):
+        """Test template content is read once and re-read after an update."""
+        template = MockPromptTemplate(name="generate_crew", template="Crew template")
+        mock_uow = AsyncMock()
+        mock_uow.template_repository = AsyncMock()
+        mock_uow.template_repository.update_template.return_value = template
+        cached_at_commit = []
+        mock_uow.commit = AsyncMock(
+            side_effect=lambda: cached_at_commit.append(get_prompt_cache().get_template("generate_crew"))
+        )
+        
+        with patch('src.services.template_service.UnitOfWork') as mock_uow_class:
+            mock_uow_class.return_value.__aenter__.return_value = mock_uow
+            
+            with patch.object(TemplateService, 'find_by_name', return_value=template) as mock_find:
+                assert await TemplateService.get_template_content("generate_crew") == "Crew template"
+                assert await TemplateService.get_template_content("generate_crew") == "Crew template"
+                assert mock_find.call_count == 1
+                
+                await TemplateService.update_existing_template(1, PromptTemplateUpdate(template="New template"))
+                
+                # Dropped only once the update is committed
+                assert cached_at_commit == ["Crew template"]
+                await TemplateService.get_template_content("generate_crew")
+                assert mock_find.call_count == 2
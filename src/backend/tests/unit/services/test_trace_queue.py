@@ -8,7 +8,14 @@ import pytest
 import queue
 from unittest.mock import patch, MagicMock
 
-from src.services.trace_queue import TraceQueue, get_trace_queue
+from src.services.trace_queue import (
+    IMPORTANT_EVENT_TYPES,
+    TraceJobCache,
+    TraceQueue,
+    get_trace_job_cache,
+    get_trace_queue,
+    should_persist_trace,
+)
 
 
 class TestTraceQueue:
@@ -203,4 +210,90 @@ class TestTraceQueue:
         
         # Access via utility function
         util_queue_2 = get_trace_queue()
-        assert util_queue_2.get() == "class_data"
\ No newline at end of file
+        assert util_queue_2.get() == "class_data"
+
+class TestTraceQueueNotifier:
+    """Test cases for the TraceQueue wakeup notifier."""
+
+    def teardown_method(self):
+        """Reset singleton state after each test."""
+        TraceQueue._instance = None
+        TraceQueue._queue = None
+
+    def test_notify_without_notifier_is_noop(self):
+        """Test that notify does nothing when no writer is registered."""
+        TraceQueue().notify()
+
+    def test_notify_calls_registered_notifier(self):
+        """Test that notify invokes the registered callback until it is unregistered."""
+        notifier = MagicMock()
+        trace_queue = TraceQueue()
+
+        trace_queue.set_notifier(notifier)
+        trace_queue.notify()
+        trace_queue.set_notifier(None)
+        trace_queue.notify()
+
+        notifier.assert_called_once()
+
+
+class TestShouldPersistTrace:
+    """Test cases for the enqueue-time event type filter."""
+
+    def test_important_event_types_are_persisted(self):
+        """Test that every important event type passes the filter."""
+        for event_type in IMPORTANT_EVENT_TYPES:
+            assert should_persist_trace(event_type)
+
+    def test_other_event_types_are_dropped(self):
+        """Test that unknown or missing event types are filtered out."""
+        assert not should_persist_trace("debug_info")
+        assert not should_persist_trace(None)
+
+
+class TestTraceJobCache:
+    """Test cases for the trace writer job cache."""
+
+    def test_get_miss_and_hit(self):
+        """Test hit/miss accounting."""
+        cache = TraceJobCache(max_size=2)
+
+        assert cache.get("job-1") is None
+        cache.put("job-1", 1)
+        assert cache.get("job-1") == 1
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache stays bounded by evicting the LRU entry."""
+        cache = TraceJobCache(max_size=2)
+        cache.put("job-1", 1)
+        cache.put("job-2", 2)
+        cache.get("job-1")  # job-2 is now least recently used
+        cache.put("job-3", 3)
+
+        assert len(cache) == 2
+        assert cache.get("job-2") is None
+        assert cache.get("job-1") == 1
+        assert cache.get("job-3") == 3
+
+    def test_evict_and_clear(self):
+        """Test explicit eviction of finished jobs and clearing."""
+        cache = TraceJobCache(max_size=4)
+        cache.put("job-1", 1)
+        cache.put("job-2", 2)
+
+        cache.evict("job-1")
+        cache.evict("unknown-job")
+        assert cache.get("job-1") is None
+        assert cache.get("job-2") == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_get_trace_job_cache_singleton(self):
+        """Test that the module-level cache is shared."""
+        assert get_trace_job_cache() is get_trace_job_cache()
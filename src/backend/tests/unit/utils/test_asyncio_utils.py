@@ -4,6 +4,8 @@ Unit tests for asyncio_utils module.
 
 import pytest
 import asyncio
+import contextvars
+import threading
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +13,11 @@ from src.utils.asyncio_utils import (
     execute_db_operation_with_fresh_engine,
     create_and_run_loop,
     create_task_lifecycle_callback,
-    run_in_thread_with_loop
+    run_in_thread_with_loop,
+    BackgroundLoop,
+    run_sync,
+    run_in_background,
+    shutdown_background_loops,
 )
 
 
@@ -315,4 +321,103 @@ class TestRunInThreadWithLoop:
             
             assert result == "result"
             # Verify the success log message was called (line 158)
-            mock_logger.info.assert_called_with("Successfully closed the event loop created for this thread")
\ No newline at end of file
+            mock_logger.info.assert_called_with("Successfully closed the event loop created for this thread")
+
+
+class TestRunSync:
+    """Test the persistent background event-loop bridge."""
+
+    @pytest.fixture(autouse=True)
+    def stop_loops(self):
+        """Stop background loops after each test."""
+        yield
+        shutdown_background_loops()
+
+    def test_runs_coroutine_and_reuses_loop(self):
+        """Test that results are returned and calls share long-lived loops."""
+        async def current_loop():
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop(), threading.current_thread()
+
+        with patch('src.config.settings.settings.ASYNC_BRIDGE_LOOP_COUNT', 1):
+            first_loop, first_thread = run_sync(current_loop())
+            second_loop, second_thread = run_sync(current_loop())
+
+        assert first_loop is second_loop
+        assert first_thread is second_thread
+        assert first_thread is not threading.current_thread()
+        assert first_thread.daemon
+
+    @pytest.mark.asyncio
+    async def test_works_from_thread_with_running_loop(self):
+        """Test that run_sync can be called while the caller's loop is running."""
+        async def add(a, b):
+            return a + b
+
+        assert run_sync(add(1, 2)) == 3
+
+    def test_propagates_exceptions(self):
+        """Test that exceptions raised by the coroutine reach the caller."""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+
+    def test_timeout_cancels_coroutine(self):
+        """Test that a timeout cancels the coroutine on the background loop."""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            run_sync(slow(), timeout=0.05)
+
+        assert cancelled.wait(2)
+
+    def test_coroutine_sees_caller_context(self):
+        """Test context variables set by the caller are visible to the coroutine, not leaked back."""
+        request_user = contextvars.ContextVar("request_user", default=None)
+
+        async def read_and_set():
+            seen = request_user.get()
+            request_user.set("changed")
+            return seen
+
+        token = request_user.set("alice")
+        try:
+            assert run_sync(read_and_set()) == "alice"
+            assert run_in_background(read_and_set()).result(2) == "alice"
+            assert request_user.get() == "alice"
+        finally:
+            request_user.reset(token)
+
+    def test_rejects_calls_from_background_thread(self):
+        """Test that nested run_sync from the loop thread fails instead of deadlocking."""
+        async def nested():
+            async def inner():
+                return 1
+            return run_sync(inner())
+
+        with pytest.raises(RuntimeError, match="background loop thread"):
+            run_sync(nested())
+
+    def test_shutdown_stops_thread_and_closes_loop(self):
+        """Test that shutdown cancels pending work and closes the loop."""
+        background = BackgroundLoop("test-bridge")
+        loop = background.loop
+        future = background.submit(asyncio.sleep(10))
+
+        background.shutdown()
+
+        assert loop.is_closed()
+        assert future.cancelled()
+        # The loop is restarted on next use
+        assert background.submit(asyncio.sleep(0, result="ok")).result(2) == "ok"
+        background.shutdown()
+
@@ -9,6 +9,7 @@ import base64
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import serialization
 
 from src.utils.encryption_utils import EncryptionUtils
 
@@ -372,4 +373,38 @@ class TestEncryptionIntegration:
             with patch('src.utils.encryption_utils.EncryptionUtils.is_ssh_encrypted', return_value=False):
                 # Decrypt using main method
                 decrypted = EncryptionUtils.decrypt_value(encrypted)
-                assert decrypted == test_value
\ No newline at end of file
+                assert decrypted == test_value
+
+class TestEncryptionUtilsKeyCache:
+    """Test that RSA keys are loaded once and kept in memory."""
+    
+    def test_key_pair_read_once_per_directory(self, tmp_path):
+        """Test the key files are only read on the first call."""
+        with patch.object(EncryptionUtils, 'get_key_directory', return_value=tmp_path):
+            first = EncryptionUtils.get_or_create_ssh_keys()
+            with patch('pathlib.Path.read_bytes') as mock_read:
+                second = EncryptionUtils.get_or_create_ssh_keys()
+                mock_read.assert_not_called()
+        
+        assert first == second
+    
+    def test_private_key_parsed_once(self):
+        """Test repeated decrypts reuse the parsed private key."""
+        private_key, public_key = EncryptionUtils.generate_ssh_key_pair()
+        
+        with patch.object(EncryptionUtils, 'get_or_create_ssh_keys', return_value=(private_key, public_key)):
+            encrypted = EncryptionUtils.encrypt_with_ssh("secret")
+            with patch('src.utils.encryption_utils.serialization.load_pem_private_key',
+                       wraps=serialization.load_pem_private_key) as mock_load:
+                assert EncryptionUtils.decrypt_with_ssh(encrypted) == "secret"
+                assert EncryptionUtils.decrypt_with_ssh(encrypted) == "secret"
+                mock_load.assert_called_once()
+    
+    def test_clear_key_cache(self, tmp_path):
+        """Test clearing the cache forces the key files to be read again."""
+        with patch.object(EncryptionUtils, 'get_key_directory', return_value=tmp_path):
+            EncryptionUtils.get_or_create_ssh_keys()
+            EncryptionUtils.clear_key_cache()
+            with patch('pathlib.Path.read_bytes', return_value=b"key") as mock_read:
+                EncryptionUtils.get_or_create_ssh_keys()
+                assert mock_read.call_count == 2
@@ -0,0 +1,126 @@
+"""
+Unit tests for streaming_json module.
+"""
+
+import json
+
+import pytest
+
+from src.utils.streaming_json import (
+    ANY,
+    IncrementalJSONParser,
+    format_sse_event,
+    iter_completion_text
+)
+
+
+CREW = {
+    "agents": [
+        {"name": "researcher", "role": "Researcher", "tools": ["SerperDevTool"]},
+        {"name": "writer", "role": "Writer, \"senior\" {editor}", "tools": []}
+    ],
+    "tasks": [
+        {"name": "research", "agent": "researcher", "context": [], "priority": 1},
+        {"name": "write", "agent": "writer", "context": ["research"], "async": False}
+    ]
+}
+
+
+def feed_in_chunks(parser, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+class TestIncrementalJSONParser:
+    """Test IncrementalJSONParser."""
+    
+    @pytest.mark.parametrize("size", [1, 3, 17, 10000])
+    def test_emits_array_elements_for_any_chunking(self, size):
+        """Test that each agent and task is emitted whatever the chunk boundaries."""
+        parser = IncrementalJSONParser([("agents", ANY), ("tasks", ANY)])
+        events = feed_in_chunks(parser, json.dumps(CREW, indent=2), size)
+        
+        assert events == [
+            (("agents", 0), CREW["agents"][0]),
+            (("agents", 1), CREW["agents"][1]),
+            (("tasks", 0), CREW["tasks"][0]),
+            (("tasks", 1), CREW["tasks"][1]),
+        ]
+        assert parser.done
+        assert not parser.failed
+    
+    def test_emits_value_as_soon_as_complete(self):
+        """Test that an element is emitted before the rest of the document arrives."""
+        parser = IncrementalJSONParser([("agents", ANY)])
+        
+        assert parser.feed('{"agents": [{"name": "a"}') == [(("agents", 0), {"name": "a"})]
+        assert parser.feed(', {"name": "b"') == []
+        assert parser.feed('}]') == [(("agents", 1), {"name": "b"})]
+        assert ("agents",) in parser.closed_paths
+    
+    def test_top_level_fields(self):
+        """Test emitting top-level scalar and container fields."""
+        parser = IncrementalJSONParser([(ANY,)])
+        events = feed_in_chunks(parser, '{"name": "Agent", "max_iter": 25, "verbose": true, "advanced_config": {"llm": null}}', 4)
+        
+        assert events == [
+            (("name",), "Agent"),
+            (("max_iter",), 25),
+            (("verbose",), True),
+            (("advanced_config",), {"llm": None}),
+        ]
+    
+    def test_skips_preface_and_code_fence(self):
+        """Test that text before the JSON document is ignored."""
+        parser = IncrementalJSONParser([(ANY,)])
+        events = parser.feed('Sure! Here it is:\n```json\n{"name": "x"}\n```')
+        
+        assert events == [(("name",), "x")]
+        assert parser.text.startswith("Sure!")
+    
+    def test_tolerates_trailing_commas(self):
+        """Test that trailing commas in the stream do not break parsing."""
+        parser = IncrementalJSONParser([("agents", ANY)])
+        events = parser.feed('{"agents": [{"name": "a",}, {"name": "b"},],}')
+        
+        assert [value for _, value in events] == [{"name": "a"}, {"name": "b"}]
+        assert not parser.failed
+    
+    def test_marks_malformed_stream_as_failed(self):
+        """Test that a malformed document stops parsing and keeps the text."""
+        parser = IncrementalJSONParser([("agents", ANY)])
+        parser.feed('{"agents": [{"name": "a"} {"name": "b"}]}')
+        
+        assert parser.failed
+        assert parser.text.endswith("]}")
+
+
+class TestIterCompletionText:
+    """Test iter_completion_text function."""
+    
+    @pytest.mark.asyncio
+    async def test_yields_content_deltas(self):
+        """Test extracting deltas from dict and attribute-style chunks."""
+        class Delta:
+            content = "lo"
+        
+        class Choice:
+            delta = Delta()
+        
+        class Chunk:
+            choices = [Choice()]
+        
+        async def stream():
+            yield {"choices": [{"delta": {"content": "Hel"}}]}
+            yield {"choices": [{"delta": {}}]}
+            yield Chunk()
+            yield {"choices": []}
+        
+        assert [text async for text in iter_completion_text(stream())] == ["Hel", "lo"]
+
+
+def test_format_sse_event():
+    """Test Server-Sent Event formatting."""
+    assert format_sse_event("agent", {"name": "a"}) == 'event: agent\ndata: {"name": "a"}\n\n'